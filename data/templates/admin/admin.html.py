@@ -0,0 +1,136 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253605.270644
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/admin.html'
+_template_uri = 'admin/admin.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        url = context.get('url', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <!-- end box / title -->\n    <div class="table">\n        <div id="user_log">\n            ')
+        runtime._include_file(context, u'admin_log.html', _template_uri)
+        __M_writer(u'\n        </div>\n    </div>\n</div>\n\n<script>\n$(document).ready(function() {\n  $(\'#j_filter\').click(function(){\n    var $jfilter = $(\'#j_filter\');\n    if($jfilter.hasClass(\'initial\')){\n        $jfilter.val(\'\');\n    }\n  });\n  var fix_j_filter_width = function(len){\n      $(\'#j_filter\').css(\'width\', Math.max(80, len*6.50)+\'px\');\n  };\n  $(\'#j_filter\').keyup(function () {\n    fix_j_filter_width($(\'#j_filter\').val().length);\n  });\n  $(\'#filter_form\').submit(function (e) {\n      e.preventDefault();\n      var val = $(\'#j_filter\').val();\n      window.location = "')
+        __M_writer(escape(url.current(filter='__FILTER__')))
+        __M_writer(u'".replace(\'__FILTER__\',val);\n  });\n  fix_j_filter_width($(\'#j_filter\').val().length);\n});\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        ungettext = context.get('ungettext', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <form id="filter_form">\n    <input class="q_filter_box ')
+        __M_writer(escape('' if c.search_term else 'initial'))
+        __M_writer(u'" id="j_filter" size="15" type="text" name="filter" value="')
+        __M_writer(escape(c.search_term or _('journal filter...')))
+        __M_writer(u'"/>\n    <span class="tooltip" title="')
+        __M_writer(escape(h.tooltip(h.journal_filter_help())))
+        __M_writer(u'">?</span>\n    <input type=\'submit\' value="')
+        __M_writer(escape(_('Filter')))
+        __M_writer(u'" class="btn btn-mini" style="padding:0px 2px 0px 2px;margin:0px"/>\n    ')
+        __M_writer(escape(_('Admin Journal')))
+        __M_writer(u' - ')
+        __M_writer(escape(ungettext('%s Entry', '%s Entries', c.users_log.item_count) % (c.users_log.item_count)))
+        __M_writer(u'\n    </form>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Admin Journal')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"132": 126, "27": 0, "38": 2, "43": 6, "44": 16, "49": 20, "50": 57, "56": 18, "63": 18, "64": 19, "65": 19, "71": 21, "77": 21, "78": 25, "79": 25, "80": 30, "81": 30, "82": 52, "83": 52, "89": 8, "97": 8, "98": 10, "99": 10, "100": 10, "101": 10, "102": 11, "103": 11, "104": 12, "105": 12, "106": 13, "107": 13, "108": 13, "109": 13, "110": 15, "111": 15, "117": 4, "124": 4, "125": 5, "126": 5}, "uri": "admin/admin.html", "filename": "/root/package/kallithea/templates/admin/admin.html"}
+__M_END_METADATA
+"""
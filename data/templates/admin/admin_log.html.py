@@ -0,0 +1,83 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253605.295869
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/admin_log.html'
+_template_uri = u'admin/admin_log.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        __M_writer = context.writer()
+        if c.users_log:
+            __M_writer(u'<table>\n    <tr>\n        <th class="left">')
+            __M_writer(escape(_('Username')))
+            __M_writer(u'</th>\n        <th class="left">')
+            __M_writer(escape(_('Action')))
+            __M_writer(u'</th>\n        <th class="left">')
+            __M_writer(escape(_('Repository')))
+            __M_writer(u'</th>\n        <th class="left">')
+            __M_writer(escape(_('Date')))
+            __M_writer(u'</th>\n        <th class="left">')
+            __M_writer(escape(_('From IP')))
+            __M_writer(u'</th>\n    </tr>\n\n')
+            for cnt,l in enumerate(c.users_log):
+                __M_writer(u'    <tr class="parity')
+                __M_writer(escape(cnt%2))
+                __M_writer(u'">\n        <td>\n')
+                if l.user is not None:
+                    __M_writer(u'          ')
+                    __M_writer(escape(h.link_to(l.user.username,h.url('edit_user', id=l.user.user_id))))
+                    __M_writer(u'\n')
+                else:
+                    __M_writer(u'          ')
+                    __M_writer(escape(l.username))
+                    __M_writer(u'\n')
+                __M_writer(u'        </td>\n        <td>')
+                __M_writer(escape(h.action_parser(l)[0]()))
+                __M_writer(u'\n            <div class="journal_action_params">\n                ')
+                __M_writer(escape(h.literal(h.action_parser(l)[1]())))
+                __M_writer(u'\n            </div>\n        </td>\n        <td>\n')
+                if l.repository is not None:
+                    __M_writer(u'              ')
+                    __M_writer(escape(h.link_to(l.repository.repo_name,h.url('summary_home',repo_name=l.repository.repo_name))))
+                    __M_writer(u'\n')
+                else:
+                    __M_writer(u'              ')
+                    __M_writer(escape(l.repository_name))
+                    __M_writer(u'\n')
+                __M_writer(u'        </td>\n\n        <td>')
+                __M_writer(escape(h.fmt_date(l.action_date)))
+                __M_writer(u'</td>\n        <td>')
+                __M_writer(escape(l.user_ip))
+                __M_writer(u'</td>\n    </tr>\n')
+            __M_writer(u'</table>\n\n<script type="text/javascript">\n  $(document).ready(function(){\n    var $user_log = $(\'#user_log\');\n    $user_log.on(\'click\',\'.pager_link\',function(e){\n      asynchtml(e.target.href, $user_log, function(){\n        show_more_event();\n        tooltip_activate();\n        show_changeset_tooltip();\n      });\n      e.preventDefault();\n    });\n    $user_log.on(\'click\',\'.show_more\',function(e){\n      var el = e.target;\n      $(\'#\'+el.id.substring(1)).show();\n      $(el.parentNode).hide();\n    });\n  });\n</script>\n\n<div class="pagination-wh pagination-left">\n')
+            __M_writer(escape(c.users_log.pager('$link_previous ~2~ $link_next')))
+            __M_writer(u'\n</div>\n')
+        else:
+            __M_writer(u'    ')
+            __M_writer(escape(_('No actions yet')))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 2, "26": 3, "27": 5, "28": 5, "29": 6, "30": 6, "31": 7, "32": 7, "33": 8, "34": 8, "35": 9, "36": 9, "37": 12, "38": 13, "39": 13, "40": 13, "41": 15, "42": 16, "43": 16, "44": 16, "45": 17, "46": 18, "47": 18, "48": 18, "49": 20, "50": 21, "51": 21, "52": 23, "53": 23, "54": 27, "55": 28, "56": 28, "57": 28, "58": 29, "59": 30, "60": 30, "61": 30, "62": 32, "63": 34, "64": 34, "65": 35, "66": 35, "67": 38, "68": 60, "69": 60, "70": 62, "71": 63, "72": 63, "73": 63, "79": 73}, "uri": "admin/admin_log.html", "filename": "/root/package/kallithea/templates/admin/admin_log.html"}
+__M_END_METADATA
+"""
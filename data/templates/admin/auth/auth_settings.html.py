@@ -0,0 +1,221 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253608.354753
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/auth/auth_settings.html'
+_template_uri = 'admin/auth/auth_settings.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    ')
+        __M_writer(escape(h.form(url('auth_settings'))))
+        __M_writer(u'\n    <div class="form">\n\n')
+        __M_writer(u'    <h1>')
+        __M_writer(escape(_('Authentication Plugins')))
+        __M_writer(u'</h1>\n    <div class="fields">\n       <div class="field">\n           <div class="label"><label for="auth_plugins">')
+        __M_writer(escape(_("Enabled Plugins")))
+        __M_writer(u'</label></div>\n           <div class="input">')
+        __M_writer(escape(h.text("auth_plugins", class_='large')))
+        __M_writer(u'\n           <span class="help-block">')
+        __M_writer(escape(_('Comma separated list of plugins. Order of plugins is also order in which Kallithea will try to authenticate user')))
+        __M_writer(u'</span>\n               <div style="padding:10px 0px 10px 0px;font-weight: bold">')
+        __M_writer(escape(_('Available built-in plugins')))
+        __M_writer(u'</div>\n               <ul>\n')
+        for plugin_path in c.available_plugins:
+            __M_writer(u'                    <li>\n                      <div style="padding:3px 0px 3px 0px">\n                          <span style="margin: 0px 10px 0px 0px" plugin_id="')
+            __M_writer(escape(plugin_path))
+            __M_writer(u'" class="toggle-plugin btn btn-mini ')
+            __M_writer(escape('btn-success' if plugin_path in c.enabled_plugins else ''))
+            __M_writer(u'">\n                          ')
+            __M_writer(escape(_('enabled') if plugin_path in c.enabled_plugins else _('disabled')))
+            __M_writer(u'</span>')
+            __M_writer(escape(plugin_path))
+            __M_writer(u'\n                      </div>\n                    </li>\n')
+        __M_writer(u'               </ul>\n           </div>\n       </div>\n    </div>\n\n')
+        for cnt, module in enumerate(c.auth_plugins):
+            __M_writer(u'        ')
+            pluginName = c.auth_plugins_shortnames[module] 
+            
+            __M_writer(u'\n        <h1>')
+            __M_writer(escape(_('Plugin')))
+            __M_writer(u': ')
+            __M_writer(escape(pluginName))
+            __M_writer(u'</h1>\n        <div class="fields">\n')
+            for setting in c.plugin_settings[module]:
+                __M_writer(u'            ')
+                fullsetting = "auth_%s_%s" % (pluginName, setting["name"]) 
+                
+                __M_writer(u'\n            ')
+                displayname = (setting["formname"] if ("formname" in setting) else setting["name"]) 
+                
+                __M_writer(u'\n')
+                if setting["type"] == "password":
+                    __M_writer(u'            <div class="field">\n                <div class="label"><label for="')
+                    __M_writer(escape(fullsetting))
+                    __M_writer(u'">')
+                    __M_writer(escape(_(displayname)))
+                    __M_writer(u'</label></div>\n                <div class="input">\n                    ')
+                    __M_writer(escape(h.password(fullsetting,class_='small',autocomplete="off")))
+                    __M_writer(u'\n                    <span class="help-block">')
+                    __M_writer(escape(setting["description"]))
+                    __M_writer(u'</span>\n                </div>\n            </div>\n')
+                elif setting["type"] in ["string", "int"]:
+                    __M_writer(u'            <div class="field">\n                <div class="label"><label for="')
+                    __M_writer(escape(fullsetting))
+                    __M_writer(u'">')
+                    __M_writer(escape(_(displayname)))
+                    __M_writer(u'</label></div>\n                <div class="input">\n                    ')
+                    __M_writer(escape(h.text(fullsetting,class_='small')))
+                    __M_writer(u'\n                    <span class="help-block">')
+                    __M_writer(escape(setting["description"]))
+                    __M_writer(u'</span>\n                </div>\n            </div>\n')
+                elif setting["type"] == "bool":
+                    __M_writer(u'            <div class="field">\n                <div class="label label-checkbox"><label for="')
+                    __M_writer(escape(fullsetting))
+                    __M_writer(u'">')
+                    __M_writer(escape(_(displayname)))
+                    __M_writer(u'</label></div>\n                <div class="checkboxes">\n                    <div class="checkbox">')
+                    __M_writer(escape(h.checkbox(fullsetting,True,class_='small')))
+                    __M_writer(u'</div>\n                    <span class="help-block">')
+                    __M_writer(escape(setting["description"]))
+                    __M_writer(u'</span>\n                </div>\n            </div>\n')
+                elif setting["type"] == "select":
+                    __M_writer(u'            <div class="field">\n                <div class="label"><label for="')
+                    __M_writer(escape(fullsetting))
+                    __M_writer(u'">')
+                    __M_writer(escape(_(displayname)))
+                    __M_writer(u'</label></div>\n                <div class="select">\n                    ')
+                    __M_writer(escape(h.select(fullsetting,setting['values'][0],setting['values'],class_='small')))
+                    __M_writer(u'\n                    <span class="help-block">')
+                    __M_writer(escape(setting["description"]))
+                    __M_writer(u'</span>\n                </div>\n            </div>\n')
+                else:
+                    __M_writer(u'            <div class="field">\n                <div class="label"><label for="')
+                    __M_writer(escape(fullsetting))
+                    __M_writer(u'">')
+                    __M_writer(escape(_(displayname)))
+                    __M_writer(u'</label></div>\n                <div class="input">This field is of type ')
+                    __M_writer(escape(setting['type']))
+                    __M_writer(u', which cannot be displayed. Must be one of [string|int|bool|select].</div>\n                <span class="help-block">')
+                    __M_writer(escape(setting["description"]))
+                    __M_writer(u'</span>\n            </div>\n')
+            __M_writer(u'        </div>\n')
+        __M_writer(u'        <div class="fields">\n            <div class="buttons">\n                ')
+        __M_writer(escape(h.submit('save',_('Save'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n</div>\n\n<script>\n    $(\'.toggle-plugin\').click(function(e){\n        var $auth_plugins_input = $(\'#auth_plugins\');\n        var notEmpty = function(element, index, array) {\n            return (element != "");\n        }\n        var elems = $auth_plugins_input.val().split(\',\').filter(notEmpty);\n        var $cur_button = $(e.currentTarget);\n        var plugin_id = $cur_button.attr(\'plugin_id\');\n\n        if($cur_button.hasClass(\'btn-success\')){\n            elems.splice(elems.indexOf(plugin_id), 1);\n            $auth_plugins_input.val(elems.join(\',\'));\n            $cur_button.removeClass(\'btn-success\');\n            $cur_button.html(_TM[\'disabled\']);\n        }\n        else{\n            console.log(elems);\n            if(elems.indexOf(plugin_id) == -1){\n                elems.push(plugin_id);\n            }\n            $auth_plugins_input.val(elems.join(\',\'));\n            $cur_button.addClass(\'btn-success\');\n            $cur_button.html(_TM[\'enabled\']);\n        }\n    });\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(_('Authentication')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Authentication Settings')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "38": 2, "43": 6, "44": 12, "49": 16, "50": 135, "56": 14, "63": 14, "64": 15, "65": 15, "71": 18, "81": 18, "82": 22, "83": 22, "84": 24, "85": 24, "86": 28, "87": 28, "88": 28, "89": 31, "90": 31, "91": 32, "92": 32, "93": 33, "94": 33, "95": 34, "96": 34, "97": 36, "98": 37, "99": 39, "100": 39, "101": 39, "102": 39, "103": 40, "104": 40, "105": 40, "106": 40, "107": 44, "108": 49, "109": 50, "110": 50, "112": 50, "113": 51, "114": 51, "115": 51, "116": 51, "117": 54, "118": 55, "119": 55, "121": 55, "122": 56, "124": 56, "125": 57, "126": 58, "127": 59, "128": 59, "129": 59, "130": 59, "131": 61, "132": 61, "133": 62, "134": 62, "135": 65, "136": 66, "137": 67, "138": 67, "139": 67, "140": 67, "141": 69, "142": 69, "143": 70, "144": 70, "145": 73, "146": 74, "147": 75, "148": 75, "149": 75, "150": 75, "151": 77, "152": 77, "153": 78, "154": 78, "155": 81, "156": 82, "157": 83, "158": 83, "159": 83, "160": 83, "161": 85, "162": 85, "163": 86, "164": 86, "165": 89, "166": 90, "167": 91, "168": 91, "169": 91, "170": 91, "171": 92, "172": 92, "173": 93, "174": 93, "175": 97, "176": 99, "177": 101, "178": 101, "179": 105, "180": 105, "186": 8, "192": 8, "193": 9, "194": 9, "195": 11, "196": 11, "202": 4, "209": 4, "210": 5, "211": 5, "217": 211}, "uri": "admin/auth/auth_settings.html", "filename": "/root/package/kallithea/templates/admin/auth/auth_settings.html"}
+__M_END_METADATA
+"""
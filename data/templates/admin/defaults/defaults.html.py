@@ -0,0 +1,160 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253609.160865
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/defaults/defaults.html'
+_template_uri = 'admin/defaults/defaults.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n\n    <h3>')
+        __M_writer(escape(_('Repository Defaults')))
+        __M_writer(u'</h3>\n\n    ')
+        __M_writer(escape(h.form(url('default', id='defaults'),method='put')))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n\n        <div class="fields">\n\n            <div class="field">\n                <div class="label">\n                    <label for="default_repo_type">')
+        __M_writer(escape(_('Type')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.select('default_repo_type','hg',c.backends,class_="medium")))
+        __M_writer(u'\n                </div>\n            </div>\n\n            <div class="field">\n                <div class="label label-checkbox">\n                    <label for="default_repo_private">')
+        __M_writer(escape(_('Private repository')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('default_repo_private',value="True")))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Private repositories are only visible to people explicitly added as collaborators.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n\n            <div class="field">\n                <div class="label label-checkbox">\n                    <label for="default_repo_enable_statistics">')
+        __M_writer(escape(_('Enable statistics')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('default_repo_enable_statistics',value="True")))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Enable statistics window on summary page.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n            <div class="field">\n                <div class="label label-checkbox">\n                    <label for="default_repo_enable_downloads">')
+        __M_writer(escape(_('Enable downloads')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('default_repo_enable_downloads',value="True")))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Enable download menu on summary page.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n            <div class="field">\n                <div class="label label-checkbox">\n                    <label for="default_repo_enable_locking">')
+        __M_writer(escape(_('Enable locking')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('default_repo_enable_locking',value="True")))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Enable lock-by-pulling on repository.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n            <div class="buttons">\n            ')
+        __M_writer(escape(h.submit('save',_('Save'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n\n')
+        __M_writer(u'\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(_('Defaults')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Repository Defaults')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"131": 8, "132": 9, "133": 9, "134": 11, "135": 11, "141": 4, "148": 4, "149": 5, "150": 5, "27": 0, "156": 150, "38": 2, "43": 6, "44": 12, "49": 16, "50": 93, "56": 14, "63": 14, "64": 15, "65": 15, "71": 18, "80": 18, "81": 22, "82": 22, "83": 25, "84": 25, "85": 27, "86": 27, "87": 35, "88": 35, "89": 38, "90": 38, "91": 44, "92": 44, "93": 47, "94": 47, "95": 48, "96": 48, "97": 55, "98": 55, "99": 58, "100": 58, "101": 59, "102": 59, "103": 65, "104": 65, "105": 68, "106": 68, "107": 69, "108": 69, "109": 75, "110": 75, "111": 78, "112": 78, "113": 79, "114": 79, "115": 84, "116": 84, "117": 88, "118": 88, "119": 91, "125": 8}, "uri": "admin/defaults/defaults.html", "filename": "/root/package/kallithea/templates/admin/defaults/defaults.html"}
+__M_END_METADATA
+"""
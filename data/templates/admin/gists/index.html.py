@@ -0,0 +1,193 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253612.296694
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/gists/index.html'
+_template_uri = 'admin/gists/index.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('gists')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'        <ul class="links">\n          <li>\n             <a href="')
+            __M_writer(escape(h.url('new_gist')))
+            __M_writer(u'" class="btn btn-small btn-success"><i class="icon-plus"></i> ')
+            __M_writer(escape(_(u'Create New Gist')))
+            __M_writer(u'</a>\n          </li>\n        </ul>\n')
+        __M_writer(u'    </div>\n')
+        if c.gists_pager.item_count>0:
+            for gist in c.gists_pager:
+                __M_writer(u'          <div class="gist-item" style="padding:10px 20px 10px 15px">\n\n            <div class="gravatar">\n              ')
+                __M_writer(escape(h.gravatar(gist.owner.email, size=28)))
+                __M_writer(u'\n            </div>\n            <div title="')
+                __M_writer(escape(gist.owner.full_contact))
+                __M_writer(u'" class="user" style="font-size: 16px">\n                <b>')
+                __M_writer(escape(h.person(gist.owner.full_contact)))
+                __M_writer(u'</b> /\n                <b><a href="')
+                __M_writer(escape(h.url('gist',gist_id=gist.gist_access_id)))
+                __M_writer(u'">gist: ')
+                __M_writer(escape(gist.gist_access_id))
+                __M_writer(u'</a></b>\n            </div>\n            <div style="padding: 4px 0px 0px 0px">\n                ')
+                __M_writer(escape(_('Created')))
+                __M_writer(u' ')
+                __M_writer(escape(h.age(gist.created_on)))
+                __M_writer(u' /\n                <span style="color: #AAA">\n')
+                if gist.gist_expires == -1:
+                    __M_writer(u'                   ')
+                    __M_writer(escape(_('Expires')))
+                    __M_writer(u': ')
+                    __M_writer(escape(_('never')))
+                    __M_writer(u'\n')
+                else:
+                    __M_writer(u'                   ')
+                    __M_writer(escape(_('Expires')))
+                    __M_writer(u': ')
+                    __M_writer(escape(h.age(h.time_to_datetime(gist.gist_expires))))
+                    __M_writer(u'\n')
+                __M_writer(u'                </span>\n            </div>\n\n            <div style="border:0px;padding:10px 0px 0px 40px;color:#AAA">')
+                __M_writer(escape(gist.gist_description))
+                __M_writer(u'</div>\n          </div>\n')
+            __M_writer(u'\n        <div class="notification-paginator">\n          <div class="pagination-wh pagination-left">\n          ')
+            __M_writer(escape(c.gists_pager.pager('$link_previous ~2~ $link_next', **request.GET.mixed())))
+            __M_writer(u'\n          </div>\n        </div>\n')
+        else:
+            __M_writer(u'        <div class="table">')
+            __M_writer(escape(_('There are no gists yet')))
+            __M_writer(u'</div>\n')
+        __M_writer(u'</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.show_private:
+            __M_writer(u'        ')
+            __M_writer(escape(_('Private Gists for User %s') % c.authuser.username))
+            __M_writer(u'\n')
+        elif c.show_public:
+            __M_writer(u'        ')
+            __M_writer(escape(_('Public Gists for User %s') % c.authuser.username))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'        ')
+            __M_writer(escape(_('Public Gists')))
+            __M_writer(u'\n')
+        __M_writer(u'    - ')
+        __M_writer(escape(c.gists_pager.item_count))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.show_private:
+            __M_writer(u'        ')
+            __M_writer(escape(_('Private Gists for User %s') % c.authuser.username))
+            __M_writer(u'\n')
+        elif c.show_public:
+            __M_writer(u'        ')
+            __M_writer(escape(_('Public Gists for User %s') % c.authuser.username))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'        ')
+            __M_writer(escape(_('Public Gists')))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "39": 2, "44": 12, "45": 23, "50": 27, "51": 77, "57": 25, "64": 25, "65": 26, "66": 26, "72": 29, "81": 29, "82": 33, "83": 33, "84": 34, "85": 35, "86": 37, "87": 37, "88": 37, "89": 37, "90": 41, "91": 42, "92": 43, "93": 44, "94": 47, "95": 47, "96": 49, "97": 49, "98": 50, "99": 50, "100": 51, "101": 51, "102": 51, "103": 51, "104": 54, "105": 54, "106": 54, "107": 54, "108": 56, "109": 57, "110": 57, "111": 57, "112": 57, "113": 57, "114": 58, "115": 59, "116": 59, "117": 59, "118": 59, "119": 59, "120": 61, "121": 64, "122": 64, "123": 67, "124": 70, "125": 70, "126": 73, "127": 74, "128": 74, "129": 74, "130": 76, "136": 14, "142": 14, "143": 15, "144": 16, "145": 16, "146": 16, "147": 17, "148": 18, "149": 18, "150": 18, "151": 19, "152": 20, "153": 20, "154": 20, "155": 22, "156": 22, "157": 22, "163": 4, "171": 4, "172": 5, "173": 6, "174": 6, "175": 6, "176": 7, "177": 8, "178": 8, "179": 8, "180": 9, "181": 10, "182": 10, "183": 10, "189": 183}, "uri": "admin/gists/index.html", "filename": "/root/package/kallithea/templates/admin/gists/index.html"}
+__M_END_METADATA
+"""
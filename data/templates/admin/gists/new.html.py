@@ -0,0 +1,188 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253610.736397
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/gists/new.html'
+_template_uri = 'admin/gists/new.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', u'css_extra', u'title', 'breadcrumbs_links', u'js_extra', 'main']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        def css_extra():
+            return render_css_extra(context._locals(__M_locals))
+        def title():
+            return render_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        def js_extra():
+            return render_js_extra(context._locals(__M_locals))
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'js_extra'):
+            context['self'].js_extra(**pageargs)
+        
+
+        __M_writer(u'\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'css_extra'):
+            context['self'].css_extra(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('gists')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_css_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        def css_extra():
+            return render_css_extra(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <link rel="stylesheet" type="text/css" href="')
+        __M_writer(escape(h.url('/codemirror/lib/codemirror.css')))
+        __M_writer(u'"/>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('New Gist')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('New Gist')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_js_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        def js_extra():
+            return render_js_extra(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/codemirror/lib/codemirror.js')))
+        __M_writer(u'"></script>\n  <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/codemirror_loadmode.js')))
+        __M_writer(u'"></script>\n  <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/codemirror/mode/meta.js')))
+        __M_writer(u'"></script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n\n    <div class="table">\n        <div id="files_data">\n          ')
+        __M_writer(escape(h.form(h.url('gists'), method='post',id='eform')))
+        __M_writer(u'\n            <div>\n                <div class="gravatar">\n                  ')
+        __M_writer(escape(h.gravatar(c.authuser.email, size=32)))
+        __M_writer(u'\n                </div>\n                <textarea style="resize:vertical; width:400px;border: 1px solid #ccc;border-radius: 3px;" id="description" name="description" placeholder="')
+        __M_writer(escape(_('Gist description ...')))
+        __M_writer(u'"></textarea>\n                <div style="padding:0px 0px 0px 42px">\n                <label for=\'lifetime\'>')
+        __M_writer(escape(_('Gist lifetime')))
+        __M_writer(u'</label>\n                ')
+        __M_writer(escape(h.select('lifetime', '', c.lifetime_options)))
+        __M_writer(u'\n                </div>\n            </div>\n            <div id="body" class="codeblock">\n                <div style="padding: 10px 10px 10px 26px;color:#666666">\n                    ')
+        __M_writer(escape(h.text('filename', size=30, placeholder=_('name this file...'))))
+        __M_writer(u'\n                    <select id="mimetype" name="mimetype"/>\n                </div>\n                <div id="editor_container">\n                    <pre id="editor_pre"></pre>\n                    <textarea id="editor" name="content" style="display:none"></textarea>\n                </div>\n            </div>\n            <div style="padding-top: 5px">\n            ')
+        __M_writer(escape(h.submit('private',_('Create Private Gist'),class_="btn btn-mini btn-success")))
+        __M_writer(u'\n            ')
+        __M_writer(escape(h.submit('public',_('Create Public Gist'),class_="btn btn-mini")))
+        __M_writer(u'\n            ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn btn-mini")))
+        __M_writer(u'\n            </div>\n          ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n          <script type="text/javascript">\n            var myCodeMirror = initCodeMirror(\'editor\', \'\');\n\n            //inject new modes\n            var $modes_select = $(\'#mimetype\');\n            $modes_select.each(function(){\n                var modes_select = this;\n                var index = 1;\n                for(var i=0;i<CodeMirror.modeInfo.length;i++) {\n                    var m = CodeMirror.modeInfo[i];\n                    var opt = new Option(m.name, m.mime);\n                    $(opt).attr(\'mode\', m.mode);\n                    if (m.mime == \'text/plain\') {\n                        // default plain text\n                        $(opt).attr(\'selected\', \'selected\');\n                        modes_select.options[0] = opt;\n                    } else {\n                        modes_select.options[index++] = opt;\n                    }\n                }\n            });\n\n            var $filename = $(\'#filename\');\n            // on select change set new mode\n            $modes_select.change(function(e){\n                var selected = e.currentTarget;\n                var node = selected.options[selected.selectedIndex];\n                var detected_mode = CodeMirror.findModeByMIME(node.value);\n                setCodeMirrorMode(myCodeMirror, detected_mode);\n\n                var proposed_ext = CodeMirror.findExtensionByMode(detected_mode);\n                var file_data = CodeMirror.getFilenameAndExt($filename.val());\n                var filename = file_data[\'filename\'] || \'filename1\';\n                $filename.val(filename + \'.\' + proposed_ext);\n            });\n\n            // on type the new filename set mode\n            $filename.keyup(function(e){\n                var file_data = CodeMirror.getFilenameAndExt(this.value);\n                if(file_data[\'ext\'] != null){\n                    var detected_mode = CodeMirror.findModeByExtension(file_data[\'ext\']) || CodeMirror.findModeByMIME(\'text/plain\');\n                    if (detected_mode){\n                        setCodeMirrorMode(myCodeMirror, detected_mode);\n                        $modes_select.val(detected_mode.mime);\n                    }\n                }\n            });\n          </script>\n        </div>\n    </div>\n\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"129": 8, "171": 56, "136": 8, "137": 9, "138": 9, "139": 10, "140": 10, "141": 11, "142": 11, "148": 25, "27": 0, "156": 25, "157": 29, "158": 29, "159": 34, "160": 34, "161": 37, "162": 37, "163": 39, "164": 39, "165": 41, "166": 41, "167": 42, "168": 42, "169": 47, "170": 47, "43": 2, "172": 56, "173": 57, "174": 57, "175": 58, "48": 6, "177": 60, "178": 60, "53": 12, "184": 178, "58": 15, "59": 19, "64": 23, "65": 113, "71": 21, "78": 21, "79": 22, "80": 22, "86": 13, "176": 58, "93": 13, "94": 14, "95": 14, "101": 4, "108": 4, "109": 5, "110": 5, "116": 17, "121": 17, "122": 18, "123": 18}, "uri": "admin/gists/new.html", "filename": "/root/package/kallithea/templates/admin/gists/new.html"}
+__M_END_METADATA
+"""
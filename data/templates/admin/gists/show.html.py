@@ -0,0 +1,203 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253610.232909
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/gists/show.html'
+_template_uri = 'admin/gists/show.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('gists')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'        <ul class="links">\n          <li>\n              <a href="')
+            __M_writer(escape(h.url('new_gist')))
+            __M_writer(u'" class="btn btn-small btn-success"><i class="icon-plus"></i> ')
+            __M_writer(escape(_(u'Create New Gist')))
+            __M_writer(u'</a>\n          </li>\n        </ul>\n')
+        __M_writer(u'    </div>\n    <div class="table">\n        <div id="files_data">\n            <div id="body" class="codeblock">\n                <div class="code-header">\n                    <div class="stats">\n                        <div class="left" style="margin: -4px 0px 0px 0px">\n')
+        if c.gist.gist_type == 'public':
+            __M_writer(u'                            <div class="btn btn-mini btn-success disabled">')
+            __M_writer(escape(_('Public Gist')))
+            __M_writer(u'</div>\n')
+        else:
+            __M_writer(u'                            <div class="btn btn-mini btn-warning disabled">')
+            __M_writer(escape(_('Private Gist')))
+            __M_writer(u'</div>\n')
+        __M_writer(u'                        </div>\n                        <div class="left item">\n                            ')
+        __M_writer(escape(c.gist.gist_description))
+        __M_writer(u'\n                        </div>\n                        <div class="left item last" style="color: #AAA">\n')
+        if c.gist.gist_expires == -1:
+            __M_writer(u'                          ')
+            __M_writer(escape(_('Expires')))
+            __M_writer(u': ')
+            __M_writer(escape(_('never')))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'                          ')
+            __M_writer(escape(_('Expires')))
+            __M_writer(u': ')
+            __M_writer(escape(h.age(h.time_to_datetime(c.gist.gist_expires))))
+            __M_writer(u'\n')
+        __M_writer(u'                       </div>\n\n')
+        if h.HasPermissionAny('hg.admin')() or c.gist.gist_owner == c.authuser.user_id:
+            __M_writer(u'                        <div style="float:right">\n                            ')
+            __M_writer(escape(h.form(url('gist', gist_id=c.gist.gist_id),method='delete')))
+            __M_writer(u'\n                                ')
+            __M_writer(escape(h.submit('remove_gist', _('Delete'),class_="btn btn-mini btn-danger",onclick="return confirm('"+_('Confirm to delete this Gist')+"');")))
+            __M_writer(u'\n                            ')
+            __M_writer(escape(h.end_form()))
+            __M_writer(u'\n                        </div>\n')
+        __M_writer(u'                        <div class="buttons">\n')
+        if h.HasPermissionAny('hg.admin')() or c.gist.gist_owner == c.authuser.user_id:
+            __M_writer(u'                            ')
+            __M_writer(escape(h.link_to(_('Edit'),h.url('edit_gist', gist_id=c.gist.gist_access_id),class_="btn btn-mini")))
+            __M_writer(u'\n')
+        __M_writer(u'                          ')
+        __M_writer(escape(h.link_to(_('Show as Raw'),h.url('formatted_gist', gist_id=c.gist.gist_access_id, format='raw'),class_="btn btn-mini")))
+        __M_writer(u'\n                        </div>\n                    </div>\n\n                    <div class="author">\n                        <div class="gravatar">\n                          ')
+        __M_writer(escape(h.gravatar(h.email_or_none(c.file_changeset.author), size=16)))
+        __M_writer(u'\n                        </div>\n                        <div title="')
+        __M_writer(escape(c.file_changeset.author))
+        __M_writer(u'" class="user">')
+        __M_writer(escape(h.person(c.file_changeset.author)))
+        __M_writer(u' - ')
+        __M_writer(escape(_('created')))
+        __M_writer(u' ')
+        __M_writer(escape(h.age(c.file_changeset.date)))
+        __M_writer(u'</div>\n                    </div>\n                    <div class="commit">')
+        __M_writer(escape(h.urlify_commit(c.file_changeset.message,c.repo_name)))
+        __M_writer(u'</div>\n                </div>\n            </div>\n\n')
+        for file in c.files:
+            __M_writer(u'               <div style="border: 1px solid #EEE;margin-top:20px">\n                <div id="')
+            __M_writer(escape(h.FID('G', file.path)))
+            __M_writer(u'" class="stats" style="border-bottom: 1px solid #DDD;padding: 8px 14px;">\n                    <a href="')
+            __M_writer(escape(c.gist.gist_url()))
+            __M_writer(u'">\xb6</a>\n                    <b style="margin:0px 0px 0px 4px">')
+            __M_writer(escape(file.path))
+            __M_writer(u'</b>\n                    <div style="float:right; margin: -5px">\n                       ')
+            __M_writer(escape(h.link_to(_('Show as raw'),h.url('formatted_gist_file', gist_id=c.gist.gist_access_id, format='raw', revision=file.changeset.raw_id, f_path=file.path),class_="btn btn-mini")))
+            __M_writer(u'\n                    </div>\n                </div>\n                <div class="code-body">\n                    ')
+            __M_writer(escape(h.pygmentize(file,linenos=True,anchorlinenos=True,lineanchors='L',cssclass="code-highlight")))
+            __M_writer(u'\n                </div>\n              </div>\n')
+        __M_writer(u'        </div>\n    </div>\n\n\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Gist')))
+        __M_writer(u' &middot; ')
+        __M_writer(escape(c.gist.gist_access_id))
+        __M_writer(u'\n    / ')
+        __M_writer(escape(_('URL')))
+        __M_writer(u': ')
+        __M_writer(escape(c.gist.gist_url()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Gist')))
+        __M_writer(u' &middot; ')
+        __M_writer(escape(c.gist.gist_access_id))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "39": 2, "44": 6, "45": 11, "50": 15, "51": 99, "57": 13, "64": 13, "65": 14, "66": 14, "72": 17, "81": 17, "82": 21, "83": 21, "84": 22, "85": 23, "86": 25, "87": 25, "88": 25, "89": 25, "90": 29, "91": 36, "92": 37, "93": 37, "94": 37, "95": 38, "96": 39, "97": 39, "98": 39, "99": 41, "100": 43, "101": 43, "102": 46, "103": 47, "104": 47, "105": 47, "106": 47, "107": 47, "108": 48, "109": 49, "110": 49, "111": 49, "112": 49, "113": 49, "114": 51, "115": 53, "116": 54, "117": 55, "118": 55, "119": 56, "120": 56, "121": 57, "122": 57, "123": 60, "124": 62, "125": 63, "126": 63, "127": 63, "128": 65, "129": 65, "130": 65, "131": 71, "132": 71, "133": 73, "134": 73, "135": 73, "136": 73, "137": 73, "138": 73, "139": 73, "140": 73, "141": 75, "142": 75, "143": 80, "144": 81, "145": 82, "146": 82, "147": 83, "148": 83, "149": 84, "150": 84, "151": 86, "152": 86, "153": 90, "154": 90, "155": 94, "161": 8, "167": 8, "168": 9, "169": 9, "170": 9, "171": 9, "172": 10, "173": 10, "174": 10, "175": 10, "181": 4, "189": 4, "190": 5, "191": 5, "192": 5, "193": 5, "199": 193}, "uri": "admin/gists/show.html", "filename": "/root/package/kallithea/templates/admin/gists/show.html"}
+__M_END_METADATA
+"""
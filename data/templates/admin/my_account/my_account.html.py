@@ -0,0 +1,172 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253699.980558
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/my_account/my_account.html'
+_template_uri = 'admin/my_account/my_account.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box" style="overflow:auto">\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n\n')
+        __M_writer(u'    <div style="width: 150px; float:left">\n        <ul class="nav nav-pills nav-stacked">\n          <li>\n           <div class="gravatar_box" style="height: 26px">\n               <div class="gravatar" style="float: left">\n                 ')
+        __M_writer(escape(h.gravatar(c.user.email)))
+        __M_writer(u'\n               </div>\n               <div class="truncate" style="margin:10px 0px 10px 0px; color:#5f5f5f; float:left; width: 100px">\n                <strong>')
+        __M_writer(escape(c.user.username))
+        __M_writer(u'</strong>\n               </div>\n           </div>\n          </li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='profile' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('my_account')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Profile')))
+        __M_writer(u'</a></li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='password' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('my_account_password')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Password')))
+        __M_writer(u'</a></li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='api_keys' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('my_account_api_keys')))
+        __M_writer(u'">')
+        __M_writer(escape(_('API Keys')))
+        __M_writer(u'</a></li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='emails' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('my_account_emails')))
+        __M_writer(u'">')
+        __M_writer(escape(_('My Emails')))
+        __M_writer(u'</a></li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='repos' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('my_account_repos')))
+        __M_writer(u'">')
+        __M_writer(escape(_('My Repositories')))
+        __M_writer(u'</a></li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='watched' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('my_account_watched')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Watched')))
+        __M_writer(u'</a></li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='perms' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('my_account_perms')))
+        __M_writer(u'">')
+        __M_writer(escape(_('My Permissions')))
+        __M_writer(u'</a></li>\n        </ul>\n    </div>\n\n    <div style="min-width:750px; float:left; padding: 10px 0px 0px 20px;margin: 0px 0px 0px 10px; border-left: 1px solid #DDDDDD">\n        ')
+        runtime._include_file(context, u'/admin/my_account/my_account_' + (c.active) + u'.html', _template_uri)
+        __M_writer(u'\n    </div>\n</div>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('My Account')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('My Account')))
+        __M_writer(u' ')
+        __M_writer(escape(c.authuser.username))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 41, "129": 41, "130": 46, "131": 46, "137": 8, "142": 8, "143": 9, "144": 9, "150": 4, "27": 0, "158": 4, "159": 5, "160": 5, "161": 5, "162": 5, "39": 2, "168": 162, "44": 6, "45": 10, "50": 14, "51": 50, "57": 12, "64": 12, "65": 13, "66": 13, "72": 16, "80": 16, "81": 19, "82": 19, "83": 23, "84": 28, "85": 28, "86": 31, "87": 31, "88": 35, "89": 35, "90": 35, "91": 35, "92": 35, "93": 35, "94": 36, "95": 36, "96": 36, "97": 36, "98": 36, "99": 36, "100": 37, "101": 37, "102": 37, "103": 37, "104": 37, "105": 37, "106": 38, "107": 38, "108": 38, "109": 38, "110": 38, "111": 38, "112": 39, "113": 39, "114": 39, "115": 39, "116": 39, "117": 39, "118": 40, "119": 40, "120": 40, "121": 40, "122": 40, "123": 40, "124": 41, "125": 41, "126": 41, "127": 41}, "uri": "admin/my_account/my_account.html", "filename": "/root/package/kallithea/templates/admin/my_account/my_account.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,113 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253700.257991
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/my_account/my_account_api_keys.html'
+_template_uri = u'/admin/my_account/my_account_api_keys.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<div class="apikeys_wrap">\n  <table class="noborder">\n    <tr>\n        <td style="width: 450px"><div class="truncate autoexpand" style="width:120px;font-size:16px;font-family: monospace">')
+        __M_writer(escape(c.user.api_key))
+        __M_writer(u'</div></td>\n        <td>\n            <span class="btn btn-mini btn-success disabled">')
+        __M_writer(escape(_('Built-in')))
+        __M_writer(u'</span>\n        </td>\n        <td>')
+        __M_writer(escape(_('expires')))
+        __M_writer(u': ')
+        __M_writer(escape(_('never')))
+        __M_writer(u'</td>\n        <td>\n            ')
+        __M_writer(escape(h.form(url('my_account_api_keys'),method='delete')))
+        __M_writer(u'\n                ')
+        __M_writer(escape(h.hidden('del_api_key',c.user.api_key)))
+        __M_writer(u'\n                ')
+        __M_writer(escape(h.hidden('del_api_key_builtin',1)))
+        __M_writer(u'\n                <button class="btn btn-mini btn-danger" type="submit"\n                        onclick="return confirm(\'')
+        __M_writer(escape(_('Confirm to reset this api key: %s') % c.user.api_key))
+        __M_writer(u'\');">\n                    ')
+        __M_writer(escape(_('reset')))
+        __M_writer(u'\n                </button>\n            ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n        </td>\n    </tr>\n')
+        if c.user_api_keys:
+            for api_key in c.user_api_keys:
+                __M_writer(u'          <tr class="')
+                __M_writer(escape('expired' if api_key.expired else ''))
+                __M_writer(u'">\n            <td style="width: 450px"><div class="truncate autoexpand" style="width:120px;font-size:16px;font-family: monospace">')
+                __M_writer(escape(api_key.api_key))
+                __M_writer(u'</div></td>\n            <td>')
+                __M_writer(escape(api_key.description))
+                __M_writer(u'</td>\n            <td style="min-width: 80px">\n')
+                if api_key.expires == -1:
+                    __M_writer(u'                  ')
+                    __M_writer(escape(_('expires')))
+                    __M_writer(u': ')
+                    __M_writer(escape(_('never')))
+                    __M_writer(u'\n')
+                else:
+                    if api_key.expired:
+                        __M_writer(u'                        ')
+                        __M_writer(escape(_('expired')))
+                        __M_writer(u': ')
+                        __M_writer(escape(h.age(h.time_to_datetime(api_key.expires))))
+                        __M_writer(u'\n')
+                    else:
+                        __M_writer(u'                        ')
+                        __M_writer(escape(_('expires')))
+                        __M_writer(u': ')
+                        __M_writer(escape(h.age(h.time_to_datetime(api_key.expires))))
+                        __M_writer(u'\n')
+                __M_writer(u'            </td>\n            <td>\n                ')
+                __M_writer(escape(h.form(url('my_account_api_keys'),method='delete')))
+                __M_writer(u'\n                    ')
+                __M_writer(escape(h.hidden('del_api_key',api_key.api_key)))
+                __M_writer(u'\n                    <button class="btn btn-mini btn-danger" type="submit"\n                            onclick="return confirm(\'')
+                __M_writer(escape(_('Confirm to remove this api key: %s') % api_key.api_key))
+                __M_writer(u'\');">\n                        <i class="icon-minus-circled"></i>\n                        ')
+                __M_writer(escape(_('remove')))
+                __M_writer(u'\n                    </button>\n                ')
+                __M_writer(escape(h.end_form()))
+                __M_writer(u'\n            </td>\n          </tr>\n')
+        else:
+            __M_writer(u'    <tr><td><div class="ip">')
+            __M_writer(escape(_('No additional api keys specified')))
+            __M_writer(u'</div></td></tr>\n')
+        __M_writer(u'  </table>\n</div>\n\n<div>\n    ')
+        __M_writer(escape(h.form(url('my_account_api_keys'), method='post')))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n        <div class="fields">\n             <div class="field">\n                <div class="label">\n                    <label for="new_email">')
+        __M_writer(escape(_('New api key')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('description', class_='medium', placeholder=_('Description'))))
+        __M_writer(u'\n                    ')
+        __M_writer(escape(h.select('lifetime', '', c.lifetime_options)))
+        __M_writer(u'\n                </div>\n             </div>\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Add'),class_="btn")))
+        __M_writer(u'\n              ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n</div>\n\n<script>\n    $(document).ready(function(){\n        $("#lifetime").select2({\n            \'dropdownAutoWidth\': true\n        });\n    })\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 4, "27": 4, "28": 6, "29": 6, "30": 8, "31": 8, "32": 8, "33": 8, "34": 10, "35": 10, "36": 11, "37": 11, "38": 12, "39": 12, "40": 14, "41": 14, "42": 15, "43": 15, "44": 17, "45": 17, "46": 20, "47": 21, "48": 22, "49": 22, "50": 22, "51": 23, "52": 23, "53": 24, "54": 24, "55": 26, "56": 27, "57": 27, "58": 27, "59": 27, "60": 27, "61": 28, "62": 29, "63": 30, "64": 30, "65": 30, "66": 30, "67": 30, "68": 31, "69": 32, "70": 32, "71": 32, "72": 32, "73": 32, "74": 35, "75": 37, "76": 37, "77": 38, "78": 38, "79": 40, "80": 40, "81": 42, "82": 42, "83": 44, "84": 44, "85": 48, "86": 49, "87": 49, "88": 49, "89": 51, "90": 55, "91": 55, "92": 61, "93": 61, "94": 64, "95": 64, "96": 65, "97": 65, "98": 69, "99": 69, "100": 70, "101": 70, "102": 74, "103": 74, "109": 103}, "uri": "/admin/my_account/my_account_api_keys.html", "filename": "/root/package/kallithea/templates/admin/my_account/my_account_api_keys.html"}
+__M_END_METADATA
+"""
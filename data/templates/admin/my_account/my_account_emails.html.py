@@ -0,0 +1,74 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253701.01862
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/my_account/my_account_emails.html'
+_template_uri = u'/admin/my_account/my_account_emails.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<div class="emails_wrap">\n  <table class="noborder">\n    <tr>\n    <td><div class="gravatar">')
+        __M_writer(escape(h.gravatar(c.user.email, size=16)))
+        __M_writer(u'</div></td>\n    <td><div class="email">')
+        __M_writer(escape(c.user.email))
+        __M_writer(u'</div></td>\n    <td>\n        <span class="btn btn-mini btn-success disabled">')
+        __M_writer(escape(_('Primary')))
+        __M_writer(u'</span>\n    </td>\n    </tr>\n')
+        if c.user_email_map:
+            for em in c.user_email_map:
+                __M_writer(u'          <tr>\n            <td><div class="gravatar">')
+                __M_writer(escape(h.gravatar(em.email, size=16)))
+                __M_writer(u'</div></td>\n            <td><div class="email">')
+                __M_writer(escape(em.email))
+                __M_writer(u'</div></td>\n            <td>\n                ')
+                __M_writer(escape(h.form(url('my_account_emails'),method='delete')))
+                __M_writer(u'\n                    ')
+                __M_writer(escape(h.hidden('del_email_id',em.email_id)))
+                __M_writer(u'\n                    <i class="icon-minus-circled" style="color:#FF4444"></i>\n                    ')
+                __M_writer(escape(h.submit('remove_',_('delete'),id="remove_email_%s" % em.email_id,
+                    class_="action_button", onclick="return  confirm('"+_('Confirm to delete this email: %s') % em.email+"');")))
+                __M_writer(u'\n                ')
+                __M_writer(escape(h.end_form()))
+                __M_writer(u'\n            </td>\n          </tr>\n')
+        else:
+            __M_writer(u'    <tr><td><div class="ip">')
+            __M_writer(escape(_('No additional emails specified.')))
+            __M_writer(u'</div></td></tr>\n')
+        __M_writer(u'  </table>\n</div>\n\n<div>\n    ')
+        __M_writer(escape(h.form(url('my_account_emails'), method='post')))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n        <div class="fields">\n             <div class="field">\n                <div class="label">\n                    <label for="new_email">')
+        __M_writer(escape(_('New email address')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('new_email', class_='medium')))
+        __M_writer(u'\n                </div>\n             </div>\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Add'),class_="btn")))
+        __M_writer(u'\n              ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 4, "27": 4, "28": 5, "29": 5, "30": 7, "31": 7, "32": 10, "33": 11, "34": 12, "35": 13, "36": 13, "37": 14, "38": 14, "39": 16, "40": 16, "41": 17, "42": 17, "43": 19, "45": 20, "46": 21, "47": 21, "48": 25, "49": 26, "50": 26, "51": 26, "52": 28, "53": 32, "54": 32, "55": 38, "56": 38, "57": 41, "58": 41, "59": 45, "60": 45, "61": 46, "62": 46, "63": 50, "64": 50, "70": 64}, "uri": "/admin/my_account/my_account_emails.html", "filename": "/root/package/kallithea/templates/admin/my_account/my_account_emails.html"}
+__M_END_METADATA
+"""
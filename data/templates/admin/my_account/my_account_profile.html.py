@@ -0,0 +1,109 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253699.993264
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/my_account/my_account_profile.html'
+_template_uri = u'/admin/my_account/my_account_profile.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(escape(h.form(url('my_account'), method='post')))
+        __M_writer(u'\n    <div class="form">\n\n         <div class="field">\n           <div class="gravatar_box">\n               <div class="gravatar">\n                 ')
+        __M_writer(escape(h.gravatar(c.user.email)))
+        __M_writer(u'\n               </div>\n                <p>\n')
+        if c.visual.use_gravatar:
+            __M_writer(u'                <strong>')
+            __M_writer(escape(_('Change your avatar at')))
+            __M_writer(u' <a href="http://gravatar.com">gravatar.com</a></strong>\n                <br/>')
+            __M_writer(escape(_('Using')))
+            __M_writer(u' ')
+            __M_writer(escape(c.user.email))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'                <strong>')
+            __M_writer(escape(_('Avatars are disabled')))
+            __M_writer(u'</strong>\n                <br/>')
+            __M_writer(escape(c.user.email or _('Missing email, please update your user email address.')))
+            __M_writer(u'\n                    [')
+            __M_writer(escape(_('current IP')))
+            __M_writer(u': ')
+            __M_writer(escape(c.perm_user.ip_addr or "?"))
+            __M_writer(u']\n')
+        __M_writer(u'               </p>\n           </div>\n         </div>\n\n        ')
+        readonly = None 
+        
+        __M_locals_builtin_stored = __M_locals_builtin()
+        __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['readonly'] if __M_key in __M_locals_builtin_stored]))
+        __M_writer(u'\n        ')
+        disabled = "" 
+        
+        __M_locals_builtin_stored = __M_locals_builtin()
+        __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['disabled'] if __M_key in __M_locals_builtin_stored]))
+        __M_writer(u'\n        <div class="fields">\n')
+        if c.extern_type != c.EXTERN_TYPE_INTERNAL:
+            __M_writer(u'                ')
+            readonly = "readonly" 
+            
+            __M_locals_builtin_stored = __M_locals_builtin()
+            __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['readonly'] if __M_key in __M_locals_builtin_stored]))
+            __M_writer(u'\n                ')
+            disabled = " disabled" 
+            
+            __M_locals_builtin_stored = __M_locals_builtin()
+            __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['disabled'] if __M_key in __M_locals_builtin_stored]))
+            __M_writer(u'\n                <strong>')
+            __M_writer(escape(_('Your user is in an external Source of Record; some details cannot be managed here')))
+            __M_writer(u'.</strong>\n')
+        __M_writer(u'             <div class="field">\n                <div class="label">\n                    <label for="username">')
+        __M_writer(escape(_('Username')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                  ')
+        __M_writer(escape(h.text('username',class_='medium%s' % disabled, readonly=readonly)))
+        __M_writer(u'\n                  ')
+        __M_writer(escape(h.hidden('extern_name', c.extern_name)))
+        __M_writer(u'\n                  ')
+        __M_writer(escape(h.hidden('extern_type', c.extern_type)))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="name">')
+        __M_writer(escape(_('First Name')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('firstname',class_="medium")))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="lastname">')
+        __M_writer(escape(_('Last Name')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('lastname',class_="medium")))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="email">')
+        __M_writer(escape(_('Email')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n')
+        __M_writer(u'                    ')
+        __M_writer(escape(h.text('email',class_="medium")))
+        __M_writer(u'\n                </div>\n             </div>\n\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Save'),class_="btn")))
+        __M_writer(u'\n              ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 1, "27": 7, "28": 7, "29": 10, "30": 11, "31": 11, "32": 11, "33": 12, "34": 12, "35": 12, "36": 12, "37": 13, "38": 14, "39": 14, "40": 14, "41": 15, "42": 15, "43": 16, "44": 16, "45": 16, "46": 16, "47": 18, "48": 22, "52": 22, "53": 23, "57": 23, "58": 25, "59": 26, "60": 26, "64": 26, "65": 27, "69": 27, "70": 28, "71": 28, "72": 30, "73": 32, "74": 32, "75": 35, "76": 35, "77": 36, "78": 36, "79": 37, "80": 37, "81": 43, "82": 43, "83": 46, "84": 46, "85": 52, "86": 52, "87": 55, "88": 55, "89": 61, "90": 61, "91": 65, "92": 65, "93": 65, "94": 70, "95": 70, "96": 71, "97": 71, "98": 75, "99": 75, "105": 99}, "uri": "/admin/my_account/my_account_profile.html", "filename": "/root/package/kallithea/templates/admin/my_account/my_account_profile.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,55 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253702.317457
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/my_account/my_account_watched.html'
+_template_uri = u'/admin/my_account/my_account_watched.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<div style="font-size: 20px; color: #666666; padding: 0px 0px 10px 0px">')
+        __M_writer(escape(_('Repositories You are Watching')))
+        __M_writer(u'</div>\n<input class="q_filter_box" id="q_filter" size="15" type="text" name="filter"\n       placeholder="')
+        __M_writer(escape(_('quick filter...')))
+        __M_writer(u'" value=""/>\n\n<div class="table-grid table yui-skin-sam" id="repos_list_wrap"></div>\n<div id="user-paginator" style="padding: 0px 0px 0px 20px"></div>\n\n<script>\nfunction table_renderer(data){\n    var myDataSource = new YAHOO.util.DataSource(data);\n    myDataSource.responseType = YAHOO.util.DataSource.TYPE_JSON;\n\n    myDataSource.responseSchema = {\n        resultsList: "records",\n        fields: [\n            {key:"menu"},\n            {key:"raw_name"},\n            {key:"name"},\n            {key:"last_changeset"},\n            {key:"last_rev_raw"},\n            {key:"action"}\n            ]\n        };\n    myDataSource.doBeforeCallback = function(req,raw,res,cb) {\n        // This is the filter function\n        var data     = res.results || [],\n            filtered = [],\n            i,l;\n\n        if (req) {\n            req = req.toLowerCase();\n            for (i = 0; i<data.length; i++) {\n                var pos = data[i].raw_name.toLowerCase().indexOf(req)\n                if (pos != -1) {\n                    filtered.push(data[i]);\n                }\n            }\n            res.results = filtered;\n        }\n        return res;\n    }\n\n      // main table sorting\n      var myColumnDefs = [\n          {key:"menu",label:"",sortable:false,className:"quick_repo_menu hidden"},\n          {key:"name",label:"')
+        __M_writer(escape(_('Name')))
+        __M_writer(u'",sortable:true,\n              sortOptions: { sortFunction: nameSort }},\n          {key:"last_changeset",label:"')
+        __M_writer(escape(_('Tip')))
+        __M_writer(u'",sortable:true,\n              sortOptions: { sortFunction: revisionSort }},\n          {key:"action",label:"')
+        __M_writer(escape(_('Action')))
+        __M_writer(u'",sortable:false}\n      ];\n\n      var myDataTable = new YAHOO.widget.DataTable("repos_list_wrap", myColumnDefs, myDataSource,{\n        sortedBy:{key:"name",dir:"asc"},\n        paginator: YUI_paginator(50, [\'user-paginator\']),\n\n        MSG_SORTASC:"')
+        __M_writer(escape(_('Click to sort ascending')))
+        __M_writer(u'",\n        MSG_SORTDESC:"')
+        __M_writer(escape(_('Click to sort descending')))
+        __M_writer(u'",\n        MSG_EMPTY:"')
+        __M_writer(escape(_('No records found.')))
+        __M_writer(u'",\n        MSG_ERROR:"')
+        __M_writer(escape(_('Data error.')))
+        __M_writer(u'",\n        MSG_LOADING:"')
+        __M_writer(escape(_('Loading...')))
+        __M_writer(u'"\n      }\n      );\n      myDataTable.subscribe(\'postRenderEvent\',function(oArgs) {\n          tooltip_activate();\n          quick_repo_menu();\n      });\n\n      var filterTimeout = null;\n\n      updateFilter = function() {\n          // Reset timeout\n          filterTimeout = null;\n\n          // Reset sort\n          var state = myDataTable.getState();\n          state.sortedBy = {key:\'name\', dir:YAHOO.widget.DataTable.CLASS_ASC};\n\n          // Get filtered data\n          myDataSource.sendRequest(YUD.get(\'q_filter\').value,{\n              success : myDataTable.onDataReturnInitializeTable,\n              failure : myDataTable.onDataReturnInitializeTable,\n              scope   : myDataTable,\n              argument: state\n          });\n\n      };\n      $(\'#q_filter\').click(function(){\n          if(!$(\'#q_filter\').hasClass(\'loaded\')){\n              //TODO: load here full list later to do search within groups\n              $(\'#q_filter\').addClass(\'loaded\');\n          }\n      });\n\n      $(\'#q_filter\').keyup(function(){\n          clearTimeout(filterTimeout);\n          filterTimeout = setTimeout(updateFilter,600);\n      });\n\n      if($(\'#q_filter\').val()) {\n          updateFilter();\n      }\n\n    }\n\ntable_renderer(')
+        __M_writer(c.data )
+        __M_writer(u');\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "23": 1, "24": 1, "25": 1, "26": 3, "27": 3, "28": 46, "29": 46, "30": 48, "31": 48, "32": 50, "33": 50, "34": 57, "35": 57, "36": 58, "37": 58, "38": 59, "39": 59, "40": 60, "41": 60, "42": 61, "43": 61, "44": 106, "45": 106, "51": 45}, "uri": "/admin/my_account/my_account_watched.html", "filename": "/root/package/kallithea/templates/admin/my_account/my_account_watched.html"}
+__M_END_METADATA
+"""
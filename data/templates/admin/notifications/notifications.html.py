@@ -0,0 +1,150 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253613.504375
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/notifications/notifications.html'
+_template_uri = 'admin/notifications/notifications.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n\n      <div style="padding:14px 18px;text-align: right;float:left">\n      <span id=\'all\' class="btn btn-small"><a href="')
+        __M_writer(escape(h.url.current()))
+        __M_writer(u'">')
+        __M_writer(escape(_('All')))
+        __M_writer(u'</a></span>\n      <span id=\'comment\' class="btn btn-small"><a href="')
+        __M_writer(escape(h.url.current(type=c.comment_type)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Comments')))
+        __M_writer(u'</a></span>\n      <span id=\'pull_request\' class="btn btn-small"><a href="')
+        __M_writer(escape(h.url.current(type=c.pull_request_type)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Pull Requests')))
+        __M_writer(u'</a></span>\n      </div>\n')
+        if c.notifications:
+            __M_writer(u'      <div style="padding:14px 18px;text-align: right;float:right">\n      <span id=\'mark_all_read\' class="btn btn-small">')
+            __M_writer(escape(_('Mark All Read')))
+            __M_writer(u'</span>\n      </div>\n')
+        __M_writer(u"  <div id='notification_data'>\n    ")
+        runtime._include_file(context, u'notifications_data.html', _template_uri)
+        __M_writer(u'\n  </div>\n</div>\n<script type="text/javascript">\nvar url_action = "')
+        __M_writer(escape(url('notification', notification_id='__NOTIFICATION_ID__')))
+        __M_writer(u'";\nvar run = function(){\n  $(\'.delete-notification\').click(function(e){\n    var notification_id = e.currentTarget.id;\n    deleteNotification(url_action,notification_id);\n  });\n  $(\'.read-notification\').click(function(e){\n    var notification_id = e.currentTarget.id;\n    readNotification(url_action,notification_id);\n  });\n}\nrun();\n$(\'#mark_all_read\').click(function(){\n    var url = "')
+        __M_writer(escape(h.url('notifications_mark_all_read', **request.GET.mixed())))
+        __M_writer(u'";\n    asynchtml(url, $(\'#notification_data\'), function(){run();});\n});\n\nvar current_filter = "')
+        __M_writer(escape(c.current_filter))
+        __M_writer(u'";\n$(\'#\'+current_filter).addClass(\'active\');\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('My Notifications')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('My Notifications')))
+        __M_writer(u' ')
+        __M_writer(escape(c.authuser.username))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 4, "136": 4, "137": 5, "138": 5, "139": 5, "140": 5, "146": 140, "27": 0, "39": 2, "44": 6, "45": 10, "50": 14, "51": 58, "57": 12, "64": 12, "65": 13, "66": 13, "72": 16, "82": 16, "83": 20, "84": 20, "85": 24, "86": 24, "87": 24, "88": 24, "89": 25, "90": 25, "91": 25, "92": 25, "93": 26, "94": 26, "95": 26, "96": 26, "97": 28, "98": 29, "99": 30, "100": 30, "101": 33, "102": 34, "103": 34, "104": 38, "105": 38, "106": 51, "107": 51, "108": 55, "109": 55, "115": 8, "120": 8, "121": 9, "122": 9}, "uri": "admin/notifications/notifications.html", "filename": "/root/package/kallithea/templates/admin/notifications/notifications.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,72 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253613.517433
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/notifications/notifications_data.html'
+_template_uri = u'admin/notifications/notifications_data.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.notifications:
+
+            unread = lambda n:{False:'unread'}.get(n)
+            
+            
+            __M_locals_builtin_stored = __M_locals_builtin()
+            __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['unread'] if __M_key in __M_locals_builtin_stored]))
+            __M_writer(u'\n\n\n<div class="notification-list  notification-table">\n')
+            for notification in c.notifications:
+                __M_writer(u'  <div id="notification_')
+                __M_writer(escape(notification.notification.notification_id))
+                __M_writer(u'" class="container ')
+                __M_writer(escape(unread(notification.read)))
+                __M_writer(u'">\n    <div class="notification-header">\n      <div class="gravatar">\n        ')
+                __M_writer(escape(h.gravatar(notification.notification.created_by_user.email, size=24)))
+                __M_writer(u'\n      </div>\n      <div class="desc ')
+                __M_writer(escape(unread(notification.read)))
+                __M_writer(u'">\n      <a href="')
+                __M_writer(escape(url('notification', notification_id=notification.notification.notification_id)))
+                __M_writer(u'">')
+                __M_writer(escape(notification.notification.description))
+                __M_writer(u'</a>\n\n      </div>\n      <div class="delete-notifications">\n        <span id="')
+                __M_writer(escape(notification.notification.notification_id))
+                __M_writer(u'" class="delete-notification"><i class="icon-minus-circled" id="yui-gen24" style="color: #b94a48; padding: 2px;"></i></span>\n      </div>\n')
+                if not notification.read:
+                    __M_writer(u'      <div class="read-notifications">\n        <span id="')
+                    __M_writer(escape(notification.notification.notification_id))
+                    __M_writer(u'" class="read-notification"><i class="icon-ok" id="yui-gen24" style="color: #4CBB17; padding: 2px;"></i></span>\n      </div>\n')
+                __M_writer(u'    </div>\n        <div class="notification-subject"></div>\n  </div>\n')
+            __M_writer(u'</div>\n\n<div class="notification-paginator">\n  <div class="pagination-wh pagination-left">\n  ')
+            __M_writer(escape(c.notifications.pager('$link_previous ~2~ $link_next',**request.GET.mixed())))
+            __M_writer(u'\n  </div>\n</div>\n\n')
+        else:
+            __M_writer(u'    <div class="table">')
+            __M_writer(escape(_('No notifications here yet')))
+            __M_writer(u'</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "26": 1, "27": 2, "28": 3, "34": 5, "35": 9, "36": 10, "37": 10, "38": 10, "39": 10, "40": 10, "41": 13, "42": 13, "43": 15, "44": 15, "45": 16, "46": 16, "47": 16, "48": 16, "49": 20, "50": 20, "51": 22, "52": 23, "53": 24, "54": 24, "55": 27, "56": 31, "57": 35, "58": 35, "59": 39, "60": 40, "61": 40, "62": 40, "68": 62}, "uri": "admin/notifications/notifications_data.html", "filename": "/root/package/kallithea/templates/admin/notifications/notifications_data.html"}
+__M_END_METADATA
+"""
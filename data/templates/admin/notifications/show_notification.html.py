@@ -0,0 +1,145 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253613.873457
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/notifications/show_notification.html'
+_template_uri = 'admin/notifications/show_notification.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <div class="table">\n      <div id="notification_')
+        __M_writer(escape(c.notification.notification_id))
+        __M_writer(u'">\n        <div class="notification-header">\n          <div class="gravatar">\n            ')
+        __M_writer(escape(h.gravatar(c.notification.created_by_user.email, size=24)))
+        __M_writer(u'\n          </div>\n          <div class="desc">\n              ')
+        __M_writer(escape(c.notification.description))
+        __M_writer(u'\n          </div>\n          <div class="delete-notifications">\n            <span id="')
+        __M_writer(escape(c.notification.notification_id))
+        __M_writer(u'" class="delete-notification action"><i class="icon-minus-circled" id="yui-gen24"></i></span>\n          </div>\n        </div>\n        <div class="notification-body">\n        <div class="notification-subject">')
+        __M_writer(escape(h.literal(c.notification.subject)))
+        __M_writer(u'</div>\n')
+        if c.notification.body:
+            __M_writer(u'            ')
+            __M_writer(escape(h.rst_w_mentions(c.notification.body)))
+            __M_writer(u'\n')
+        __M_writer(u'        </div>\n      </div>\n    </div>\n</div>\n<script type="text/javascript">\nvar url = "')
+        __M_writer(escape(url('notification', notification_id='__NOTIFICATION_ID__')))
+        __M_writer(u'";\nvar main = "')
+        __M_writer(escape(url('notifications')))
+        __M_writer(u'";\n   $(\'.delete-notification\').click(function(e){\n       var notification_id = e.currentTarget.id;\n       deleteNotification(url,notification_id,[function(){window.location=main}])\n   });\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.link_to(_('Notifications'),h.url('notifications'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(_('Show Notification')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Show Notification')))
+        __M_writer(u' ')
+        __M_writer(escape(c.authuser.username))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"131": 4, "132": 5, "133": 5, "134": 5, "135": 5, "141": 135, "27": 0, "39": 2, "44": 6, "45": 12, "50": 16, "51": 54, "57": 14, "64": 14, "65": 15, "66": 15, "72": 18, "80": 18, "81": 22, "82": 22, "83": 25, "84": 25, "85": 28, "86": 28, "87": 31, "88": 31, "89": 34, "90": 34, "91": 38, "92": 38, "93": 39, "94": 40, "95": 40, "96": 40, "97": 42, "98": 47, "99": 47, "100": 48, "101": 48, "107": 8, "113": 8, "114": 9, "115": 9, "116": 11, "117": 11, "123": 4}, "uri": "admin/notifications/show_notification.html", "filename": "/root/package/kallithea/templates/admin/notifications/show_notification.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,143 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253614.048654
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/permissions/permissions.html'
+_template_uri = 'admin/permissions/permissions.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box" style="overflow:auto">\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n\n')
+        __M_writer(u'    <div style="width: 150px; float:left">\n      <ul class="nav nav-pills nav-stacked">\n        <li class="')
+        __M_writer(escape('active' if c.active=='globals' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_permissions')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Global')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='ips' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_permissions_ips')))
+        __M_writer(u'">')
+        __M_writer(escape(_('IP Whitelist')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='perms' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_permissions_perms')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Overview')))
+        __M_writer(u'</a></li>\n      </ul>\n    </div>\n\n    <div style="width:750px; float:left; padding: 10px 0px 0px 20px;margin: 0px 0px 0px 10px; border-left: 1px solid #DDDDDD">\n        ')
+        runtime._include_file(context, u'/admin/permissions/permissions_' + (c.active) + u'.html', _template_uri)
+        __M_writer(u'\n    </div>\n</div>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(_('Permissions')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Permissions Administration')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"131": 4, "132": 5, "133": 5, "139": 133, "27": 0, "38": 2, "43": 6, "44": 12, "49": 16, "50": 39, "56": 14, "63": 14, "64": 15, "65": 15, "71": 19, "79": 19, "80": 22, "81": 22, "82": 26, "83": 28, "84": 28, "85": 28, "86": 28, "87": 28, "88": 28, "89": 29, "90": 29, "91": 29, "92": 29, "93": 29, "94": 29, "95": 30, "96": 30, "97": 30, "98": 30, "99": 30, "100": 30, "101": 35, "102": 35, "108": 8, "114": 8, "115": 9, "116": 9, "117": 11, "118": 11, "124": 4}, "uri": "admin/permissions/permissions.html", "filename": "/root/package/kallithea/templates/admin/permissions/permissions.html"}
+__M_END_METADATA
+"""
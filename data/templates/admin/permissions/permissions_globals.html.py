@@ -0,0 +1,104 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253614.242948
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/permissions/permissions_globals.html'
+_template_uri = u'/admin/permissions/permissions_globals.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(escape(h.form(url('admin_permissions'), method='post')))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n        <div class="fields">\n            <div class="field">\n                <div class="label label-checkbox">\n                    <label for="anonymous">')
+        __M_writer(escape(_('Anonymous access')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('anonymous',True)))
+        __M_writer(u'\n                    </div>\n                     <span class="help-block">')
+        __M_writer(escape(h.literal(_('Allow access to Kallithea without needing to log in. Anonymous users use %s user permissions.' % (h.link_to('*default*',h.url('admin_permissions_perms')))))))
+        __M_writer(u'</span>\n                </div>\n            </div>\n            <div class="field">\n                <div class="label">\n                    <label for="default_repo_perm">')
+        __M_writer(escape(_('Repository')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('default_repo_perm','',c.repo_perms_choices)))
+        __M_writer(u'\n\n                    ')
+        __M_writer(escape(h.checkbox('overwrite_default_repo','true')))
+        __M_writer(u'\n                    <label for="overwrite_default_repo">\n                    <span class="tooltip"\n                    title="')
+        __M_writer(escape(h.tooltip(_('All default permissions on each repository will be reset to chosen permission, note that all custom default permission on repositories will be lost'))))
+        __M_writer(u'">\n                    ')
+        __M_writer(escape(_('Overwrite existing settings')))
+        __M_writer(u'</span> </label>\n                </div>\n            </div>\n            <div class="field">\n                <div class="label">\n                    <label for="default_group_perm">')
+        __M_writer(escape(_('Repository group')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('default_group_perm','',c.group_perms_choices)))
+        __M_writer(u'\n                    ')
+        __M_writer(escape(h.checkbox('overwrite_default_group','true')))
+        __M_writer(u'\n                    <label for="overwrite_default_group">\n                    <span class="tooltip"\n                    title="')
+        __M_writer(escape(h.tooltip(_('All default permissions on each repository group will be reset to chosen permission, note that all custom default permission on repository groups will be lost'))))
+        __M_writer(u'">\n                    ')
+        __M_writer(escape(_('Overwrite existing settings')))
+        __M_writer(u'</span> </label>\n\n                </div>\n            </div>\n            <div class="field">\n                <div class="label">\n                    <label for="default_group_perm">')
+        __M_writer(escape(_('User group')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('default_user_group_perm','',c.user_group_perms_choices)))
+        __M_writer(u'\n                    ')
+        __M_writer(escape(h.checkbox('overwrite_default_user_group','true')))
+        __M_writer(u'\n                    <label for="overwrite_default_user_group">\n                    <span class="tooltip"\n                    title="')
+        __M_writer(escape(h.tooltip(_('All default permissions on each user group will be reset to chosen permission, note that all custom default permission on repository groups will be lost'))))
+        __M_writer(u'">\n                    ')
+        __M_writer(escape(_('Overwrite existing settings')))
+        __M_writer(u'</span> </label>\n\n                </div>\n            </div>\n             <div class="field">\n                <div class="label">\n                    <label for="default_repo_create">')
+        __M_writer(escape(_('Repository creation')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('default_repo_create','',c.repo_create_choices)))
+        __M_writer(u'\n                </div>\n             </div>\n            <div class="field">\n                <div class="label label-checkbox">\n                    <label for="create_on_write">')
+        __M_writer(escape(_('Repository creation with group write access')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('create_on_write','',c.repo_create_on_write_choices)))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Write permission to a repository group allows creating repositories inside that group.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n             <div class="field">\n                <div class="label">\n                    <label for="default_user_group_create">')
+        __M_writer(escape(_('User group creation')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('default_user_group_create','',c.user_group_create_choices)))
+        __M_writer(u'\n                </div>\n             </div>\n             <div class="field">\n                <div class="label">\n                    <label for="default_fork">')
+        __M_writer(escape(_('Repository forking')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('default_fork','',c.fork_choices)))
+        __M_writer(u'\n                </div>\n             </div>\n             <div class="field">\n                <div class="label">\n                    <label for="default_register">')
+        __M_writer(escape(_('Registration')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('default_register','',c.register_choices)))
+        __M_writer(u'\n                </div>\n             </div>\n             <div class="field">\n                <div class="label">\n                    <label for="default_extern_activate">')
+        __M_writer(escape(_('External auth account activation')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('default_extern_activate','',c.extern_activate_choices)))
+        __M_writer(u'\n                </div>\n             </div>\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Save'),class_="btn")))
+        __M_writer(u'\n              ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 1, "27": 7, "28": 7, "29": 11, "30": 11, "31": 13, "32": 13, "33": 18, "34": 18, "35": 21, "36": 21, "37": 23, "38": 23, "39": 26, "40": 26, "41": 27, "42": 27, "43": 32, "44": 32, "45": 35, "46": 35, "47": 36, "48": 36, "49": 39, "50": 39, "51": 40, "52": 40, "53": 46, "54": 46, "55": 49, "56": 49, "57": 50, "58": 50, "59": 53, "60": 53, "61": 54, "62": 54, "63": 60, "64": 60, "65": 63, "66": 63, "67": 68, "68": 68, "69": 71, "70": 71, "71": 72, "72": 72, "73": 77, "74": 77, "75": 80, "76": 80, "77": 85, "78": 85, "79": 88, "80": 88, "81": 93, "82": 93, "83": 96, "84": 96, "85": 101, "86": 101, "87": 104, "88": 104, "89": 108, "90": 108, "91": 109, "92": 109, "93": 113, "94": 113, "100": 94}, "uri": "/admin/permissions/permissions_globals.html", "filename": "/root/package/kallithea/templates/admin/permissions/permissions_globals.html"}
+__M_END_METADATA
+"""
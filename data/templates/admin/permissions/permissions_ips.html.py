@@ -0,0 +1,74 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253614.06128
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/permissions/permissions_ips.html'
+_template_uri = u'/admin/permissions/permissions_ips.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<h4>')
+        __M_writer(escape(_('Default IP Whitelist for All Users')))
+        __M_writer(u'</h4>\n\n<div class="ips_wrap">\n      <table class="noborder">\n')
+        if c.user_ip_map:
+            for ip in c.user_ip_map:
+                __M_writer(u'          <tr>\n              <td><div class="ip">')
+                __M_writer(escape(ip.ip_addr))
+                __M_writer(u'</div></td>\n              <td><div class="ip">')
+                __M_writer(escape(h.ip_range(ip.ip_addr)))
+                __M_writer(u'</div></td>\n              <td>\n                ')
+                __M_writer(escape(h.form(url('edit_user_ips', id=c.user.user_id),method='delete')))
+                __M_writer(u'\n                    ')
+                __M_writer(escape(h.hidden('del_ip_id',ip.ip_id)))
+                __M_writer(u'\n                    ')
+                __M_writer(escape(h.hidden('default_user', 'True')))
+                __M_writer(u'\n                    <i class="icon-minus-circled" style="color:#FF4444"></i> ')
+                __M_writer(escape(h.submit('remove_',_('delete'),id="remove_ip_%s" % ip.ip_id,
+                    class_="action_button", onclick="return confirm('"+_('Confirm to delete this ip: %s') % ip.ip_addr+"');")))
+                __M_writer(u'\n                ')
+                __M_writer(escape(h.end_form()))
+                __M_writer(u'\n              </td>\n          </tr>\n')
+        else:
+            __M_writer(u'        <tr><td><div class="ip">')
+            __M_writer(escape(_('All IP addresses are allowed.')))
+            __M_writer(u'</div></td></tr>\n')
+        __M_writer(u'      </table>\n</div>\n\n')
+        __M_writer(escape(h.form(url('edit_user_ips', id=c.user.user_id),method='put')))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n        <div class="fields">\n             <div class="field">\n                <div class="label">\n                    <label for="new_ip">')
+        __M_writer(escape(_('New ip address')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.hidden('default_user', 'True')))
+        __M_writer(u'\n                    ')
+        __M_writer(escape(h.text('new_ip', class_='medium')))
+        __M_writer(u'\n                </div>\n             </div>\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Add'),class_="btn")))
+        __M_writer(u'\n              ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 1, "27": 1, "28": 5, "29": 6, "30": 7, "31": 8, "32": 8, "33": 9, "34": 9, "35": 11, "36": 11, "37": 12, "38": 12, "39": 13, "40": 13, "41": 14, "43": 15, "44": 16, "45": 16, "46": 20, "47": 21, "48": 21, "49": 21, "50": 23, "51": 26, "52": 26, "53": 32, "54": 32, "55": 35, "56": 35, "57": 36, "58": 36, "59": 40, "60": 40, "61": 41, "62": 41, "63": 45, "64": 45, "70": 64}, "uri": "/admin/permissions/permissions_ips.html", "filename": "/root/package/kallithea/templates/admin/permissions/permissions_ips.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,49 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253614.54303
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/permissions/permissions_perms.html'
+_template_uri = u'/admin/permissions/permissions_perms.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'p', context._clean_inheritance_tokens(), templateuri=u'/base/perms_summary.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'p')] = ns
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        p = _mako_get_namespace(context, 'p')
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<h4>')
+        __M_writer(escape(_('Default User Permissions Overview')))
+        __M_writer(u'</h4>\n\n')
+        __M_writer(u'\n')
+        __M_writer(escape(p.perms_summary(c.perm_user.permissions, show_all=True)))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"34": 1, "35": 1, "36": 1, "37": 4, "38": 5, "39": 5, "45": 39, "23": 4, "26": 0}, "uri": "/admin/permissions/permissions_perms.html", "filename": "/root/package/kallithea/templates/admin/permissions/permissions_perms.html"}
+__M_END_METADATA
+"""
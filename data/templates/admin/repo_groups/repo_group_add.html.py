@@ -0,0 +1,150 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253706.778984
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/repo_groups/repo_group_add.html'
+_template_uri = 'admin/repo_groups/repo_group_add.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <!-- end box / title -->\n    ')
+        __M_writer(escape(h.form(url('repos_groups'))))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n        <div class="fields">\n             <div class="field">\n                <div class="label">\n                    <label for="group_name">')
+        __M_writer(escape(_('Group name')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('group_name',class_='small')))
+        __M_writer(u'\n                </div>\n             </div>\n\n            <div class="field">\n                <div class="label label-textarea">\n                    <label for="group_description">')
+        __M_writer(escape(_('Description')))
+        __M_writer(u':</label>\n                </div>\n                <div class="textarea-repo editor">\n                    ')
+        __M_writer(escape(h.textarea('group_description',cols=23,rows=5,class_="medium")))
+        __M_writer(u'\n                </div>\n            </div>\n\n            <div class="field">\n                 <div class="label">\n                     <label for="group_parent_id">')
+        __M_writer(escape(_('Group parent')))
+        __M_writer(u':</label>\n                 </div>\n                 <div class="input">\n                     ')
+        __M_writer(escape(h.select('group_parent_id',request.GET.get('parent_group'),c.repo_groups,class_="medium")))
+        __M_writer(u'\n                 </div>\n            </div>\n\n            <div id="copy_perms" class="field">\n                <div class="label label-checkbox">\n                    <label for="group_copy_permissions">')
+        __M_writer(escape(_('Copy parent group permissions')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('group_copy_permissions',value="True")))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Copy permission set from parent repository group.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Save'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n</div>\n<script>\n    $(document).ready(function(){\n        var setCopyPermsOption = function(group_val){\n            if(group_val != "-1"){\n                $(\'#copy_perms\').show()\n            }\n            else{\n                $(\'#copy_perms\').hide();\n            }\n        }\n        $("#group_parent_id").select2({\n            \'dropdownAutoWidth\': true\n        });\n        setCopyPermsOption($(\'#group_parent_id\').val())\n        $("#group_parent_id").on("change", function(e) {\n            setCopyPermsOption(e.val)\n        })\n        $(\'#group_name\').focus();\n    })\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(h.link_to(_('Repository Groups'),h.url('repos_groups'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(_('Add Repository Group')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Add Repository Group')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"131": 4, "138": 4, "139": 5, "140": 5, "146": 140, "27": 0, "38": 2, "43": 6, "44": 14, "49": 18, "50": 95, "56": 16, "63": 16, "64": 17, "65": 17, "71": 20, "81": 20, "82": 24, "83": 24, "84": 27, "85": 27, "86": 33, "87": 33, "88": 36, "89": 36, "90": 42, "91": 42, "92": 45, "93": 45, "94": 51, "95": 51, "96": 54, "97": 54, "98": 60, "99": 60, "100": 63, "101": 63, "102": 64, "103": 64, "104": 69, "105": 69, "106": 73, "107": 73, "113": 8, "119": 8, "120": 9, "121": 9, "122": 11, "123": 11, "124": 13, "125": 13}, "uri": "admin/repo_groups/repo_group_add.html", "filename": "/root/package/kallithea/templates/admin/repo_groups/repo_group_add.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,145 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253706.619805
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/repo_groups/repo_groups.html'
+_template_uri = 'admin/repo_groups/repo_groups.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n        <ul class="links">\n')
+        if h.HasPermissionAny('hg.admin')():
+            __M_writer(u'             <li>\n               <a href="')
+            __M_writer(escape(h.url('new_repos_group')))
+            __M_writer(u'" class="btn btn-small btn-success"><i class="icon-plus"></i> ')
+            __M_writer(escape(_(u'Add Repository Group')))
+            __M_writer(u'</a>\n             </li>\n')
+        __M_writer(u'        </ul>\n    </div>\n    <!-- end box / title -->\n    <div class="table-grid table yui-skin-sam" id="datatable_list_wrap"></div>\n    <div id="user-paginator" style="padding: 0px 0px 0px 20px"></div>\n</div>\n<script>\n  var data = ')
+        __M_writer(c.data)
+        __M_writer(u';\n  var fields = [\n    {key: "group_name"},\n    {key: "raw_name"},\n    {key: "desc"},\n    {key: "repos"},\n    {key: "owner"},\n    {key: "action"}\n  ];\n  var column_defs = [\n    {key:"group_name",label:"')
+        __M_writer(escape(_('Name')))
+        __M_writer(u'",sortable:true, sortOptions: { sortFunction: nameSort }},\n    {key:"desc",label:"')
+        __M_writer(escape(_('Description')))
+        __M_writer(u'",sortable:true},\n    {key:"repos",label:"')
+        __M_writer(escape(_('Number of Top-level Repositories')))
+        __M_writer(u'",sortable:true},\n    {key:"owner",label:"')
+        __M_writer(escape(_('Owner')))
+        __M_writer(u'",sortable:true},\n    {key:"action",label:"')
+        __M_writer(escape(_('Action')))
+        __M_writer(u'",sortable:false}\n  ];\n  var counter = YUD.get(\'repo_group_count\');\n  var sort_key = "group_name";\n  YUI_datatable(data, fields, column_defs, counter, sort_key, ')
+        __M_writer(escape(c.visual.admin_grid_items))
+        __M_writer(u');\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <input class="q_filter_box" id="q_filter" size="15" type="text" name="filter" placeholder="')
+        __M_writer(escape(_('quick filter...')))
+        __M_writer(u'" value=""/>\n    ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u' &raquo; <span id="repo_group_count">0</span> ')
+        __M_writer(escape(_('Repository Groups')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Repository Groups Administration')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"133": 4, "134": 5, "135": 5, "141": 135, "27": 0, "38": 2, "43": 6, "44": 11, "49": 16, "50": 56, "56": 14, "63": 14, "64": 15, "65": 15, "71": 18, "79": 18, "80": 22, "81": 22, "82": 24, "83": 25, "84": 26, "85": 26, "86": 26, "87": 26, "88": 29, "89": 36, "90": 36, "91": 46, "92": 46, "93": 47, "94": 47, "95": 48, "96": 48, "97": 49, "98": 49, "99": 50, "100": 50, "101": 54, "102": 54, "108": 8, "114": 8, "115": 9, "116": 9, "117": 10, "118": 10, "119": 10, "120": 10, "126": 4}, "uri": "admin/repo_groups/repo_groups.html", "filename": "/root/package/kallithea/templates/admin/repo_groups/repo_groups.html"}
+__M_END_METADATA
+"""
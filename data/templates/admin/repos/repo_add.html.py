@@ -0,0 +1,133 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253615.872903
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/repos/repo_add.html'
+_template_uri = 'admin/repos/repo_add.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <div class="box">\n        <!-- box / title -->\n        <div class="title">\n            ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n        </div>\n        ')
+        runtime._include_file(context, u'repo_add_base.html', _template_uri)
+        __M_writer(u'\n    </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.authuser.is_admin:
+            __M_writer(u'    ')
+            __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+            __M_writer(u'\n    &raquo;\n    ')
+            __M_writer(escape(h.link_to(_('Repositories'),h.url('repos'))))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'    ')
+            __M_writer(escape(_('Admin')))
+            __M_writer(u'\n    &raquo;\n    ')
+            __M_writer(escape(_('Repositories')))
+            __M_writer(u'\n')
+        __M_writer(u'    &raquo;\n    ')
+        __M_writer(escape(_('Add Repository')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Add Repository')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"129": 123, "27": 0, "38": 2, "43": 6, "44": 20, "49": 24, "50": 34, "56": 22, "63": 22, "64": 23, "65": 23, "71": 26, "76": 26, "77": 30, "78": 30, "79": 32, "80": 32, "86": 8, "93": 8, "94": 9, "95": 10, "96": 10, "97": 10, "98": 12, "99": 12, "100": 13, "101": 14, "102": 14, "103": 14, "104": 16, "105": 16, "106": 18, "107": 19, "108": 19, "114": 4, "121": 4, "122": 5, "123": 5}, "uri": "admin/repos/repo_add.html", "filename": "/root/package/kallithea/templates/admin/repos/repo_add.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,95 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253615.890975
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/repos/repo_add_base.html'
+_template_uri = u'admin/repos/repo_add_base.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(h.form(url('repos'))))
+        __M_writer(u'\n<div class="form">\n    <!-- fields -->\n    <div class="fields">\n        <div class="field">\n            <div class="label">\n                <label for="repo_name">')
+        __M_writer(escape(_('Name')))
+        __M_writer(u':</label>\n            </div>\n            <div class="input">\n                ')
+        __M_writer(escape(h.text('repo_name',class_="small")))
+        __M_writer(u'\n                <div style="margin: 6px 0px 0px 0px">\n                    <a id="remote_clone_toggle" href="#"><i class="icon-download-cloud"></i> ')
+        __M_writer(escape(_('Import existing repository ?')))
+        __M_writer(u'</a>\n                </div>\n')
+        if not c.authuser.is_admin:
+            __M_writer(u'                    ')
+            __M_writer(escape(h.hidden('user_created',True)))
+            __M_writer(u'\n')
+        __M_writer(u'            </div>\n         </div>\n        <div id="remote_clone" class="field" style="display: none">\n            <div class="label">\n                <label for="clone_uri">')
+        __M_writer(escape(_('Clone from')))
+        __M_writer(u':</label>\n            </div>\n            <div class="input">\n                ')
+        __M_writer(escape(h.text('clone_uri',class_="small")))
+        __M_writer(u'\n                <span class="help-block">')
+        __M_writer(escape(_('Optional URL from which repository should be cloned.')))
+        __M_writer(u'</span>\n            </div>\n        </div>\n        <div class="field">\n            <div class="label label-textarea">\n                <label for="repo_description">')
+        __M_writer(escape(_('Description')))
+        __M_writer(u':</label>\n            </div>\n            <div class="textarea-repo editor">\n                ')
+        __M_writer(escape(h.textarea('repo_description')))
+        __M_writer(u'\n                <span class="help-block">')
+        __M_writer(escape(_('Keep it short and to the point. Use a README file for longer descriptions.')))
+        __M_writer(u'</span>\n            </div>\n        </div>\n        <div class="field">\n             <div class="label">\n                 <label for="repo_group">')
+        __M_writer(escape(_('Repository group')))
+        __M_writer(u':</label>\n             </div>\n             <div class="input">\n                 ')
+        __M_writer(escape(h.select('repo_group',request.GET.get('parent_group'),c.repo_groups,class_="medium")))
+        __M_writer(u'\n                 <span class="help-block">')
+        __M_writer(escape(_('Optionally select a group to put this repository into.')))
+        __M_writer(u'</span>\n             </div>\n        </div>\n        <div id="copy_perms" class="field">\n            <div class="label label-checkbox">\n                <label for="repo_copy_permissions">')
+        __M_writer(escape(_('Copy parent group permissions')))
+        __M_writer(u':</label>\n            </div>\n            <div class="checkboxes">\n                ')
+        __M_writer(escape(h.checkbox('repo_copy_permissions',value="True")))
+        __M_writer(u'\n                <span class="help-block">')
+        __M_writer(escape(_('Copy permission set from parent repository group.')))
+        __M_writer(u'</span>\n            </div>\n        </div>\n        <div class="field">\n            <div class="label">\n                <label for="repo_type">')
+        __M_writer(escape(_('Type')))
+        __M_writer(u':</label>\n            </div>\n            <div class="input">\n                ')
+        __M_writer(escape(h.select('repo_type','hg',c.backends,class_="small")))
+        __M_writer(u'\n                <span class="help-block">')
+        __M_writer(escape(_('Type of repository to create.')))
+        __M_writer(u'</span>\n            </div>\n        </div>\n        <div class="field">\n            <div class="label">\n                <label for="repo_landing_rev">')
+        __M_writer(escape(_('Landing revision')))
+        __M_writer(u':</label>\n            </div>\n            <div class="input">\n                ')
+        __M_writer(escape(h.select('repo_landing_rev','',c.landing_revs,class_="medium")))
+        __M_writer(u'\n                <span class="help-block">')
+        __M_writer(escape(_('Default revision for files page, downloads, full text search index and readme generation')))
+        __M_writer(u'</span>\n            </div>\n        </div>\n        <div class="field">\n            <div class="label label-checkbox">\n                <label for="repo_private">')
+        __M_writer(escape(_('Private repository')))
+        __M_writer(u':</label>\n            </div>\n            <div class="checkboxes">\n                ')
+        __M_writer(escape(h.checkbox('repo_private',value="True")))
+        __M_writer(u'\n                <span class="help-block">')
+        __M_writer(escape(_('Private repositories are only visible to people explicitly added as collaborators.')))
+        __M_writer(u'</span>\n            </div>\n        </div>\n        <div class="buttons">\n          ')
+        __M_writer(escape(h.submit('add',_('Add'),class_="btn")))
+        __M_writer(u'\n        </div>\n    </div>\n</div>\n<script>\n    $(document).ready(function(){\n        var setCopyPermsOption = function(group_val){\n            if(group_val != "-1"){\n                $(\'#copy_perms\').show()\n            }\n            else{\n                $(\'#copy_perms\').hide();\n            }\n        }\n\n        $(\'#remote_clone_toggle\').on(\'click\', function(e){\n            $(\'#remote_clone\').show();\n            e.preventDefault();\n        })\n        if($(\'#remote_clone input\').hasClass(\'error\')){\n            $(\'#remote_clone\').show();\n        }\n        if($(\'#remote_clone input\').val()){\n            $(\'#remote_clone\').show();\n        }\n        $("#repo_group").select2({\n            \'dropdownAutoWidth\': true\n        });\n\n        setCopyPermsOption($(\'#repo_group\').val())\n        $("#repo_group").on("change", function(e) {\n            setCopyPermsOption(e.val)\n        })\n\n        $("#repo_type").select2({\n            \'minimumResultsForSearch\': -1\n        });\n        $("#repo_landing_rev").select2({\n            \'minimumResultsForSearch\': -1\n        });\n        $(\'#repo_name\').focus();\n    })\n</script>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "26": 2, "27": 3, "28": 3, "29": 9, "30": 9, "31": 12, "32": 12, "33": 14, "34": 14, "35": 16, "36": 17, "37": 17, "38": 17, "39": 19, "40": 23, "41": 23, "42": 26, "43": 26, "44": 27, "45": 27, "46": 32, "47": 32, "48": 35, "49": 35, "50": 36, "51": 36, "52": 41, "53": 41, "54": 44, "55": 44, "56": 45, "57": 45, "58": 50, "59": 50, "60": 53, "61": 53, "62": 54, "63": 54, "64": 59, "65": 59, "66": 62, "67": 62, "68": 63, "69": 63, "70": 68, "71": 68, "72": 71, "73": 71, "74": 72, "75": 72, "76": 77, "77": 77, "78": 80, "79": 80, "80": 81, "81": 81, "82": 85, "83": 85, "84": 128, "85": 128, "91": 85}, "uri": "admin/repos/repo_add_base.html", "filename": "/root/package/kallithea/templates/admin/repos/repo_add_base.html"}
+__M_END_METADATA
+"""
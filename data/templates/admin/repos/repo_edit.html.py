@@ -0,0 +1,170 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253618.691402
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/repos/repo_edit.html'
+_template_uri = 'admin/repos/repo_edit.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('options')))
+        __M_writer(u'\n<div class="box" style="overflow:auto">\n    <!--<div class="title">-->\n        <!--')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'-->\n    <!--</div>-->\n\n')
+        __M_writer(u'    <div style="width: 150px; float:left">\n        <ul class="nav nav-pills nav-stacked">\n          <!--<li>-->\n           <!--<div class="gravatar_box" style="height: 26px">-->\n             <!--<div class="gravatar" style="float: left">-->\n                <!--<i class="icon-users" style="font-size: 26px"></i>-->\n             <!--</div>-->\n               <!--<div style="margin:10px 0px 10px 0px; color:#5f5f5f; float:left">-->\n                <!--<strong>')
+        __M_writer(escape('repo-info'))
+        __M_writer(u'</strong>-->\n               <!--</div>-->\n           <!--</div>-->\n          <!--</li>-->\n          <li class="')
+        __M_writer(escape('active' if c.active=='settings' else ''))
+        __M_writer(u'">\n              <a href="')
+        __M_writer(escape(h.url('edit_repo', repo_name=c.repo_name)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Settings')))
+        __M_writer(u'</a>\n          </li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='permissions' else ''))
+        __M_writer(u'">\n              <a href="')
+        __M_writer(escape(h.url('edit_repo_perms', repo_name=c.repo_name)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Permissions')))
+        __M_writer(u'</a>\n          </li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='advanced' else ''))
+        __M_writer(u'">\n              <a href="')
+        __M_writer(escape(h.url('edit_repo_advanced', repo_name=c.repo_name)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Advanced')))
+        __M_writer(u'</a>\n          </li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='fields' else ''))
+        __M_writer(u'">\n              <a href="')
+        __M_writer(escape(h.url('edit_repo_fields', repo_name=c.repo_name)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Extra Fields')))
+        __M_writer(u'</a>\n          </li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='caches' else ''))
+        __M_writer(u'">\n              <a href="')
+        __M_writer(escape(h.url('edit_repo_caches', repo_name=c.repo_name)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Caches')))
+        __M_writer(u'</a>\n          </li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='remote' else ''))
+        __M_writer(u'">\n              <a href="')
+        __M_writer(escape(h.url('edit_repo_remote', repo_name=c.repo_name)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Remote')))
+        __M_writer(u'</a>\n          </li>\n          <li class="')
+        __M_writer(escape('active' if c.active=='statistics' else ''))
+        __M_writer(u'">\n              <a href="')
+        __M_writer(escape(h.url('edit_repo_statistics', repo_name=c.repo_name)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Statistics')))
+        __M_writer(u'</a>\n          </li>\n        </ul>\n    </div>\n\n    <div style="width:750px; float:left; padding: 10px 0px 0px 20px;margin: 0px 0px 0px 10px; border-left: 1px solid #DDDDDD">\n        ')
+        runtime._include_file(context, u'/admin/repos/repo_edit_' + (c.active) + u'.html', _template_uri)
+        __M_writer(u'\n    </div>\n</div>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Settings')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s Repository Settings') % c.repo_info.repo_name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 58, "129": 58, "130": 64, "131": 64, "137": 11, "142": 11, "143": 12, "144": 12, "150": 7, "27": 0, "158": 7, "159": 8, "160": 8, "166": 160, "39": 5, "44": 9, "45": 13, "50": 17, "51": 68, "57": 15, "64": 15, "65": 16, "66": 16, "72": 19, "80": 19, "81": 20, "82": 20, "83": 23, "84": 23, "85": 27, "86": 35, "87": 35, "88": 39, "89": 39, "90": 40, "91": 40, "92": 40, "93": 40, "94": 42, "95": 42, "96": 43, "97": 43, "98": 43, "99": 43, "100": 45, "101": 45, "102": 46, "103": 46, "104": 46, "105": 46, "106": 48, "107": 48, "108": 49, "109": 49, "110": 49, "111": 49, "112": 51, "113": 51, "114": 52, "115": 52, "116": 52, "117": 52, "118": 54, "119": 54, "120": 55, "121": 55, "122": 55, "123": 55, "124": 57, "125": 57, "126": 58, "127": 58}, "uri": "admin/repos/repo_edit.html", "filename": "/root/package/kallithea/templates/admin/repos/repo_edit.html"}
+__M_END_METADATA
+"""
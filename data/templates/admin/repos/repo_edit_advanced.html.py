@@ -0,0 +1,115 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253618.708418
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/repos/repo_edit_advanced.html'
+_template_uri = u'/admin/repos/repo_edit_advanced.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        ungettext = context.get('ungettext', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<h3>')
+        __M_writer(escape(_('Parent')))
+        __M_writer(u'</h3>\n')
+        __M_writer(escape(h.form(url('edit_repo_advanced_fork', repo_name=c.repo_info.repo_name), method='put')))
+        __M_writer(u'\n<div class="form">\n       ')
+        __M_writer(escape(h.select('id_fork_of','',c.repos_list,class_="medium")))
+        __M_writer(u'\n       ')
+        __M_writer(escape(h.submit('set_as_fork_%s' % c.repo_info.repo_name,_('Set'),class_="btn btn-small")))
+        __M_writer(u'\n       <div class="field" style="border:none;color:#888">\n       <ul>\n            <li>')
+        __M_writer(escape(_('''Manually set this repository as a fork of another from the list.''')))
+        __M_writer(u'</li>\n       </ul>\n       </div>\n</div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n\n<script>\n    $(document).ready(function(){\n        $("#id_fork_of").select2({\n            \'dropdownAutoWidth\': true\n        });\n    })\n</script>\n\n<h3>')
+        __M_writer(escape(_('Public Journal Visibility')))
+        __M_writer(u'</h3>\n')
+        __M_writer(escape(h.form(url('edit_repo_advanced_journal', repo_name=c.repo_info.repo_name), method='put')))
+        __M_writer(u'\n<div class="form">\n  <div class="field">\n')
+        if c.in_public_journal:
+            __M_writer(u'    <button class="btn btn-small" type="submit">\n        <i class="icon-minus"></i>\n        ')
+            __M_writer(escape(_('Remove from public journal')))
+            __M_writer(u'\n    </button>\n')
+        else:
+            __M_writer(u'    <button class="btn btn-small" type="submit">\n        <i class="icon-plus"></i>\n        ')
+            __M_writer(escape(_('Add to Public Journal')))
+            __M_writer(u'\n    </button>\n')
+        __M_writer(u'  </div>\n <div class="field" style="border:none;color:#888">\n <ul>\n      <li>')
+        __M_writer(escape(_('All actions done in this repository will be visible to everyone in the public journal.')))
+        __M_writer(u'</li>\n </ul>\n </div>\n</div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n\n<h3>')
+        __M_writer(escape(_('Change Locking')))
+        __M_writer(u'</h3>\n')
+        __M_writer(escape(h.form(url('edit_repo_advanced_locking', repo_name=c.repo_info.repo_name), method='put')))
+        __M_writer(u'\n<div class="form">\n')
+        if c.repo_info.locked[0]:
+            __M_writer(u'        ')
+            __M_writer(escape(h.hidden('set_unlock', '1')))
+            __M_writer(u'\n        <button class="btn btn-small" type="submit"\n                onclick="return confirm(\'')
+            __M_writer(escape(_('Confirm to unlock repository.')))
+            __M_writer(u'\');">\n            <i class="icon-lock-open-alt"></i>\n            ')
+            __M_writer(escape(_('Unlock Repository')))
+            __M_writer(u'\n        </button>\n       ')
+            __M_writer(escape('Locked by %s on %s' % (h.person_by_id(c.repo_info.locked[0]),h.fmt_date(h.time_to_datetime(c.repo_info.locked[1])))))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'        ')
+            __M_writer(escape(h.hidden('set_lock', '1')))
+            __M_writer(u'\n        <button class="btn btn-small" type="submit"\n                onclick="return confirm(\'')
+            __M_writer(escape(_('Confirm to lock repository.')))
+            __M_writer(u'\');">\n            <i class="icon-lock"></i>\n            ')
+            __M_writer(escape(_('Lock Repository')))
+            __M_writer(u'\n        </button>\n        ')
+            __M_writer(escape(_('Repository is not locked')))
+            __M_writer(u'\n')
+        __M_writer(u'   <div class="field" style="border:none;color:#888">\n   <ul>\n        <li>')
+        __M_writer(escape(_('Force locking on the repository. Works only when anonymous access is disabled. Triggering a pull locks the repository.  The user who is pulling locks the repository; only the user who pulled and locked it can unlock it by doing a push.')))
+        __M_writer(u'\n        </li>\n   </ul>\n   </div>\n</div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n\n<h3>')
+        __M_writer(escape(_('Delete')))
+        __M_writer(u'</h3>\n')
+        __M_writer(escape(h.form(url('repo', repo_name=c.repo_name),method='delete')))
+        __M_writer(u'\n<div class="form">\n    <button class="btn btn-small btn-danger" type="submit"\n            onclick="return confirm(\'')
+        __M_writer(escape(_('Confirm to delete this repository: %s') % c.repo_name))
+        __M_writer(u'\');">\n        <i class="icon-minus-circled"></i>\n        ')
+        __M_writer(escape(_('Delete this Repository')))
+        __M_writer(u'\n    </button>\n')
+        if c.repo_info.forks.count():
+            __M_writer(u'        ')
+            __M_writer(escape(ungettext('This repository has %s fork', 'This repository has %s forks', c.repo_info.forks.count()) % c.repo_info.forks.count()))
+            __M_writer(u'\n        <input type="radio" name="forks" value="detach_forks" checked="checked"/> <label for="forks">')
+            __M_writer(escape(_('Detach forks')))
+            __M_writer(u'</label>\n        <input type="radio" name="forks" value="delete_forks" /> <label for="forks">')
+            __M_writer(escape(_('Delete forks')))
+            __M_writer(u'</label>\n')
+        __M_writer(u'    <div class="field" style="border:none;color:#888">\n        <ul>\n        <li>')
+        __M_writer(escape(_('The deleted repository will be moved away and hidden until the administrator expires it. The administrator can both permanently delete it or restore it.')))
+        __M_writer(u'</li>\n        </ul>\n    </div>\n</div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "26": 1, "27": 1, "28": 1, "29": 2, "30": 2, "31": 4, "32": 4, "33": 5, "34": 5, "35": 8, "36": 8, "37": 12, "38": 12, "39": 22, "40": 22, "41": 23, "42": 23, "43": 26, "44": 27, "45": 29, "46": 29, "47": 31, "48": 32, "49": 34, "50": 34, "51": 37, "52": 40, "53": 40, "54": 44, "55": 44, "56": 46, "57": 46, "58": 47, "59": 47, "60": 49, "61": 50, "62": 50, "63": 50, "64": 52, "65": 52, "66": 54, "67": 54, "68": 56, "69": 56, "70": 57, "71": 58, "72": 58, "73": 58, "74": 60, "75": 60, "76": 62, "77": 62, "78": 64, "79": 64, "80": 66, "81": 68, "82": 68, "83": 73, "84": 73, "85": 75, "86": 75, "87": 76, "88": 76, "89": 79, "90": 79, "91": 81, "92": 81, "93": 83, "94": 84, "95": 84, "96": 84, "97": 85, "98": 85, "99": 86, "100": 86, "101": 88, "102": 90, "103": 90, "104": 94, "105": 94, "111": 105}, "uri": "/admin/repos/repo_edit_advanced.html", "filename": "/root/package/kallithea/templates/admin/repos/repo_edit_advanced.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,147 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253617.508293
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/repos/repos.html'
+_template_uri = 'admin/repos/repos.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n        <ul class="links">\n')
+        if h.HasPermissionAny('hg.admin','hg.create.repository')():
+            __M_writer(u'          <li>\n            <a href="')
+            __M_writer(escape(h.url('new_repo')))
+            __M_writer(u'" class="btn btn-small btn-success"><i class="icon-plus"></i> ')
+            __M_writer(escape(_(u'Add Repository')))
+            __M_writer(u'</a>\n          </li>\n')
+        __M_writer(u'        </ul>\n    </div>\n    <div class="table-grid table yui-skin-sam" id="datatable_list_wrap"></div>\n    <div id="user-paginator" style="padding: 0px 0px 0px 20px"></div>\n\n\n</div>\n<script>\n  var data = ')
+        __M_writer(c.data)
+        __M_writer(u';\n  var fields = [\n    {key:"menu"},\n    {key:"raw_name"},\n    {key:"name"},\n    {key:"desc"},\n    {key:"last_changeset"},\n    {key:"last_rev_raw"},\n    {key:"owner"},\n    {key:"state"},\n    {key:"action"}\n  ];\n  var column_defs = [\n    {key:"menu",label:"",sortable:false,className:"quick_repo_menu hidden"},\n    {key:"name",label:"')
+        __M_writer(escape(_('Name')))
+        __M_writer(u'",sortable:true, sortOptions: { sortFunction: nameSort }},\n    {key:"desc",label:"')
+        __M_writer(escape(_('Description')))
+        __M_writer(u'",sortable:true},\n    {key:"last_changeset",label:"')
+        __M_writer(escape(_('Tip')))
+        __M_writer(u'",sortable:true, sortOptions: { sortFunction: revisionSort }},\n    {key:"owner",label:"')
+        __M_writer(escape(_('Owner')))
+        __M_writer(u'",sortable:true},\n    {key:"state",label:"')
+        __M_writer(escape(_('State')))
+        __M_writer(u'",sortable:true},\n    {key:"action",label:"')
+        __M_writer(escape(_('Action')))
+        __M_writer(u'",sortable:false}\n  ];\n  var counter = YUD.get(\'repo_count\');\n  var sort_key = "name";\n  YUI_datatable(data, fields, column_defs, counter, sort_key, ')
+        __M_writer(escape(c.visual.admin_grid_items))
+        __M_writer(u');\n</script>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <input class="q_filter_box" id="q_filter" size="15" type="text" name="filter" placeholder="')
+        __M_writer(escape(_('quick filter...')))
+        __M_writer(u'" value=""/> ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u' &raquo; <span id="repo_count">0</span> ')
+        __M_writer(escape(_('Repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Repositories Administration')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 4, "135": 4, "136": 5, "137": 5, "143": 137, "27": 0, "38": 2, "43": 6, "44": 10, "49": 13, "50": 59, "56": 11, "63": 11, "64": 12, "65": 12, "71": 14, "79": 14, "80": 18, "81": 18, "82": 20, "83": 21, "84": 22, "85": 22, "86": 22, "87": 22, "88": 25, "89": 33, "90": 33, "91": 47, "92": 47, "93": 48, "94": 48, "95": 49, "96": 49, "97": 50, "98": 50, "99": 51, "100": 51, "101": 52, "102": 52, "103": 56, "104": 56, "110": 8, "116": 8, "117": 9, "118": 9, "119": 9, "120": 9, "121": 9, "122": 9}, "uri": "admin/repos/repos.html", "filename": "/root/package/kallithea/templates/admin/repos/repos.html"}
+__M_END_METADATA
+"""
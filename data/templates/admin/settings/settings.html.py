@@ -0,0 +1,173 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253626.459971
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/settings/settings.html'
+_template_uri = 'admin/settings/settings.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box" style="overflow:auto">\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n\n')
+        __M_writer(u'    <div style="width: 150px; float:left">\n      <ul class="nav nav-pills nav-stacked">\n        <li class="')
+        __M_writer(escape('active' if c.active=='vcs' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_settings')))
+        __M_writer(u'">')
+        __M_writer(escape(_('VCS')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='mapping' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_settings_mapping')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Remap and Rescan')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='global' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_settings_global')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Global')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='visual' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_settings_visual')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Visual')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='email' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_settings_email')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Email')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='hooks' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_settings_hooks')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Hooks')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='search' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_settings_search')))
+        __M_writer(u'">')
+        __M_writer(escape(_('Full Text Search')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='system' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('admin_settings_system')))
+        __M_writer(u'">')
+        __M_writer(escape(_('System Info')))
+        __M_writer(u'</a></li>\n      </ul>\n    </div>\n\n    <div style="width:750px; float:left; padding: 10px 0px 0px 20px;margin: 0px 0px 0px 10px; border-left: 1px solid #DDDDDD">\n        ')
+        runtime._include_file(context, u'/admin/settings/settings_' + (c.active) + u'.html', _template_uri)
+        __M_writer(u'\n    </div>\n</div>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(_('Settings')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Settings Administration')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 34, "129": 34, "130": 34, "131": 39, "132": 39, "138": 8, "144": 8, "145": 9, "146": 9, "147": 11, "148": 11, "154": 4, "27": 0, "161": 4, "162": 5, "163": 5, "38": 2, "169": 163, "43": 6, "44": 12, "49": 16, "50": 43, "56": 14, "63": 14, "64": 15, "65": 15, "71": 18, "79": 18, "80": 21, "81": 21, "82": 25, "83": 27, "84": 27, "85": 27, "86": 27, "87": 27, "88": 27, "89": 28, "90": 28, "91": 28, "92": 28, "93": 28, "94": 28, "95": 29, "96": 29, "97": 29, "98": 29, "99": 29, "100": 29, "101": 30, "102": 30, "103": 30, "104": 30, "105": 30, "106": 30, "107": 31, "108": 31, "109": 31, "110": 31, "111": 31, "112": 31, "113": 32, "114": 32, "115": 32, "116": 32, "117": 32, "118": 32, "119": 33, "120": 33, "121": 33, "122": 33, "123": 33, "124": 33, "125": 34, "126": 34, "127": 34}, "uri": "admin/settings/settings.html", "filename": "/root/package/kallithea/templates/admin/settings/settings.html"}
+__M_END_METADATA
+"""
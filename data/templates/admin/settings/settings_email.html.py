@@ -0,0 +1,76 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253627.45634
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/settings/settings_email.html'
+_template_uri = u'/admin/settings/settings_email.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<dl class="dl-horizontal">\n')
+
+        elems = [
+           (_('Email prefix'), c.ini.get('email_prefix'), ''),
+           (_('Kallithea email from'), c.ini.get('app_email_from'), ''),
+           (_('Error email from'), c.ini.get('error_email_from'), ''),
+           (_('Error email recipients'), c.ini.get('email_to'), ''),
+        
+           (_('SMTP server'), c.ini.get('smtp_server'), ''),
+           (_('SMTP username'), c.ini.get('smtp_username'), ''),
+           (_('SMTP password'), '%s chars' % len(c.ini.get('smtp_password', '')), ''),
+           (_('SMTP port'), c.ini.get('smtp_port'), ''),
+        
+           (_('SMTP use TLS'), c.ini.get('smtp_use_tls'), ''),
+           (_('SMTP use SSL'), c.ini.get('smtp_use_ssl'), ''),
+           (_('SMTP auth'), c.ini.get('smtp_auth'), '')
+        ]
+        
+        
+        __M_locals_builtin_stored = __M_locals_builtin()
+        __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['elems'] if __M_key in __M_locals_builtin_stored]))
+        __M_writer(u'\n')
+        for dt, dd, tt in elems:
+            __M_writer(u'  <dt style="width:150px; text-align: left">')
+            __M_writer(escape(dt))
+            __M_writer(u':</dt>\n  <dd style="margin-left: 160px" title="')
+            __M_writer(escape(tt))
+            __M_writer(u'">')
+            __M_writer(escape(dd))
+            __M_writer(u'</dd>\n')
+        __M_writer(u'</dl>\n\n')
+        __M_writer(escape(h.form(url('admin_settings_email'), method='post')))
+        __M_writer(u'\n    <div class="form">\n\n        <div class="fields">\n            <div class="field">\n                <div class="label">\n                    <label for="test_email">')
+        __M_writer(escape(_('Send test email to')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('test_email',size=30)))
+        __M_writer(u'\n                </div>\n            </div>\n\n            <div class="buttons">\n            ')
+        __M_writer(escape(h.submit('send',_('Send'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "26": 1, "27": 2, "47": 18, "48": 19, "49": 20, "50": 20, "51": 20, "52": 21, "53": 21, "54": 21, "55": 21, "56": 23, "57": 25, "58": 25, "59": 31, "60": 31, "61": 34, "62": 34, "63": 39, "64": 39, "65": 43, "66": 43, "72": 66}, "uri": "/admin/settings/settings_email.html", "filename": "/root/package/kallithea/templates/admin/settings/settings_email.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,69 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253627.052094
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/settings/settings_global.html'
+_template_uri = u'/admin/settings/settings_global.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(escape(h.form(url('admin_settings_global'), method='post')))
+        __M_writer(u'\n    <div class="form">\n\n        <div class="fields">\n\n             <div class="field">\n                <div class="label">\n                    <label for="title">')
+        __M_writer(escape(_('Site branding')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('title',size=30)))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Set a custom title for your Kallithea Service.')))
+        __M_writer(u'</span>\n                </div>\n             </div>\n\n            <div class="field">\n                <div class="label">\n                    <label for="realm">')
+        __M_writer(escape(_('HTTP authentication realm')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('realm',size=30)))
+        __M_writer(u'\n                </div>\n            </div>\n\n            <div class="field">\n                <div class="label">\n                    <label for="ga_code">')
+        __M_writer(escape(_('Analytics HTML block')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.textarea('ga_code', cols=80, rows=10)))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('HTML with JavaScript for web analytics systems like Google Analytics or Piwik. This will be added at the bottom of every page.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n            <div class="field">\n                <div class="label">\n                    <label for="captcha_public_key">')
+        __M_writer(escape(_('ReCaptcha public key')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('captcha_public_key',size=60)))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Public key for reCaptcha system.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n            <div class="field">\n                <div class="label">\n                    <label for="captcha_private_key">')
+        __M_writer(escape(_('ReCaptcha private key')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('captcha_private_key',size=60)))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Private key for reCaptcha system. Setting this value will enable captcha on registration.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n            <div class="buttons">\n                ')
+        __M_writer(escape(h.submit('save',_('Save Settings'),class_="btn")))
+        __M_writer(u'\n                ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n           </div>\n        </div>\n    </div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "24": 1, "25": 1, "26": 8, "27": 8, "28": 11, "29": 11, "30": 12, "31": 12, "32": 18, "33": 18, "34": 21, "35": 21, "36": 27, "37": 27, "38": 30, "39": 30, "40": 31, "41": 31, "42": 37, "43": 37, "44": 40, "45": 40, "46": 41, "47": 41, "48": 47, "49": 47, "50": 50, "51": 50, "52": 51, "53": 51, "54": 56, "55": 56, "56": 57, "57": 57, "58": 61, "59": 61, "65": 59}, "uri": "/admin/settings/settings_global.html", "filename": "/root/package/kallithea/templates/admin/settings/settings_global.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,88 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253626.478062
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/settings/settings_hooks.html'
+_template_uri = u'/admin/settings/settings_hooks.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<h4>')
+        __M_writer(escape(_('Built-in Mercurial Hooks (Read-Only)')))
+        __M_writer(u'</h4>\n<div class="form">\n    <div class="fields">\n')
+        for hook in c.hooks:
+            __M_writer(u'        <div class="field">\n            <div class="label label">\n                <label for="')
+            __M_writer(escape(hook.ui_key))
+            __M_writer(u'">')
+            __M_writer(escape(hook.ui_key))
+            __M_writer(u'</label>\n            </div>\n            <div class="input" style="margin-left:280px">\n              ')
+            __M_writer(escape(h.text(hook.ui_key,hook.ui_value,size=60,readonly="readonly")))
+            __M_writer(u'\n            </div>\n        </div>\n')
+        __M_writer(u'    </div>\n    <span class="help-block">')
+        __M_writer(escape(_('Hooks can be used to trigger actions on certain events such as push / pull. They can trigger Python functions or external applications.')))
+        __M_writer(u'</span>\n</div>\n\n')
+        if c.visual.allow_custom_hooks_settings:
+            __M_writer(u'<h4>')
+            __M_writer(escape(_('Custom Hooks')))
+            __M_writer(u'</h4>\n')
+            __M_writer(escape(h.form(url('admin_settings_hooks'), method='post')))
+            __M_writer(u'\n<div class="form">\n    <div class="fields">\n\n')
+            for hook in c.custom_hooks:
+                __M_writer(u'      <div class="field"  id="')
+                __M_writer(escape('id%s' % hook.ui_id ))
+                __M_writer(u'">\n        <div class="label label">\n            <label for="')
+                __M_writer(escape(hook.ui_key))
+                __M_writer(u'">')
+                __M_writer(escape(hook.ui_key))
+                __M_writer(u'</label>\n        </div>\n        <div class="input" style="margin-left:280px">\n            ')
+                __M_writer(escape(h.hidden('hook_ui_key',hook.ui_key)))
+                __M_writer(u'\n            ')
+                __M_writer(escape(h.hidden('hook_ui_value',hook.ui_value)))
+                __M_writer(u'\n            ')
+                __M_writer(escape(h.text('hook_ui_value_new',hook.ui_value,size=60)))
+                __M_writer(u'\n            <span class="action_button"\n            onclick="ajaxActionHook(')
+                __M_writer(escape(hook.ui_id))
+                __M_writer(u",'")
+                __M_writer(escape('id%s' % hook.ui_id ))
+                __M_writer(u'\')">\n            <i class="icon-minus-circled" style="color:#FF4444"></i>\n            ')
+                __M_writer(escape(_('delete')))
+                __M_writer(u'\n            </span>\n        </div>\n      </div>\n')
+            __M_writer(u'\n      <div class="field">\n        <div class="input" style="margin-left:-135px;position: absolute;">\n          <div class="input">\n             ')
+            __M_writer(escape(h.text('new_hook_ui_key',size=20)))
+            __M_writer(u'\n          </div>\n        </div>\n        <div class="input" style="margin-left:280px">\n            ')
+            __M_writer(escape(h.text('new_hook_ui_value',size=60)))
+            __M_writer(u'\n        </div>\n      </div>\n      <div class="buttons" style="margin-left:280px">\n         ')
+            __M_writer(escape(h.submit('save',_('Save'),class_="btn")))
+            __M_writer(u'\n      </div>\n    </div>\n</div>\n')
+            __M_writer(escape(h.end_form()))
+            __M_writer(u'\n')
+        __M_writer(u'\n<script type="text/javascript">\nfunction ajaxActionHook(hook_id,field_id) {\n    var sUrl = "')
+        __M_writer(escape(h.url('admin_settings_hooks')))
+        __M_writer(u'";\n    var success = function (o) {\n            var elem = YUD.get(""+field_id);\n            elem.parentNode.removeChild(elem);\n        };\n    var failure = function (o) {\n            alert("')
+        __M_writer(escape(_('Failed to remove hook')))
+        __M_writer(u'");\n        };\n    var postData = {\'_method\': \'delete\', \'hook_id\': hook_id};\n    ajaxPOST(sUrl, postData, success, failure);\n};\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 1, "27": 1, "28": 4, "29": 5, "30": 7, "31": 7, "32": 7, "33": 7, "34": 10, "35": 10, "36": 14, "37": 15, "38": 15, "39": 18, "40": 19, "41": 19, "42": 19, "43": 20, "44": 20, "45": 24, "46": 25, "47": 25, "48": 25, "49": 27, "50": 27, "51": 27, "52": 27, "53": 30, "54": 30, "55": 31, "56": 31, "57": 32, "58": 32, "59": 34, "60": 34, "61": 34, "62": 34, "63": 36, "64": 36, "65": 41, "66": 45, "67": 45, "68": 49, "69": 49, "70": 53, "71": 53, "72": 57, "73": 57, "74": 59, "75": 62, "76": 62, "77": 68, "78": 68, "84": 78}, "uri": "/admin/settings/settings_hooks.html", "filename": "/root/package/kallithea/templates/admin/settings/settings_hooks.html"}
+__M_END_METADATA
+"""
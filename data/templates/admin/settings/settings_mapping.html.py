@@ -0,0 +1,59 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253628.195786
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/settings/settings_mapping.html'
+_template_uri = u'/admin/settings/settings_mapping.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(escape(h.form(url('admin_settings_mapping'), method='post')))
+        __M_writer(u'\n    <div class="form">\n        <div class="fields">\n            <div class="field">\n                <div class="label label-checkbox">\n                    <label for="destroy">')
+        __M_writer(escape(_('Rescan option')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('destroy',True)))
+        __M_writer(u'\n                        <label for="destroy">')
+        __M_writer(escape(_('Destroy old data')))
+        __M_writer(u'</label>\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_('Check this option to remove references to repositories that no longer exist in on the filesystem.')))
+        __M_writer(u'</span>\n\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('invalidate',True)))
+        __M_writer(u'\n                        <label for="invalidate"> ')
+        __M_writer(escape(_('Invalidate cache for all repositories')))
+        __M_writer(u'</label>\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_('Check this to reload data and clear cache keys for all repositories.')))
+        __M_writer(u'</span>\n\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('hooks',True)))
+        __M_writer(u'\n                        <label for="hooks"> ')
+        __M_writer(escape(_('Install Git hooks')))
+        __M_writer(u' </label>\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_("Verify if Kallithea's Git hooks are installed for each repository. Current hooks will be updated to the latest version.")))
+        __M_writer(u'</span>\n                </div>\n\n                </div>\n            </div>\n\n            <div class="buttons">\n            ')
+        __M_writer(escape(h.submit('rescan',_('Rescan Repositories'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "24": 1, "25": 1, "26": 6, "27": 6, "28": 10, "29": 10, "30": 11, "31": 11, "32": 13, "33": 13, "34": 16, "35": 16, "36": 17, "37": 17, "38": 19, "39": 19, "40": 22, "41": 22, "42": 23, "43": 23, "44": 25, "45": 25, "46": 32, "47": 32, "48": 36, "49": 36, "55": 49}, "uri": "/admin/settings/settings_mapping.html", "filename": "/root/package/kallithea/templates/admin/settings/settings_mapping.html"}
+__M_END_METADATA
+"""
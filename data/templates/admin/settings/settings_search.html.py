@@ -0,0 +1,47 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253628.380772
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/settings/settings_search.html'
+_template_uri = u'/admin/settings/settings_search.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(escape(h.form(url('admin_settings_search'), method='post')))
+        __M_writer(u'\n    <div class="form">\n\n        <div class="fields">\n            <div class="field">\n                <div class="label label-checkbox">\n                    <label>')
+        __M_writer(escape(_('Index build option')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('full_index',True)))
+        __M_writer(u'\n                        <label for="full_index">')
+        __M_writer(escape(_('Build from scratch')))
+        __M_writer(u'</label>\n\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_('This option completely reindexeses all of the repositories for proper fulltext search capabilities.')))
+        __M_writer(u'</span>\n\n                </div>\n            </div>\n\n            <div class="buttons">\n            ')
+        __M_writer(escape(h.submit('reindex',_('Reindex'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"32": 15, "33": 15, "34": 21, "35": 21, "36": 25, "37": 25, "43": 37, "16": 0, "24": 1, "25": 1, "26": 7, "27": 7, "28": 11, "29": 11, "30": 12, "31": 12}, "uri": "/admin/settings/settings_search.html", "filename": "/root/package/kallithea/templates/admin/settings/settings_search.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,71 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253628.561828
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/settings/settings_system.html'
+_template_uri = u'/admin/settings/settings_system.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<dl class="dl-horizontal">\n')
+
+        elems = [
+           (_('Kallithea version'), h.literal('%s <b><span style="color:#036185; text-decoration: underline;cursor: pointer" id="check_for_update" >%s</span></b>' % (c.kallithea_version, _('check for updates'))), ''),
+           (_('Python version'), c.py_version, ''),
+           (_('Platform'), c.platform, ''),
+           (_('Git version'), c.git_version, ''),
+           (_('Git path'), c.ini.get('git_path'), ''),
+           (_('Repository cache'), _('%(entries)s repositories, %(hits)s hits, %(misses)s misses, %(evictions)s evictions') % c.scm_pool_stats, ''),
+           (_('Upgrade info endpoint'), h.literal('%s <br/><span style="color:#999999">%s.</span>' % (c.update_url, _('Note: please make sure this server can access this URL'))), '')
+        ]
+        
+        
+        __M_locals_builtin_stored = __M_locals_builtin()
+        __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['elems'] if __M_key in __M_locals_builtin_stored]))
+        __M_writer(u'\n\n<div id="update_notice" style="display: none">\n    <div style="padding: 5px 0px 5px 0px; color: #000000; font-weight: bold">')
+        __M_writer(escape(_('Checking for updates...')))
+        __M_writer(u'</div>\n</div>\n')
+        for dt, dd, tt in elems:
+            __M_writer(u'  <dt style="width:150px; text-align: left">')
+            __M_writer(escape(dt))
+            __M_writer(u':</dt>\n  <dd style="margin-left: 160px" title="')
+            __M_writer(escape(tt))
+            __M_writer(u'">')
+            __M_writer(escape(dd))
+            __M_writer(u'</dd>\n')
+        __M_writer(u'</dl>\n\n<h4>')
+        __M_writer(escape(_('Python Packages')))
+        __M_writer(u'</h4>\n<table class="table" style="margin:0px 0px 0px 0px">\n  <colgroup>\n      <col style="width:180px">\n  </colgroup>\n  <tbody>\n')
+        for key, value in c.modules:
+            __M_writer(u'          <tr>\n              <td style="padding-right:5px;">')
+            __M_writer(escape(key))
+            __M_writer(u'</td>\n              <td>')
+            __M_writer(escape(value))
+            __M_writer(u'</td>\n          </tr>\n')
+        __M_writer(u'  </tbody>\n</table>\n\n<script>\n    $(\'#check_for_update\').click(function(e){\n        var $update_notice = $(\'#update_notice\');\n        $update_notice.show();\n        asynchtml("')
+        __M_writer(escape(h.url('admin_settings_system_update')))
+        __M_writer(u'", $update_notice);\n    });\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "24": 1, "25": 2, "39": 12, "40": 15, "41": 15, "42": 17, "43": 18, "44": 18, "45": 18, "46": 19, "47": 19, "48": 19, "49": 19, "50": 21, "51": 23, "52": 23, "53": 29, "54": 30, "55": 31, "56": 31, "57": 32, "58": 32, "59": 35, "60": 42, "61": 42, "67": 61}, "uri": "/admin/settings/settings_system.html", "filename": "/root/package/kallithea/templates/admin/settings/settings_system.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,96 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253628.010787
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/settings/settings_vcs.html'
+_template_uri = u'/admin/settings/settings_vcs.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(escape(h.form(url('admin_settings'), method='post')))
+        __M_writer(u'\n    <div class="form">\n        <div class="fields">\n            <div class="field">\n                <div class="label label-checkbox">\n                    <label>')
+        __M_writer(escape(_('Web')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('web_push_ssl', 'True')))
+        __M_writer(u'\n                        <label for="web_push_ssl">')
+        __M_writer(escape(_('Require SSL for vcs operations')))
+        __M_writer(u'</label>\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_('Activate to require SSL both pushing and pulling. If SSL certificate is missing, it will return an HTTP Error 406: Not Acceptable.')))
+        __M_writer(u'</span>\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label>')
+        __M_writer(escape(_('Hooks')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('hooks_changegroup_repo_size','True')))
+        __M_writer(u'\n                        <label for="hooks_changegroup_repo_size">')
+        __M_writer(escape(_('Show repository size after push')))
+        __M_writer(u'</label>\n                    </div>\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('hooks_changegroup_push_logger','True')))
+        __M_writer(u'\n                        <label for="hooks_changegroup_push_logger">')
+        __M_writer(escape(_('Log user push commands')))
+        __M_writer(u'</label>\n                    </div>\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('hooks_outgoing_pull_logger','True')))
+        __M_writer(u'\n                        <label for="hooks_outgoing_pull_logger">')
+        __M_writer(escape(_('Log user pull commands')))
+        __M_writer(u'</label>\n                    </div>\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('hooks_changegroup_update','True')))
+        __M_writer(u'\n                        <label for="hooks_changegroup_update">')
+        __M_writer(escape(_('Update repository after push (hg update)')))
+        __M_writer(u'</label>\n                    </div>\n                </div>\n             </div>\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label>')
+        __M_writer(escape(_('Mercurial extensions')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('extensions_largefiles','True')))
+        __M_writer(u'\n                        <label for="extensions_largefiles">')
+        __M_writer(escape(_('Enable largefiles extension')))
+        __M_writer(u'</label>\n                    </div>\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('extensions_hgsubversion','True')))
+        __M_writer(u'\n                        <label for="extensions_hgsubversion">')
+        __M_writer(escape(_('Enable hgsubversion extension')))
+        __M_writer(u'</label>\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_('Requires hgsubversion library to be installed. Enables cloning of remote Subversion repositories while converting them to Mercurial.')))
+        __M_writer(u'</span>\n')
+        __M_writer(u'                </div>\n            </div>\n')
+        if c.visual.allow_repo_location_change:
+            __M_writer(u'            <div class="field">\n                <div class="label">\n                    <label for="paths_root_path">')
+            __M_writer(escape(_('Location of repositories')))
+            __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+            __M_writer(escape(h.text('paths_root_path',size=60,readonly="readonly", class_="disabled")))
+            __M_writer(u'\n                    <span id="path_unlock" class="tooltip" style="cursor: pointer"\n                            title="')
+            __M_writer(escape(h.tooltip(_('Click to unlock. You must restart Kallithea in order to make this setting take effect.'))))
+            __M_writer(u'">\n                        <div class="btn btn-small"><i id="path_unlock_icon" class="icon-lock"></i></div>\n                    </span>\n                    <span class="help-block">')
+            __M_writer(escape(_('Filesystem location where repositories are stored. After changing this value, a restart and rescan of the repository folder are both required.')))
+            __M_writer(u'</span>\n                </div>\n            </div>\n')
+        else:
+            __M_writer(u'            ')
+            __M_writer(escape(h.hidden('paths_root_path',size=30,readonly="readonly", class_="disabled")))
+            __M_writer(u'\n')
+        __M_writer(u'            <div class="buttons">\n                ')
+        __M_writer(escape(h.submit('save',_('Save Settings'),class_="btn")))
+        __M_writer(u'\n                ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n           </div>\n        </div>\n    </div>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n\n    <script type="text/javascript">\n        $(document).ready(function(){\n            $(\'#path_unlock\').on(\'click\', function(e){\n                $(\'#path_unlock_icon\').removeClass(\'icon-lock\');\n                $(\'#path_unlock_icon\').addClass(\'icon-lock-open-alt\');\n                $(\'#paths_root_path\').removeAttr(\'readonly\');\n                $(\'#paths_root_path\').removeClass(\'disabled\');\n            })\n        })\n    </script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 1, "27": 6, "28": 6, "29": 10, "30": 10, "31": 11, "32": 11, "33": 13, "34": 13, "35": 19, "36": 19, "37": 23, "38": 23, "39": 24, "40": 24, "41": 27, "42": 27, "43": 28, "44": 28, "45": 31, "46": 31, "47": 32, "48": 32, "49": 35, "50": 35, "51": 36, "52": 36, "53": 42, "54": 42, "55": 46, "56": 46, "57": 47, "58": 47, "59": 50, "60": 50, "61": 51, "62": 51, "63": 53, "64": 53, "65": 59, "66": 61, "67": 62, "68": 64, "69": 64, "70": 67, "71": 67, "72": 69, "73": 69, "74": 72, "75": 72, "76": 75, "77": 77, "78": 77, "79": 77, "80": 79, "81": 80, "82": 80, "83": 81, "84": 81, "85": 85, "86": 85, "92": 86}, "uri": "/admin/settings/settings_vcs.html", "filename": "/root/package/kallithea/templates/admin/settings/settings_vcs.html"}
+__M_END_METADATA
+"""
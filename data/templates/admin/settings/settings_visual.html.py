@@ -0,0 +1,111 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253628.75487
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/settings/settings_visual.html'
+_template_uri = u'/admin/settings/settings_visual.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(escape(h.form(url('admin_settings_visual'), method='post')))
+        __M_writer(u'\n    <div class="form">\n\n        <div class="fields">\n\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label>')
+        __M_writer(escape(_('General')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('repository_fields','True')))
+        __M_writer(u'\n                        <label for="repository_fields">')
+        __M_writer(escape(_('Use repository extra fields')))
+        __M_writer(u'</label>\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_('Allows storing additional customized fields per repository.')))
+        __M_writer(u'</span>\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('show_version','True')))
+        __M_writer(u'\n                        <label for="show_version">')
+        __M_writer(escape(_('Show Kallithea version')))
+        __M_writer(u'</label>\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_('Shows or hides a version number of Kallithea displayed in the footer.')))
+        __M_writer(u'</span>\n\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('use_gravatar','True')))
+        __M_writer(u'\n                        <label for="use_gravatar">')
+        __M_writer(escape(_('Use Gravatars in Kallithea')))
+        __M_writer(u'</label>\n                    </div>\n                </div>\n                <div class="field">\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.text('gravatar_url', size=80)))
+        __M_writer(u'\n                        <span class="help-block">')
+        __M_writer(escape(_('''Gravatar URL allows you to use another avatar server application.
+                                                        The following variables of the URL will be replaced accordingly.
+                                                        {scheme}    'http' or 'https' sent from running Kallithea server,
+                                                        {email}     user email,
+                                                        {md5email}  md5 hash of the user email (like at gravatar.com),
+                                                        {size}      size of the image that is expected from the server application,
+                                                        {netloc}    network location/server host of running Kallithea server''')))
+        __M_writer(u'</span>\n                    </div>\n                </div>\n                <div class="field">\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.text('clone_uri_tmpl', size=80)))
+        __M_writer(u'\n                        <span class="help-block">')
+        __M_writer(escape(_('''Schema of clone URL construction eg. '{scheme}://{user}@{netloc}/{repo}'.
+                                                        The following variables are available:
+                                                        {scheme} 'http' or 'https' sent from running Kallithea server,
+                                                        {user}   current user username,
+                                                        {netloc} network location/server host of running Kallithea server,
+                                                        {repo}   full repository name,
+                                                        {repoid} ID of repository, can be used to contruct clone-by-id''')))
+        __M_writer(u'</span>\n                    </div>\n                </div>\n             </div>\n\n            <div class="field">\n                <div class="label">\n                    <label for="dashboard_items">')
+        __M_writer(escape(_('Dashboard items')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('dashboard_items',size=5)))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Number of items displayed in the main page dashboard before pagination is shown.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n            <div class="field">\n                <div class="label">\n                    <label for="admin_grid_items">')
+        __M_writer(escape(_('Admin pages items')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('admin_grid_items',size=5)))
+        __M_writer(u'\n                    <span class="help-block">')
+        __M_writer(escape(_('Number of items displayed in the admin pages grids before pagination is shown.')))
+        __M_writer(u'</span>\n                </div>\n            </div>\n\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label>')
+        __M_writer(escape(_('Icons')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('show_public_icon','True')))
+        __M_writer(u'\n                        <label for="show_public_icon">')
+        __M_writer(escape(_('Show public repo icon on repositories')))
+        __M_writer(u'</label>\n                    </div>\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('show_private_icon','True')))
+        __M_writer(u'\n                        <label for="show_private_icon">')
+        __M_writer(escape(_('Show private repo icon on repositories')))
+        __M_writer(u'</label>\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_('Show public/private icons next to repository names.')))
+        __M_writer(u'</span>\n                 </div>\n             </div>\n\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label>')
+        __M_writer(escape(_('Meta-Tagging')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    <div class="checkbox">\n                        ')
+        __M_writer(escape(h.checkbox('stylify_metatags','True')))
+        __M_writer(u'\n                        <label for="stylify_metatags">')
+        __M_writer(escape(_('Stylify recognised meta tags:')))
+        __M_writer(u'</label>\n                    </div>\n                    <div style="padding-left: 20px;">\n                        <ul> <!-- Fix style here -->\n                            <li>[featured] <span class="metatag" tag="featured">featured</span></li>\n                            <li>[stale] <span class="metatag" tag="stale">stale</span></li>\n                            <li>[dead] <span class="metatag" tag="dead">dead</span></li>\n                            <li>[lang =&gt; lang] <span class="metatag" tag="lang" >lang</span></li>\n                            <li>[license =&gt; License] <span class="metatag" tag="license"><a href="http://www.opensource.org/licenses/License" >License</a></span></li>\n                            <li>[requires =&gt; Repo] <span class="metatag" tag="requires" >requires =&gt; <a href="#" >Repo</a></span></li>\n                            <li>[recommends =&gt; Repo] <span class="metatag" tag="recommends" >recommends =&gt; <a href="#" >Repo</a></span></li>\n                            <li>[see =&gt; URI] <span class="metatag" tag="see">see =&gt; <a href="#">URI</a> </span></li>\n                        </ul>\n                    </div>\n                    <span class="help-block">')
+        __M_writer(escape(_('Parses meta tags from the repository description field and turns them into colored tags.')))
+        __M_writer(u'</span>\n                 </div>\n             </div>\n\n             <div class="buttons">\n                 ')
+        __M_writer(escape(h.submit('save',_('Save Settings'),class_="btn")))
+        __M_writer(u'\n                 ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n             </div>\n\n        </div>\n    </div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "24": 1, "25": 1, "26": 8, "27": 8, "28": 12, "29": 12, "30": 13, "31": 13, "32": 15, "33": 15, "34": 17, "35": 17, "36": 18, "37": 18, "38": 20, "39": 20, "40": 23, "41": 23, "42": 24, "43": 24, "44": 29, "45": 29, "46": 30, "53": 36, "54": 41, "55": 41, "56": 42, "63": 48, "64": 55, "65": 55, "66": 58, "67": 58, "68": 59, "69": 59, "70": 65, "71": 65, "72": 68, "73": 68, "74": 69, "75": 69, "76": 75, "77": 75, "78": 79, "79": 79, "80": 80, "81": 80, "82": 83, "83": 83, "84": 84, "85": 84, "86": 86, "87": 86, "88": 92, "89": 92, "90": 96, "91": 96, "92": 97, "93": 97, "94": 111, "95": 111, "96": 116, "97": 116, "98": 117, "99": 117, "100": 122, "101": 122, "107": 101}, "uri": "/admin/settings/settings_visual.html", "filename": "/root/package/kallithea/templates/admin/settings/settings_visual.html"}
+__M_END_METADATA
+"""
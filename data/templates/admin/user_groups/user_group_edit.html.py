@@ -0,0 +1,160 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253629.748257
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/user_groups/user_group_edit.html'
+_template_uri = 'admin/user_groups/user_group_edit.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box" style="overflow:auto">\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n\n')
+        __M_writer(u'    <div style="width: 150px; float:left">\n      <ul class="nav nav-pills nav-stacked">\n        <li class="')
+        __M_writer(escape('active' if c.active=='settings' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('edit_users_group', id=c.user_group.users_group_id)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Settings')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='advanced' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('edit_user_group_advanced', id=c.user_group.users_group_id)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Advanced')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='default_perms' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('edit_user_group_default_perms', id=c.user_group.users_group_id)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Default permissions')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='perms' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('edit_user_group_perms', id=c.user_group.users_group_id)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Permissions')))
+        __M_writer(u'</a></li>\n        <li class="')
+        __M_writer(escape('active' if c.active=='members' else ''))
+        __M_writer(u'"><a href="')
+        __M_writer(escape(h.url('edit_user_group_members', id=c.user_group.users_group_id)))
+        __M_writer(u'">')
+        __M_writer(escape(_('Members')))
+        __M_writer(u'</a></li>\n      </ul>\n    </div>\n\n    <div style="width:750px; float:left; padding: 10px 0px 0px 20px;margin: 0px 0px 0px 10px; border-left: 1px solid #DDDDDD">\n        ')
+        runtime._include_file(context, u'/admin/user_groups/user_group_edit_' + (c.active) + u'.html', _template_uri)
+        __M_writer(u'\n    </div>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(h.link_to(_('User Groups'),h.url('users_groups'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(c.user_group.users_group_name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s user group settings') % c.user_group.users_group_name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 8, "129": 9, "130": 9, "131": 11, "132": 11, "133": 13, "134": 13, "140": 4, "148": 4, "149": 5, "150": 5, "27": 0, "156": 150, "39": 2, "44": 6, "45": 14, "50": 18, "51": 41, "57": 16, "64": 16, "65": 17, "66": 17, "72": 20, "80": 20, "81": 23, "82": 23, "83": 27, "84": 29, "85": 29, "86": 29, "87": 29, "88": 29, "89": 29, "90": 30, "91": 30, "92": 30, "93": 30, "94": 30, "95": 30, "96": 31, "97": 31, "98": 31, "99": 31, "100": 31, "101": 31, "102": 32, "103": 32, "104": 32, "105": 32, "106": 32, "107": 32, "108": 33, "109": 33, "110": 33, "111": 33, "112": 33, "113": 33, "114": 38, "115": 38, "121": 8}, "uri": "admin/user_groups/user_group_edit.html", "filename": "/root/package/kallithea/templates/admin/user_groups/user_group_edit.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,53 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253629.757573
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/user_groups/user_group_edit_default_perms.html'
+_template_uri = u'/admin/user_groups/user_group_edit_default_perms.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'p', context._clean_inheritance_tokens(), templateuri=u'/base/perms_summary.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'p')] = ns
+
+    ns = runtime.TemplateNamespace(u'dpb', context._clean_inheritance_tokens(), templateuri=u'/base/default_perms_box.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'dpb')] = ns
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        p = _mako_get_namespace(context, 'p')
+        c = context.get('c', UNDEFINED)
+        dpb = _mako_get_namespace(context, 'dpb')
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(dpb.default_perms_box(url('edit_user_group_default_perms', id=c.user_group.users_group_id))))
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        __M_writer(escape(p.perms_summary(c.permissions)))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"38": 1, "39": 2, "40": 2, "41": 5, "42": 6, "43": 6, "49": 43, "23": 5, "26": 1, "29": 0}, "uri": "/admin/user_groups/user_group_edit_default_perms.html", "filename": "/root/package/kallithea/templates/admin/user_groups/user_group_edit_default_perms.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,163 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253634.169019
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/users/user_add.html'
+_template_uri = 'admin/users/user_add.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <!-- end box / title -->\n    ')
+        __M_writer(escape(h.form(url('users'))))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n        <div class="fields">\n             <div class="field">\n                <div class="label">\n                    <label for="username">')
+        __M_writer(escape(_('Username')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('username',class_='small')))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="password">')
+        __M_writer(escape(_('Password')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.password('password',class_='small',autocomplete="off")))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="password_confirmation">')
+        __M_writer(escape(_('Password confirmation')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.password('password_confirmation',class_="small",autocomplete="off")))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="firstname">')
+        __M_writer(escape(_('First Name')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('firstname',class_='small')))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="lastname">')
+        __M_writer(escape(_('Last Name')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('lastname',class_='small')))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="email">')
+        __M_writer(escape(_('Email')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('email',class_='small')))
+        __M_writer(u'\n                    ')
+        __M_writer(escape(h.hidden('extern_name', c.default_extern_type)))
+        __M_writer(u'\n                    ')
+        __M_writer(escape(h.hidden('extern_type', c.default_extern_type)))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label for="active">')
+        __M_writer(escape(_('Active')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('active',value=True,checked='checked')))
+        __M_writer(u'\n                </div>\n             </div>\n\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Save'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u"\n</div>\n\n<script>\n    $(document).ready(function(){\n        $('#username').focus();\n    })\n</script>\n")
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(h.link_to(_('Users'),h.url('users'))))
+        __M_writer(u'\n    &raquo;\n    ')
+        __M_writer(escape(_('Add User')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Add user')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"132": 7, "133": 8, "134": 8, "135": 10, "136": 10, "137": 12, "138": 12, "144": 4, "151": 4, "152": 5, "153": 5, "27": 0, "159": 153, "38": 2, "43": 6, "44": 13, "49": 17, "50": 108, "56": 15, "63": 15, "64": 16, "65": 16, "71": 19, "80": 19, "81": 23, "82": 23, "83": 26, "84": 26, "85": 32, "86": 32, "87": 35, "88": 35, "89": 41, "90": 41, "91": 44, "92": 44, "93": 50, "94": 50, "95": 53, "96": 53, "97": 59, "98": 59, "99": 62, "100": 62, "101": 68, "102": 68, "103": 71, "104": 71, "105": 77, "106": 77, "107": 80, "108": 80, "109": 81, "110": 81, "111": 82, "112": 82, "113": 88, "114": 88, "115": 91, "116": 91, "117": 96, "118": 96, "119": 100, "120": 100, "126": 7}, "uri": "admin/users/user_add.html", "filename": "/root/package/kallithea/templates/admin/users/user_add.html"}
+__M_END_METADATA
+"""
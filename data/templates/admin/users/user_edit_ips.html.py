@@ -0,0 +1,78 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253631.878164
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/users/user_edit_ips.html'
+_template_uri = u'/admin/users/user_edit_ips.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<div class="ips_wrap">\n  <table class="noborder">\n')
+        if c.default_user_ip_map and c.inherit_default_ips:
+            for ip in c.default_user_ip_map:
+                __M_writer(u'          <tr>\n            <td><div class="ip">')
+                __M_writer(escape(ip.ip_addr))
+                __M_writer(u'</div></td>\n            <td><div class="ip">')
+                __M_writer(escape(h.ip_range(ip.ip_addr)))
+                __M_writer(u'</div></td>\n            <td>')
+                __M_writer(escape(h.literal(_('Inherited from %s') % h.link_to('*default*',h.url('admin_permissions_ips')))))
+                __M_writer(u'</td>\n          </tr>\n')
+        __M_writer(u'\n')
+        if c.user_ip_map:
+            for ip in c.user_ip_map:
+                __M_writer(u'          <tr>\n            <td><div class="ip">')
+                __M_writer(escape(ip.ip_addr))
+                __M_writer(u'</div></td>\n            <td><div class="ip">')
+                __M_writer(escape(h.ip_range(ip.ip_addr)))
+                __M_writer(u'</div></td>\n            <td>\n                ')
+                __M_writer(escape(h.form(url('edit_user_ips', id=c.user.user_id),method='delete')))
+                __M_writer(u'\n                    ')
+                __M_writer(escape(h.hidden('del_ip_id',ip.ip_id)))
+                __M_writer(u'\n                    <i class="icon-minus-circled" style="color:#FF4444"></i>\n                    ')
+                __M_writer(escape(h.submit('remove_',_('delete'),id="remove_ip_%s" % ip.ip_id,
+                    class_="action_button", onclick="return  confirm('"+_('Confirm to delete this ip: %s') % ip.ip_addr+"');")))
+                __M_writer(u'\n                ')
+                __M_writer(escape(h.end_form()))
+                __M_writer(u'\n            </td>\n          </tr>\n')
+        if not c.default_user_ip_map and not c.user_ip_map:
+            __M_writer(u'        <tr><td><div class="ip">')
+            __M_writer(escape(_('All IP addresses are allowed.')))
+            __M_writer(u'</div></td></tr>\n')
+        __M_writer(u'  </table>\n</div>\n\n<div>\n    ')
+        __M_writer(escape(h.form(url('edit_user_ips', id=c.user.user_id),method='put')))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n        <div class="fields">\n             <div class="field">\n                <div class="label">\n                    <label for="new_ip">')
+        __M_writer(escape(_('New ip address')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('new_ip', class_='medium')))
+        __M_writer(u'\n                </div>\n             </div>\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Add'),class_="btn")))
+        __M_writer(u'\n              ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 3, "27": 4, "28": 5, "29": 6, "30": 6, "31": 7, "32": 7, "33": 8, "34": 8, "35": 12, "36": 13, "37": 14, "38": 15, "39": 16, "40": 16, "41": 17, "42": 17, "43": 19, "44": 19, "45": 20, "46": 20, "47": 22, "49": 23, "50": 24, "51": 24, "52": 29, "53": 30, "54": 30, "55": 30, "56": 32, "57": 36, "58": 36, "59": 42, "60": 42, "61": 45, "62": 45, "63": 49, "64": 49, "65": 50, "66": 50, "67": 54, "68": 54, "74": 68}, "uri": "/admin/users/user_edit_ips.html", "filename": "/root/package/kallithea/templates/admin/users/user_edit_ips.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,130 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253635.804248
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/admin/users/user_edit_profile.html'
+_template_uri = u'/admin/users/user_edit_profile.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(escape(h.form(url('update_user', id=c.user.user_id),method='put')))
+        __M_writer(u'\n<div class="form">\n        <div class="field">\n           <div class="gravatar_box">\n                <div class="gravatar">')
+        __M_writer(escape(h.gravatar(c.user.email)))
+        __M_writer(u'</div>\n                <p>\n')
+        if c.visual.use_gravatar:
+            __M_writer(u'                <strong>')
+            __M_writer(escape(_('Change avatar at')))
+            __M_writer(u' <a href="http://gravatar.com">gravatar.com</a></strong>\n                <br/>')
+            __M_writer(escape(_('Using')))
+            __M_writer(u' ')
+            __M_writer(escape(c.user.email))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'                <strong>')
+            __M_writer(escape(_('Avatars are disabled')))
+            __M_writer(u'</strong>\n                <br/>')
+            __M_writer(escape(c.user.email or _('Missing email, please update this user email address.')))
+            __M_writer(u'\n')
+            if c.authuser.username == c.user.username:
+                __M_writer(u'                            [')
+                __M_writer(escape(_('current IP')))
+                __M_writer(u': ')
+                __M_writer(escape(c.perm_user.ip_addr or "?"))
+                __M_writer(u']\n')
+        __M_writer(u'           </div>\n        </div>\n        ')
+        readonly = None 
+        
+        __M_locals_builtin_stored = __M_locals_builtin()
+        __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['readonly'] if __M_key in __M_locals_builtin_stored]))
+        __M_writer(u'\n        ')
+        disabled = "" 
+        
+        __M_locals_builtin_stored = __M_locals_builtin()
+        __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['disabled'] if __M_key in __M_locals_builtin_stored]))
+        __M_writer(u'\n        <div class="fields">\n')
+        if c.extern_type != c.EXTERN_TYPE_INTERNAL:
+            __M_writer(u'             <div class="field">\n               ')
+            readonly = "readonly" 
+            
+            __M_locals_builtin_stored = __M_locals_builtin()
+            __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['readonly'] if __M_key in __M_locals_builtin_stored]))
+            __M_writer(u'\n               ')
+            disabled = " disabled" 
+            
+            __M_locals_builtin_stored = __M_locals_builtin()
+            __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['disabled'] if __M_key in __M_locals_builtin_stored]))
+            __M_writer(u'\n               <strong>')
+            __M_writer(escape(_('This user is in an external Source of Record (%s); some details cannot be managed here.' % c.extern_type)))
+            __M_writer(u'.</strong>\n             </div>\n')
+        __M_writer(u'\n             <div class="field">\n                <div class="label">\n                    <label for="username">')
+        __M_writer(escape(_('Username')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                  ')
+        __M_writer(escape(h.text('username',class_='medium%s' % disabled, readonly=readonly)))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="email">')
+        __M_writer(escape(_('Email')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('email',class_='medium')))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="extern_type">')
+        __M_writer(escape(_('Source of Record')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('extern_type',class_='medium disabled',readonly="readonly")))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="extern_name">')
+        __M_writer(escape(_('Name in Source of Record')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('extern_name',class_='medium disabled',readonly="readonly")))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="new_password">')
+        __M_writer(escape(_('New password')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.password('new_password',class_='medium%s' % disabled,autocomplete="off",readonly=readonly)))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="password_confirmation">')
+        __M_writer(escape(_('New password confirmation')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.password('password_confirmation',class_="medium%s" % disabled,autocomplete="off",readonly=readonly)))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="firstname">')
+        __M_writer(escape(_('First Name')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('firstname',class_='medium')))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label">\n                    <label for="lastname">')
+        __M_writer(escape(_('Last Name')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('lastname',class_='medium')))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label for="active">')
+        __M_writer(escape(_('Active')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('active',value=True)))
+        __M_writer(u'\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label for="admin">')
+        __M_writer(escape(_('Admin')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('admin',value=True)))
+        __M_writer(u'\n                </div>\n             </div>\n\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Save'),class_="btn")))
+        __M_writer(u'\n              ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n</div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 1, "27": 5, "28": 5, "29": 7, "30": 8, "31": 8, "32": 8, "33": 9, "34": 9, "35": 9, "36": 9, "37": 10, "38": 11, "39": 11, "40": 11, "41": 12, "42": 12, "43": 14, "44": 15, "45": 15, "46": 15, "47": 15, "48": 15, "49": 18, "50": 20, "54": 20, "55": 21, "59": 21, "60": 23, "61": 24, "62": 25, "66": 25, "67": 26, "71": 26, "72": 27, "73": 27, "74": 30, "75": 33, "76": 33, "77": 36, "78": 36, "79": 42, "80": 42, "81": 45, "82": 45, "83": 51, "84": 51, "85": 54, "86": 54, "87": 60, "88": 60, "89": 63, "90": 63, "91": 69, "92": 69, "93": 72, "94": 72, "95": 78, "96": 78, "97": 81, "98": 81, "99": 87, "100": 87, "101": 90, "102": 90, "103": 96, "104": 96, "105": 99, "106": 99, "107": 105, "108": 105, "109": 108, "110": 108, "111": 114, "112": 114, "113": 117, "114": 117, "115": 122, "116": 122, "117": 123, "118": 123, "119": 127, "120": 127, "126": 120}, "uri": "/admin/users/user_edit_profile.html", "filename": "/root/package/kallithea/templates/admin/users/user_edit_profile.html"}
+__M_END_METADATA
+"""
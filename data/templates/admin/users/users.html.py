@@ -0,0 +1,148 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253633.971967
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/admin/users/users.html'
+_template_uri = 'admin/users/users.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('admin')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n        <ul class="links">\n          <li>\n            <a href="')
+        __M_writer(escape(h.url('new_user')))
+        __M_writer(u'" class="btn btn-small btn-success"><i class="icon-plus"></i> ')
+        __M_writer(escape(_(u'Add User')))
+        __M_writer(u'</a>\n          </li>\n        </ul>\n    </div>\n    <!-- end box / title -->\n    <div class="table-grid table yui-skin-sam" id="datatable_list_wrap"></div>\n    <div id="user-paginator" style="padding: 0px 0px 0px 20px"></div>\n</div>\n\n<script>\n  var data = ')
+        __M_writer(c.data)
+        __M_writer(u';\n  var fields = [\n    {key: "gravatar"},\n    {key: "raw_name"},\n    {key: "username"},\n    {key: "firstname"},\n    {key: "lastname"},\n    {key: "last_login"},\n    {key: "last_login_raw"},\n    {key: "active"},\n    {key: "admin"},\n    {key: "extern_type"},\n    {key: "action"}\n  ];\n  var column_defs = [\n    {key:"gravatar",label:"",sortable:false},\n    {key:"username",label:"')
+        __M_writer(escape(_('Username')))
+        __M_writer(u'",sortable:true},\n    {key:"firstname",label:"')
+        __M_writer(escape(_('First Name')))
+        __M_writer(u'",sortable:true},\n    {key:"lastname",label:"')
+        __M_writer(escape(_('Last Name')))
+        __M_writer(u'",sortable:true},\n    {key:"last_login",label:"')
+        __M_writer(escape(_('Last Login')))
+        __M_writer(u'",sortable:true, sortOptions: { sortFunction: lastLoginSort }},\n    {key:"active",label:"')
+        __M_writer(escape(_('Active')))
+        __M_writer(u'",sortable:true},\n    {key:"admin",label:"')
+        __M_writer(escape(_('Admin')))
+        __M_writer(u'",sortable:true},\n    {key:"extern_type",label:"')
+        __M_writer(escape(_('Auth Type')))
+        __M_writer(u'",sortable:true},\n    {key:"action",label:"')
+        __M_writer(escape(_('Action')))
+        __M_writer(u'",sortable:false}\n  ];\n  var counter = YUD.get(\'user_count\');\n  var sort_key = "username";\n  YUI_datatable(data, fields, column_defs, counter, sort_key, ')
+        __M_writer(escape(c.visual.admin_grid_items))
+        __M_writer(u');\n</script>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <input class="q_filter_box" id="q_filter" size="15" type="text" name="filter" placeholder="')
+        __M_writer(escape(_('quick filter...')))
+        __M_writer(u'" value=""/>\n    ')
+        __M_writer(escape(h.link_to(_('Admin'),h.url('admin_home'))))
+        __M_writer(u' &raquo; <span id="user_count">0</span> ')
+        __M_writer(escape(_('Users')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Users Administration')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"129": 4, "136": 4, "137": 5, "138": 5, "144": 138, "27": 0, "38": 2, "43": 6, "44": 11, "49": 15, "50": 64, "56": 13, "63": 13, "64": 14, "65": 14, "71": 17, "79": 17, "80": 21, "81": 21, "82": 24, "83": 24, "84": 24, "85": 24, "86": 34, "87": 34, "88": 50, "89": 50, "90": 51, "91": 51, "92": 52, "93": 52, "94": 53, "95": 53, "96": 54, "97": 54, "98": 55, "99": 55, "100": 56, "101": 56, "102": 57, "103": 57, "104": 61, "105": 61, "111": 8, "117": 8, "118": 9, "119": 9, "120": 10, "121": 10, "122": 10, "123": 10}, "uri": "admin/users/users.html", "filename": "/root/package/kallithea/templates/admin/users/users.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,646 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253605.150514
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/base/base.html'
+_template_uri = u'/base/base.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = ['flash_msg', u'branding_title', 'breadcrumbs', 'repotag', 'admin_menu', 'repo_context_bar', 'menu', 'admin_menu_simple']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'root.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        c = context.get('c', UNDEFINED)
+        def branding_title():
+            return render_branding_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        next = context.get('next', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<!-- CONTENT -->\n<div id="content">\n    ')
+        __M_writer(escape(self.flash_msg()))
+        __M_writer(u'\n    <div id="main">\n        ')
+        __M_writer(escape(next.main()))
+        __M_writer(u'\n    </div>\n</div>\n<!-- END CONTENT -->\n\n<!-- FOOTER -->\n<div id="footer">\n   <div id="footer-inner" class="title">\n       <div>\n           <p class="footer-link">\n               ')
+        __M_writer(escape(_('Server instance: %s') % c.instance_id if c.instance_id else ''))
+        __M_writer(u'\n           </p>\n           <p class="footer-link-right">\n               This site is powered by\n')
+        if c.visual.show_version:
+            __M_writer(u'                   <a href="')
+            __M_writer(escape(h.url('kallithea_project_url')))
+            __M_writer(u'" target="_blank">Kallithea</a> ')
+            __M_writer(escape(c.kallithea_version))
+            __M_writer(u',\n')
+        else:
+            __M_writer(u'                   <a href="')
+            __M_writer(escape(h.url('kallithea_project_url')))
+            __M_writer(u'" target="_blank">Kallithea</a>,\n')
+        __M_writer(u'               which is\n               <a href="')
+        __M_writer(escape(h.canonical_url('about')))
+        __M_writer(u'#copyright">&copy; 2010&ndash;2015 by various authors &amp; licensed under GPLv3</a>.\n')
+        if c.issues_url:
+            __M_writer(u'                   &ndash; <a href="')
+            __M_writer(escape(c.issues_url))
+            __M_writer(u'" target="_blank">')
+            __M_writer(escape(_('Support')))
+            __M_writer(u'</a>\n')
+        __M_writer(u'           </p>\n       </div>\n   </div>\n</div>\n\n<!-- END FOOTER -->\n\n')
+        __M_writer(u'\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'branding_title'):
+            context['self'].branding_title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 0:
+            __M_writer(u'<div class="modal" id="help_kb" tabindex="-1" role="dialog" aria-labelledby="myModalLabel" aria-hidden="true">\n    <div class="modal-dialog">\n      <div class="modal-content">\n        <div class="modal-header">\n          <button type="button" class="close" data-dismiss="modal" aria-hidden="true"><i class="icon-cancel-circled"></i></button>\n          <h4 class="modal-title">')
+            __M_writer(escape(_('Keyboard shortcuts')))
+            __M_writer(u'</h4>\n        </div>\n        <div class="modal-body">\n           <div class="row">\n              <div class="col-md-5">\n                <table class="keyboard-mappings">\n                    <tbody>\n                  <tr>\n                    <th></th>\n                    <th>')
+            __M_writer(escape(_('Site-wide shortcuts')))
+            __M_writer(u'</th>\n                  </tr>\n                  ')
+
+            elems = [
+                ('/', 'Open quick search box'),
+                ('ctrl/cmd+b', 'Show main settings bar'),
+                ('g h', 'Goto home page'),
+                ('g g', 'Goto my private gists page'),
+                ('g G', 'Goto my public gists page'),
+                ('n r', 'New repository page'),
+                ('n g', 'New gist page')
+            ]
+                              
+            
+            __M_locals_builtin_stored = __M_locals_builtin()
+            __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['elems'] if __M_key in __M_locals_builtin_stored]))
+            __M_writer(u'\n')
+            for key, desc in elems:
+                __M_writer(u'                  <tr>\n                    <td class="keys">\n                      <span class="key">')
+                __M_writer(escape(key))
+                __M_writer(u'</span>\n                    </td>\n                    <td>')
+                __M_writer(escape(desc))
+                __M_writer(u'</td>\n                  </tr>\n')
+            __M_writer(u'                </tbody>\n                  </table>\n              </div>\n              <div class="col-md-offset-5">\n                <table class="keyboard-mappings">\n                <tbody>\n                  <tr>\n                    <th></th>\n                    <th>')
+            __M_writer(escape(_('Repositories')))
+            __M_writer(u'</th>\n                  </tr>\n                  ')
+
+            elems = [
+                ('g s', 'Goto summary page'),
+                ('g c', 'Goto changelog page'),
+                ('g f', 'Goto files page'),
+                ('g F', 'Goto files page with file search activated'),
+                ('g o', 'Goto repository settings'),
+                ('g O', 'Goto repository permissions settings')
+            ]
+                              
+            
+            __M_locals_builtin_stored = __M_locals_builtin()
+            __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['elems'] if __M_key in __M_locals_builtin_stored]))
+            __M_writer(u'\n')
+            for key, desc in elems:
+                __M_writer(u'                  <tr>\n                    <td class="keys">\n                      <span class="key">')
+                __M_writer(escape(key))
+                __M_writer(u'</span>\n                    </td>\n                    <td>')
+                __M_writer(escape(desc))
+                __M_writer(u'</td>\n                  </tr>\n')
+            __M_writer(u'                </tbody>\n            </table>\n              </div>\n            </div>\n        </div>\n        <div class="modal-footer">\n        </div>\n      </div><!-- /.modal-content -->\n    </div><!-- /.modal-dialog -->\n</div><!-- /.modal -->\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_flash_msg(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        runtime._include_file(context, u'/base/flash_msg.html', _template_uri)
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_branding_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def branding_title():
+            return render_branding_title(context)
+        c = context.get('c', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.site_name:
+            __M_writer(u'    &middot; ')
+            __M_writer(escape(c.site_name))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <div class="breadcrumbs">\n    ')
+        __M_writer(escape(self.breadcrumbs_links()))
+        __M_writer(u'\n    </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_repotag(context,repo):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if h.is_hg(repo):
+            __M_writer(u'    <span class="repotag" title="')
+            __M_writer(escape(_('Mercurial repository')))
+            __M_writer(u'">hg</span>\n')
+        if h.is_git(repo):
+            __M_writer(u'    <span class="repotag" title="')
+            __M_writer(escape(_('Git repository')))
+            __M_writer(u'">git</span>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_admin_menu(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <ul class="admin_menu">\n      <li><a href="')
+        __M_writer(escape(h.url('admin_home')))
+        __M_writer(u'"><i class="icon-book"></i> ')
+        __M_writer(escape(_('Admin Journal')))
+        __M_writer(u'</a></li>\n      <li><a href="')
+        __M_writer(escape(h.url('repos')))
+        __M_writer(u'"><i class="icon-database"></i> ')
+        __M_writer(escape(_('Repositories')))
+        __M_writer(u'</a></li>\n      <li><a href="')
+        __M_writer(escape(h.url('repos_groups')))
+        __M_writer(u'"><i class="icon-folder"></i> ')
+        __M_writer(escape(_('Repository Groups')))
+        __M_writer(u'</a></li>\n      <li><a href="')
+        __M_writer(escape(h.url('users')))
+        __M_writer(u'"><i class="icon-user"></i> ')
+        __M_writer(escape(_('Users')))
+        __M_writer(u'</a></li>\n      <li><a href="')
+        __M_writer(escape(h.url('users_groups')))
+        __M_writer(u'"><i class="icon-users"></i> ')
+        __M_writer(escape(_('User Groups')))
+        __M_writer(u'</a></li>\n      <li><a href="')
+        __M_writer(escape(h.url('admin_permissions')))
+        __M_writer(u'"><i class="icon-block"></i> ')
+        __M_writer(escape(_('Permissions')))
+        __M_writer(u'</a></li>\n      <li><a href="')
+        __M_writer(escape(h.url('auth_home')))
+        __M_writer(u'"><i class="icon-key"></i> ')
+        __M_writer(escape(_('Authentication')))
+        __M_writer(u'</a></li>\n      <li><a href="')
+        __M_writer(escape(h.url('defaults')))
+        __M_writer(u'"><i class="icon-wrench"></i> ')
+        __M_writer(escape(_('Defaults')))
+        __M_writer(u'</a></li>\n      <li class="last"><a href="')
+        __M_writer(escape(h.url('admin_settings')))
+        __M_writer(u'"><i class="icon-gear"></i> ')
+        __M_writer(escape(_('Settings')))
+        __M_writer(u'</a></li>\n  </ul>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_repo_context_bar(context,current=None,rev=None):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        def repotag(repo):
+            return render_repotag(context,repo)
+        request = context.get('request', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        rev = None if rev == 'tip' else rev 
+        
+        __M_writer(u'\n  ')
+
+        def follow_class():
+            if c.repository_following:
+                return h.literal('following')
+            else:
+                return h.literal('follow')
+          
+        
+        __M_writer(u'\n  ')
+
+        def is_current(selected):
+            if selected == current:
+                return h.literal('class="current"')
+        
+        
+        __M_writer(u'\n\n  <!--- CONTEXT BAR -->\n  <div id="context-bar" class="box">\n      <h2>\n        ')
+        __M_writer(escape(repotag(c.db_repo)))
+        __M_writer(u'\n\n')
+        if c.db_repo.private:
+            __M_writer(u'          <i class="icon-keyhole-circled"></i>\n')
+        else:
+            __M_writer(u'          <i class="icon-globe"></i>\n')
+        __M_writer(u'        ')
+        __M_writer(escape(h.repo_link(c.db_repo.groups_and_repo)))
+        __M_writer(u'\n\n')
+        if current == 'createfork':
+            __M_writer(u'         - ')
+            __M_writer(escape(_('Create Fork')))
+            __M_writer(u'\n')
+        __M_writer(u'      </h2>\n      <!--\n      <div id="breadcrumbs">\n        ')
+        __M_writer(escape(h.link_to(_(u'Repositories'),h.url('home'))))
+        __M_writer(u'\n        &raquo;\n        ')
+        __M_writer(escape(h.repo_link(c.db_repo.groups_and_repo)))
+        __M_writer(u'\n      </div>\n      -->\n      <ul id="context-pages" class="horizontal-list">\n        <li ')
+        __M_writer(escape(is_current('summary')))
+        __M_writer(u'><a href="')
+        __M_writer(escape(h.url('summary_home', repo_name=c.repo_name)))
+        __M_writer(u'"><i class="icon-doc-text"></i> ')
+        __M_writer(escape(_('Summary')))
+        __M_writer(u'</a></li>\n')
+        if rev:
+            __M_writer(u'        <li ')
+            __M_writer(escape(is_current('changelog')))
+            __M_writer(u'><a href="')
+            __M_writer(escape(h.url('changelog_file_home', repo_name=c.repo_name, revision=rev, f_path='')))
+            __M_writer(u'"><i class="icon-clock"></i> ')
+            __M_writer(escape(_('Changelog')))
+            __M_writer(u'</a></li>\n')
+        else:
+            __M_writer(u'        <li ')
+            __M_writer(escape(is_current('changelog')))
+            __M_writer(u'><a href="')
+            __M_writer(escape(h.url('changelog_home', repo_name=c.repo_name)))
+            __M_writer(u'"><i class="icon-clock"></i> ')
+            __M_writer(escape(_('Changelog')))
+            __M_writer(u'</a></li>\n')
+        __M_writer(u'        <li ')
+        __M_writer(escape(is_current('files')))
+        __M_writer(u'><a href="')
+        __M_writer(escape(h.url('files_home', repo_name=c.repo_name, revision=rev or 'tip')))
+        __M_writer(u'"><i class="icon-doc-inv"></i> ')
+        __M_writer(escape(_('Files')))
+        __M_writer(u'</a></li>\n        <li ')
+        __M_writer(escape(is_current('switch-to')))
+        __M_writer(u'>\n          <a href="#" id="branch_tag_switcher_2" class="dropdown"><i class="icon-exchange"></i> ')
+        __M_writer(escape(_('Switch To')))
+        __M_writer(u'</a>\n          <ul id="switch_to_list_2" class="switch_to submenu">\n            <li><a href="#">')
+        __M_writer(escape(_('Loading...')))
+        __M_writer(u'</a></li>\n          </ul>\n        </li>\n        <li ')
+        __M_writer(escape(is_current('options')))
+        __M_writer(u'>\n')
+        if h.HasRepoPermissionAll('repository.admin')(c.repo_name):
+            __M_writer(u'               <a href="')
+            __M_writer(escape(h.url('edit_repo',repo_name=c.repo_name)))
+            __M_writer(u'" class="dropdown"><i class="icon-wrench"></i> ')
+            __M_writer(escape(_('Options')))
+            __M_writer(u'</a>\n')
+        else:
+            __M_writer(u'               <a href="#" class="dropdown"><i class="icon-wrench"></i> ')
+            __M_writer(escape(_('Options')))
+            __M_writer(u'</a>\n')
+        __M_writer(u'          <ul>\n')
+        if h.HasRepoPermissionAll('repository.admin')(c.repo_name):
+            __M_writer(u'                   <li><a href="')
+            __M_writer(escape(h.url('edit_repo',repo_name=c.repo_name)))
+            __M_writer(u'"><i class="icon-gear"></i> ')
+            __M_writer(escape(_('Settings')))
+            __M_writer(u'</a></li>\n')
+        if c.db_repo.fork:
+            __M_writer(u'               <li><a href="')
+            __M_writer(escape(h.url('compare_url',repo_name=c.db_repo.fork.repo_name,org_ref_type=c.db_repo.landing_rev[0],org_ref_name=c.db_repo.landing_rev[1], other_repo=c.repo_name,other_ref_type='branch' if request.GET.get('branch') else c.db_repo.landing_rev[0],other_ref_name=request.GET.get('branch') or c.db_repo.landing_rev[1], merge=1)))
+            __M_writer(u'">\n                   <i class="icon-git-compare"></i> ')
+            __M_writer(escape(_('Compare Fork')))
+            __M_writer(u'</a></li>\n')
+        __M_writer(u'              <li><a href="')
+        __M_writer(escape(h.url('compare_home',repo_name=c.repo_name)))
+        __M_writer(u'"><i class="icon-git-compare"></i> ')
+        __M_writer(escape(_('Compare')))
+        __M_writer(u'</a></li>\n\n              <li><a href="')
+        __M_writer(escape(h.url('search_repo',repo_name=c.repo_name)))
+        __M_writer(u'"><i class="icon-search"></i> ')
+        __M_writer(escape(_('Search')))
+        __M_writer(u'</a></li>\n\n')
+        if h.HasRepoPermissionAny('repository.write','repository.admin')(c.repo_name) and c.db_repo.enable_locking:
+            if c.db_repo.locked[0]:
+                __M_writer(u'                  <li><a href="')
+                __M_writer(escape(h.url('toggle_locking', repo_name=c.repo_name)))
+                __M_writer(u'"><i class="icon-lock"></i> ')
+                __M_writer(escape(_('Unlock')))
+                __M_writer(u'</a></li>\n')
+            else:
+                __M_writer(u'                  <li><a href="')
+                __M_writer(escape(h.url('toggle_locking', repo_name=c.repo_name)))
+                __M_writer(u'"><i class="icon-lock-open-alt"></i> ')
+                __M_writer(escape(_('Lock')))
+                __M_writer(u'</li>\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'                  <li>\n                   <a class="')
+            __M_writer(escape(follow_class()))
+            __M_writer(u'" onclick="javascript:toggleFollowingRepo(this,')
+            __M_writer(escape(c.db_repo.repo_id))
+            __M_writer(u');">\n                    <span class="show-follow"><i class="icon-heart-empty"></i> ')
+            __M_writer(escape(_('Follow')))
+            __M_writer(u'</span>\n                    <span class="show-following"><i class="icon-heart"></i> ')
+            __M_writer(escape(_('Unfollow')))
+            __M_writer(u'</span>\n                  </a>\n                  </li>\n                  <li><a href="')
+            __M_writer(escape(h.url('repo_fork_home',repo_name=c.repo_name)))
+            __M_writer(u'"><i class="icon-git-pull-request"></i> ')
+            __M_writer(escape(_('Fork')))
+            __M_writer(u'</a></li>\n                  <li><a href="')
+            __M_writer(escape(h.url('pullrequest_home',repo_name=c.repo_name)))
+            __M_writer(u'"><i class="icon-git-pull-request"></i> ')
+            __M_writer(escape(_('Create Pull Request')))
+            __M_writer(u'</a></li>\n')
+        __M_writer(u'             </ul>\n        </li>\n        <li ')
+        __M_writer(escape(is_current('showpullrequest')))
+        __M_writer(u'>\n          <a href="')
+        __M_writer(escape(h.url('pullrequest_show_all',repo_name=c.repo_name)))
+        __M_writer(u'" title="')
+        __M_writer(escape(_('Show Pull Requests for %s') % c.repo_name))
+        __M_writer(u'"> <i class="icon-git-pull-request"></i> ')
+        __M_writer(escape(_('Pull Requests')))
+        __M_writer(u'\n')
+        if c.repository_pull_requests:
+            __M_writer(u'              <span>')
+            __M_writer(escape(c.repository_pull_requests))
+            __M_writer(u'</span>\n')
+        __M_writer(u'          </a>\n        </li>\n      </ul>\n  </div>\n  <script type="text/javascript">\n      YUE.on(\'branch_tag_switcher_2\',\'mouseover\',function(){\n         var $branch_tag_switcher_2 = $(\'#branch_tag_switcher_2\');\n         var loaded = $branch_tag_switcher_2.hasClass(\'loaded\');\n         if(!loaded){\n             $branch_tag_switcher_2.addClass(\'loaded\');\n             asynchtml("')
+        __M_writer(escape(h.url('branch_tag_switcher',repo_name=c.repo_name)))
+        __M_writer(u'", $(\'#switch_to_list_2\'));\n         }\n         return false;\n      });\n  </script>\n  <!--- END CONTEXT BAR -->\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_menu(context,current=None):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        def admin_menu_simple(repositories=None,repository_groups=None,user_groups=None):
+            return render_admin_menu_simple(context,repositories,repository_groups,user_groups)
+        hasattr = context.get('hasattr', UNDEFINED)
+        def admin_menu():
+            return render_admin_menu(context)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+
+        def is_current(selected):
+            if selected == current:
+                return h.literal('class="current"')
+        
+        
+        __M_writer(u'\n\n  <ul id="quick" class="horizontal-list">\n    <!-- repo switcher -->\n    <li ')
+        __M_writer(escape(is_current('repositories')))
+        __M_writer(u'>\n      <input id="repo_switcher" name="repo_switcher" type="hidden">\n    </li>\n\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'      <li ')
+            __M_writer(escape(is_current('journal')))
+            __M_writer(u'>\n        <a class="menu_link" title="')
+            __M_writer(escape(_('Show recent activity')))
+            __M_writer(u'"  href="')
+            __M_writer(escape(h.url('journal')))
+            __M_writer(u'">\n          <i class="icon-book"></i> ')
+            __M_writer(escape(_('Journal')))
+            __M_writer(u'\n        </a>\n      </li>\n')
+        else:
+            __M_writer(u'      <li ')
+            __M_writer(escape(is_current('journal')))
+            __M_writer(u'>\n        <a class="menu_link" title="')
+            __M_writer(escape(_('Public journal')))
+            __M_writer(u'"  href="')
+            __M_writer(escape(h.url('public_journal')))
+            __M_writer(u'">\n          <i class="icon-book"></i> ')
+            __M_writer(escape(_('Public journal')))
+            __M_writer(u'\n        </a>\n      </li>\n')
+        __M_writer(u'      <li ')
+        __M_writer(escape(is_current('gists')))
+        __M_writer(u'>\n        <a class="menu_link childs" title="')
+        __M_writer(escape(_('Show public gists')))
+        __M_writer(u'"  href="')
+        __M_writer(escape(h.url('gists')))
+        __M_writer(u'">\n          <i class="icon-clippy"></i> ')
+        __M_writer(escape(_('Gists')))
+        __M_writer(u'\n        </a>\n          <ul class="admin_menu">\n            <li><a href="')
+        __M_writer(escape(h.url('new_gist', public=1)))
+        __M_writer(u'"><i class="icon-paste"></i> ')
+        __M_writer(escape(_('Create New Gist')))
+        __M_writer(u'</a></li>\n            <li><a href="')
+        __M_writer(escape(h.url('gists')))
+        __M_writer(u'"><i class="icon-globe"></i> ')
+        __M_writer(escape(_('All Public Gists')))
+        __M_writer(u'</a></li>\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'              <li><a href="')
+            __M_writer(escape(h.url('gists', public=1)))
+            __M_writer(u'"><i class="icon-user"></i> ')
+            __M_writer(escape(_('My Public Gists')))
+            __M_writer(u'</a></li>\n              <li><a href="')
+            __M_writer(escape(h.url('gists', private=1)))
+            __M_writer(u'"><i class="icon-keyhole-circled"></i> ')
+            __M_writer(escape(_('My Private Gists')))
+            __M_writer(u'</a></li>\n')
+        __M_writer(u'          </ul>\n      </li>\n    <li ')
+        __M_writer(escape(is_current('search')))
+        __M_writer(u'>\n        <a class="menu_link" title="')
+        __M_writer(escape(_('Search in repositories')))
+        __M_writer(u'"  href="')
+        __M_writer(escape(h.url('search')))
+        __M_writer(u'">\n          <i class="icon-search"></i> ')
+        __M_writer(escape(_('Search')))
+        __M_writer(u'\n        </a>\n    </li>\n')
+        if h.HasPermissionAll('hg.admin')('access admin main page'):
+            __M_writer(u'      <li ')
+            __M_writer(escape(is_current('admin')))
+            __M_writer(u'>\n        <a class="menu_link childs" title="')
+            __M_writer(escape(_('Admin')))
+            __M_writer(u'" href="')
+            __M_writer(escape(h.url('admin_home')))
+            __M_writer(u'">\n          <i class="icon-gear"></i> ')
+            __M_writer(escape(_('Admin')))
+            __M_writer(u'\n        </a>\n        ')
+            __M_writer(escape(admin_menu()))
+            __M_writer(u'\n      </li>\n')
+        elif c.authuser.repositories_admin or c.authuser.repository_groups_admin or c.authuser.user_groups_admin:
+            __M_writer(u'    <li ')
+            __M_writer(escape(is_current('admin')))
+            __M_writer(u'>\n        <a class="menu_link childs" title="')
+            __M_writer(escape(_('Admin')))
+            __M_writer(u'">\n          <i class="icon-gear"></i> ')
+            __M_writer(escape(_('Admin')))
+            __M_writer(u'\n        </a>\n        ')
+            __M_writer(escape(admin_menu_simple(c.authuser.repositories_admin,
+                            c.authuser.repository_groups_admin,
+                            c.authuser.user_groups_admin or h.HasPermissionAny('hg.usergroup.create.true')())))
+            __M_writer(u'\n    </li>\n')
+        __M_writer(u'\n    <li ')
+        __M_writer(escape(is_current('my_pullrequests')))
+        __M_writer(u'>\n      <a class="menu_link" title="')
+        __M_writer(escape(_('My Pull Requests')))
+        __M_writer(u'" href="')
+        __M_writer(escape(h.url('my_pullrequests')))
+        __M_writer(u'">\n        <i class="icon-git-pull-request"></i> ')
+        __M_writer(escape(_('My Pull Requests')))
+        __M_writer(u'\n')
+        if c.my_pr_count != 0:
+            __M_writer(u'          <span class="menu_link_notifications">')
+            __M_writer(escape(c.my_pr_count))
+            __M_writer(u'</span>\n')
+        __M_writer(u'      </a>\n    </li>\n\n')
+        __M_writer(u'    <li>\n      <a class="menu_link childs" id="quick_login_link">\n          <span class="icon">\n            ')
+        __M_writer(escape(h.gravatar(c.authuser.email, size=20)))
+        __M_writer(u'\n          </span>\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'            <span class="menu_link_user">')
+            __M_writer(escape(c.authuser.username))
+            __M_writer(u'</span>\n')
+            if c.unread_notifications != 0:
+                __M_writer(u'              <span class="menu_link_notifications">')
+                __M_writer(escape(c.unread_notifications))
+                __M_writer(u'</span>\n')
+        else:
+            __M_writer(u'              <span>')
+            __M_writer(escape(_('Not Logged In')))
+            __M_writer(u'</span>\n')
+        __M_writer(u'      </a>\n\n      <div class="user-menu">\n        <div id="quick_login">\n')
+        if c.authuser.username == 'default' or c.authuser.user_id is None:
+            __M_writer(u'            <h4>')
+            __M_writer(escape(_('Login to Your Account')))
+            __M_writer(u'</h4>\n            ')
+            __M_writer(escape(h.form(h.url('login_home',came_from=h.url.current()))))
+            __M_writer(u'\n            <div class="form">\n                <div class="fields">\n                    <div class="field">\n                        <div class="label">\n                            <label for="username">')
+            __M_writer(escape(_('Username')))
+            __M_writer(u':</label>\n                        </div>\n                        <div class="input">\n                            ')
+            __M_writer(escape(h.text('username',class_='focus')))
+            __M_writer(u'\n                        </div>\n\n                    </div>\n                    <div class="field">\n                        <div class="label">\n                            <label for="password">')
+            __M_writer(escape(_('Password')))
+            __M_writer(u':</label>\n                        </div>\n                        <div class="input">\n                            ')
+            __M_writer(escape(h.password('password',class_='focus')))
+            __M_writer(u'\n                        </div>\n\n                    </div>\n                    <div class="buttons">\n                        <div class="password_forgoten">')
+            __M_writer(escape(h.link_to(_('Forgot password ?'),h.url('reset_password'))))
+            __M_writer(u'</div>\n                        <div class="register">\n')
+            if h.HasPermissionAny('hg.admin', 'hg.register.auto_activate', 'hg.register.manual_activate')():
+                __M_writer(u'                         ')
+                __M_writer(escape(h.link_to(_("Don't have an account ?"),h.url('register'))))
+                __M_writer(u'\n')
+            __M_writer(u'                        </div>\n                        <div class="submit">\n                            ')
+            __M_writer(escape(h.submit('sign_in',_('Log In'),class_="btn btn-mini")))
+            __M_writer(u'\n                        </div>\n                    </div>\n                </div>\n            </div>\n            ')
+            __M_writer(escape(h.end_form()))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'            <div class="links_left">\n                <div class="big_gravatar">\n                  ')
+            __M_writer(escape(h.gravatar(c.authuser.email, size=48)))
+            __M_writer(u'\n                </div>\n                <div class="full_name">')
+            __M_writer(escape(c.authuser.full_name_or_username))
+            __M_writer(u'</div>\n                <div class="email">')
+            __M_writer(escape(c.authuser.email))
+            __M_writer(u'</div>\n            </div>\n            <div class="links_right">\n            <ol class="links">\n              <li><a href="')
+            __M_writer(escape(h.url('notifications')))
+            __M_writer(u'">')
+            __M_writer(escape(_('Notifications')))
+            __M_writer(u': ')
+            __M_writer(escape(c.unread_notifications))
+            __M_writer(u'</a></li>\n              <li>')
+            __M_writer(escape(h.link_to(_(u'My Account'),h.url('my_account'))))
+            __M_writer(u'</li>\n              <li class="logout">')
+            __M_writer(escape(h.link_to(_(u'Log Out'),h.url('logout_home'))))
+            __M_writer(u'</li>\n            </ol>\n            </div>\n')
+        __M_writer(u'        </div>\n      </div>\n    </li>\n\n    <script type="text/javascript">\n        var visual_show_public_icon = "')
+        __M_writer(escape(c.visual.show_public_icon))
+        __M_writer(u'" == "True";\n        var cache = {}\n        /*format the look of items in the list*/\n        var format = function(state){\n            if (!state.id){\n              return state.text; // optgroup\n            }\n            var obj_dict = state.obj;\n            var tmpl = \'\';\n\n            if(obj_dict && state.type == \'repo\'){\n                tmpl += \'<span class="repo-icons">\';\n                if(obj_dict[\'repo_type\'] === \'hg\'){\n                    tmpl += \'<span class="repotag">hg</span> \';\n                }\n                else if(obj_dict[\'repo_type\'] === \'git\'){\n                    tmpl += \'<span class="repotag">git</span> \';\n                }\n                if(obj_dict[\'private\']){\n                    tmpl += \'<i class="icon-keyhole-circled"></i> \';\n                }\n                else if(visual_show_public_icon){\n                    tmpl += \'<i class="icon-globe"></i> \';\n                }\n                tmpl += \'</span>\';\n            }\n            if(obj_dict && state.type == \'group\'){\n                    tmpl += \'<i class="icon-folder"></i> \';\n            }\n            tmpl += state.text;\n            return tmpl;\n        }\n\n        $("#repo_switcher").select2({\n            placeholder: \'<i class="icon-database"></i> ')
+        __M_writer(escape(_('Repositories')))
+        __M_writer(u'\',\n            dropdownAutoWidth: true,\n            formatResult: format,\n            formatSelection: format,\n            formatNoMatches: function(term){\n                return "')
+        __M_writer(escape(_('No matches found')))
+        __M_writer(u'";\n            },\n            containerCssClass: "repo-switcher",\n            dropdownCssClass: "repo-switcher-dropdown",\n            escapeMarkup: function(m){\n                // don\'t escape our custom placeholder\n                if(m.substr(0,29) == \'<i class="icon-database"></i>\'){\n                    return m;\n                }\n\n                return Select2.util.escapeMarkup(m);\n            },\n            query: function(query){\n              var key = \'cache\';\n              var cached = cache[key] ;\n              if(cached) {\n                var data = {results: []};\n                //filter results\n                $.each(cached.results, function(){\n                    var section = this.text;\n                    var children = [];\n                    $.each(this.children, function(){\n                        if(query.term.length == 0 || this.text.toUpperCase().indexOf(query.term.toUpperCase()) >= 0 ){\n                            children.push({\'id\': this.id, \'text\': this.text, \'type\': this.type, \'obj\': this.obj})\n                        }\n                    })\n                    if(children.length !== 0){\n                        data.results.push({\'text\': section, \'children\': children})\n                    }\n\n                });\n                query.callback(data);\n              }else{\n                  $.ajax({\n                    url: "')
+        __M_writer(escape(h.url('repo_switcher_data')))
+        __M_writer(u'",\n                    data: {},\n                    dataType: \'json\',\n                    type: \'GET\',\n                    success: function(data) {\n                      cache[key] = data;\n                      query.callback({results: data.results});\n                    }\n                  })\n              }\n            }\n        });\n\n        $("#repo_switcher").on(\'select2-selecting\', function(e){\n            e.preventDefault();\n            window.location = pyroutes.url(\'summary_home\', {\'repo_name\': e.val})\n        })\n\n')
+        __M_writer(u'\n        // general help "?"\n        Mousetrap.bind([\'?\'], function(e) {\n            $(\'#help_kb\').modal({})\n        });\n\n        // / open the quick filter\n        Mousetrap.bind([\'/\'], function(e) {\n            $("#repo_switcher").select2("open");\n\n            // return false to prevent default browser behavior\n            // and stop event from bubbling\n            return false;\n        });\n\n        // ctrl/command+b, show the the main bar\n        Mousetrap.bind([\'command+b\', \'ctrl+b\'], function(e) {\n            if($(\'#header-inner\').hasClass(\'hover\') && $(\'#content\').hasClass(\'hover\')){\n                $(\'#header-inner\').removeClass(\'hover\');\n                $(\'#content\').removeClass(\'hover\');\n            }\n            else{\n                $(\'#header-inner\').addClass(\'hover\');\n                $(\'#content\').addClass(\'hover\');\n            }\n            return false;\n        });\n\n        // general nav g + action\n        Mousetrap.bind([\'g h\'], function(e) {\n            window.location = pyroutes.url(\'home\');\n        });\n        Mousetrap.bind([\'g g\'], function(e) {\n            window.location = pyroutes.url(\'gists\', {\'private\':1});\n        });\n        Mousetrap.bind([\'g G\'], function(e) {\n            window.location = pyroutes.url(\'gists\', {\'public\':1});\n        });\n        Mousetrap.bind([\'n g\'], function(e) {\n            window.location = pyroutes.url(\'new_gist\');\n        });\n        Mousetrap.bind([\'n r\'], function(e) {\n            window.location = pyroutes.url(\'new_repo\');\n        });\n\n')
+        if hasattr(c, 'repo_name') and hasattr(c, 'db_repo'):
+            __M_writer(u"            // nav in repo context\n            Mousetrap.bind(['g s'], function(e) {\n                window.location = pyroutes.url('summary_home', {'repo_name': REPO_NAME});\n            });\n            Mousetrap.bind(['g c'], function(e) {\n                window.location = pyroutes.url('changelog_home', {'repo_name': REPO_NAME});\n            });\n            Mousetrap.bind(['g F'], function(e) {\n                window.location = pyroutes.url('files_home', {'repo_name': REPO_NAME, 'revision': '")
+            __M_writer(escape(c.db_repo.landing_rev[1]))
+            __M_writer(u"', 'f_path': '', 'search': '1'});\n            });\n            Mousetrap.bind(['g f'], function(e) {\n                window.location = pyroutes.url('files_home', {'repo_name': REPO_NAME, 'revision': '")
+            __M_writer(escape(c.db_repo.landing_rev[1]))
+            __M_writer(u"', 'f_path': ''});\n            });\n            Mousetrap.bind(['g o'], function(e) {\n                window.location = pyroutes.url('edit_repo', {'repo_name': REPO_NAME});\n            });\n            Mousetrap.bind(['g O'], function(e) {\n                window.location = pyroutes.url('edit_repo_perms', {'repo_name': REPO_NAME});\n            });\n")
+        __M_writer(u'\n    </script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_admin_menu_simple(context,repositories=None,repository_groups=None,user_groups=None):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <ul>\n')
+        if repositories:
+            __M_writer(u'      <li><a href="')
+            __M_writer(escape(h.url('repos')))
+            __M_writer(u'"><i class="icon-database"></i> ')
+            __M_writer(escape(_('Repositories')))
+            __M_writer(u'</a></li>\n')
+        if repository_groups:
+            __M_writer(u'      <li><a href="')
+            __M_writer(escape(h.url('repos_groups')))
+            __M_writer(u'"><i class="icon-folder"></i> ')
+            __M_writer(escape(_('Repository Groups')))
+            __M_writer(u'</a></li>\n')
+        if user_groups:
+            __M_writer(u'      <li><a href="')
+            __M_writer(escape(h.url('users_groups')))
+            __M_writer(u'"><i class="icon-users"></i> ')
+            __M_writer(escape(_('User Groups')))
+            __M_writer(u'</a></li>\n')
+        __M_writer(u'  </ul>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "39": 2, "40": 6, "41": 6, "42": 8, "43": 8, "44": 18, "45": 18, "46": 22, "47": 23, "48": 23, "49": 23, "50": 23, "51": 23, "52": 24, "53": 25, "54": 25, "55": 25, "56": 27, "57": 28, "58": 28, "59": 29, "60": 30, "61": 30, "62": 30, "63": 30, "64": 30, "65": 32, "66": 40, "71": 45, "72": 49, "73": 55, "74": 70, "75": 86, "76": 95, "77": 210, "78": 520, "79": 522, "80": 523, "81": 528, "82": 528, "83": 537, "84": 537, "85": 539, "99": 549, "100": 550, "101": 551, "102": 553, "103": 553, "104": 555, "105": 555, "106": 558, "107": 566, "108": 566, "109": 568, "122": 577, "123": 578, "124": 579, "125": 581, "126": 581, "127": 583, "128": 583, "129": 586, "135": 47, "139": 47, "140": 48, "141": 48, "147": 41, "154": 41, "155": 42, "156": 43, "157": 43, "158": 43, "164": 51, "169": 51, "170": 53, "171": 53, "177": 88, "183": 88, "184": 89, "185": 90, "186": 90, "187": 90, "188": 92, "189": 93, "190": 93, "191": 93, "197": 57, "203": 57, "204": 59, "205": 59, "206": 59, "207": 59, "208": 60, "209": 60, "210": 60, "211": 60, "212": 61, "213": 61, "214": 61, "215": 61, "216": 62, "217": 62, "218": 62, "219": 62, "220": 63, "221": 63, "222": 63, "223": 63, "224": 64, "225": 64, "226": 64, "227": 64, "228": 65, "229": 65, "230": 65, "231": 65, "232": 66, "233": 66, "234": 66, "235": 66, "236": 67, "237": 67, "238": 67, "239": 67, "245": 97, "255": 97, "256": 98, "258": 98, "259": 99, "267": 105, "268": 106, "274": 110, "275": 115, "276": 115, "277": 118, "278": 119, "279": 120, "280": 121, "281": 123, "282": 123, "283": 123, "284": 125, "285": 126, "286": 126, "287": 126, "288": 128, "289": 131, "290": 131, "291": 133, "292": 133, "293": 137, "294": 137, "295": 137, "296": 137, "297": 137, "298": 137, "299": 138, "300": 139, "301": 139, "302": 139, "303": 139, "304": 139, "305": 139, "306": 139, "307": 140, "308": 141, "309": 141, "310": 141, "311": 141, "312": 141, "313": 141, "314": 141, "315": 143, "316": 143, "317": 143, "318": 143, "319": 143, "320": 143, "321": 143, "322": 144, "323": 144, "324": 145, "325": 145, "326": 147, "327": 147, "328": 150, "329": 150, "330": 151, "331": 152, "332": 152, "333": 152, "334": 152, "335": 152, "336": 153, "337": 154, "338": 154, "339": 154, "340": 156, "341": 157, "342": 158, "343": 158, "344": 158, "345": 158, "346": 158, "347": 160, "348": 161, "349": 161, "350": 161, "351": 162, "352": 162, "353": 164, "354": 164, "355": 164, "356": 164, "357": 164, "358": 166, "359": 166, "360": 166, "361": 166, "362": 168, "363": 169, "364": 170, "365": 170, "366": 170, "367": 170, "368": 170, "369": 171, "370": 172, "371": 172, "372": 172, "373": 172, "374": 172, "375": 177, "376": 178, "377": 179, "378": 179, "379": 179, "380": 179, "381": 180, "382": 180, "383": 181, "384": 181, "385": 184, "386": 184, "387": 184, "388": 184, "389": 185, "390": 185, "391": 185, "392": 185, "393": 187, "394": 189, "395": 189, "396": 190, "397": 190, "398": 190, "399": 190, "400": 190, "401": 190, "402": 191, "403": 192, "404": 192, "405": 192, "406": 194, "407": 204, "408": 204, "414": 212, "426": 212, "427": 213, "433": 217, "434": 221, "435": 221, "436": 226, "437": 227, "438": 227, "439": 227, "440": 228, "441": 228, "442": 228, "443": 228, "444": 229, "445": 229, "446": 232, "447": 233, "448": 233, "449": 233, "450": 234, "451": 234, "452": 234, "453": 234, "454": 235, "455": 235, "456": 239, "457": 239, "458": 239, "459": 240, "460": 240, "461": 240, "462": 240, "463": 241, "464": 241, "465": 244, "466": 244, "467": 244, "468": 244, "469": 245, "470": 245, "471": 245, "472": 245, "473": 246, "474": 247, "475": 247, "476": 247, "477": 247, "478": 247, "479": 248, "480": 248, "481": 248, "482": 248, "483": 250, "484": 252, "485": 252, "486": 253, "487": 253, "488": 253, "489": 253, "490": 254, "491": 254, "492": 257, "493": 258, "494": 258, "495": 258, "496": 259, "497": 259, "498": 259, "499": 259, "500": 260, "501": 260, "502": 262, "503": 262, "504": 264, "505": 265, "506": 265, "507": 265, "508": 266, "509": 266, "510": 267, "511": 267, "512": 269, "515": 271, "516": 274, "517": 275, "518": 275, "519": 276, "520": 276, "521": 276, "522": 276, "523": 277, "524": 277, "525": 278, "526": 279, "527": 279, "528": 279, "529": 281, "530": 285, "531": 288, "532": 288, "533": 290, "534": 291, "535": 291, "536": 291, "537": 292, "538": 293, "539": 293, "540": 293, "541": 295, "542": 296, "543": 296, "544": 296, "545": 298, "546": 302, "547": 303, "548": 303, "549": 303, "550": 304, "551": 304, "552": 309, "553": 309, "554": 312, "555": 312, "556": 318, "557": 318, "558": 321, "559": 321, "560": 326, "561": 326, "562": 328, "563": 329, "564": 329, "565": 329, "566": 331, "567": 333, "568": 333, "569": 338, "570": 338, "571": 339, "572": 340, "573": 342, "574": 342, "575": 344, "576": 344, "577": 345, "578": 345, "579": 349, "580": 349, "581": 349, "582": 349, "583": 349, "584": 349, "585": 350, "586": 350, "587": 351, "588": 351, "589": 355, "590": 360, "591": 360, "592": 394, "593": 394, "594": 399, "595": 399, "596": 433, "597": 433, "598": 452, "599": 497, "600": 498, "601": 506, "602": 506, "603": 509, "604": 509, "605": 518, "611": 74, "617": 74, "618": 76, "619": 77, "620": 77, "621": 77, "622": 77, "623": 77, "624": 79, "625": 80, "626": 80, "627": 80, "628": 80, "629": 80, "630": 82, "631": 83, "632": 83, "633": 83, "634": 83, "635": 83, "636": 85, "642": 636}, "uri": "/base/base.html", "filename": "/root/package/kallithea/templates/base/base.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,79 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253629.766973
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/base/default_perms_box.html'
+_template_uri = u'/base/default_perms_box.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = ['default_perms_box']
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_default_perms_box(context,form_url):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(h.form(form_url, method='put')))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n        <div class="fields">\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label for="inherit_default_permissions">')
+        __M_writer(escape(_('Inherit from defaults')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('inherit_default_permissions',value=True)))
+        __M_writer(u'\n                    <span class="help-block">\n                    ')
+        __M_writer(escape(h.literal(_('Select to inherit permissions from %s permissions settings, and default IP address whitelist.')
+                                % h.link_to('default global', url('admin_permissions')))))
+        __M_writer(u'\n                    </span>\n                </div>\n             </div>\n\n             <div id="inherit_overlay">\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label for="create_repo_perm">')
+        __M_writer(escape(_('Create repositories')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('create_repo_perm',value=True)))
+        __M_writer(u'\n                    <span class="help-block">\n                    ')
+        __M_writer(escape(h.literal(_('Select this option to allow repository creation for this user'))))
+        __M_writer(u'\n                    </span>\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label for="create_user_group_perm">')
+        __M_writer(escape(_('Create user groups')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('create_user_group_perm',value=True)))
+        __M_writer(u'\n                    <span class="help-block">\n                        ')
+        __M_writer(escape(h.literal(_('Select this option to allow user group creation for this user'))))
+        __M_writer(u'\n                    </span>\n                </div>\n             </div>\n\n             <div class="field">\n                <div class="label label-checkbox">\n                    <label for="fork_repo_perm">')
+        __M_writer(escape(_('Fork repositories')))
+        __M_writer(u':</label>\n                </div>\n                <div class="checkboxes">\n                    ')
+        __M_writer(escape(h.checkbox('fork_repo_perm',value=True)))
+        __M_writer(u'\n                    <span class="help-block">\n                        ')
+        __M_writer(escape(h.literal(_('Select this option to allow repository forking for this user'))))
+        __M_writer(u'\n                    </span>\n                </div>\n             </div>\n\n            </div>\n            <div class="buttons">\n              ')
+        __M_writer(escape(h.submit('save',_('Save'),class_="btn")))
+        __M_writer(u'\n              ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n            </div>\n        </div>\n    </div>\n')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n\n')
+        __M_writer(u"<script>\n$(document).ready(function(e){\n    var show_custom_perms = function(inherit_default){\n        if(inherit_default){\n            $('#inherit_overlay').hide();\n        }else{\n            $('#inherit_overlay').show();\n        }\n    };\n\n    show_custom_perms($('#inherit_default_permissions').prop('checked'));\n    $('#inherit_default_permissions').change(function(){\n        show_custom_perms($('#inherit_default_permissions').prop('checked'));\n    });\n})\n</script>\n\n")
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "21": 5, "22": 89, "28": 7, "35": 7, "36": 8, "37": 8, "38": 14, "39": 14, "40": 17, "41": 17, "42": 19, "44": 20, "45": 28, "46": 28, "47": 31, "48": 31, "49": 33, "50": 33, "51": 40, "52": 40, "53": 43, "54": 43, "55": 45, "56": 45, "57": 52, "58": 52, "59": 55, "60": 55, "61": 57, "62": 57, "63": 64, "64": 64, "65": 65, "66": 65, "67": 69, "68": 69, "69": 72, "75": 69}, "uri": "/base/default_perms_box.html", "filename": "/root/package/kallithea/templates/base/default_perms_box.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,45 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253605.203422
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/base/flash_msg.html'
+_template_uri = u'/base/flash_msg.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<div class="flash_msg">\n    ')
+        messages = h.flash.pop_messages() 
+        
+        __M_locals_builtin_stored = __M_locals_builtin()
+        __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['messages'] if __M_key in __M_locals_builtin_stored]))
+        __M_writer(u'\n')
+        if messages:
+            for message in messages:
+                __M_writer(u'            <div class="alert alert-dismissable alert-')
+                __M_writer(escape(message.category))
+                __M_writer(u'">\n              <button type="button" class="close" data-dismiss="alert" aria-hidden="true"><i class="icon-cancel-circled"></i></button>\n              ')
+                __M_writer(escape(message))
+                __M_writer(u'\n            </div>\n')
+        __M_writer(u'    <script>\n    if (typeof jQuery != \'undefined\') {\n        $(".alert").alert();\n    }\n    </script>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"32": 5, "33": 7, "34": 7, "35": 11, "41": 35, "16": 0, "22": 1, "23": 2, "27": 2, "28": 3, "29": 4, "30": 5, "31": 5}, "uri": "/base/flash_msg.html", "filename": "/root/package/kallithea/templates/base/flash_msg.html"}
+__M_END_METADATA
+"""
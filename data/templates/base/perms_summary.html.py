@@ -0,0 +1,173 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253614.557929
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/base/perms_summary.html'
+_template_uri = u'/base/perms_summary.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = ['perms_summary']
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_perms_summary(context,permissions,show_all=False,actions=True):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        sorted = context.get('sorted', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div id="perms" class="table">\n')
+        for section in sorted(permissions.keys()):
+            __M_writer(u'        <div class="perms_section_head">\n            ')
+            __M_writer(escape(section.replace("_"," ").capitalize()))
+            __M_writer(u'\n')
+            if section != 'global':
+                __M_writer(u'                <div style="float: right">\n                ')
+                __M_writer(escape(_('show')))
+                __M_writer(u':\n                ')
+                __M_writer(escape(h.checkbox('perms_filter_none_%s' % section, 'none', 'checked', class_='perm_filter filter_%s' % section, section=section, perm_type='none')))
+                __M_writer(u'   <label for="')
+                __M_writer(escape('perms_filter_none_%s' % section))
+                __M_writer(u'"><span class="perm_tag none">')
+                __M_writer(escape(_('none')))
+                __M_writer(u'</span></label>\n                ')
+                __M_writer(escape(h.checkbox('perms_filter_read_%s' % section, 'read', 'checked', class_='perm_filter filter_%s' % section, section=section, perm_type='read')))
+                __M_writer(u'   <label for="')
+                __M_writer(escape('perms_filter_read_%s' % section))
+                __M_writer(u'"><span class="perm_tag read">')
+                __M_writer(escape(_('read')))
+                __M_writer(u'</span></label>\n                ')
+                __M_writer(escape(h.checkbox('perms_filter_write_%s' % section, 'write', 'checked', class_='perm_filter filter_%s' % section, section=section, perm_type='write')))
+                __M_writer(u' <label for="')
+                __M_writer(escape('perms_filter_write_%s' % section))
+                __M_writer(u'"> <span class="perm_tag write">')
+                __M_writer(escape(_('write')))
+                __M_writer(u'</span></label>\n                ')
+                __M_writer(escape(h.checkbox('perms_filter_admin_%s' % section, 'admin', 'checked', class_='perm_filter filter_%s' % section, section=section, perm_type='admin')))
+                __M_writer(u' <label for="')
+                __M_writer(escape('perms_filter_admin_%s' % section))
+                __M_writer(u'"><span class="perm_tag admin">')
+                __M_writer(escape(_('admin')))
+                __M_writer(u'</span></label>\n                </div>\n')
+            __M_writer(u'        </div>\n')
+            if not permissions[section]:
+                __M_writer(u'            <span class="empty_data">')
+                __M_writer(escape(_('No permissions defined yet')))
+                __M_writer(u'</span>\n')
+            else:
+                __M_writer(u"        <div id='tbl_list_wrap_")
+                __M_writer(escape(section))
+                __M_writer(u'\' class="yui-skin-sam">\n         <table id="tbl_list_')
+                __M_writer(escape(section))
+                __M_writer(u'">\n')
+                if section == 'global':
+                    __M_writer(u'              <thead>\n                  <tr>\n                  <th colspan="2" class="left">')
+                    __M_writer(escape(_('Permission')))
+                    __M_writer(u'</th>\n')
+                    if actions:
+                        __M_writer(u'                  <th class="left">')
+                        __M_writer(escape(_('Edit Permission')))
+                        __M_writer(u'</th>\n')
+                    __M_writer(u'              </thead>\n              <tbody>\n')
+                    for k in permissions[section]:
+                        __M_writer(u'                  <tr>\n                      <td colspan="2">\n                          ')
+                        __M_writer(escape(h.get_permission_name(k)))
+                        __M_writer(u'\n                      </td>\n')
+                        if actions:
+                            __M_writer(u'                      <td>\n                           <a href="')
+                            __M_writer(escape(h.url('admin_permissions')))
+                            __M_writer(u'">')
+                            __M_writer(escape(_('edit')))
+                            __M_writer(u'</a>\n                      </td>\n')
+                        __M_writer(u'                  </tr>\n')
+                    __M_writer(u'              </tbody>\n')
+                else:
+                    __M_writer(u'              <thead>\n                  <tr>\n                  <th class="left">')
+                    __M_writer(escape(_('Name')))
+                    __M_writer(u'</th>\n                  <th class="left">')
+                    __M_writer(escape(_('Permission')))
+                    __M_writer(u'</th>\n')
+                    if actions:
+                        __M_writer(u'                  <th class="left">')
+                        __M_writer(escape(_('Edit Permission')))
+                        __M_writer(u'</th>\n')
+                    __M_writer(u'              </thead>\n              <tbody class="section_')
+                    __M_writer(escape(section))
+                    __M_writer(u'">\n')
+                    for k, section_perm in sorted(permissions[section].items(), key=lambda s: {'none':0, 'read':1,'write':2,'admin':3}.get(s[1].split('.')[-1])):
+                        if section_perm.split('.')[-1] != 'none' or show_all:
+                            __M_writer(u'                  <tr class="perm_row ')
+                            __M_writer(escape('%s_%s' % (section, section_perm.split('.')[-1])))
+                            __M_writer(u'">\n                      <td>\n')
+                            if section == 'repositories':
+                                __M_writer(u'                              <a href="')
+                                __M_writer(escape(h.url('summary_home',repo_name=k)))
+                                __M_writer(u'">')
+                                __M_writer(escape(k))
+                                __M_writer(u'</a>\n')
+                            elif section == 'repositories_groups':
+                                __M_writer(u'                              <a href="')
+                                __M_writer(escape(h.url('repos_group_home',group_name=k)))
+                                __M_writer(u'">')
+                                __M_writer(escape(k))
+                                __M_writer(u'</a>\n')
+                            elif section == 'user_groups':
+                                __M_writer(u'                              ')
+                                __M_writer(escape(k))
+                                __M_writer(u'\n')
+                            __M_writer(u'                      </td>\n                      <td>\n                           <span class="perm_tag ')
+                            __M_writer(escape(section_perm.split('.')[-1]))
+                            __M_writer(u'">')
+                            __M_writer(escape(section_perm))
+                            __M_writer(u'</span>\n                      </td>\n')
+                            if actions:
+                                __M_writer(u'                      <td>\n')
+                                if section == 'repositories':
+                                    __M_writer(u'                              <a href="')
+                                    __M_writer(escape(h.url('edit_repo_perms',repo_name=k,anchor='permissions_manage')))
+                                    __M_writer(u'">')
+                                    __M_writer(escape(_('edit')))
+                                    __M_writer(u'</a>\n')
+                                elif section == 'repositories_groups':
+                                    __M_writer(u'                              <a href="')
+                                    __M_writer(escape(h.url('edit_repo_group_perms',group_name=k,anchor='permissions_manage')))
+                                    __M_writer(u'">')
+                                    __M_writer(escape(_('edit')))
+                                    __M_writer(u'</a>\n')
+                                elif section == 'user_groups':
+                                    pass
+                                __M_writer(u'                      </td>\n')
+                            __M_writer(u'                  </tr>\n')
+                    __M_writer(u'              <tr id="empty_')
+                    __M_writer(escape(section))
+                    __M_writer(u'" style="display: none"><td colspan="6">')
+                    __M_writer(escape(_('No permission defined')))
+                    __M_writer(u'</td></tr>\n              </tbody>\n')
+                __M_writer(u'         </table>\n        </div>\n')
+        __M_writer(u"</div>\n<script>\n    $(document).ready(function(){\n        var show_empty = function(section){\n            var visible = $('.section_{0} tr.perm_row:visible'.format(section)).length;\n            console.log(visible)\n            console.log($('.section_{0} tr.perm_row:visible'.format(section)))\n            if(visible == 0){\n                $('#empty_{0}'.format(section)).show();\n            }\n            else{\n                $('#empty_{0}'.format(section)).hide();\n            }\n        }\n        $('.perm_filter').on('change', function(e){\n            var self = this;\n            var section = $(this).attr('section');\n\n            var opts = {}\n            var elems = $('.filter_' + section).each(function(el){\n                var perm_type = $(this).attr('perm_type');\n                var checked = this.checked;\n                opts[perm_type] = checked;\n                if(checked){\n                    $('.'+section+'_'+perm_type).show();\n                }\n                else{\n                    $('.'+section+'_'+perm_type).hide();\n                }\n            });\n            show_empty(section);\n        })\n\n    })\n</script>\n")
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "21": 5, "22": 132, "28": 6, "35": 6, "36": 8, "37": 9, "38": 10, "39": 10, "40": 11, "41": 12, "42": 13, "43": 13, "44": 14, "45": 14, "46": 14, "47": 14, "48": 14, "49": 14, "50": 15, "51": 15, "52": 15, "53": 15, "54": 15, "55": 15, "56": 16, "57": 16, "58": 16, "59": 16, "60": 16, "61": 16, "62": 17, "63": 17, "64": 17, "65": 17, "66": 17, "67": 17, "68": 20, "69": 21, "70": 22, "71": 22, "72": 22, "73": 23, "74": 24, "75": 24, "76": 24, "77": 25, "78": 25, "79": 27, "80": 28, "81": 30, "82": 30, "83": 31, "84": 32, "85": 32, "86": 32, "87": 34, "88": 36, "89": 37, "90": 39, "91": 39, "92": 41, "93": 42, "94": 43, "95": 43, "96": 43, "97": 43, "98": 46, "99": 48, "100": 49, "101": 51, "102": 53, "103": 53, "104": 54, "105": 54, "106": 55, "107": 56, "108": 56, "109": 56, "110": 58, "111": 59, "112": 59, "113": 60, "114": 61, "115": 62, "116": 62, "117": 62, "118": 64, "119": 65, "120": 65, "121": 65, "122": 65, "123": 65, "124": 66, "125": 67, "126": 67, "127": 67, "128": 67, "129": 67, "130": 68, "131": 70, "132": 70, "133": 70, "134": 72, "135": 74, "136": 74, "137": 74, "138": 74, "139": 76, "140": 77, "141": 78, "142": 79, "143": 79, "144": 79, "145": 79, "146": 79, "147": 80, "148": 81, "149": 81, "150": 81, "151": 81, "152": 81, "153": 82, "155": 85, "156": 87, "157": 90, "158": 90, "159": 90, "160": 90, "161": 90, "162": 93, "163": 97, "169": 163}, "uri": "/base/perms_summary.html", "filename": "/root/package/kallithea/templates/base/perms_summary.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,291 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253605.179779
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/base/root.html'
+_template_uri = u'/base/root.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', u'head_extra', u'title', u'branding_title', u'js_extra', u'css_extra']
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        def css_extra():
+            return render_css_extra(context._locals(__M_locals))
+        def title():
+            return render_title(context._locals(__M_locals))
+        def branding_title():
+            return render_branding_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        next = context.get('next', UNDEFINED)
+        def js_extra():
+            return render_js_extra(context._locals(__M_locals))
+        def head_extra():
+            return render_head_extra(context._locals(__M_locals))
+        hasattr = context.get('hasattr', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml">\n    <head>\n        <title>')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'branding_title'):
+            context['self'].branding_title(**pageargs)
+        
+
+        __M_writer(u'</title>\n        <meta http-equiv="Content-Type" content="text/html;charset=utf-8" />\n        <meta name="robots" content="index, nofollow"/>\n        <link rel="icon" href="')
+        __M_writer(escape(h.url('/images/favicon.ico')))
+        __M_writer(u'" type="image/png" />\n\n')
+        __M_writer(u'        <link rel="stylesheet" type="text/css" href="')
+        __M_writer(escape(h.url('/js/select2/select2.css', ver=c.kallithea_version)))
+        __M_writer(u'"/>\n        <link rel="stylesheet" type="text/css" href="')
+        __M_writer(escape(h.url('/css/pygments.css', ver=c.kallithea_version)))
+        __M_writer(u'"/>\n        <link rel="stylesheet" type="text/css" href="')
+        __M_writer(escape(h.url('/css/style.css', ver=c.kallithea_version)))
+        __M_writer(u'" media="screen"/>\n        <link rel="stylesheet" type="text/css" href="')
+        __M_writer(escape(h.url('/css/contextbar.css', ver=c.kallithea_version)))
+        __M_writer(u'" media="screen"/>\n        <link rel="stylesheet" type="text/css" href="')
+        __M_writer(escape(h.url('/fontello/css/kallithea.css', ver=c.kallithea_version)))
+        __M_writer(u'">\n        ')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'css_extra'):
+            context['self'].css_extra(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'        <script type="text/javascript">\n')
+        __M_writer(u"            var TRANSLATION_MAP = {\n                'Add Another Comment':'")
+        __M_writer(escape(_("Add Another Comment")))
+        __M_writer(u'\',\n                \'Stop following this repository\':"')
+        __M_writer(escape(_('Stop following this repository')))
+        __M_writer(u'",\n                \'Start following this repository\':"')
+        __M_writer(escape(_('Start following this repository')))
+        __M_writer(u'",\n                \'Group\':"')
+        __M_writer(escape(_('Group')))
+        __M_writer(u'",\n                \'members\':"')
+        __M_writer(escape(_('members')))
+        __M_writer(u'",\n                \'Loading ...\':"')
+        __M_writer(escape(_('Loading ...')))
+        __M_writer(u'",\n                \'loading ...\':"')
+        __M_writer(escape(_('loading ...')))
+        __M_writer(u'",\n                \'Search truncated\': "')
+        __M_writer(escape(_('Search truncated')))
+        __M_writer(u'",\n                \'No matching files\': "')
+        __M_writer(escape(_('No matching files')))
+        __M_writer(u'",\n                \'Open New Pull Request\': "')
+        __M_writer(escape(_('Open New Pull Request')))
+        __M_writer(u'",\n                \'Open New Pull Request for Selected Changesets\':  "')
+        __M_writer(escape(_('Open New Pull Request for Selected Changesets')))
+        __M_writer(u'",\n                \'Show Selected Changesets __S &rarr; __E\': "')
+        __M_writer(escape(h.literal(_('Show Selected Changesets __S &rarr; __E'))))
+        __M_writer(u'",\n                \'Show Selected Changeset __S\': "')
+        __M_writer(escape(_('Show Selected Changeset __S')))
+        __M_writer(u'",\n                \'Selection Link\': "')
+        __M_writer(escape(_('Selection Link')))
+        __M_writer(u'",\n                \'Collapse Diff\': "')
+        __M_writer(escape(_('Collapse Diff')))
+        __M_writer(u'",\n                \'Expand Diff\': "')
+        __M_writer(escape(_('Expand Diff')))
+        __M_writer(u'",\n                \'Failed to revoke permission\': "')
+        __M_writer(escape(_('Failed to revoke permission')))
+        __M_writer(u'",\n                \'Confirm to revoke permission for {0}: {1} ?\': "')
+        __M_writer(escape(_('Confirm to revoke permission for {0}: {1} ?')))
+        __M_writer(u'",\n                \'enabled\': "')
+        __M_writer(escape(_('enabled')))
+        __M_writer(u'",\n                \'disabled\': "')
+        __M_writer(escape(_('disabled')))
+        __M_writer(u'",\n                \'Select changeset\': "')
+        __M_writer(escape(_('Select changeset')))
+        __M_writer(u'",\n                \'Specify changeset\': "')
+        __M_writer(escape(_('Specify changeset')))
+        __M_writer(u'",\n                \'MSG_SORTASC\': "')
+        __M_writer(escape(_('Click to sort ascending')))
+        __M_writer(u'",\n                \'MSG_SORTDESC\': "')
+        __M_writer(escape(_('Click to sort descending')))
+        __M_writer(u'",\n                \'MSG_EMPTY\': "')
+        __M_writer(escape(_('No records found.')))
+        __M_writer(u'",\n                \'MSG_ERROR\': "')
+        __M_writer(escape(_('Data error.')))
+        __M_writer(u'",\n                \'MSG_LOADING\': "')
+        __M_writer(escape(_('Loading...')))
+        __M_writer(u'"\n            };\n            var _TM = TRANSLATION_MAP;\n\n            var TOGGLE_FOLLOW_URL  = "')
+        __M_writer(escape(h.url('toggle_following')))
+        __M_writer(u'";\n\n            var REPO_NAME = "";\n')
+        if hasattr(c, 'repo_name'):
+            __M_writer(u'                var REPO_NAME = "')
+            __M_writer(escape(c.repo_name))
+            __M_writer(u'";\n')
+        __M_writer(u'\n            var _authentication_token = "')
+        __M_writer(escape(h.authentication_token()))
+        __M_writer(u'";\n        </script>\n        <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/yui.2.9.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n        <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/jquery-1.11.1.min.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n        <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/bootstrap.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n        <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/select2/select2.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n        <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/mousetrap.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n        <!--[if lt IE 9]>\n           <script language="javascript" type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/excanvas.min.js')))
+        __M_writer(u'"></script>\n        <![endif]-->\n        <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/yui.flot.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n        <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/native.history.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n        <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/pyroutes_map.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n        <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/base.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n')
+        __M_writer(u'        ')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'js_extra'):
+            context['self'].js_extra(**pageargs)
+        
+
+        __M_writer(u'\n        <script type="text/javascript">\n            (function(window,undefined){\n                var History = window.History; // Note: We are using a capital H instead of a lower h\n                if ( !History.enabled ) {\n                     // History.js is disabled for this browser.\n                     // This is because we can optionally choose to support HTML4 browsers or not.\n                    return false;\n                }\n            })(window);\n\n            $(document).ready(function(){\n              tooltip_activate();\n              show_more_event();\n              show_changeset_tooltip();\n              // routes registration\n              pyroutes.register(\'home\', "')
+        __M_writer(escape(h.url('home')))
+        __M_writer(u'", []);\n              pyroutes.register(\'new_gist\', "')
+        __M_writer(escape(h.url('new_gist')))
+        __M_writer(u'", []);\n              pyroutes.register(\'gists\', "')
+        __M_writer(escape(h.url('gists')))
+        __M_writer(u'", []);\n              pyroutes.register(\'new_repo\', "')
+        __M_writer(escape(h.url('new_repo')))
+        __M_writer(u'", []);\n\n              pyroutes.register(\'summary_home\', "')
+        __M_writer(escape(h.url('summary_home', repo_name='%(repo_name)s')))
+        __M_writer(u'", [\'repo_name\']);\n              pyroutes.register(\'changelog_home\', "')
+        __M_writer(escape(h.url('changelog_home', repo_name='%(repo_name)s')))
+        __M_writer(u'", [\'repo_name\']);\n              pyroutes.register(\'files_home\', "')
+        __M_writer(escape(h.url('files_home', repo_name='%(repo_name)s',revision='%(revision)s',f_path='%(f_path)s')))
+        __M_writer(u'", [\'repo_name\', \'revision\', \'f_path\']);\n              pyroutes.register(\'edit_repo\', "')
+        __M_writer(escape(h.url('edit_repo', repo_name='%(repo_name)s')))
+        __M_writer(u'", [\'repo_name\']);\n              pyroutes.register(\'edit_repo_perms\', "')
+        __M_writer(escape(h.url('edit_repo_perms', repo_name='%(repo_name)s')))
+        __M_writer(u'", [\'repo_name\']);\n              pyroutes.register(\'pullrequest_home\', "')
+        __M_writer(escape(h.url('pullrequest_home', repo_name='%(repo_name)s')))
+        __M_writer(u'", [\'repo_name\']);\n\n              pyroutes.register(\'toggle_following\', "')
+        __M_writer(escape(h.url('toggle_following')))
+        __M_writer(u'");\n              pyroutes.register(\'changeset_info\', "')
+        __M_writer(escape(h.url('changeset_info', repo_name='%(repo_name)s', revision='%(revision)s')))
+        __M_writer(u'", [\'repo_name\', \'revision\']);\n              pyroutes.register(\'repo_size\', "')
+        __M_writer(escape(h.url('repo_size', repo_name='%(repo_name)s')))
+        __M_writer(u'", [\'repo_name\']);\n              pyroutes.register(\'changeset_comment_preview\', "')
+        __M_writer(escape(h.url('changeset_comment_preview', repo_name='%(repo_name)s')))
+        __M_writer(u'", [\'repo_name\']);\n              pyroutes.register(\'repo_refs_data\', "')
+        __M_writer(escape(h.url('repo_refs_data', repo_name='%(repo_name)s')))
+        __M_writer(u'", [\'repo_name\']);\n             });\n        </script>\n\n        ')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'head_extra'):
+            context['self'].head_extra(**pageargs)
+        
+
+        __M_writer(u'\n    </head>\n    <body id="body">\n')
+        __M_writer(u'      <!--[if IE 7]>\n      <script>$(document.body).addClass(\'ie7\')</script>\n      <![endif]-->\n      <!--[if IE 8]>\n      <script>$(document.body).addClass(\'ie8\')</script>\n      <![endif]-->\n      <!--[if IE 9]>\n      <script>$(document.body).addClass(\'ie9\')</script>\n      <![endif]-->\n\n      <div id="header">\n        <div id="header-inner" class="title">\n          <div id="logo">\n            <a href="')
+        __M_writer(escape(h.url('home')))
+        __M_writer(u'" style="display: block;">\n              <div class="header">\n                <img src="')
+        __M_writer(escape(h.url('/images/kallithea-logo.svg')))
+        __M_writer(u'" onerror="this.onerror=\'\';this.src=\'')
+        __M_writer(escape(h.url('/images/kallithea-logo.png')))
+        __M_writer(u'\'" alt="Kallithea"/>\n              </div>\n')
+        if c.site_name:
+            __M_writer(u'                <div class="branding">')
+            __M_writer(escape(c.site_name))
+            __M_writer(u'</div>\n')
+        __M_writer(u'            </a>\n          </div>\n          ')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n        </div>\n      </div>\n\n      ')
+        __M_writer(escape(next.body()))
+        __M_writer(u'\n\n')
+        if c.ga_code:
+            __M_writer(u'      ')
+            __M_writer(escape(h.literal(c.ga_code)))
+            __M_writer(u'\n')
+        __M_writer(u'    </body>\n</html>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        __M_writer = context.writer()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_head_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def head_extra():
+            return render_head_extra(context)
+        __M_writer = context.writer()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_branding_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def branding_title():
+            return render_branding_title(context)
+        __M_writer = context.writer()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_js_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def js_extra():
+            return render_js_extra(context)
+        __M_writer = context.writer()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_css_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def css_extra():
+            return render_css_extra(context)
+        __M_writer = context.writer()
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "38": 2, "47": 5, "48": 8, "49": 8, "50": 11, "51": 11, "52": 11, "53": 12, "54": 12, "55": 13, "56": 13, "57": 14, "58": 14, "59": 15, "60": 15, "65": 16, "66": 19, "67": 21, "68": 22, "69": 22, "70": 23, "71": 23, "72": 24, "73": 24, "74": 25, "75": 25, "76": 26, "77": 26, "78": 27, "79": 27, "80": 28, "81": 28, "82": 29, "83": 29, "84": 30, "85": 30, "86": 31, "87": 31, "88": 32, "89": 32, "90": 33, "91": 33, "92": 34, "93": 34, "94": 35, "95": 35, "96": 36, "97": 36, "98": 37, "99": 37, "100": 38, "101": 38, "102": 39, "103": 39, "104": 40, "105": 40, "106": 41, "107": 41, "108": 42, "109": 42, "110": 43, "111": 43, "112": 44, "113": 44, "114": 45, "115": 45, "116": 46, "117": 46, "118": 47, "119": 47, "120": 48, "121": 48, "122": 52, "123": 52, "124": 55, "125": 56, "126": 56, "127": 56, "128": 58, "129": 59, "130": 59, "131": 61, "132": 61, "133": 62, "134": 62, "135": 63, "136": 63, "137": 64, "138": 64, "139": 65, "140": 65, "141": 67, "142": 67, "143": 69, "144": 69, "145": 70, "146": 70, "147": 71, "148": 71, "149": 72, "150": 72, "151": 74, "156": 74, "157": 90, "158": 90, "159": 91, "160": 91, "161": 92, "162": 92, "163": 93, "164": 93, "165": 95, "166": 95, "167": 96, "168": 96, "169": 97, "170": 97, "171": 98, "172": 98, "173": 99, "174": 99, "175": 100, "176": 100, "177": 102, "178": 102, "179": 103, "180": 103, "181": 104, "182": 104, "183": 105, "184": 105, "185": 106, "186": 106, "191": 110, "192": 114, "193": 127, "194": 127, "195": 129, "196": 129, "197": 129, "198": 129, "199": 131, "200": 132, "201": 132, "202": 132, "203": 134, "208": 136, "209": 140, "210": 140, "211": 142, "212": 143, "213": 143, "214": 143, "215": 145, "221": 136, "232": 110, "243": 5, "254": 5, "265": 74, "276": 16, "287": 276}, "uri": "/base/root.html", "filename": "/root/package/kallithea/templates/base/root.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,154 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253639.485229
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/branches/branches.html'
+_template_uri = 'branches/branches.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('switch-to')))
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <!-- end box / title -->\n')
+        if c.repo_branches:
+            __M_writer(u'    <div class="info_box" id="compare_branches" style="clear: both;padding: 10px 19px;text-align: right;"><a href="#" class="btn btn-small">')
+            __M_writer(escape(_('Compare Branches')))
+            __M_writer(u'</a></div>\n')
+        __M_writer(u'    <div class="table">\n        ')
+        runtime._include_file(context, u'branches_data.html', _template_uri)
+        __M_writer(u'\n    </div>\n</div>\n\n<script type="text/javascript">\n$(\'#compare_branches\',\'click\',function(e){\n    e.preventDefault();\n    var org = $(\'input[name=compare_org]:checked\')[0];\n    var other = $(\'input[name=compare_other]:checked\')[0];\n\n    if(org && other){\n        var compare_url = "')
+        __M_writer(escape(h.url('compare_url',repo_name=c.repo_name,org_ref_type='branch',org_ref_name='__ORG__',other_ref_type='branch',other_ref_name='__OTHER__')))
+        __M_writer(u'";\n        var u = compare_url.replace(\'__ORG__\',org.value)\n                           .replace(\'__OTHER__\',other.value);\n        window.location=u;\n    }\n});\n\n// main table sorting\nvar myColumnDefs = [\n    {key:"name",label:"')
+        __M_writer(escape(_('Name')))
+        __M_writer(u'",sortable:true,\n        sortOptions: { sortFunction: nameSort }},\n    {key:"date",label:"')
+        __M_writer(escape(_('Date')))
+        __M_writer(u'",sortable:true,\n        sortOptions: { sortFunction: dateSort }},\n    {key:"author",label:"')
+        __M_writer(escape(_('Author')))
+        __M_writer(u'",sortable:true},\n    {key:"revision",label:"')
+        __M_writer(escape(_('Revision')))
+        __M_writer(u'",sortable:true,\n        sortOptions: { sortFunction: revisionSort }},\n    {key:"compare",label:"')
+        __M_writer(escape(_('Compare')))
+        __M_writer(u'",sortable:false}\n];\n\nvar myDataSource = new YAHOO.util.DataSource(YUD.get("branches_data"));\n\nmyDataSource.responseType = YAHOO.util.DataSource.TYPE_HTMLTABLE;\n\nmyDataSource.responseSchema = {\n    fields: [\n        {key:"raw_name"},\n        {key:"name"},\n        {key:"raw_date"},\n        {key:"date"},\n        {key:"author"},\n        {key:"last_rev_raw"},\n        {key:"revision"},\n        {key:"compare"}\n    ]\n};\n\nvar myDataTable = new YAHOO.widget.DataTable("table_wrap", myColumnDefs, myDataSource,\n    {\n         sortedBy:{key:"name",dir:"asc"},\n         MSG_SORTASC:"')
+        __M_writer(escape(_('Click to sort ascending')))
+        __M_writer(u'",\n         MSG_SORTDESC:"')
+        __M_writer(escape(_('Click to sort descending')))
+        __M_writer(u'",\n         MSG_EMPTY:"')
+        __M_writer(escape(_('No records found.')))
+        __M_writer(u'",\n         MSG_ERROR:"')
+        __M_writer(escape(_('Data error.')))
+        __M_writer(u'",\n         MSG_LOADING:"')
+        __M_writer(escape(_('Loading...')))
+        __M_writer(u'"\n    }\n);\nmyDataTable.subscribe(\'postRenderEvent\',function(oArgs) {\n    tooltip_activate();\n    var func = function(node){\n        return node.parentNode.parentNode.parentNode.parentNode.parentNode;\n    }\n    q_filter(\'q_filter_branches\',$(\'div.table tr td .logtags .branchtag a\'),func);\n});\n\n</script>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <input class="q_filter_box" id="q_filter_branches" size="15" type="text" name="filter" placeholder="')
+        __M_writer(escape(_('quick filter...')))
+        __M_writer(u'" value=""/>\n    ')
+        __M_writer(escape(_('Branches')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s Branches') % c.repo_name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 10, "134": 4, "142": 4, "143": 5, "144": 5, "150": 144, "27": 0, "39": 2, "44": 6, "45": 11, "50": 15, "51": 96, "57": 13, "64": 13, "65": 14, "66": 14, "72": 17, "80": 17, "81": 18, "82": 18, "83": 22, "84": 22, "85": 25, "86": 26, "87": 26, "88": 26, "89": 28, "90": 29, "91": 29, "92": 40, "93": 40, "94": 49, "95": 49, "96": 51, "97": 51, "98": 53, "99": 53, "100": 54, "101": 54, "102": 56, "103": 56, "104": 79, "105": 79, "106": 80, "107": 80, "108": 81, "109": 81, "110": 82, "111": 82, "112": 83, "113": 83, "119": 8, "124": 8, "125": 9, "126": 9, "127": 10}, "uri": "branches/branches.html", "filename": "/root/package/kallithea/templates/branches/branches.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,105 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253639.497502
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/branches/branches_data.html'
+_template_uri = u'branches/branches_data.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        hasattr = context.get('hasattr', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        __M_writer = context.writer()
+        if c.repo_branches:
+            __M_writer(u'   <div id="table_wrap" class="yui-skin-sam">\n    <table id="branches_data">\n      <thead>\n        <tr>\n            <th class="left">Raw name</th> ##notranslation\n            <th class="left">')
+            __M_writer(escape(_('Name')))
+            __M_writer(u'</th>\n            <th class="left">Raw date</th> ##notranslation\n            <th class="left">')
+            __M_writer(escape(_('Date')))
+            __M_writer(u'</th>\n            <th class="left">')
+            __M_writer(escape(_('Author')))
+            __M_writer(u'</th>\n            <th class="left">Raw rev</th> ##notranslation\n            <th class="left">')
+            __M_writer(escape(_('Revision')))
+            __M_writer(u'</th>\n            <th class="left">')
+            __M_writer(escape(_('Compare')))
+            __M_writer(u'</th>\n        </tr>\n      </thead>\n')
+            for cnt,branch in enumerate(c.repo_branches.items()):
+                __M_writer(u'        <tr class="parity')
+                __M_writer(escape(cnt%2))
+                __M_writer(u'">\n            <td>')
+                __M_writer(escape(branch[0]))
+                __M_writer(u'</td>\n            <td>\n                <span class="logtags">\n                    <span class="branchtag">\n                    ')
+                __M_writer(escape(h.link_to(branch[0],h.url('changelog_home',repo_name=c.repo_name,branch=branch[0]))))
+                __M_writer(u'\n                    </span>\n                </span>\n            </td>\n            <td>')
+                __M_writer(escape(branch[1]._timestamp))
+                __M_writer(u'</td>\n            <td><span class="tooltip" title="')
+                __M_writer(escape(h.tooltip(h.age(branch[1].date))))
+                __M_writer(u'">')
+                __M_writer(escape(h.fmt_date(branch[1].date)))
+                __M_writer(u'</span></td>\n            <td title="')
+                __M_writer(escape(branch[1].author))
+                __M_writer(u'">')
+                __M_writer(escape(h.person(branch[1].author)))
+                __M_writer(u'</td>\n            <td>')
+                __M_writer(escape(branch[1].revision))
+                __M_writer(u'</td>\n            <td>\n                <div>\n                    <a href="')
+                __M_writer(escape(h.url('changeset_home',repo_name=c.repo_name,revision=branch[1].raw_id)))
+                __M_writer(u'" class="revision-link">')
+                __M_writer(escape(h.show_id(branch[1])))
+                __M_writer(u'</a>\n                </div>\n            </td>\n            <td>\n                <input class="branch-compare" type="radio" name="compare_org" value="')
+                __M_writer(escape(branch[0]))
+                __M_writer(u'"/>\n                <input class="branch-compare" type="radio" name="compare_other" value="')
+                __M_writer(escape(branch[0]))
+                __M_writer(u'"/>\n            </td>\n        </tr>\n')
+            if hasattr(c,'repo_closed_branches') and c.repo_closed_branches:
+                for cnt,branch in enumerate(c.repo_closed_branches.items()):
+                    __M_writer(u'          <tr class="parity')
+                    __M_writer(escape(cnt%2))
+                    __M_writer(u'">\n              <td>')
+                    __M_writer(escape(branch[0]))
+                    __M_writer(u'</td>\n              <td>\n                  <span class="logtags">\n                      <span class="branchtag">\n                      ')
+                    __M_writer(escape(h.link_to(branch[0]+' [closed]',h.url('changelog_home',repo_name=c.repo_name,branch=branch[0]))))
+                    __M_writer(u'\n                      </span>\n                  </span>\n              </td>\n              <td>')
+                    __M_writer(escape(branch[1]._timestamp))
+                    __M_writer(u'</td>\n              <td><span class="tooltip" title="')
+                    __M_writer(escape(h.tooltip(h.age(branch[1].date))))
+                    __M_writer(u'">')
+                    __M_writer(escape(h.fmt_date(branch[1].date)))
+                    __M_writer(u'</span></td>\n              <td title="')
+                    __M_writer(escape(branch[1].author))
+                    __M_writer(u'">')
+                    __M_writer(escape(h.person(branch[1].author)))
+                    __M_writer(u'</td>\n              <td>')
+                    __M_writer(escape(branch[1].revision))
+                    __M_writer(u'</td>\n              <td>\n                <div>\n                    <a href="')
+                    __M_writer(escape(h.url('changeset_home',repo_name=c.repo_name,revision=branch[1].raw_id)))
+                    __M_writer(u'" class="revision-link">')
+                    __M_writer(escape(h.show_id(branch[1])))
+                    __M_writer(u'</a>\n                </div>\n              </td>\n              <td></td>\n          </tr>\n')
+            __M_writer(u'    </table>\n    </div>\n')
+        else:
+            __M_writer(u'    ')
+            __M_writer(escape(_('There are no branches yet')))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "26": 1, "27": 2, "28": 7, "29": 7, "30": 9, "31": 9, "32": 10, "33": 10, "34": 12, "35": 12, "36": 13, "37": 13, "38": 16, "39": 17, "40": 17, "41": 17, "42": 18, "43": 18, "44": 22, "45": 22, "46": 26, "47": 26, "48": 27, "49": 27, "50": 27, "51": 27, "52": 28, "53": 28, "54": 28, "55": 28, "56": 29, "57": 29, "58": 32, "59": 32, "60": 32, "61": 32, "62": 36, "63": 36, "64": 37, "65": 37, "66": 42, "67": 43, "68": 44, "69": 44, "70": 44, "71": 45, "72": 45, "73": 49, "74": 49, "75": 53, "76": 53, "77": 54, "78": 54, "79": 54, "80": 54, "81": 55, "82": 55, "83": 55, "84": 55, "85": 56, "86": 56, "87": 59, "88": 59, "89": 59, "90": 59, "91": 66, "92": 68, "93": 69, "94": 69, "95": 69, "101": 95}, "uri": "branches/branches_data.html", "filename": "/root/package/kallithea/templates/branches/branches_data.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,310 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253639.932494
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/changelog/changelog.html'
+_template_uri = 'changelog/changelog.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('changelog', c.first_revision.raw_id if c.first_revision else None)))
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <div class="table">\n')
+        if c.pagination:
+            __M_writer(u'            <div>\n                <div style="overflow:auto; display:')
+            __M_writer(escape('none' if c.changelog_for_path else ''))
+            __M_writer(u'">\n                    <div class="container_header">\n                        <div style="float:left; margin-left:20px;">\n                        ')
+            __M_writer(escape(h.form(h.url.current(),method='get')))
+            __M_writer(u'\n                            ')
+            __M_writer(escape(h.submit('set',_('Show'),class_="btn btn-small")))
+            __M_writer(u'\n                            ')
+            __M_writer(escape(h.text('size',size=3,value=c.size)))
+            __M_writer(u'\n                            ')
+            __M_writer(escape(_('revisions')))
+            __M_writer(u'\n')
+            if c.branch_name:
+                __M_writer(u'                            ')
+                __M_writer(escape(h.hidden('branch', c.branch_name)))
+                __M_writer(u'\n')
+            __M_writer(u'                        ')
+            __M_writer(escape(h.end_form()))
+            __M_writer(u'\n                        </div>\n                        <div style="float: right; margin: 0px 0px 0px 4px">\n                            <a href="#" class="btn btn-small" id="rev_range_container" style="display:none"></a>\n                            <a href="#" class="btn btn-small" id="rev_range_clear" style="display:none">')
+            __M_writer(escape(_('Clear selection')))
+            __M_writer(u'</a>\n')
+            if c.revision:
+                __M_writer(u'                                <a class="btn btn-small" href="')
+                __M_writer(escape(h.url('changelog_home', repo_name=c.repo_name)))
+                __M_writer(u'">\n                                    ')
+                __M_writer(escape(_('Go to tip of repository')))
+                __M_writer(u'\n                                </a>\n')
+            if c.db_repo.fork:
+                __M_writer(u'                                <a id="compare_fork"\n                                   title="')
+                __M_writer(escape(_('Compare fork with %s' % c.db_repo.fork.repo_name)))
+                __M_writer(u'"\n                                   href="')
+                __M_writer(escape(h.url('compare_url',repo_name=c.db_repo.fork.repo_name,org_ref_type=c.db_repo.landing_rev[0],org_ref_name=c.db_repo.landing_rev[1],other_repo=c.repo_name,other_ref_type='branch' if request.GET.get('branch') else c.db_repo.landing_rev[0],other_ref_name=request.GET.get('branch') or c.db_repo.landing_rev[1], merge=1)))
+                __M_writer(u'"\n                                   class="btn btn-small"><i class="icon-git-compare"></i> ')
+                __M_writer(escape(_('Compare fork with parent repo (%s)' % c.db_repo.fork.repo_name)))
+                __M_writer(u'</a>\n')
+            __M_writer(u'                            <a id="open_new_pr" class="btn btn-small"></a>\n                            ')
+            __M_writer(escape(_("Branch filter:")))
+            __M_writer(u' ')
+            __M_writer(escape(h.select('branch_filter',c.branch_name,c.branch_filters)))
+            __M_writer(u'\n                        </div>\n                    </div>\n                </div>\n\n                <div id="changelog" style="clear:both">\n\n                <div id="graph_nodes">\n                    <canvas id="graph_canvas"></canvas>\n                </div>\n                <div id="graph_content" style="')
+            __M_writer(escape('margin: 0px' if c.changelog_for_path else ''))
+            __M_writer(u'">\n\n                <table id="changesets">\n                <tbody>\n')
+            for cnt,cs in enumerate(c.pagination):
+                __M_writer(u'                    <tr id="chg_')
+                __M_writer(escape(cnt+1))
+                __M_writer(u'" class="container ')
+                __M_writer(escape('tablerow%s' % (cnt%2)))
+                __M_writer(u'">\n                        <td class="checkbox">\n')
+                if c.changelog_for_path:
+                    __M_writer(u'                                ')
+                    __M_writer(escape(h.checkbox(cs.raw_id,class_="changeset_range", disabled="disabled")))
+                    __M_writer(u'\n')
+                else:
+                    __M_writer(u'                                ')
+                    __M_writer(escape(h.checkbox(cs.raw_id,class_="changeset_range")))
+                    __M_writer(u'\n')
+                __M_writer(u'                        <td class="status">\n')
+                if c.statuses.get(cs.raw_id):
+                    __M_writer(u'                            <div class="changeset-status-ico">\n')
+                    if c.statuses.get(cs.raw_id)[2]:
+                        __M_writer(u'                              <a class="tooltip" title="')
+                        __M_writer(escape(_('Changeset status: %s\nClick to open associated pull request #%s') % (h.changeset_status_lbl(c.statuses.get(cs.raw_id)[0]), c.statuses.get(cs.raw_id)[2])))
+                        __M_writer(u'" href="')
+                        __M_writer(escape(h.url('pullrequest_show',repo_name=c.statuses.get(cs.raw_id)[3],pull_request_id=c.statuses.get(cs.raw_id)[2])))
+                        __M_writer(u'">\n                                <i class="icon-circle changeset-status-')
+                        __M_writer(escape(c.statuses.get(cs.raw_id)[0]))
+                        __M_writer(u'"></i>\n                              </a>\n')
+                    else:
+                        __M_writer(u'                              <a class="tooltip" title="')
+                        __M_writer(escape(_('Changeset status: %s') % h.changeset_status_lbl(c.statuses.get(cs.raw_id)[0])))
+                        __M_writer(u'" href="')
+                        __M_writer(escape(h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id,anchor='comment-%s' % c.comments[cs.raw_id][0].comment_id)))
+                        __M_writer(u'">\n                                  <i class="icon-circle changeset-status-')
+                        __M_writer(escape(c.statuses.get(cs.raw_id)[0]))
+                        __M_writer(u'"></i>\n                              </a>\n')
+                    __M_writer(u'                            </div>\n')
+                __M_writer(u'                        </td>\n                        <td class="author">\n                            ')
+                __M_writer(escape(h.gravatar(h.email_or_none(cs.author), size=16)))
+                __M_writer(u'\n                            <span title="')
+                __M_writer(escape(cs.author))
+                __M_writer(u'" class="user">')
+                __M_writer(escape(h.shorter(h.person(cs.author),22)))
+                __M_writer(u'</span>\n                        </td>\n                        <td class="hash" style="width:')
+                __M_writer(escape(len(h.show_id(cs))*6.5))
+                __M_writer(u'px">\n                            <a href="')
+                __M_writer(escape(h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id)))
+                __M_writer(u'">\n                                <span class="changeset_hash">')
+                __M_writer(escape(h.show_id(cs)))
+                __M_writer(u'</span>\n                            </a>\n                        </td>\n                        <td class="date">\n                            <div class="date">')
+                __M_writer(escape(h.age(cs.date,True)))
+                __M_writer(u'</div>\n                        </td>\n                        <td class="expand_commit" commit_id="')
+                __M_writer(escape(cs.raw_id))
+                __M_writer(u'" title="')
+                __M_writer(escape(_('Expand commit message')))
+                __M_writer(u'">\n                            <i class="icon-align-left" style="color:#999"></i>\n                        </td>\n                        <td class="mid">\n                            <div class="log-container">\n                                <div class="message" id="C-')
+                __M_writer(escape(cs.raw_id))
+                __M_writer(u'">')
+                __M_writer(escape(h.urlify_commit(cs.message, c.repo_name,h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id))))
+                __M_writer(u'</div>\n                                <div class="extra-container">\n')
+                if c.comments.get(cs.raw_id):
+                    __M_writer(u'                                        <div class="comments-container">\n                                            <div class="comments-cnt" title="')
+                    __M_writer(escape(_('Changeset has comments')))
+                    __M_writer(u'">\n                                                <a href="')
+                    __M_writer(escape(h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id,anchor='comment-%s' % c.comments[cs.raw_id][0].comment_id)))
+                    __M_writer(u'">\n                                                    ')
+                    __M_writer(escape(len(c.comments[cs.raw_id])))
+                    __M_writer(u'\n                                                    <i class="icon-comment-discussion"></i>\n                                                </a>\n                                            </div>\n                                        </div>\n')
+                if h.is_hg(c.db_repo_scm_instance):
+                    for book in cs.bookmarks:
+                        __M_writer(u'                                            <div class="booktag" title="')
+                        __M_writer(escape(_('Bookmark %s') % book))
+                        __M_writer(u'">\n                                                ')
+                        __M_writer(escape(h.link_to(book,h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id))))
+                        __M_writer(u'\n                                            </div>\n')
+                for tag in cs.tags:
+                    __M_writer(u'                                        <div class="tagtag" title="')
+                    __M_writer(escape(_('Tag %s') % tag))
+                    __M_writer(u'">\n                                            ')
+                    __M_writer(escape(h.link_to(tag,h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id))))
+                    __M_writer(u'\n                                        </div>\n')
+                if (not c.branch_name) and cs.branch:
+                    __M_writer(u'                                        <div class="branchtag" title="')
+                    __M_writer(escape(_('Branch %s' % cs.branch)))
+                    __M_writer(u'">\n                                            ')
+                    __M_writer(escape(h.link_to(cs.branch,h.url('changelog_home',repo_name=c.repo_name,branch=cs.branch))))
+                    __M_writer(u'\n                                        </div>\n')
+                __M_writer(u'                                </div>\n                            </div>\n                        </td>\n                    </tr>\n')
+            __M_writer(u'                </tbody>\n                </table>\n\n                </div>\n\n                <div class="pagination-wh pagination-left">\n                    ')
+            __M_writer(escape(c.pagination.pager('$link_previous ~2~ $link_next')))
+            __M_writer(u'\n                </div>\n            </div>\n        </div>\n\n        <script type="text/javascript" src="')
+            __M_writer(escape(h.url('/js/graph.js', ver=c.kallithea_version)))
+            __M_writer(u'"></script>\n        <script type="text/javascript">\n            $(document).ready(function(){\n                //Monitor range checkboxes and build a link to changesets ranges\n                var checkboxes = YUD.getElementsByClassName(\'changeset_range\');\n                // register extra routes needed for this view\n                pyroutes.register(\'changeset_home\', "')
+            __M_writer(escape(h.url('changeset_home', repo_name='%(repo_name)s', revision='%(revision)s')))
+            __M_writer(u'", [\'repo_name\', \'revision\']);\n\n                var checkbox_checker = function(e){\n                    var checked_checkboxes = [];\n                    for (pos in checkboxes){\n                        if(checkboxes[pos].checked){\n                            checked_checkboxes.push(checkboxes[pos]);\n                        }\n                    }\n                    if(YUD.get(\'open_new_pr\')){\n                        if(checked_checkboxes.length>1){\n                            YUD.setStyle(\'open_new_pr\',\'display\',\'none\');\n                        } else {\n                            YUD.setStyle(\'open_new_pr\',\'display\',\'\');\n                            if(checked_checkboxes.length>0){\n                                YUD.get(\'open_new_pr\').innerHTML = _TM[\'Open New Pull Request for Selected Changesets\'];\n                            }else{\n                                YUD.get(\'open_new_pr\').innerHTML = _TM[\'Open New Pull Request\'];\n                            }\n                        }\n                    }\n\n                    if(checked_checkboxes.length>0){\n                        var rev_end = checked_checkboxes[0].name;\n                        var rev_start = checked_checkboxes[checked_checkboxes.length-1].name;\n                        var url = pyroutes.url(\'changeset_home\', {\'repo_name\': \'')
+            __M_writer(escape(c.repo_name))
+            __M_writer(u"',\n                                                                  'revision': rev_start+'...'+rev_end});\n\n                        var link = (rev_start == rev_end)\n                            ? _TM['Show Selected Changeset __S']\n                            : _TM['Show Selected Changesets __S &rarr; __E'];\n\n                        link = link.replace('__S',rev_start.substr(0,6));\n                        link = link.replace('__E',rev_end.substr(0,6));\n                        YUD.get('rev_range_container').href = url;\n                        YUD.get('rev_range_container').innerHTML = link;\n                        YUD.setStyle('rev_range_container','display','');\n                        YUD.setStyle('rev_range_clear','display','');\n\n                        YUD.get('open_new_pr').href = pyroutes.url('pullrequest_home',\n                                                                   {'repo_name': '")
+            __M_writer(escape(c.repo_name))
+            __M_writer(u"',\n                                                                    'rev_start': rev_start,\n                                                                    'rev_end': rev_end})\n\n                        YUD.setStyle('compare_fork','display','none');\n                    }else{\n                        YUD.setStyle('rev_range_container','display','none');\n                        YUD.setStyle('rev_range_clear','display','none');\n")
+            if c.revision:
+                __M_writer(u"                            YUD.get('open_new_pr').href = pyroutes.url('pullrequest_home',\n                                                                       {'repo_name': '")
+                __M_writer(escape(c.repo_name))
+                __M_writer(u"',\n                                                                        'rev_end':'")
+                __M_writer(escape(c.first_revision.raw_id))
+                __M_writer(u"'});\n")
+            else:
+                __M_writer(u"                            YUD.get('open_new_pr').href = pyroutes.url('pullrequest_home',\n                                                                       {'repo_name': '")
+                __M_writer(escape(c.repo_name))
+                __M_writer(u"',\n                                                                        'branch':'")
+                __M_writer(escape(c.first_revision.branch))
+                __M_writer(u"'});\n")
+            __M_writer(u'                        YUD.setStyle(\'compare_fork\',\'display\',\'\');\n                    }\n                };\n                checkbox_checker();\n                YUE.on(checkboxes,\'click\', checkbox_checker);\n\n                YUE.on(\'rev_range_clear\',\'click\',function(e){\n                    for (var i=0; i<checkboxes.length; i++){\n                        var cb = checkboxes[i];\n                        cb.checked = false;\n                    }\n                    checkbox_checker();\n                    YUE.preventDefault(e);\n                });\n\n                var $msgs = $(\'.message\');\n                // get first element height\n                var el = $(\'#graph_content .container\')[0];\n                var row_h = el.clientHeight;\n                $msgs.each(function() {\n                    var m = this;\n\n                    var h = m.clientHeight;\n                    if(h > row_h){\n                        var offset = row_h - (h+12);\n                        $(m.nextElementSibling).css(\'display\', \'block\');\n                        $(m.nextElementSibling).css(\'margin-top\', offset+\'px\');\n                    }\n                });\n\n                $(\'.expand_commit\').on(\'click\',function(e){\n                    var cid = $(this).attr(\'commit_id\');\n                    $(\'#C-\'+cid).toggleClass(\'expanded\');\n\n                    //redraw the graph, r and jsdata are bound outside function\n                    r.render(jsdata,100);\n                });\n\n                // change branch filter\n                $("#branch_filter").select2({\n                    dropdownAutoWidth: true,\n                    minimumInputLength: 1\n                    });\n\n                $("#branch_filter").change(function(e){\n                    var selected_branch = e.currentTarget.options[e.currentTarget.selectedIndex].value;\n                    if(selected_branch != \'\'){\n                        window.location = pyroutes.url(\'changelog_home\', {\'repo_name\': \'')
+            __M_writer(escape(c.repo_name))
+            __M_writer(u"',\n                                                                          'branch': selected_branch});\n                    }else{\n                        window.location = pyroutes.url('changelog_home', {'repo_name': '")
+            __M_writer(escape(c.repo_name))
+            __M_writer(u'\'});\n                    }\n                    $("#changelog").hide();\n                });\n\n                var jsdata = ')
+            __M_writer(c.jsdata)
+            __M_writer(u";\n                var r = new BranchRenderer('graph_canvas', 'graph_content', 'chg_');\n                r.render(jsdata,100);\n            });\n\n        </script>\n")
+        else:
+            __M_writer(u'            ')
+            __M_writer(escape(_('There are no changes yet')))
+            __M_writer(u'\n')
+        __M_writer(u'    </div>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        ungettext = context.get('ungettext', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        size = c.size if c.size <= c.total_cs else c.total_cs 
+        
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Changelog')))
+        __M_writer(u'\n')
+        if c.changelog_for_path:
+            __M_writer(u'     - /')
+            __M_writer(escape(c.changelog_for_path))
+            __M_writer(u'\n')
+        if c.revision:
+            __M_writer(u'    @ ')
+            __M_writer(escape(h.short_id(c.first_revision.raw_id)))
+            __M_writer(u'\n')
+        __M_writer(u'    - ')
+        __M_writer(escape(ungettext('showing %d out of %d revision', 'showing %d out of %d revisions', size) % (size, c.total_cs)))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s Changelog') % c.repo_name))
+        __M_writer(u'\n')
+        if c.changelog_for_path:
+            __M_writer(u'      /')
+            __M_writer(escape(c.changelog_for_path))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "39": 2, "40": 3, "45": 10, "46": 22, "51": 26, "52": 294, "58": 24, "65": 24, "66": 25, "67": 25, "73": 28, "84": 28, "85": 29, "86": 29, "87": 33, "88": 33, "89": 36, "90": 37, "91": 38, "92": 38, "93": 41, "94": 41, "95": 42, "96": 42, "97": 43, "98": 43, "99": 44, "100": 44, "101": 45, "102": 46, "103": 46, "104": 46, "105": 48, "106": 48, "107": 48, "108": 52, "109": 52, "110": 53, "111": 54, "112": 54, "113": 54, "114": 55, "115": 55, "116": 58, "117": 59, "118": 60, "119": 60, "120": 61, "121": 61, "122": 62, "123": 62, "124": 65, "125": 66, "126": 66, "127": 66, "128": 66, "129": 76, "130": 76, "131": 80, "132": 81, "133": 81, "134": 81, "135": 81, "136": 81, "137": 83, "138": 84, "139": 84, "140": 84, "141": 85, "142": 86, "143": 86, "144": 86, "145": 88, "146": 89, "147": 90, "148": 91, "149": 92, "150": 92, "151": 92, "152": 92, "153": 92, "154": 93, "155": 93, "156": 95, "157": 96, "158": 96, "159": 96, "160": 96, "161": 96, "162": 97, "163": 97, "164": 100, "165": 102, "166": 104, "167": 104, "168": 105, "169": 105, "170": 105, "171": 105, "172": 107, "173": 107, "174": 108, "175": 108, "176": 109, "177": 109, "178": 113, "179": 113, "180": 115, "181": 115, "182": 115, "183": 115, "184": 120, "185": 120, "186": 120, "187": 120, "188": 122, "189": 123, "190": 124, "191": 124, "192": 125, "193": 125, "194": 126, "195": 126, "196": 132, "197": 133, "198": 134, "199": 134, "200": 134, "201": 135, "202": 135, "203": 139, "204": 140, "205": 140, "206": 140, "207": 141, "208": 141, "209": 144, "210": 145, "211": 145, "212": 145, "213": 146, "214": 146, "215": 149, "216": 154, "217": 160, "218": 160, "219": 165, "220": 165, "221": 171, "222": 171, "223": 196, "224": 196, "225": 211, "226": 211, "227": 219, "228": 220, "229": 221, "230": 221, "231": 222, "232": 222, "233": 223, "234": 224, "235": 225, "236": 225, "237": 226, "238": 226, "239": 228, "240": 275, "241": 275, "242": 278, "243": 278, "244": 283, "245": 283, "246": 289, "247": 290, "248": 290, "249": 290, "250": 292, "256": 12, "264": 12, "265": 13, "267": 13, "268": 14, "269": 14, "270": 15, "271": 16, "272": 16, "273": 16, "274": 18, "275": 19, "276": 19, "277": 19, "278": 21, "279": 21, "280": 21, "286": 5, "294": 5, "295": 6, "296": 6, "297": 7, "298": 8, "299": 8, "300": 8, "306": 300}, "uri": "changelog/changelog.html", "filename": "/root/package/kallithea/templates/changelog/changelog.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,149 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253614.879056
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/changelog/changelog_summary_data.html'
+_template_uri = u'summary/../changelog/changelog_summary_data.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        __M_writer = context.writer()
+        if c.repo_changesets:
+            __M_writer(u'<table>\n    <tr>\n        <th class="left"></th>\n        <th class="left"></th>\n        <th class="left">')
+            __M_writer(escape(_('Revision')))
+            __M_writer(u'</th>\n        <th class="left">')
+            __M_writer(escape(_('Commit Message')))
+            __M_writer(u'</th>\n        <th class="left">')
+            __M_writer(escape(_('Age')))
+            __M_writer(u'</th>\n        <th class="left">')
+            __M_writer(escape(_('Author')))
+            __M_writer(u'</th>\n        <th class="left">')
+            __M_writer(escape(_('Refs')))
+            __M_writer(u'</th>\n    </tr>\n')
+            for cnt,cs in enumerate(c.repo_changesets):
+                __M_writer(u'    <tr class="parity')
+                __M_writer(escape(cnt%2))
+                __M_writer(u'">\n        <td class="compact">\n            <div class="changeset-status-container">\n')
+                if c.statuses.get(cs.raw_id):
+                    __M_writer(u'                <div class="changeset-status-ico shortlog">\n')
+                    if c.statuses.get(cs.raw_id)[2]:
+                        __M_writer(u'                  <a class="tooltip" title="')
+                        __M_writer(escape(_('Changeset status: %s\nClick to open associated pull request #%s') % (c.statuses.get(cs.raw_id)[0], c.statuses.get(cs.raw_id)[2])))
+                        __M_writer(u'" href="')
+                        __M_writer(escape(h.url('pullrequest_show',repo_name=c.statuses.get(cs.raw_id)[3],pull_request_id=c.statuses.get(cs.raw_id)[2])))
+                        __M_writer(u'">\n                    <i class="icon-circle changeset-status-')
+                        __M_writer(escape(c.statuses.get(cs.raw_id)[0]))
+                        __M_writer(u'"></i>\n                  </a>\n')
+                    else:
+                        __M_writer(u'                  <i class="icon-circle changeset-status-')
+                        __M_writer(escape(c.statuses.get(cs.raw_id)[0]))
+                        __M_writer(u'"></i>\n')
+                    __M_writer(u'                </div>\n')
+                __M_writer(u'            </div>\n        </td>\n        <td class="compact">\n')
+                if c.comments.get(cs.raw_id,[]):
+                    __M_writer(u'               <div class="comments-container">\n                   <div title="')
+                    __M_writer(escape(('comments')))
+                    __M_writer(u'">\n                       <a href="')
+                    __M_writer(escape(h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id,anchor='comment-%s' % c.comments[cs.raw_id][0].comment_id)))
+                    __M_writer(u'">\n                          <i class="icon-comment"></i>')
+                    __M_writer(escape(len(c.comments[cs.raw_id])))
+                    __M_writer(u'\n                       </a>\n                   </div>\n               </div>\n')
+                __M_writer(u'        </td>\n        <td>\n            <a href="')
+                __M_writer(escape(h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id)))
+                __M_writer(u'" class="revision-link">')
+                __M_writer(escape(h.show_id(cs)))
+                __M_writer(u'</a>\n        </td>\n        <td>\n            ')
+                __M_writer(escape(h.urlify_commit(h.chop_at(cs.message,'\n'),c.repo_name, h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id))))
+                __M_writer(u'\n        </td>\n        <td><span class="tooltip" title="')
+                __M_writer(escape(h.tooltip(h.fmt_date(cs.date))))
+                __M_writer(u'">\n                      ')
+                __M_writer(escape(h.age(cs.date)))
+                __M_writer(u'</span>\n        </td>\n        <td title="')
+                __M_writer(escape(cs.author))
+                __M_writer(u'">')
+                __M_writer(escape(h.person(cs.author)))
+                __M_writer(u'</td>\n        <td>\n')
+                if h.is_hg(c.db_repo_scm_instance):
+                    for book in cs.bookmarks:
+                        __M_writer(u'                    <div class="booktag" title="')
+                        __M_writer(escape(_('Bookmark %s') % book))
+                        __M_writer(u'">\n                        ')
+                        __M_writer(escape(h.link_to(book,h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id))))
+                        __M_writer(u'\n                    </div>\n')
+                for tag in cs.tags:
+                    __M_writer(u'             <div class="tagtag" title="')
+                    __M_writer(escape(_('Tag %s') % tag))
+                    __M_writer(u'">\n                 ')
+                    __M_writer(escape(h.link_to(tag,h.url('changeset_home',repo_name=c.repo_name,revision=cs.raw_id))))
+                    __M_writer(u'\n             </div>\n')
+                if cs.branch:
+                    __M_writer(u'             <div class="branchtag" title="')
+                    __M_writer(escape(_('Branch %s' % cs.branch)))
+                    __M_writer(u'">\n                 ')
+                    __M_writer(escape(h.link_to(cs.branch,h.url('changelog_home',repo_name=c.repo_name,branch=cs.branch))))
+                    __M_writer(u'\n             </div>\n')
+                __M_writer(u'        </td>\n    </tr>\n')
+            __M_writer(u'\n</table>\n\n<script type="text/javascript">\n  $(document).ready(function(){\n    var $shortlog_data = $(\'#shortlog_data\');\n    $shortlog_data.on(\'click\',\'.pager_link\',function(e){\n      asynchtml(e.target.href, $shortlog_data, function(){tooltip_activate();});\n      e.preventDefault();\n    });\n  });\n</script>\n\n<div class="pagination-wh pagination-left">\n')
+            __M_writer(escape(c.repo_changesets.pager('$link_previous ~2~ $link_next')))
+            __M_writer(u'\n</div>\n')
+        else:
+            __M_writer(u'\n')
+            if h.HasRepoPermissionAny('repository.write','repository.admin')(c.repo_name):
+                __M_writer(u'<h4>')
+                __M_writer(escape(_('Add or upload files directly via Kallithea')))
+                __M_writer(u'</h4>\n<div style="margin: 20px 30px;">\n  <div id="add_node_id" class="add_node">\n      <a class="btn btn-mini" href="')
+                __M_writer(escape(h.url('files_add_home',repo_name=c.repo_name,revision=0,f_path='', anchor='edit')))
+                __M_writer(u'">')
+                __M_writer(escape(_('Add New File')))
+                __M_writer(u'</a>\n  </div>\n</div>\n')
+            __M_writer(u'\n\n<h4>')
+            __M_writer(escape(_('Push new repo')))
+            __M_writer(u'</h4>\n<pre>\n    ')
+            __M_writer(escape(c.db_repo_scm_instance.alias))
+            __M_writer(u' clone ')
+            __M_writer(escape(c.clone_repo_url))
+            __M_writer(u'\n    ')
+            __M_writer(escape(c.db_repo_scm_instance.alias))
+            __M_writer(u' add README # add first file\n    ')
+            __M_writer(escape(c.db_repo_scm_instance.alias))
+            __M_writer(u' commit -m "Initial" # commit with message\n    ')
+            __M_writer(escape(c.db_repo_scm_instance.alias))
+            __M_writer(u' push ')
+            __M_writer(escape('origin master' if h.is_git(c.db_repo_scm_instance) else ''))
+            __M_writer(u' # push changes back\n</pre>\n\n<h4>')
+            __M_writer(escape(_('Existing repository?')))
+            __M_writer(u'</h4>\n<pre>\n')
+            if h.is_git(c.db_repo_scm_instance):
+                __M_writer(u'    git remote add origin ')
+                __M_writer(escape(c.clone_repo_url))
+                __M_writer(u'\n    git push -u origin master\n')
+            else:
+                __M_writer(u'    hg push ')
+                __M_writer(escape(c.clone_repo_url))
+                __M_writer(u'\n')
+            __M_writer(u'</pre>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "26": 2, "27": 3, "28": 7, "29": 7, "30": 8, "31": 8, "32": 9, "33": 9, "34": 10, "35": 10, "36": 11, "37": 11, "38": 13, "39": 14, "40": 14, "41": 14, "42": 17, "43": 18, "44": 19, "45": 20, "46": 20, "47": 20, "48": 20, "49": 20, "50": 21, "51": 21, "52": 23, "53": 24, "54": 24, "55": 24, "56": 26, "57": 28, "58": 31, "59": 32, "60": 33, "61": 33, "62": 34, "63": 34, "64": 35, "65": 35, "66": 40, "67": 42, "68": 42, "69": 42, "70": 42, "71": 45, "72": 45, "73": 47, "74": 47, "75": 48, "76": 48, "77": 50, "78": 50, "79": 50, "80": 50, "81": 52, "82": 53, "83": 54, "84": 54, "85": 54, "86": 55, "87": 55, "88": 59, "89": 60, "90": 60, "91": 60, "92": 61, "93": 61, "94": 64, "95": 65, "96": 65, "97": 65, "98": 66, "99": 66, "100": 69, "101": 72, "102": 86, "103": 86, "104": 88, "105": 89, "106": 90, "107": 91, "108": 91, "109": 91, "110": 94, "111": 94, "112": 94, "113": 94, "114": 98, "115": 100, "116": 100, "117": 102, "118": 102, "119": 102, "120": 102, "121": 103, "122": 103, "123": 104, "124": 104, "125": 105, "126": 105, "127": 105, "128": 105, "129": 108, "130": 108, "131": 110, "132": 111, "133": 111, "134": 111, "135": 113, "136": 114, "137": 114, "138": 114, "139": 116, "145": 139}, "uri": "summary/../changelog/changelog_summary_data.html", "filename": "/root/package/kallithea/templates/changelog/changelog_summary_data.html"}
+__M_END_METADATA
+"""
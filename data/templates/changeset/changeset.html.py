@@ -0,0 +1,343 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253644.660491
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/changeset/changeset.html'
+_template_uri = 'changeset/changeset.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'comment', context._clean_inheritance_tokens(), templateuri=u'/changeset/changeset_file_comment.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'comment')] = ns
+
+    ns = runtime.TemplateNamespace(u'diff_block', context._clean_inheritance_tokens(), templateuri=u'/changeset/diff_block.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'diff_block')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        comment = _mako_get_namespace(context, 'comment')
+        c = context.get('c', UNDEFINED)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        diff_block = _mako_get_namespace(context, 'diff_block')
+        ungettext = context.get('ungettext', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('changelog', c.changeset.raw_id)))
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <script>\n    var _USERS_AC_DATA = ')
+        __M_writer(c.users_array)
+        __M_writer(u';\n    var _GROUPS_AC_DATA = ')
+        __M_writer(c.user_groups_array)
+        __M_writer(u';\n    AJAX_COMMENT_URL = "')
+        __M_writer(escape(url('changeset_comment',repo_name=c.repo_name,revision=c.changeset.raw_id)))
+        __M_writer(u'";\n    AJAX_COMMENT_DELETE_URL = "')
+        __M_writer(escape(url('changeset_comment_delete',repo_name=c.repo_name,comment_id='__COMMENT_ID__')))
+        __M_writer(u'";\n    </script>\n    <div class="table">\n        <div class="diffblock">\n            <div class="parents">\n                <div id="parent_link" class="changeset_hash">\n                    <i style="color:#036185" class="icon-left-open"></i> <a href="#">')
+        __M_writer(escape(_('parent rev.')))
+        __M_writer(u'</a>\n                </div>\n            </div>\n\n            <div class="children">\n                <div id="child_link" class="changeset_hash">\n                    <a href="#">')
+        __M_writer(escape(_('child rev.')))
+        __M_writer(u'</a> <i style="color:#036185" class="icon-right-open"></i>\n                </div>\n            </div>\n\n            <div class="code-header banner">\n                <div class="changeset-status-container">\n')
+        if c.statuses:
+            __M_writer(u'                        <div class="changeset-status-ico"><i class="icon-circle changeset-status-')
+            __M_writer(escape(c.statuses[0]))
+            __M_writer(u'"></i></div>\n                        <div title="')
+            __M_writer(escape(_('Changeset status')))
+            __M_writer(u'" class="changeset-status-lbl">[')
+            __M_writer(escape(h.changeset_status_lbl(c.statuses[0])))
+            __M_writer(u']</div>\n')
+        __M_writer(u'                </div>\n                <div class="diff-actions">\n                  <a href="')
+        __M_writer(escape(h.url('changeset_raw_home',repo_name=c.repo_name,revision=c.changeset.raw_id)))
+        __M_writer(u'"  class="tooltip" title="')
+        __M_writer(escape(h.tooltip(_('Raw diff'))))
+        __M_writer(u'">\n                      <i class="icon-diff"></i>\n                  </a>\n                  <a href="')
+        __M_writer(escape(h.url('changeset_patch_home',repo_name=c.repo_name,revision=c.changeset.raw_id)))
+        __M_writer(u'"  class="tooltip" title="')
+        __M_writer(escape(h.tooltip(_('Patch diff'))))
+        __M_writer(u'">\n                      <i class="icon-file-powerpoint"></i>\n                  </a>\n                  <a href="')
+        __M_writer(escape(h.url('changeset_download_home',repo_name=c.repo_name,revision=c.changeset.raw_id,diff='download')))
+        __M_writer(u'" class="tooltip" title="')
+        __M_writer(escape(h.tooltip(_('Download diff'))))
+        __M_writer(u'">\n                      <i class="icon-floppy"></i>\n                  </a>\n                  ')
+        __M_writer(escape(c.ignorews_url(request.GET)))
+        __M_writer(u'\n                  ')
+        __M_writer(escape(c.context_url(request.GET)))
+        __M_writer(u'\n                </div>\n                <div class="comments-number" style="float:right;padding-right:5px">\n                    ')
+        __M_writer(escape(comment.comment_count(c.inline_cnt, len(c.comments))))
+        __M_writer(u'\n                </div>\n            </div>\n        </div>\n        <div id="changeset_content">\n            <div class="container">\n\n                <div class="right">\n                    <div class="changes">\n')
+        if (len(c.changeset.affected_files) <= c.affected_files_cut_off) or c.fulldiff:
+            __M_writer(u'                         <span class="removed" title="')
+            __M_writer(escape(_('Removed')))
+            __M_writer(u'">')
+            __M_writer(escape(len(c.changeset.removed)))
+            __M_writer(u'</span>\n                         <span class="changed" title="')
+            __M_writer(escape(_('Changed')))
+            __M_writer(u'">')
+            __M_writer(escape(len(c.changeset.changed)))
+            __M_writer(u'</span>\n                         <span class="added" title="')
+            __M_writer(escape(_('Added')))
+            __M_writer(u'">')
+            __M_writer(escape(len(c.changeset.added)))
+            __M_writer(u'</span>\n')
+        else:
+            __M_writer(u'                         <span class="removed" title="')
+            __M_writer(escape(_('Affected %s files') % len(c.changeset.affected_files)))
+            __M_writer(u'">!</span>\n                         <span class="changed" title="')
+            __M_writer(escape(_('Affected %s files') % len(c.changeset.affected_files)))
+            __M_writer(u'">!</span>\n                         <span class="added"   title="')
+            __M_writer(escape(_('Affected %s files') % len(c.changeset.affected_files)))
+            __M_writer(u'">!</span>\n')
+        __M_writer(u'                    </div>\n\n                    <span class="logtags">\n')
+        if len(c.changeset.parents)>1:
+            __M_writer(u'                        <span class="merge">')
+            __M_writer(escape(_('merge')))
+            __M_writer(u'</span>\n')
+        __M_writer(u'\n')
+        if h.is_hg(c.db_repo_scm_instance):
+            for book in c.changeset.bookmarks:
+                __M_writer(u'                          <span class="booktag" title="')
+                __M_writer(escape(_('Bookmark %s') % book))
+                __M_writer(u'">\n                             ')
+                __M_writer(escape(h.link_to(book,h.url('changeset_home',repo_name=c.repo_name,revision=c.changeset.raw_id))))
+                __M_writer(u'\n                          </span>\n')
+        __M_writer(u'\n')
+        for tag in c.changeset.tags:
+            __M_writer(u'                         <span class="tagtag"  title="')
+            __M_writer(escape(_('Tag %s') % tag))
+            __M_writer(u'">\n                         ')
+            __M_writer(escape(h.link_to(tag,h.url('changeset_home',repo_name=c.repo_name,revision=c.changeset.raw_id))))
+            __M_writer(u'</span>\n')
+        __M_writer(u'\n')
+        if c.changeset.branch:
+            __M_writer(u'                         <span class="branchtag" title="')
+            __M_writer(escape(_('Branch %s') % c.changeset.branch))
+            __M_writer(u'">\n                         ')
+            __M_writer(escape(h.link_to(c.changeset.branch,h.url('changelog_home',repo_name=c.repo_name,branch=c.changeset.branch))))
+            __M_writer(u'\n                         </span>\n')
+        __M_writer(u'                    </span>\n                </div>\n                <div class="left">\n                     <div class="author">\n                         <div class="gravatar">\n                           ')
+        __M_writer(escape(h.gravatar(h.email_or_none(c.changeset.author), size=20)))
+        __M_writer(u'\n                         </div>\n                         <span><b>')
+        __M_writer(escape(h.person(c.changeset.author,'username_and_name')))
+        __M_writer(u'</b> - ')
+        __M_writer(escape(h.age(c.changeset.date,True)))
+        __M_writer(u' ')
+        __M_writer(escape(h.fmt_date(c.changeset.date)))
+        __M_writer(u'</span><br/>\n                         <span>')
+        __M_writer(escape(h.email_or_none(c.changeset.author)))
+        __M_writer(u'</span><br/>\n                     </div>\n                     ')
+        rev = c.changeset.extra.get('source') 
+        
+        __M_writer(u'\n')
+        if rev:
+            __M_writer(u'                     <div>\n                       ')
+            __M_writer(escape(_('Grafted from:')))
+            __M_writer(u' ')
+            __M_writer(escape(h.link_to(h.short_id(rev),h.url('changeset_home',repo_name=c.repo_name,revision=rev))))
+            __M_writer(u'\n                     </div>\n')
+        __M_writer(u'                     ')
+        rev = c.changeset.extra.get('transplant_source', '').encode('hex') 
+        
+        __M_writer(u'\n')
+        if rev:
+            __M_writer(u'                     <div>\n                       ')
+            __M_writer(escape(_('Transplanted from:')))
+            __M_writer(u' ')
+            __M_writer(escape(h.link_to(h.short_id(rev),h.url('changeset_home',repo_name=c.repo_name,revision=rev))))
+            __M_writer(u'\n                     </div>\n')
+        __M_writer(u'                     <div class="message">')
+        __M_writer(escape(h.urlify_commit(c.changeset.message, c.repo_name)))
+        __M_writer(u'</div>\n                </div>\n            </div>\n            <div class="changes_txt">\n')
+        if c.limited_diff:
+            __M_writer(u'            ')
+            __M_writer(escape(ungettext('%s file changed','%s files changed',len(c.changeset.affected_files)) % (len(c.changeset.affected_files))))
+            __M_writer(u':\n')
+        else:
+            __M_writer(u'            ')
+            __M_writer(escape(ungettext('%s file changed with %s insertions and %s deletions','%s files changed with %s insertions and %s deletions', len(c.changeset.affected_files)) % (len(c.changeset.affected_files),c.lines_added,c.lines_deleted)))
+            __M_writer(u':\n')
+        __M_writer(u'            </div>\n            <div class="cs_files">\n')
+        for FID, (cs1, cs2, change, path, diff, stats) in c.changes[c.changeset.raw_id].iteritems():
+            __M_writer(u'                  <div class="cs_')
+            __M_writer(escape(change))
+            __M_writer(u'">\n                        <div class="node">\n                            <i class="icon-diff-')
+            __M_writer(escape(change))
+            __M_writer(u'"></i>\n                            <a href="#')
+            __M_writer(escape(FID))
+            __M_writer(u'">')
+            __M_writer(escape(h.safe_unicode(path)))
+            __M_writer(u'</a>\n                        </div>\n                    <div class="changes">')
+            __M_writer(escape(h.fancy_file_stats(stats)))
+            __M_writer(u'</div>\n                  </div>\n')
+        if c.limited_diff:
+            __M_writer(u'                <h5>')
+            __M_writer(escape(_('Changeset was too big and was cut off...')))
+            __M_writer(u' <a href="')
+            __M_writer(escape(h.url.current(fulldiff=1, **request.GET.mixed())))
+            __M_writer(u'">')
+            __M_writer(escape(_('Show full diff anyway')))
+            __M_writer(u'</a></h5>\n')
+        __M_writer(u'            </div>\n        </div>\n\n    </div>\n\n')
+        __M_writer(u'    ')
+        __M_writer(u'\n    ')
+        __M_writer(escape(diff_block.diff_block_js()))
+        __M_writer(u'\n    ')
+        __M_writer(escape(diff_block.diff_block(c.changes[c.changeset.raw_id])))
+        __M_writer(u'\n\n')
+        if c.limited_diff:
+            __M_writer(u'      <h4>')
+            __M_writer(escape(_('Changeset was too big and was cut off...')))
+            __M_writer(u' <a href="')
+            __M_writer(escape(h.url.current(fulldiff=1, **request.GET.mixed())))
+            __M_writer(u'">')
+            __M_writer(escape(_('Show full diff anyway')))
+            __M_writer(u'</a></h4>\n')
+        __M_writer(u'\n')
+        __M_writer(u'    ')
+        __M_writer(escape(comment.comment_inline_form()))
+        __M_writer(u'\n\n')
+        __M_writer(u'    ')
+        __M_writer(escape(comment.generate_comments()))
+        __M_writer(u'\n\n')
+        __M_writer(u'    ')
+        __M_writer(escape(comment.comments(h.url('changeset_comment', repo_name=c.repo_name, revision=c.changeset.raw_id),
+                       h.changeset_status(c.db_repo, c.changeset.raw_id))))
+        __M_writer(u'\n\n')
+        __M_writer(u'    <script type="text/javascript">\n      $(document).ready(function(){\n          $(\'.show-inline-comments\').change(function(e){\n              var target = e.currentTarget;\n              if(target == null){\n                  target = this;\n              }\n              var boxid = $(target).attr(\'id_for\');\n              if(target.checked){\n                  $(\'#{0} .inline-comments\'.format(boxid)).show();\n                  $(\'#{0} .inline-comments-button\'.format(boxid)).show();\n              }else{\n                  $(\'#{0} .inline-comments\'.format(boxid)).hide();\n                  $(\'#{0} .inline-comments-button\'.format(boxid)).hide();\n              }\n          });\n          $(\'.add-bubble\').click(function(e){\n              var tr = e.currentTarget;\n              if(tr == null){\n                  tr = this;\n              }\n              injectInlineForm(tr.parentNode.parentNode);\n          });\n\n          // inject comments into they proper positions\n          var file_comments = $(\'.inline-comment-placeholder\').toArray();\n          renderInlineComments(file_comments);\n\n          linkInlineComments(document.getElementsByClassName(\'firstlink\'), document.getElementsByClassName("comment"));\n\n          pyroutes.register(\'changeset_home\',\n                            "')
+        __M_writer(escape(h.url('changeset_home', repo_name='%(repo_name)s', revision='%(revision)s')))
+        __M_writer(u'",\n                            [\'repo_name\', \'revision\']);\n\n          //next links\n          $(\'#child_link\').on(\'click\', function(e){\n              //fetch via ajax what is going to be the next link, if we have\n              //>1 links show them to user to choose\n              if(!$(\'#child_link\').hasClass(\'disabled\')){\n                  $.ajax({\n                    url: \'')
+        __M_writer(escape(h.url('changeset_children',repo_name=c.repo_name, revision=c.changeset.raw_id)))
+        __M_writer(u"',\n                    success: function(data) {\n                      if(data.results.length === 0){\n                          $('#child_link').addClass('disabled');\n                          $('#child_link').html('")
+        __M_writer(escape(_('no revisions')))
+        __M_writer(u"');\n                      }\n                      if(data.results.length === 1){\n                          var commit = data.results[0];\n                          window.location = pyroutes.url('changeset_home', {'repo_name': '")
+        __M_writer(escape(c.repo_name))
+        __M_writer(u'\',\'revision\': commit.raw_id});\n                      }\n                      else if(data.results.length === 2){\n                          $(\'#child_link\').addClass(\'disabled\');\n                          $(\'#child_link\').addClass(\'double\');\n                          var _html = \'\';\n                          _html +=\'<a title="__title__" href="__url__">__rev__</a> <i style="color:#036185" class="icon-right-open"></i>\'\n                                  .replace(\'__rev__\',\'r{0}:{1}\'.format(data.results[0].revision, data.results[0].raw_id.substr(0,6)))\n                                  .replace(\'__title__\', data.results[0].message)\n                                  .replace(\'__url__\', pyroutes.url(\'changeset_home\', {\'repo_name\': \'')
+        __M_writer(escape(c.repo_name))
+        __M_writer(u'\',\'revision\': data.results[0].raw_id}));\n                          _html +=\'<br/>\'\n                          _html +=\'<a title="__title__" href="__url__">__rev__</a> <i style="color:#036185" class="icon-right-open"></i>\'\n                                  .replace(\'__rev__\',\'r{0}:{1}\'.format(data.results[1].revision, data.results[1].raw_id.substr(0,6)))\n                                  .replace(\'__title__\', data.results[1].message)\n                                  .replace(\'__url__\', pyroutes.url(\'changeset_home\', {\'repo_name\': \'')
+        __M_writer(escape(c.repo_name))
+        __M_writer(u"','revision': data.results[1].raw_id}));\n                          $('#child_link').html(_html);\n                      }\n                    }\n                  });\n              e.preventDefault();\n              }\n          })\n\n          //prev links\n          $('#parent_link').on('click', function(e){\n              //fetch via ajax what is going to be the next link, if we have\n              //>1 links show them to user to choose\n              if(!$('#parent_link').hasClass('disabled')){\n                  $.ajax({\n                    url: '")
+        __M_writer(escape(h.url('changeset_parents',repo_name=c.repo_name, revision=c.changeset.raw_id)))
+        __M_writer(u"',\n                    success: function(data) {\n                      if(data.results.length === 0){\n                          $('#parent_link').addClass('disabled');\n                          $('#parent_link').html('")
+        __M_writer(escape(_('no revisions')))
+        __M_writer(u"');\n                      }\n                      if(data.results.length === 1){\n                          var commit = data.results[0];\n                          window.location = pyroutes.url('changeset_home', {'repo_name': '")
+        __M_writer(escape(c.repo_name))
+        __M_writer(u'\',\'revision\': commit.raw_id});\n                      }\n                      else if(data.results.length === 2){\n                          $(\'#parent_link\').addClass(\'disabled\');\n                          $(\'#parent_link\').addClass(\'double\');\n                          var _html = \'\';\n                          _html +=\'<i style="color:#036185" class="icon-left-open"></i> <a title="__title__" href="__url__">__rev__</a>\'\n                                  .replace(\'__rev__\',\'r{0}:{1}\'.format(data.results[0].revision, data.results[0].raw_id.substr(0,6)))\n                                  .replace(\'__title__\', data.results[0].message)\n                                  .replace(\'__url__\', pyroutes.url(\'changeset_home\', {\'repo_name\': \'')
+        __M_writer(escape(c.repo_name))
+        __M_writer(u'\',\'revision\': data.results[0].raw_id}));\n                          _html +=\'<br/>\'\n                          _html +=\'<i style="color:#036185" class="icon-left-open"></i> <a title="__title__" href="__url__">__rev__</a>\'\n                                  .replace(\'__rev__\',\'r{0}:{1}\'.format(data.results[1].revision, data.results[1].raw_id.substr(0,6)))\n                                  .replace(\'__title__\', data.results[1].message)\n                                  .replace(\'__url__\', pyroutes.url(\'changeset_home\', {\'repo_name\': \'')
+        __M_writer(escape(c.repo_name))
+        __M_writer(u"','revision': data.results[1].raw_id}));\n                          $('#parent_link').html(_html);\n                      }\n                    }\n                  });\n              e.preventDefault();\n              }\n          })\n      })\n\n    </script>\n\n    </div>\n")
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Changeset')))
+        __M_writer(u" - <span class='hash'>")
+        __M_writer(escape(h.show_id(c.changeset)))
+        __M_writer(u'</span>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s Changeset') % c.repo_name))
+        __M_writer(u' - ')
+        __M_writer(escape(h.show_id(c.changeset)))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"23": 5, "26": 161, "32": 0, "45": 2, "46": 3, "47": 5, "52": 9, "53": 13, "58": 17, "59": 292, "65": 15, "72": 15, "73": 16, "74": 16, "80": 19, "94": 19, "95": 20, "96": 20, "97": 24, "98": 24, "99": 27, "100": 27, "101": 28, "102": 28, "103": 29, "104": 29, "105": 30, "106": 30, "107": 36, "108": 36, "109": 42, "110": 42, "111": 48, "112": 49, "113": 49, "114": 49, "115": 50, "116": 50, "117": 50, "118": 50, "119": 52, "120": 54, "121": 54, "122": 54, "123": 54, "124": 57, "125": 57, "126": 57, "127": 57, "128": 60, "129": 60, "130": 60, "131": 60, "132": 63, "133": 63, "134": 64, "135": 64, "136": 67, "137": 67, "138": 76, "139": 77, "140": 77, "141": 77, "142": 77, "143": 77, "144": 78, "145": 78, "146": 78, "147": 78, "148": 79, "149": 79, "150": 79, "151": 79, "152": 80, "153": 81, "154": 81, "155": 81, "156": 82, "157": 82, "158": 83, "159": 83, "160": 85, "161": 88, "162": 89, "163": 89, "164": 89, "165": 91, "166": 92, "167": 93, "168": 94, "169": 94, "170": 94, "171": 95, "172": 95, "173": 99, "174": 100, "175": 101, "176": 101, "177": 101, "178": 102, "179": 102, "180": 104, "181": 105, "182": 106, "183": 106, "184": 106, "185": 107, "186": 107, "187": 110, "188": 115, "189": 115, "190": 117, "191": 117, "192": 117, "193": 117, "194": 117, "195": 117, "196": 118, "197": 118, "198": 120, "200": 120, "201": 121, "202": 122, "203": 123, "204": 123, "205": 123, "206": 123, "207": 126, "208": 126, "210": 126, "211": 127, "212": 128, "213": 129, "214": 129, "215": 129, "216": 129, "217": 132, "218": 132, "219": 132, "220": 136, "221": 137, "222": 137, "223": 137, "224": 138, "225": 139, "226": 139, "227": 139, "228": 141, "229": 143, "230": 144, "231": 144, "232": 144, "233": 146, "234": 146, "235": 147, "236": 147, "237": 147, "238": 147, "239": 149, "240": 149, "241": 152, "242": 153, "243": 153, "244": 153, "245": 153, "246": 153, "247": 153, "248": 153, "249": 155, "250": 161, "251": 161, "252": 162, "253": 162, "254": 163, "255": 163, "256": 165, "257": 166, "258": 166, "259": 166, "260": 166, "261": 166, "262": 166, "263": 166, "264": 168, "265": 170, "266": 170, "267": 170, "268": 173, "269": 173, "270": 173, "271": 176, "272": 176, "274": 177, "275": 180, "276": 211, "277": 211, "278": 220, "279": 220, "280": 224, "281": 224, "282": 228, "283": 228, "284": 237, "285": 237, "286": 242, "287": 242, "288": 257, "289": 257, "290": 261, "291": 261, "292": 265, "293": 265, "294": 274, "295": 274, "296": 279, "297": 279, "303": 11, "310": 11, "311": 12, "312": 12, "313": 12, "314": 12, "320": 7, "329": 7, "330": 8, "331": 8, "332": 8, "333": 8, "339": 333}, "uri": "changeset/changeset.html", "filename": "/root/package/kallithea/templates/changeset/changeset.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,306 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253644.37932
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/changeset/changeset_file_comment.html'
+_template_uri = u'/changeset/changeset_file_comment.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = ['comment_block', 'inlines', 'comments', 'comment_count', 'generate_comments', 'comment_inline_form']
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n\n')
+        __M_writer(u'\n\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_comment_block(context,co):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <div class="comment" id="comment-')
+        __M_writer(escape(co.comment_id))
+        __M_writer(u'" line="')
+        __M_writer(escape(co.line_no))
+        __M_writer(u'">\n    <div class="comment-wrapp">\n      <div class="meta">\n          <div style="float:left">\n               ')
+        __M_writer(escape(h.gravatar(co.author.email, size=20)))
+        __M_writer(u'\n          </div>\n          <div class="user">\n              ')
+        __M_writer(escape(co.author.username_and_name))
+        __M_writer(u'\n          </div>\n          <div class="date">\n              ')
+        __M_writer(escape(h.age(co.modified_at)))
+        __M_writer(u'\n          </div>\n\n       <div style="float:left;padding:4px 0px 0px 5px">\n        <span class="">\n')
+        if co.pull_request:
+            if co.status_change:
+                __M_writer(u'              ')
+                __M_writer(escape(_('Status change from pull request')))
+                __M_writer(u'\n              <a href="')
+                __M_writer(escape(co.pull_request.url()))
+                __M_writer(u'">"')
+                __M_writer(escape(co.pull_request.title or _("No title")))
+                __M_writer(u'"</a>:\n')
+            else:
+                __M_writer(u'              ')
+                __M_writer(escape(_('Comment from pull request')))
+                __M_writer(u'\n              <a href="')
+                __M_writer(escape(co.pull_request.url()))
+                __M_writer(u'">"')
+                __M_writer(escape(co.pull_request.title or _("No title")))
+                __M_writer(u'"</a>\n')
+        else:
+            if co.status_change:
+                __M_writer(u'              ')
+                __M_writer(escape(_('Status change on changeset')))
+                __M_writer(u':\n')
+            else:
+                __M_writer(u'              ')
+                __M_writer(escape(_('Comment on changeset')))
+                __M_writer(u'\n')
+        __M_writer(u'        </span>\n       </div>\n\n')
+        if co.status_change:
+            __M_writer(u'           <div  style="float:left" class="changeset-status-container">\n             <div style="float:left;padding:10px 2px 0px 2px"></div>\n             <div title="')
+            __M_writer(escape(_('Changeset status')))
+            __M_writer(u'" class="changeset-status-lbl"> ')
+            __M_writer(escape(co.status_change[0].status_lbl))
+            __M_writer(u'</div>\n             <div class="changeset-status-ico"><i class="icon-circle changeset-status-')
+            __M_writer(escape(co.status_change[0].status))
+            __M_writer(u'"></i></div>\n           </div>\n')
+        __M_writer(u'\n      <a class="permalink" href="#comment-')
+        __M_writer(escape(co.comment_id))
+        __M_writer(u'">&para;</a>\n')
+        if h.HasPermissionAny('hg.admin')() or h.HasRepoPermissionAny('repository.admin')(c.repo_name) or co.author.user_id == c.authuser.user_id:
+            __M_writer(u'          <div onClick="confirm(\'')
+            __M_writer(escape(_("Delete comment?")))
+            __M_writer(u"') && deleteComment(")
+            __M_writer(escape(co.comment_id))
+            __M_writer(u')" class="buttons delete-comment btn btn-mini">')
+            __M_writer(escape(_('Delete')))
+            __M_writer(u'</div>\n')
+        __M_writer(u'      </div>\n      <div class="text">\n          ')
+        __M_writer(h.rst_w_mentions(co.text))
+        __M_writer(u'\n      </div>\n    </div>\n  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_inlines(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        def comment_count(inline_cnt,general_cnt):
+            return render_comment_count(context,inline_cnt,general_cnt)
+        def comment_block(co):
+            return render_comment_block(context,co)
+        c = context.get('c', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <div class="comments-number">\n        ')
+        __M_writer(escape(comment_count(c.inline_cnt, len(c.comments))))
+        __M_writer(u'\n    </div>\n')
+        for path, lines in c.inline_comments:
+            for line,comments in lines.iteritems():
+                __M_writer(u'            <div style="display:none" class="inline-comment-placeholder" path="')
+                __M_writer(escape(path))
+                __M_writer(u'" target_id="')
+                __M_writer(escape(h.safeid(h.safe_unicode(path))))
+                __M_writer(u'">\n')
+                for co in comments:
+                    __M_writer(u'                ')
+                    __M_writer(escape(comment_block(co)))
+                    __M_writer(u'\n')
+                __M_writer(u'            </div>\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_comments(context,post_url,cur_status,is_pr=False,change_status=True):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<div class="comments">\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'    <div class="comment-form ac">\n      ')
+            __M_writer(escape(h.form(post_url, id="main_form")))
+            __M_writer(u'\n        <div id="edit-container" class="clearfix">\n            <div class="comment-help">\n                ')
+            __M_writer((_('Comments parsed using %s syntax with %s support.') % (('<a href="%s">RST</a>' % h.url('rst_help')),
+                  '<span style="color:#577632" class="tooltip" title="%s">@mention</span>' %
+                  _('Use @username inside this text to notify another user.'))))
+            __M_writer(u'\n            </div>\n            <div class="mentions-container" id="mentions_container"></div>\n            ')
+            __M_writer(escape(h.textarea('text', class_="comment-block-ta")))
+            __M_writer(u'\n')
+            if change_status:
+                __M_writer(u'              <div id="status_block_container" class="status-block">\n')
+                if is_pr:
+                    __M_writer(u'                  ')
+                    __M_writer(escape(_('Vote for pull request status')))
+                    __M_writer(u':\n')
+                else:
+                    __M_writer(u'                  ')
+                    __M_writer(escape(_('Set changeset status')))
+                    __M_writer(u':\n')
+                __M_writer(u'                <input type="radio" class="status_change_radio" name="changeset_status" id="changeset_status_unchanged" value="" checked="checked" />\n                <label for="changeset_status_unchanged">\n                  ')
+                __M_writer(escape(_('No change')))
+                __M_writer(u'\n                </label>\n')
+                for status,lbl in c.changeset_statuses:
+                    __M_writer(u'                    <span style="margin-left: 15px;">\n                        <input type="radio" class="status_change_radio" name="changeset_status" id="')
+                    __M_writer(escape(status))
+                    __M_writer(u'" value="')
+                    __M_writer(escape(status))
+                    __M_writer(u'">\n                        <label for="')
+                    __M_writer(escape(status))
+                    __M_writer(u'"><i class="icon-circle changeset-status-')
+                    __M_writer(escape(status))
+                    __M_writer(u'" /></i>')
+                    __M_writer(escape(lbl))
+                    __M_writer(u'</label>\n                    </span>\n')
+                __M_writer(u'\n')
+                if is_pr and ( \
+                    h.HasPermissionAny('hg.admin')() or h.HasRepoPermissionAny('repository.admin')(c.repo_name) \
+                    or c.pull_request.author.user_id == c.authuser.user_id):
+                    __M_writer(u'                  <input id="save_close" type="checkbox" name="save_close">\n                  <label id="save_close_label" for="save_close">')
+                    __M_writer(escape(_("Close")))
+                    __M_writer(u'</label>\n')
+                __M_writer(u'              </div>\n')
+            __M_writer(u'        </div>\n\n        <div id="preview-container" class="clearfix" style="display:none">\n            <div class="comment-help">\n                ')
+            __M_writer(escape(_('Comment preview')))
+            __M_writer(u'\n            </div>\n            <div id="preview-box" class="preview-box"></div>\n        </div>\n\n        <div class="comment-button">\n            ')
+            __M_writer(escape(h.submit('save', _('Comment'), class_="btn")))
+            __M_writer(u'\n            <div id="preview-btn" class="preview-btn btn">')
+            __M_writer(escape(_('Preview')))
+            __M_writer(u'</div>\n            <div id="edit-btn" class="edit-btn btn" style="display:none">')
+            __M_writer(escape(_('Edit')))
+            __M_writer(u'</div>\n        </div>\n      ')
+            __M_writer(escape(h.end_form()))
+            __M_writer(u'\n    </div>\n')
+        __M_writer(u"</div>\n\n<script>\n\n$(document).ready(function () {\n   MentionsAutoComplete('text', 'mentions_container', _USERS_AC_DATA, _GROUPS_AC_DATA);\n\n   $(window).on('beforeunload', function(){\n      if($('.form-open').size() || $('textarea#text').val()){\n         // this message will not be displayed on all browsers\n         // (e.g. some versions of Firefox), but the user will still be warned\n         return 'There are uncommitted comments.';\n      }\n   });\n\n   $('form#main_form').submit(function(){\n      // if no open inline forms, disable the beforeunload check - it would\n      // fail in the check for the textarea we are about to submit\n      if(!$('.form-open').size()){\n          $(window).off('beforeunload');\n      }\n   });\n\n   $('#preview-btn').click(function(){\n       var _text = $('#text').val();\n       if(!_text){\n           return;\n       }\n       var post_data = {'text': _text};\n       $('#preview-box').addClass('unloaded');\n       $('#preivew-box').html(_TM['Loading ...']);\n       $('#edit-container').hide();\n       $('#edit-btn').show();\n       $('#preview-container').show();\n       $('#preview-btn').hide();\n\n       var url = pyroutes.url('changeset_comment_preview', {'repo_name': '")
+        __M_writer(escape(c.repo_name))
+        __M_writer(u"'});\n       ajaxPOST(url,post_data,function(html){\n           $('#preview-box').html(html);\n           $('#preview-box').removeClass('unloaded');\n       });\n   });\n   $('#edit-btn').click(function(){\n       $('#edit-container').show();\n       $('#edit-btn').hide();\n       $('#preview-container').hide();\n       $('#preview-btn').show();\n   });\n\n});\n</script>\n")
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_comment_count(context,inline_cnt,general_cnt):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        ungettext = context.get('ungettext', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape('%s (%s, %s)' % (
+        ungettext("%d comment", "%d comments", inline_cnt + general_cnt) % (inline_cnt + general_cnt),
+        ungettext("%d inline", "%d inline", inline_cnt) % inline_cnt,
+        ungettext("%d general", "%d general", general_cnt) % general_cnt
+    )))
+        __M_writer(u'\n    <span class="firstlink"></span>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_generate_comments(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def inlines():
+            return render_inlines(context)
+        c = context.get('c', UNDEFINED)
+        def comment_block(co):
+            return render_comment_block(context,co)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="comments">\n    <div id="inline-comments-container">\n')
+        __M_writer(u'     ')
+        __M_writer(escape(inlines()))
+        __M_writer(u'\n    </div>\n\n')
+        for co in c.comments:
+            __M_writer(u'        <div id="comment-tr-')
+            __M_writer(escape(co.comment_id))
+            __M_writer(u'">\n          ')
+            __M_writer(escape(comment_block(co)))
+            __M_writer(u'\n        </div>\n')
+        __M_writer(u'</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_comment_inline_form(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div id=\'comment-inline-form-template\' style="display:none">\n  <div class="comment-inline-form ac">\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'    ')
+            __M_writer(escape(h.form('#', class_='inline-form')))
+            __M_writer(u'\n      <div id="edit-container_{1}" class="clearfix">\n        <div class="comment-help">')
+            __M_writer(escape(_('Commenting on line {1}.')))
+            __M_writer(u'\n          ')
+            __M_writer((_('Comments parsed using %s syntax with %s support.') % (
+                 ('<a href="%s">RST</a>' % h.url('rst_help')),
+                   ('<span style="color:#577632" class="tooltip" title="%s">@mention</span>' % _('Use @username inside this text to notify another user'))
+               )
+            ))
+            __M_writer(u'\n        </div>\n        <div class="mentions-container" id="mentions_container_{1}"></div>\n        <textarea id="text_{1}" name="text" class="comment-block-ta yui-ac-input"></textarea>\n      </div>\n      <div id="preview-container_{1}" class="clearfix" style="display:none">\n        <div class="comment-help">\n            ')
+            __M_writer(escape(_('Comment preview')))
+            __M_writer(u'\n        </div>\n        <div id="preview-box_{1}" class="preview-box"></div>\n      </div>\n      <div class="comment-button">\n        <div class="submitting-overlay">')
+            __M_writer(escape(_('Submitting ...')))
+            __M_writer(u'</div>\n        <input type="hidden" name="f_path" value="{0}">\n        <input type="hidden" name="line" value="{1}">\n        ')
+            __M_writer(escape(h.submit('save', _('Comment'), class_='btn btn-small save-inline-form')))
+            __M_writer(u'\n        ')
+            __M_writer(escape(h.reset('hide-inline-form', _('Cancel'), class_='btn btn-small hide-inline-form')))
+            __M_writer(u'\n        <div id="preview-btn_{1}" class="preview-btn btn btn-small">')
+            __M_writer(escape(_('Preview')))
+            __M_writer(u'</div>\n        <div id="edit-btn_{1}" class="edit-btn btn btn-small" style="display:none">')
+            __M_writer(escape(_('Edit')))
+            __M_writer(u'</div>\n      </div>\n    ')
+            __M_writer(escape(h.end_form()))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'      ')
+            __M_writer(escape(h.form('')))
+            __M_writer(u'\n      <div class="clearfix">\n          <div class="comment-help">\n            ')
+            __M_writer(escape(_('You need to be logged in to comment.')))
+            __M_writer(u' <a href="')
+            __M_writer(escape(h.url('login_home',came_from=h.url.current())))
+            __M_writer(u'">')
+            __M_writer(escape(_('Login now')))
+            __M_writer(u'</a>\n          </div>\n      </div>\n      <div class="comment-button">\n      ')
+            __M_writer(escape(h.reset('hide-inline-form', _('Hide'), class_='btn btn-small hide-inline-form')))
+            __M_writer(u'\n      </div>\n      ')
+            __M_writer(escape(h.end_form()))
+            __M_writer(u'\n')
+        __M_writer(u'  </div>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "21": 58, "22": 108, "23": 119, "24": 136, "25": 152, "26": 263, "32": 6, "39": 6, "40": 7, "41": 7, "42": 7, "43": 7, "44": 11, "45": 11, "46": 14, "47": 14, "48": 17, "49": 17, "50": 22, "51": 23, "52": 24, "53": 24, "54": 24, "55": 25, "56": 25, "57": 25, "58": 25, "59": 26, "60": 27, "61": 27, "62": 27, "63": 28, "64": 28, "65": 28, "66": 28, "67": 30, "68": 31, "69": 32, "70": 32, "71": 32, "72": 33, "73": 34, "74": 34, "75": 34, "76": 37, "77": 40, "78": 41, "79": 43, "80": 43, "81": 43, "82": 43, "83": 44, "84": 44, "85": 47, "86": 48, "87": 48, "88": 49, "89": 50, "90": 50, "91": 50, "92": 50, "93": 50, "94": 50, "95": 50, "96": 52, "97": 54, "98": 54, "104": 122, "115": 122, "116": 124, "117": 124, "118": 126, "119": 127, "120": 128, "121": 128, "122": 128, "123": 128, "124": 128, "125": 129, "126": 130, "127": 130, "128": 130, "129": 132, "130": 135, "136": 155, "143": 155, "144": 158, "145": 159, "146": 160, "147": 160, "148": 163, "151": 165, "152": 168, "153": 168, "154": 169, "155": 170, "156": 171, "157": 172, "158": 172, "159": 172, "160": 173, "161": 174, "162": 174, "163": 174, "164": 176, "165": 178, "166": 178, "167": 180, "168": 181, "169": 182, "170": 182, "171": 182, "172": 182, "173": 183, "174": 183, "175": 183, "176": 183, "177": 183, "178": 183, "179": 186, "180": 187, "183": 190, "184": 191, "185": 191, "186": 193, "187": 195, "188": 199, "189": 199, "190": 205, "191": 205, "192": 206, "193": 206, "194": 207, "195": 207, "196": 209, "197": 209, "198": 212, "199": 248, "200": 248, "206": 112, "211": 112, "212": 113, "217": 117, "223": 139, "232": 139, "233": 143, "234": 143, "235": 143, "236": 146, "237": 147, "238": 147, "239": 147, "240": 148, "241": 148, "242": 151, "248": 61, "255": 61, "256": 64, "257": 65, "258": 65, "259": 65, "260": 67, "261": 67, "262": 68, "267": 73, "268": 80, "269": 80, "270": 85, "271": 85, "272": 88, "273": 88, "274": 89, "275": 89, "276": 90, "277": 90, "278": 91, "279": 91, "280": 93, "281": 93, "282": 94, "283": 95, "284": 95, "285": 95, "286": 98, "287": 98, "288": 98, "289": 98, "290": 98, "291": 98, "292": 102, "293": 102, "294": 104, "295": 104, "296": 106, "302": 296}, "uri": "/changeset/changeset_file_comment.html", "filename": "/root/package/kallithea/templates/changeset/changeset_file_comment.html"}
+__M_END_METADATA
+"""
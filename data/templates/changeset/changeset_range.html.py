@@ -0,0 +1,230 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253644.351353
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/changeset/changeset_range.html'
+_template_uri = 'changeset/changeset_range.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'comment', context._clean_inheritance_tokens(), templateuri=u'/changeset/changeset_file_comment.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'comment')] = ns
+
+    ns = runtime.TemplateNamespace(u'diff_block', context._clean_inheritance_tokens(), templateuri=u'/changeset/diff_block.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'diff_block')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        diff_block = _mako_get_namespace(context, 'diff_block')
+        len = context.get('len', UNDEFINED)
+        getattr = context.get('getattr', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('changelog')))
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <div class="table">\n        <div id="body" class="diffblock">\n            <div class="code-header">\n                <div>\n                    ')
+        __M_writer(escape(h.show_id(c.cs_ranges[0])))
+        __M_writer(u'\n                    <i class="icon-right"></i>\n                    ')
+        __M_writer(escape(h.show_id(c.cs_ranges[-1])))
+        __M_writer(u'\n                    <a style="font-weight: bold" href="')
+        __M_writer(escape(h.url('compare_url',repo_name=c.repo_name,org_ref_type='rev',org_ref_name=getattr(c.cs_ranges[0].parents[0] if c.cs_ranges[0].parents else h.EmptyChangeset(),'raw_id'),other_ref_type='rev',other_ref_name=c.cs_ranges[-1].raw_id)))
+        __M_writer(u'" class="btn btn-small"><i class="icon-git-compare"></i> Compare Revisions</a>\n                </div>\n            </div>\n        </div>\n        <div id="changeset_compare_view_content">\n            <div class="container">\n            <table class="compare_view_commits noborder">\n')
+        for cnt,cs in enumerate(c.cs_ranges):
+            __M_writer(u'                <tr>\n                <td><div class="gravatar">')
+            __M_writer(escape(h.gravatar(h.email_or_none(cs.author), size=14)))
+            __M_writer(u'</div></td>\n                <td>')
+            __M_writer(escape(h.link_to('r%s:%s' % (cs.revision,h.short_id(cs.raw_id)),h.url('changeset_home',repo_name=c.cs_repo.repo_name,revision=cs.raw_id))))
+            __M_writer(u'</td>\n                <td><div class="author">')
+            __M_writer(escape(h.person(cs.author)))
+            __M_writer(u'</div></td>\n                <td><span class="tooltip" title="')
+            __M_writer(escape(h.age(cs.date)))
+            __M_writer(u'">')
+            __M_writer(escape(cs.date))
+            __M_writer(u'</span></td>\n                <td>\n')
+            if c.statuses:
+                __M_writer(u'                    <div title="')
+                __M_writer(escape(h.tooltip(_('Changeset status'))))
+                __M_writer(u'" class="changeset-status-ico"><i class="icon-circle changeset-status-')
+                __M_writer(escape(c.statuses[cnt]))
+                __M_writer(u'"></i></div>\n')
+            __M_writer(u'                </td>\n                <td><div class="message">')
+            __M_writer(escape(h.urlify_commit(h.wrap_paragraphs(cs.message),c.repo_name)))
+            __M_writer(u'</div></td>\n                </tr>\n')
+        __M_writer(u'            </table>\n            </div>\n            <div style="font-size:1.1em;font-weight: bold;clear:both;padding-top:10px">')
+        __M_writer(escape(_('Files affected')))
+        __M_writer(u'</div>\n            <div class="cs_files">\n')
+        for cs in c.cs_ranges:
+            __M_writer(u'                    <div class="cur_cs">')
+            __M_writer(escape(h.link_to(h.show_id(cs),h.url('changeset_home',repo_name=c.cs_repo.repo_name,revision=cs.raw_id))))
+            __M_writer(u'</div>\n')
+            for FID, (cs1, cs2, change, path, diff, stats) in c.changes[cs.raw_id].iteritems():
+                __M_writer(u'                        <div class="cs_')
+                __M_writer(escape(change))
+                __M_writer(u'">\n                            <div class="node">\n                                <i class="icon-diff-')
+                __M_writer(escape(change))
+                __M_writer(u'"></i>\n                                ')
+                __M_writer(escape(h.link_to(h.safe_unicode(path),h.url.current(anchor=FID))))
+                __M_writer(u'\n                            </div>\n                            <div class="changes">')
+                __M_writer(escape(h.fancy_file_stats(stats)))
+                __M_writer(u'</div>\n                        </div>\n')
+        __M_writer(u'            </div>\n        </div>\n\n    </div>\n    ')
+        __M_writer(u'\n    ')
+        __M_writer(u'\n    ')
+        __M_writer(escape(diff_block.diff_block_js()))
+        __M_writer(u'\n')
+        for cs in c.cs_ranges:
+            __M_writer(u'          <div class="h3">\n          <a class="tooltip" title="')
+            __M_writer(escape(h.tooltip(cs.message)))
+            __M_writer(u'" href="')
+            __M_writer(escape(h.url('changeset_home',repo_name=c.cs_repo.repo_name,revision=cs.raw_id)))
+            __M_writer(u'">')
+            __M_writer(escape(h.show_id(cs)))
+            __M_writer(u'</a>\n             <div class="gravatar">\n               ')
+            __M_writer(escape(h.gravatar(h.email_or_none(cs.author), size=20)))
+            __M_writer(u'\n             </div>\n             <div class="right">\n              <span class="logtags">\n')
+            if len(cs.parents)>1:
+                __M_writer(u'                <span class="merge">')
+                __M_writer(escape(_('merge')))
+                __M_writer(u'</span>\n')
+            if h.is_hg(c.db_repo_scm_instance):
+                for book in cs.bookmarks:
+                    __M_writer(u'                  <span class="booktag" title="')
+                    __M_writer(escape(_('Bookmark %s') % book))
+                    __M_writer(u'">\n                     ')
+                    __M_writer(escape(h.link_to(book,h.url('changeset_home',repo_name=c.cs_repo.repo_name,revision=cs.raw_id))))
+                    __M_writer(u'\n                  </span>\n')
+            for tag in cs.tags:
+                __M_writer(u'                    <span class="tagtag" title="')
+                __M_writer(escape(_('Tag %s') % tag))
+                __M_writer(u'">\n                    ')
+                __M_writer(escape(h.link_to(tag,h.url('changeset_home',repo_name=c.cs_repo.repo_name,revision=cs.raw_id))))
+                __M_writer(u'</span>\n')
+            if cs.branch:
+                __M_writer(u'                <span class="branchtag" title="')
+                __M_writer(escape(_('Branch %s') % cs.branch))
+                __M_writer(u'">\n                   ')
+                __M_writer(escape(h.link_to(cs.branch,h.url('changeset_home',repo_name=c.cs_repo.repo_name,revision=cs.raw_id))))
+                __M_writer(u'\n                </span>\n')
+            __M_writer(u'              </span>\n            </div>\n           </div>\n          ')
+            __M_writer(escape(diff_block.diff_block(c.changes[cs.raw_id])))
+            __M_writer(u'\n\n')
+        __M_writer(u'</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Changesets')))
+        __M_writer(u' -\n    ')
+        __M_writer(escape(h.link_to(h.show_id(c.cs_ranges[0]),h.url('changeset_home',repo_name=c.repo_name,revision=c.cs_ranges[0]))))
+        __M_writer(u'</td>\n    <i class="icon-right"></i>\n    ')
+        __M_writer(escape(h.link_to(h.show_id(c.cs_ranges[-1]),h.url('changeset_home',repo_name=c.repo_name,revision=c.cs_ranges[-1]))))
+        __M_writer(u'</td>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s Changesets') % c.repo_name))
+        __M_writer(u' - ')
+        __M_writer(escape(h.show_id(c.cs_ranges[0])))
+        __M_writer(u' &gt; ')
+        __M_writer(escape(h.show_id(c.cs_ranges[-1])))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"23": 74, "26": 75, "32": 0, "45": 2, "50": 6, "51": 13, "56": 17, "57": 113, "63": 15, "70": 15, "71": 16, "72": 16, "78": 19, "90": 19, "91": 20, "92": 20, "93": 24, "94": 24, "95": 30, "96": 30, "97": 32, "98": 32, "99": 33, "100": 33, "101": 40, "102": 41, "103": 42, "104": 42, "105": 43, "106": 43, "107": 44, "108": 44, "109": 45, "110": 45, "111": 45, "112": 45, "113": 47, "114": 48, "115": 48, "116": 48, "117": 48, "118": 48, "119": 50, "120": 51, "121": 51, "122": 54, "123": 56, "124": 56, "125": 58, "126": 59, "127": 59, "128": 59, "129": 60, "130": 61, "131": 61, "132": 61, "133": 63, "134": 63, "135": 64, "136": 64, "137": 66, "138": 66, "139": 70, "140": 74, "141": 75, "142": 76, "143": 76, "144": 77, "145": 80, "146": 81, "147": 81, "148": 81, "149": 81, "150": 81, "151": 81, "152": 83, "153": 83, "154": 87, "155": 88, "156": 88, "157": 88, "158": 90, "159": 91, "160": 92, "161": 92, "162": 92, "163": 93, "164": 93, "165": 97, "166": 98, "167": 98, "168": 98, "169": 99, "170": 99, "171": 101, "172": 102, "173": 102, "174": 102, "175": 103, "176": 103, "177": 106, "178": 109, "179": 109, "180": 112, "186": 8, "193": 8, "194": 9, "195": 9, "196": 10, "197": 10, "198": 12, "199": 12, "205": 4, "214": 4, "215": 5, "216": 5, "217": 5, "218": 5, "219": 5, "220": 5, "226": 220}, "uri": "changeset/changeset_range.html", "filename": "/root/package/kallithea/templates/changeset/changeset_range.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,221 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253644.408998
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/changeset/diff_block.html'
+_template_uri = u'/changeset/diff_block.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = ['diff_block', 'diff_block_js', 'diff_block_simple']
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_diff_block(context,change):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        id = context.get('id', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n<div class="diff-collapse">\n    <span target="')
+        __M_writer(escape('diff-container-%s' % (id(change))))
+        __M_writer(u'" class="diff-collapse-button">&uarr; ')
+        __M_writer(escape(_('Collapse Diff')))
+        __M_writer(u' &uarr;</span>\n</div>\n<div class="diff-container" id="')
+        __M_writer(escape('diff-container-%s' % (id(change))))
+        __M_writer(u'">\n')
+        for FID,(cs1, cs2, change, path, diff, stats) in change.iteritems():
+            __M_writer(u'    <div id="')
+            __M_writer(escape(FID))
+            __M_writer(u'_target" style="clear:both;margin-top:25px"></div>\n    <div id="')
+            __M_writer(escape(FID))
+            __M_writer(u'" class="diffblock  margined comm">\n        <div class="code-header">\n            <div class="changeset_header">\n                <div class="changeset_file">\n                    ')
+            __M_writer(escape(h.link_to_if(change!='D',h.safe_unicode(path),h.url('files_home',repo_name=c.repo_name,
+                    revision=cs2,f_path=h.safe_unicode(path)))))
+            __M_writer(u'\n                </div>\n                <div class="diff-actions">\n                  <a href="')
+            __M_writer(escape(h.url('files_diff_home',repo_name=c.repo_name,f_path=h.safe_unicode(path),diff2=cs2,diff1=cs1,diff='diff',fulldiff=1)))
+            __M_writer(u'" class="tooltip" title="')
+            __M_writer(escape(h.tooltip(_('Show full diff for this file'))))
+            __M_writer(u'">\n                      <i class="icon-file-code"></i>\n                  </a>\n                  <a href="')
+            __M_writer(escape(h.url('files_diff_2way_home',repo_name=c.repo_name,f_path=h.safe_unicode(path),diff2=cs2,diff1=cs1,diff='diff',fulldiff=1)))
+            __M_writer(u'" class="tooltip" title="')
+            __M_writer(escape(h.tooltip(_('Show full side-by-side diff for this file'))))
+            __M_writer(u'">\n                      <i class="icon-docs"></i>\n                  </a>\n                  <a href="')
+            __M_writer(escape(h.url('files_diff_home',repo_name=c.repo_name,f_path=h.safe_unicode(path),diff2=cs2,diff1=cs1,diff='raw')))
+            __M_writer(u'" class="tooltip" title="')
+            __M_writer(escape(h.tooltip(_('Raw diff'))))
+            __M_writer(u'">\n                      <i class="icon-diff"></i>\n                  </a>\n                  <a href="')
+            __M_writer(escape(h.url('files_diff_home',repo_name=c.repo_name,f_path=h.safe_unicode(path),diff2=cs2,diff1=cs1,diff='download')))
+            __M_writer(u'" class="tooltip" title="')
+            __M_writer(escape(h.tooltip(_('Download diff'))))
+            __M_writer(u'">\n                      <i class="icon-floppy"></i>\n                  </a>\n                  ')
+            __M_writer(escape(c.ignorews_url(request.GET, h.FID(cs2,path))))
+            __M_writer(u'\n                  ')
+            __M_writer(escape(c.context_url(request.GET, h.FID(cs2,path))))
+            __M_writer(u'\n                </div>\n                <span style="float:right;margin-top:-3px">\n                  <label>\n                  ')
+            __M_writer(escape(_('Show inline comments')))
+            __M_writer(u'\n                  ')
+            __M_writer(escape(h.checkbox('',checked="checked",class_="show-inline-comments",id_for=h.FID(cs2,path))))
+            __M_writer(u'\n                  </label>\n                </span>\n            </div>\n        </div>\n        <div class="code-body">\n            <div class="full_f_path" path="')
+            __M_writer(escape(h.safe_unicode(path)))
+            __M_writer(u'"></div>\n            ')
+            __M_writer(diff)
+            __M_writer(u'\n')
+            if path.rsplit('.')[-1] in ['png', 'gif', 'jpg', 'bmp']:
+                __M_writer(u'              <div class="btn btn-image-diff-show">Show images</div>\n')
+                if change =='M':
+                    __M_writer(u'                <div id="')
+                    __M_writer(escape(FID))
+                    __M_writer(u'_image-diff" class="btn btn-image-diff-swap" style="display:none">Press to swap images</div>\n')
+                __M_writer(u'              <div style="font-size: 0">\n')
+                if change == 'M':
+                    __M_writer(u'                  <img id="')
+                    __M_writer(escape(FID))
+                    __M_writer(u'_image-diff-img-a" class="img-diff img-diff-swapable" style="display:none"\n                      realsrc="')
+                    __M_writer(escape(h.url('files_raw_home',repo_name=c.repo_name,revision=cs1,f_path=path)))
+                    __M_writer(u'" />\n')
+                if change in 'AM':
+                    __M_writer(u'                  <img id="')
+                    __M_writer(escape(FID))
+                    __M_writer(u'_image-diff-img-b" class="img-diff img-diff-swapable" style="display:none"\n                      realsrc="')
+                    __M_writer(escape(h.url('files_raw_home',repo_name=c.repo_name,revision=cs2,f_path=path)))
+                    __M_writer(u'" />\n')
+                __M_writer(u'              </div>\n')
+            __M_writer(u'        </div>\n    </div>\n')
+        __M_writer(u'</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_diff_block_js(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n<script type="text/javascript">\n$(document).ready(function(){\n    $(\'.btn-image-diff-show\').click(function(e){\n        $(\'.btn-image-diff-show\').hide();\n        $(\'.btn-image-diff-swap\').show();\n        $(\'.img-diff-swapable\')\n            .each(function(i,e){\n                    $(e).attr(\'src\', $(e).attr(\'realsrc\'));\n                })\n            .show();\n        });\n\n    $(\'.btn-image-diff-swap\').mousedown(function(e){\n        $(\'#\'+e.currentTarget.id+\'-img-a.img-diff-swapable\')\n          .before($(\'#\'+e.currentTarget.id+\'-img-b.img-diff-swapable\'));\n    });\n    var reset = function(e){\n        $(\'#\'+e.currentTarget.id+\'-img-a.img-diff-swapable\')\n          .after($(\'#\'+e.currentTarget.id+\'-img-b.img-diff-swapable\'));\n    };\n    $(\'.btn-image-diff-swap\').mouseup(reset);\n    $(\'.btn-image-diff-swap\').mouseleave(reset);\n});\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_diff_block_simple(context,change):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        for op,filenode_path,diff in change:
+            __M_writer(u'    <div id="')
+            __M_writer(escape(h.FID('',filenode_path)))
+            __M_writer(u'_target" style="clear:both;margin-top:25px"></div>\n    <div id="')
+            __M_writer(escape(h.FID('',filenode_path)))
+            __M_writer(u'" class="diffblock  margined comm">\n      <div class="code-header">\n          <div class="changeset_header">\n              <div class="changeset_file">\n                  ')
+            __M_writer(escape(h.safe_unicode(filenode_path)))
+            __M_writer(u' |\n')
+            if op == 'A':
+                __M_writer(u'                    ')
+                __M_writer(escape(_('Added')))
+                __M_writer(u'\n                    <a class="spantag" href="')
+                __M_writer(escape(h.url('files_home', repo_name=c.cs_repo.repo_name, f_path=filenode_path, revision=c.cs_rev)))
+                __M_writer(u'">')
+                __M_writer(escape(h.short_id(c.cs_ref_name) if c.cs_ref_type=='rev' else c.cs_ref_name))
+                __M_writer(u'</a>\n')
+            elif op == 'M':
+                __M_writer(u'                    <a class="spantag" href="')
+                __M_writer(escape(h.url('files_home', repo_name=c.a_repo.repo_name, f_path=filenode_path, revision=c.a_rev)))
+                __M_writer(u'">')
+                __M_writer(escape(h.short_id(c.a_ref_name) if c.a_ref_type=='rev' else c.a_ref_name))
+                __M_writer(u'</a>\n                    <i class="icon-right"></i>\n                    <a class="spantag" href="')
+                __M_writer(escape(h.url('files_home', repo_name=c.cs_repo.repo_name, f_path=filenode_path, revision=c.cs_rev)))
+                __M_writer(u'">')
+                __M_writer(escape(h.short_id(c.cs_ref_name) if c.cs_ref_type=='rev' else c.cs_ref_name))
+                __M_writer(u'</a>\n')
+            elif op == 'D':
+                __M_writer(u'                    ')
+                __M_writer(escape(_('Deleted')))
+                __M_writer(u'\n                    <a class="spantag" href="')
+                __M_writer(escape(h.url('files_home', repo_name=c.a_repo.repo_name, f_path=filenode_path, revision=c.a_rev)))
+                __M_writer(u'">')
+                __M_writer(escape(h.short_id(c.a_ref_name) if c.a_ref_type=='rev' else c.a_ref_name))
+                __M_writer(u'</a>\n')
+            elif op == 'R':
+                __M_writer(u'                    ')
+                __M_writer(escape(_('Renamed')))
+                __M_writer(u'\n                    <a class="spantag" href="')
+                __M_writer(escape(h.url('files_home', repo_name=c.a_repo.repo_name, f_path=filenode_path, revision=c.a_rev)))
+                __M_writer(u'">')
+                __M_writer(escape(h.short_id(c.a_ref_name) if c.a_ref_type=='rev' else c.a_ref_name))
+                __M_writer(u'</a>\n                    <i class="icon-right"></i>\n                    <a class="spantag" href="')
+                __M_writer(escape(h.url('files_home', repo_name=c.cs_repo.repo_name, f_path=filenode_path, revision=c.cs_rev)))
+                __M_writer(u'">')
+                __M_writer(escape(h.short_id(c.cs_ref_name) if c.cs_ref_type=='rev' else c.cs_ref_name))
+                __M_writer(u'</a>\n')
+            else:
+                __M_writer(u'                    ')
+                __M_writer(escape(op))
+                __M_writer(u'???\n')
+            __M_writer(u'              </div>\n              <div class="diff-actions">\n                <a href="')
+            __M_writer(escape(h.url('files_diff_2way_home',repo_name=c.cs_repo.repo_name,f_path=h.safe_unicode(filenode_path),diff1=c.a_rev,diff2=c.cs_rev,diff='diff',fulldiff=1)))
+            __M_writer(u'" class="tooltip" title="')
+            __M_writer(escape(h.tooltip(_('Show full side-by-side diff for this file'))))
+            __M_writer(u'">\n                  <i class="icon-docs"></i>\n                </a>\n                ')
+            __M_writer(escape(c.ignorews_url(request.GET)))
+            __M_writer(u'\n                ')
+            __M_writer(escape(c.context_url(request.GET)))
+            __M_writer(u'\n              </div>\n          </div>\n      </div>\n        <div class="code-body">\n            <div class="full_f_path" path="')
+            __M_writer(escape(h.safe_unicode(filenode_path)))
+            __M_writer(u'"></div>\n            ')
+            __M_writer(diff)
+            __M_writer(u'\n')
+            if filenode_path.rsplit('.')[-1] in ['png', 'gif', 'jpg', 'bmp']:
+                __M_writer(u'              <div class="btn btn-image-diff-show">Show images</div>\n')
+                if op == 'M':
+                    __M_writer(u'                <div id="')
+                    __M_writer(escape(h.FID('',filenode_path)))
+                    __M_writer(u'_image-diff" class="btn btn-image-diff-swap" style="display:none">Press to swap images</div>\n')
+                __M_writer(u'              <div style="font-size: 0">\n')
+                if op == 'M':
+                    __M_writer(u'                  <img id="')
+                    __M_writer(escape(h.FID('',filenode_path)))
+                    __M_writer(u'_image-diff-img-a" class="img-diff img-diff-swapable" style="display:none"\n                      realsrc="')
+                    __M_writer(escape(h.url('files_raw_home',repo_name=c.a_repo.repo_name,revision=c.a_rev,f_path=filenode_path) if op in 'DM' else ''))
+                    __M_writer(u'" />\n')
+                if op in 'AM':
+                    __M_writer(u'                  <img id="')
+                    __M_writer(escape(h.FID('',filenode_path)))
+                    __M_writer(u'_image-diff-img-b" class="img-diff img-diff-swapable" style="display:none"\n                      realsrc="')
+                    __M_writer(escape(h.url('files_raw_home',repo_name=c.cs_repo.repo_name,revision=c.cs_rev,f_path=filenode_path) if op in 'AM' else ''))
+                    __M_writer(u'" />\n')
+                __M_writer(u'              </div>\n')
+            __M_writer(u'        </div>\n    </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "21": 67, "22": 129, "23": 156, "29": 6, "38": 6, "39": 8, "40": 8, "41": 8, "42": 8, "43": 10, "44": 10, "45": 11, "46": 12, "47": 12, "48": 12, "49": 13, "50": 13, "51": 17, "53": 18, "54": 21, "55": 21, "56": 21, "57": 21, "58": 24, "59": 24, "60": 24, "61": 24, "62": 27, "63": 27, "64": 27, "65": 27, "66": 30, "67": 30, "68": 30, "69": 30, "70": 33, "71": 33, "72": 34, "73": 34, "74": 38, "75": 38, "76": 39, "77": 39, "78": 45, "79": 45, "80": 46, "81": 46, "82": 47, "83": 48, "84": 49, "85": 50, "86": 50, "87": 50, "88": 52, "89": 53, "90": 54, "91": 54, "92": 54, "93": 55, "94": 55, "95": 57, "96": 58, "97": 58, "98": 58, "99": 59, "100": 59, "101": 61, "102": 63, "103": 66, "109": 131, "113": 131, "119": 69, "127": 69, "128": 71, "129": 72, "130": 72, "131": 72, "132": 73, "133": 73, "134": 77, "135": 77, "136": 79, "137": 80, "138": 80, "139": 80, "140": 81, "141": 81, "142": 81, "143": 81, "144": 82, "145": 83, "146": 83, "147": 83, "148": 83, "149": 83, "150": 85, "151": 85, "152": 85, "153": 85, "154": 86, "155": 87, "156": 87, "157": 87, "158": 88, "159": 88, "160": 88, "161": 88, "162": 89, "163": 90, "164": 90, "165": 90, "166": 91, "167": 91, "168": 91, "169": 91, "170": 93, "171": 93, "172": 93, "173": 93, "174": 94, "175": 95, "176": 95, "177": 95, "178": 97, "179": 99, "180": 99, "181": 99, "182": 99, "183": 102, "184": 102, "185": 103, "186": 103, "187": 108, "188": 108, "189": 109, "190": 109, "191": 110, "192": 111, "193": 112, "194": 113, "195": 113, "196": 113, "197": 115, "198": 116, "199": 117, "200": 117, "201": 117, "202": 118, "203": 118, "204": 120, "205": 121, "206": 121, "207": 121, "208": 122, "209": 122, "210": 124, "211": 126, "217": 211}, "uri": "/changeset/diff_block.html", "filename": "/root/package/kallithea/templates/changeset/diff_block.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,60 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253644.526218
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/changeset/patch_changeset.html'
+_template_uri = 'changeset/patch_changeset.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        __M_writer = context.writer()
+        if h.is_hg(c.db_repo_scm_instance):
+            __M_writer(u'# ')
+            __M_writer(escape(c.db_repo_scm_instance.alias.upper()))
+            __M_writer(u' changeset patch\n# User ')
+            __M_writer(c.changeset.author )
+            __M_writer(u'\n# Date ')
+            __M_writer(escape(c.changeset.date))
+            __M_writer(u'\n# Node ID ')
+            __M_writer(escape(c.changeset.raw_id))
+            __M_writer(u'\n')
+            __M_writer(escape(c.parent_tmpl))
+            __M_writer(u'\n')
+            __M_writer(c.changeset.message )
+            __M_writer(u'\n\n')
+        elif h.is_git(c.db_repo_scm_instance):
+            __M_writer(u'From ')
+            __M_writer(escape(c.changeset.raw_id))
+            __M_writer(u' ')
+            __M_writer(escape(c.changeset.date))
+            __M_writer(u'\nFrom: ')
+            __M_writer(c.changeset.author )
+            __M_writer(u'\nDate: ')
+            __M_writer(escape(c.changeset.date))
+            __M_writer(u'\nSubject: [PATCH] ')
+            __M_writer(c.changeset.message )
+            __M_writer(u'\n---\n\n')
+        __M_writer(c.diff)
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "23": 1, "24": 2, "25": 2, "26": 2, "27": 3, "28": 3, "29": 4, "30": 4, "31": 5, "32": 5, "33": 6, "34": 6, "35": 7, "36": 7, "37": 9, "38": 10, "39": 10, "40": 10, "41": 10, "42": 10, "43": 11, "44": 11, "45": 12, "46": 12, "47": 13, "48": 13, "49": 17, "50": 17, "56": 50}, "uri": "changeset/patch_changeset.html", "filename": "/root/package/kallithea/templates/changeset/patch_changeset.html"}
+__M_END_METADATA
+"""
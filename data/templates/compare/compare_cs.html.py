@@ -0,0 +1,147 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253647.01142
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/compare/compare_cs.html'
+_template_uri = u'compare/compare_cs.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        c = context.get('c', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        reversed = context.get('reversed', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<div class="container">\n')
+        if not c.cs_ranges:
+            __M_writer(u'    <span class="empty_data">')
+            __M_writer(escape(_('No changesets')))
+            __M_writer(u'</span>\n')
+        else:
+            __M_writer(u'\n')
+            if c.ancestor:
+                __M_writer(u'    <div class="ancestor">')
+                __M_writer(escape(_('Ancestor')))
+                __M_writer(u':\n      ')
+                __M_writer(escape(h.link_to(h.short_id(c.ancestor),h.url('changeset_home',repo_name=c.repo_name,revision=c.ancestor))))
+                __M_writer(u'\n    </div>\n')
+            __M_writer(u'\n    <div id="graph_nodes">\n        <canvas id="graph_canvas"></canvas>\n    </div>\n\n    <div id="graph_content_pr" style="margin-left: 100px;">\n\n    <table class="compare_view_commits noborder">\n')
+            for cnt, cs in enumerate(reversed(c.cs_ranges)):
+                __M_writer(u'        <tr id="chg_')
+                __M_writer(escape(cnt+1))
+                __M_writer(u'">\n        <td style="width:50px">\n')
+                if cs.raw_id in c.statuses:
+                    __M_writer(u'            <div title="')
+                    __M_writer(escape(_('Changeset status: %s') % c.statuses[cs.raw_id][1]))
+                    __M_writer(u'" class="changeset-status-ico">\n                <i class="icon-circle changeset-status-')
+                    __M_writer(escape(c.statuses[cs.raw_id][0]))
+                    __M_writer(u'"></i>\n            </div>\n')
+                if c.cs_comments.get(cs.raw_id):
+                    __M_writer(u'              <div class="comments-container">\n                  <div class="comments-cnt" title="')
+                    __M_writer(escape(_('Changeset has comments')))
+                    __M_writer(u'">\n                      <a href="')
+                    __M_writer(escape(h.url('changeset_home',repo_name=c.cs_repo.repo_name,revision=cs.raw_id,anchor='comment-%s' % c.cs_comments[cs.raw_id][0].comment_id)))
+                    __M_writer(u'">\n                          ')
+                    __M_writer(escape(len(c.cs_comments[cs.raw_id])))
+                    __M_writer(u'\n                          <i class="icon-comment"></i>\n                      </a>\n                  </div>\n              </div>\n')
+                __M_writer(u'        </td>\n        <td style="width: 140px"><span class="tooltip" title="')
+                __M_writer(escape(h.tooltip(h.age(cs.date))))
+                __M_writer(u'">')
+                __M_writer(escape(cs.date))
+                __M_writer(u'</span></td>\n        <td><div class="gravatar" commit_id="')
+                __M_writer(escape(cs.raw_id))
+                __M_writer(u'">')
+                __M_writer(escape(h.gravatar(h.email_or_none(cs.author), size=14)))
+                __M_writer(u'</div></td>\n        <td><div class="author">')
+                __M_writer(escape(h.person(cs.author)))
+                __M_writer(u'</div></td>\n        <td>')
+                __M_writer(escape(h.link_to(h.show_id(cs),h.url('changeset_home',repo_name=c.cs_repo.repo_name,revision=cs.raw_id))))
+                __M_writer(u'</td>\n        <td>\n')
+                if cs.branch:
+                    __M_writer(u'        <span class="branchtag">')
+                    __M_writer(escape(h.link_to(cs.branch,h.url('changelog_home',repo_name=c.cs_repo.repo_name,branch=cs.branch))))
+                    __M_writer(u'</span>\n')
+                __M_writer(u'        </td>\n        <td class="expand_commit" commit_id="')
+                __M_writer(escape(cs.raw_id))
+                __M_writer(u'" title="')
+                __M_writer(escape(_('Expand commit message')))
+                __M_writer(u'">\n            <i class="icon-align-left" style="color:#999"></i>\n        </td>\n        <td><div id="C-')
+                __M_writer(escape(cs.raw_id))
+                __M_writer(u'" class="message">')
+                __M_writer(escape(h.urlify_commit(cs.message, c.repo_name)))
+                __M_writer(u'</div></td>\n        </tr>\n')
+            __M_writer(u'    </table>\n\n    </div>\n\n')
+            if c.as_form:
+                __M_writer(u'      <div style="font-size:1.1em;font-weight: bold;clear:both;padding-top:10px">\n')
+                __M_writer(u'      ')
+                __M_writer(escape(h.link_to(_('Show merge diff'),
+        h.url('compare_url',
+          repo_name=c.a_repo.repo_name,
+          org_ref_type=c.a_ref_type, org_ref_name=c.a_ref_name,
+          other_repo=c.cs_repo.repo_name,
+          other_ref_type=c.cs_ref_type, other_ref_name=c.cs_ref_name,
+          merge='1')
+        )))
+                __M_writer(u'\n      </div>\n      <div style="font-size:1.1em;font-weight: bold;clear:both;padding-top:10px">\n        ')
+                __M_writer(escape(_('Common ancestor')))
+                __M_writer(u':\n')
+                if c.ancestor:
+                    __M_writer(u'        ')
+                    __M_writer(escape(h.link_to(h.short_id(c.ancestor),h.url('changeset_home',repo_name=c.repo_name,revision=c.ancestor))))
+                    __M_writer(u'\n')
+                else:
+                    __M_writer(u'        ')
+                    __M_writer(escape(_('No common ancestor found - repositories are unrelated')))
+                    __M_writer(u'\n')
+                __M_writer(u'      </div>\n')
+            if c.cs_ranges_org is not None:
+                __M_writer(u'      <div style="font-size:1.1em;font-weight: bold;clear:both;padding-top:10px">\n        ')
+                __M_writer(escape(h.link_to_ref(c.cs_repo.repo_name, c.cs_ref_type, c.cs_ref_name, c.cs_rev)))
+                __M_writer(u'\n        ')
+                __M_writer(escape(_('is')))
+                __M_writer(u'\n        <a href="')
+                __M_writer(escape(c.swap_url))
+                __M_writer(u'">')
+                __M_writer(escape(_('%s changesets') % (len(c.cs_ranges_org))))
+                __M_writer(u'</a>\n        ')
+                __M_writer(escape(_('behind')))
+                __M_writer(u'\n        ')
+                __M_writer(escape(h.link_to_ref(c.a_repo.repo_name, c.a_ref_type, c.a_ref_name)))
+                __M_writer(u'\n      </div>\n')
+        __M_writer(u'</div>\n\n')
+        if c.as_form:
+            __M_writer(u'<div id="jsdata" style="display:none">')
+            __M_writer(c.jsdata)
+            __M_writer(u'</div>\n')
+        else:
+            __M_writer(u'<script type="text/javascript" src="')
+            __M_writer(escape(h.url('/js/graph.js', ver=c.kallithea_version)))
+            __M_writer(u'"></script>\n')
+        __M_writer(u'\n<script type="text/javascript">\n\n    $(document).ready(function(){\n')
+        if not c.as_form:
+            __M_writer(u'        var jsdata = ')
+            __M_writer(c.jsdata)
+            __M_writer(u";\n        var r = new BranchRenderer('graph_canvas', 'graph_content_pr', 'chg_');\n        r.render(jsdata,100);\n")
+        __M_writer(u"\n        $('.expand_commit').click(function(e){\n            var cid = $(this).attr('commit_id');\n            $('#C-'+cid).toggleClass('expanded');\n            r.render(jsdata,100);\n        });\n\n        $('.gravatar').click(function(e){\n            var cid = $(this).attr('commit_id');\n            $('#row-'+cid).toggleClass('hl', !$('#row-'+cid).hasClass('hl'));\n        });\n    });\n\n</script>\n")
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "27": 2, "28": 3, "29": 4, "30": 4, "31": 4, "32": 5, "33": 6, "34": 7, "35": 8, "36": 8, "37": 8, "38": 9, "39": 9, "40": 12, "41": 20, "42": 21, "43": 21, "44": 21, "45": 23, "46": 24, "47": 24, "48": 24, "49": 25, "50": 25, "51": 28, "52": 29, "53": 30, "54": 30, "55": 31, "56": 31, "57": 32, "58": 32, "59": 38, "60": 39, "61": 39, "62": 39, "63": 39, "64": 40, "65": 40, "66": 40, "67": 40, "68": 41, "69": 41, "70": 42, "71": 42, "72": 44, "73": 45, "74": 45, "75": 45, "76": 47, "77": 48, "78": 48, "79": 48, "80": 48, "81": 51, "82": 51, "83": 51, "84": 51, "85": 54, "86": 58, "87": 59, "88": 61, "89": 61, "97": 68, "98": 71, "99": 71, "100": 72, "101": 73, "102": 73, "103": 73, "104": 74, "105": 75, "106": 75, "107": 75, "108": 77, "109": 79, "110": 81, "111": 82, "112": 82, "113": 83, "114": 83, "115": 84, "116": 84, "117": 84, "118": 84, "119": 85, "120": 85, "121": 86, "122": 86, "123": 90, "124": 92, "125": 93, "126": 93, "127": 93, "128": 94, "129": 95, "130": 95, "131": 95, "132": 97, "133": 101, "134": 102, "135": 102, "136": 102, "137": 106, "143": 137}, "uri": "compare/compare_cs.html", "filename": "/root/package/kallithea/templates/compare/compare_cs.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,232 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253646.992656
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/compare/compare_diff.html'
+_template_uri = 'compare/compare_diff.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'diff_block', context._clean_inheritance_tokens(), templateuri=u'/changeset/diff_block.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'diff_block')] = ns
+
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        request = context.get('request', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        diff_block = _mako_get_namespace(context, 'diff_block')
+        ungettext = context.get('ungettext', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('changelog')))
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <div class="table">\n        <div id="body" class="diffblock">\n            <div class="code-header">\n                <div>\n                    ')
+        __M_writer(escape(h.hidden('compare_org')))
+        __M_writer(u' <i class="icon-right"></i> ')
+        __M_writer(escape(h.hidden('compare_other')))
+        __M_writer(u'\n')
+        if not c.compare_home:
+            __M_writer(u'                        <a class="btn btn-small" href="')
+            __M_writer(escape(c.swap_url))
+            __M_writer(u'"><i class="icon-arrows-cw"></i> ')
+            __M_writer(escape(_('Swap')))
+            __M_writer(u'</a>\n')
+        __M_writer(u'                    <div id="compare_revs" class="btn btn-small"><i class="icon-git-compare"></i> ')
+        __M_writer(escape(_('Compare Revisions')))
+        __M_writer(u'</div>\n                </div>\n            </div>\n        </div>\n\n')
+        if c.compare_home:
+            __M_writer(u'        <div id="changeset_compare_view_content">\n         <div style="color:#999;font-size: 18px">')
+            __M_writer(escape(_('Compare revisions, branches, bookmarks, or tags.')))
+            __M_writer(u'</div>\n        </div>\n')
+        else:
+            __M_writer(u'        <div id="changeset_compare_view_content">\n')
+            __M_writer(u'                <div style="font-size:1.1em;font-weight: bold;clear:both;padding-top:10px">')
+            __M_writer(escape(ungettext('Showing %s commit','Showing %s commits', len(c.cs_ranges)) % len(c.cs_ranges)))
+            __M_writer(u'</div>\n                ')
+            runtime._include_file(context, u'compare_cs.html', _template_uri)
+            __M_writer(u'\n\n')
+            __M_writer(u'                <div style="font-size:1.1em;font-weight: bold;clear:both;padding-top:10px">\n\n')
+            if c.limited_diff:
+                __M_writer(u'                    ')
+                __M_writer(escape(ungettext('%s file changed', '%s files changed', len(c.files)) % len(c.files)))
+                __M_writer(u'\n')
+            else:
+                __M_writer(u'                    ')
+                __M_writer(escape(ungettext('%s file changed with %s insertions and %s deletions','%s files changed with %s insertions and %s deletions', len(c.files)) % (len(c.files),c.lines_added,c.lines_deleted)))
+                __M_writer(u':\n')
+            __M_writer(u'\n                ')
+            __M_writer(escape(c.ignorews_url(request.GET)))
+            __M_writer(u'\n                ')
+            __M_writer(escape(c.context_url(request.GET)))
+            __M_writer(u'\n\n                </div>\n                <div class="cs_files">\n')
+            if not c.files:
+                __M_writer(u'                     <span class="empty_data">')
+                __M_writer(escape(_('No files')))
+                __M_writer(u'</span>\n')
+            for fid, change, f, stat in c.files:
+                __M_writer(u'                     <div class="cs_')
+                __M_writer(escape(change))
+                __M_writer(u'">\n                         <div class="node">\n                             <i class="icon-diff-')
+                __M_writer(escape(change))
+                __M_writer(u'"></i>\n                             ')
+                __M_writer(escape(h.link_to(h.safe_unicode(f), '#' + fid)))
+                __M_writer(u'\n                         </div>\n                         <div class="changes">')
+                __M_writer(escape(h.fancy_file_stats(stat)))
+                __M_writer(u'</div>\n                     </div>\n')
+            __M_writer(u'                </div>\n')
+            if c.limited_diff:
+                __M_writer(u'                  <h5>')
+                __M_writer(escape(_('Changeset was too big and was cut off...')))
+                __M_writer(u' <a href="')
+                __M_writer(escape(h.url.current(fulldiff=1, **request.GET.mixed())))
+                __M_writer(u'">')
+                __M_writer(escape(_('Show full diff')))
+                __M_writer(u'</a></h5>\n')
+            __M_writer(u'         </div>\n\n')
+            __M_writer(u'        ')
+            __M_writer(u'\n        ')
+            __M_writer(escape(diff_block.diff_block_js()))
+            __M_writer(u'\n')
+            for fid, change, f, stat in c.files:
+                __M_writer(u'          ')
+                __M_writer(escape(diff_block.diff_block_simple([c.changes[fid]])))
+                __M_writer(u'\n')
+            if c.limited_diff:
+                __M_writer(u'          <h4>')
+                __M_writer(escape(_('Changeset was too big and was cut off...')))
+                __M_writer(u' <a href="')
+                __M_writer(escape(h.url.current(fulldiff=1, **request.GET.mixed())))
+                __M_writer(u'">')
+                __M_writer(escape(_('Show full diff')))
+                __M_writer(u'</a></h4>\n')
+        __M_writer(u'    </div>\n\n</div>\n    <script type="text/javascript">\n\n   $(document).ready(function(){\n    var cache = {}\n    $("#compare_org").select2({\n        placeholder: "')
+        __M_writer(escape('%s@%s' % (c.a_repo.repo_name, c.a_ref_name)))
+        __M_writer(u'",\n        formatSelection: function(obj){\n            return \'{0}@{1}\'.format("')
+        __M_writer(escape(c.a_repo.repo_name))
+        __M_writer(u'", obj.text)\n        },\n        dropdownAutoWidth: true,\n        query: function(query){\n          var key = \'cache\';\n          var cached = cache[key] ;\n          if(cached) {\n            var data = {results: []};\n            //filter results\n            $.each(cached.results, function(){\n                var section = this.text;\n                var children = [];\n                $.each(this.children, function(){\n                    if(query.term.length == 0 || this.text.toUpperCase().indexOf(query.term.toUpperCase()) >= 0 ){\n                        children.push({\'id\': this.id, \'text\': this.text})\n                    }\n                })\n                data.results.push({\'text\': section, \'children\': children})\n            });\n            //push the typed in changeset\n            data.results.push({\'text\':_TM[\'Specify changeset\'],\n                               \'children\': [{\'id\': query.term, \'text\': query.term, \'type\': \'rev\'}]})\n            query.callback(data);\n          }else{\n              $.ajax({\n                url: pyroutes.url(\'repo_refs_data\', {\'repo_name\': \'')
+        __M_writer(escape(c.a_repo.repo_name))
+        __M_writer(u'\'}),\n                data: {},\n                dataType: \'json\',\n                type: \'GET\',\n                success: function(data) {\n                  cache[key] = data;\n                  query.callback(data);\n                }\n              })\n          }\n        }\n    });\n    $("#compare_other").select2({\n        placeholder: "')
+        __M_writer(escape('%s@%s' % (c.cs_repo.repo_name, c.cs_ref_name)))
+        __M_writer(u'",\n        dropdownAutoWidth: true,\n        formatSelection: function(obj){\n            return \'{0}@{1}\'.format("')
+        __M_writer(escape(c.cs_repo.repo_name))
+        __M_writer(u'", obj.text)\n        },\n        query: function(query){\n          var key = \'cache2\';\n          var cached = cache[key] ;\n          if(cached) {\n            var data = {results: []};\n            //filter results\n            $.each(cached.results, function(){\n                var section = this.text;\n                var children = [];\n                $.each(this.children, function(){\n                    if(query.term.length == 0 || this.text.toUpperCase().indexOf(query.term.toUpperCase()) >= 0 ){\n                        children.push({\'id\': this.id, \'text\': this.text})\n                    }\n                })\n                data.results.push({\'text\': section, \'children\': children})\n            });\n            //push the typed in changeset\n            data.results.push({\'text\':_TM[\'Specify changeset\'],\n                               \'children\': [{\'id\': query.term, \'text\': query.term, \'type\': \'rev\'}]})\n            query.callback(data);\n          }else{\n              $.ajax({\n                url: pyroutes.url(\'repo_refs_data\', {\'repo_name\': \'')
+        __M_writer(escape(c.cs_repo.repo_name))
+        __M_writer(u'\'}),\n                data: {},\n                dataType: \'json\',\n                type: \'GET\',\n                success: function(data) {\n                  cache[key] = data;\n                  query.callback({results: data.results});\n                }\n              })\n          }\n        }\n    });\n\n    var values_changed = function() {\n        var values = $(\'#compare_org\').select2(\'data\') && $(\'#compare_other\').select2(\'data\');\n        if (values) {\n             $(\'#compare_revs\').removeClass("disabled");\n             // TODO: the swap button ... if any\n        } else {\n             $(\'#compare_revs\').addClass("disabled");\n             // TODO: the swap button ... if any\n        }\n    }\n    values_changed();\n    $(\'#compare_org\').change(values_changed);\n    $(\'#compare_other\').change(values_changed);\n    $(\'#compare_revs\').on(\'click\', function(e){\n        var org = $(\'#compare_org\').select2(\'data\');\n        var other = $(\'#compare_other\').select2(\'data\');\n        if (!org || !other) {\n            return;\n        }\n\n        var compare_url = "')
+        __M_writer(escape(h.url('compare_url',repo_name=c.repo_name,org_ref_type='__other_ref_type__',org_ref_name='__org__',other_ref_type='__org_ref_type__',other_ref_name='__other__', other_repo=c.cs_repo.repo_name)))
+        __M_writer(u'";\n        var u = compare_url.replace(\'__other_ref_type__\',org.type)\n                           .replace(\'__org__\',org.text)\n                           .replace(\'__org_ref_type__\',other.type)\n                           .replace(\'__other__\',other.text);\n        window.location = u;\n    });\n   });\n    </script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  ')
+        __M_writer(escape(_('Compare Revisions')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.compare_home:
+            __M_writer(u'        ')
+            __M_writer(escape(_('%s Compare') % c.repo_name))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'        ')
+            __M_writer(escape(_('%s Compare') % c.repo_name))
+            __M_writer(u' - ')
+            __M_writer(escape('%s@%s' % (c.a_repo.repo_name, c.a_ref_name)))
+            __M_writer(u' &gt; ')
+            __M_writer(escape('%s@%s' % (c.cs_repo.repo_name, c.cs_ref_name)))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"23": 83, "29": 0, "41": 2, "46": 10, "47": 14, "52": 18, "53": 209, "59": 16, "66": 16, "67": 17, "68": 17, "74": 20, "86": 20, "87": 21, "88": 21, "89": 25, "90": 25, "91": 31, "92": 31, "93": 31, "94": 31, "95": 32, "96": 33, "97": 33, "98": 33, "99": 33, "100": 33, "101": 35, "102": 35, "103": 35, "104": 40, "105": 41, "106": 42, "107": 42, "108": 44, "109": 45, "110": 47, "111": 47, "112": 47, "113": 48, "114": 48, "115": 51, "116": 53, "117": 54, "118": 54, "119": 54, "120": 55, "121": 56, "122": 56, "123": 56, "124": 58, "125": 59, "126": 59, "127": 60, "128": 60, "129": 64, "130": 65, "131": 65, "132": 65, "133": 67, "134": 68, "135": 68, "136": 68, "137": 70, "138": 70, "139": 71, "140": 71, "141": 73, "142": 73, "143": 76, "144": 77, "145": 78, "146": 78, "147": 78, "148": 78, "149": 78, "150": 78, "151": 78, "152": 80, "153": 83, "154": 83, "155": 84, "156": 84, "157": 85, "158": 86, "159": 86, "160": 86, "161": 88, "162": 89, "163": 89, "164": 89, "165": 89, "166": 89, "167": 89, "168": 89, "169": 92, "170": 100, "171": 100, "172": 102, "173": 102, "174": 127, "175": 127, "176": 140, "177": 140, "178": 143, "179": 143, "180": 167, "181": 167, "182": 200, "183": 200, "189": 12, "194": 12, "195": 13, "196": 13, "202": 4, "210": 4, "211": 5, "212": 6, "213": 6, "214": 6, "215": 7, "216": 8, "217": 8, "218": 8, "219": 8, "220": 8, "221": 8, "222": 8, "228": 222}, "uri": "compare/compare_diff.html", "filename": "/root/package/kallithea/templates/compare/compare_diff.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,436 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253605.079225
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/data_table/_dt_elements.html'
+_template_uri = 'data_table/_dt_elements.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = ['quick_menu', 'user_group_actions', 'repo_state', 'revision', 'user_group_name', 'user_name', 'toggle_follow', 'repo_actions', 'repo_group_name', 'repo_group_actions', 'atom', 'user_actions', 'repo_name', 'last_change', 'rss']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'base', context._clean_inheritance_tokens(), templateuri=u'/base/base.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'base')] = ns
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_quick_menu(context,repo_name):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <ul class="menu_items hidden">\n')
+        __M_writer(u'\n    <li style="border-top:1px solid #577632; margin-left: 21px; padding-left: -99px;"></li>\n    <li>\n       <a title="')
+        __M_writer(escape(_('Summary')))
+        __M_writer(u'" href="')
+        __M_writer(escape(h.url('summary_home',repo_name=repo_name)))
+        __M_writer(u'">\n       <span class="icon">\n           <i class="icon-doc-text-inv"></i>\n       </span>\n       <span>')
+        __M_writer(escape(_('Summary')))
+        __M_writer(u'</span>\n       </a>\n    </li>\n    <li>\n       <a title="')
+        __M_writer(escape(_('Changelog')))
+        __M_writer(u'" href="')
+        __M_writer(escape(h.url('changelog_home',repo_name=repo_name)))
+        __M_writer(u'">\n       <span class="icon">\n           <i class="icon-clock"></i>\n       </span>\n       <span>')
+        __M_writer(escape(_('Changelog')))
+        __M_writer(u'</span>\n       </a>\n    </li>\n    <li>\n       <a title="')
+        __M_writer(escape(_('Files')))
+        __M_writer(u'" href="')
+        __M_writer(escape(h.url('files_home',repo_name=repo_name)))
+        __M_writer(u'">\n       <span class="icon">\n           <i class="icon-docs"></i>\n       </span>\n       <span>')
+        __M_writer(escape(_('Files')))
+        __M_writer(u'</span>\n       </a>\n    </li>\n    <li>\n       <a title="')
+        __M_writer(escape(_('Fork')))
+        __M_writer(u'" href="')
+        __M_writer(escape(h.url('repo_fork_home',repo_name=repo_name)))
+        __M_writer(u'">\n       <span class="icon">\n           <i class="icon-fork"></i>\n       </span>\n       <span>')
+        __M_writer(escape(_('Fork')))
+        __M_writer(u'</span>\n       </a>\n    </li>\n    <li>\n       <a title="')
+        __M_writer(escape(_('Settings')))
+        __M_writer(u'" href="')
+        __M_writer(escape(h.url('edit_repo',repo_name=repo_name)))
+        __M_writer(u'">\n       <span class="icon">\n           <i class="icon-gear"></i>\n       </span>\n       <span>')
+        __M_writer(escape(_('Settings')))
+        __M_writer(u'</span>\n       </a>\n    </li>\n  </ul>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_user_group_actions(context,user_group_id,user_group_name):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n <div style="float:left" class="grid_edit">\n    <a href="')
+        __M_writer(escape(h.url('edit_users_group', id=user_group_id)))
+        __M_writer(u'" title="')
+        __M_writer(escape(_('Edit')))
+        __M_writer(u'">\n    <i class="icon-pencil"></i>\n     ')
+        __M_writer(escape(h.submit('edit_%s' % user_group_name,_('edit'),class_="action_button", id_="submit_user_group_edit")))
+        __M_writer(u'\n    </a>\n </div>\n <div style="float:left" class="grid_delete">\n    ')
+        __M_writer(escape(h.form(h.url('users_group', id=user_group_id),method='delete')))
+        __M_writer(u'\n      <i class="icon-minus-circled" style="color:#FF4444"></i>\n      ')
+        __M_writer(escape(h.submit('remove_',_('delete'),id="remove_group_%s" % user_group_id, class_="action_button",
+      onclick="return confirm('"+_('Confirm to delete this user group: %s') % user_group_name+"');")))
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_repo_state(context,repo_state):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <div>\n')
+        if repo_state == 'repo_state_pending':
+            __M_writer(u'        <div class="btn btn-mini btn-info disabled">')
+            __M_writer(escape(_('Creating')))
+            __M_writer(u'</div>\n')
+        elif repo_state == 'repo_state_created':
+            __M_writer(u'        <div class="btn btn-mini btn-success disabled">')
+            __M_writer(escape(_('Created')))
+            __M_writer(u'</div>\n')
+        else:
+            __M_writer(u'        <div class="btn btn-mini btn-danger disabled" title="')
+            __M_writer(escape(repo_state))
+            __M_writer(u'">invalid</div>\n')
+        __M_writer(u'  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_revision(context,name,rev,tip,author,last_msg):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <div>\n')
+        if rev >= 0:
+            __M_writer(u'      <a title="')
+            __M_writer(escape(h.tooltip('%s:\n\n%s' % (author,last_msg))))
+            __M_writer(u'" class="tooltip revision-link" href="')
+            __M_writer(escape(h.url('changeset_home',repo_name=name,revision=tip)))
+            __M_writer(u'">')
+            __M_writer(escape('r%s:%s' % (rev,h.short_id(tip))))
+            __M_writer(u'</a>\n')
+        else:
+            __M_writer(u'      ')
+            __M_writer(escape(_('No changesets yet')))
+            __M_writer(u'\n')
+        __M_writer(u'  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_user_group_name(context,user_group_id,user_group_name):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <div style="white-space: nowrap">\n  <a href="')
+        __M_writer(escape(h.url('edit_users_group', id=user_group_id)))
+        __M_writer(u'">\n    <i class="icon-users" title="')
+        __M_writer(escape(_('User group')))
+        __M_writer(u'"></i> ')
+        __M_writer(escape(user_group_name))
+        __M_writer(u'</a>\n  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_user_name(context,user_id,username):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.link_to(username,h.url('edit_user', id=user_id))))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_toggle_follow(context,repo_id):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <span id="follow_toggle_')
+        __M_writer(escape(repo_id))
+        __M_writer(u'" class="following" title="')
+        __M_writer(escape(_('Stop following this repository')))
+        __M_writer(u'"\n        onclick="javascript:toggleFollowingRepo(this, ')
+        __M_writer(escape(repo_id))
+        __M_writer(u')">\n  </span>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_repo_actions(context,repo_name,super_user=True):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <div>\n    <div style="float:left; margin-right:5px;" class="grid_edit">\n      <a href="')
+        __M_writer(escape(h.url('edit_repo',repo_name=repo_name)))
+        __M_writer(u'" title="')
+        __M_writer(escape(_('edit')))
+        __M_writer(u'">\n        <i class="icon-pencil"></i> ')
+        __M_writer(escape(h.submit('edit_%s' % repo_name,_('edit'),class_="action_button")))
+        __M_writer(u'\n      </a>\n    </div>\n    <div style="float:left" class="grid_delete">\n      ')
+        __M_writer(escape(h.form(h.url('repo', repo_name=repo_name),method='delete')))
+        __M_writer(u'\n        <i class="icon-minus-circled" style="color:#FF4444"></i>\n        ')
+        __M_writer(escape(h.submit('remove_%s' % repo_name,_('delete'),class_="action_button",
+        onclick="return confirm('"+_('Confirm to delete this repository: %s') % repo_name+"');")))
+        __M_writer(u'\n      ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n    </div>\n  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_repo_group_name(context,repo_group_name,children_groups):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <div style="white-space: nowrap">\n  <a href="')
+        __M_writer(escape(h.url('repos_group_home',group_name=repo_group_name)))
+        __M_writer(u'">\n    <i class="icon-folder" title="')
+        __M_writer(escape(_('Repository group')))
+        __M_writer(u'"></i> ')
+        __M_writer(escape(h.literal(' &raquo; '.join(children_groups))))
+        __M_writer(u'</a>\n  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_repo_group_actions(context,repo_group_id,repo_group_name,gr_count):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        ungettext = context.get('ungettext', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n <div style="float:left" class="grid_edit">\n    <a href="')
+        __M_writer(escape(h.url('edit_repo_group',group_name=repo_group_name)))
+        __M_writer(u'" title="')
+        __M_writer(escape(_('Edit')))
+        __M_writer(u'">\n    <i class="icon-pencil"></i>\n     ')
+        __M_writer(escape(h.submit('edit_%s' % repo_group_name, _('edit'),class_="action_button")))
+        __M_writer(u'\n    </a>\n </div>\n <div style="float:left" class="grid_delete">\n    ')
+        __M_writer(escape(h.form(h.url('repos_group', group_name=repo_group_name),method='delete')))
+        __M_writer(u'\n        <i class="icon-minus-circled" style="color:#FF4444"></i>\n        ')
+        __M_writer(escape(h.submit('remove_%s' % repo_group_name,_('delete'),class_="action_button",
+        onclick="return confirm('"+ungettext('Confirm to delete this group: %s with %s repository','Confirm to delete this group: %s with %s repositories',gr_count) % (repo_group_name, gr_count)+"');")))
+        __M_writer(u'\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_atom(context,name):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'    <a title="')
+            __M_writer(escape(_('Subscribe to %s atom feed')% name))
+            __M_writer(u'" href="')
+            __M_writer(escape(h.url('atom_feed_home',repo_name=name,api_key=c.authuser.api_key)))
+            __M_writer(u'"><i class="icon-rss-squared"></i></a>\n')
+        else:
+            __M_writer(u'    <a title="')
+            __M_writer(escape(_('Subscribe to %s atom feed')% name))
+            __M_writer(u'" href="')
+            __M_writer(escape(h.url('atom_feed_home',repo_name=name)))
+            __M_writer(u'"><i class="icon-rss-squared"></i></a>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_user_actions(context,user_id,username):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n <div style="float:left" class="grid_edit">\n   <a href="')
+        __M_writer(escape(h.url('edit_user',id=user_id)))
+        __M_writer(u'" title="')
+        __M_writer(escape(_('edit')))
+        __M_writer(u'">\n     <i class="icon-pencil"></i> ')
+        __M_writer(escape(h.submit('edit_%s' % username,_('edit'),class_="action_button")))
+        __M_writer(u'\n   </a>\n </div>\n <div style="float:left" class="grid_delete">\n  ')
+        __M_writer(escape(h.form(h.url('delete_user', id=user_id),method='delete')))
+        __M_writer(u'\n    <i class="icon-minus-circled" style="color:#FF4444"></i>\n    ')
+        __M_writer(escape(h.submit('remove_',_('delete'),id="remove_user_%s" % user_id, class_="action_button",
+    onclick="return confirm('"+_('Confirm to delete this user: %s') % username+"');")))
+        __M_writer(u'\n  ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_repo_name(context,name,rtype,rstate,private,fork_of,short_name=False,admin=False):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        base = _mako_get_namespace(context, 'base')
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+
+        def get_name(name,short_name=short_name):
+          if short_name:
+            return name.split('/')[-1]
+          else:
+            return name
+        
+        
+        __M_writer(u'\n  <div class="dt_repo ')
+        __M_writer(escape('dt_repo_pending' if rstate == 'repo_state_pending' else ''))
+        __M_writer(u'">\n')
+        __M_writer(u'    <a href="')
+        __M_writer(escape(h.url('edit_repo' if admin else 'summary_home', repo_name=name)))
+        __M_writer(u'">\n\n')
+        __M_writer(u'    ')
+        __M_writer(escape(base.repotag(rtype)))
+        __M_writer(u'\n\n')
+        if private and c.visual.show_private_icon:
+            __M_writer(u'      <i class="icon-keyhole-circled" title="')
+            __M_writer(escape(_('Private repository')))
+            __M_writer(u'"></i>\n')
+        elif not private and c.visual.show_public_icon:
+            __M_writer(u'      <i class="icon-globe" title="')
+            __M_writer(escape(_('Public repository')))
+            __M_writer(u'"></i>\n')
+        else:
+            __M_writer(u'      <span style="margin: 0px 8px 0px 8px"></span>\n')
+        __M_writer(u'    <span class="dt_repo_name">')
+        __M_writer(escape(get_name(name)))
+        __M_writer(u'</span>\n    </a>\n')
+        if fork_of:
+            __M_writer(u'      <a href="')
+            __M_writer(escape(h.url('summary_home',repo_name=fork_of.repo_name)))
+            __M_writer(u'"><i class="icon-fork"></i></a>\n')
+        if rstate == 'repo_state_pending':
+            __M_writer(u'      <i class="icon-wrench" title="')
+            __M_writer(escape(_('Repository creation in progress...')))
+            __M_writer(u'"></i>\n')
+        __M_writer(u'  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_last_change(context,last_change):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <span class="tooltip" date="')
+        __M_writer(escape(last_change))
+        __M_writer(u'" title="')
+        __M_writer(escape(h.tooltip(h.fmt_date(last_change))))
+        __M_writer(u'">')
+        __M_writer(escape(h.age(last_change)))
+        __M_writer(u'</span>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_rss(context,name):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'    <a title="')
+            __M_writer(escape(_('Subscribe to %s rss feed')% name))
+            __M_writer(u'" href="')
+            __M_writer(escape(h.url('rss_feed_home',repo_name=name,api_key=c.authuser.api_key)))
+            __M_writer(u'"><i class="icon-rss-squared"></i></a>\n')
+        else:
+            __M_writer(u'    <a title="')
+            __M_writer(escape(_('Subscribe to %s rss feed')% name))
+            __M_writer(u'" href="')
+            __M_writer(escape(h.url('rss_feed_home',repo_name=name)))
+            __M_writer(u'"><i class="icon-rss-squared"></i></a>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"23": 5, "26": 0, "31": 4, "32": 5, "33": 53, "34": 87, "35": 91, "36": 101, "37": 109, "38": 117, "39": 134, "40": 146, "41": 161, "42": 177, "43": 193, "44": 197, "45": 204, "46": 211, "47": 217, "53": 7, "59": 7, "60": 10, "61": 13, "62": 13, "63": 13, "64": 13, "65": 17, "66": 17, "67": 21, "68": 21, "69": 21, "70": 21, "71": 25, "72": 25, "73": 29, "74": 29, "75": 29, "76": 29, "77": 33, "78": 33, "79": 37, "80": 37, "81": 37, "82": 37, "83": 41, "84": 41, "85": 45, "86": 45, "87": 45, "88": 45, "89": 49, "90": 49, "96": 163, "102": 163, "103": 165, "104": 165, "105": 165, "106": 165, "107": 167, "108": 167, "109": 171, "110": 171, "111": 173, "113": 174, "114": 175, "115": 175, "121": 136, "126": 136, "127": 138, "128": 139, "129": 139, "130": 139, "131": 140, "132": 141, "133": 141, "134": 141, "135": 142, "136": 143, "137": 143, "138": 143, "139": 145, "145": 93, "151": 93, "152": 95, "153": 96, "154": 96, "155": 96, "156": 96, "157": 96, "158": 96, "159": 96, "160": 97, "161": 98, "162": 98, "163": 98, "164": 100, "170": 206, "176": 206, "177": 208, "178": 208, "179": 209, "180": 209, "181": 209, "182": 209, "188": 195, "193": 195, "194": 196, "195": 196, "201": 213, "206": 213, "207": 214, "208": 214, "209": 214, "210": 214, "211": 215, "212": 215, "218": 119, "224": 119, "225": 122, "226": 122, "227": 122, "228": 122, "229": 123, "230": 123, "231": 127, "232": 127, "233": 129, "235": 130, "236": 131, "237": 131, "243": 199, "249": 199, "250": 201, "251": 201, "252": 202, "253": 202, "254": 202, "255": 202, "261": 179, "268": 179, "269": 181, "270": 181, "271": 181, "272": 181, "273": 183, "274": 183, "275": 187, "276": 187, "277": 189, "279": 190, "280": 191, "281": 191, "287": 111, "294": 111, "295": 112, "296": 113, "297": 113, "298": 113, "299": 113, "300": 113, "301": 114, "302": 115, "303": 115, "304": 115, "305": 115, "306": 115, "312": 148, "318": 148, "319": 150, "320": 150, "321": 150, "322": 150, "323": 151, "324": 151, "325": 155, "326": 155, "327": 157, "329": 158, "330": 159, "331": 159, "337": 55, "345": 55, "346": 56, "354": 62, "355": 63, "356": 63, "357": 65, "358": 65, "359": 65, "360": 68, "361": 68, "362": 68, "363": 71, "364": 72, "365": 72, "366": 72, "367": 73, "368": 74, "369": 74, "370": 74, "371": 75, "372": 76, "373": 78, "374": 78, "375": 78, "376": 80, "377": 81, "378": 81, "379": 81, "380": 83, "381": 84, "382": 84, "383": 84, "384": 86, "390": 89, "395": 89, "396": 90, "397": 90, "398": 90, "399": 90, "400": 90, "401": 90, "407": 103, "414": 103, "415": 104, "416": 105, "417": 105, "418": 105, "419": 105, "420": 105, "421": 106, "422": 107, "423": 107, "424": 107, "425": 107, "426": 107, "432": 426}, "uri": "data_table/_dt_elements.html", "filename": "/root/package/kallithea/templates/data_table/_dt_elements.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,84 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253645.965813
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/email_templates/changeset_comment.html'
+_template_uri = 'email_templates/changeset_comment.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'main.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        body = context.get('body', UNDEFINED)
+        cs_comment_user = context.get('cs_comment_user', UNDEFINED)
+        cs_comment_url = context.get('cs_comment_url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        is_mention = context.get('is_mention', UNDEFINED)
+        raw_id = context.get('raw_id', UNDEFINED)
+        message = context.get('message', UNDEFINED)
+        status_change = context.get('status_change', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        cs_target_repo = context.get('cs_target_repo', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if is_mention:
+            __M_writer(u'<p>')
+            __M_writer(escape(_('Comment from %s on %s changeset %s mentioned you') % (cs_comment_user, cs_target_repo, h.short_id(raw_id))))
+            __M_writer(u':</p>\n')
+        else:
+            __M_writer(u'<p>')
+            __M_writer(escape(_('Comment from %s on %s changeset %s') % (cs_comment_user, cs_target_repo, h.short_id(raw_id))))
+            __M_writer(u':</p>\n')
+        __M_writer(u'<p>')
+        __M_writer(escape(body))
+        __M_writer(u'</p>\n\n')
+        if status_change:
+            __M_writer(u'    <p>')
+            __M_writer(escape(_('The changeset status was changed to')))
+            __M_writer(u': <b>')
+            __M_writer(escape(status_change))
+            __M_writer(u'</b></p>\n')
+        __M_writer(u'\n<p>')
+        __M_writer(escape(_('URL')))
+        __M_writer(u': <a href="')
+        __M_writer(escape(cs_comment_url))
+        __M_writer(u'">')
+        __M_writer(escape(cs_comment_url))
+        __M_writer(u'</a></p>\n\n<p>')
+        __M_writer(escape(_('Changeset')))
+        __M_writer(u': ')
+        __M_writer(escape(h.short_id(raw_id)))
+        __M_writer(u'</p>\n<p>')
+        __M_writer(escape(_('Description')))
+        __M_writer(u':<br/>\n')
+        __M_writer(escape(h.shorter(message, 256)))
+        __M_writer(u'\n</p>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "42": 2, "43": 4, "44": 5, "45": 5, "46": 5, "47": 6, "48": 7, "49": 7, "50": 7, "51": 9, "52": 9, "53": 9, "54": 11, "55": 12, "56": 12, "57": 12, "58": 12, "59": 12, "60": 14, "61": 15, "62": 15, "63": 15, "64": 15, "65": 15, "66": 15, "67": 17, "68": 17, "69": 17, "70": 17, "71": 18, "72": 18, "73": 19, "74": 19, "80": 74}, "uri": "email_templates/changeset_comment.html", "filename": "/root/package/kallithea/templates/email_templates/changeset_comment.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,78 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253645.957995
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/email_templates/changeset_comment.txt'
+_template_uri = 'email_templates/changeset_comment.txt'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'main.txt', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        body = context.get('body', UNDEFINED)
+        cs_comment_user = context.get('cs_comment_user', UNDEFINED)
+        cs_comment_url = context.get('cs_comment_url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        is_mention = context.get('is_mention', UNDEFINED)
+        raw_id = context.get('raw_id', UNDEFINED)
+        message = context.get('message', UNDEFINED)
+        status_change = context.get('status_change', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        cs_target_repo = context.get('cs_target_repo', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if is_mention:
+            __M_writer(unicode(_('Comment from %s on %s changeset %s mentioned you') % (cs_comment_user, cs_target_repo, h.short_id(raw_id))))
+            __M_writer(u':\n')
+        else:
+            __M_writer(unicode(_('Comment from %s on %s changeset %s') % (cs_comment_user, cs_target_repo, h.short_id(raw_id))))
+            __M_writer(u':\n')
+        __M_writer(unicode(body))
+        __M_writer(u'\n\n')
+        if status_change:
+            __M_writer(unicode(_('The changeset status was changed to')))
+            __M_writer(u': ')
+            __M_writer(unicode(status_change))
+            __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(unicode(_('URL')))
+        __M_writer(u': ')
+        __M_writer(unicode(cs_comment_url))
+        __M_writer(u'\n\n')
+        __M_writer(unicode(_('Changeset')))
+        __M_writer(u': ')
+        __M_writer(unicode(h.short_id(raw_id)))
+        __M_writer(u'\n')
+        __M_writer(unicode(_('Description')))
+        __M_writer(u':\n')
+        __M_writer(unicode(h.shorter(message, 256)))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "42": 2, "43": 4, "44": 5, "45": 5, "46": 6, "47": 7, "48": 7, "49": 9, "50": 9, "51": 11, "52": 12, "53": 12, "54": 12, "55": 12, "56": 14, "57": 15, "58": 15, "59": 15, "60": 15, "61": 17, "62": 17, "63": 17, "64": 17, "65": 18, "66": 18, "67": 19, "68": 19, "74": 68}, "uri": "email_templates/changeset_comment.txt", "filename": "/root/package/kallithea/templates/email_templates/changeset_comment.txt"}
+__M_END_METADATA
+"""
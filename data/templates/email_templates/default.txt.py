@@ -0,0 +1,45 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253613.240513
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/email_templates/default.txt'
+_template_uri = 'email_templates/default.txt'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'main.txt', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        body = context.get('body', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        __M_writer(unicode(body))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"33": 2, "34": 4, "27": 0, "35": 4, "41": 35}, "uri": "email_templates/default.txt", "filename": "/root/package/kallithea/templates/email_templates/default.txt"}
+__M_END_METADATA
+"""
@@ -0,0 +1,36 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253613.243664
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/email_templates/main.txt'
+_template_uri = u'email_templates/main.txt'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(unicode(self.body()))
+        __M_writer(u'\n\n-- \n')
+        __M_writer(unicode(_("This is an automatic notification. Don't reply to this mail.")))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"32": 26, "16": 0, "23": 1, "24": 1, "25": 4, "26": 4}, "uri": "email_templates/main.txt", "filename": "/root/package/kallithea/templates/email_templates/main.txt"}
+__M_END_METADATA
+"""
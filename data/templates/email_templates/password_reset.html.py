@@ -0,0 +1,57 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253697.47145
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/email_templates/password_reset.html'
+_template_uri = 'email_templates/password_reset.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'main.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        reset_url = context.get('reset_url', UNDEFINED)
+        user = context.get('user', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n<h4>')
+        __M_writer(escape(_('Hello %s') % user))
+        __M_writer(u'</h4>\n\n<p>')
+        __M_writer(escape(_('We received a request to create a new password for your account.')))
+        __M_writer(u'</p>\n<p>')
+        __M_writer(escape(_('You can generate it by clicking following URL')))
+        __M_writer(u':</p>\n<p><a href="')
+        __M_writer(escape(reset_url))
+        __M_writer(u'">')
+        __M_writer(escape(reset_url))
+        __M_writer(u'</a></p>\n\n<p>')
+        __M_writer(escape(_("Please ignore this email if you did not request a new password .")))
+        __M_writer(u'</p>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"35": 2, "36": 4, "37": 4, "38": 6, "39": 6, "40": 7, "41": 7, "42": 8, "43": 8, "44": 8, "45": 8, "46": 10, "47": 10, "53": 47, "27": 0}, "uri": "email_templates/password_reset.html", "filename": "/root/package/kallithea/templates/email_templates/password_reset.html"}
+__M_END_METADATA
+"""
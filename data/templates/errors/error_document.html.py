@@ -0,0 +1,49 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253609.952878
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/errors/error_document.html'
+_template_uri = '/errors/error_document.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<!DOCTYPE html>\n<html xmlns="http://www.w3.org/1999/xhtml">\n    <head>\n        <title>Error - ')
+        __M_writer(escape(c.error_message))
+        __M_writer(u'</title>\n        <meta http-equiv="Content-Type" content="text/html;charset=utf-8" />\n        <meta name="robots" content="index, nofollow"/>\n        <link rel="icon" href="')
+        __M_writer(escape(h.url('/images/favicon.ico')))
+        __M_writer(u'" type="image/png" />\n\n        <meta http-equiv="Content-Type" content="text/html;charset=utf-8" />\n\n        <!-- stylesheets -->\n        <link rel="stylesheet" type="text/css" href="')
+        __M_writer(escape(h.url('/css/style.css')))
+        __M_writer(u'" media="screen"/>\n        <link rel="stylesheet" type="text/css" href="')
+        __M_writer(escape(h.url('/css/contextbar.css')))
+        __M_writer(u'" media="screen"/>\n        <style type="text/css">\n         #main_div{\n           border: 0px solid #000;\n           width: 500px;\n           margin: auto;\n           text-align: center;\n           margin-top: 200px;\n           font-size: 1.6em;\n         }\n         .error_message{\n            text-align: center;\n            color:#577632;\n            font-size: 1.6em;\n            margin:10px;\n         }\n        </style>\n\n    </head>\n    <body>\n        ')
+        runtime._include_file(context, u'/base/flash_msg.html', _template_uri)
+        __M_writer(u'\n        <div id="login">\n            <div class="table">\n                <div id="main_div">\n                    <div style="font-size:2.0em;margin: 10px">')
+        __M_writer(escape(c.site_name))
+        __M_writer(u'</div>\n                    <h1 class="error_message">')
+        __M_writer(escape(c.error_message))
+        __M_writer(u'</h1>\n\n                    <p>')
+        __M_writer(escape(c.error_explanation))
+        __M_writer(u'</p>\n\n                </div>\n            </div>\n        </div>\n    </body>\n\n</html>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"32": 34, "33": 34, "34": 38, "35": 38, "36": 39, "37": 39, "38": 41, "39": 41, "45": 39, "16": 0, "23": 2, "24": 5, "25": 5, "26": 8, "27": 8, "28": 13, "29": 13, "30": 14, "31": 14}, "uri": "/errors/error_document.html", "filename": "/root/package/kallithea/templates/errors/error_document.html"}
+__M_END_METADATA
+"""
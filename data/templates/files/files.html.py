@@ -0,0 +1,182 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253665.953211
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/files/files.html'
+_template_uri = 'files/files.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        hasattr = context.get('hasattr', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('files', c.revision)))
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n        <ul class="links">\n            <li style="color:white">\n              ')
+        __M_writer(escape(_("Branch filter:")))
+        __M_writer(u' ')
+        __M_writer(escape(h.select('branch_selector',c.changeset.raw_id,c.revision_options)))
+        __M_writer(u'\n            </li>\n        </ul>\n    </div>\n    <div class="table">\n        <div id="files_data">\n            ')
+        runtime._include_file(context, u'files_ypjax.html', _template_uri)
+        __M_writer(u'\n        </div>\n    </div>\n</div>\n\n<script type="text/javascript">\nvar CACHE = {};\nvar CACHE_EXPIRE = 5*60*1000; //cache for 5*60s\n//used to construct links from the search list\nvar url_base = \'')
+        __M_writer(escape(h.url("files_home",repo_name=c.repo_name,revision='__REV__',f_path='__FPATH__')))
+        __M_writer(u"';\n//send the nodelist request to this url\nvar node_list_url = '")
+        __M_writer(escape(h.url("files_nodelist_home",repo_name=c.repo_name,revision='__REV__',f_path='__FPATH__')))
+        __M_writer(u"';\n// send the node history requst to this url\nvar node_history_url = '")
+        __M_writer(escape(h.url("files_history_home",repo_name=c.repo_name,revision='__REV__',f_path='__FPATH__')))
+        __M_writer(u"';\n\n")
+        __M_writer(u'pyroutes.register(\'files_nodelist_home\', "')
+        __M_writer(escape(h.url('files_nodelist_home', repo_name=c.repo_name,revision='%(revision)s',f_path='%(f_path)s')))
+        __M_writer(u'", [\'revision\', \'f_path\']);\npyroutes.register(\'files_history_home\', "')
+        __M_writer(escape(h.url('files_history_home', repo_name=c.repo_name,revision='%(revision)s',f_path='%(f_path)s')))
+        __M_writer(u'", [\'revision\', \'f_path\']);\npyroutes.register(\'files_authors_home\', "')
+        __M_writer(escape(h.url('files_authors_home', repo_name=c.repo_name,revision='%(revision)s',f_path='%(f_path)s')))
+        __M_writer(u'", [\'revision\', \'f_path\']);\n\nvar ypjax_links = function(){\n    $(\'.ypjax-link\').click(function(e){\n\n        //don\'t do ypjax on middle click\n        if(e.which == 2 || !History.enabled){\n            return true;\n        }\n\n        var el = e.currentTarget;\n        var url = el.href;\n\n        var _base_url = \'')
+        __M_writer(escape(h.url("files_home",repo_name=c.repo_name,revision='',f_path='')))
+        __M_writer(u'\';\n        _base_url = _base_url.replace(\'//\',\'/\')\n\n        //extract rev and the f_path from url.\n        parts = url.split(_base_url)\n        if(parts.length != 2){\n            return false;\n        }\n\n        var parts2 = parts[1].split(\'/\');\n        var rev = parts2.shift(); // pop the first element which is the revision\n        var f_path = parts2.join(\'/\');\n\n        //page title - make this consistent with title mako block above\n        var title = "')
+        __M_writer(escape(_('%s Files') % c.repo_name))
+        __M_writer(u'" + " \\u00B7 " + (f_path || \'/\') + " \\u00B7 " + "')
+        __M_writer(escape(c.site_name))
+        __M_writer(u'";\n\n        var _node_list_url = node_list_url.replace(\'__REV__\',rev).replace(\'__FPATH__\', f_path);\n        var _url_base = url_base.replace(\'__REV__\',rev);\n\n        // Change our States and save some data for handling events\n        var data = {url:url,title:title, url_base:_url_base,\n                    node_list_url:_node_list_url, rev:rev, f_path:f_path};\n        History.pushState(data, title, url);\n\n        //now we\'re sure that we can do ypjax things\n        e.preventDefault();\n        return false;\n    });\n}\n\n// callbacks needed to process the ypjax filebrowser\nvar callbacks = function(State){\n    ypjax_links();\n    tooltip_activate();\n\n    if(State !== undefined){\n        //inistially loaded stuff\n        var _f_path = State.data.f_path;\n        var _rev = State.data.rev;\n\n        fileBrowserListeners(State.url, State.data.node_list_url, State.data.url_base);\n        // Inform Google Analytics of the change\n        if ( typeof window.pageTracker !== \'undefined\' ) {\n            window.pageTracker._trackPageview(State.url);\n        }\n    }\n\n    function highlight_lines(lines){\n        for(pos in lines){\n          $(\'#L\'+lines[pos]).css(\'background-color\',\'#FFFFBE\');\n        }\n    }\n    page_highlights = location.href.substring(location.href.indexOf(\'#\')+1).split(\'L\');\n    if (page_highlights.length == 2){\n       highlight_ranges  = page_highlights[1].split(",");\n\n       var h_lines = [];\n       for (pos in highlight_ranges){\n            var _range = highlight_ranges[pos].split(\'-\');\n            if(_range.length == 2){\n                var start = parseInt(_range[0]);\n                var end = parseInt(_range[1]);\n                if (start < end){\n                    for(var i=start;i<=end;i++){\n                        h_lines.push(i);\n                    }\n                }\n            }\n            else{\n                h_lines.push(parseInt(highlight_ranges[pos]));\n            }\n      }\n      highlight_lines(h_lines);\n      $(\'#L\'+h_lines[0]).each(function(){\n          this.scrollIntoView();\n      });\n    }\n\n    // select code link event\n    $(\'#hlcode\').mouseup(getSelectionLink);\n\n    // history select field\n    var cache = {}\n    $("#diff1").select2({\n        placeholder: _TM[\'Select changeset\'],\n        dropdownAutoWidth: true,\n        query: function(query){\n          var key = \'cache\';\n          var cached = cache[key] ;\n          if(cached) {\n            var data = {results: []};\n            //filter results\n            $.each(cached.results, function(){\n                var section = this.text;\n                var children = [];\n                $.each(this.children, function(){\n                    if(query.term.length == 0 || this.text.toUpperCase().indexOf(query.term.toUpperCase()) >= 0 ){\n                        children.push({\'id\': this.id, \'text\': this.text})\n                    }\n                })\n                data.results.push({\'text\': section, \'children\': children})\n            });\n            query.callback(data);\n          }else{\n              $.ajax({\n                url: pyroutes.url(\'files_history_home\', {\'revision\': _rev, \'f_path\': _f_path}),\n                data: {},\n                dataType: \'json\',\n                type: \'GET\',\n                success: function(data) {\n                  cache[key] = data;\n                  query.callback({results: data.results});\n                }\n              })\n          }\n        }\n    });\n    $(\'#show_authors\').on(\'click\', function(){\n        $.ajax({\n            url: pyroutes.url(\'files_authors_home\', {\'revision\': _rev, \'f_path\': _f_path}),\n            success: function(data) {\n                $(\'#file_authors\').html(data);\n                $(\'#file_authors\').show();\n                tooltip_activate()\n            }\n        })\n    })\n}\n\n$(document).ready(function(){\n    ypjax_links();\n    var $files_data = $(\'#files_data\');\n    //Bind to StateChange Event\n    History.Adapter.bind(window,\'statechange\',function(){\n        var State = History.getState();\n        cache_key = State.url;\n        //check if we have this request in cache maybe ?\n        var _cache_obj = CACHE[cache_key];\n        var _cur_time = new Date().getTime();\n        // get from cache if it\'s there and not yet expired !\n        if(_cache_obj !== undefined && _cache_obj[0] > _cur_time){\n            $files_data.html(_cache_obj[1]);\n            $files_data.css(\'opacity\',\'1.0\');\n            //callbacks after ypjax call\n            callbacks(State);\n        }\n        else{\n            asynchtml(State.url, $files_data, function(){\n                    callbacks(State);\n                    var expire_on = new Date().getTime() + CACHE_EXPIRE;\n                    CACHE[cache_key] = [expire_on, $files_data.html()];\n                });\n        }\n    });\n\n    // init the search filter\n    var _State = {\n       url: "')
+        __M_writer(escape(h.url.current()))
+        __M_writer(u'",\n       data: {\n         node_list_url: node_list_url.replace(\'__REV__\',"')
+        __M_writer(escape(c.changeset.raw_id))
+        __M_writer(u'").replace(\'__FPATH__\', "')
+        __M_writer(escape(h.safe_unicode(c.file.path)))
+        __M_writer(u'"),\n         url_base: url_base.replace(\'__REV__\',"')
+        __M_writer(escape(c.changeset.raw_id))
+        __M_writer(u'"),\n         rev:"')
+        __M_writer(escape(c.changeset.raw_id))
+        __M_writer(u'",\n         f_path: "')
+        __M_writer(escape(h.safe_unicode(c.file.path)))
+        __M_writer(u'"\n       }\n    }\n    fileBrowserListeners(_State.url, _State.data.node_list_url, _State.data.url_base);\n\n    // change branch filter\n    $("#branch_selector").select2({\n        dropdownAutoWidth: true,\n        minimumInputLength: 1\n        });\n\n    $("#branch_selector").change(function(e){\n        var selected = e.currentTarget.options[e.currentTarget.selectedIndex].value;\n        if(selected && selected != "')
+        __M_writer(escape(c.changeset.raw_id))
+        __M_writer(u'"){\n            window.location = pyroutes.url(\'files_home\', {\'repo_name\': "')
+        __M_writer(escape(h.safe_unicode(c.repo_name)))
+        __M_writer(u'", \'revision\': selected, \'f_path\': "')
+        __M_writer(escape(h.safe_unicode(c.file.path)))
+        __M_writer(u'"});\n            $("#browserblock").hide();\n        } else {\n            $("#branch_selector").val("')
+        __M_writer(escape(c.changeset.raw_id))
+        __M_writer(u'");\n        }\n    });\n\n});\n\n</script>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Files')))
+        __M_writer(u'\n')
+        if c.file:
+            __M_writer(u'        @ ')
+            __M_writer(escape(h.show_id(c.changeset)))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        hasattr = context.get('hasattr', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s Files') % c.repo_name))
+        __M_writer(u'\n')
+        if hasattr(c,'file'):
+            __M_writer(u'        &middot; ')
+            __M_writer(escape(h.safe_unicode(c.file.path) or '/'))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 242, "129": 242, "130": 245, "131": 245, "137": 10, "144": 10, "145": 11, "146": 11, "147": 12, "148": 13, "149": 13, "150": 13, "27": 0, "156": 3, "166": 3, "167": 4, "168": 4, "41": 1, "170": 6, "171": 6, "172": 6, "46": 8, "47": 15, "178": 172, "52": 19, "53": 253, "59": 17, "169": 5, "66": 17, "67": 18, "68": 18, "74": 21, "82": 21, "83": 22, "84": 22, "85": 26, "86": 26, "87": 29, "88": 29, "89": 29, "90": 29, "91": 35, "92": 35, "93": 44, "94": 44, "95": 46, "96": 46, "97": 48, "98": 48, "99": 51, "100": 51, "101": 51, "102": 52, "103": 52, "104": 53, "105": 53, "106": 66, "107": 66, "108": 80, "109": 80, "110": 80, "111": 80, "112": 223, "113": 223, "114": 225, "115": 225, "116": 225, "117": 225, "118": 226, "119": 226, "120": 227, "121": 227, "122": 228, "123": 228, "124": 241, "125": 241, "126": 242, "127": 242}, "uri": "files/files.html", "filename": "/root/package/kallithea/templates/files/files.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,212 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253659.784792
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/files/files_add.html'
+_template_uri = 'files/files_add.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', u'css_extra', u'title', 'breadcrumbs_links', u'js_extra', 'main']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        def css_extra():
+            return render_css_extra(context._locals(__M_locals))
+        def title():
+            return render_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        def js_extra():
+            return render_js_extra(context._locals(__M_locals))
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'js_extra'):
+            context['self'].js_extra(**pageargs)
+        
+
+        __M_writer(u'\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'css_extra'):
+            context['self'].css_extra(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_css_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        def css_extra():
+            return render_css_extra(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <link rel="stylesheet" type="text/css" href="')
+        __M_writer(escape(h.url('/codemirror/lib/codemirror.css')))
+        __M_writer(u'"/>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s Files Add') % c.repo_name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Add New File')))
+        __M_writer(u' @ ')
+        __M_writer(escape(h.show_id(c.cs)))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_js_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        def js_extra():
+            return render_js_extra(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/codemirror/lib/codemirror.js')))
+        __M_writer(u'"></script>\n  <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/codemirror_loadmode.js')))
+        __M_writer(u'"></script>\n  <script type="text/javascript" src="')
+        __M_writer(escape(h.url('/codemirror/mode/meta.js')))
+        __M_writer(u'"></script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('files')))
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n        <ul class="links">\n            <li>\n              <span><a href="#">')
+        __M_writer(escape(_('Branch')))
+        __M_writer(u': ')
+        __M_writer(escape(c.cs.branch))
+        __M_writer(u'</a></span>\n            </li>\n        </ul>\n    </div>\n    <div class="table" id="edit">\n        <div id="files_data">\n          ')
+        __M_writer(escape(h.form(h.url.current(),method='post',id='eform',enctype="multipart/form-data", class_="form-horizontal")))
+        __M_writer(u'\n          <h3 class="files_location">\n            ')
+        __M_writer(escape(_('Location')))
+        __M_writer(u': ')
+        __M_writer(escape(h.files_breadcrumbs(c.repo_name,c.cs.raw_id,c.f_path)))
+        __M_writer(u' /\n              <span id="filename_container" class="file reviewer_ac">\n                  <input class="input-small" type="text" value="" size="30" name="filename" id="filename" placeholder="')
+        __M_writer(escape(_('Enter filename...')))
+        __M_writer(u'">\n                  <input type="hidden" value="')
+        __M_writer(escape(c.f_path))
+        __M_writer(u'" size="30" name="location" id="location">\n                  ')
+        __M_writer(escape(_('or')))
+        __M_writer(u' <div class="btn btn-small" id="upload_file_enable">')
+        __M_writer(escape(_('Upload File')))
+        __M_writer(u'</div>\n              </span>\n              <span id="upload_file_container" class="reviewer_ac" style="display:none">\n                  <input type="file"  size="20" name="upload_file" id="upload_file">\n                  ')
+        __M_writer(escape(_('or')))
+        __M_writer(u' <div class="btn btn-small" id="file_enable">')
+        __M_writer(escape(_('Create New File')))
+        __M_writer(u'</div>\n              </span>\n          </h3>\n            <div id="body" class="codeblock">\n            <div class="code-header" id="set_mode_header">\n                <label class="commit" for="set_mode">')
+        __M_writer(escape(_('New file mode')))
+        __M_writer(u'</label>\n                <select id="set_mode" name="set_mode"/>\n            </div>\n                <div id="editor_container">\n                    <pre id="editor_pre"></pre>\n                    <textarea id="editor" name="content" style="display:none"></textarea>\n                </div>\n                <div style="padding: 10px;color:#666666">')
+        __M_writer(escape(_('Commit Message')))
+        __M_writer(u'</div>\n                <textarea id="commit" name="message" style="height: 100px;width: 99%;margin-left:4px" placeholder="')
+        __M_writer(escape(c.default_message))
+        __M_writer(u'"></textarea>\n            </div>\n            <div style="text-align: left;padding-top: 5px">\n            ')
+        __M_writer(escape(h.submit('commit',_('Commit Changes'),class_="btn btn-small btn-success")))
+        __M_writer(u'\n            ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn btn-small")))
+        __M_writer(u'\n            </div>\n            ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n            <script type="text/javascript">\n            var reset_url = "')
+        __M_writer(escape(h.url('files_home',repo_name=c.repo_name,revision=c.cs.raw_id,f_path=c.f_path)))
+        __M_writer(u'";\n            var myCodeMirror = initCodeMirror(\'editor\',reset_url);\n\n            //inject new modes, based on codeMirrors modeInfo object\n            $(\'#set_mode\').each(function(){\n                var modes_select = this;\n                var index = 1;\n                for(var i=0;i<CodeMirror.modeInfo.length;i++){\n                    var m = CodeMirror.modeInfo[i];\n                    var opt = new Option(m.name, m.mime);\n                    $(opt).attr(\'mode\', m.mode);\n                    if (m.mime == \'text/plain\') {\n                        // default plain text\n                        $(opt).attr(\'selected\', \'selected\');\n                        modes_select.options[0] = opt;\n                    } else {\n                        modes_select.options[index++] = opt;\n                    }\n                }\n            });\n            $(\'#set_mode\').change(function(e){\n                var selected = e.currentTarget;\n                var node = selected.options[selected.selectedIndex];\n                var detected_mode = CodeMirror.findModeByMIME(node.value);\n                setCodeMirrorMode(myCodeMirror, detected_mode);\n\n                var filenameInput = $(\'#filename\');\n                var proposed_ext = CodeMirror.findExtensionByMode(detected_mode);\n                var file_data = CodeMirror.getFilenameAndExt(filenameInput.val());\n                var filename = file_data[\'filename\'] || \'filename1\';\n                filenameInput.val(filename + \'.\' + proposed_ext);\n            });\n\n            // on type the new filename set mode\n            $(\'#filename\').keyup(function(e){\n                var file_data = CodeMirror.getFilenameAndExt(this.value);\n                if(file_data[\'ext\'] != null){\n                    var detected_mode = CodeMirror.findModeByExtension(file_data[\'ext\']) || CodeMirror.findModeByMIME(\'text/plain\');\n                    if (detected_mode){\n                        setCodeMirrorMode(myCodeMirror, detected_mode);\n                        $(\'#set_mode\').val(detected_mode.mime);\n                    }\n                }\n            });\n            </script>\n        </div>\n    </div>\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 21, "129": 21, "201": 69, "135": 7, "172": 38, "192": 60, "194": 61, "142": 7, "143": 8, "144": 8, "145": 9, "146": 9, "147": 10, "148": 10, "154": 24, "27": 0, "197": 65, "162": 24, "163": 25, "164": 25, "165": 29, "166": 29, "167": 32, "168": 32, "169": 32, "170": 32, "171": 38, "44": 1, "173": 40, "174": 40, "175": 40, "176": 40, "49": 5, "178": 42, "179": 43, "180": 43, "181": 44, "54": 11, "183": 44, "184": 44, "185": 48, "186": 48, "59": 14, "188": 48, "189": 53, "190": 53, "191": 60, "64": 18, "65": 22, "66": 117, "195": 64, "196": 64, "182": 44, "198": 65, "199": 67, "72": 16, "177": 42, "202": 69, "79": 16, "80": 17, "81": 17, "193": 61, "87": 12, "94": 12, "95": 13, "96": 13, "208": 202, "187": 48, "102": 3, "110": 3, "111": 4, "112": 4, "118": 20, "200": 67, "125": 20, "126": 21, "127": 21}, "uri": "files/files_add.html", "filename": "/root/package/kallithea/templates/files/files_add.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,198 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253667.951395
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/files/files_browser.html'
+_template_uri = u'files/files_browser.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = ['file_name', 'file_url', 'file_class']
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        c = context.get('c', UNDEFINED)
+        def file_class(node):
+            return render_file_class(context._locals(__M_locals),node)
+        def file_name(node):
+            return render_file_name(context._locals(__M_locals),node)
+        def file_url(node,c):
+            return render_file_url(context._locals(__M_locals),node,c)
+        request = context.get('request', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        __M_writer(u'\n<div id="body" class="browserblock">\n    <div class="browser-header">\n        <div class="browser-nav">\n            ')
+        __M_writer(escape(h.form(h.url.current())))
+        __M_writer(u'\n            <div class="info_box">\n              <div class="info_box_elem rev">')
+        __M_writer(escape(_('revision')))
+        __M_writer(u'</div>\n              <div class="info_box_elem"><a class="btn btn-mini ypjax-link" href="')
+        __M_writer(escape(c.url_prev))
+        __M_writer(u'" title="')
+        __M_writer(escape(_('Previous revision')))
+        __M_writer(u'"><i class="icon-left-open"></i></a></div>\n              <div class="info_box_elem">')
+        __M_writer(escape(h.text('at_rev',value=c.changeset.revision,size=5)))
+        __M_writer(u'</div>\n              <div class="info_box_elem"><a class="btn btn-mini ypjax-link" href="')
+        __M_writer(escape(c.url_next))
+        __M_writer(u'" title="')
+        __M_writer(escape(_('Next revision')))
+        __M_writer(u'"><i class="icon-right-open"></i></a></div>\n            </div>\n            ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n        </div>\n        <div class="browser-branch">\n           ')
+        __M_writer(escape(h.checkbox('stay_at_branch',c.changeset.branch,c.changeset.branch==c.branch)))
+        __M_writer(u'\n           <label>')
+        __M_writer(escape(_('Follow current branch')))
+        __M_writer(u'</label>\n        </div>\n        <div id="search_activate_id" class="search_activate">\n           <a class="btn btn-mini" id="filter_activate" href="#">')
+        __M_writer(escape(_('Search File List')))
+        __M_writer(u'</a>\n        </div>\n        <div class="browser-search">\n            <div>\n                <div id="node_filter_box_loading" style="display:none">')
+        __M_writer(escape(_('Loading file list...')))
+        __M_writer(u'</div>\n                <div id="node_filter_box" style="display:none">\n                ')
+        __M_writer(escape(h.files_breadcrumbs(c.repo_name,c.changeset.raw_id,c.file.path)))
+        __M_writer(u'/<input class="init" type="text" value="type to search..." name="filter" size="25" id="node_filter" autocomplete="off">\n                </div>\n            </div>\n        </div>\n    </div>\n\n    <div class="browser-body">\n        <table class="code-browser">\n            <thead>\n                <tr>\n                    <th>')
+        __M_writer(escape(_('Name')))
+        __M_writer(u'</th>\n                    <th>')
+        __M_writer(escape(_('Size')))
+        __M_writer(u'</th>\n                    <th>')
+        __M_writer(escape(_('Mimetype')))
+        __M_writer(u'</th>\n                    <th>')
+        __M_writer(escape(_('Last Revision')))
+        __M_writer(u'</th>\n                    <th>')
+        __M_writer(escape(_('Last Modified')))
+        __M_writer(u'</th>\n                    <th>')
+        __M_writer(escape(_('Last Committer')))
+        __M_writer(u'</th>\n                </tr>\n            </thead>\n\n            <tbody id="tbody">\n')
+        if c.file.parent:
+            __M_writer(u'                <tr class="parity0">\n                    <td>\n                        ')
+            __M_writer(escape(h.link_to(h.literal('<i class="icon-folder-open"></i><span>..</span>'),h.url('files_home',repo_name=c.repo_name,revision=c.changeset.raw_id,f_path=c.file.parent.path),class_="browser-dir ypjax-link")))
+            __M_writer(u'\n                    </td>\n                    <td></td>\n                    <td></td>\n                    <td></td>\n                    <td></td>\n                    <td></td>\n                </tr>\n')
+        __M_writer(u'\n')
+        for cnt,node in enumerate(c.file):
+            __M_writer(u'                <tr class="parity')
+            __M_writer(escape(cnt%2))
+            __M_writer(u'">\n                     <td>\n                         ')
+            __M_writer(escape(h.link_to(file_name(node),file_url(node,c),class_=file_class(node)+" ypjax-link")))
+            __M_writer(u'\n                     </td>\n                     <td>\n')
+            if node.is_file():
+                __M_writer(u'                         ')
+                __M_writer(escape(h.format_byte_size(node.size,binary=True)))
+                __M_writer(u'\n')
+            __M_writer(u'                     </td>\n                     <td>\n')
+            if node.is_file():
+                __M_writer(u'                          ')
+                __M_writer(escape(node.mimetype))
+                __M_writer(u'\n')
+            __M_writer(u'                     </td>\n                     <td>\n')
+            if node.is_file():
+                __M_writer(u'                             <a title="')
+                __M_writer(escape(h.tooltip(node.last_changeset.message)))
+                __M_writer(u'" href="')
+                __M_writer(escape(h.url('changeset_home',repo_name=c.repo_name,revision=node.last_changeset)))
+                __M_writer(u'" class="tooltip revision-link">')
+                __M_writer(escape(h.show_id(node.last_changeset)))
+                __M_writer(u'</a>\n')
+            __M_writer(u'                     </td>\n                     <td>\n')
+            if node.is_file():
+                __M_writer(u'                             <span class="tooltip" title="')
+                __M_writer(escape(h.tooltip(h.fmt_date(node.last_changeset.date))))
+                __M_writer(u'">\n                            ')
+                __M_writer(escape(h.age(node.last_changeset.date)))
+                __M_writer(u'</span>\n')
+            __M_writer(u'                     </td>\n                     <td>\n')
+            if node.is_file():
+                __M_writer(u'                             <span title="')
+                __M_writer(escape(node.last_changeset.author))
+                __M_writer(u'">\n                            ')
+                __M_writer(escape(h.person(node.last_changeset.author)))
+                __M_writer(u'\n                            </span>\n')
+            __M_writer(u'                     </td>\n                </tr>\n')
+        __M_writer(u'            </tbody>\n            <tbody id="tbody_filtered" style="display:none">\n            </tbody>\n        </table>\n    </div>\n</div>\n\n<script>\n    $(document).ready(function(){\n        // init node filter if we pass GET param ?search=1\n        var search_GET = "')
+        __M_writer(escape(request.GET.get('search','')))
+        __M_writer(u'";\n        if(search_GET == "1"){\n            $("#filter_activate").click();\n        }\n    })\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_file_name(context,node):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+
+        c = "icon-folder-open"
+        if node.is_file():
+            c = "icon-doc"
+        elif node.is_submodule():
+            c = "icon-file-submodule"
+            
+        
+        __M_writer(u'\n    ')
+        return h.literal('<i class="%s"></i><span>%s</span>' % (c, h.escape(node.name)))
+        
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_file_url(context,node,c):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if node.is_submodule():
+            __M_writer(u'        ')
+            return node.url or '#'
+            
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'        ')
+            return h.url('files_home', repo_name=c.repo_name, revision=c.changeset.raw_id, f_path=h.safe_unicode(node.path))
+            
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_file_class(context,node):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if node.is_file():
+            __M_writer(u'        ')
+            return "browser-file" 
+            
+            __M_writer(u'\n')
+        elif node.is_submodule():
+            __M_writer(u'        ')
+            return "submodule-dir"
+            
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'        ')
+            return "browser-dir"
+            
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "32": 9, "33": 16, "34": 26, "35": 30, "36": 30, "37": 32, "38": 32, "39": 33, "40": 33, "41": 33, "42": 33, "43": 34, "44": 34, "45": 35, "46": 35, "47": 35, "48": 35, "49": 37, "50": 37, "51": 40, "52": 40, "53": 41, "54": 41, "55": 44, "56": 44, "57": 48, "58": 48, "59": 50, "60": 50, "61": 60, "62": 60, "63": 61, "64": 61, "65": 62, "66": 62, "67": 63, "68": 63, "69": 64, "70": 64, "71": 65, "72": 65, "73": 70, "74": 71, "75": 73, "76": 73, "77": 82, "78": 83, "79": 84, "80": 84, "81": 84, "82": 86, "83": 86, "84": 89, "85": 90, "86": 90, "87": 90, "88": 92, "89": 94, "90": 95, "91": 95, "92": 95, "93": 97, "94": 99, "95": 100, "96": 100, "97": 100, "98": 100, "99": 100, "100": 100, "101": 100, "102": 102, "103": 104, "104": 105, "105": 105, "106": 105, "107": 106, "108": 106, "109": 108, "110": 110, "111": 111, "112": 111, "113": 111, "114": 112, "115": 112, "116": 115, "117": 118, "118": 128, "119": 128, "125": 17, "130": 17, "131": 18, "139": 24, "140": 25, "142": 25, "148": 10, "153": 10, "154": 11, "155": 12, "156": 12, "158": 12, "159": 13, "160": 14, "161": 14, "163": 14, "169": 1, "173": 1, "174": 2, "175": 3, "176": 3, "178": 3, "179": 4, "180": 5, "181": 5, "183": 5, "184": 6, "185": 7, "186": 7, "188": 7, "194": 188}, "uri": "files/files_browser.html", "filename": "/root/package/kallithea/templates/files/files_browser.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,44 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253667.077455
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/files/files_history_box.html'
+_template_uri = 'files/files_history_box.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        ungettext = context.get('ungettext', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<div class="file_author" style="clear:both">\n    <div class="item">')
+        __M_writer(escape(h.literal(ungettext(u'%s author',u'%s authors',len(c.authors)) % ('<b>%s</b>' % len(c.authors))) ))
+        __M_writer(u'</div>\n')
+        for email, user in c.authors:
+            __M_writer(u'      <div class="contributor tooltip" style="float:left" title="')
+            __M_writer(escape(h.tooltip(user)))
+            __M_writer(u'">\n        <div class="gravatar" style="margin:1px">\n          ')
+            __M_writer(escape(h.gravatar(email, size=20)))
+            __M_writer(u'\n        </div>\n      </div>\n')
+        __M_writer(u'</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"32": 6, "33": 6, "34": 10, "40": 34, "16": 0, "25": 1, "26": 2, "27": 2, "28": 3, "29": 4, "30": 4, "31": 4}, "uri": "files/files_history_box.html", "filename": "/root/package/kallithea/templates/files/files_history_box.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,139 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253665.985143
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/files/files_source.html'
+_template_uri = u'files/files_source.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'<div id="node_history" style="padding: 0px 0px 10px 0px">\n    <div>\n        <div style="float:left">\n        ')
+        __M_writer(escape(h.form(h.url('files_diff_home',repo_name=c.repo_name,f_path=c.f_path),method='get')))
+        __M_writer(u'\n        ')
+        __M_writer(escape(h.hidden('diff2',c.file_changeset.raw_id)))
+        __M_writer(u'\n        ')
+        __M_writer(escape(h.hidden('diff1')))
+        __M_writer(u'\n        ')
+        __M_writer(escape(h.submit('diff',_('Diff to Revision'),class_="btn btn-small")))
+        __M_writer(u'\n        ')
+        __M_writer(escape(h.submit('show_rev',_('Show at Revision'),class_="btn btn-small")))
+        __M_writer(u'\n        ')
+        __M_writer(escape(h.hidden('annotate', c.annotate)))
+        __M_writer(u'\n        ')
+        __M_writer(escape(h.link_to(_('Show Full History'),h.url('changelog_file_home',repo_name=c.repo_name, revision=c.file_changeset.raw_id, f_path=c.f_path),class_="btn btn-small")))
+        __M_writer(u'\n        ')
+        __M_writer(escape(h.link_to(_('Show Authors'),'#',class_="btn btn-small" ,id="show_authors")))
+        __M_writer(u'\n\n        ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n        </div>\n        <div id="file_authors" class="file_author" style="clear:both; display: none"></div>\n    </div>\n    <div style="clear:both"></div>\n</div>\n\n\n<div id="body" class="codeblock">\n    <div class="code-header">\n        <div class="stats">\n            <div class="left img"><i class="icon-doc-inv"></i></div>\n            <div class="left item"><pre class="tooltip" title="')
+        __M_writer(escape(h.tooltip(h.fmt_date(c.file_changeset.date))))
+        __M_writer(u'">')
+        __M_writer(escape(h.link_to(h.show_id(c.file_changeset),h.url('changeset_home',repo_name=c.repo_name,revision=c.file_changeset.raw_id))))
+        __M_writer(u'</pre></div>\n            <div class="left item"><pre>')
+        __M_writer(escape(h.format_byte_size(c.file.size,binary=True)))
+        __M_writer(u'</pre></div>\n            <div class="left item last"><pre>')
+        __M_writer(escape(c.file.mimetype))
+        __M_writer(u'</pre></div>\n            <div class="buttons">\n')
+        if c.annotate:
+            __M_writer(u'                ')
+            __M_writer(escape(h.link_to(_('Show Source'),    h.url('files_home',         repo_name=c.repo_name,revision=c.file_changeset.raw_id,f_path=c.f_path),class_="btn btn-mini")))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'                ')
+            __M_writer(escape(h.link_to(_('Show Annotation'),h.url('files_annotate_home',repo_name=c.repo_name,revision=c.file_changeset.raw_id,f_path=c.f_path),class_="btn btn-mini")))
+            __M_writer(u'\n')
+        __M_writer(u'              ')
+        __M_writer(escape(h.link_to(_('Show as Raw'),h.url('files_raw_home',repo_name=c.repo_name,revision=c.file_changeset.raw_id,f_path=c.f_path),class_="btn btn-mini")))
+        __M_writer(u'\n              ')
+        __M_writer(escape(h.link_to(_('Download as Raw'),h.url('files_rawfile_home',repo_name=c.repo_name,revision=c.file_changeset.raw_id,f_path=c.f_path),class_="btn btn-mini")))
+        __M_writer(u'\n')
+        if h.HasRepoPermissionAny('repository.write','repository.admin')(c.repo_name):
+            if c.on_branch_head and c.changeset.branch and not c.file.is_binary:
+                __M_writer(u'                ')
+                __M_writer(escape(h.link_to(_('Edit on Branch:%s') % c.changeset.branch, h.url('files_edit_home',repo_name=c.repo_name,revision=c.changeset.branch,f_path=c.f_path, anchor='edit'),class_="btn btn-mini")))
+                __M_writer(u'\n                ')
+                __M_writer(escape(h.link_to(_('Delete'), h.url('files_delete_home',repo_name=c.repo_name,revision=c.changeset.branch,f_path=c.f_path, anchor='edit'),class_="btn btn-mini btn-danger")))
+                __M_writer(u'\n')
+            elif c.on_branch_head and c.changeset.branch and c.file.is_binary:
+                __M_writer(u'                ')
+                __M_writer(escape(h.link_to(_('Edit'), '#', class_="btn btn-mini disabled tooltip", title=_('Editing binary files not allowed'))))
+                __M_writer(u'\n                ')
+                __M_writer(escape(h.link_to(_('Delete'), h.url('files_delete_home',repo_name=c.repo_name,revision=c.changeset.branch,f_path=c.f_path, anchor='edit'),class_="btn btn-mini btn-danger")))
+                __M_writer(u'\n')
+            else:
+                __M_writer(u'                ')
+                __M_writer(escape(h.link_to(_('Edit'), '#', class_="btn btn-mini disabled tooltip", title=_('Editing files allowed only when on branch head revision'))))
+                __M_writer(u'\n                ')
+                __M_writer(escape(h.link_to(_('Delete'), '#', class_="btn btn-mini btn-danger disabled tooltip", title=_('Deleting files allowed only when on branch head revision'))))
+                __M_writer(u'\n')
+        __M_writer(u'            </div>\n        </div>\n        <div class="author">\n            <div class="gravatar">\n                ')
+        __M_writer(escape(h.gravatar(h.email_or_none(c.file_changeset.author), size=16)))
+        __M_writer(u'\n            </div>\n            <div title="')
+        __M_writer(escape(c.file_changeset.author))
+        __M_writer(u'" class="user">')
+        __M_writer(escape(h.person(c.file_changeset.author)))
+        __M_writer(u'</div>\n        </div>\n        <div class="commit">')
+        __M_writer(escape(h.urlify_commit(c.file_changeset.message,c.repo_name)))
+        __M_writer(u'</div>\n    </div>\n    <div class="code-body">\n')
+        if c.file.is_browser_compatible_image():
+            __M_writer(u'        <img src="')
+            __M_writer(escape(h.url('files_raw_home',repo_name=c.repo_name,revision=c.file_changeset.raw_id,f_path=c.f_path)))
+            __M_writer(u'" class="img-preview"/>\n')
+        elif c.file.is_binary:
+            __M_writer(u'        <div style="padding:5px">\n          ')
+            __M_writer(escape(_('Binary file (%s)') % c.file.mimetype))
+            __M_writer(u'\n        </div>\n')
+        else:
+            if c.file.size < c.cut_off_limit:
+                if c.annotate:
+                    __M_writer(u'              ')
+                    __M_writer(escape(h.pygmentize_annotation(c.repo_name,c.file,linenos=True,anchorlinenos=True,lineanchors='L',cssclass="code-highlight")))
+                    __M_writer(u'\n')
+                else:
+                    __M_writer(u'              ')
+                    __M_writer(escape(h.pygmentize(c.file,linenos=True,anchorlinenos=True,lineanchors='L',cssclass="code-highlight")))
+                    __M_writer(u'\n')
+            else:
+                __M_writer(u'            ')
+                __M_writer(escape(_('File is too big to display')))
+                __M_writer(u' ')
+                __M_writer(escape(h.link_to(_('Show as raw'),
+            h.url('files_raw_home',repo_name=c.repo_name,revision=c.file_changeset.raw_id,f_path=c.f_path))))
+                __M_writer(u'\n')
+        __M_writer(u'    </div>\n</div>\n\n<script>\n    $(document).ready(function(){\n        // fake html5 history state\n        var _State = {\n           url: "')
+        __M_writer(escape(h.url.current()))
+        __M_writer(u'",\n           data: {\n             node_list_url: node_list_url.replace(\'__REV__\',"')
+        __M_writer(escape(c.changeset.raw_id))
+        __M_writer(u'").replace(\'__FPATH__\', "')
+        __M_writer(escape(h.safe_unicode(c.file.path)))
+        __M_writer(u'"),\n             url_base: url_base.replace(\'__REV__\',"')
+        __M_writer(escape(c.changeset.raw_id))
+        __M_writer(u'"),\n             rev:"')
+        __M_writer(escape(c.changeset.raw_id))
+        __M_writer(u'",\n             f_path: "')
+        __M_writer(escape(h.safe_unicode(c.file.path)))
+        __M_writer(u'"\n           }\n        }\n        callbacks(_State) // defined in files.html, main callbacks. Triggerd in pjax calls\n    })\n</script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "24": 1, "25": 4, "26": 4, "27": 5, "28": 5, "29": 6, "30": 6, "31": 7, "32": 7, "33": 8, "34": 8, "35": 9, "36": 9, "37": 10, "38": 10, "39": 11, "40": 11, "41": 13, "42": 13, "43": 25, "44": 25, "45": 25, "46": 25, "47": 26, "48": 26, "49": 27, "50": 27, "51": 29, "52": 30, "53": 30, "54": 30, "55": 31, "56": 32, "57": 32, "58": 32, "59": 34, "60": 34, "61": 34, "62": 35, "63": 35, "64": 36, "65": 37, "66": 38, "67": 38, "68": 38, "69": 39, "70": 39, "71": 40, "72": 41, "73": 41, "74": 41, "75": 42, "76": 42, "77": 43, "78": 44, "79": 44, "80": 44, "81": 45, "82": 45, "83": 48, "84": 52, "85": 52, "86": 54, "87": 54, "88": 54, "89": 54, "90": 56, "91": 56, "92": 59, "93": 60, "94": 60, "95": 60, "96": 61, "97": 62, "98": 63, "99": 63, "100": 65, "101": 66, "102": 67, "103": 68, "104": 68, "105": 68, "106": 69, "107": 70, "108": 70, "109": 70, "110": 72, "111": 73, "112": 73, "113": 73, "114": 73, "116": 74, "117": 77, "118": 84, "119": 84, "120": 86, "121": 86, "122": 86, "123": 86, "124": 87, "125": 87, "126": 88, "127": 88, "128": 89, "129": 89, "135": 129}, "uri": "files/files_source.html", "filename": "/root/package/kallithea/templates/files/files_source.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,67 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253665.967105
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/files/files_ypjax.html'
+_template_uri = u'files/files_ypjax.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        if c.file:
+            __M_writer(u'    <h3 class="files_location">\n        ')
+            __M_writer(escape(_('Location')))
+            __M_writer(u': ')
+            __M_writer(escape(h.files_breadcrumbs(c.repo_name,c.changeset.raw_id,c.file.path)))
+            __M_writer(u'\n')
+            if c.annotate:
+                __M_writer(u'        - ')
+                __M_writer(escape(_('annotation')))
+                __M_writer(u'\n')
+            if c.file.is_dir():
+                if h.HasRepoPermissionAny('repository.write','repository.admin')(c.repo_name):
+                    __M_writer(u'             / <span title="')
+                    __M_writer(escape(_('Add New File')))
+                    __M_writer(u'">\n               <a href="')
+                    __M_writer(escape(h.url('files_add_home',repo_name=c.repo_name,revision=c.changeset.raw_id,f_path=c.f_path, anchor='edit')))
+                    __M_writer(u'">\n                   <i class="icon-plus-circled" style="color:#5bb75b; font-size: 16px"></i></a>\n               </span>\n')
+            __M_writer(u'    </h3>\n')
+            if c.file.is_dir():
+                __M_writer(u'            ')
+                runtime._include_file(context, u'files_browser.html', _template_uri)
+                __M_writer(u'\n')
+            else:
+                __M_writer(u'            ')
+                runtime._include_file(context, u'files_source.html', _template_uri)
+                __M_writer(u'\n')
+        else:
+            __M_writer(u'    <h2>\n        <a href="#" onClick="javascript:parent.history.back();" target="main">')
+            __M_writer(escape(_('Go Back')))
+            __M_writer(u'</a>\n        ')
+            __M_writer(escape(_('No files at given path')))
+            __M_writer(u': "')
+            __M_writer(escape(c.f_path or "/"))
+            __M_writer(u'"\n    </h2>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "24": 1, "25": 2, "26": 3, "27": 3, "28": 3, "29": 3, "30": 4, "31": 5, "32": 5, "33": 5, "34": 7, "35": 8, "36": 9, "37": 9, "38": 9, "39": 10, "40": 10, "41": 15, "42": 16, "43": 17, "44": 17, "45": 17, "46": 18, "47": 19, "48": 19, "49": 19, "50": 21, "51": 22, "52": 23, "53": 23, "54": 24, "55": 24, "56": 24, "57": 24, "63": 57}, "uri": "files/files_ypjax.html", "filename": "/root/package/kallithea/templates/files/files_ypjax.html"}
+__M_END_METADATA
+"""
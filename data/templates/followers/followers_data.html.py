@@ -0,0 +1,53 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253670.317168
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/followers/followers_data.html'
+_template_uri = u'/followers/followers_data.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        for f in c.followers_pager:
+            __M_writer(u'    <div>\n        <div class="follower_user">\n            <div class="gravatar">\n              ')
+            __M_writer(escape(h.gravatar(f.user.email, size=24)))
+            __M_writer(u'\n            </div>\n            <span style="font-size: 20px"> <b>')
+            __M_writer(escape(f.user.username))
+            __M_writer(u'</b> (')
+            __M_writer(escape(f.user.name))
+            __M_writer(u' ')
+            __M_writer(escape(f.user.lastname))
+            __M_writer(u')</span>\n        </div>\n        <div style="clear:both;padding-top: 10px"></div>\n        <div class="follower_date">')
+            __M_writer(escape(_('Started following -')))
+            __M_writer(u'\n        <span class="tooltip" title="')
+            __M_writer(escape(h.tooltip(f.follows_from)))
+            __M_writer(u'"> ')
+            __M_writer(escape(h.age(f.follows_from)))
+            __M_writer(u'</span></div>\n        <div style="border-bottom: 1px solid #DDD;margin:10px 0px 10px 0px"></div>\n    </div>\n')
+        __M_writer(u'\n<div class="pagination-wh pagination-left">\n<script type="text/javascript">\n$(document).ready(function(){\n    var $followers = $(\'#followers\');\n    $followers.on(\'click\',\'.pager_link\',function(e){\n        asynchtml(e.target.href, $followers, function(){\n            show_more_event();\n            tooltip_activate();\n            show_changeset_tooltip();\n        });\n        e.preventDefault();\n    });\n});\n</script>\n')
+        __M_writer(escape(c.followers_pager.pager('$link_previous ~2~ $link_next')))
+        __M_writer(u'\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "24": 2, "25": 3, "26": 4, "27": 7, "28": 7, "29": 9, "30": 9, "31": 9, "32": 9, "33": 9, "34": 9, "35": 12, "36": 12, "37": 13, "38": 13, "39": 13, "40": 13, "41": 17, "42": 32, "43": 32, "49": 43}, "uri": "/followers/followers_data.html", "filename": "/root/package/kallithea/templates/followers/followers_data.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,68 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253671.765899
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/forks/forks_data.html'
+_template_uri = u'/forks/forks_data.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.forks_pager:
+            for f in c.forks_pager:
+                __M_writer(u'        <div>\n            <div class="fork_user">\n                <div class="gravatar">\n                  ')
+                __M_writer(escape(h.gravatar(f.user.email, size=24)))
+                __M_writer(u'\n                </div>\n                <span style="font-size: 20px">\n                 <b>')
+                __M_writer(escape(f.user.username))
+                __M_writer(u'</b> (')
+                __M_writer(escape(f.user.name))
+                __M_writer(u' ')
+                __M_writer(escape(f.user.lastname))
+                __M_writer(u') /\n                  ')
+                __M_writer(escape(h.link_to(f.repo_name,h.url('summary_home',repo_name=f.repo_name))))
+                __M_writer(u'\n                </span>\n                <div style="padding:5px 3px 3px 42px;">')
+                __M_writer(escape(f.description))
+                __M_writer(u'</div>\n            </div>\n            <div style="clear:both;padding-top: 10px"></div>\n            <div class="follower_date">')
+                __M_writer(escape(_('Forked')))
+                __M_writer(u' -\n                <span class="tooltip" title="')
+                __M_writer(escape(h.tooltip(h.fmt_date(f.created_on))))
+                __M_writer(u'"> ')
+                __M_writer(escape(h.age(f.created_on)))
+                __M_writer(u'</span>\n                <a title="')
+                __M_writer(escape(_('Compare fork with %s' % c.repo_name)))
+                __M_writer(u'"\n                   href="')
+                __M_writer(escape(h.url('compare_url',repo_name=c.repo_name, org_ref_type=c.db_repo.landing_rev[0],org_ref_name=c.db_repo.landing_rev[1],other_repo=f.repo_name,other_ref_type=c.db_repo.landing_rev[0],other_ref_name=c.db_repo.landing_rev[1], merge=1)))
+                __M_writer(u'"\n                   class="btn btn-small"><i class="icon-git-compare"></i> ')
+                __M_writer(escape(_('Compare Fork')))
+                __M_writer(u'</a>\n            </div>\n            <div style="border-bottom: 1px solid #DDD;margin:10px 0px 10px 0px"></div>\n        </div>\n')
+            __M_writer(u'  <div class="pagination-wh pagination-left">\n  <script type="text/javascript">\n  $(document).ready(function(){\n      var $forks = $(\'#forks\');\n      $forks.on(\'click\',\'.pager_link\',function(e){\n          asynchtml(e.target.href, $forks, function(){\n              show_more_event();\n              tooltip_activate();\n              show_changeset_tooltip();\n          });\n          e.preventDefault();\n      });\n  });\n  </script>\n  ')
+            __M_writer(escape(c.forks_pager.pager('$link_previous ~2~ $link_next')))
+            __M_writer(u'\n  </div>\n')
+        else:
+            __M_writer(u'    ')
+            __M_writer(escape(_('There are no forks yet')))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "24": 2, "25": 3, "26": 4, "27": 5, "28": 8, "29": 8, "30": 11, "31": 11, "32": 11, "33": 11, "34": 11, "35": 11, "36": 12, "37": 12, "38": 14, "39": 14, "40": 17, "41": 17, "42": 18, "43": 18, "44": 18, "45": 18, "46": 19, "47": 19, "48": 20, "49": 20, "50": 21, "51": 21, "52": 26, "53": 40, "54": 40, "55": 42, "56": 43, "57": 43, "58": 43, "64": 58}, "uri": "/forks/forks_data.html", "filename": "/root/package/kallithea/templates/forks/forks_data.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,162 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253605.216038
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/index_base.html'
+_template_uri = u'/index_base.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    ns = runtime.TemplateNamespace(u'dt', context._clean_inheritance_tokens(), templateuri=u'/data_table/_dt_elements.html', callables=None,  calling_uri=_template_uri)
+    context.namespaces[(__name__, u'dt')] = ns
+
+def render_body(context,parent,group_name='',**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs,parent=parent,group_name=group_name)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <div class="box">\n        <!-- box / title -->\n        <div class="title">\n            <h5>\n            <input class="q_filter_box" id="q_filter" size="15" type="text" name="filter" placeholder="')
+        __M_writer(escape(_('quick filter...')))
+        __M_writer(u'" value=""/> ')
+        __M_writer(escape(parent.breadcrumbs()))
+        __M_writer(u' <span id="repo_count">0</span> ')
+        __M_writer(escape(_('repositories')))
+        __M_writer(u'\n            </h5>\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'              <ul class="links">\n                <li>\n                ')
+
+            gr_name = c.group.group_name if c.group else None
+            # create repositories with write permission on group is set to true
+            create_on_write = h.HasPermissionAny('hg.create.write_on_repogroup.true')()
+            group_admin = h.HasRepoGroupPermissionAny('group.admin')(gr_name, 'can write into group index page')
+            group_write = h.HasRepoGroupPermissionAny('group.write')(gr_name, 'can write into group index page')
+                            
+            
+            __M_locals_builtin_stored = __M_locals_builtin()
+            __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['gr_name','group_admin','group_write','create_on_write'] if __M_key in __M_locals_builtin_stored]))
+            __M_writer(u'\n')
+            if h.HasPermissionAny('hg.admin','hg.create.repository')() or (group_admin or (group_write and create_on_write)):
+                if c.group:
+                    __M_writer(u'                        <a href="')
+                    __M_writer(escape(h.url('new_repo',parent_group=c.group.group_id)))
+                    __M_writer(u'" class="btn btn-small"><i class="icon-plus"></i> ')
+                    __M_writer(escape(_('Add Repository')))
+                    __M_writer(u'</a>\n')
+                    if h.HasPermissionAny('hg.admin')() or h.HasRepoGroupPermissionAny('group.admin')(c.group.group_name):
+                        __M_writer(u'                            <a href="')
+                        __M_writer(escape(h.url('new_repos_group', parent_group=c.group.group_id)))
+                        __M_writer(u'" class="btn btn-small"><i class="icon-plus"></i> ')
+                        __M_writer(escape(_(u'Add Repository Group')))
+                        __M_writer(u'</a>\n')
+                else:
+                    __M_writer(u'                    <a href="')
+                    __M_writer(escape(h.url('new_repo')))
+                    __M_writer(u'" class="btn btn-small"><i class="icon-plus"></i> ')
+                    __M_writer(escape(_('Add Repository')))
+                    __M_writer(u'</a>\n')
+                    if h.HasPermissionAny('hg.admin')():
+                        __M_writer(u'                        <a href="')
+                        __M_writer(escape(h.url('new_repos_group')))
+                        __M_writer(u'" class="btn btn-small"><i class="icon-plus"></i> ')
+                        __M_writer(escape(_(u'Add Repository Group')))
+                        __M_writer(u'</a>\n')
+            if c.group and h.HasRepoGroupPermissionAny('group.admin')(c.group.group_name):
+                __M_writer(u'                    <a href="')
+                __M_writer(escape(h.url('edit_repo_group',group_name=c.group.group_name)))
+                __M_writer(u'" title="')
+                __M_writer(escape(_('You have admin right to this group, and can edit it')))
+                __M_writer(u'" class="btn btn-small"><i class="icon-pencil"></i> ')
+                __M_writer(escape(_('Edit Repository Group')))
+                __M_writer(u'</a>\n')
+            __M_writer(u'                </li>\n              </ul>\n')
+        __M_writer(u'        </div>\n        <!-- end box / title -->\n        <div class="table">\n')
+        if c.groups:
+            __M_writer(u'            <div id=\'groups_list_wrap\' class="yui-skin-sam">\n              <table id="groups_list">\n                  <thead>\n                      <tr>\n                          <th class="left"><a href="#">')
+            __M_writer(escape(_('Group Name')))
+            __M_writer(u'</a></th>\n                          <th class="left"><a href="#">')
+            __M_writer(escape(_('Description')))
+            __M_writer(u'</a></th>\n')
+            __M_writer(u'                      </tr>\n                  </thead>\n\n')
+            for gr in c.groups:
+                __M_writer(u'                    <tr>\n                        <td>\n                            <div class="dt_repo">\n                              <a href="')
+                __M_writer(escape(url('repos_group_home',group_name=gr.group_name)))
+                __M_writer(u'">\n                                <i class="icon-folder"></i>\n                                <span class="dt_repo_name">')
+                __M_writer(escape(gr.name))
+                __M_writer(u'</span>\n                              </a>\n                            </div>\n                        </td>\n')
+                if c.visual.stylify_metatags:
+                    __M_writer(u'                            <td>')
+                    __M_writer(escape(h.urlify_text(h.desc_stylize(gr.group_description))))
+                    __M_writer(u'</td>\n')
+                else:
+                    __M_writer(u'                            <td>')
+                    __M_writer(escape(gr.group_description))
+                    __M_writer(u'</td>\n')
+                __M_writer(u'                    </tr>\n')
+            __M_writer(u'              </table>\n            </div>\n            <div id="group-user-paginator" style="padding: 0px 0px 0px 0px"></div>\n            <div style="height: 20px"></div>\n')
+        __M_writer(u'            <div id="welcome" style="display:none;text-align:center">\n                <h1><a href="')
+        __M_writer(escape(h.url('home')))
+        __M_writer(u'">')
+        __M_writer(escape(c.site_name))
+        __M_writer(u' ')
+        __M_writer(escape(c.kallithea_version))
+        __M_writer(u'</a></h1>\n            </div>\n            ')
+        cnt=0
+        
+        __M_locals_builtin_stored = __M_locals_builtin()
+        __M_locals.update(__M_dict_builtin([(__M_key, __M_locals_builtin_stored[__M_key]) for __M_key in ['cnt'] if __M_key in __M_locals_builtin_stored]))
+        __M_writer(u'\n            ')
+        __M_writer(u'\n            <div class="yui-skin-sam" id="repos_list_wrap"></div>\n            <div id="user-paginator" style="padding: 0px 0px 0px 0px"></div>\n        </div>\n    </div>\n\n      <script>\n        var data = ')
+        __M_writer(c.data)
+        __M_writer(u';\n        var myDataSource = new YAHOO.util.DataSource(data);\n        myDataSource.responseType = YAHOO.util.DataSource.TYPE_JSON;\n\n        myDataSource.responseSchema = {\n            resultsList: "records",\n            fields: [\n               {key:"menu"},\n               {key:"raw_name"},\n               {key:"name"},\n               {key:"desc"},\n               {key:"last_change"},\n               {key:"last_changeset"},\n               {key:"last_rev_raw"},\n               {key:"owner"},\n               {key:"atom"}\n            ]\n         };\n        myDataSource.doBeforeCallback = function(req,raw,res,cb) {\n            // This is the filter function\n            var data     = res.results || [],\n                filtered = [],\n                i,l;\n\n            if (req) {\n                req = req.toLowerCase();\n                for (i = 0; i<data.length; i++) {\n                    var pos = data[i].raw_name.toLowerCase().indexOf(req, ')
+        __M_writer(escape(len(group_name)))
+        __M_writer(u')\n                    if (pos != -1) {\n                        filtered.push(data[i]);\n                    }\n                }\n                res.results = filtered;\n            }\n            YUD.get(\'repo_count\').innerHTML = res.results.length;\n            return res;\n        }\n\n        // main table sorting\n        var myColumnDefs = [\n            {key:"menu",label:"",sortable:false,className:"quick_repo_menu hidden"},\n            {key:"name",label:"')
+        __M_writer(escape(_('Name')))
+        __M_writer(u'",sortable:true,\n                sortOptions: { sortFunction: nameSort }},\n            {key:"desc",label:"')
+        __M_writer(escape(_('Description')))
+        __M_writer(u'",sortable:true},\n            {key:"last_change",label:"')
+        __M_writer(escape(_('Last Change')))
+        __M_writer(u'",sortable:true,\n                sortOptions: { sortFunction: ageSort }},\n            {key:"last_changeset",label:"')
+        __M_writer(escape(_('Tip')))
+        __M_writer(u'",sortable:true,\n                sortOptions: { sortFunction: revisionSort }},\n            {key:"owner",label:"')
+        __M_writer(escape(_('Owner')))
+        __M_writer(u'",sortable:true},\n            {key:"atom",label:"",sortable:false}\n        ];\n\n        var myDataTable = new YAHOO.widget.DataTable("repos_list_wrap", myColumnDefs, myDataSource,{\n          sortedBy:{key:"name",dir:"asc"},\n          paginator: YUI_paginator(')
+        __M_writer(escape(c.visual.dashboard_items))
+        __M_writer(u',[\'user-paginator\']),\n\n          MSG_SORTASC:"')
+        __M_writer(escape(_('Click to sort ascending')))
+        __M_writer(u'",\n          MSG_SORTDESC:"')
+        __M_writer(escape(_('Click to sort descending')))
+        __M_writer(u'",\n          MSG_EMPTY:"')
+        __M_writer(escape(_('No repositories found.')))
+        __M_writer(u'",\n          MSG_ERROR:"')
+        __M_writer(escape(_('Data error.')))
+        __M_writer(u'",\n          MSG_LOADING:"')
+        __M_writer(escape(_('Loading...')))
+        __M_writer(u'"\n        }\n        );\n        myDataTable.subscribe(\'postRenderEvent\',function(oArgs) {\n            tooltip_activate();\n            quick_repo_menu();\n        });\n\n        var filterTimeout = null;\n\n        updateFilter = function () {\n            // Reset timeout\n            filterTimeout = null;\n\n            // Reset sort\n            var state = myDataTable.getState();\n            state.sortedBy = {key:\'name\', dir:YAHOO.widget.DataTable.CLASS_ASC};\n\n            // Get filtered data\n            myDataSource.sendRequest(YUD.get(\'q_filter\').value,{\n                success : myDataTable.onDataReturnInitializeTable,\n                failure : myDataTable.onDataReturnInitializeTable,\n                scope   : myDataTable,\n                argument: state\n            });\n\n        };\n        $(\'#q_filter\').click(function(){\n            if(!$(\'#q_filter\').hasClass(\'loaded\')){\n                //TODO: load here full list later to do search within groups\n                $(\'#q_filter\').addClass(\'loaded\');\n            }\n        });\n\n        $(\'#q_filter\').keyup(function(){\n            clearTimeout(filterTimeout);\n            filterTimeout = setTimeout(updateFilter,600);\n        });\n\n        if($(\'#q_filter\').val()) {\n            updateFilter();\n        }\n      </script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"23": 81, "26": 1, "36": 1, "37": 6, "38": 6, "39": 6, "40": 6, "41": 6, "42": 6, "43": 8, "44": 9, "45": 11, "55": 17, "56": 18, "57": 19, "58": 20, "59": 20, "60": 20, "61": 20, "62": 20, "63": 21, "64": 22, "65": 22, "66": 22, "67": 22, "68": 22, "69": 24, "70": 25, "71": 25, "72": 25, "73": 25, "74": 25, "75": 26, "76": 27, "77": 27, "78": 27, "79": 27, "80": 27, "81": 31, "82": 32, "83": 32, "84": 32, "85": 32, "86": 32, "87": 32, "88": 32, "89": 34, "90": 37, "91": 40, "92": 41, "93": 45, "94": 45, "95": 46, "96": 46, "97": 48, "98": 52, "99": 53, "100": 56, "101": 56, "102": 58, "103": 58, "104": 62, "105": 63, "106": 63, "107": 63, "108": 64, "109": 65, "110": 65, "111": 65, "112": 70, "113": 72, "114": 77, "115": 78, "116": 78, "117": 78, "118": 78, "119": 78, "120": 78, "121": 80, "125": 80, "126": 81, "127": 88, "128": 88, "129": 115, "130": 115, "131": 129, "132": 129, "133": 131, "134": 131, "135": 132, "136": 132, "137": 134, "138": 134, "139": 136, "140": 136, "141": 142, "142": 142, "143": 144, "144": 144, "145": 145, "146": 145, "147": 146, "148": 146, "149": 147, "150": 147, "151": 148, "152": 148, "158": 152}, "uri": "/index_base.html", "filename": "/root/package/kallithea/templates/index_base.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,221 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253681.071589
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/journal/journal.html'
+_template_uri = 'journal/journal.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'breadcrumbs', u'head_extra', 'main', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        def head_extra():
+            return render_head_extra(context._locals(__M_locals))
+        def title():
+            return render_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'head_extra'):
+            context['self'].head_extra(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('journal')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        ungettext = context.get('ungettext', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <h5>\n    <form id="filter_form">\n    <input class="q_filter_box ')
+        __M_writer(escape('' if c.search_term else 'initial'))
+        __M_writer(u'" id="j_filter" size="15" type="text" name="filter" value="')
+        __M_writer(escape(c.search_term or _('quick filter...')))
+        __M_writer(u'"/>\n    <span class="tooltip" title="')
+        __M_writer(escape(h.tooltip(h.journal_filter_help())))
+        __M_writer(u'">?</span>\n    <input type=\'submit\' value="')
+        __M_writer(escape(_('Filter')))
+        __M_writer(u'" class="btn btn-small" style="padding:0px 2px 0px 2px;margin:0px"/>\n    ')
+        __M_writer(escape(_('Journal')))
+        __M_writer(u' - ')
+        __M_writer(escape(ungettext('%s Entry', '%s Entries', c.journal_pager.item_count) % (c.journal_pager.item_count)))
+        __M_writer(u'\n    </form>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n    </h5>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_head_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        def head_extra():
+            return render_head_extra(context)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <link href="')
+        __M_writer(escape(h.url('journal_atom', api_key=c.authuser.api_key)))
+        __M_writer(u'" rel="alternate" title="')
+        __M_writer(escape(_('ATOM journal feed')))
+        __M_writer(u'" type="application/atom+xml" />\n  <link href="')
+        __M_writer(escape(h.url('journal_rss', api_key=c.authuser.api_key)))
+        __M_writer(u'" rel="alternate" title="')
+        __M_writer(escape(_('RSS journal feed')))
+        __M_writer(u'" type="application/rss+xml" />\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    <div class="box box-left">\n        <!-- box / title -->\n        <div class="title">\n         ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n         <ul class="links icon-only-links">\n           <li>\n             <span><a id="refresh" href="')
+        __M_writer(escape(h.url('journal')))
+        __M_writer(u'"><i class="icon-arrows-cw"></i></a></span>\n           </li>\n           <li>\n             <span><a href="')
+        __M_writer(escape(h.url('journal_atom', api_key=c.authuser.api_key)))
+        __M_writer(u'"><i class="icon-rss-squared"></i></a></span>\n           </li>\n         </ul>\n        </div>\n        <div id="journal">\n            ')
+        runtime._include_file(context, u'journal_data.html', _template_uri)
+        __M_writer(u'\n        </div>\n    </div>\n    <div class="box box-right">\n        <!-- box / title -->\n\n        <div class="title">\n            <h5>\n            <input class="q_filter_box" id="q_filter" size="15" type="text" name="filter" placeholder="')
+        __M_writer(escape(_('quick filter...')))
+        __M_writer(u'" value="" style="display: none"/>\n            <input class="q_filter_box" id="q_filter_watched" size="15" type="text" name="filter" placeholder="')
+        __M_writer(escape(_('quick filter...')))
+        __M_writer(u'" value="" style="display: none"/>\n            </h5>\n            <ul class="links nav nav-tabs">\n                <li class="active" id="show_watched_li">\n                    <a id="show_watched" href="#watched"><i class="icon-eye"></i> ')
+        __M_writer(escape(_('Watched')))
+        __M_writer(u'</a>\n                </li>\n                <li id="show_my_li">\n                    <a id="show_my" href="#my"><i class="icon-database"></i> ')
+        __M_writer(escape(_('My Repos')))
+        __M_writer(u'</a>\n               </li>\n            </ul>\n        </div>\n\n        <!-- end box / title -->\n        <div id="my_container" style="display:none">\n            <div class="table-grid table yui-skin-sam" id="repos_list_wrap"></div>\n            <div id="user-paginator" style="padding: 0px 0px 0px 20px"></div>\n        </div>\n\n        <div id="watched_container">\n            <div class="table-grid table yui-skin-sam" id="watched_repos_list_wrap"></div>\n            <div id="watched-user-paginator" style="padding: 0px 0px 0px 20px"></div>\n        </div>\n    </div>\n\n    <script type="text/javascript">\n\n    $(\'#j_filter\').click(function(){\n        var $jfilter = $(\'#j_filter\');\n        if($jfilter.hasClass(\'initial\')){\n            $jfilter.val(\'\');\n        }\n    });\n    var fix_j_filter_width = function(len){\n        $(\'#j_filter\').css(\'width\', Math.max(80, len*6.50)+\'px\');\n    };\n    $(\'#j_filter\').keyup(function(){\n        fix_j_filter_width($(\'#j_filter\').val().length);\n    });\n    $(\'#filter_form\').submit(function(e){\n        e.preventDefault();\n        var val = $(\'#j_filter\').val();\n        window.location = "')
+        __M_writer(escape(url.current(filter='__FILTER__')))
+        __M_writer(u'".replace(\'__FILTER__\',val);\n    });\n    fix_j_filter_width($(\'#j_filter\').val().length);\n\n    $(\'#refresh\').click(function(e){\n        asynchtml("')
+        __M_writer(escape(h.url.current(filter=c.search_term)))
+        __M_writer(u'", $("#journal"), function(){\n            show_more_event();\n            tooltip_activate();\n            show_changeset_tooltip();\n            });\n        e.preventDefault();\n    });\n\n    var show_my = function(e){\n        $(\'#watched_container\').hide();\n        $(\'#my_container\').show();\n        $(\'#q_filter\').show();\n        $(\'#q_filter_watched\').hide();\n\n        $(\'#show_my_li\').addClass(\'active\');\n        $(\'#show_watched_li\').removeClass(\'active\');\n        if(!$(\'#show_my\').hasClass(\'loaded\')){\n            table_renderer(')
+        __M_writer(c.data )
+        __M_writer(u");\n            $('#show_my').addClass('loaded');\n        }\n    };\n    $('#show_my').click(function(){\n        show_my();\n    });\n    var show_watched = function(){\n        $('#my_container').hide();\n        $('#watched_container').show();\n        $('#q_filter_watched').show();\n        $('#q_filter').hide();\n\n        $('#show_watched_li').addClass('active');\n        $('#show_my_li').removeClass('active');\n        if(!$('#show_watched').hasClass('loaded')){\n            watched_renderer(")
+        __M_writer(c.watched_data )
+        __M_writer(u');\n            $(\'#show_watched\').addClass(\'loaded\');\n        }\n    };\n    $(\'#show_watched\').click(function(){\n        show_watched();\n    });\n    //init watched\n    show_watched();\n\n    var tabs = {\n        \'watched\': show_watched,\n        \'my\': show_my\n    }\n    var url = location.href.split(\'#\');\n    if (url[1]) {\n        //We have a hash\n        var tabHash = url[1];\n        var func = tabs[tabHash]\n        if (func){\n            func();\n        }\n    }\n    function watched_renderer(data){\n        var myDataSource = new YAHOO.util.DataSource(data);\n        myDataSource.responseType = YAHOO.util.DataSource.TYPE_JSON;\n\n        myDataSource.responseSchema = {\n            resultsList: "records",\n            fields: [\n               {key:"menu"},\n               {key:"raw_name"},\n               {key:"name"},\n               {key:"last_changeset"},\n               {key:"last_rev_raw"},\n               {key:"action"}\n            ]\n         };\n        myDataSource.doBeforeCallback = function(req,raw,res,cb) {\n            // This is the filter function\n            var data     = res.results || [],\n                filtered = [],\n                i,l;\n\n            if (req) {\n                req = req.toLowerCase();\n                for (i = 0; i<data.length; i++) {\n                    var pos = data[i].raw_name.toLowerCase().indexOf(req)\n                    if (pos != -1) {\n                        filtered.push(data[i]);\n                    }\n                }\n                res.results = filtered;\n            }\n            return res;\n        }\n        // main table sorting\n        var myColumnDefs = [\n            {key:"menu",label:"",sortable:false,className:"quick_repo_menu hidden"},\n            {key:"name",label:"')
+        __M_writer(escape(_('Name')))
+        __M_writer(u'",sortable:true,\n                sortOptions: { sortFunction: nameSort }},\n            {key:"last_changeset",label:"')
+        __M_writer(escape(_('Tip')))
+        __M_writer(u'",sortable:true,\n                sortOptions: { sortFunction: revisionSort }},\n            {key:"action",label:"')
+        __M_writer(escape(_('Action')))
+        __M_writer(u'",sortable:false}\n        ];\n\n        var myDataTable = new YAHOO.widget.DataTable("watched_repos_list_wrap", myColumnDefs, myDataSource,{\n          sortedBy:{key:"name",dir:"asc"},\n          paginator: YUI_paginator(25, [\'watched-user-paginator\']),\n\n          MSG_SORTASC:"')
+        __M_writer(escape(_('Click to sort ascending')))
+        __M_writer(u'",\n          MSG_SORTDESC:"')
+        __M_writer(escape(_('Click to sort descending')))
+        __M_writer(u'",\n          MSG_EMPTY:"')
+        __M_writer(escape(_('No records found.')))
+        __M_writer(u'",\n          MSG_ERROR:"')
+        __M_writer(escape(_('Data error.')))
+        __M_writer(u'",\n          MSG_LOADING:"')
+        __M_writer(escape(_('Loading...')))
+        __M_writer(u'"\n        }\n        );\n        myDataTable.subscribe(\'postRenderEvent\',function(oArgs) {\n            tooltip_activate();\n            quick_repo_menu();\n        });\n\n        var filterTimeout = null;\n\n        updateFilter  = function () {\n            // Reset timeout\n            filterTimeout = null;\n\n            // Reset sort\n            var state = myDataTable.getState();\n            state.sortedBy = {key:\'name\', dir:YAHOO.widget.DataTable.CLASS_ASC};\n\n            // Get filtered data\n            myDataSource.sendRequest(YUD.get(\'q_filter_watched\').value,{\n                success : myDataTable.onDataReturnInitializeTable,\n                failure : myDataTable.onDataReturnInitializeTable,\n                scope   : myDataTable,\n                argument: state\n            });\n\n        };\n        $(\'#q_filter_watched\').click(function(){\n            if(!$(\'#q_filter_watched\').hasClass(\'loaded\')) {\n                //TODO: load here full list later to do search within groups\n                $(\'#q_filter_watched\').css(\'loaded\');\n            }\n        });\n\n        $(\'#q_filter_watched\').keyup(function(){\n            clearTimeout(filterTimeout);\n            filterTimeout = setTimeout(updateFilter,600);\n        });\n      }\n\n    function table_renderer(data){\n        var myDataSource = new YAHOO.util.DataSource(data);\n        myDataSource.responseType = YAHOO.util.DataSource.TYPE_JSON;\n\n        myDataSource.responseSchema = {\n            resultsList: "records",\n            fields: [\n               {key:"menu"},\n               {key:"raw_name"},\n               {key:"name"},\n               {key:"last_changeset"},\n               {key:"last_rev_raw"},\n               {key:"action"}\n            ]\n         };\n        myDataSource.doBeforeCallback = function(req,raw,res,cb) {\n            // This is the filter function\n            var data     = res.results || [],\n                filtered = [],\n                i,l;\n\n            if (req) {\n                req = req.toLowerCase();\n                for (i = 0; i<data.length; i++) {\n                    var pos = data[i].raw_name.toLowerCase().indexOf(req)\n                    if (pos != -1) {\n                        filtered.push(data[i]);\n                    }\n                }\n                res.results = filtered;\n            }\n            return res;\n        }\n        // main table sorting\n        var myColumnDefs = [\n            {key:"menu",label:"",sortable:false,className:"quick_repo_menu hidden"},\n            {key:"name",label:"')
+        __M_writer(escape(_('Name')))
+        __M_writer(u'",sortable:true,\n                sortOptions: { sortFunction: nameSort }},\n            {key:"last_changeset",label:"')
+        __M_writer(escape(_('Tip')))
+        __M_writer(u'",sortable:true,\n                sortOptions: { sortFunction: revisionSort }},\n            {key:"action",label:"')
+        __M_writer(escape(_('Action')))
+        __M_writer(u'",sortable:false}\n        ];\n\n        var myDataTable = new YAHOO.widget.DataTable("repos_list_wrap", myColumnDefs, myDataSource,{\n          sortedBy:{key:"name",dir:"asc"},\n          paginator: YUI_paginator(25, [\'user-paginator\']),\n\n          MSG_SORTASC:"')
+        __M_writer(escape(_('Click to sort ascending')))
+        __M_writer(u'",\n          MSG_SORTDESC:"')
+        __M_writer(escape(_('Click to sort descending')))
+        __M_writer(u'",\n          MSG_EMPTY:"')
+        __M_writer(escape(_('No records found.')))
+        __M_writer(u'",\n          MSG_ERROR:"')
+        __M_writer(escape(_('Data error.')))
+        __M_writer(u'",\n          MSG_LOADING:"')
+        __M_writer(escape(_('Loading...')))
+        __M_writer(u'"\n        }\n        );\n        myDataTable.subscribe(\'postRenderEvent\',function(oArgs) {\n            tooltip_activate();\n            quick_repo_menu();\n        });\n\n        var filterTimeout = null;\n\n        updateFilter = function () {\n            // Reset timeout\n            filterTimeout = null;\n\n            // Reset sort\n            var state = myDataTable.getState();\n            state.sortedBy = {key:\'name\', dir:YAHOO.widget.DataTable.CLASS_ASC};\n\n            // Get filtered data\n            myDataSource.sendRequest(YUD.get(\'q_filter\').value,{\n                success : myDataTable.onDataReturnInitializeTable,\n                failure : myDataTable.onDataReturnInitializeTable,\n                scope   : myDataTable,\n                argument: state\n            });\n\n        };\n        $(\'#q_filter\').click(function(){\n            if(!$(\'#q_filter\').hasClass(\'loaded\')){\n                //TODO: load here full list later to do search within groups\n                $(\'#q_filter\').addClass(\'loaded\');\n            }\n        });\n\n        $(\'#q_filter\').keyup(function(){\n            clearTimeout(filterTimeout);\n            filterTimeout = setTimeout(updateFilter,600);\n        });\n\n        if($(\'#q_filter\').val()) {\n            updateFilter();\n        }\n    }\n\n    </script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Journal')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "42": 2, "47": 5, "48": 16, "53": 19, "58": 23, "59": 338, "65": 17, "72": 17, "73": 18, "74": 18, "80": 6, "88": 6, "89": 9, "90": 9, "91": 9, "92": 9, "93": 10, "94": 10, "95": 11, "96": 11, "97": 12, "98": 12, "99": 12, "100": 12, "101": 14, "102": 14, "108": 20, "117": 20, "118": 21, "119": 21, "120": 21, "121": 21, "122": 22, "123": 22, "124": 22, "125": 22, "131": 25, "140": 25, "141": 29, "142": 29, "143": 32, "144": 32, "145": 35, "146": 35, "147": 40, "148": 40, "149": 48, "150": 48, "151": 49, "152": 49, "153": 53, "154": 53, "155": 56, "156": 56, "157": 90, "158": 90, "159": 95, "160": 95, "161": 112, "162": 112, "163": 128, "164": 128, "165": 187, "166": 187, "167": 189, "168": 189, "169": 191, "170": 191, "171": 198, "172": 198, "173": 199, "174": 199, "175": 200, "176": 200, "177": 201, "178": 201, "179": 202, "180": 202, "181": 278, "182": 278, "183": 280, "184": 280, "185": 282, "186": 282, "187": 289, "188": 289, "189": 290, "190": 290, "191": 291, "192": 291, "193": 292, "194": 292, "195": 293, "196": 293, "202": 3, "209": 3, "210": 4, "211": 4, "217": 211}, "uri": "journal/journal.html", "filename": "/root/package/kallithea/templates/journal/journal.html"}
+__M_END_METADATA
+"""
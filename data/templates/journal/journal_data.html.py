@@ -0,0 +1,84 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253681.083464
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/journal/journal_data.html'
+_template_uri = u'journal/journal_data.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.journal_day_aggreagate:
+            for day,items in c.journal_day_aggreagate:
+                __M_writer(u'     <div class="journal_day">')
+                __M_writer(escape(day))
+                __M_writer(u'</div>\n')
+                for user,entries in items:
+                    __M_writer(u'            <div class="journal_container">\n                <div class="gravatar">\n                    ')
+                    __M_writer(escape(h.gravatar(user.email if user else 'anonymous@kallithea-scm.org', size=24)))
+                    __M_writer(u'\n                </div>\n')
+                    if user:
+                        __M_writer(u'                    <div class="journal_user">')
+                        __M_writer(escape(user.name))
+                        __M_writer(u' ')
+                        __M_writer(escape(user.lastname))
+                        __M_writer(u'</div>\n')
+                    else:
+                        __M_writer(u'                    <div class="journal_user deleted">')
+                        __M_writer(escape(entries[0].username))
+                        __M_writer(u'</div>\n')
+                    __M_writer(u'                <div class="journal_action_container">\n')
+                    for entry in entries:
+                        __M_writer(u'                    <div class="journal_icon"> ')
+                        __M_writer(escape(h.action_parser(entry)[2]()))
+                        __M_writer(u'</div>\n                    <div class="journal_action">')
+                        __M_writer(escape(h.action_parser(entry)[0]()))
+                        __M_writer(u'</div>\n                    <div class="journal_repo">\n                        <span class="journal_repo_name">\n')
+                        if entry.repository is not None:
+                            __M_writer(u'                          ')
+                            __M_writer(escape(h.link_to(entry.repository.repo_name,
+                                      h.url('summary_home',repo_name=entry.repository.repo_name))))
+                            __M_writer(u'\n')
+                        else:
+                            __M_writer(u'                          ')
+                            __M_writer(escape(entry.repository_name))
+                            __M_writer(u'\n')
+                        __M_writer(u'                        </span>\n                    </div>\n                    <div class="journal_action_params">')
+                        __M_writer(escape(h.literal(h.action_parser(entry)[1]())))
+                        __M_writer(u'</div>\n                    <div class="date"><span class="tooltip" title="')
+                        __M_writer(escape(h.tooltip(h.fmt_date(entry.action_date))))
+                        __M_writer(u'">')
+                        __M_writer(escape(h.age(entry.action_date)))
+                        __M_writer(u'</span></div>\n')
+                    __M_writer(u'                </div>\n            </div>\n')
+            __M_writer(u'\n  <div class="pagination-wh pagination-left" style="padding: 0px 0px 0px 10px;">\n  ')
+            __M_writer(escape(c.journal_pager.pager('$link_previous ~2~ $link_next')))
+            __M_writer(u'\n  </div>\n    <script type="text/javascript">\n    $(document).ready(function(){\n        var $journal = $(\'#journal\');\n        $journal.on(\'click\',\'.pager_link\',function(e){\n            asynchtml(e.target.href, $journal, function(){\n                show_more_event();\n                tooltip_activate();\n                show_changeset_tooltip();\n            });\n            e.preventDefault();\n        });\n        $(\'#journal\').on(\'click\',\'.show_more\',function(e){\n            var el = e.target;\n            $(\'#\'+el.id.substring(1)).show();\n            $(el.parentNode).hide();\n        });\n    });\n    </script>\n')
+        else:
+            __M_writer(u'  <div style="padding:5px 0px 10px 10px;">\n      ')
+            __M_writer(escape(_('No entries yet')))
+            __M_writer(u'\n  </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "24": 2, "25": 3, "26": 4, "27": 5, "28": 5, "29": 5, "30": 6, "31": 7, "32": 9, "33": 9, "34": 11, "35": 12, "36": 12, "37": 12, "38": 12, "39": 12, "40": 13, "41": 14, "42": 14, "43": 14, "44": 16, "45": 17, "46": 18, "47": 18, "48": 18, "49": 19, "50": 19, "51": 22, "52": 23, "53": 23, "55": 24, "56": 25, "57": 26, "58": 26, "59": 26, "60": 28, "61": 30, "62": 30, "63": 31, "64": 31, "65": 31, "66": 31, "67": 33, "68": 37, "69": 39, "70": 39, "71": 59, "72": 60, "73": 61, "74": 61, "80": 74}, "uri": "journal/journal_data.html", "filename": "/root/package/kallithea/templates/journal/journal_data.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,101 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253697.508504
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/login.html'
+_template_uri = '/login.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'base/root.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n<div id="login">\n    ')
+        runtime._include_file(context, u'/base/flash_msg.html', _template_uri)
+        __M_writer(u'\n    <!-- login -->\n    <div class="title withlogo">\n')
+        if c.site_name:
+            __M_writer(u'            <h5>')
+            __M_writer(escape(_('Log In to %s') % c.site_name))
+            __M_writer(u'</h5>\n')
+        else:
+            __M_writer(u'            <h5>')
+            __M_writer(escape(_('Log In')))
+            __M_writer(u'</h5>\n')
+        __M_writer(u'    </div>\n    <div class="inner">\n        ')
+        __M_writer(escape(h.form(h.url.current(came_from=c.came_from))))
+        __M_writer(u'\n        <div class="form">\n            <i class="icon-lock"></i>\n            <!-- fields -->\n\n            <div class="fields">\n                <div class="field">\n                    <div class="label">\n                        <label for="username">')
+        __M_writer(escape(_('Username')))
+        __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.text('username',class_='focus large')))
+        __M_writer(u'\n                    </div>\n\n                </div>\n                <div class="field">\n                    <div class="label">\n                        <label for="password">')
+        __M_writer(escape(_('Password')))
+        __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.password('password',class_='focus large')))
+        __M_writer(u'\n                    </div>\n\n                </div>\n                <div class="field">\n                    <div class="checkbox">\n                        <input type="checkbox" id="remember" name="remember" />\n                        <label for="remember">')
+        __M_writer(escape(_('Remember me')))
+        __M_writer(u'</label>\n                    </div>\n                </div>\n                <div class="buttons">\n                    ')
+        __M_writer(escape(h.submit('sign_in',_('Sign In'),class_="btn")))
+        __M_writer(u'\n                </div>\n            </div>\n            <!-- end fields -->\n            <!-- links -->\n            <div class="links">\n                ')
+        __M_writer(escape(h.link_to(_('Forgot your password ?'),h.url('reset_password'))))
+        __M_writer(u'\n')
+        if h.HasPermissionAny('hg.admin', 'hg.register.auto_activate', 'hg.register.manual_activate')():
+            __M_writer(u'                  /\n                 ')
+            __M_writer(escape(h.link_to(_("Don't have an account ?"),h.url('register'))))
+            __M_writer(u'\n')
+        __M_writer(u'            </div>\n\n            <!-- end links -->\n        </div>\n        ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n        <script type="text/javascript">\n        $(document).ready(function(){\n            $(\'#username\').focus();\n        });\n        </script>\n    </div>\n    <!-- end login -->\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Log In')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "37": 2, "42": 6, "43": 9, "44": 9, "45": 12, "46": 13, "47": 13, "48": 13, "49": 14, "50": 15, "51": 15, "52": 15, "53": 17, "54": 19, "55": 19, "56": 27, "57": 27, "58": 30, "59": 30, "60": 36, "61": 36, "62": 39, "63": 39, "64": 46, "65": 46, "66": 50, "67": 50, "68": 56, "69": 56, "70": 57, "71": 58, "72": 59, "73": 59, "74": 61, "75": 65, "76": 65, "82": 4, "89": 4, "90": 5, "91": 5, "97": 91}, "uri": "/login.html", "filename": "/root/package/kallithea/templates/login.html"}
+__M_END_METADATA
+"""
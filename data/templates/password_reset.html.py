@@ -0,0 +1,106 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253697.441538
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/password_reset.html'
+_template_uri = '/password_reset.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'base/root.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n<div id="register">\n    ')
+        runtime._include_file(context, u'/base/flash_msg.html', _template_uri)
+        __M_writer(u'\n    <div class="title withlogo">\n')
+        if c.site_name:
+            __M_writer(u'            <h5>')
+            __M_writer(escape(_('Reset Your Password to %s') % c.site_name))
+            __M_writer(u'</h5>\n')
+        else:
+            __M_writer(u'            <h5>')
+            __M_writer(escape(_('Reset Your Password')))
+            __M_writer(u'</h5>\n')
+        __M_writer(u'    </div>\n    <div class="inner">\n        ')
+        __M_writer(escape(h.form(url('password_reset'))))
+        __M_writer(u'\n        <div class="form">\n            <!-- fields -->\n            <div class="fields">\n\n                 <div class="field">\n                    <div class="label">\n                        <label for="email">')
+        __M_writer(escape(_('Email Address')))
+        __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.text('email')))
+        __M_writer(u'\n                    </div>\n                 </div>\n\n')
+        if c.captcha_active:
+            __M_writer(u'                <div class="field">\n                    <div class="label">\n                        <label for="email">')
+            __M_writer(escape(_('Captcha')))
+            __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+            __M_writer(escape(h.hidden('recaptcha_field')))
+            __M_writer(u'\n                        <div id="recaptcha"></div>\n                    </div>\n                </div>\n')
+        __M_writer(u'\n                <div class="buttons">\n                    <div class="nohighlight">\n                      ')
+        __M_writer(escape(h.submit('send',_('Send Password Reset Email'),class_="btn")))
+        __M_writer(u'\n                          <div class="activation_msg">')
+        __M_writer(escape(_('Password reset link will be sent to the email address matching your username.')))
+        __M_writer(u'</div>\n                    </div>\n                </div>\n            </div>\n        </div>\n        ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        if c.captcha_active:
+            __M_writer(u'        <script type="text/javascript" src="https://www.google.com/recaptcha/api/js/recaptcha_ajax.js"></script>\n')
+        __M_writer(u'        <script type="text/javascript">\n         $(document).ready(function(){\n            $(\'#email\').focus();\n')
+        if c.captcha_active:
+            __M_writer(u'            Recaptcha.create("')
+            __M_writer(escape(c.captcha_public_key))
+            __M_writer(u'", "recaptcha",\n                {\n                  theme: "white"\n                }\n            );\n')
+        __M_writer(u'         });\n        </script>\n    </div>\n   </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Password Reset')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "38": 2, "43": 6, "44": 9, "45": 9, "46": 11, "47": 12, "48": 12, "49": 12, "50": 13, "51": 14, "52": 14, "53": 14, "54": 16, "55": 18, "56": 18, "57": 25, "58": 25, "59": 28, "60": 28, "61": 32, "62": 33, "63": 35, "64": 35, "65": 38, "66": 38, "67": 43, "68": 46, "69": 46, "70": 47, "71": 47, "72": 52, "73": 52, "74": 53, "75": 54, "76": 56, "77": 59, "78": 60, "79": 60, "80": 60, "81": 66, "87": 4, "94": 4, "95": 5, "96": 5, "102": 96}, "uri": "/password_reset.html", "filename": "/root/package/kallithea/templates/password_reset.html"}
+__M_END_METADATA
+"""
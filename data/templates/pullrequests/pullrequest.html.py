@@ -0,0 +1,197 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253705.34105
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/pullrequests/pullrequest.html'
+_template_uri = '/pullrequests/pullrequest.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('showpullrequest')))
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n\n    ')
+        __M_writer(escape(h.form(url('pullrequest', repo_name=c.repo_name), method='post', id='pull_request_form')))
+        __M_writer(u'\n    <div class="form">\n        <!-- fields -->\n\n        <div class="fields" style="float:left;width:50%;padding-right:30px;">\n\n             <div class="field">\n                <div class="label">\n                    <label for="pullrequest_title">')
+        __M_writer(escape(_('Title')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n                    ')
+        __M_writer(escape(h.text('pullrequest_title',class_="large",placeholder=_('Summarize the changes - or leave empty'))))
+        __M_writer(u'\n                </div>\n             </div>\n\n            <div class="field">\n                <div class="label label-textarea">\n                    <label for="pullrequest_desc">')
+        __M_writer(escape(_('Description')))
+        __M_writer(u':</label>\n                </div>\n                <div class="textarea text-area editor">\n                    ')
+        __M_writer(escape(h.textarea('pullrequest_desc',size=30,placeholder=_('Write a short description on this pull request'))))
+        __M_writer(u'\n                </div>\n            </div>\n\n            <div class="field">\n                <div class="label label-textarea">\n                    <label for="pullrequest_desc">')
+        __M_writer(escape(_('Changeset flow')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input">\n')
+        __M_writer(u'                    <div>\n                        <div>\n                            <div style="padding:5px 3px 3px 3px;">\n                            <b>')
+        __M_writer(escape(_('Origin repository')))
+        __M_writer(u':</b> <span id="org_repo_desc">')
+        __M_writer(escape(c.db_repo.description.split('\n')[0]))
+        __M_writer(u'</span>\n                            </div>\n                            <div>\n                            ')
+        __M_writer(escape(h.select('org_repo','',c.cs_repos,class_='refs')))
+        __M_writer(u':')
+        __M_writer(escape(h.select('org_ref',c.default_cs_ref,c.cs_refs,class_='refs')))
+        __M_writer(u'\n                            </div>\n                            <div style="padding:5px 3px 3px 3px;">\n                            <b>')
+        __M_writer(escape(_('Revision')))
+        __M_writer(u':</b> <span id="org_rev_span">-</span>\n                            </div>\n                        </div>\n                    </div>\n\n')
+        __M_writer(u'                    <div style="border-top: 1px solid #EEE; margin: 5px 0px 0px 0px">\n                        <div>\n')
+        __M_writer(u'                            <div style="padding:5px 3px 3px 3px;">\n                            <b>')
+        __M_writer(escape(_('Destination repository')))
+        __M_writer(u':</b> <span id="other_repo_desc">')
+        __M_writer(escape(c.a_repo.description.split('\n')[0]))
+        __M_writer(u'</span>\n                            </div>\n                            <div>\n                            ')
+        __M_writer(escape(h.select('other_repo',c.a_repo.repo_name,c.a_repos,class_='refs')))
+        __M_writer(u':')
+        __M_writer(escape(h.select('other_ref',c.default_a_ref,c.a_refs,class_='refs')))
+        __M_writer(u'\n                            </div>\n                            <div style="padding:5px 3px 3px 3px;">\n                            <b>')
+        __M_writer(escape(_('Revision')))
+        __M_writer(u':</b> <span id="other_rev_span">-</span>\n                            </div>\n                        </div>\n                    </div>\n                    <div style="clear:both"></div>\n                </div>\n            </div>\n\n            <div class="field">\n                <div class="buttons">\n                    ')
+        __M_writer(escape(h.submit('save',_('Create Pull Request'),class_="btn")))
+        __M_writer(u'\n                    ')
+        __M_writer(escape(h.reset('reset',_('Reset'),class_="btn")))
+        __M_writer(u'\n               </div>\n            </div>\n\n        </div>\n\n')
+        __M_writer(u'        <div style="float:left; border-left:1px dashed #eee">\n            <div class="pr-details-title">')
+        __M_writer(escape(_('Pull Request Reviewers')))
+        __M_writer(u'</div>\n            <div id="reviewers" style="padding:0px 0px 0px 15px">\n')
+        __M_writer(u'              <div>\n                <ul id="review_members" class="group_members">\n                </ul>\n              </div>\n\n              <div class=\'ac\'>\n                <div class="reviewer_ac">\n                   ')
+        __M_writer(escape(h.text('user', class_='yui-ac-input',placeholder=_('Type name of reviewer to add'))))
+        __M_writer(u'\n                   <div id="reviewers_container"></div>\n                </div>\n              </div>\n            </div>\n        </div>\n\n        <div style="clear:both;padding: 0 0 30px 0;"></div>\n\n        <h4>')
+        __M_writer(escape(_('Changesets')))
+        __M_writer(u'</h4>\n        <div style="float:left;padding:0px 30px 30px 30px">\n')
+        __M_writer(u'           <div style="float:left" id="pull_request_overview"></div>\n        </div>\n        <div style="clear:both;"></div>\n\n    </div>\n\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n\n</div>\n\n<script type="text/javascript" src="')
+        __M_writer(escape(h.url('/js/graph.js', ver=c.kallithea_version)))
+        __M_writer(u'"></script>\n<script type="text/javascript">\n  var _USERS_AC_DATA = ')
+        __M_writer(c.users_array)
+        __M_writer(u';\n  var _GROUPS_AC_DATA = ')
+        __M_writer(c.user_groups_array)
+        __M_writer(u';\n  PullRequestAutoComplete(\'user\', \'reviewers_container\', _USERS_AC_DATA, _GROUPS_AC_DATA);\n\n  pyroutes.register(\'pullrequest_repo_info\', "')
+        __M_writer(escape(url('pullrequest_repo_info',repo_name='%(repo_name)s')))
+        __M_writer(u'", [\'repo_name\']);\n\n  var pendingajax = undefined;\n  var otherrepoChanged = function(){\n      var $other_ref = $(\'#other_ref\');\n      $other_ref.prop(\'disabled\', true);\n      var repo_name = $(\'#other_repo\').val();\n      if (pendingajax) {\n          pendingajax.abort();\n          pendingajax = undefined;\n      }\n      pendingajax = ajaxGET(pyroutes.url(\'pullrequest_repo_info\', {"repo_name": repo_name}),\n          function(data){\n              pendingajax = undefined;\n              $(\'#other_repo_desc\').html(data.description);\n\n              // replace options of other_ref with the ones for the current other_repo\n              $other_ref.empty();\n              for(var i = 0; i < data.refs.length; i++)\n              {\n                var $optgroup = $(\'<optgroup/>\').attr(\'label\', data.refs[i][1]);\n                var options = data.refs[i][0];\n                var length = options.length;\n                for(var j = 0; j < length; j++)\n                {\n                  $optgroup.append($(\'<option/>\').text(options[j][1]).val(options[j][0]));\n                }\n                $other_ref.append($optgroup);\n              }\n              $other_ref.val(data.selected_ref);\n\n              // re-populate the select2 thingie\n              $("#other_ref").select2({\n                  dropdownAutoWidth: true\n              });\n\n              $other_ref.prop(\'disabled\', false);\n              loadPreview();\n          });\n  };\n\n  var loadPreview = function(){\n      //url template\n      var url = "')
+        __M_writer(escape(h.url('compare_url',
+                         repo_name='__other_repo__',
+                         org_ref_type='rev',
+                         org_ref_name='__other_ref_name__',
+                         other_repo='__org_repo__',
+                         other_ref_type='rev',
+                         other_ref_name='__org_ref_name__',
+                         as_form=True,
+                         merge=True,
+                         )))
+        __M_writer(u'";\n      var org_repo = $(\'#pull_request_form #org_repo\').val();\n      var org_ref = $(\'#pull_request_form #org_ref\').val().split(\':\');\n')
+        __M_writer(u'      $(\'#org_rev_span\').html(org_ref[2].substr(0,12));\n\n      var other_repo = $(\'#pull_request_form #other_repo\').val();\n      var other_ref = $(\'#pull_request_form #other_ref\').val().split(\':\');\n      $(\'#other_rev_span\').html(other_ref[2].substr(0,12));\n\n      var rev_data = {\n          \'__org_repo__\': org_repo,\n          \'__org_ref_name__\': org_ref[2],\n          \'__other_repo__\': other_repo,\n          \'__other_ref_name__\': other_ref[2]\n      }; // gather the org/other ref and repo here\n\n      for (k in rev_data){\n          url = url.replace(k,rev_data[k]);\n      }\n\n      if (pendingajax) {\n          pendingajax.abort();\n          pendingajax = undefined;\n      }\n      pendingajax = asynchtml(url, $(\'#pull_request_overview\'), function(o){\n          pendingajax = undefined;\n          var jsdata = eval(\'(\'+YUD.get(\'jsdata\').innerHTML+\')\'); // TODO: just get json\n          var r = new BranchRenderer(\'graph_canvas\', \'graph_content_pr\', \'chg_\');\n          r.render(jsdata,100);\n      });\n  }\n\n  $(document).ready(function(){\n      $("#org_repo").select2({\n          dropdownAutoWidth: true\n      });\n')
+        __M_writer(u'\n      $("#org_ref").select2({\n          dropdownAutoWidth: true\n      });\n      $("#org_ref").on("change", function(e){\n          loadPreview();\n      });\n\n      $("#other_repo").select2({\n          dropdownAutoWidth: true\n      });\n      $("#other_repo").on("change", function(e){\n          otherrepoChanged();\n      });\n\n      $("#other_ref").select2({\n          dropdownAutoWidth: true\n      });\n      $("#other_ref").on("change", function(e){\n          loadPreview();\n      });\n\n      //lazy load overview after 0.5s\n      setTimeout(loadPreview, 500);\n  });\n\n</script>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('New Pull Request')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(c.repo_name))
+        __M_writer(u' ')
+        __M_writer(escape(_('New Pull Request')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "39": 1, "44": 5, "45": 9, "50": 13, "51": 253, "57": 11, "64": 11, "65": 12, "66": 12, "72": 15, "81": 15, "82": 16, "83": 16, "84": 20, "85": 20, "86": 23, "87": 23, "88": 31, "89": 31, "90": 34, "91": 34, "92": 40, "93": 40, "94": 43, "95": 43, "96": 49, "97": 49, "98": 53, "99": 56, "100": 56, "101": 56, "102": 56, "103": 59, "104": 59, "105": 59, "106": 59, "107": 62, "108": 62, "109": 68, "110": 71, "111": 72, "112": 72, "113": 72, "114": 72, "115": 75, "116": 75, "117": 75, "118": 75, "119": 78, "120": 78, "121": 88, "122": 88, "123": 89, "124": 89, "125": 96, "126": 97, "127": 97, "128": 100, "129": 107, "130": 107, "131": 116, "132": 116, "133": 119, "134": 125, "135": 125, "136": 129, "137": 129, "138": 131, "139": 131, "140": 132, "141": 132, "142": 135, "143": 135, "144": 178, "154": 187, "155": 191, "156": 225, "162": 7, "167": 7, "168": 8, "169": 8, "175": 3, "183": 3, "184": 4, "185": 4, "186": 4, "187": 4, "193": 187}, "uri": "/pullrequests/pullrequest.html", "filename": "/root/package/kallithea/templates/pullrequests/pullrequest.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,133 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253626.079956
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/register.html'
+_template_uri = '/register.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'base/root.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        url = context.get('url', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n<div id="register">\n    ')
+        runtime._include_file(context, u'/base/flash_msg.html', _template_uri)
+        __M_writer(u'\n    <div class="title withlogo">\n')
+        if c.site_name:
+            __M_writer(u'            <h5>')
+            __M_writer(escape(_('Sign Up to %s') % c.site_name))
+            __M_writer(u'</h5>\n')
+        else:
+            __M_writer(u'            <h5>')
+            __M_writer(escape(_('Sign Up')))
+            __M_writer(u'</h5>\n')
+        __M_writer(u'    </div>\n    <div class="inner">\n        ')
+        __M_writer(escape(h.form(url('register'))))
+        __M_writer(u'\n        <div class="form">\n            <!-- fields -->\n            <div class="fields">\n                <div class="field">\n                    <div class="label">\n                        <label for="username">')
+        __M_writer(escape(_('Username')))
+        __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.text('username',class_="medium")))
+        __M_writer(u'\n                    </div>\n                </div>\n\n                <div class="field">\n                    <div class="label">\n                        <label for="password">')
+        __M_writer(escape(_('Password')))
+        __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.password('password',class_="medium",autocomplete="off")))
+        __M_writer(u'\n                    </div>\n                </div>\n\n                <div class="field">\n                    <div class="label">\n                        <label for="password">')
+        __M_writer(escape(_('Re-enter password')))
+        __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.password('password_confirmation',class_="medium",autocomplete="off")))
+        __M_writer(u'\n                    </div>\n                </div>\n\n                <div class="field">\n                    <div class="label">\n                        <label for="firstname">')
+        __M_writer(escape(_('First Name')))
+        __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.text('firstname',class_="medium")))
+        __M_writer(u'\n                    </div>\n                </div>\n\n                <div class="field">\n                    <div class="label">\n                        <label for="lastname">')
+        __M_writer(escape(_('Last Name')))
+        __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.text('lastname',class_="medium")))
+        __M_writer(u'\n                    </div>\n                </div>\n\n                <div class="field">\n                    <div class="label">\n                        <label for="email">')
+        __M_writer(escape(_('Email')))
+        __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+        __M_writer(escape(h.text('email',class_="medium")))
+        __M_writer(u'\n                    </div>\n                </div>\n\n')
+        if c.captcha_active:
+            __M_writer(u'                <div class="field">\n                    <div class="label">\n                        <label for="email">')
+            __M_writer(escape(_('Captcha')))
+            __M_writer(u':</label>\n                    </div>\n                    <div class="input">\n                        ')
+            __M_writer(escape(h.hidden('recaptcha_field')))
+            __M_writer(u'\n                        <div id="recaptcha"></div>\n                    </div>\n                </div>\n')
+        __M_writer(u'\n                <div class="buttons">\n                    <div class="nohighlight">\n                      ')
+        __M_writer(escape(h.submit('sign_up',_('Sign Up'),class_="btn")))
+        __M_writer(u'\n')
+        if c.auto_active:
+            __M_writer(u'                          <div class="activation_msg">')
+            __M_writer(escape(_('Registered accounts are ready to use and need no further action.')))
+            __M_writer(u'</div>\n')
+        else:
+            __M_writer(u'                          <div class="activation_msg">')
+            __M_writer(escape(_('Please wait for an administrator to activate your account.')))
+            __M_writer(u'</div>\n')
+        __M_writer(u'                    </div>\n                </div>\n            </div>\n        </div>\n        ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n')
+        if c.captcha_active:
+            __M_writer(u'        <script type="text/javascript" src="https://www.google.com/recaptcha/api/js/recaptcha_ajax.js"></script>\n')
+        __M_writer(u'        <script type="text/javascript">\n        $(document).ready(function(){\n            $(\'#username\').focus();\n\n')
+        if c.captcha_active:
+            __M_writer(u'            Recaptcha.create("')
+            __M_writer(escape(c.captcha_public_key))
+            __M_writer(u'", "recaptcha",\n                {\n                  theme: "white"\n                }\n            );\n')
+        __M_writer(u'        });\n        </script>\n    </div>\n </div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Sign Up')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"129": 123, "27": 0, "38": 2, "43": 6, "44": 9, "45": 9, "46": 11, "47": 12, "48": 12, "49": 12, "50": 13, "51": 14, "52": 14, "53": 14, "54": 16, "55": 18, "56": 18, "57": 24, "58": 24, "59": 27, "60": 27, "61": 33, "62": 33, "63": 36, "64": 36, "65": 42, "66": 42, "67": 45, "68": 45, "69": 51, "70": 51, "71": 54, "72": 54, "73": 60, "74": 60, "75": 63, "76": 63, "77": 69, "78": 69, "79": 72, "80": 72, "81": 76, "82": 77, "83": 79, "84": 79, "85": 82, "86": 82, "87": 87, "88": 90, "89": 90, "90": 91, "91": 92, "92": 92, "93": 92, "94": 93, "95": 94, "96": 94, "97": 94, "98": 96, "99": 100, "100": 100, "101": 101, "102": 102, "103": 104, "104": 108, "105": 109, "106": 109, "107": 109, "108": 115, "114": 4, "121": 4, "122": 5, "123": 5}, "uri": "/register.html", "filename": "/root/package/kallithea/templates/register.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,193 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253707.087626
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/search/search.html'
+_template_uri = '/search/search.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context._locals(__M_locals))
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.repo_name:
+            __M_writer(u'    ')
+            __M_writer(escape(self.menu('repositories')))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'    ')
+            __M_writer(escape(self.menu('search')))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.repo_name:
+            __M_writer(escape(self.repo_context_bar('options')))
+            __M_writer(u'\n')
+        __M_writer(u'<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <!-- end box / title -->\n')
+        if c.repo_name:
+            __M_writer(u'        ')
+            __M_writer(escape(h.form(h.url('search_repo',repo_name=c.repo_name),method='get')))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'        ')
+            __M_writer(escape(h.form(h.url('search'),method='get')))
+            __M_writer(u'\n')
+        __M_writer(u'    <div class="form">\n        <div class="fields">\n            <div class="field field-first field-noborder">\n             <div class="label">\n                 <label for="q">')
+        __M_writer(escape(_('Search term')))
+        __M_writer(u':</label>\n             </div>\n                <div class="input">')
+        __M_writer(escape(h.text('q',c.cur_query,class_="small")))
+        __M_writer(u'\n                    <div class="button highlight">\n                        <input type="submit" value="')
+        __M_writer(escape(_('Search')))
+        __M_writer(u'" class="btn"/>\n                    </div>\n                </div>\n                <div style="font-weight: bold;clear:both;margin-left:200px">')
+        __M_writer(escape(c.runtime))
+        __M_writer(u'</div>\n            </div>\n\n            <div class="field">\n                <div class="label">\n                    <label for="type">')
+        __M_writer(escape(_('Search in')))
+        __M_writer(u':</label>\n                </div>\n                <div class="select">\n                    ')
+        __M_writer(escape(h.select('type',c.cur_type,[('content',_('File contents')),
+                        ('commit',_('Commit messages')),
+                        ('path',_('File names'))
+                        ##('repository',_('Repository names'))
+                        ])))
+        __M_writer(u'\n                </div>\n             </div>\n\n        </div>\n    </div>\n    ')
+        __M_writer(escape(h.end_form()))
+        __M_writer(u'\n    <div class="search">\n')
+        if c.cur_type == 'content':
+            __M_writer(u'        ')
+            runtime._include_file(context, u'search_content.html', _template_uri)
+            __M_writer(u'\n')
+        elif c.cur_type == 'path':
+            __M_writer(u'        ')
+            runtime._include_file(context, u'search_path.html', _template_uri)
+            __M_writer(u'\n')
+        elif c.cur_type == 'commit':
+            __M_writer(u'        ')
+            runtime._include_file(context, u'search_commit.html', _template_uri)
+            __M_writer(u'\n')
+        elif c.cur_type == 'repository':
+            __M_writer(u'        ')
+            runtime._include_file(context, u'search_repository.html', _template_uri)
+            __M_writer(u'\n')
+        __M_writer(u'    </div>\n</div>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.repo_name:
+            __M_writer(u'    ')
+            __M_writer(escape(_('Search')))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'    ')
+            __M_writer(escape(_('Search in All Repositories')))
+            __M_writer(u'\n')
+        if c.cur_query:
+            __M_writer(u'    &raquo;\n    ')
+            __M_writer(escape(c.cur_query))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        if c.repo_name:
+            __M_writer(u'        ')
+            __M_writer(escape(_('%s Search') % c.repo_name))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'        ')
+            __M_writer(escape(_('Search in All Repositories')))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "39": 2, "44": 10, "45": 22, "50": 30, "51": 89, "57": 24, "65": 24, "66": 25, "67": 26, "68": 26, "69": 26, "70": 27, "71": 28, "72": 28, "73": 28, "79": 31, "87": 31, "88": 32, "89": 33, "90": 33, "91": 35, "92": 38, "93": 38, "94": 41, "95": 42, "96": 42, "97": 42, "98": 43, "99": 44, "100": 44, "101": 44, "102": 46, "103": 50, "104": 50, "105": 52, "106": 52, "107": 54, "108": 54, "109": 57, "110": 57, "111": 62, "112": 62, "113": 65, "118": 69, "119": 75, "120": 75, "121": 77, "122": 78, "123": 78, "124": 78, "125": 79, "126": 80, "127": 80, "128": 80, "129": 81, "130": 82, "131": 82, "132": 82, "133": 83, "134": 84, "135": 84, "136": 84, "137": 86, "143": 12, "149": 12, "150": 13, "151": 14, "152": 14, "153": 14, "154": 15, "155": 16, "156": 16, "157": 16, "158": 18, "159": 19, "160": 20, "161": 20, "167": 4, "175": 4, "176": 5, "177": 6, "178": 6, "179": 6, "180": 7, "181": 8, "182": 8, "183": 8, "189": 183}, "uri": "/search/search.html", "filename": "/root/package/kallithea/templates/search/search.html"}
+__M_END_METADATA
+"""
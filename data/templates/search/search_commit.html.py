@@ -0,0 +1,71 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253707.607095
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/search/search_commit.html'
+_template_uri = u'/search/search_commit.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        for cnt,sr in enumerate(c.formated_results):
+            if h.HasRepoPermissionAny('repository.write','repository.read','repository.admin')(sr['repository'],'search results check'):
+                __M_writer(u'    <div class="table">\n        <div id="body')
+                __M_writer(escape(cnt))
+                __M_writer(u'" class="codeblock">\n            <div class="code-header">\n                <div class="search-path">')
+                __M_writer(escape(h.link_to(h.literal('%s &raquo; %s' % (sr['repository'],sr['raw_id'])),
+                h.url('changeset_home',repo_name=sr['repository'],revision=sr['raw_id']))))
+                __M_writer(u'\n                ')
+                __M_writer(escape(h.fmt_date(h.time_to_datetime(sr['date']))))
+                __M_writer(u'\n                </div>\n            </div>\n            <div class="left">\n                <div class="author">\n                    <div class="gravatar">\n                      ')
+                __M_writer(escape(h.gravatar(h.email_or_none(sr['author']), size=20)))
+                __M_writer(u'\n                    </div>\n                    <span>')
+                __M_writer(escape(h.person(sr['author'])))
+                __M_writer(u'</span><br/>\n                    <span>')
+                __M_writer(escape(h.email_or_none(sr['author'])))
+                __M_writer(u'</a></span><br/>\n                </div>\n')
+                if sr['message_hl']:
+                    __M_writer(u'                <div class="search-code-body">\n                    <pre>')
+                    __M_writer(escape(h.literal(sr['message_hl'])))
+                    __M_writer(u'</pre>\n                </div>\n')
+                else:
+                    __M_writer(u'                <div class="message">')
+                    __M_writer(escape(h.urlify_commit(sr['message'], sr['repository'])))
+                    __M_writer(u'</div>\n')
+                __M_writer(u'            </div>\n        </div>\n    </div>\n')
+            else:
+                if cnt == 0:
+                    __M_writer(u'        <div class="table">\n            <div id="body')
+                    __M_writer(escape(cnt))
+                    __M_writer(u'" class="codeblock">\n                <div class="error">')
+                    __M_writer(escape(_('Permission denied')))
+                    __M_writer(u'</div>\n            </div>\n        </div>\n')
+        if c.cur_query and c.formated_results:
+            __M_writer(u'<div class="pagination-wh pagination-left">\n    ')
+            __M_writer(escape(c.formated_results.pager('$link_previous ~2~ $link_next')))
+            __M_writer(u'\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 2, "26": 3, "27": 4, "28": 5, "29": 6, "30": 6, "31": 8, "33": 9, "34": 10, "35": 10, "36": 16, "37": 16, "38": 18, "39": 18, "40": 19, "41": 19, "42": 21, "43": 22, "44": 23, "45": 23, "46": 25, "47": 26, "48": 26, "49": 26, "50": 28, "51": 31, "52": 32, "53": 33, "54": 34, "55": 34, "56": 35, "57": 35, "58": 41, "59": 42, "60": 43, "61": 43, "67": 61}, "uri": "/search/search_commit.html", "filename": "/root/package/kallithea/templates/search/search_commit.html"}
+__M_END_METADATA
+"""
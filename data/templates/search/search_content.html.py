@@ -0,0 +1,57 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253707.100127
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/search/search_content.html'
+_template_uri = u'/search/search_content.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        for cnt,sr in enumerate(c.formated_results):
+            if h.HasRepoPermissionAny('repository.write','repository.read','repository.admin')(sr['repository'],'search results check'):
+                __M_writer(u'    <div class="table">\n        <div id="body')
+                __M_writer(escape(cnt))
+                __M_writer(u'" class="codeblock">\n            <div class="code-header">\n                <div class="search-path">')
+                __M_writer(escape(h.link_to(h.literal('%s &raquo; %s' % (sr['repository'],sr['f_path'])),
+                h.url('files_home',repo_name=sr['repository'],revision='tip',f_path=sr['f_path']))))
+                __M_writer(u'\n                </div>\n            </div>\n            <div class="search-code-body">\n                <pre>')
+                __M_writer(escape(h.literal(sr['content_short_hl'])))
+                __M_writer(u'</pre>\n            </div>\n        </div>\n    </div>\n')
+            else:
+                if cnt == 0:
+                    __M_writer(u'        <div class="table">\n            <div id="body')
+                    __M_writer(escape(cnt))
+                    __M_writer(u'" class="codeblock">\n                <div class="error">')
+                    __M_writer(escape(_('Permission denied')))
+                    __M_writer(u'</div>\n            </div>\n        </div>\n')
+                __M_writer(u'\n')
+        if c.cur_query and c.formated_results:
+            __M_writer(u'<div class="pagination-wh pagination-left" style="padding-left:16px">\n    ')
+            __M_writer(escape(c.formated_results.pager('$link_previous ~2~ $link_next')))
+            __M_writer(u'\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 2, "26": 3, "27": 4, "28": 5, "29": 6, "30": 6, "31": 8, "33": 9, "34": 13, "35": 13, "36": 17, "37": 18, "38": 19, "39": 20, "40": 20, "41": 21, "42": 21, "43": 25, "44": 28, "45": 29, "46": 30, "47": 30, "53": 47}, "uri": "/search/search_content.html", "filename": "/root/package/kallithea/templates/search/search_content.html"}
+__M_END_METADATA
+"""
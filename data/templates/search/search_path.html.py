@@ -0,0 +1,51 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253708.564468
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/search/search_path.html'
+_template_uri = u'/search/search_path.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        for cnt,sr in enumerate(c.formated_results):
+            if h.HasRepoPermissionAny('repository.write','repository.read','repository.admin')(sr['repository'],'search results check'):
+                __M_writer(u'        <div class="search_path">\n            <div class="link">\n                ')
+                __M_writer(escape(h.link_to(h.literal('%s &raquo; %s' % (sr['repository'],sr['f_path'])),
+                    h.url('files_home',repo_name=sr['repository'],revision='tip',f_path=sr['f_path']))))
+                __M_writer(u'\n            </div>\n        </div>\n')
+            else:
+                if cnt == 0:
+                    __M_writer(u'            <div class="error">\n                <div class="link">\n                    ')
+                    __M_writer(escape(_('Permission denied')))
+                    __M_writer(u'\n                </div>\n            </div>\n')
+                __M_writer(u'\n')
+        if c.cur_query and c.formated_results:
+            __M_writer(u'<div class="pagination-wh pagination-left">\n    ')
+            __M_writer(escape(c.formated_results.pager('$link_previous ~2~ $link_next')))
+            __M_writer(u'\n</div>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"32": 11, "33": 12, "34": 13, "35": 15, "36": 15, "37": 19, "38": 22, "39": 23, "40": 24, "41": 24, "47": 41, "16": 0, "25": 2, "26": 3, "27": 4, "28": 5, "29": 7, "31": 8}, "uri": "/search/search_path.html", "filename": "/root/package/kallithea/templates/search/search_path.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,205 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253710.173079
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/summary/statistics.html'
+_template_uri = 'summary/statistics.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', u'head_extra', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        def head_extra():
+            return render_head_extra(context._locals(__M_locals))
+        def title():
+            return render_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'head_extra'):
+            context['self'].head_extra(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('summary')))
+        __M_writer(u'\n    ')
+
+        summary = lambda n:{False:'summary-short'}.get(n)
+        
+        
+        __M_writer(u'\n    <div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n\n    <div class="graph">\n         <div style="padding:0 10px 10px 17px;">\n')
+        if c.no_data:
+            __M_writer(u'           ')
+            __M_writer(escape(c.no_data_msg))
+            __M_writer(u'\n')
+            if h.HasPermissionAll('hg.admin')('enable stats on from summary'):
+                __M_writer(u'                ')
+                __M_writer(escape(h.link_to(_('Enable'),h.url('edit_repo',repo_name=c.repo_name),class_="btn btn-mini")))
+                __M_writer(u'\n')
+        else:
+            __M_writer(u'            ')
+            __M_writer(escape(_('Stats gathered: ')))
+            __M_writer(u' ')
+            __M_writer(escape(c.stats_percentage))
+            __M_writer(u'%\n')
+        __M_writer(u'        </div>\n        <div id="commit_history" style="width:450px;height:300px;float:left"></div>\n\n        <div id="legend_data" style="float: left;">\n            <div id="legend_container"></div>\n            <div id="legend_choices">\n                <table id="legend_choices_tables" class="noborder" style="font-size:smaller;color:#545454"></table>\n            </div>\n        </div>\n\n        <div style="clear: both; height: 10px;"></div>\n        <div id="overview" style="width: 450px; height: 100px; float: left;"></div>\n    </div>\n</div>\n\n<script type="text/javascript">\nvar data = ')
+        __M_writer(c.trending_languages)
+        __M_writer(u';\nvar total = 0;\nvar no_data = true;\nvar tbl = document.createElement(\'table\');\ntbl.setAttribute(\'class\',\'trending_language_tbl\');\nvar cnt = 0;\nfor (var i=0;i<data.length;i++){\n    total+= data[i][1].count;\n}\nfor (var i=0;i<data.length;i++){\n    cnt += 1;\n    no_data = false;\n\n    var hide = cnt>2;\n    var tr = document.createElement(\'tr\');\n    if (hide){\n        tr.setAttribute(\'style\',\'display:none\');\n        tr.setAttribute(\'class\',\'stats_hidden\');\n    }\n    var k = data[i][0];\n    var obj = data[i][1];\n    var percentage = Math.round((obj.count/total*100),2);\n\n    var td1 = document.createElement(\'td\');\n    td1.width = 150;\n    var trending_language_label = document.createElement(\'div\');\n    trending_language_label.innerHTML = obj.desc+" ("+k+")";\n    td1.appendChild(trending_language_label);\n\n    var td2 = document.createElement(\'td\');\n    td2.setAttribute(\'style\',\'padding-right:14px !important\');\n    var trending_language = document.createElement(\'div\');\n    var nr_files = obj.count+" ')
+        __M_writer(escape(_('files')))
+        __M_writer(u'";\n\n    trending_language.title = k+" "+nr_files;\n\n    if (percentage>22){\n        trending_language.innerHTML = "<b style=\'font-size:0.8em\'>"+percentage+"% "+nr_files+ "</b>";\n    }\n    else{\n        trending_language.innerHTML = "<b style=\'font-size:0.8em\'>"+percentage+"%</b>";\n    }\n\n    trending_language.setAttribute("class", \'trending_language top-right-rounded-corner bottom-right-rounded-corner\');\n    trending_language.style.width=percentage+"%";\n    td2.appendChild(trending_language);\n\n    tr.appendChild(td1);\n    tr.appendChild(td2);\n    tbl.appendChild(tr);\n    if(cnt == 3){\n        var show_more = document.createElement(\'tr\');\n        var td = document.createElement(\'td\');\n        lnk = document.createElement(\'a\');\n\n        lnk.href=\'#\';\n        lnk.innerHTML = "')
+        __M_writer(escape(_('Show more')))
+        __M_writer(u'";\n        lnk.id=\'code_stats_show_more\';\n        td.appendChild(lnk);\n\n        show_more.appendChild(td);\n        show_more.appendChild(document.createElement(\'td\'));\n        tbl.appendChild(show_more);\n    }\n\n}\n\n</script>\n<script type="text/javascript">\n/**\n * Plots summary graph\n *\n * @class SummaryPlot\n * @param {from} initial from for detailed graph\n * @param {to} initial to for detailed graph\n * @param {dataset}\n * @param {overview_dataset}\n */\nfunction SummaryPlot(from,to,dataset,overview_dataset) {\n    var initial_ranges = {\n        "xaxis":{\n            "from":from,\n            "to":to\n        }\n    };\n    var dataset = dataset;\n    var overview_dataset = [overview_dataset];\n    var choiceContainer = YUD.get("legend_choices");\n    var choiceContainerTable = YUD.get("legend_choices_tables");\n    var plotContainer = YUD.get(\'commit_history\');\n    var overviewContainer = YUD.get(\'overview\');\n\n    var plot_options = {\n        bars: {show:true, align: \'center\', lineWidth: 4},\n        legend: {show:true, container: "legend_container"},\n        points: {show:true, radius: 0, fill: false},\n        yaxis: {tickDecimals: 0},\n        xaxis: {\n            mode: "time",\n            timeformat: "%d/%m",\n            min: from,\n            max: to\n        },\n        grid: {\n            hoverable: true,\n            clickable: true,\n            autoHighlight: true,\n            color: "#999"\n        },\n        //selection: {mode: "x"}\n    };\n    var overview_options = {\n        legend:{show:false},\n        bars: {show:true, barWidth: 2},\n        shadowSize: 0,\n        xaxis: {mode: "time", timeformat: "%d/%m/%y"},\n        yaxis: {ticks: 3, min: 0, tickDecimals:0},\n        grid: {color: "#999"},\n        selection: {mode: "x"}\n    };\n\n    /**\n    *get dummy data needed in few places\n    */\n    function getDummyData(label){\n        return {"label":label,\n         "data":[{"time":0,\n             "commits":0,\n                 "added":0,\n                 "changed":0,\n                 "removed":0\n            }],\n            "schema":["commits"],\n            "color":\'#ffffff\'\n        }\n    }\n\n    /**\n     * generate checkboxes accordindly to data\n     * @param keys\n     * @returns\n     */\n    function generateCheckboxes(data) {\n        //append checkboxes\n        var i = 0;\n        choiceContainerTable.innerHTML = \'\';\n        for(var pos in data) {\n\n            data[pos].color = i;\n            i++;\n            if(data[pos].label != \'\'){\n                choiceContainerTable.innerHTML +=\n                    \'<tr><td><input type="checkbox" id="id_user_{0}" name="{0}" checked="checked" /> ')
+        __M_writer(u'                     <label for="id_user_{0}">{0}</label></td></tr>\'.format(data[pos].label);\n            }\n        }\n    }\n\n    /**\n     * ToolTip show\n     */\n    function showTooltip(x, y, contents) {\n        var div=document.getElementById(\'tooltip\');\n        if(!div) {\n            div = document.createElement(\'div\');\n            div.id="tooltip";\n            div.style.position="absolute";\n            div.style.border=\'1px solid #fdd\';\n            div.style.padding=\'2px\';\n            div.style.backgroundColor=\'#fee\';\n            document.body.appendChild(div);\n        }\n        YUD.setStyle(div, \'opacity\', 0);\n        div.innerHTML = contents;\n        div.style.top=(y + 5) + "px";\n        div.style.left=(x + 5) + "px";\n\n        var anim = new YAHOO.util.Anim(div, {opacity: {to: 0.8}}, 0.2);\n        anim.animate();\n    }\n\n    /**\n     * This function will detect if selected period has some changesets\n       for this user if it does this data is then pushed for displaying\n       Additionally it will only display users that are selected by the checkbox\n    */\n    function getDataAccordingToRanges(ranges) {\n\n        var data = [];\n        var new_dataset = {};\n        var keys = [];\n        var max_commits = 0;\n        for(var key in dataset){\n\n            for(var ds in dataset[key].data){\n                commit_data = dataset[key].data[ds];\n                if (commit_data.time >= ranges.xaxis.from && commit_data.time <= ranges.xaxis.to){\n\n                    if(new_dataset[key] === undefined){\n                        new_dataset[key] = {data:[],schema:["commits"],label:key};\n                    }\n                    new_dataset[key].data.push(commit_data);\n                }\n            }\n            if (new_dataset[key] !== undefined){\n                data.push(new_dataset[key]);\n            }\n        }\n\n        if (data.length > 0){\n            return data;\n        }\n        else{\n            //just return dummy data for graph to plot itself\n            return [getDummyData(\'\')];\n        }\n    }\n\n    /**\n    * redraw using new checkbox data\n    */\n    function plotchoiced(e,args){\n        var cur_data = args[0];\n        var cur_ranges = args[1];\n\n        var new_data = [];\n        var inputs = choiceContainer.getElementsByTagName("input");\n\n        //show only checked labels\n        for(var i=0; i<inputs.length; i++) {\n            var checkbox_key = inputs[i].name;\n\n            if(inputs[i].checked){\n                for(var d in cur_data){\n                    if(cur_data[d].label == checkbox_key){\n                        new_data.push(cur_data[d]);\n                    }\n                }\n            }\n            else{\n                //push dummy data to not hide the label\n                new_data.push(getDummyData(checkbox_key));\n            }\n        }\n\n        var new_options = YAHOO.lang.merge(plot_options, {\n            xaxis: {\n                min: cur_ranges.xaxis.from,\n                max: cur_ranges.xaxis.to,\n                mode: "time",\n                timeformat: "%d/%m"\n            }\n        });\n        if (!new_data){\n            new_data = [[0,1]];\n        }\n        // do the zooming\n       plot = YAHOO.widget.Flot(plotContainer, new_data, new_options);\n\n       plot.subscribe("plotselected", plotselected);\n\n       //resubscribe plothover\n       plot.subscribe("plothover", plothover);\n\n       // don\'t fire event on the overview to prevent eternal loop\n       overview.setSelection(cur_ranges, true);\n\n    }\n\n    /**\n     * plot only selected items from overview\n     * @param ranges\n     * @returns\n     */\n    function plotselected(ranges,cur_data) {\n        //updates the data for new plot\n        var data = getDataAccordingToRanges(ranges);\n        generateCheckboxes(data);\n\n        var new_options = YAHOO.lang.merge(plot_options, {\n            xaxis: {\n                min: ranges.xaxis.from,\n                max: ranges.xaxis.to,\n                mode:"time",\n                timeformat: "%d/%m"\n            }\n        });\n        // do the zooming\n        plot = YAHOO.widget.Flot(plotContainer, data, new_options);\n\n        plot.subscribe("plotselected", plotselected);\n\n        //resubscribe plothover\n        plot.subscribe("plothover", plothover);\n\n        // don\'t fire event on the overview to prevent eternal loop\n        overview.setSelection(ranges, true);\n\n        //resubscribe choiced\n        YUE.on(choiceContainer.getElementsByTagName("input"), "click", plotchoiced, [data, ranges]);\n    }\n\n    var previousPoint = null;\n\n    function plothover(o) {\n        var pos = o.pos;\n        var item = o.item;\n\n        //YUD.get("x").innerHTML = pos.x.toFixed(2);\n        //YUD.get("y").innerHTML = pos.y.toFixed(2);\n        if (item) {\n            if (previousPoint != item.datapoint) {\n                previousPoint = item.datapoint;\n\n                var tooltip = YUD.get("tooltip");\n                if(tooltip) {\n                      tooltip.parentNode.removeChild(tooltip);\n                }\n                var x = item.datapoint.x.toFixed(2);\n                var y = item.datapoint.y.toFixed(2);\n\n                if (!item.series.label){\n                    item.series.label = \'commits\';\n                }\n                var d = new Date(x*1000);\n                var fd = d.toDateString()\n                var nr_commits = parseInt(y);\n\n                var cur_data = dataset[item.series.label].data[item.dataIndex];\n                var added = cur_data.added;\n                var changed = cur_data.changed;\n                var removed = cur_data.removed;\n\n                var nr_commits_suffix = " ')
+        __M_writer(escape(_('commits')))
+        __M_writer(u' ";\n                var added_suffix = " ')
+        __M_writer(escape(_('files added')))
+        __M_writer(u' ";\n                var changed_suffix = " ')
+        __M_writer(escape(_('files changed')))
+        __M_writer(u' ";\n                var removed_suffix = " ')
+        __M_writer(escape(_('files removed')))
+        __M_writer(u' ";\n\n                if(nr_commits == 1){nr_commits_suffix = " ')
+        __M_writer(escape(_('commit')))
+        __M_writer(u' ";}\n                if(added==1){added_suffix=" ')
+        __M_writer(escape(_('file added')))
+        __M_writer(u' ";}\n                if(changed==1){changed_suffix=" ')
+        __M_writer(escape(_('file changed')))
+        __M_writer(u' ";}\n                if(removed==1){removed_suffix=" ')
+        __M_writer(escape(_('file removed')))
+        __M_writer(u' ";}\n\n                showTooltip(item.pageX, item.pageY, item.series.label + " on " + fd\n                         +\'<br/>\'+\n                         nr_commits + nr_commits_suffix+\'<br/>\'+\n                         added + added_suffix +\'<br/>\'+\n                         changed + changed_suffix + \'<br/>\'+\n                         removed + removed_suffix + \'<br/>\');\n            }\n        }\n        else {\n              var tooltip = YUD.get("tooltip");\n\n              if(tooltip) {\n                    tooltip.parentNode.removeChild(tooltip);\n              }\n            previousPoint = null;\n        }\n    }\n\n    /**\n     * MAIN EXECUTION\n     */\n\n    var data = getDataAccordingToRanges(initial_ranges);\n    generateCheckboxes(data);\n\n    //main plot\n    var plot = YAHOO.widget.Flot(plotContainer,data,plot_options);\n\n    //overview\n    var overview = YAHOO.widget.Flot(overviewContainer,\n            overview_dataset, overview_options);\n\n    //show initial selection on overview\n    overview.setSelection(initial_ranges);\n\n    plot.subscribe("plotselected", plotselected);\n    plot.subscribe("plothover", plothover)\n\n    overview.subscribe("plotselected", function (ranges) {\n        plot.setSelection(ranges);\n    });\n\n    // user choices on overview\n    YUE.on(choiceContainer.getElementsByTagName("input"), "click", plotchoiced, [data, initial_ranges]);\n}\n    SummaryPlot(')
+        __M_writer(escape(c.ts_min))
+        __M_writer(u',')
+        __M_writer(escape(c.ts_max))
+        __M_writer(u',')
+        __M_writer(c.commit_data)
+        __M_writer(u',')
+        __M_writer(c.overview_data)
+        __M_writer(u');\n</script>\n\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_head_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        def head_extra():
+            return render_head_extra(context)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <link href="')
+        __M_writer(escape(h.url('atom_feed_home',repo_name=c.db_repo.repo_name,api_key=c.authuser.api_key)))
+        __M_writer(u'" rel="alternate" title="')
+        __M_writer(escape(_('%s ATOM feed') % c.repo_name))
+        __M_writer(u'" type="application/atom+xml" />\n  <link href="')
+        __M_writer(escape(h.url('rss_feed_home',repo_name=c.db_repo.repo_name,api_key=c.authuser.api_key)))
+        __M_writer(u'" rel="alternate" title="')
+        __M_writer(escape(_('%s RSS feed') % c.repo_name))
+        __M_writer(u'" type="application/rss+xml" />\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Statistics')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s Statistics') % c.repo_name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"128": 395, "129": 395, "130": 396, "131": 396, "132": 397, "133": 397, "134": 398, "135": 398, "136": 445, "137": 445, "138": 445, "139": 445, "140": 445, "141": 445, "142": 445, "143": 445, "149": 15, "27": 0, "158": 15, "159": 16, "160": 16, "161": 16, "162": 16, "163": 17, "164": 17, "165": 17, "166": 17, "42": 1, "172": 7, "47": 5, "48": 9, "177": 7, "178": 8, "179": 8, "53": 13, "201": 195, "185": 3, "58": 18, "59": 448, "65": 11, "194": 4, "195": 4, "72": 11, "73": 12, "74": 12, "80": 20, "193": 3, "88": 20, "89": 21, "90": 21, "91": 22, "95": 24, "96": 28, "97": 28, "98": 33, "99": 34, "100": 34, "101": 34, "102": 35, "103": 36, "104": 36, "105": 36, "106": 38, "107": 39, "108": 39, "109": 39, "110": 39, "111": 39, "112": 41, "113": 57, "114": 57, "115": 89, "116": 89, "117": 113, "118": 113, "119": 210, "120": 390, "121": 390, "122": 391, "123": 391, "124": 392, "125": 392, "126": 393, "127": 393}, "uri": "summary/statistics.html", "filename": "/root/package/kallithea/templates/summary/statistics.html"}
+__M_END_METADATA
+"""
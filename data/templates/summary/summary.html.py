@@ -0,0 +1,369 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253614.850386
+_enable_loop = True
+_template_filename = '/root/package/kallithea/templates/summary/summary.html'
+_template_uri = 'summary/summary.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = [u'header_menu', 'main', u'head_extra', 'breadcrumbs_links', u'title']
+
+
+def _mako_get_namespace(context, name):
+    try:
+        return context.namespaces[(__name__, name)]
+    except KeyError:
+        _mako_generate_namespaces(context)
+        return context.namespaces[(__name__, name)]
+def _mako_generate_namespaces(context):
+    pass
+def _mako_inherit(template, context):
+    _mako_generate_namespaces(context)
+    return runtime._inherit_from(context, u'/base/base.html', _template_uri)
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        def header_menu():
+            return render_header_menu(context._locals(__M_locals))
+        c = context.get('c', UNDEFINED)
+        def head_extra():
+            return render_head_extra(context._locals(__M_locals))
+        def title():
+            return render_title(context._locals(__M_locals))
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'title'):
+            context['self'].title(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'header_menu'):
+            context['self'].header_menu(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        if 'parent' not in context._data or not hasattr(context._data['parent'], 'head_extra'):
+            context['self'].head_extra(**pageargs)
+        
+
+        __M_writer(u'\n\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_header_menu(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        def header_menu():
+            return render_header_menu(context)
+        self = context.get('self', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(self.menu('repositories')))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_main(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        h = context.get('h', UNDEFINED)
+        self = context.get('self', UNDEFINED)
+        len = context.get('len', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n')
+        __M_writer(escape(self.repo_context_bar('summary')))
+        __M_writer(u'\n')
+
+        summary = lambda n:{False:'summary-short'}.get(n)
+        
+        
+        __M_writer(u'\n<div class="box">\n    <!-- box / title -->\n    <div class="title">\n        ')
+        __M_writer(escape(self.breadcrumbs()))
+        __M_writer(u'\n    </div>\n    <!-- end box / title -->\n    <div class="form">\n        <div id="summary" class="fields">\n            <div class="field">\n                <div class="label-summary">\n                  <label>')
+        __M_writer(escape(_('Clone URL')))
+        __M_writer(u':</label>\n                </div>\n                <div class="input ')
+        __M_writer(escape(summary(c.show_stats)))
+        __M_writer(u'">\n                  ')
+        __M_writer(escape(self.repotag(c.db_repo)))
+        __M_writer(u'\n                  <input style="width:80%" type="text" id="clone_url" readonly="readonly" value="')
+        __M_writer(escape(c.clone_repo_url))
+        __M_writer(u'"/>\n                  <input style="display:none;width:80%" type="text" id="clone_url_id" readonly="readonly" value="')
+        __M_writer(escape(c.clone_repo_url_id))
+        __M_writer(u'"/>\n                  <div style="display:none" id="clone_by_name" class="btn btn-small">')
+        __M_writer(escape(_('Show by Name')))
+        __M_writer(u'</div>\n                  <div id="clone_by_id" class="btn btn-small">')
+        __M_writer(escape(_('Show by ID')))
+        __M_writer(u'</div>\n                </div>\n            </div>\n\n            <div class="field">\n              <div class="label-summary">\n                  <label>')
+        __M_writer(escape(_('Description')))
+        __M_writer(u':</label>\n              </div>\n')
+        if c.visual.stylify_metatags:
+            __M_writer(u'                   <div class="input ')
+            __M_writer(escape(summary(c.show_stats)))
+            __M_writer(u' desc">')
+            __M_writer(escape(h.urlify_text(h.desc_stylize(h.escape(c.db_repo.description)))))
+            __M_writer(u'</div>\n')
+        else:
+            __M_writer(u'                   <div class="input ')
+            __M_writer(escape(summary(c.show_stats)))
+            __M_writer(u' desc">')
+            __M_writer(escape(h.urlify_text(h.escape(c.db_repo.description))))
+            __M_writer(u'</div>\n')
+        __M_writer(u'            </div>\n\n            <div class="field">\n              <div class="label-summary">\n                  <label>')
+        __M_writer(escape(_('Trending files')))
+        __M_writer(u':</label>\n              </div>\n              <div class="input ')
+        __M_writer(escape(summary(c.show_stats)))
+        __M_writer(u'">\n')
+        if c.show_stats:
+            __M_writer(u'                <div id="lang_stats"></div>\n')
+        else:
+            __M_writer(u'                   ')
+            __M_writer(escape(_('Statistics are disabled for this repository')))
+            __M_writer(u'\n')
+            if h.HasPermissionAll('hg.admin')('enable stats on from summary'):
+                __M_writer(u'                        ')
+                __M_writer(escape(h.link_to(_('Enable'),h.url('edit_repo',repo_name=c.repo_name, anchor='repo_enable_statistics'),class_="btn btn-mini")))
+                __M_writer(u'\n')
+        __M_writer(u'              </div>\n            </div>\n\n            <div class="field">\n              <div class="label-summary">\n                  <label>')
+        __M_writer(escape(_('Download')))
+        __M_writer(u':</label>\n              </div>\n              <div class="input ')
+        __M_writer(escape(summary(c.show_stats)))
+        __M_writer(u'">\n')
+        if len(c.db_repo_scm_instance.revisions) == 0:
+            __M_writer(u'                  ')
+            __M_writer(escape(_('There are no downloads yet')))
+            __M_writer(u'\n')
+        elif not c.enable_downloads:
+            __M_writer(u'                  ')
+            __M_writer(escape(_('Downloads are disabled for this repository')))
+            __M_writer(u'\n')
+            if h.HasPermissionAll('hg.admin')('enable downloads on from summary'):
+                __M_writer(u'                        ')
+                __M_writer(escape(h.link_to(_('Enable'),h.url('edit_repo',repo_name=c.repo_name, anchor='repo_enable_downloads'),class_="btn btn-mini")))
+                __M_writer(u'\n')
+        else:
+            __M_writer(u'                    <span id="')
+            __M_writer(escape('zip_link'))
+            __M_writer(u'">\n                        <a class="btn btn-small" href="')
+            __M_writer(escape(h.url('files_archive_home',repo_name=c.db_repo.repo_name,fname='tip.zip')))
+            __M_writer(u'"><i class="icon-file-zip"></i> ')
+            __M_writer(escape(_('Download as zip')))
+            __M_writer(u'</a>\n                    </span>\n                    ')
+            __M_writer(escape(h.hidden('download_options')))
+            __M_writer(u'\n                    <span style="vertical-align: bottom">\n                      <input id="archive_subrepos" type="checkbox" name="subrepos" />\n                      <label for="archive_subrepos" class="tooltip" title="')
+            __M_writer(escape(h.tooltip(_('Check this to download archive with subrepos'))))
+            __M_writer(u'" >')
+            __M_writer(escape(_('with subrepos')))
+            __M_writer(u'</label>\n                    </span>\n')
+        __M_writer(u'              </div>\n            </div>\n        </div>\n        <div id="summary-menu-stats">\n          <ul>\n            <li>\n               <a title="')
+        __M_writer(escape(_('Owner')))
+        __M_writer(u' ')
+        __M_writer(escape(c.db_repo.user.email))
+        __M_writer(u'">\n                <i class="icon-user"></i> ')
+        __M_writer(escape(c.db_repo.user.username))
+        __M_writer(u'\n                  <div class="gravatar" style="float: right; margin: 0px 0px 0px 0px" title="')
+        __M_writer(escape(c.db_repo.user.name))
+        __M_writer(u' ')
+        __M_writer(escape(c.db_repo.user.lastname))
+        __M_writer(u'">\n                    ')
+        __M_writer(escape(h.gravatar(c.db_repo.user.email, size=18)))
+        __M_writer(u'\n                  </div>\n              </a>\n            </li>\n            <li>\n               <a title="')
+        __M_writer(escape(_('Followers')))
+        __M_writer(u'" href="')
+        __M_writer(escape(h.url('repo_followers_home',repo_name=c.repo_name)))
+        __M_writer(u'">\n                <i class="icon-heart"></i> ')
+        __M_writer(escape(_('Followers')))
+        __M_writer(u'\n                <span class="stats-bullet" id="current_followers_count">')
+        __M_writer(escape(c.repository_followers))
+        __M_writer(u'</span>\n              </a>\n            </li>\n            <li>\n              <a title="')
+        __M_writer(escape(_('Forks')))
+        __M_writer(u'" href="')
+        __M_writer(escape(h.url('repo_forks_home',repo_name=c.repo_name)))
+        __M_writer(u'">\n                <i class="icon-fork"></i> ')
+        __M_writer(escape(_('Forks')))
+        __M_writer(u'\n                <span class="stats-bullet">')
+        __M_writer(escape(c.repository_forks))
+        __M_writer(u'</span>\n              </a>\n            </li>\n\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'            <li class="repo_size">\n              <a href="#" onclick="javascript:showRepoSize(\'repo_size_2\',\'')
+            __M_writer(escape(c.db_repo.repo_name))
+            __M_writer(u'\')"><i class="icon-ruler"></i> ')
+            __M_writer(escape(_('Repository Size')))
+            __M_writer(u'</a>\n              <span  class="stats-bullet" id="repo_size_2"></span>\n            </li>\n')
+        __M_writer(u'\n            <li>\n')
+        if c.authuser.username != 'default':
+            __M_writer(u'              <a href="')
+            __M_writer(escape(h.url('atom_feed_home',repo_name=c.db_repo.repo_name,api_key=c.authuser.api_key)))
+            __M_writer(u'"><i class="icon-rss-squared"></i> ')
+            __M_writer(escape(_('Feed')))
+            __M_writer(u'</a>\n')
+        else:
+            __M_writer(u'              <a href="')
+            __M_writer(escape(h.url('atom_feed_home',repo_name=c.db_repo.repo_name)))
+            __M_writer(u'"><i class="icon-rss-squared"></i> ')
+            __M_writer(escape(_('Feed')))
+            __M_writer(u'</a>\n')
+        __M_writer(u'            </li>\n\n')
+        if c.show_stats:
+            __M_writer(u'            <li>\n              <a title="')
+            __M_writer(escape(_('Statistics')))
+            __M_writer(u'" href="')
+            __M_writer(escape(h.url('repo_stats_home',repo_name=c.repo_name)))
+            __M_writer(u'">\n                <i class="icon-graph"></i> ')
+            __M_writer(escape(_('Statistics')))
+            __M_writer(u'\n              </a>\n            </li>\n')
+        __M_writer(u'          </ul>\n        </div>\n    </div>\n</div>\n\n\n<div class="box">\n    <div class="title">\n        <div class="breadcrumbs">\n')
+        if c.repo_changesets:
+            __M_writer(u'            ')
+            __M_writer(escape(h.link_to(_('Latest Changes'),h.url('changelog_home',repo_name=c.repo_name))))
+            __M_writer(u'\n')
+        else:
+            __M_writer(u'            ')
+            __M_writer(escape(_('Quick Start')))
+            __M_writer(u'\n')
+        __M_writer(u'        </div>\n    </div>\n    <div class="table">\n        <div id="shortlog_data">\n            ')
+        runtime._include_file(context, u'../changelog/changelog_summary_data.html', _template_uri)
+        __M_writer(u'\n        </div>\n    </div>\n</div>\n\n')
+        if c.readme_data:
+            __M_writer(u'<div id="readme" class="anchor">\n<div class="box" style="background-color: #FAFAFA">\n    <div class="title" title="')
+            __M_writer(escape(_('Readme file from revision %s:%s') % (c.db_repo.landing_rev[0], c.db_repo.landing_rev[1])))
+            __M_writer(u'">\n        <div class="breadcrumbs">\n            <a href="')
+            __M_writer(escape(h.url('files_home',repo_name=c.repo_name,revision='tip',f_path=c.readme_file)))
+            __M_writer(u'">')
+            __M_writer(escape(c.readme_file))
+            __M_writer(u'</a>\n        </div>\n    </div>\n    <div class="readme">\n      <div class="readme_box">\n        ')
+            __M_writer(c.readme_data)
+            __M_writer(u'\n      </div>\n    </div>\n</div>\n</div>\n')
+        __M_writer(u'\n<script type="text/javascript">\n$(document).ready(function(){\n    var $clone_url = $(\'#clone_url\');\n    var $clone_url_id = $(\'#clone_url_id\');\n    var $clone_by_name = $(\'#clone_by_name\');\n    var $clone_by_id = $(\'#clone_by_id\');\n    $clone_url.click(function(e){\n        if($clone_url.hasClass(\'selected\')){\n            return ;\n        }else{\n            $clone_url.addClass(\'selected\');\n            $clone_url.select();\n        }\n    });\n\n    $clone_by_name.click(function(e){\n        // show url by name and hide name button\n        $clone_url.show();\n        $clone_by_name.hide();\n\n        // hide url by id and show name button\n        $clone_by_id.show();\n        $clone_url_id.hide();\n    });\n\n    $clone_by_id.click(function(e){\n        // show url by id and hide id button\n        $clone_by_id.hide();\n        $clone_url_id.show();\n\n        // hide url by name and show id button\n        $clone_by_name.show();\n        $clone_url.hide();\n    });\n\n    var cache = {}\n    $("#download_options").select2({\n        placeholder: _TM[\'Select changeset\'],\n        dropdownAutoWidth: true,\n        query: function(query){\n          var key = \'cache\';\n          var cached = cache[key] ;\n          if(cached) {\n            var data = {results: []};\n            //filter results\n            $.each(cached.results, function(){\n                var section = this.text;\n                var children = [];\n                $.each(this.children, function(){\n                    if(query.term.length == 0 || this.text.toUpperCase().indexOf(query.term.toUpperCase()) >= 0 ){\n                        children.push({\'id\': this.id, \'text\': this.text})\n                    }\n                })\n                data.results.push({\'text\': section, \'children\': children})\n            });\n            query.callback(data);\n          }else{\n              $.ajax({\n                url: pyroutes.url(\'repo_refs_data\', {\'repo_name\': \'')
+        __M_writer(escape(c.repo_name))
+        __M_writer(u'\'}),\n                data: {},\n                dataType: \'json\',\n                type: \'GET\',\n                success: function(data) {\n                  cache[key] = data;\n                  query.callback({results: data.results});\n                }\n              })\n          }\n        }\n    });\n    // on change of download options\n    $(\'#download_options\').change(function(e){\n       var new_cs = e.added\n\n       for(k in tmpl_links){\n           var s = $(\'#\'+k+\'_link\');\n           if(s){\n             var title_tmpl = "')
+        __M_writer(escape(_('Download %s as %s') % ('__CS_NAME__','__CS_EXT__')))
+        __M_writer(u'";\n             title_tmpl= title_tmpl.replace(\'__CS_NAME__\',new_cs.text);\n             title_tmpl = title_tmpl.replace(\'__CS_EXT__\',k);\n             title_tmpl = \'<i class="icon-file-zip"></i> \'+ title_tmpl;\n             var url = tmpl_links[k].replace(\'__CS__\',new_cs.id);\n             var subrepos = $(\'#archive_subrepos\').is(\':checked\');\n             url = url.replace(\'__SUB__\',subrepos);\n             url = url.replace(\'__NAME__\',title_tmpl);\n\n             s.html(url)\n           }\n       }\n    });\n\n    var tmpl_links = {};\n')
+        for cnt,archive in enumerate(c.db_repo_scm_instance._get_archives()):
+            __M_writer(u'      tmpl_links["')
+            __M_writer(escape(archive['type']))
+            __M_writer(u'"] = \'')
+            __M_writer(escape(h.link_to('__NAME__', h.url('files_archive_home',repo_name=c.db_repo.repo_name, fname='__CS__'+archive['extension'],subrepos='__SUB__'),class_='btn btn-small')))
+            __M_writer(u"';\n")
+        __M_writer(u'})\n</script>\n\n')
+        if c.show_stats:
+            __M_writer(u'<script type="text/javascript">\n$(document).ready(function(){\n    var data = ')
+            __M_writer(c.trending_languages)
+            __M_writer(u';\n    var total = 0;\n    var no_data = true;\n    var tbl = document.createElement(\'table\');\n    tbl.setAttribute(\'class\',\'trending_language_tbl\');\n    var cnt = 0;\n    for (var i=0;i<data.length;i++){\n        total+= data[i][1].count;\n    }\n    for (var i=0;i<data.length;i++){\n        cnt += 1;\n        no_data = false;\n\n        var hide = cnt>2;\n        var tr = document.createElement(\'tr\');\n        if (hide){\n            tr.setAttribute(\'style\',\'display:none\');\n            tr.setAttribute(\'class\',\'stats_hidden\');\n        }\n        var k = data[i][0];\n        var obj = data[i][1];\n        var percentage = Math.round((obj.count/total*100),2);\n\n        var td1 = document.createElement(\'td\');\n        td1.width = 150;\n        var trending_language_label = document.createElement(\'div\');\n        trending_language_label.innerHTML = obj.desc+" ("+k+")";\n        td1.appendChild(trending_language_label);\n\n        var td2 = document.createElement(\'td\');\n        td2.setAttribute(\'style\',\'padding-right:14px !important\');\n        var trending_language = document.createElement(\'div\');\n        var nr_files = obj.count+" ')
+            __M_writer(escape(_('files')))
+            __M_writer(u'";\n\n        trending_language.title = k+" "+nr_files;\n\n        if (percentage>22){\n            trending_language.innerHTML = "<b style=\'font-size:0.8em\'>"+percentage+"% "+nr_files+ "</b>";\n        }\n        else{\n            trending_language.innerHTML = "<b style=\'font-size:0.8em\'>"+percentage+"%</b>";\n        }\n\n        trending_language.setAttribute("class", \'trending_language top-right-rounded-corner bottom-right-rounded-corner\');\n        trending_language.style.width=percentage+"%";\n        td2.appendChild(trending_language);\n\n        tr.appendChild(td1);\n        tr.appendChild(td2);\n        tbl.appendChild(tr);\n        if(cnt == 3){\n            var show_more = document.createElement(\'tr\');\n            var td = document.createElement(\'td\');\n            lnk = document.createElement(\'a\');\n\n            lnk.href=\'#\';\n            lnk.innerHTML = "')
+            __M_writer(escape(_('Show more')))
+            __M_writer(u'";\n            lnk.id=\'code_stats_show_more\';\n            td.appendChild(lnk);\n\n            show_more.appendChild(td);\n            show_more.appendChild(document.createElement(\'td\'));\n            tbl.appendChild(show_more);\n        }\n\n    }\n    if (data.length == 0) {\n        tbl.innerHTML = "<tr><td>')
+            __M_writer(escape(_('No data ready yet')))
+            __M_writer(u'</td></tr>";\n    }\n\n    $(\'#lang_stats\').append(tbl);\n    $(\'#code_stats_show_more\').click(function(){\n        $(\'.stats_hidden\').show();\n        $(\'#code_stats_show_more\').hide();\n    });\n});\n</script>\n')
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_head_extra(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        def head_extra():
+            return render_head_extra(context)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n  <link href="')
+        __M_writer(escape(h.url('atom_feed_home',repo_name=c.db_repo.repo_name,api_key=c.authuser.api_key)))
+        __M_writer(u'" rel="alternate" title="')
+        __M_writer(escape(_('%s ATOM feed') % c.repo_name))
+        __M_writer(u'" type="application/atom+xml" />\n  <link href="')
+        __M_writer(escape(h.url('rss_feed_home',repo_name=c.db_repo.repo_name,api_key=c.authuser.api_key)))
+        __M_writer(u'" rel="alternate" title="')
+        __M_writer(escape(_('%s RSS feed') % c.repo_name))
+        __M_writer(u'" type="application/rss+xml" />\n\n  <script>\n  redirect_hash_branch = function(){\n    var branch = window.location.hash.replace(/^#(.*)/, \'$1\');\n    if (branch){\n      window.location = "')
+        __M_writer(escape(h.url('changelog_home',repo_name=c.repo_name,branch='__BRANCH__')))
+        __M_writer(u'"\n        .replace(\'__BRANCH__\',branch);\n    }\n  }\n  redirect_hash_branch();\n  window.onhashchange = function() {\n    redirect_hash_branch();\n  };\n  </script>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_breadcrumbs_links(context):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        str = context.get('str', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('Summary')))
+        __M_writer(u'\n\n')
+        if c.db_repo.enable_locking:
+            if c.db_repo.locked[0]:
+                __M_writer(u'       <span class="locking_locked tooltip icon-block" title="')
+                __M_writer(escape(_('Repository locked by %s') % h.person_by_id(c.db_repo.locked[0])))
+                __M_writer(u'"></span>\n')
+            else:
+                __M_writer(u'       <span class="locking_unlocked tooltip icon-ok" title="')
+                __M_writer(escape(_('Repository unlocked')))
+                __M_writer(u'"></span>\n')
+        __M_writer(u'\n')
+        if c.db_repo.fork:
+            __M_writer(u'    <span>\n        - <i class="icon-fork"></i> ')
+            __M_writer(escape(_('Fork of')))
+            __M_writer(u' "<a href="')
+            __M_writer(escape(h.url('summary_home',repo_name=c.db_repo.fork.repo_name)))
+            __M_writer(u'">')
+            __M_writer(escape(c.db_repo.fork.repo_name))
+            __M_writer(u'</a>"\n    </span>\n')
+        __M_writer(u'\n')
+        if c.db_repo.clone_uri:
+            __M_writer(u'    <span>\n       - <i class="icon-fork"></i> ')
+            __M_writer(escape(_('Clone from')))
+            __M_writer(u' "<a href="')
+            __M_writer(escape(h.url(str(h.hide_credentials(c.db_repo.clone_uri)))))
+            __M_writer(u'">')
+            __M_writer(escape(h.hide_credentials(c.db_repo.clone_uri)))
+            __M_writer(u'</a>"\n    <span>\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+def render_title(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        def title():
+            return render_title(context)
+        __M_writer = context.writer()
+        __M_writer(u'\n    ')
+        __M_writer(escape(_('%s Summary') % c.repo_name))
+        __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"27": 0, "42": 1, "47": 5, "48": 32, "53": 36, "58": 55, "59": 400, "65": 34, "72": 34, "73": 35, "74": 35, "80": 57, "90": 57, "91": 58, "92": 58, "93": 59, "97": 61, "98": 65, "99": 65, "100": 72, "101": 72, "102": 74, "103": 74, "104": 75, "105": 75, "106": 76, "107": 76, "108": 77, "109": 77, "110": 78, "111": 78, "112": 79, "113": 79, "114": 85, "115": 85, "116": 87, "117": 88, "118": 88, "119": 88, "120": 88, "121": 88, "122": 89, "123": 90, "124": 90, "125": 90, "126": 90, "127": 90, "128": 92, "129": 96, "130": 96, "131": 98, "132": 98, "133": 99, "134": 100, "135": 101, "136": 102, "137": 102, "138": 102, "139": 103, "140": 104, "141": 104, "142": 104, "143": 107, "144": 112, "145": 112, "146": 114, "147": 114, "148": 115, "149": 116, "150": 116, "151": 116, "152": 117, "153": 118, "154": 118, "155": 118, "156": 119, "157": 120, "158": 120, "159": 120, "160": 122, "161": 123, "162": 123, "163": 123, "164": 124, "165": 124, "166": 124, "167": 124, "168": 126, "169": 126, "170": 129, "171": 129, "172": 129, "173": 129, "174": 132, "175": 138, "176": 138, "177": 138, "178": 138, "179": 139, "180": 139, "181": 140, "182": 140, "183": 140, "184": 140, "185": 141, "186": 141, "187": 146, "188": 146, "189": 146, "190": 146, "191": 147, "192": 147, "193": 148, "194": 148, "195": 152, "196": 152, "197": 152, "198": 152, "199": 153, "200": 153, "201": 154, "202": 154, "203": 158, "204": 159, "205": 160, "206": 160, "207": 160, "208": 160, "209": 164, "210": 166, "211": 167, "212": 167, "213": 167, "214": 167, "215": 167, "216": 168, "217": 169, "218": 169, "219": 169, "220": 169, "221": 169, "222": 171, "223": 173, "224": 174, "225": 175, "226": 175, "227": 175, "228": 175, "229": 176, "230": 176, "231": 180, "232": 189, "233": 190, "234": 190, "235": 190, "236": 191, "237": 192, "238": 192, "239": 192, "240": 194, "241": 198, "242": 198, "243": 203, "244": 204, "245": 206, "246": 206, "247": 208, "248": 208, "249": 208, "250": 208, "251": 213, "252": 213, "253": 219, "254": 278, "255": 278, "256": 297, "257": 297, "258": 312, "259": 313, "260": 313, "261": 313, "262": 313, "263": 313, "264": 315, "265": 318, "266": 319, "267": 321, "268": 321, "269": 353, "270": 353, "271": 377, "272": 377, "273": 388, "274": 388, "275": 399, "281": 38, "290": 38, "291": 39, "292": 39, "293": 39, "294": 39, "295": 40, "296": 40, "297": 40, "298": 40, "299": 46, "300": 46, "306": 7, "314": 7, "315": 8, "316": 8, "317": 11, "318": 12, "319": 13, "320": 13, "321": 13, "322": 14, "323": 15, "324": 15, "325": 15, "326": 18, "327": 20, "328": 21, "329": 22, "330": 22, "331": 22, "332": 22, "333": 22, "334": 22, "335": 25, "336": 27, "337": 28, "338": 29, "339": 29, "340": 29, "341": 29, "342": 29, "343": 29, "349": 3, "357": 3, "358": 4, "359": 4, "365": 359}, "uri": "summary/summary.html", "filename": "/root/package/kallithea/templates/summary/summary.html"}
+__M_END_METADATA
+"""
@@ -0,0 +1,80 @@
+# -*- coding:utf-8 -*-
+from mako import runtime, filters, cache
+UNDEFINED = runtime.UNDEFINED
+__M_dict_builtin = dict
+__M_locals_builtin = locals
+_magic_number = 10
+_modified_time = 1792253711.409602
+_enable_loop = True
+_template_filename = u'/root/package/kallithea/templates/tags/tags_data.html'
+_template_uri = u'tags/tags_data.html'
+_source_encoding = 'utf-8'
+from webhelpers.html import escape
+_exports = []
+
+
+def render_body(context,**pageargs):
+    __M_caller = context.caller_stack._push_frame()
+    try:
+        __M_locals = __M_dict_builtin(pageargs=pageargs)
+        h = context.get('h', UNDEFINED)
+        c = context.get('c', UNDEFINED)
+        _ = context.get('_', UNDEFINED)
+        enumerate = context.get('enumerate', UNDEFINED)
+        __M_writer = context.writer()
+        if c.repo_tags:
+            __M_writer(u'   <div id="table_wrap" class="yui-skin-sam">\n    <table id="tags_data">\n      <thead>\n        <tr>\n            <th class="left">Raw name</th> ##notranslation\n            <th class="left">')
+            __M_writer(escape(_('Name')))
+            __M_writer(u'</th>\n            <th class="left">Raw date</th> ##notranslation\n            <th class="left">')
+            __M_writer(escape(_('Date')))
+            __M_writer(u'</th>\n            <th class="left">')
+            __M_writer(escape(_('Author')))
+            __M_writer(u'</th>\n            <th class="left">Raw rev</th> ##notranslation\n            <th class="left">')
+            __M_writer(escape(_('Revision')))
+            __M_writer(u'</th>\n            <th class="left">')
+            __M_writer(escape(_('Compare')))
+            __M_writer(u'</th>\n        </tr>\n      </thead>\n')
+            for cnt,tag in enumerate(c.repo_tags.items()):
+                __M_writer(u'        <tr class="parity')
+                __M_writer(escape(cnt%2))
+                __M_writer(u'">\n            <td>')
+                __M_writer(escape(tag[0]))
+                __M_writer(u'</td>\n            <td>\n                <span class="logtags">\n                    <span class="tagtag">')
+                __M_writer(escape(h.link_to(tag[0],
+                    h.url('changeset_home',repo_name=c.repo_name,revision=tag[1].raw_id))))
+                __M_writer(u'\n                    </span>\n                </span>\n            </td>\n            <td>')
+                __M_writer(escape(tag[1]._timestamp))
+                __M_writer(u'</td>\n            <td><span class="tooltip" title="')
+                __M_writer(escape(h.tooltip(h.age(tag[1].date))))
+                __M_writer(u'">')
+                __M_writer(escape(h.fmt_date(tag[1].date)))
+                __M_writer(u'</span></td>\n            <td title="')
+                __M_writer(escape(tag[1].author))
+                __M_writer(u'">')
+                __M_writer(escape(h.person(tag[1].author)))
+                __M_writer(u'</td>\n            <td>')
+                __M_writer(escape(tag[1].revision))
+                __M_writer(u'</td>\n            <td>\n                <div>\n                    <a href="')
+                __M_writer(escape(h.url('changeset_home',repo_name=c.repo_name,revision=tag[1].raw_id)))
+                __M_writer(u'" class="revision-link">')
+                __M_writer(escape(h.show_id(tag[1])))
+                __M_writer(u'</a>\n                </div>\n            </td>\n            <td>\n                <input class="branch-compare" type="radio" name="compare_org" value="')
+                __M_writer(escape(tag[0]))
+                __M_writer(u'"/>\n                <input class="branch-compare" type="radio" name="compare_other" value="')
+                __M_writer(escape(tag[0]))
+                __M_writer(u'"/>\n            </td>\n        </tr>\n')
+            __M_writer(u'    </table>\n   </div>\n')
+        else:
+            __M_writer(u'    ')
+            __M_writer(escape(_('There are no tags yet')))
+            __M_writer(u'\n')
+        return ''
+    finally:
+        context.caller_stack._pop_frame()
+
+
+"""
+__M_BEGIN_METADATA
+{"source_encoding": "utf-8", "line_map": {"16": 0, "25": 1, "26": 2, "27": 7, "28": 7, "29": 9, "30": 9, "31": 10, "32": 10, "33": 12, "34": 12, "35": 13, "36": 13, "37": 16, "38": 17, "39": 17, "40": 17, "41": 18, "42": 18, "43": 21, "45": 22, "46": 26, "47": 26, "48": 27, "49": 27, "50": 27, "51": 27, "52": 28, "53": 28, "54": 28, "55": 28, "56": 29, "57": 29, "58": 32, "59": 32, "60": 32, "61": 32, "62": 36, "63": 36, "64": 37, "65": 37, "66": 41, "67": 43, "68": 44, "69": 44, "70": 44, "76": 70}, "uri": "tags/tags_data.html", "filename": "/root/package/kallithea/templates/tags/tags_data.html"}
+__M_END_METADATA
+"""
@@ -54,8 +54,7 @@ max_request_body_size = 107374182400
 %if http_server == 'gunicorn':
 <%text>## GUNICORN ##</%text>
 use = egg:gunicorn#main
-<%text>## number of process workers. You must set `instance_id = *` when this option</%text>
-<%text>## is set to more than one worker</%text>
+<%text>## number of process workers</%text>
 workers = 1
 <%text>## process name</%text>
 proc_name = kallithea
@@ -157,14 +156,41 @@ initial_repo_scan = false
 <%text>## uncomment and set this path to use archive download cache</%text>
 archive_cache_dir = ${here}/tarballcache
 
+<%text>## size in megabytes the archive cache is limited to, unlimited if not set</%text>
+#archive_cache_size = 1024
+<%text>## compression level of archives, from 1 (fastest) to 9 (smallest, default)</%text>
+#archive_compression_level = 9
+<%text>## number of threads compressing each gzip and zip archive</%text>
+#archive_compression_threads = 1
+
+<%text>## how cached archives are sent: python (default), x-sendfile (apache with</%text>
+<%text>## mod_xsendfile, lighttpd) or x-accel-redirect (nginx)</%text>
+#file_send_mode = python
+<%text>## internal nginx location serving archive_cache_dir, for x-accel-redirect</%text>
+#archive_cache_location = /archive_cache/
+
 <%text>## change this to unique ID for security</%text>
 app_instance_uuid = ${uuid()}
 
 <%text>## cut off limit for large diffs (size in bytes)</%text>
 cut_off_limit = 256000
 
+<%text>## size in megabytes of the cache of parsed diffs kept in cache_dir</%text>
+#diff_cache_size = 100
+
+<%text>## size in megabytes of the memory cache of syntax highlighted files</%text>
+#highlight_cache_size = 64
+
 <%text>## use cache version of scm repo everywhere</%text>
 vcs_full_cache = true
+<%text>## number of open repositories kept in memory by each process</%text>
+vcs_full_cache_size = 100
+
+<%text>## cache computed permissions of users in the long_term cache region</%text>
+#permission_cache = true
+
+<%text>## seconds successful verifications of VCS credentials are reused for</%text>
+#auth_cache_ttl = 60
 
 <%text>## force https in Kallithea, fixes https redirects, assumes it's always https</%text>
 force_https = false
@@ -175,6 +201,11 @@ use_htsts = false
 <%text>## number of commits stats will parse on each iteration</%text>
 commit_parse_limit = 25
 
+<%text>## number of processes parsing commits for stats in parallel, each of them</%text>
+<%text>## parses commit_parse_limit commits on each iteration, only used when</%text>
+<%text>## use_celery is enabled</%text>
+commit_parse_processes = 1
+
 <%text>## path to git executable</%text>
 git_path = git
 
@@ -182,6 +213,19 @@ git_path = git
 <%text>## hide all refs in changelog switch this to --branches --tags</%text>
 #git_rev_filter = --branches --tags
 
+<%text>## size in megabytes of the cache of git upload-pack responses of full clones</%text>
+<%text>## kept in cache_dir, no responses are cached if unset</%text>
+#git_pack_cache_size = 1024
+
+<%text>## keep a commit graph cache file in each git repository, it's written by</%text>
+<%text>## push hooks and remote pulls and saves running git rev-list for every</%text>
+<%text>## repository access until the refs change</%text>
+#git_commit_graph_cache = true
+
+<%text>## number of files and directories of mercurial manifests each process keeps</%text>
+<%text>## indexed in memory for browsing</%text>
+#hg_manifest_index_cache_size = 100000
+
 <%text>## RSS feed options</%text>
 rss_cut_off_limit = 256000
 rss_items_per_page = 10
@@ -247,11 +291,18 @@ issue_prefix = #
 
 
 <%text>## instance-id prefix</%text>
-<%text>## a prefix key for this instance used for cache invalidation when running</%text>
-<%text>## multiple instances of kallithea, make sure it's globally unique for</%text>
-<%text>## all running kallithea instances. Leave empty if you don't use it</%text>
+<%text>## a name of this instance shown in page footers when running multiple</%text>
+<%text>## instances of kallithea, make sure it's globally unique for all running</%text>
+<%text>## kallithea instances. Leave empty if you don't use it</%text>
 instance_id =
 
+<%text>## cache invalidation</%text>
+<%text>## number of milliseconds a process keeps using the cache generations it</%text>
+<%text>## read from the database before reading them again. Invalidations made by</%text>
+<%text>## other processes and instances may take that long to be noticed. Changed</%text>
+<%text>## permissions are checked on every request and apply right away</%text>
+#cache_generation_interval = 1000
+
 <%text>## alternative return HTTP header for failed authentication. Default HTTP</%text>
 <%text>## response is 401 HTTPUnauthorized. Currently Mercurial clients have trouble with</%text>
 <%text>## handling that. Set this variable to 403 to return HTTPForbidden</%text>
@@ -34,7 +34,7 @@ from pylons import request, tmpl_context as c, url, config
 from pylons.controllers.util import redirect
 from pylons.i18n.translation import _
 
-from kallithea.lib import helpers as h
+from kallithea.lib import helpers as h, scm_pool
 from kallithea.lib.auth import LoginRequired, HasPermissionAllDecorator
 from kallithea.lib.base import BaseController, render
 from kallithea.lib.celerylib import tasks, run_task
@@ -204,7 +204,7 @@ class SettingsController(BaseController):
             if invalidate_cache:
                 log.debug('invalidating all repositories cache')
                 for repo in Repository.get_all():
-                    ScmModel().mark_for_invalidation(repo.repo_name, delete=True)
+                    ScmModel().mark_for_invalidation(repo.repo_name)
 
             filesystem_repos = ScmModel().repo_scan()
             added, removed = repo2db_mapper(filesystem_repos, rm_obsolete,
@@ -472,6 +472,7 @@ class SettingsController(BaseController):
         server_info = Setting.get_server_info()
         for key, val in server_info.iteritems():
             setattr(c, key, val)
+        c.scm_pool_stats = scm_pool.get_pool().get_stats()
 
         return htmlfill.render(
             render('admin/settings/settings.html'),
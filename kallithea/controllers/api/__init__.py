@@ -40,7 +40,8 @@ from kallithea.model.db import User
 from kallithea.model import meta
 from kallithea.lib.compat import izip_longest, json
 from kallithea.lib.auth import AuthUser
-from kallithea.lib.base import _get_ip_addr as _get_ip, _get_access_path
+from kallithea.lib.base import _get_ip_addr as _get_ip, _get_access_path, \
+    STREAMING_RESPONSE_KEY
 from kallithea.lib.utils2 import safe_unicode, safe_str
 
 log = logging.getLogger('JSONRPC')
@@ -86,6 +87,9 @@ class JSONRPCController(WSGIController):
 
      """
 
+    # argspecs of methods by function
+    _argspecs = {}
+
     def _get_ip_addr(self, environ):
         return _get_ip(environ)
 
@@ -101,8 +105,25 @@ class JSONRPCController(WSGIController):
         Parse the request body as JSON, look up the method on the
         controller and if it exists, dispatch to it.
         """
+        self._streaming = False
         try:
-            return self._handle_request(environ, start_response)
+            output = self._handle_request(environ, start_response)
+        except:
+            meta.Session.remove()
+            raise
+        if not self._streaming:
+            meta.Session.remove()
+            return output
+        # keep the session until the stream is sent
+        environ[STREAMING_RESPONSE_KEY] = True
+        return self._remove_session_after(output)
+
+    @staticmethod
+    def _remove_session_after(output):
+        # streamed results are read from the database while being sent
+        try:
+            for chunk in output:
+                yield chunk
         finally:
             meta.Session.remove()
 
@@ -134,9 +155,103 @@ class JSONRPCController(WSGIController):
                                  message="JSON parse error ERR:%s RAW:%r"
                                  % (e, raw_body))
 
-        # check AUTH based on API KEY
+        if isinstance(json_body, list):
+            return self._handle_batch(json_body, environ, start_response,
+                                      start)
+
         try:
-            self._req_api_key = json_body['api_key']
+            api_key = self._parse_call(json_body)
+            # check if we can find this session using api_key
+            u, auth_u = self._authenticate(api_key, ip_addr)
+            self._prepare_call(u, auth_u, environ, start_response)
+        except JSONRPCError, e:
+            return jsonrpc_error(retid=self._req_id, message=safe_str(e))
+
+        status = []
+        headers = []
+        exc_info = []
+
+        def change_content(new_status, new_headers, new_exc_info=None):
+            status.append(new_status)
+            headers.extend(new_headers)
+            exc_info.append(new_exc_info)
+
+        output = WSGIController.__call__(self, environ, change_content)
+        if self._streaming:
+            # length is unknown, the server will send it chunked
+            headers = [h for h in headers if h[0].lower() != 'content-length']
+        else:
+            output = list(output)
+            headers.append(('Content-Length', str(len(output[0]))))
+        replace_header(headers, 'Content-Type', 'application/json')
+        start_response(status[0], headers, exc_info[0])
+        log.info('IP: %s Request to %s time: %.3fs' % (
+            self._get_ip_addr(environ),
+            safe_unicode(_get_access_path(environ)), time.time() - start)
+        )
+        return output
+
+    def _handle_batch(self, calls, environ, start_response, start):
+        """
+        Run a list of calls with the same api_key, the key is checked and
+        the user is loaded only once. Each call gets its own response, in
+        the order of the calls.
+        """
+        if not calls:
+            return jsonrpc_error(retid=self._req_id,
+                                 message='Empty batch request')
+        # needed by WSGIController._inspect_call, normally set by __call__
+        self._py_object = environ['pylons.pylons']
+        batch_api_key = auth = auth_error = None
+        responses = []
+        for call in calls:
+            self._req_id = None
+            try:
+                if not isinstance(call, dict):
+                    raise JSONRPCError('Incorrect JSON query')
+                api_key = self._parse_call(call)
+                if auth is None and auth_error is None:
+                    batch_api_key = api_key
+                    try:
+                        auth = self._authenticate(api_key, self.ip_addr)
+                    except JSONRPCError, e:
+                        auth_error = e
+                if auth_error is not None:
+                    raise auth_error
+                if api_key != batch_api_key:
+                    raise JSONRPCError('All calls of a batch request must '
+                                       'use the same API KEY')
+                self._prepare_call(auth[0], auth[1], environ, start_response)
+            except JSONRPCError, e:
+                responses.append(self._encode_response(
+                    dict(id=self._req_id, result=None, error=safe_str(e))))
+                continue
+            output = self._dispatch_call()
+            if self._streaming:
+                # responses of a batch are sent together
+                output = ''.join(output)
+                self._streaming = False
+            responses.append(output)
+            if self._error is not None:
+                # don't let a failed call break the following ones
+                meta.Session().rollback()
+
+        body = '[%s]' % ','.join(responses)
+        start_response('200 OK', [('Content-Type', 'application/json'),
+                                  ('Content-Length', str(len(body)))])
+        log.info('IP: %s Batch of %s requests to %s time: %.3fs' % (
+            self._get_ip_addr(environ), len(calls),
+            safe_unicode(_get_access_path(environ)), time.time() - start)
+        )
+        return [body]
+
+    def _parse_call(self, json_body):
+        """
+        Read id, method and args of a call from request data and return its
+        api_key
+        """
+        try:
+            api_key = json_body['api_key']
             self._req_id = json_body['id']
             self._req_method = json_body['method']
             self._request_params = json_body['args']
@@ -148,38 +263,51 @@ class JSONRPCController(WSGIController):
                                             self._request_params)
             )
         except KeyError, e:
-            return jsonrpc_error(retid=self._req_id,
-                                 message='Incorrect JSON query missing %s' % e)
+            raise JSONRPCError('Incorrect JSON query missing %s' % e)
+        return api_key
 
-        # check if we can find this session using api_key
+    def _authenticate(self, api_key, ip_addr):
+        """
+        Return user owning ``api_key`` and its AuthUser, raise JSONRPCError
+        if the key is invalid or not allowed from ``ip_addr``
+        """
         try:
-            u = User.get_by_api_key(self._req_api_key)
+            u = User.get_by_api_key(api_key)
             if u is None:
-                return jsonrpc_error(retid=self._req_id,
-                                     message='Invalid API KEY')
+                raise JSONRPCError('Invalid API KEY')
 
             #check if we are allowed to use this IP
-            auth_u = AuthUser(u.user_id, self._req_api_key, ip_addr=ip_addr)
+            auth_u = AuthUser(u.user_id, api_key, ip_addr=ip_addr)
             if not auth_u.ip_allowed:
-                return jsonrpc_error(retid=self._req_id,
-                        message='request from IP:%s not allowed' % (ip_addr,))
+                raise JSONRPCError('request from IP:%s not allowed' % (ip_addr,))
             else:
                 log.info('Access for IP:%s allowed' % (ip_addr,))
 
         except Exception, e:
-            return jsonrpc_error(retid=self._req_id,
-                                 message='Invalid API KEY')
+            raise JSONRPCError('Invalid API KEY')
+        return u, auth_u
+
+    def _get_argspec(self, func):
+        try:
+            return self._argspecs[func.im_func]
+        except KeyError:
+            argspec = self._argspecs[func.im_func] = inspect.getargspec(func)
+            return argspec
 
+    def _prepare_call(self, u, auth_u, environ, start_response):
+        """
+        Find the method of the parsed call and check its arguments, raise
+        JSONRPCError if it can't be called
+        """
         self._error = None
         try:
             self._func = self._find_method()
         except AttributeError, e:
-            return jsonrpc_error(retid=self._req_id,
-                                 message=str(e))
+            raise JSONRPCError(str(e))
 
         # now that we have a method, add self._req_params to
         # self.kargs and dispatch control to WGIController
-        argspec = inspect.getargspec(self._func)
+        argspec = self._get_argspec(self._func)
         arglist = argspec[0][1:]
         defaults = map(type, argspec[3] or [])
         default_empty = types.NotImplementedType
@@ -198,11 +326,10 @@ class JSONRPCController(WSGIController):
         USER_SESSION_ATTR = 'apiuser'
 
         if USER_SESSION_ATTR not in arglist:
-            return jsonrpc_error(
-                retid=self._req_id,
-                message='This method [%s] does not support '
-                         'authentication (missing %s param)' % (
-                                    self._func.__name__, USER_SESSION_ATTR)
+            raise JSONRPCError(
+                'This method [%s] does not support '
+                'authentication (missing %s param)' % (
+                    self._func.__name__, USER_SESSION_ATTR)
             )
 
         # get our arglist and check if we provided them as args
@@ -215,11 +342,8 @@ class JSONRPCController(WSGIController):
             # skip the required param check if it's default value is
             # NotImplementedType (default_empty)
             if default == default_empty and arg not in self._request_params:
-                return jsonrpc_error(
-                    retid=self._req_id,
-                    message=(
-                        'Missing non optional `%s` arg in JSON DATA' % arg
-                    )
+                raise JSONRPCError(
+                    'Missing non optional `%s` arg in JSON DATA' % arg
                 )
 
         self._rpc_args = {USER_SESSION_ATTR: u}
@@ -230,26 +354,6 @@ class JSONRPCController(WSGIController):
         self._rpc_args['environ'] = environ
         self._rpc_args['start_response'] = start_response
 
-        status = []
-        headers = []
-        exc_info = []
-
-        def change_content(new_status, new_headers, new_exc_info=None):
-            status.append(new_status)
-            headers.extend(new_headers)
-            exc_info.append(new_exc_info)
-
-        output = WSGIController.__call__(self, environ, change_content)
-        output = list(output)
-        headers.append(('Content-Length', str(len(output[0]))))
-        replace_header(headers, 'Content-Type', 'application/json')
-        start_response(status[0], headers, exc_info[0])
-        log.info('IP: %s Request to %s time: %.3fs' % (
-            self._get_ip_addr(environ),
-            safe_unicode(_get_access_path(environ)), time.time() - start)
-        )
-        return output
-
     def _dispatch_call(self):
         """
         Implement dispatch interface specified by WSGIController
@@ -269,8 +373,40 @@ class JSONRPCController(WSGIController):
 
         if self._error is not None:
             raw_response = None
+        elif isinstance(raw_response, types.GeneratorType):
+            self._streaming = True
+            return self._stream_response(raw_response)
+
+        return self._encode_response(
+            dict(id=self._req_id, result=raw_response, error=self._error))
+
+    def _stream_response(self, items):
+        """
+        Encode a response with list of ``items`` as result incrementally,
+        without keeping the items or the encoded list in memory. Errors
+        while producing the items are only known when a part of the result
+        has been sent already, the partial result is then followed by the
+        error.
+        """
+        yield '{"id": %s, "result": [' % json.dumps(self._req_id)
+        error = None
+        try:
+            sep = ''
+            for item in items:
+                yield sep + json.dumps(item)
+                sep = ', '
+        except JSONRPCError, e:
+            error = safe_str(e)
+        except TypeError, e:
+            log.error('API FAILED. Error encoding response: %s' % e)
+            error = 'Error encoding response'
+        except Exception, e:
+            log.error('Encountered unhandled exception: %s'
+                      % (traceback.format_exc(),))
+            error = safe_str(JSONRPCError('Internal server error'))
+        yield '], "error": %s}' % json.dumps(error)
 
-        response = dict(id=self._req_id, result=raw_response, error=self._error)
+    def _encode_response(self, response):
         try:
             return json.dumps(response)
         except TypeError, e:
@@ -27,9 +27,11 @@ Original author and date, and relevant copyright and licensing information is be
 
 
 import time
+import itertools
 import traceback
 import logging
 from sqlalchemy import or_
+from sqlalchemy.orm import joinedload, subqueryload
 
 from kallithea import EXTERN_TYPE_INTERNAL
 from kallithea.controllers.api import JSONRPCController, JSONRPCError
@@ -39,7 +41,7 @@ from kallithea.lib.auth import (
     HasRepoGroupPermissionAnyApi, HasUserGroupPermissionAny)
 from kallithea.lib.utils import map_groups, repo2db_mapper
 from kallithea.lib.utils2 import (
-    str2bool, time_to_datetime, safe_int, Optional, OAttr)
+    str2bool, time_to_datetime, safe_int, safe_str, Optional, OAttr)
 from kallithea.model.meta import Session
 from kallithea.model.repo_group import RepoGroupModel
 from kallithea.model.scm import ScmModel, UserGroupList
@@ -49,7 +51,8 @@ from kallithea.model.user_group import UserGroupModel
 from kallithea.model.gist import GistModel
 from kallithea.model.db import (
     Repository, Setting, UserIpMap, Permission, User, Gist,
-    RepoGroup)
+    RepoGroup, UserGroup, RepositoryField, UserEmailMap, UserApiKeys, UserRepoToPerm,
+    UserGroupRepoToPerm, UserFollowing)
 from kallithea.lib.compat import json
 from kallithea.lib.exceptions import (
     DefaultUserException, UserGroupsAssignedException)
@@ -143,6 +146,249 @@ def get_gist_or_error(gistid):
     return gist
 
 
+# number of values passed to a single IN query
+IN_QUERY_CHUNK = 500
+
+USER_API_FIELDS = ('user_id', 'username', 'firstname', 'lastname', 'email',
+                   'emails', 'active', 'admin')
+USER_API_DETAIL_FIELDS = ('extern_type', 'extern_name', 'api_key',
+                          'api_keys', 'last_login', 'ip_addresses')
+REPO_API_FIELDS = ('repo_id', 'repo_name', 'repo_type', 'clone_uri',
+                   'private', 'created_on', 'description', 'landing_rev',
+                   'owner', 'fork_of', 'enable_statistics', 'enable_locking',
+                   'enable_downloads', 'last_changeset', 'locked_by',
+                   'locked_date')
+REPO_API_DETAIL_FIELDS = ('members', 'followers')
+
+
+def get_fields_or_error(fields, allowed, prefix=None):
+    """
+    Get list of requested output fields, None for the default ones, or
+    return JsonRPCError if some field is unknown
+
+    :param fields:
+    :param allowed: names of known fields
+    :param prefix: prefix of names of additional known fields
+    """
+    fields = Optional.extract(fields)
+    if fields is None:
+        return None
+    if not isinstance(fields, list):
+        raise JSONRPCError('fields must be a list')
+    for field in fields:
+        if field not in allowed and not (prefix and isinstance(field, basestring)
+                                         and field.startswith(prefix)):
+            raise JSONRPCError('unknown field `%s`' % (field,))
+    return fields
+
+
+def _select_fields(data, fields):
+    if fields is None:
+        return data
+    return dict((field, data[field]) for field in fields if field in data)
+
+
+def get_limit_or_error(limit):
+    """
+    Get page size or None if not given, return JsonRPCError if it is not a
+    positive number
+
+    :param limit:
+    """
+    limit = Optional.extract(limit)
+    if limit is None:
+        return None
+    if safe_int(limit, 0) <= 0:
+        raise JSONRPCError('limit must be a positive number')
+    return safe_int(limit)
+
+
+def _iter_by_name(query, name_column, cursor=None, chunk=IN_QUERY_CHUNK):
+    """
+    Iterate over rows of ``query`` ordered by ``name_column`` and following
+    ``cursor``, reading at most ``chunk`` rows at a time
+    """
+    query = query.order_by(name_column)
+    chunk = min(chunk, IN_QUERY_CHUNK)
+    while True:
+        q = query
+        if cursor is not None:
+            q = q.filter(name_column > cursor)
+        rows = q.limit(chunk).all()
+        for row in rows:
+            yield row
+        if len(rows) < chunk:
+            return
+        cursor = getattr(rows[-1], name_column.key)
+
+
+def _iter_chunks(iterable, size=IN_QUERY_CHUNK):
+    chunk = []
+    for obj in iterable:
+        chunk.append(obj)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _iter_api_data(objs, get_api_data, *args, **kwargs):
+    """
+    Iterate over api data of ``objs`` computed in bulk by ``get_api_data``
+    for a chunk of them at a time
+    """
+    for chunk in _iter_chunks(objs):
+        for data in get_api_data(chunk, *args, **kwargs):
+            yield data
+
+
+def _query_in(query, column, values):
+    """
+    Return all rows of ``query`` with ``column`` in ``values``, large lists
+    are split into several queries
+    """
+    values = list(values)
+    result = []
+    for i in xrange(0, len(values), IN_QUERY_CHUNK):
+        result.extend(query.filter(column.in_(values[i:i + IN_QUERY_CHUNK])))
+    return result
+
+
+def _group_by(rows, key):
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(key(row), []).append(row)
+    return grouped
+
+
+def _get_all_or_error(query, ids, id_column, name_column, message):
+    """
+    Get objects by ids or names in the order they were given, return
+    JsonRPCError if some does not exist
+
+    :returns: list of (given id or name, object) tuples
+    """
+    if not isinstance(ids, list):
+        raise JSONRPCError('list of ids or names expected')
+    by_id = {}
+    by_name = {}
+    for id_ in ids:
+        if isinstance(id_, (int, long)) or safe_str(id_).isdigit():
+            by_id[int(id_)] = None
+        else:
+            by_name[id_] = None
+    for obj in _query_in(query, id_column, by_id):
+        by_id[getattr(obj, id_column.key)] = obj
+    for obj in _query_in(query, name_column, by_name):
+        by_name[getattr(obj, name_column.key)] = obj
+    result = []
+    seen = set()
+    for id_ in ids:
+        if isinstance(id_, (int, long)) or safe_str(id_).isdigit():
+            obj = by_id[int(id_)]
+        else:
+            obj = by_name[id_]
+        if obj is None:
+            raise JSONRPCError(message % (id_,))
+        if obj not in seen:
+            seen.add(obj)
+            result.append((id_, obj))
+    return result
+
+
+def get_users_api_data(users, details=False):
+    """
+    Get api data of many users with a few queries for all of them
+    """
+    user_ids = [user.user_id for user in users]
+
+    def get_related(cls, attr):
+        rows = _query_in(cls.query().order_by(*cls.__table__.primary_key),
+                         cls.user_id, user_ids)
+        return _group_by(((row.user_id, getattr(row, attr)) for row in rows),
+                         lambda row: row[0])
+
+    emails = get_related(UserEmailMap, 'email')
+    api_keys = ip_addresses = {}
+    if details:
+        api_keys = get_related(UserApiKeys, 'api_key')
+        ip_addresses = get_related(UserIpMap, 'ip_addr')
+    return [user.get_api_data(
+                details,
+                emails=[row[1] for row in emails.get(user.user_id, [])],
+                api_keys=[row[1] for row in api_keys.get(user.user_id, [])],
+                ip_addresses=[row[1] for row in ip_addresses.get(user.user_id, [])])
+            for user in users]
+
+
+def get_repos_api_data(repos, fields=None):
+    """
+    Get api data of many repositories with a few queries for all of them,
+    members and followers of repositories are only included if they are
+    among requested ``fields``
+    """
+    repository_fields = str2bool(
+        Setting.get_app_settings().get('repository_fields'))
+    repo_ids = [repo.repo_id for repo in repos]
+    members = followers = None
+    if fields is not None and 'members' in fields:
+        user_perms = _query_in(UserRepoToPerm.query()
+                    .options(joinedload(UserRepoToPerm.user),
+                             joinedload(UserRepoToPerm.permission))
+                    .order_by(UserRepoToPerm.repo_to_perm_id),
+                UserRepoToPerm.repository_id, repo_ids)
+        user_group_perms = _query_in(UserGroupRepoToPerm.query()
+                    .options(joinedload(UserGroupRepoToPerm.users_group),
+                             joinedload(UserGroupRepoToPerm.permission))
+                    .order_by(UserGroupRepoToPerm.users_group_to_perm_id),
+                UserGroupRepoToPerm.repository_id, repo_ids)
+        members = {}
+        for perm in user_perms:
+            members.setdefault(perm.repository_id, []).append({
+                'name': perm.user.username,
+                'type': "user",
+                'permission': perm.permission.permission_name
+            })
+        for perm in user_group_perms:
+            members.setdefault(perm.repository_id, []).append({
+                'name': perm.users_group.users_group_name,
+                'type': "user_group",
+                'permission': perm.permission.permission_name
+            })
+    if fields is not None and 'followers' in fields:
+        followings = _query_in(UserFollowing.query()
+                    .options(joinedload(UserFollowing.user))
+                    .order_by(UserFollowing.user_following_id),
+                UserFollowing.follows_repo_id, repo_ids)
+        users = dict((f.user_id, f.user) for f in followings).values()
+        users_data = dict(zip([user.user_id for user in users],
+                              get_users_api_data(users)))
+        followers = {}
+        for following in followings:
+            followers.setdefault(following.follows_repo_id, []) \
+                .append(users_data[following.user_id])
+
+    lock_users = None
+    if fields is None or 'locked_by' in fields:
+        locked_user_ids = set(repo.locked[0] for repo in repos
+                              if repo.locked[0])
+        users = _query_in(User.query(), User.user_id, locked_user_ids)
+        lock_users = dict(zip([user.user_id for user in users],
+                              get_users_api_data(users)))
+
+    result = []
+    for repo in repos:
+        data = repo.get_api_data(repository_fields=repository_fields,
+                                 lock_users=lock_users)
+        if members is not None:
+            data['members'] = members.get(repo.repo_id, [])
+        if followers is not None:
+            data['followers'] = followers.get(repo.repo_id, [])
+        result.append(_select_fields(data, fields))
+    return result
+
+
 class ApiController(JSONRPCController):
     """
     API Controller
@@ -594,13 +840,27 @@ class ApiController(JSONRPCController):
         return data
 
     @HasPermissionAllDecorator('hg.admin')
-    def get_users(self, apiuser):
+    def get_users(self, apiuser, userids=Optional(None),
+                  fields=Optional(None), cursor=Optional(None),
+                  limit=Optional(None)):
         """
-        Lists all existing users. This command can be executed only using api_key
-        belonging to user with admin rights.
+        Lists all existing users or the given ones. This command can be
+        executed only using api_key belonging to user with admin rights.
+        Users are listed by username, a page of at most ``limit`` users
+        following username ``cursor`` can be requested.
 
         :param apiuser: filled automatically from apikey
         :type apiuser: AuthUser
+        :param userids: usernames or user ids of users to get, all users if
+            not given
+        :type userids: Optional(list)
+        :param fields: names of fields of user objects to return, may
+            include the fields returned by get_user except permissions
+        :type fields: Optional(list)
+        :param cursor: username of the last user of the previous page
+        :type cursor: Optional(str)
+        :param limit: maximal number of users to return
+        :type limit: Optional(int)
 
         OUTPUT::
 
@@ -608,14 +868,27 @@ class ApiController(JSONRPCController):
             result: [<user_object>, ...]
             error:  null
         """
-
-        result = []
-        users_list = User.query().order_by(User.username) \
-            .filter(User.username != User.DEFAULT_USER) \
-            .all()
-        for user in users_list:
-            result.append(user.get_api_data())
-        return result
+        fields = get_fields_or_error(fields,
+                                     USER_API_FIELDS + USER_API_DETAIL_FIELDS)
+        userids = Optional.extract(userids)
+        cursor = Optional.extract(cursor)
+        limit = get_limit_or_error(limit)
+        if userids is None:
+            users = _iter_by_name(
+                User.query().filter(User.username != User.DEFAULT_USER),
+                User.username, cursor, chunk=limit or IN_QUERY_CHUNK)
+            if limit is not None:
+                users = itertools.islice(users, limit)
+        elif cursor is not None or limit is not None:
+            raise JSONRPCError('userids can not be paginated')
+        else:
+            users = [user for _id, user in _get_all_or_error(User.query(),
+                userids, User.user_id, User.username,
+                'user `%s` does not exist')]
+        details = fields is not None and \
+            any(field in USER_API_DETAIL_FIELDS for field in fields)
+        return (_select_fields(data, fields) for data in
+                _iter_api_data(users, get_users_api_data, details=details))
 
     @HasPermissionAllDecorator('hg.admin')
     def create_user(self, apiuser, username, email, password=Optional(''),
@@ -867,14 +1140,21 @@ class ApiController(JSONRPCController):
         return data
 
     # permission check inside
-    def get_user_groups(self, apiuser):
+    def get_user_groups(self, apiuser, cursor=Optional(None),
+                        limit=Optional(None)):
         """
         Lists all existing user groups. This command can be executed only using
         api_key belonging to user with admin rights or user who has at least
-        read access to user group.
+        read access to user group. When paginated, user groups are listed by
+        name and a page of at most ``limit`` user groups following name
+        ``cursor`` is returned.
 
         :param apiuser: filled automatically from apikey
         :type apiuser: AuthUser
+        :param cursor: name of the last user group of the previous page
+        :type cursor: Optional(str)
+        :param limit: maximal number of user groups to return
+        :type limit: Optional(int)
 
         OUTPUT::
 
@@ -882,14 +1162,22 @@ class ApiController(JSONRPCController):
             result : [<user_group_obj>,...]
             error : null
         """
-
-        result = []
+        cursor = Optional.extract(cursor)
+        limit = get_limit_or_error(limit)
         _perms = ('usergroup.read', 'usergroup.write', 'usergroup.admin',)
-        extras = {'user': apiuser}
-        for user_group in UserGroupList(UserGroupModel().get_all(),
-                                        perm_set=_perms, extra_kwargs=extras):
-            result.append(user_group.get_api_data())
-        return result
+        # permissions are computed only once for all groups
+        extras = {'user': self.authuser}
+        if cursor is None and limit is None:
+            user_groups = UserGroupModel().get_all()
+        else:
+            user_groups = _iter_by_name(UserGroup.query(),
+                                        UserGroup.users_group_name, cursor,
+                                        chunk=limit or IN_QUERY_CHUNK)
+        user_groups = UserGroupList(user_groups, perm_set=_perms,
+                                    extra_kwargs=extras)
+        if limit is not None:
+            user_groups = itertools.islice(user_groups, limit)
+        return (user_group.get_api_data() for user_group in user_groups)
 
     @HasPermissionAnyDecorator('hg.admin', 'hg.usergroup.create.true')
     def create_user_group(self, apiuser, group_name, description=Optional(''),
@@ -1288,14 +1576,28 @@ class ApiController(JSONRPCController):
         return data
 
     # permission check inside
-    def get_repos(self, apiuser):
+    def get_repos(self, apiuser, repoids=Optional(None),
+                  fields=Optional(None), cursor=Optional(None),
+                  limit=Optional(None)):
         """
-        Lists all existing repositories. This command can be executed only using
-        api_key belonging to user with admin rights or regular user that have
-        admin, write or read access to repository.
+        Lists all existing repositories or the given ones. This command can
+        be executed only using api_key belonging to user with admin rights or
+        regular user that have admin, write or read access to repository.
+        When paginated, repositories are listed by name and a page of at most
+        ``limit`` repositories following name ``cursor`` is returned.
 
         :param apiuser: filled automatically from apikey
         :type apiuser: AuthUser
+        :param repoids: repository names or repository ids of repositories
+            to get, all accessible repositories if not given
+        :type repoids: Optional(list)
+        :param fields: names of fields of repository objects to return, may
+            include ``members`` and ``followers`` as returned by get_repo
+        :type fields: Optional(list)
+        :param cursor: name of the last repository of the previous page
+        :type cursor: Optional(str)
+        :param limit: maximal number of repositories to return
+        :type limit: Optional(int)
 
         OUTPUT::
 
@@ -1320,24 +1622,59 @@ class ApiController(JSONRPCController):
                     ]
             error:  null
         """
-        result = []
-        if not HasPermissionAnyApi('hg.admin')(user=apiuser):
-            repos = RepoModel().get_all_user_repos(user=apiuser)
+        fields = get_fields_or_error(fields,
+                                     REPO_API_FIELDS + REPO_API_DETAIL_FIELDS,
+                                     RepositoryField.PREFIX)
+        repoids = Optional.extract(repoids)
+        cursor = Optional.extract(cursor)
+        limit = get_limit_or_error(limit)
+        # permissions of the caller are computed once for the whole batch
+        is_admin = HasPermissionAnyApi('hg.admin')(user=self.authuser)
+        options = [joinedload(Repository.user), joinedload(Repository.fork),
+                   subqueryload(Repository.extra_fields)]
+        if repoids is None:
+            if not is_admin:
+                repos = RepoModel().get_all_user_repos(user=self.authuser)
+            else:
+                repos = Repository.query()
+            repos = repos.options(*options)
+            if cursor is None and limit is None:
+                repos = repos.all()
+            else:
+                repos = _iter_by_name(repos, Repository.repo_name, cursor,
+                                      chunk=limit or IN_QUERY_CHUNK)
+                if limit is not None:
+                    repos = itertools.islice(repos, limit)
+        elif cursor is not None or limit is not None:
+            raise JSONRPCError('repoids can not be paginated')
         else:
-            repos = RepoModel().get_all()
-
-        for repo in repos:
-            result.append(repo.get_api_data())
-        return result
+            repos = []
+            if not is_admin:
+                perms = self.authuser.permissions['repositories']
+            for repoid, repo in _get_all_or_error(
+                    Repository.query().options(*options), repoids,
+                    Repository.repo_id, Repository.repo_name,
+                    'repository `%s` does not exist'):
+                if not is_admin and perms.get(repo.repo_name) not in (
+                        'repository.admin', 'repository.write',
+                        'repository.read'):
+                    raise JSONRPCError(
+                        'repository `%s` does not exist' % (repoid,))
+                repos.append(repo)
+        return _iter_api_data(repos, get_repos_api_data, fields)
 
     # permission check inside
     def get_repo_nodes(self, apiuser, repoid, revision, root_path,
-                       ret_type=Optional('all')):
+                       ret_type=Optional('all'), cursor=Optional(None),
+                       limit=Optional(None)):
         """
         returns a list of nodes and it's children in a flat list for a given path
         at given revision. It's possible to specify ret_type to show only `files` or
         `dirs`.  This command can be executed only using api_key belonging to
         user with admin rights or regular user that have at least read access to repository.
+        A page of at most ``limit`` nodes following the node named ``cursor``
+        can be requested, paginated nodes are listed depth first in path
+        order.
 
         :param apiuser: filled automatically from apikey
         :type apiuser: AuthUser
@@ -1349,6 +1686,10 @@ class ApiController(JSONRPCController):
         :type root_path: str
         :param ret_type: return type 'all|files|dirs' nodes
         :type ret_type: Optional(str)
+        :param cursor: name of the last node of the previous page
+        :type cursor: Optional(str)
+        :param limit: maximal number of nodes to return
+        :type limit: Optional(int)
 
 
         OUTPUT::
@@ -1372,24 +1713,26 @@ class ApiController(JSONRPCController):
                 raise JSONRPCError('repository `%s` does not exist' % (repoid,))
 
         ret_type = Optional.extract(ret_type)
-        _map = {}
+        cursor = Optional.extract(cursor)
+        limit = get_limit_or_error(limit)
         try:
-            _d, _f = ScmModel().get_nodes(repo, revision, root_path,
-                                          flat=False)
-            _map = {
-                'all': _d + _f,
-                'files': _f,
-                'dirs': _d,
-            }
-            return _map[ret_type]
-        except KeyError:
-            raise JSONRPCError('ret_type must be one of %s'
-                               % (','.join(_map.keys())))
+            nodes = ScmModel().iter_nodes(repo, revision, root_path,
+                                          dirs=ret_type in ('all', 'dirs'),
+                                          files=ret_type in ('all', 'files'),
+                                          path_order=cursor is not None or
+                                                     limit is not None,
+                                          after=cursor)
         except Exception:
             log.error(traceback.format_exc())
             raise JSONRPCError(
                 'failed to get repo: `%s` nodes' % repo.repo_name
             )
+        if ret_type not in ('all', 'files', 'dirs'):
+            raise JSONRPCError('ret_type must be one of %s'
+                               % (','.join(['files', 'dirs', 'all'])))
+        if limit is not None:
+            nodes = itertools.islice(nodes, limit)
+        return (node for node in nodes)
 
     @HasPermissionAnyDecorator('hg.admin', 'hg.create.repository')
     def create_repo(self, apiuser, repo_name, owner=Optional(OAttr('apiuser')),
@@ -39,6 +39,8 @@ from kallithea.lib.base import BaseRepoController, render
 from kallithea.lib.helpers import RepoPage
 from kallithea.lib.compat import json
 from kallithea.lib.graphmod import graph_data
+from kallithea.lib.identities import resolve_authors
+from kallithea.lib.vcs.backends.base import CollectionGenerator
 from kallithea.lib.vcs.exceptions import RepositoryError, ChangesetDoesNotExistError,\
     ChangesetError, NodeDoesNotExistError, EmptyRepositoryError
 from kallithea.lib.utils2 import safe_int, safe_str
@@ -61,6 +63,7 @@ def _load_changelog_summary():
                                  items_per_page=size,
                                  url=url_generator)
     page_revisions = [x.raw_id for x in list(c.repo_changesets)]
+    resolve_authors(x.author for x in c.repo_changesets)
     c.comments = c.db_repo.get_comments(page_revisions)
     c.statuses = c.db_repo.statuses(page_revisions)
 
@@ -124,16 +127,18 @@ class ChangelogController(BaseRepoController):
                 # get the history for the file !
                 tip_cs = c.db_repo_scm_instance.get_changeset()
                 try:
-                    collection = tip_cs.get_file_history(f_path)
+                    history = tip_cs.get_file_history_page(f_path)[0]
                 except (NodeDoesNotExistError, ChangesetError):
                     #this node is not present at tip !
                     try:
                         cs = self.__get_cs(revision, repo_name)
-                        collection = cs.get_file_history(f_path)
+                        history = cs.get_file_history_page(f_path)[0]
                     except RepositoryError, e:
                         h.flash(safe_str(e), category='warning')
                         redirect(h.url('changelog_home', repo_name=repo_name))
-                collection = list(reversed(collection))
+                # only changesets shown on the page get built
+                collection = CollectionGenerator(c.db_repo_scm_instance,
+                    [x.raw_id for x in reversed(history)])
             else:
                 collection = c.db_repo_scm_instance.get_changesets(start=0, end=revision,
                                                         branch_name=branch_name)
@@ -143,6 +148,7 @@ class ChangelogController(BaseRepoController):
                                     items_per_page=c.size, branch=branch_name,)
 
             page_revisions = [x.raw_id for x in c.pagination]
+            resolve_authors(x.author for x in c.pagination)
             c.comments = c.db_repo.get_comments(page_revisions)
             c.statuses = c.db_repo.statuses(page_revisions)
         except (EmptyRepositoryError), e:
@@ -57,6 +57,7 @@ from kallithea.lib.exceptions import StatusChangeOnClosedPullRequestError
 from kallithea.lib.vcs.backends.base import EmptyChangeset
 from kallithea.lib.utils2 import safe_unicode
 from kallithea.lib.graphmod import graph_data
+from kallithea.lib.identities import resolve_authors
 
 log = logging.getLogger(__name__)
 
@@ -206,6 +207,7 @@ class ChangesetController(BaseRepoController):
             c.cs_ranges = list(rev_ranges)
             if not c.cs_ranges:
                 raise RepositoryError('Changeset range returned empty result')
+            resolve_authors(x.author for x in c.cs_ranges)
 
         except(ChangesetDoesNotExistError,), e:
             log.error(traceback.format_exc())
@@ -255,16 +257,22 @@ class ChangesetController(BaseRepoController):
             context_lcl = get_line_ctx('', request.GET)
             ign_whitespace_lcl = ign_whitespace_lcl = get_ignore_ws('', request.GET)
 
-            _diff = c.db_repo_scm_instance.get_diff(cs1, cs2,
-                ignore_whitespace=ign_whitespace_lcl, context=context_lcl)
             diff_limit = self.cut_off_limit if not fulldiff else None
-            diff_processor = diffs.DiffProcessor(_diff,
-                                                 vcs=c.db_repo_scm_instance.alias,
-                                                 format='gitdiff',
-                                                 diff_limit=diff_limit)
+            if method == 'show':
+                diff_processor = diffs.get_diff_processor(
+                    c.db_repo_scm_instance, cs1, cs2,
+                    ignore_whitespace=ign_whitespace_lcl, context=context_lcl,
+                    diff_limit=diff_limit)
+            else:
+                _diff = c.db_repo_scm_instance.get_diff(cs1, cs2,
+                    ignore_whitespace=ign_whitespace_lcl, context=context_lcl)
+                diff_processor = diffs.DiffProcessor(_diff,
+                                                     vcs=c.db_repo_scm_instance.alias,
+                                                     format='gitdiff',
+                                                     diff_limit=diff_limit)
             cs_changes = OrderedDict()
             if method == 'show':
-                _parsed = diff_processor.prepare()
+                _parsed = diff_processor.parsed_diff
                 c.limited_diff = False
                 if isinstance(_parsed, LimitedDiffContainer):
                     c.limited_diff = True
@@ -273,8 +281,9 @@ class ChangesetController(BaseRepoController):
                     c.lines_added += st['added']
                     c.lines_deleted += st['deleted']
                     fid = h.FID(changeset.raw_id, f['filename'])
-                    diff = diff_processor.as_html(enable_comments=enable_comments,
-                                                  parsed_lines=[f])
+                    # rendered when the page shows it
+                    diff = diff_processor.as_deferred_html(
+                        f, enable_comments=enable_comments)
                     cs_changes[fid] = [cs1, cs2, f['operation'], f['filename'],
                                        diff, st]
             else:
@@ -28,7 +28,6 @@ Original author and date, and relevant copyright and licensing information is be
 
 
 import logging
-import re
 
 from webob.exc import HTTPBadRequest
 from pylons import request, tmpl_context as c, url
@@ -36,6 +35,7 @@ from pylons.controllers.util import redirect
 from pylons.i18n.translation import _
 
 from kallithea.lib.vcs.utils.hgcompat import unionrepo
+from kallithea.lib.vcs.backends.git.compare import compare as git_compare
 from kallithea.lib import helpers as h
 from kallithea.lib.base import BaseRepoController, render
 from kallithea.lib.auth import LoginRequired, HasRepoPermissionAnyDecorator
@@ -45,6 +45,7 @@ from kallithea.lib.diffs import LimitedDiffContainer
 from kallithea.controllers.changeset import _ignorews_url,\
     _context_url, get_line_ctx, get_ignore_ws
 from kallithea.lib.graphmod import graph_data
+from kallithea.lib.identities import resolve_authors
 from kallithea.lib.compat import json
 
 log = logging.getLogger(__name__)
@@ -106,40 +107,11 @@ class CompareController(BaseRepoController):
             org_changesets = [org_repo.get_changeset(hgrepo[rev].hex()) for rev in org_revs]
 
         elif alias == 'git':
-            if org_repo != other_repo:
-                from dulwich.repo import Repo
-                from dulwich.client import SubprocessGitClient
-
-                gitrepo = Repo(org_repo.path)
-                SubprocessGitClient(thin_packs=False).fetch(other_repo.path, gitrepo)
-
-                gitrepo_remote = Repo(other_repo.path)
-                SubprocessGitClient(thin_packs=False).fetch(org_repo.path, gitrepo_remote)
-
-                revs = []
-                for x in gitrepo_remote.get_walker(include=[other_rev],
-                                                   exclude=[org_rev]):
-                    revs.append(x.commit.id)
-
-                other_changesets = [other_repo.get_changeset(rev) for rev in reversed(revs)]
-                if other_changesets:
-                    ancestor = other_changesets[0].parents[0].raw_id
-                else:
-                    # no changesets from other repo, ancestor is the other_rev
-                    ancestor = other_rev
-
-            else:
-                so, se = org_repo.run_git_command(
-                    'log --reverse --pretty="format: %%H" -s %s..%s'
-                        % (org_rev, other_rev)
-                )
-                other_changesets = [org_repo.get_changeset(cs)
-                              for cs in re.findall(r'[0-9a-fA-F]{40}', so)]
-                so, se = org_repo.run_git_command(
-                    'merge-base %s %s' % (org_rev, other_rev)
-                )
-                ancestor = re.findall(r'[0-9a-fA-F]{40}', so)[0]
-            org_changesets = []
+            # walk both repositories in process without fetching anything
+            other_revs, org_revs, ancestor = git_compare(org_repo, org_rev,
+                                                         other_repo, other_rev)
+            other_changesets = [other_repo.get_changeset(rev) for rev in other_revs]
+            org_changesets = [org_repo.get_changeset(rev) for rev in org_revs]
 
         else:
             raise Exception('Bad alias only git and hg is allowed')
@@ -230,6 +202,7 @@ class CompareController(BaseRepoController):
             org_repo.scm_instance.alias, org_repo.scm_instance, c.a_rev,
             other_repo.scm_instance, c.cs_rev)
         raw_ids = [x.raw_id for x in c.cs_ranges]
+        resolve_authors(x.author for x in c.cs_ranges)
         c.cs_comments = other_repo.get_comments(raw_ids)
         c.statuses = other_repo.statuses(raw_ids)
 
@@ -260,13 +233,12 @@ class CompareController(BaseRepoController):
 
         log.debug('running diff between %s and %s in %s'
                   % (rev1, c.cs_rev, org_repo.scm_instance.path))
-        txtdiff = org_repo.scm_instance.get_diff(rev1=rev1, rev2=c.cs_rev,
-                                      ignore_whitespace=ignore_whitespace,
-                                      context=line_context)
-
-        diff_processor = diffs.DiffProcessor(txtdiff or '', format='gitdiff',
-                                             diff_limit=diff_limit)
-        _parsed = diff_processor.prepare()
+        diff_processor = diffs.get_diff_processor(org_repo.scm_instance,
+                                                  rev1, c.cs_rev,
+                                                  ignore_whitespace=ignore_whitespace,
+                                                  context=line_context,
+                                                  diff_limit=diff_limit)
+        _parsed = diff_processor.parsed_diff
 
         c.limited_diff = False
         if isinstance(_parsed, LimitedDiffContainer):
@@ -283,7 +255,8 @@ class CompareController(BaseRepoController):
                 c.lines_deleted += st['deleted']
             fid = h.FID('', f['filename'])
             c.files.append([fid, f['operation'], f['filename'], f['stats']])
-            htmldiff = diff_processor.as_html(enable_comments=False, parsed_lines=[f])
+            # rendered when the page shows it
+            htmldiff = diff_processor.as_deferred_html(f, enable_comments=False)
             c.changes[fid] = [f['operation'], f['filename'], htmldiff]
 
         return render('compare/compare_diff.html')
@@ -31,7 +31,7 @@ import logging
 from pylons import response, tmpl_context as c
 from pylons.i18n.translation import _
 
-from beaker.cache import cache_region, region_invalidate
+from beaker.cache import cache_region
 from webhelpers.feedgenerator import Atom1Feed, Rss201rev2Feed
 
 from kallithea.lib import helpers as h
@@ -120,7 +120,7 @@ class FeedController(BaseRepoController):
         """Produce an atom-1.0 feed via feedgenerator module"""
 
         @cache_region('long_term')
-        def _get_feed_from_cache(key, kind):
+        def _get_feed_from_cache(key, kind, generation):
             feed = Atom1Feed(
                  title=self.title % repo_name,
                  link=h.canonical_url('summary_home', repo_name=repo_name),
@@ -142,16 +142,14 @@ class FeedController(BaseRepoController):
             return feed.writeString('utf-8')
 
         kind = 'ATOM'
-        valid = CacheInvalidation.test_and_set_valid(repo_name, kind)
-        if not valid:
-            region_invalidate(_get_feed_from_cache, None, repo_name, kind)
-        return _get_feed_from_cache(repo_name, kind)
+        generation = CacheInvalidation.get_generation(repo_name)
+        return _get_feed_from_cache(repo_name, kind, generation)
 
     def rss(self, repo_name):
         """Produce an rss2 feed via feedgenerator module"""
 
         @cache_region('long_term')
-        def _get_feed_from_cache(key, kind):
+        def _get_feed_from_cache(key, kind, generation):
             feed = Rss201rev2Feed(
                 title=self.title % repo_name,
                 link=h.canonical_url('summary_home', repo_name=repo_name),
@@ -173,7 +171,5 @@ class FeedController(BaseRepoController):
             return feed.writeString('utf-8')
 
         kind = 'RSS'
-        valid = CacheInvalidation.test_and_set_valid(repo_name, kind)
-        if not valid:
-            region_invalidate(_get_feed_from_cache, None, repo_name, kind)
-        return _get_feed_from_cache(repo_name, kind)
+        generation = CacheInvalidation.get_generation(repo_name)
+        return _get_feed_from_cache(repo_name, kind, generation)
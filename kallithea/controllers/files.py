@@ -30,7 +30,6 @@ import os
 import logging
 import traceback
 import tempfile
-import shutil
 
 from pylons import request, response, tmpl_context as c, url
 from pylons.i18n.translation import _
@@ -38,11 +37,13 @@ from pylons.controllers.util import redirect
 from kallithea.lib.utils import jsonify, action_logger
 
 from kallithea.lib import diffs
+from kallithea.lib import archive_cache
 from kallithea.lib import helpers as h
+from kallithea.lib.file_response import send_file, file_etag, is_not_modified
 
 from kallithea.lib.compat import OrderedDict
 from kallithea.lib.utils2 import convert_line_endings, detect_mode, safe_str,\
-    str2bool
+    str2bool, safe_int
 from kallithea.lib.auth import LoginRequired, HasRepoPermissionAnyDecorator
 from kallithea.lib.base import BaseRepoController, render
 from kallithea.lib.vcs.backends.base import EmptyChangeset
@@ -61,6 +62,7 @@ from kallithea.controllers.changeset import anchor_url, _ignorews_url,\
     _context_url, get_line_ctx, get_ignore_ws
 from webob.exc import HTTPNotFound
 from kallithea.lib.exceptions import NonRelativePathError
+from kallithea.lib.identities import resolve_authors
 
 
 log = logging.getLogger(__name__)
@@ -178,7 +180,7 @@ class FilesController(BaseRepoController):
                     c.file_history, _hist = self._get_node_history(c.changeset, f_path)
 
                 c.authors = []
-                for a in set([x.author for x in _hist]):
+                for a in resolve_authors(x.author for x in _hist):
                     c.authors.append((h.email(a), h.person(a)))
             else:
                 c.authors = c.file_history = []
@@ -234,7 +236,7 @@ class FilesController(BaseRepoController):
         if _file.is_file():
             file_history, _hist = self._get_node_history(changeset, f_path)
             c.authors = []
-            for a in set([x.author for x in _hist]):
+            for a in resolve_authors(x.author for x in _hist):
                 c.authors.append((h.email(a), h.person(a)))
             return render('files/files_history_box.html')
 
@@ -244,6 +246,8 @@ class FilesController(BaseRepoController):
     def rawfile(self, repo_name, revision, f_path):
         cs = self.__get_cs(revision)
         file_node = self.__get_filenode(cs, f_path)
+        if is_not_modified(request, response, cs.get_file_id(f_path)):
+            return ''
 
         response.content_disposition = 'attachment; filename=%s' % \
             safe_str(f_path.split(Repository.url_sep())[-1])
@@ -257,6 +261,8 @@ class FilesController(BaseRepoController):
     def raw(self, repo_name, revision, f_path):
         cs = self.__get_cs(revision)
         file_node = self.__get_filenode(cs, f_path)
+        if is_not_modified(request, response, cs.get_file_id(f_path)):
+            return ''
 
         raw_mimetype_mapping = {
             # map original mimetype to a mimetype used for "show as raw"
@@ -541,59 +547,47 @@ class FilesController(BaseRepoController):
             return _('Empty repository')
         except (ImproperArchiveTypeError, KeyError):
             return _('Unknown archive type')
-        # archive cache
         from kallithea import CONFIG
         rev_name = cs.raw_id[:12]
         archive_name = '%s-%s%s' % (safe_str(repo_name.replace('/', '_')),
                                     safe_str(rev_name), ext)
+        compression_level = safe_int(CONFIG.get('archive_compression_level'))
+        compression_threads = safe_int(CONFIG.get('archive_compression_threads'))
 
-        use_cached_archive = False  # defines if we use cached version of archive
-        archive_cache_enabled = CONFIG.get('archive_cache_dir')
-        if not subrepos and archive_cache_enabled:
-            #check if we it's ok to write
-            if not os.path.isdir(CONFIG['archive_cache_dir']):
-                os.makedirs(CONFIG['archive_cache_dir'])
-            cached_archive_path = os.path.join(CONFIG['archive_cache_dir'], archive_name)
-            if os.path.isfile(cached_archive_path):
-                log.debug('Found cached archive in %s' % cached_archive_path)
-                fd, archive = None, cached_archive_path
-                use_cached_archive = True
-            else:
-                log.debug('Archive %s is not yet cached' % (archive_name))
+        def fill_archive(stream):
+            cs.fill_archive(stream=stream, kind=fileformat, subrepos=subrepos,
+                            compression_level=compression_level,
+                            compression_threads=compression_threads)
 
-        if not use_cached_archive:
-            # generate new archive
-            fd, archive = tempfile.mkstemp()
-            temp_stream = open(archive, 'wb')
-            log.debug('Creating new temp archive in %s' % archive)
-            cs.fill_archive(stream=temp_stream, kind=fileformat, subrepos=subrepos)
-            temp_stream.close()
-            if not subrepos and archive_cache_enabled:
-                #if we generated the archive and use cache rename that
-                log.debug('Storing new archive in %s' % cached_archive_path)
-                shutil.move(archive, cached_archive_path)
-                archive = cached_archive_path
-
-        def get_chunked_archive(archive):
-            stream = open(archive, 'rb')
-            while True:
-                data = stream.read(16 * 1024)
-                if not data:
-                    stream.close()
-                    if fd:  # fd means we used temporary file
-                        os.close(fd)
-                    if not archive_cache_enabled:
-                        log.debug('Destroying temp archive %s' % archive)
-                        os.remove(archive)
-                    break
-                yield data
         # store download action
         action_logger(user=c.authuser,
                       action='user_downloaded_archive:%s' % (archive_name),
                       repo=repo_name, ipaddr=self.ip_addr, commit=True)
         response.content_disposition = str('attachment; filename=%s' % (archive_name))
         response.content_type = str(content_type)
-        return get_chunked_archive(archive)
+
+        cache = None if subrepos else archive_cache.get_cache()
+        if cache is None:
+            fd, archive = tempfile.mkstemp()
+            log.debug('Creating new temp archive in %s' % archive)
+            with os.fdopen(fd, 'wb') as temp_stream:
+                fill_archive(temp_stream)
+            # temporary archive, removed once sent
+            return send_file(request, response, archive, remove=True)
+
+        archive = cache.get(archive_name)
+        if archive is None:
+            # stream it while it is generated, once for all requests
+            log.debug('Archive %s is not yet cached' % (archive_name))
+            return cache.generate(archive_name, fill_archive)
+
+        log.debug('Found cached archive in %s' % archive)
+        location = CONFIG.get('archive_cache_location')
+        if location:
+            location = location.rstrip('/') + '/' + archive_name
+        return send_file(request, response, archive,
+                         etag=file_etag(archive, cs.raw_id + ext),
+                         location=location)
 
     @LoginRequired()
     @HasRepoPermissionAnyDecorator('repository.read', 'repository.write',
@@ -766,10 +760,10 @@ class FilesController(BaseRepoController):
         tip_cs = c.db_repo_scm_instance.get_changeset()
         if changesets is None:
             try:
-                changesets = tip_cs.get_file_history(f_path)
+                changesets = tip_cs.get_file_history_page(f_path)[0]
             except (NodeDoesNotExistError, ChangesetError):
                 #this node is not present at tip !
-                changesets = cs.get_file_history(f_path)
+                changesets = cs.get_file_history_page(f_path)[0]
         hist_l = []
 
         changesets_group = ([], _("Changesets"))
@@ -61,6 +61,7 @@ from kallithea.controllers.changeset import _ignorews_url,\
     _context_url, get_line_ctx, get_ignore_ws
 from kallithea.controllers.compare import CompareController
 from kallithea.lib.graphmod import graph_data
+from kallithea.lib.identities import resolve_authors
 
 log = logging.getLogger(__name__)
 
@@ -552,6 +553,7 @@ class PullrequestsController(BaseRepoController):
         c.cs_repo = c.cs_repo
         c.cs_ranges = [org_scm_instance.get_changeset(x) for x in c.pull_request.revisions]
         c.cs_ranges_org = None # not stored and not important and moving target - could be calculated ...
+        resolve_authors(x.author for x in c.cs_ranges)
         revs = [ctx.revision for ctx in reversed(c.cs_ranges)]
         c.jsdata = json.dumps(graph_data(org_scm_instance, revs))
 
@@ -631,13 +633,13 @@ class PullrequestsController(BaseRepoController):
         # we swap org/other ref since we run a simple diff on one repo
         log.debug('running diff between %s and %s in %s'
                   % (c.a_rev, c.cs_rev, org_scm_instance.path))
-        txtdiff = org_scm_instance.get_diff(rev1=safe_str(c.a_rev), rev2=safe_str(c.cs_rev),
-                                      ignore_whitespace=ignore_whitespace,
-                                      context=line_context)
-
-        diff_processor = diffs.DiffProcessor(txtdiff or '', format='gitdiff',
-                                             diff_limit=diff_limit)
-        _parsed = diff_processor.prepare()
+        diff_processor = diffs.get_diff_processor(org_scm_instance,
+                                                  safe_str(c.a_rev),
+                                                  safe_str(c.cs_rev),
+                                                  ignore_whitespace=ignore_whitespace,
+                                                  context=line_context,
+                                                  diff_limit=diff_limit)
+        _parsed = diff_processor.parsed_diff
 
         c.limited_diff = False
         if isinstance(_parsed, LimitedDiffContainer):
@@ -654,8 +656,8 @@ class PullrequestsController(BaseRepoController):
             c.lines_deleted += st['deleted']
             fid = h.FID('', f['filename'])
             c.files.append([fid, f['operation'], f['filename'], f['stats']])
-            htmldiff = diff_processor.as_html(enable_comments=True,
-                                              parsed_lines=[f])
+            # rendered when the page shows it
+            htmldiff = diff_processor.as_deferred_html(f, enable_comments=True)
             c.changes[fid] = [f['operation'], f['filename'], htmldiff]
 
         # inline comments
@@ -35,7 +35,7 @@ from pylons import tmpl_context as c, request
 from pylons.i18n.translation import _
 from webob.exc import HTTPBadRequest
 
-from beaker.cache import cache_region, region_invalidate
+from beaker.cache import cache_region
 
 from kallithea.lib.compat import product
 from kallithea.lib.vcs.exceptions import ChangesetError, EmptyRepositoryError, \
@@ -91,7 +91,7 @@ class SummaryController(BaseRepoController):
         log.debug('Looking for README file')
 
         @cache_region('long_term')
-        def _get_readme_from_cache(key, kind):
+        def _get_readme_from_cache(key, kind, generation):
             readme_data = None
             readme_file = None
             try:
@@ -122,10 +122,8 @@ class SummaryController(BaseRepoController):
             return readme_data, readme_file
 
         kind = 'README'
-        valid = CacheInvalidation.test_and_set_valid(repo_name, kind)
-        if not valid:
-            region_invalidate(_get_readme_from_cache, None, repo_name, kind)
-        return _get_readme_from_cache(repo_name, kind)
+        generation = CacheInvalidation.get_generation(repo_name)
+        return _get_readme_from_cache(repo_name, kind, generation)
 
     @LoginRequired()
     @HasRepoPermissionAnyDecorator('repository.read', 'repository.write',
@@ -27,6 +27,7 @@ Original author and date, and relevant copyright and licensing information is be
 
 import StringIO
 
+from kallithea.lib import highlight_cache
 from kallithea.lib.vcs.exceptions import VCSError
 from kallithea.lib.vcs.nodes import FileNode
 from pygments.formatters import HtmlFormatter
@@ -48,17 +49,19 @@ def annotate_highlight(filenode, annotate_from_changeset_func=None,
     :param headers: dictionary with headers (keys are whats in ``order``
       parameter)
     """
-    from kallithea.lib.utils import get_custom_lexer
+    from kallithea.lib.utils import get_lexer_for_filenode
     options['linenos'] = True
     formatter = AnnotateHtmlFormatter(filenode=filenode, order=order,
         headers=headers,
         annotate_from_changeset_func=annotate_from_changeset_func, **options)
-    lexer = get_custom_lexer(filenode.extension) or filenode.lexer
+    lexer = get_lexer_for_filenode(filenode)
+    formatter.highlight_key = highlight_cache.get_key(filenode, lexer)
     highlighted = highlight(filenode.content, lexer, formatter)
     return highlighted
 
 
-class AnnotateHtmlFormatter(HtmlFormatter):
+class AnnotateHtmlFormatter(highlight_cache.CachedFormatterMixin,
+                            HtmlFormatter):
 
     def __init__(self, filenode, annotate_from_changeset_func=None,
             order=None, **options):
@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+kallithea.lib.archive_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Disk cache of downloadable repository archives.
+
+Many clients tend to download the same archive at the same time, for
+example right after a release has been tagged. An archive is only generated
+once: the first request creates it in a ``.part`` file in the background,
+and all concurrent requests, also from other processes, stream that file
+while it grows. The total size of the cache can be bounded, least recently
+downloaded archives are removed first.
+"""
+
+from __future__ import with_statement
+
+import os
+import time
+import errno
+import logging
+import threading
+import traceback
+
+from kallithea.lib.utils2 import safe_int
+
+log = logging.getLogger(__name__)
+
+PART_SUFFIX = '.part'
+# seconds a growing archive may not change before it is considered abandoned
+STALE_TIMEOUT = 300
+# seconds to wait for more data of a growing archive
+POLL_INTERVAL = 0.1
+BLOCK_SIZE = 64 * 1024
+# share of max size the cache is shrunk to when full
+EVICT_RATIO = 0.8
+
+
+class ArchiveGenerationError(Exception):
+    pass
+
+
+class ArchiveCache(object):
+    """
+    Directory of archives of at most ``max_size`` bytes, or of unbounded
+    size if ``max_size`` is None.
+
+    Usage::
+
+      cache = ArchiveCache(path, 1024 * 1024 * 1024)
+      path = cache.get(name)
+      if path is None:
+          app_iter = cache.generate(name, lambda f: cs.fill_archive(f))
+    """
+
+    def __init__(self, path, max_size=None):
+        self.path = path
+        self.max_size = max_size
+
+    def _get_path(self, name):
+        return os.path.join(self.path, name)
+
+    def get(self, name):
+        """
+        Returns path of the complete archive ``name`` or None.
+        """
+        path = self._get_path(name)
+        try:
+            st = os.stat(path)
+            # access time is used for finding least recently used archives,
+            # the modification time is kept as it is part of the ETag
+            os.utime(path, (time.time(), st.st_mtime))
+        except OSError:
+            return None
+        return path
+
+    def generate(self, name, fill):
+        """
+        Returns an iterable over the archive ``name`` while it is being
+        created by calling ``fill`` with a file to write it to. If the archive
+        is already being created by someone else, that is streamed instead.
+        """
+        path = self._get_path(name)
+        part_path = path + PART_SUFFIX
+        while True:
+            if not os.path.isdir(self.path):
+                try:
+                    os.makedirs(self.path)
+                except OSError, e:
+                    if e.errno != errno.EEXIST:
+                        raise
+            try:
+                fd = os.open(part_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY,
+                             0644)
+            except OSError, e:
+                if e.errno != errno.EEXIST:
+                    raise
+            else:
+                # opening it for reading first, it might be renamed quickly
+                stream = open(part_path, 'rb')
+                t = threading.Thread(target=self._fill,
+                                     args=(fd, part_path, path, fill),
+                                     name='archive %s' % name)
+                t.daemon = True
+                t.start()
+                log.debug('Generating archive %s', path)
+                return self._follow(stream, part_path, path)
+
+            try:
+                stream = open(part_path, 'rb')
+            except IOError, e:
+                if e.errno != errno.ENOENT:
+                    raise
+                # just completed or failed
+                if os.path.isfile(path):
+                    stream = open(path, 'rb')
+                    return self._follow(stream, part_path, path)
+                continue
+            st = os.fstat(stream.fileno())
+            if time.time() - st.st_mtime > STALE_TIMEOUT:
+                log.warning('Removing abandoned archive %s', part_path)
+                stream.close()
+                self._remove_if_same(part_path, st)
+                continue
+            log.debug('Waiting for archive %s being generated', path)
+            return self._follow(stream, part_path, path)
+
+    def _fill(self, fd, part_path, path, fill):
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                fill(f)
+            if self.max_size is not None:
+                self._evict()
+            os.rename(part_path, path)
+        except Exception:
+            log.error('Failed to generate archive %s: %s',
+                      path, traceback.format_exc())
+            self._remove(part_path)
+            return
+        log.debug('Stored new archive %s', path)
+
+    def _follow(self, stream, part_path, path):
+        """
+        Yields content of ``stream`` while it is being written until it has
+        been renamed from ``part_path`` to ``path``.
+        """
+        try:
+            ino = os.fstat(stream.fileno()).st_ino
+            last_change = time.time()
+            while True:
+                data = stream.read(BLOCK_SIZE)
+                if data:
+                    last_change = time.time()
+                    yield data
+                    continue
+                if not self._is_file(part_path, ino):
+                    # the last writes happened before the rename
+                    data = stream.read()
+                    if data:
+                        yield data
+                    if not self._is_file(path, ino):
+                        raise ArchiveGenerationError(
+                            'Generating archive %s failed' % path)
+                    return
+                if time.time() - last_change > STALE_TIMEOUT:
+                    raise ArchiveGenerationError(
+                        'Generating archive %s stalled' % path)
+                time.sleep(POLL_INTERVAL)
+        finally:
+            stream.close()
+
+    def _is_file(self, path, ino):
+        try:
+            return os.stat(path).st_ino == ino
+        except OSError:
+            return False
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _remove_if_same(self, path, st):
+        # someone else might have replaced it already
+        if self._is_file(path, st.st_ino):
+            self._remove(path)
+
+    def _evict(self):
+        """
+        Remove least recently downloaded archives if the cache is too big.
+        """
+        entries = []
+        for filename in os.listdir(self.path):
+            path = os.path.join(self.path, filename)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if filename.endswith(PART_SUFFIX):
+                # growing archives count but can't be removed yet
+                entries.append((None, st.st_size, None))
+            else:
+                entries.append((st.st_atime, st.st_size, path))
+        size = sum(e[1] for e in entries)
+        if size <= self.max_size:
+            return
+        entries.sort()
+        limit = self.max_size * EVICT_RATIO
+        removed = 0
+        for _atime, entry_size, path in entries:
+            if size <= limit:
+                break
+            if path is None:
+                continue
+            self._remove(path)
+            size -= entry_size
+            removed += 1
+        log.debug('Removed %s archives from cache %s', removed, self.path)
+
+
+def get_cache():
+    """
+    Return an archive cache or None if it is disabled. Archives are stored
+    in ``archive_cache_dir``, the size of the cache in megabytes is given by
+    ``archive_cache_size`` setting.
+    """
+    import kallithea
+    cache_dir = kallithea.CONFIG.get('archive_cache_dir')
+    if not cache_dir:
+        return None
+    size = safe_int(kallithea.CONFIG.get('archive_cache_size'))
+    return ArchiveCache(cache_dir, size * 1024 * 1024 if size else None)
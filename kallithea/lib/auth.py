@@ -52,9 +52,9 @@ from kallithea.model.user import UserModel
 from kallithea.model.db import User, Repository, Permission, \
     UserToPerm, UserGroupRepoToPerm, UserGroupToPerm, UserGroupMember, \
     RepoGroup, UserGroupRepoGroupToPerm, UserIpMap, UserGroupUserGroupToPerm, \
-    UserGroup, UserApiKeys
+    UserGroup, UserApiKeys, CacheInvalidation
 
-from kallithea.lib.utils2 import safe_unicode, aslist
+from kallithea.lib.utils2 import safe_unicode, aslist, str2bool
 from kallithea.lib.utils import get_repo_slug, get_repo_group_slug, \
     get_user_group_slug, conditional_cache
 from kallithea.lib.caching_query import FromCache
@@ -175,7 +175,13 @@ class CookieStoreWrapper(object):
 
 
 def _cached_perms_data(user_id, user_is_admin, user_inherit_default_permissions,
-                       explicit, algo):
+                       explicit, algo, repo_name=None, perms_version=None):
+    """
+    Computes permissions of user. If ``repo_name`` is given only permissions
+    of that repository are computed and repository and user groups are
+    skipped. ``perms_version`` is not used, it only makes part of the cache
+    key.
+    """
     RK = 'repositories'
     GK = 'repositories_groups'
     UK = 'user_groups'
@@ -201,9 +207,13 @@ def _cached_perms_data(user_id, user_is_admin, user_inherit_default_permissions,
     default_user = User.get_by_username('default', cache=True)
     default_user_id = default_user.user_id
 
-    default_repo_perms = Permission.get_default_perms(default_user_id)
-    default_repo_groups_perms = Permission.get_default_group_perms(default_user_id)
-    default_user_group_perms = Permission.get_default_user_group_perms(default_user_id)
+    default_repo_perms = Permission.get_default_perms(default_user_id,
+                                                      repo_name=repo_name)
+    if repo_name is not None:
+        default_repo_groups_perms = default_user_group_perms = []
+    else:
+        default_repo_groups_perms = Permission.get_default_group_perms(default_user_id)
+        default_user_group_perms = Permission.get_default_user_group_perms(default_user_id)
 
     if user_is_admin:
         #==================================================================
@@ -342,8 +352,11 @@ def _cached_perms_data(user_id, user_is_admin, user_inherit_default_permissions,
                Permission.permission_id))\
         .join((UserGroupMember, UserGroupRepoToPerm.users_group_id ==
                UserGroupMember.users_group_id))\
-        .filter(UserGroupMember.user_id == uid)\
-        .all()
+        .filter(UserGroupMember.user_id == uid)
+    if repo_name is not None:
+        user_repo_perms_from_users_groups = user_repo_perms_from_users_groups\
+            .filter(Repository.repo_name == repo_name)
+    user_repo_perms_from_users_groups = user_repo_perms_from_users_groups.all()
 
     multiple_counter = collections.defaultdict(int)
     for perm in user_repo_perms_from_users_groups:
@@ -362,7 +375,7 @@ def _cached_perms_data(user_id, user_is_admin, user_inherit_default_permissions,
 
     # user explicit permissions for repositories, overrides any specified
     # by the group permission
-    user_repo_perms = Permission.get_default_perms(uid)
+    user_repo_perms = Permission.get_default_perms(uid, repo_name=repo_name)
     for perm in user_repo_perms:
         r_k = perm.UserRepoToPerm.repository.repo_name
         cur_perm = permissions[RK][r_k]
@@ -375,6 +388,9 @@ def _cached_perms_data(user_id, user_is_admin, user_inherit_default_permissions,
                 p = _choose_perm(p, cur_perm)
         permissions[RK][r_k] = p
 
+    if repo_name is not None:
+        return permissions
+
     #======================================================================
     # !! PERMISSIONS FOR REPOSITORY GROUPS !!
     #======================================================================
@@ -503,7 +519,25 @@ class AuthUser(object):
 
     @LazyProperty
     def permissions(self):
-        return self.get_perms(user=self, cache=False)
+        return self.get_perms(user=self, cache=self._use_permission_cache())
+
+    @staticmethod
+    def _use_permission_cache():
+        from kallithea import CONFIG
+        return str2bool(CONFIG.get('permission_cache'))
+
+    def get_repo_permission(self, repo_name):
+        """
+        Returns permission of user on single repository. Unless permissions
+        of all repositories are known already, only permissions of this
+        repository are computed.
+        """
+        if 'permissions' in self.__dict__:
+            perms = self.permissions
+        else:
+            perms = self.get_perms(user=self, repo_name=repo_name,
+                                   cache=self._use_permission_cache())
+        return perms['repositories'][repo_name]
 
     @property
     def api_keys(self):
@@ -547,7 +581,8 @@ class AuthUser(object):
 
         log.debug('Auth User is now %s' % self)
 
-    def get_perms(self, user, explicit=True, algo='higherwin', cache=False):
+    def get_perms(self, user, explicit=True, algo='higherwin', cache=False,
+                  repo_name=None):
         """
         Fills user permission attribute with permissions taken from database
         works for permissions given for repositories, and for permissions that
@@ -562,16 +597,24 @@ class AuthUser(object):
             it's multiple defined, eg user in two different groups. It also
             decides if explicit flag is turned off how to specify the permission
             for case when user is in a group + have defined separate permission
+        :param cache: use permissions cached until permissions of the user
+            change
+        :param repo_name: only compute permissions of this repository
         """
         user_id = user.user_id
         user_is_admin = user.is_admin
         user_inherit_default_permissions = user.inherit_default_permissions
+        perms_version = None
+        if cache:
+            perms_version = CacheInvalidation.get_permissions_version(user_id)
+            cache = perms_version is not None
 
         log.debug('Getting PERMISSION tree')
-        compute = conditional_cache('short_term', 'cache_desc',
+        compute = conditional_cache('long_term', 'cache_desc',
                                     condition=cache, func=_cached_perms_data)
         return compute(user_id, user_is_admin,
-                       user_inherit_default_permissions, explicit, algo)
+                       user_inherit_default_permissions, explicit, algo,
+                       repo_name, perms_version)
 
     def get_api_keys(self):
         api_keys = [self.api_key]
@@ -1181,7 +1224,7 @@ class HasPermissionAnyMiddleware(object):
         # dict by unicode
         repo_name = safe_unicode(repo_name)
         usr = AuthUser(user.user_id)
-        self.user_perms = set([usr.permissions['repositories'][repo_name]])
+        self.user_perms = set([usr.get_repo_permission(repo_name)])
         self.username = user.username
         self.repo_name = repo_name
         return self.check_permissions()
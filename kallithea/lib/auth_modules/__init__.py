@@ -15,21 +15,37 @@
 Authentication modules
 """
 
+import os
+import time
+import hmac
+import hashlib
 import logging
 import traceback
 
+import kallithea
 from kallithea import EXTERN_TYPE_INTERNAL
 from kallithea.lib.compat import importlib
-from kallithea.lib.utils2 import str2bool
+from kallithea.lib.utils2 import str2bool, safe_int, safe_str
 from kallithea.lib.compat import formatted_json, hybrid_property
 from kallithea.lib.auth import PasswordGenerator
+from kallithea.lib.vcs.utils.lrucache import LRUCache
 from kallithea.model.user import UserModel
-from kallithea.model.db import Setting, User
+from kallithea.model.db import Setting, User, CacheInvalidation, \
+    get_changed_keys
 from kallithea.model.meta import Session
 from kallithea.model.user_group import UserGroupModel
 
 log = logging.getLogger(__name__)
 
+# number of kept successful verifications of credentials
+CREDENTIALS_CACHE_SIZE = 1000
+
+_credentials = LRUCache(CREDENTIALS_CACHE_SIZE)
+# passwords are only kept as digests keyed with a per process secret
+_digest_key = os.urandom(32)
+# authentication settings and their generation
+_auth_settings = (None, None)
+
 
 class LazyFormencode(object):
     def __init__(self, formencode_obj, *args, **kwargs):
@@ -351,7 +367,54 @@ def loadplugin(plugin):
     return plugin
 
 
-def authenticate(username, password, environ=None):
+def get_auth_settings():
+    """
+    Returns dict with all authentication settings, it is only read from the
+    database again when the settings change. The dict is shared and must not
+    be modified.
+    """
+    global _auth_settings
+    key = CacheInvalidation.AUTH_SETTINGS_KEY
+    sa = Session()
+    # pending changes would be flushed by the query anyway
+    sa.flush()
+    changed = key in get_changed_keys(sa)
+    generation = CacheInvalidation.get_generation(key)
+    cached_generation, settings = _auth_settings
+    if changed or settings is None or cached_generation != generation:
+        settings = Setting.get_auth_settings()
+        if not changed:
+            _auth_settings = (generation, settings)
+    return settings
+
+
+def _get_credentials_ttl():
+    return safe_int(kallithea.CONFIG.get('auth_cache_ttl'), 0)
+
+
+def _get_credentials_key(plugin_name, username, password):
+    digest = hmac.new(_digest_key, safe_str(password), hashlib.sha256).digest()
+    return (plugin_name, safe_str(username), digest)
+
+
+def _get_credentials_generations(user_id):
+    """
+    Returns generations of authentication settings and credentials of user
+    a verification is valid for or None if the current transaction changed
+    them.
+    """
+    keys = (CacheInvalidation.AUTH_SETTINGS_KEY,
+            CacheInvalidation.USER_AUTH_KEY % user_id)
+    sa = Session()
+    sa.flush()
+    if get_changed_keys(sa).intersection(keys):
+        return None
+    generations = CacheInvalidation.get_generations()
+    return tuple(CacheInvalidation.get_generation(key, generations)
+                 for key in keys)
+
+
+def authenticate(username, password, environ=None, cache=False):
     """
     Authentication function used for access control,
     It tries to authenticate based on enabled authentication modules.
@@ -359,10 +422,15 @@ def authenticate(username, password, environ=None):
     :param username: username can be empty for container auth
     :param password: password can be empty for container auth
     :param environ: environ headers passed for container auth
+    :param cache: reuse successful verifications of the same credentials
+        for ``auth_cache_ttl`` seconds, unless the user or authentication
+        settings changed in the meantime
     :returns: None if auth failed, plugin_user dict if auth is correct
     """
 
-    auth_plugins = Setting.get_auth_plugins()
+    ttl = _get_credentials_ttl() if cache and password else 0
+    auth_settings = get_auth_settings()
+    auth_plugins = auth_settings.get('auth_plugins') or []
     log.debug('Authentication against %s plugins' % (auth_plugins,))
     for module in auth_plugins:
         try:
@@ -376,8 +444,7 @@ def authenticate(username, password, environ=None):
         plugin_settings = {}
         for v in plugin.plugin_settings():
             conf_key = "auth_%s_%s" % (plugin_name, v["name"])
-            setting = Setting.get_by_name(conf_key)
-            plugin_settings[v["name"]] = setting.app_settings_value if setting else None
+            plugin_settings[v["name"]] = auth_settings.get(conf_key)
         log.debug('Plugin settings \n%s' % formatted_json(plugin_settings))
 
         if not str2bool(plugin_settings["enabled"]):
@@ -397,6 +464,20 @@ def authenticate(username, password, environ=None):
             log.debug('Plugin %s accepted user `%s` for authentication'
                       % (module, user))
 
+        credentials_key = None
+        if ttl and user is not None:
+            credentials_key = _get_credentials_key(plugin_name, username,
+                                                   password)
+            entry = _credentials.get(credentials_key)
+            if entry is not None:
+                expires, user_id, generations, plugin_user = entry
+                if (expires > time.time() and user_id == user.user_id and
+                    generations == _get_credentials_generations(user_id)):
+                    log.debug('Reusing verification of user %s by %s plugin'
+                              % (username, plugin.__module__))
+                    return plugin_user
+                _credentials.pop(credentials_key)
+
         log.info('Authenticating user using %s plugin' % plugin.__module__)
         # _authenticate is a wrapper for .auth() method of plugin.
         # it checks if .auth() sends proper data. For KallitheaExternalAuthPlugin
@@ -410,6 +491,13 @@ def authenticate(username, password, environ=None):
 
         if plugin_user:
             log.debug('Plugin returned proper authentication data')
+            if credentials_key is not None:
+                # external plugins might have updated the user, generations
+                # are taken after that
+                generations = _get_credentials_generations(user.user_id)
+                if generations is not None:
+                    _credentials[credentials_key] = (time.time() + ttl,
+                        user.user_id, generations, plugin_user)
             return plugin_user
 
         # we failed to Auth because .auth() method didn't return proper the user
@@ -30,6 +30,7 @@ Original author and date, and relevant copyright and licensing information is be
 
 import logging
 import time
+import functools
 import traceback
 
 import webob.exc
@@ -61,6 +62,10 @@ from kallithea.model.pull_request import PullRequestModel
 
 log = logging.getLogger(__name__)
 
+# environ key set by responses which read from the database while they are
+# sent and remove the database session themselves when done
+STREAMING_RESPONSE_KEY = 'kallithea.streaming_response'
+
 
 def _filter_proxy(ip):
     """
@@ -144,10 +149,14 @@ class BaseVCSController(object):
         # base path of repo locations
         self.basepath = self.config['base_path']
         #authenticate this VCS request using authfunc
-        self.authenticate = BasicAuth('', auth_modules.authenticate,
+        self.authenticate = BasicAuth('', functools.partial(
+                                          auth_modules.authenticate, cache=True),
                                       config.get('auth_ret_code'))
         self.ip_addr = '0.0.0.0'
 
+    def _is_vcs_request(self, environ):
+        raise NotImplementedError()
+
     def _handle_request(self, environ, start_response):
         raise NotImplementedError()
 
@@ -272,6 +281,12 @@ class BaseVCSController(object):
         return make_lock, locked, locked_by
 
     def __call__(self, environ, start_response):
+        if not self._is_vcs_request(environ):
+            try:
+                return self.application(environ, start_response)
+            finally:
+                if not environ.get(STREAMING_RESPONSE_KEY):
+                    meta.Session.remove()
         start = time.time()
         try:
             return self._handle_request(environ, start_response)
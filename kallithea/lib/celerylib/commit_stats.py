@@ -0,0 +1,199 @@
+# -*- coding: utf-8 -*-
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+kallithea.lib.celerylib.commit_stats
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Aggregation of commit activity shown on the repository summary page.
+
+Activity is collected into ``CommitStats`` which keeps commits and file
+change counts in per author and per day buckets. Aggregates of separate
+revision ranges can be merged, so long ranges can be parsed in parallel
+by a pool of processes inside celery workers. The processes only read the repository, authors are
+resolved to users in the parent process which owns the database
+connections.
+"""
+
+import logging
+import multiprocessing
+from time import mktime
+
+from kallithea.lib.helpers import person
+from kallithea.lib.vcs import get_backend
+
+log = logging.getLogger(__name__)
+
+
+def _day(date):
+    return mktime([date.year, date.month, date.day, 0, 0, 0, 0, 0, 0])
+
+
+def author_label(author):
+    # for js data compatibility cleans the key for person from '
+    return person(author).replace('"', "")
+
+
+class CommitStats(object):
+    """
+    Commit activity of a range of revisions.
+
+    ``authors`` maps author label to dict of day timestamp to list of
+    commits, added, changed and removed counts, ``days`` maps day timestamp
+    to number of commits.
+    """
+
+    def __init__(self):
+        self.authors = {}
+        self.days = {}
+
+    def add(self, author, day, added, changed, removed):
+        days = self.authors.setdefault(author, {})
+        bucket = days.get(day)
+        if bucket is None:
+            days[day] = [1, added, changed, removed]
+        else:
+            bucket[0] += 1
+            bucket[1] += added
+            bucket[2] += changed
+            bucket[3] += removed
+        self.days[day] = self.days.get(day, 0) + 1
+
+    def add_changeset(self, cs):
+        """
+        Adds activity of ``cs`` under its raw author string, see
+        ``labelled``.
+        """
+        added, changed, removed = cs.file_change_counts
+        self.add(cs.author, _day(cs.date), added, changed, removed)
+
+    def labelled(self):
+        """
+        Returns aggregate with raw author strings replaced by their labels,
+        authors of the same user are merged. Each distinct author is
+        labelled once.
+        """
+        stats = CommitStats()
+        stats.days = dict(self.days)
+        for author, days in self.authors.iteritems():
+            stats._merge_author(author_label(author), days)
+        return stats
+
+    def _merge_author(self, author, days):
+        for day, (commits, added, changed, removed) in days.iteritems():
+            bucket = self.authors.setdefault(author, {}).get(day)
+            if bucket is None:
+                self.authors[author][day] = [commits, added, changed,
+                                             removed]
+            else:
+                bucket[0] += commits
+                bucket[1] += added
+                bucket[2] += changed
+                bucket[3] += removed
+
+    def merge(self, other):
+        for author, days in other.authors.iteritems():
+            self._merge_author(author, days)
+        for day, commits in other.days.iteritems():
+            self.days[day] = self.days.get(day, 0) + commits
+
+    @classmethod
+    def from_json_data(cls, commit_activity, commit_activity_combined):
+        """
+        Creates aggregate from the data stored in ``Statistics``.
+        """
+        stats = cls()
+        for author, author_data in commit_activity.iteritems():
+            for item in author_data['data']:
+                # placeholder of repositories without commits is [0, 1]
+                if not isinstance(item, dict):
+                    continue
+                stats.authors.setdefault(author, {})[item['time']] = [
+                    item['commits'], item['added'], item['changed'],
+                    item['removed']]
+        for day, commits in commit_activity_combined:
+            stats.days[day] = commits
+        return stats
+
+    def to_json_data(self):
+        """
+        Returns commit activity and combined activity in the format stored
+        in ``Statistics``.
+        """
+        commit_activity = {}
+        for author, days in self.authors.iteritems():
+            commit_activity[author] = {
+                "label": author,
+                "data": [{"time": day,
+                          "commits": commits,
+                          "added": added,
+                          "changed": changed,
+                          "removed": removed,
+                          }
+                         for day, (commits, added, changed, removed)
+                         in sorted(days.iteritems())],
+                "schema": ["commits"],
+            }
+        return commit_activity, sorted(self.days.iteritems())
+
+
+def _parse_raw_range(repo, start, end):
+    stats = CommitStats()
+    cs = None
+    for cs in repo[start:end]:
+        stats.add_changeset(cs)
+    return stats, cs
+
+
+def parse_range(repo, start, end):
+    """
+    Returns ``CommitStats`` of revisions from ``start`` to ``end``
+    (exclusive) and the last parsed changeset.
+    """
+    stats, cs = _parse_raw_range(repo, start, end)
+    return stats.labelled(), cs
+
+
+def _parse_range_worker(args):
+    # runs in a forked process and must not touch the database, the
+    # connections of the parent can't be shared
+    alias, path, start, end = args
+    repo = get_backend(alias)(path, create=False)
+    return _parse_raw_range(repo, start, end)[0]
+
+
+def parse_range_parallel(repo, start, end, processes):
+    """
+    Like ``parse_range`` but splits the range into ``processes`` chunks
+    parsed by a pool of processes. Falls back to parsing in this process
+    when it can't have children (e.g. it is a daemonic celery worker).
+
+    The pool forks the calling process, so it must only be used in celery
+    workers and never in the web server.
+    """
+    count = len(repo.revisions[start:end])
+    if processes < 2 or count < 2 or multiprocessing.current_process().daemon:
+        return parse_range(repo, start, end)
+    step = -(-count // processes)
+    chunks = [(repo.alias, repo.path, i, min(i + step, start + count))
+              for i in xrange(start, start + count, step)]
+    log.debug('parsing %s revisions in %s chunks' % (count, len(chunks)))
+    pool = multiprocessing.Pool(min(processes, len(chunks)))
+    try:
+        stats = CommitStats()
+        for partial in pool.map(_parse_range_worker, chunks):
+            stats.merge(partial)
+    finally:
+        pool.close()
+        pool.join()
+    return stats.labelled(), repo.get_changeset(start + count - 1)
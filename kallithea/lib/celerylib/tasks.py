@@ -33,19 +33,18 @@ import traceback
 import logging
 from os.path import join as jn
 
-from time import mktime
-from operator import itemgetter
-from string import lower
 
 from pylons import config
 
-from kallithea import CELERY_ON
+from kallithea import CELERY_ON, CELERY_EAGER
 from kallithea.lib.celerylib import run_task, locked_task, dbsession, \
     str2bool, __get_lockkey, LockHeld, DaemonLock, get_session
-from kallithea.lib.helpers import person
 from kallithea.lib.rcmail.smtp_mailer import SmtpMailer
 from kallithea.lib.utils import add_cache, action_logger
-from kallithea.lib.compat import json, OrderedDict
+from kallithea.lib.utils2 import safe_int
+from kallithea.lib.compat import json
+from kallithea.lib.celerylib.commit_stats import CommitStats, \
+    author_label, parse_range_parallel
 from kallithea.lib.hooks import log_create_repository
 
 from kallithea.model.db import Statistics, Repository, User
@@ -90,13 +89,8 @@ def get_commits_stats(repo_name, ts_min_y, ts_max_y, recurse_limit=100):
     log.info('running task with lockkey %s' % lockkey)
 
     try:
-        lock = l = DaemonLock(file_=jn(lockkey_path, lockkey))
+        lock = DaemonLock(file_=jn(lockkey_path, lockkey))
 
-        # for js data compatibility cleans the key for person from '
-        akc = lambda k: person(k).replace('"', "")
-
-        co_day_auth_aggr = {}
-        commits_by_day_aggregate = {}
         repo = Repository.get_by_repo_name(repo_name)
         if repo is None:
             return True
@@ -108,11 +102,12 @@ def get_commits_stats(repo_name, ts_min_y, ts_max_y, recurse_limit=100):
             lock.release()
             return True
 
-        skip_date_limit = True
         parse_limit = int(config['app_conf'].get('commit_parse_limit'))
+        processes = safe_int(config['app_conf'].get('commit_parse_processes'), 1)
+        if not CELERY_ON or CELERY_EAGER:
+            # only fork celery workers, never the web server
+            processes = 1
         last_rev = None
-        last_cs = None
-        timegetter = itemgetter('time')
 
         dbrepo = DBS.query(Repository)\
             .filter(Repository.repo_name == repo_name).scalar()
@@ -130,78 +125,27 @@ def get_commits_stats(repo_name, ts_min_y, ts_max_y, recurse_limit=100):
             return True
 
         if cur_stats:
-            commits_by_day_aggregate = OrderedDict(json.loads(
-                                        cur_stats.commit_activity_combined))
-            co_day_auth_aggr = json.loads(cur_stats.commit_activity)
-
-        log.debug('starting parsing %s' % parse_limit)
-        lmktime = mktime
-
+            commit_stats = CommitStats.from_json_data(
+                json.loads(cur_stats.commit_activity),
+                json.loads(cur_stats.commit_activity_combined))
+        else:
+            commit_stats = CommitStats()
+
+        # each process parses parse_limit revisions
+        parse_limit *= max(processes, 1)
         last_rev = last_rev + 1 if last_rev >= 0 else 0
         log.debug('Getting revisions from %s to %s' % (
              last_rev, last_rev + parse_limit)
         )
-        for cs in repo[last_rev:last_rev + parse_limit]:
-            log.debug('parsing %s' % cs)
-            last_cs = cs  # remember last parsed changeset
-            k = lmktime([cs.date.timetuple()[0], cs.date.timetuple()[1],
-                          cs.date.timetuple()[2], 0, 0, 0, 0, 0, 0])
-
-            if akc(cs.author) in co_day_auth_aggr:
-                try:
-                    l = [timegetter(x) for x in
-                         co_day_auth_aggr[akc(cs.author)]['data']]
-                    time_pos = l.index(k)
-                except ValueError:
-                    time_pos = None
-
-                if time_pos >= 0 and time_pos is not None:
-
-                    datadict = \
-                        co_day_auth_aggr[akc(cs.author)]['data'][time_pos]
-
-                    datadict["commits"] += 1
-                    datadict["added"] += len(cs.added)
-                    datadict["changed"] += len(cs.changed)
-                    datadict["removed"] += len(cs.removed)
-
-                else:
-                    if k >= ts_min_y and k <= ts_max_y or skip_date_limit:
-
-                        datadict = {"time": k,
-                                    "commits": 1,
-                                    "added": len(cs.added),
-                                    "changed": len(cs.changed),
-                                    "removed": len(cs.removed),
-                                   }
-                        co_day_auth_aggr[akc(cs.author)]['data']\
-                            .append(datadict)
-
-            else:
-                if k >= ts_min_y and k <= ts_max_y or skip_date_limit:
-                    co_day_auth_aggr[akc(cs.author)] = {
-                                        "label": akc(cs.author),
-                                        "data": [{"time":k,
-                                                 "commits":1,
-                                                 "added":len(cs.added),
-                                                 "changed":len(cs.changed),
-                                                 "removed":len(cs.removed),
-                                                 }],
-                                        "schema": ["commits"],
-                                        }
-
-            #gather all data by day
-            if k in commits_by_day_aggregate:
-                commits_by_day_aggregate[k] += 1
-            else:
-                commits_by_day_aggregate[k] = 1
-
-        overview_data = sorted(commits_by_day_aggregate.items(),
-                               key=itemgetter(0))
+        parsed, last_cs = parse_range_parallel(repo, last_rev,
+                                               last_rev + parse_limit,
+                                               processes)
+        commit_stats.merge(parsed)
+        co_day_auth_aggr, overview_data = commit_stats.to_json_data()
 
         if not co_day_auth_aggr:
-            co_day_auth_aggr[akc(repo.contact)] = {
-                "label": akc(repo.contact),
+            co_day_auth_aggr[author_label(repo.contact)] = {
+                "label": author_label(repo.contact),
                 "data": [0, 1],
                 "schema": ["commits"],
             }
@@ -478,18 +422,6 @@ def __get_codes_stats(repo_name):
     from kallithea.config.conf import LANGUAGES_EXTENSIONS_MAP
     repo = Repository.get_by_repo_name(repo_name).scm_instance
 
-    tip = repo.get_changeset()
-    code_stats = {}
-
-    def aggregate(cs):
-        for f in cs[2]:
-            ext = lower(f.extension)
-            if ext in LANGUAGES_EXTENSIONS_MAP.keys() and not f.is_binary:
-                if ext in code_stats:
-                    code_stats[ext] += 1
-                else:
-                    code_stats[ext] = 1
-
-    map(aggregate, tip.walk('/'))
-
-    return code_stats or {}
+    extensions = repo.get_changeset().get_tree_stats().extensions
+    return dict((ext, count) for ext, count in extensions.iteritems()
+                if ext in LANGUAGES_EXTENSIONS_MAP)
@@ -158,10 +158,6 @@ class DbManage(object):
             print 'This database is already at the newest version'
             sys.exit(0)
 
-        # clear cache keys
-        log.info("Clearing cache keys now...")
-        CacheInvalidation.clear_cache()
-
         upgrade_steps = range(curr_version + 1, __dbversion__ + 1)
         notify('attempting to do database upgrade from '
                'version %s to version %s' % (curr_version, __dbversion__))
@@ -177,6 +173,10 @@ class DbManage(object):
 
             _step = step
 
+        # clear cache keys, the schema has the current generations now
+        log.info("Clearing cache keys now...")
+        CacheInvalidation.clear_cache()
+
         notify('upgrade to version %s successful' % _step)
 
     def fix_repo_paths(self):
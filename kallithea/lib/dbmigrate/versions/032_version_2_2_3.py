@@ -0,0 +1,40 @@
+import logging
+
+from sqlalchemy import *
+
+from kallithea.lib.dbmigrate.migrate import *
+from kallithea.lib.dbmigrate.migrate.changeset import *
+
+from kallithea.model import meta
+from kallithea.lib.dbmigrate.versions import _reset_base
+
+log = logging.getLogger(__name__)
+
+
+def upgrade(migrate_engine):
+    """
+    Upgrade operations go here.
+    Don't create your own engine; bind migrate_engine to your metadata
+    """
+    _reset_base(migrate_engine)
+    from kallithea.lib.dbmigrate.schema import db_2_2_3
+
+    tbl = db_2_2_3.CacheInvalidation.__table__
+
+    # cache keys are cleared before upgrades, the default only makes adding
+    # a not nullable column possible
+    cache_generation = Column("cache_generation", Integer(), nullable=False,
+                              server_default='1')
+    cache_generation.create(table=tbl)
+
+    # issue fixups
+    fixups(db_2_2_3, meta.Session)
+
+
+def downgrade(migrate_engine):
+    meta = MetaData()
+    meta.bind = migrate_engine
+
+
+def fixups(models, _SESSION):
+    pass
@@ -0,0 +1,197 @@
+# -*- coding: utf-8 -*-
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+kallithea.lib.diff_cache
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Disk cache of parsed diffs of files.
+
+Changeset, compare and pull request pages parse the diff of every shown file
+on every view. Parsed diffs of single files are stored under the ids of the
+old and new content of the file and the options the diff was made with, so
+the same change of a file is parsed once, no matter if it is shown in a
+changeset, a comparison or a pull request. Content ids never change their
+content, so entries never have to be invalidated. Entries are shared by all
+processes, the total size of the cache is bounded and least recently used
+entries are removed first.
+"""
+
+from __future__ import with_statement
+
+import os
+import zlib
+import errno
+import hashlib
+import logging
+import tempfile
+
+from kallithea.lib.compat import json
+from kallithea.lib.utils2 import safe_int
+
+log = logging.getLogger(__name__)
+
+# bump when format of entries changes
+CACHE_VERSION = 3
+# share of max size the cache is shrunk to when full
+EVICT_RATIO = 0.8
+
+_LINE_FIELDS = ('old_lineno', 'new_lineno', 'action', 'line')
+
+
+def _pack(chunks):
+    return zlib.compress(json.dumps([[[l[n] for n in _LINE_FIELDS]
+                                      for l in chunk]
+                                     for chunk in chunks]))
+
+
+def _unpack(data):
+    return [[dict(zip(_LINE_FIELDS, l)) for l in chunk]
+            for chunk in json.loads(zlib.decompress(data))]
+
+
+class DiffCache(object):
+    """
+    Directory of compressed parsed diffs of at most ``max_size`` bytes. An
+    entry is a list of chunks of the diff of one file, each a list of line
+    dicts with ``old_lineno``, ``new_lineno``, ``action`` and ``line``.
+
+    Usage::
+
+      cache = DiffCache(path, 100 * 1024 * 1024)
+      key = cache.get_key(old_file_id, new_file_id, options)
+      chunks = cache.get(key)
+      if chunks is None:
+          chunks = parse(get_file_diff(old_file_id, new_file_id))
+          cache.set(key, chunks)
+    """
+
+    def __init__(self, path, max_size):
+        self.path = path
+        self.max_size = max_size
+        # estimated size of all entries, recomputed on eviction
+        self._size = None
+
+    @staticmethod
+    def get_key(*parts):
+        return hashlib.sha1(repr((CACHE_VERSION,) + parts)).hexdigest()
+
+    def _get_path(self, key):
+        return os.path.join(self.path, key[:2], key)
+
+    def get(self, key):
+        """
+        Returns cached chunks of ``key`` or None.
+        """
+        path = self._get_path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            # mtime is used for finding least recently used entries
+            os.utime(path, None)
+            return _unpack(data)
+        except (IOError, OSError):
+            return None
+        except Exception:
+            log.error('Removing broken diff cache entry %s', path)
+            self._remove(path)
+            return None
+
+    def set(self, key, chunks):
+        path = self._get_path(key)
+        data = _pack(chunks)
+        try:
+            dirname = os.path.dirname(path)
+            if not os.path.isdir(dirname):
+                try:
+                    os.makedirs(dirname)
+                except OSError, e:
+                    if e.errno != errno.EEXIST:
+                        raise
+            # write atomically, other processes might read it already
+            fd, tmp_path = tempfile.mkstemp(dir=dirname)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.rename(tmp_path, path)
+        except (IOError, OSError), e:
+            log.warning('Failed to store diff in cache %s: %s', path, e)
+            return
+        if self._size is None:
+            self._evict()
+        else:
+            self._size += len(data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        """
+        Compute size of the cache and remove least recently used entries
+        if it is too big.
+        """
+        entries = []
+        for dirpath, _dirnames, filenames in os.walk(self.path):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        size = sum(e[1] for e in entries)
+        if size > self.max_size:
+            entries.sort()
+            limit = self.max_size * EVICT_RATIO
+            removed = 0
+            for _mtime, entry_size, path in entries:
+                if size <= limit:
+                    break
+                self._remove(path)
+                size -= entry_size
+                removed += 1
+            log.debug('Removed %s entries from diff cache %s',
+                      removed, self.path)
+        self._size = size
+
+    def clear(self):
+        for dirpath, _dirnames, filenames in os.walk(self.path):
+            for filename in filenames:
+                self._remove(os.path.join(dirpath, filename))
+        self._size = 0
+
+
+_cache = None
+
+
+def get_cache():
+    """
+    Return the process wide cache or None if it is disabled. Its size in
+    megabytes is given by ``diff_cache_size`` setting, entries are stored in
+    ``diffs`` directory of ``cache_dir``.
+    """
+    global _cache
+    if _cache is None:
+        import kallithea
+        size = safe_int(kallithea.CONFIG.get('diff_cache_size'), 0)
+        cache_dir = kallithea.CONFIG.get('cache_dir')
+        if not size or not cache_dir:
+            _cache = False
+        else:
+            _cache = DiffCache(os.path.join(cache_dir, 'diffs'),
+                               size * 1024 * 1024)
+    return _cache or None
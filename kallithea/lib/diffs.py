@@ -28,6 +28,7 @@ Original author and date, and relevant copyright and licensing information is be
 import re
 import difflib
 import logging
+import tempfile
 
 from itertools import tee, imap
 
@@ -37,7 +38,8 @@ from kallithea.lib.vcs.exceptions import VCSError
 from kallithea.lib.vcs.nodes import FileNode, SubModuleNode
 from kallithea.lib.vcs.backends.base import EmptyChangeset
 from kallithea.lib.helpers import escape
-from kallithea.lib.utils2 import safe_unicode
+from kallithea.lib.utils2 import safe_unicode, safe_str
+from kallithea.lib import diff_cache
 
 log = logging.getLogger(__name__)
 
@@ -70,10 +72,9 @@ def wrapped_diff(filenode_old, filenode_new, cut_off_limit=None,
     elif cut_off_limit != -1 and (cut_off_limit is None or
     (filenode_old.size < cut_off_limit and filenode_new.size < cut_off_limit)):
 
-        f_gitdiff = get_gitdiff(filenode_old, filenode_new,
-                                ignore_whitespace=ignore_whitespace,
-                                context=line_context)
-        diff_processor = DiffProcessor(f_gitdiff, format='gitdiff')
+        diff_processor = _get_filenode_diff_processor(filenode_old,
+            filenode_new, ignore_whitespace=ignore_whitespace,
+            context=line_context)
 
         diff = diff_processor.as_html(enable_comments=enable_comments)
         stats = diff_processor.stat()
@@ -97,6 +98,31 @@ def wrapped_diff(filenode_old, filenode_new, cut_off_limit=None,
     return size, cs1, cs2, diff, stats
 
 
+def _get_filenode_diff_processor(filenode_old, filenode_new,
+                                 ignore_whitespace=True, context=3):
+    """
+    Returns prepared ``DiffProcessor`` of diff of given file nodes, see
+    ``get_diff_processor``.
+    """
+    submodules = filter(lambda o: isinstance(o, SubModuleNode),
+                        [filenode_new, filenode_old])
+    if submodules:
+        return DiffProcessor('', format='gitdiff')
+
+    for filenode in (filenode_old, filenode_new):
+        if not isinstance(filenode, FileNode):
+            raise VCSError("Given object should be FileNode object, not %s"
+                % filenode.__class__)
+
+    repo = filenode_new.changeset.repository
+    old_raw_id = getattr(filenode_old.changeset, 'raw_id', repo.EMPTY_CHANGESET)
+    new_raw_id = getattr(filenode_new.changeset, 'raw_id', repo.EMPTY_CHANGESET)
+    return get_diff_processor(repo, old_raw_id, new_raw_id,
+                              path=filenode_new.path,
+                              ignore_whitespace=ignore_whitespace,
+                              context=context or 3)
+
+
 def get_gitdiff(filenode_old, filenode_new, ignore_whitespace=True, context=3):
     """
     Returns git style diff between given ``filenode_old`` and ``filenode_new``.
@@ -123,6 +149,70 @@ def get_gitdiff(filenode_old, filenode_new, ignore_whitespace=True, context=3):
                                 ignore_whitespace, context)
     return vcs_gitdiff
 
+def get_diff_processor(repo, rev1, rev2, path=None, ignore_whitespace=False,
+                       context=3, diff_limit=None):
+    """
+    Returns prepared ``DiffProcessor`` of diff of ``rev1`` and ``rev2`` in
+    scm ``repo``, limited to ``path`` if given. Parsed diffs of files are
+    taken from ``diff_cache`` if it is enabled, so files which were shown
+    before in any diff aren't parsed again.
+    """
+    rev1 = safe_str(rev1)
+    rev2 = safe_str(repo.get_changeset(rev2).raw_id)
+    if rev1 != repo.EMPTY_CHANGESET:
+        rev1 = safe_str(repo.get_changeset(rev1).raw_id)
+    # only read as much of the diff as will be shown
+    _diff = repo.iter_diff(rev1, rev2, path=path,
+                           ignore_whitespace=ignore_whitespace,
+                           context=context)
+    diff_processor = DiffProcessor(_diff, vcs=repo.alias, format='gitdiff',
+                                   diff_limit=diff_limit)
+    cache = diff_cache.get_cache()
+    if cache is not None:
+        diff_processor._chunks_cache = _ChunksCache(
+            cache, repo, rev1, rev2, ignore_whitespace, context)
+    diff_processor.prepare()
+    return diff_processor
+
+
+class _ChunksCache(object):
+    """
+    Parsed chunks of diffs of single files in ``diff_cache``. They are
+    stored under ids of the old and new content of the file and the diff
+    options, so a file is parsed once for all changesets, comparisons and
+    pull requests it is a part of.
+    """
+
+    def __init__(self, cache, repo, rev1, rev2, ignore_whitespace, context):
+        self.cache = cache
+        self.repo = repo
+        self.revs = (rev1, rev2)
+        self.options = (bool(ignore_whitespace), safe_str(context))
+
+    def _get_file_id(self, rev, path):
+        # Mercurial diffs don't have the ids of the content
+        if rev == self.repo.EMPTY_CHANGESET:
+            return ''
+        try:
+            return self.repo.get_changeset(rev).get_file_id(path)
+        except VCSError:
+            return ''
+
+    def get_key(self, diff_file, inline_diff):
+        old_id = diff_file['old_revision']
+        new_id = diff_file['new_revision']
+        if old_id is None or new_id is None:
+            old_id = self._get_file_id(self.revs[0], diff_file._old_path)
+            new_id = self._get_file_id(self.revs[1], diff_file['filename'])
+        return self.cache.get_key(safe_str(old_id), safe_str(new_id),
+                                  bool(inline_diff), *self.options)
+
+    def get(self, key):
+        return self.cache.get(key)
+
+    def set(self, key, chunks):
+        self.cache.set(key, chunks)
+
 NEW_FILENODE = 1
 DEL_FILENODE = 2
 MOD_FILENODE = 3
@@ -132,6 +222,10 @@ CHMOD_FILENODE = 6
 BIN_FILENODE = 7
 
 
+# diffs read from streams are kept in memory up to this size, then on disk
+DIFF_SPOOL_SIZE = 1024 * 1024
+
+
 class DiffLimitExceeded(Exception):
     pass
 
@@ -148,12 +242,55 @@ class LimitedDiffContainer(object):
             yield l
 
 
+class DiffFile(dict):
+    """
+    Meta information about diff of one file. Its ``chunks`` are parsed from
+    the raw diff whenever they are accessed and not kept afterwards, so only
+    the file being rendered is ever materialized.
+    """
+
+    def __init__(self, processor, location, old_path=None, **kwargs):
+        dict.__init__(self, **kwargs)
+        self._processor = processor
+        # (offset, body offset, end offset) of the file in the raw diff
+        self._location = location
+        self._old_path = old_path
+
+    def __missing__(self, key):
+        if key == 'chunks':
+            return self._processor._parse_chunks(self)
+        raise KeyError(key)
+
+
+class DeferredHtml(object):
+    """
+    HTML of diff of a file which is rendered only when it is converted to
+    unicode, so pages render the diffs of their files one by one.
+    """
+
+    def __init__(self, processor, diff_file, **kwargs):
+        self._processor = processor
+        self._diff_file = diff_file
+        self._kwargs = kwargs
+
+    def __unicode__(self):
+        return self._processor.as_html(parsed_lines=[self._diff_file],
+                                       **self._kwargs) or u''
+
+    def __html__(self):
+        return self.__unicode__()
+
+
 class DiffProcessor(object):
     """
     Give it a unified or git diff and it returns a list of the files that were
     mentioned in the diff together with a dict of meta information that
     can be used to render it in a HTML template.
+
+    Preparing the diff only indexes boundaries of the files and computes
+    their stats, diffs of single files are parsed on demand.
     """
+    _file_separator = '\ndiff --git'
     _chunk_re = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@(.*)')
     _newline_marker = re.compile(r'^\\ No newline at end of file')
     _git_header_re = re.compile(r"""
@@ -201,27 +338,41 @@ class DiffProcessor(object):
 
     def __init__(self, diff, vcs='hg', format='gitdiff', diff_limit=None):
         """
-        :param diff:   a text in diff format
+        :param diff: a text in diff format or an iterable of chunks of it,
+            the iterable is only read as far as it is needed and closed when
+            the diff is prepared
         :param vcs: type of version control hg or git
         :param format: format of diff passed, `udiff` or `gitdiff`
         :param diff_limit: define the size of diff that is considered "big"
             based on that parameter cut off will be triggered, set to None
             to show full diff
         """
-        if not isinstance(diff, basestring):
-            raise Exception('Diff must be a basestring got %s instead' % type(diff))
+        if isinstance(diff, basestring):
+            self._diff = diff
+            self._spool = None
+            # calculate diff size
+            self.diff_size = len(diff)
+        elif hasattr(diff, '__iter__'):
+            self._diff = None
+            self._stream = diff
+            # shared by all readers, lines are read only once
+            self._stream_lines = self._read_stream_lines(iter(diff))
+            self._spool = tempfile.SpooledTemporaryFile(DIFF_SPOOL_SIZE)
+            self.diff_size = 0
+        else:
+            raise Exception('Diff must be a basestring or iterable got %s instead' % type(diff))
 
-        self._diff = diff
         self._format = format
         self.adds = 0
         self.removes = 0
-        # calculate diff size
-        self.diff_size = len(diff)
         self.diff_limit = diff_limit
         self.cur_diff_size = 0
         self.parsed = False
         self.parsed_diff = []
         self.vcs = vcs
+        self._inline_diff = True
+        # _ChunksCache of parsed diffs of files, if enabled
+        self._chunks_cache = None
 
         if format == 'gitdiff':
             self.differ = self._highlight_line_difflib
@@ -241,18 +392,11 @@ class DiffProcessor(object):
 
     def _escaper(self, string):
         """
-        Escaper for diff escapes special chars and checks the diff limit
+        Escaper for diff escapes special chars
 
         :param string:
         """
 
-        self.cur_diff_size += len(string)
-
-        # escaper gets iterated on each .next() call and it checks if each
-        # parsed line doesn't exceed the diff limit
-        if self.diff_limit is not None and self.cur_diff_size > self.diff_limit:
-            raise DiffLimitExceeded('Diff Limit Exceeded')
-
         def substitute(m):
             groups = m.groups()
             if groups[0]:
@@ -342,31 +486,117 @@ class DiffProcessor(object):
             do(line)
             do(next_)
 
-    def _get_header(self, diff_chunk):
+    def _get_header(self, diff, start=0, end=None):
         """
-        parses the diff header, and returns parts, and leftover diff
+        parses the diff header of file in ``diff[start:end]``, and returns
+        parts, and offset of leftover diff
         parts consists of 14 elements::
 
             a_path, b_path, similarity_index, rename_from, rename_to,
             old_mode, new_mode, new_file_mode, deleted_file_mode,
             a_blob_id, b_blob_id, b_mode, a_file, b_file
 
-        :param diff_chunk:
+        :param diff:
         """
-
+        if end is None:
+            end = len(diff)
         match = None
         if self.vcs == 'git':
-            match = self._git_header_re.match(diff_chunk)
+            match = self._git_header_re.match(diff, start, end)
         elif self.vcs == 'hg':
-            match = self._hg_header_re.match(diff_chunk)
+            match = self._hg_header_re.match(diff, start, end)
         if match is None:
             raise Exception('diff not recognized as valid %s diff' % self.vcs)
         groups = match.groupdict()
-        rest = diff_chunk[match.end():]
-        if rest and not rest.startswith('@') and not rest.startswith('literal ') and not rest.startswith('delta '):
-            raise Exception('cannot parse diff header: %r followed by %r' % (diff_chunk[:match.end()], rest[:1000]))
-        difflines = imap(self._escaper, re.findall(r'.*\n|.+$', rest)) # don't split on \r as str.splitlines do
-        return groups, difflines
+        rest = match.end()
+        if rest < end and not diff.startswith(('@', 'literal ', 'delta '), rest, end):
+            raise Exception('cannot parse diff header: %r followed by %r' % (diff[start:rest], diff[rest:min(rest + 1000, end)]))
+        return groups, rest
+
+    def _iter_files(self):
+        """
+        Yields diff, start and end offset of each file in it (right after
+        the ``diff --git`` line start) and offset of the diff in the whole
+        raw diff.
+        """
+        if self._spool is not None:
+            for f in self._iter_stream_files():
+                yield f
+            return
+        diff = self._diff
+        sep = self._file_separator
+        if diff.startswith(sep[1:]):
+            start = len(sep) - 1
+        else:
+            start = diff.find(sep)
+            if start != -1:
+                start += len(sep)
+        while start != -1:
+            end = diff.find(sep, start)
+            if end == -1:
+                yield diff, start, len(diff), 0
+                break
+            yield diff, start, end, 0
+            start = end + len(sep)
+
+    def _iter_stream_files(self):
+        """
+        Like ``_iter_files`` for diff read from stream. Everything read is
+        spooled and only diff of the current file is kept in memory.
+        """
+        marker = self._file_separator[1:]
+        lines = None
+        offset = 0
+        for line in self._stream_lines:
+            if not line.startswith(marker):
+                if lines is not None:
+                    lines.append(line)
+                self._spool.write(line)
+                continue
+            prev_lines, prev_offset = lines, offset
+            lines = [line]
+            offset = self._spool.tell()
+            self._spool.write(line)
+            if prev_lines is not None:
+                diff = ''.join(prev_lines)
+                # the last newline is a part of the separator
+                yield diff, len(marker), len(diff) - 1, prev_offset
+        if lines is not None:
+            diff = ''.join(lines)
+            yield diff, len(marker), len(diff), offset
+
+    def _read_stream_lines(self, stream):
+        rest = ''
+        for chunk in stream:
+            self.diff_size += len(chunk)
+            lines = (rest + chunk).split('\n')
+            rest = lines.pop()
+            for line in lines:
+                yield line + '\n'
+        if rest:
+            yield rest
+
+    def _close_stream(self):
+        """
+        Closes the stream the diff is read from, nothing more of it is read
+        and the process producing it can be stopped.
+        """
+        if self._spool is None:
+            return
+        self._stream_lines.close()
+        close = getattr(self._stream, 'close', None)
+        if close is not None:
+            close()
+
+    def _get_file_diff(self, diff_file):
+        """
+        Returns diff containing ``diff_file`` and offsets of its body and end.
+        """
+        offset, body, end = diff_file._location
+        if self._spool is None:
+            return self._diff, body, end
+        self._spool.seek(offset)
+        return self._spool.read(end - offset), body - offset, end - offset
 
     def _clean_line(self, line, command):
         if command in ['+', '-', ' ']:
@@ -377,10 +607,11 @@ class DiffProcessor(object):
     def _parse_gitdiff(self, inline_diff=True):
         _files = []
         diff_container = lambda arg: arg
+        self._inline_diff = inline_diff
 
         ##split the diff in chunks of separate --git a/file b/file chunks
-        for raw_diff in ('\n' + self._diff).split('\ndiff --git')[1:]:
-            head, diff = self._get_header(raw_diff)
+        for diff, start, end, offset in self._iter_files():
+            head, body = self._get_header(diff, start, end)
 
             op = None
             stats = {
@@ -439,69 +670,105 @@ class DiffProcessor(object):
 
             # a real non-binary diff
             if head['a_file'] or head['b_file']:
-                try:
-                    chunks, _stats = self._parse_lines(diff)
-                    stats['binary'] = False
-                    stats['added'] = _stats[0]
-                    stats['deleted'] = _stats[1]
-                    # explicit mark that it's a modified file
-                    if op == 'M':
-                        stats['ops'][MOD_FILENODE] = 'modified file'
-
-                except DiffLimitExceeded:
+                self.cur_diff_size += end - body
+                if (self.diff_limit is not None and
+                    self.cur_diff_size > self.diff_limit):
                     diff_container = lambda _diff: \
                         LimitedDiffContainer(self.diff_limit,
                                             self.cur_diff_size, _diff)
                     break
+                # hunks start with @@ line, all other lines start with the
+                # command
+                stats['binary'] = False
+                stats['added'] = diff.count('\n+', body, end)
+                stats['deleted'] = diff.count('\n-', body, end)
+                self.adds += stats['added']
+                self.removes += stats['deleted']
+                # explicit mark that it's a modified file
+                if op == 'M':
+                    stats['ops'][MOD_FILENODE] = 'modified file'
             else:  # Git binary patch (or empty diff)
                 # Git binary patch
                 if head['bin_patch']:
                     stats['ops'][BIN_FILENODE] = 'binary diff not shown'
-                chunks = []
-
-            if op == 'D' and chunks:
-                # a way of seeing deleted content could perhaps be nice - but
-                # not with the current UI
-                chunks = []
-
-            chunks.insert(0, [{
-                'old_lineno': '',
-                'new_lineno': '',
-                'action':     'context',
-                'line':       msg,
-                } for _op, msg in stats['ops'].iteritems()
-                  if _op not in [MOD_FILENODE]])
-
-            _files.append({
-                'filename':         head['b_path'],
-                'old_revision':     head['a_blob_id'],
-                'new_revision':     head['b_blob_id'],
-                'chunks':           chunks,
-                'operation':        op,
-                'stats':            stats,
-            })
-
-        if not inline_diff:
-            return diff_container(_files)
 
-        # highlight inline changes
-        for diff_data in _files:
-            for chunk in diff_data['chunks']:
-                lineiter = iter(chunk)
-                try:
-                    while 1:
-                        line = lineiter.next()
-                        if line['action'] not in ['unmod', 'context']:
-                            nextline = lineiter.next()
-                            if nextline['action'] in ['unmod', 'context'] or \
-                               nextline['action'] == line['action']:
-                                continue
-                            self.differ(line, nextline)
-                except StopIteration:
-                    pass
+            location = (offset + start, offset + body, offset + end)
+            _files.append(DiffFile(self, location, head['a_path'],
+                filename=head['b_path'],
+                old_revision=head['a_blob_id'],
+                new_revision=head['b_blob_id'],
+                operation=op,
+                stats=stats,
+            ))
 
         return diff_container(_files)
 
+    def _parse_chunks(self, diff_file):
+        """
+        Parses and returns chunks of lines of ``diff_file``.
+        """
+        stats = diff_file['stats']
+        chunks = []
+        # a way of seeing deleted content could perhaps be nice - but
+        # not with the current UI
+        if not stats['binary'] and diff_file['operation'] != 'D':
+            chunks = self._get_file_chunks(diff_file)
+
+        chunks.insert(0, [{
+            'old_lineno': '',
+            'new_lineno': '',
+            'action':     'context',
+            'line':       msg,
+            } for _op, msg in stats['ops'].iteritems()
+              if _op not in [MOD_FILENODE]])
+        return chunks
+
+    def _get_file_chunks(self, diff_file):
+        """
+        Returns chunks of lines of ``diff_file`` from the cache or parsed
+        from the raw diff.
+        """
+        cache = self._chunks_cache
+        if cache is not None:
+            key = cache.get_key(diff_file, self._inline_diff)
+            chunks = cache.get(key)
+            if chunks is not None:
+                return chunks
+        diff, body, end = self._get_file_diff(diff_file)
+        chunks = self._parse_file_lines(safe_str(diff[body:end]))
+        if cache is not None:
+            cache.set(key, chunks)
+        return chunks
+
+    def _parse_file_lines(self, raw_diff):
+        """
+        Parses chunks of lines of diff of file, with highlighted inline
+        changes if enabled.
+        """
+        # don't split on \r as str.splitlines do
+        difflines = imap(self._escaper, re.findall(r'.*\n|.+$', raw_diff))
+        chunks = self._parse_lines(difflines)[0]
+
+        if not self._inline_diff:
+            return chunks
+
+        # highlight inline changes
+        for chunk in chunks:
+            lineiter = iter(chunk)
+            try:
+                while 1:
+                    line = lineiter.next()
+                    if line['action'] not in ['unmod', 'context']:
+                        nextline = lineiter.next()
+                        if nextline['action'] in ['unmod', 'context'] or \
+                           nextline['action'] == line['action']:
+                            continue
+                        self.differ(line, nextline)
+            except StopIteration:
+                pass
+
+        return chunks
+
     def _parse_udiff(self, inline_diff=True):
         raise NotImplementedError()
 
@@ -628,7 +895,10 @@ class DiffProcessor(object):
         Prepare the passed udiff for HTML rendering. It'l return a list
         of dicts with diff information
         """
-        parsed = self._parser(inline_diff=inline_diff)
+        try:
+            parsed = self._parser(inline_diff=inline_diff)
+        finally:
+            self._close_stream()
         self.parsed = True
         self.parsed_diff = parsed
         return parsed
@@ -637,9 +907,23 @@ class DiffProcessor(object):
         """
         Returns raw string diff
         """
+        if self._spool is not None:
+            # read the rest of stream, if it still is open
+            self._spool.seek(0, 2)
+            for _line in self._stream_lines:
+                self._spool.write(_line)
+            self._spool.seek(0)
+            return self._spool.read()
         return self._diff
         #return u''.join(imap(self._line_counter, self._diff.splitlines(1)))
 
+    def as_deferred_html(self, diff_file, **kwargs):
+        """
+        Returns ``DeferredHtml`` of ``diff_file``, rendered by ``as_html``
+        with the given arguments when it is shown.
+        """
+        return DeferredHtml(self, diff_file, **kwargs)
+
     def as_html(self, table_class='code-difftable', line_class='line',
                 old_lineno_class='lineno old', new_lineno_class='lineno new',
                 code_class='code', enable_comments=False, parsed_lines=None):
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+kallithea.lib.file_response
+~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Sending of downloads with support for conditional and partial requests.
+
+Responses carry an ETag, so clients that already have the content get a
+304 Not Modified, and answer Range requests with only the requested part,
+which lets interrupted downloads of large files be resumed. Files on disk
+are handed to the ``wsgi.file_wrapper`` of the server, or with
+``file_send_mode`` set to ``x-sendfile`` or ``x-accel-redirect`` left to the
+front-end web server entirely, so sending them does not keep a Python worker
+busy.
+"""
+
+import os
+import logging
+
+from kallithea.lib.utils2 import safe_str
+
+log = logging.getLogger(__name__)
+
+BLOCK_SIZE = 64 * 1024
+
+SEND_FILE_MODES = ('python', 'x-sendfile', 'x-accel-redirect')
+
+
+class FileIter(object):
+    """
+    Iterates over the ``start:stop`` part of the file at ``path``. Ranges are
+    read directly from the file, and a ``remove``-able file is deleted when
+    the response is closed.
+    """
+
+    def __init__(self, path, start=0, stop=None, remove=False):
+        self.path = path
+        self.start = start
+        self.stop = stop
+        self.remove = remove
+
+    def __iter__(self):
+        with open(self.path, 'rb') as f:
+            f.seek(self.start)
+            left = None if self.stop is None else self.stop - self.start
+            while left is None or left > 0:
+                data = f.read(BLOCK_SIZE if left is None
+                              else min(BLOCK_SIZE, left))
+                if not data:
+                    break
+                if left is not None:
+                    left -= len(data)
+                yield data
+
+    def app_iter_range(self, start, stop):
+        # the file now belongs to the iterator that is actually sent
+        remove, self.remove = self.remove, False
+        return FileIter(self.path, self.start + start,
+                        self.start + stop if stop is not None else self.stop,
+                        remove)
+
+    def close(self):
+        if self.remove:
+            log.debug('Removing %s', self.path)
+            os.remove(self.path)
+            self.remove = False
+
+
+def _get_send_mode():
+    from kallithea import CONFIG
+    mode = CONFIG.get('file_send_mode') or 'python'
+    if mode not in SEND_FILE_MODES:
+        log.error('Unknown file_send_mode %r, using python', mode)
+        return 'python'
+    return mode
+
+
+def file_etag(path, key):
+    """
+    Returns an ETag for the file at ``path`` containing ``key``. The file
+    modification time is included too, as the same content generated
+    again might differ byte by byte.
+    """
+    return '%s-%x' % (key, int(os.stat(path).st_mtime))
+
+
+def is_not_modified(request, response, etag):
+    """
+    Sets ``etag`` on ``response`` and enables conditional and partial
+    responses for it. Returns True if the client already has the content and
+    it doesn't have to be loaded, an empty body gets sent as 304 Not Modified.
+    """
+    response.conditional_response = True
+    response.accept_ranges = 'bytes'
+    response.etag = etag
+    return bool(request.if_none_match) and etag in request.if_none_match
+
+
+def send_file(request, response, path, etag=None, location=None,
+              remove=False):
+    """
+    Prepares ``response`` for sending the file at ``path`` and returns the
+    response body. ``location`` is the url the front-end web server serves
+    the file as, for ``x-accel-redirect``; without it the file is always sent
+    by Python. A ``remove``-able temporary file is deleted once sent.
+    """
+    response.conditional_response = True
+    response.accept_ranges = 'bytes'
+    if etag is not None and is_not_modified(request, response, etag):
+        if remove:
+            os.remove(path)
+        return ''
+
+    mode = _get_send_mode() if not remove else 'python'
+    if mode == 'x-sendfile':
+        # the web server takes care of Range requests, not the empty body
+        response.conditional_response = False
+        response.headers['X-Sendfile'] = safe_str(os.path.abspath(path))
+        return ''
+    if mode == 'x-accel-redirect' and location:
+        response.conditional_response = False
+        response.headers['X-Accel-Redirect'] = safe_str(location)
+        return ''
+
+    file_wrapper = request.environ.get('wsgi.file_wrapper')
+    if file_wrapper is not None and not remove and request.range is None:
+        app_iter = file_wrapper(open(path, 'rb'), BLOCK_SIZE)
+    else:
+        app_iter = FileIter(path, remove=remove)
+    # setting app_iter resets the length of the previous body, set it first
+    response.app_iter = app_iter
+    response.content_length = os.path.getsize(path)
+    return app_iter
@@ -53,18 +53,50 @@ def graph_data(repo, revs):
       - A list of tuples indicating the edges between the current node and its
         parents.
     """
-    dag = _dagwalker(repo, revs)
-    return list(_colored(repo, dag))
+    dag = list(_dagwalker(_parentrev_func(repo), revs))
+    branches, closing = _branch_info(repo, dag)
+    return list(_colored(dag, branches, closing))
 
-def _dagwalker(repo, revs):
-    if not revs:
-        return
+def _parentrev_func(repo):
+    if repo.alias == 'hg':
+        return repo._repo.changelog.parentrevs
+    elif repo.alias == 'git':
+        return repo._get_parent_revisions
 
+def _branch_info(repo, dag):
+    """
+    Return branch ids for all revs in dag and their parents and the set of
+    revs that close their branch. Branch names are mapped to small integers,
+    revs without branch map to None.
+    """
+    needed = set()
+    for rev, dagparents in dag:
+        needed.add(rev)
+        needed.update(abs(p) for p in dagparents)
+
+    names = {}
+    branches = {}
+    closing = set()
     if repo.alias == 'hg':
-        parentrev_func = repo._repo.changelog.parentrevs
+        cl = repo._repo.changelog
+        for rev in needed:
+            extra = cl.read(cl.node(rev))[5]
+            branches[rev] = names.setdefault(extra.get('branch', 'default'),
+                                             len(names))
+            if 'close' in extra:
+                closing.add(rev)
     elif repo.alias == 'git':
-        def parentrev_func(rev):
-            return [x.revision for x in repo[rev].parents]
+        heads = repo._heads(reverse=False)
+        revisions = repo.revisions
+        for rev in needed:
+            name = heads.get(revisions[rev])
+            if name:
+                branches[rev] = names.setdefault(name, len(names))
+    return branches, closing
+
+def _dagwalker(parentrev_func, revs):
+    if not revs:
+        return
 
     minrev = revs[-1] # assuming sorted reverse
     knownrevs = set(revs)
@@ -82,57 +114,61 @@ def _dagwalker(repo, revs):
         yield (rev, sorted(dagparents))
 
 
-def _colored(repo, dag):
+def _colored(dag, branches, closing):
     """annotates a DAG with colored edge information
 
     For each DAG node this function emits tuples::
 
-      ((col, color), [(col, nextcol, color)])
+      ((col, color), [(col, nextcol, color)], closing)
 
     with the following new elements:
 
       - Tuple (col, color) with column and color index for the current node
       - A list of tuples indicating the edges between the current node and its
         parents.
-    """
-    branch_cache = {}
-    def branch(rev):
-        if rev not in branch_cache:
-            branch_cache[rev] = repo[rev].branch
-        return branch_cache[rev]
+      - 1 if the node closes its branch, else 0
 
+    dag is a sequence of (rev, dagparents) tuples, branches maps revs to
+    branch ids (or None) and closing is a set of branch closing revs.
+    Columns of the current row are kept in a dict so each row costs time
+    proportional to its width.
+    """
     row = []
+    rowcols = {}
     colors = {}
     newcolor = 1
 
     for (rev, dagparents) in dag:
 
         # Compute row and nextrow
-        if rev not in row:
+        if rev not in rowcols:
+            rowcols[rev] = len(row)
             row.append(rev)  # new head
             colors[rev] = newcolor
             newcolor += 1
 
-        col = row.index(rev)
-        addparents = [p for p in dagparents if p not in row]
+        col = rowcols[rev]
+        dagparentset = set(dagparents)
+        addparents = [p for p in dagparents if p not in rowcols]
 
-        # Add unknown parents to nextrow
-        tmprow = row[:]
-        tmprow[col:col + 1] = reversed(addparents) # highest revs first (to the right), dead ends last (to the left)
-        # Stop looking for non-existing ancestors
+        # Add unknown parents to nextrow, highest revs first (to the right),
+        # dead ends last (to the left) and stop looking for non-existing
+        # ancestors
         nextrow = []
-        for r in tmprow:
-            if r > nullrev or r in dagparents:
-                nextrow.append(r)
-            else:
-                colors.pop(r)
+        for part in (row[:col], reversed(addparents), row[col + 1:]):
+            for r in part:
+                if r > nullrev or r in dagparentset:
+                    nextrow.append(r)
+                else:
+                    colors.pop(r)
+        nextcols = dict((r, i) for i, r in enumerate(nextrow))
 
         # Set colors for the parents
         color = colors.pop(rev)
         if addparents:
-            b = branch(rev)
+            b = branches.get(rev)
             for p in reversed(addparents):
-                if b and branch(abs(p)) == b:
+                if b is not None and branches.get(abs(p)) == b:
                     colors[p] = color
                     b = None
                 else:
@@ -142,13 +178,13 @@ def _colored(repo, dag):
         # Add edges to the graph
         edges = []
         for ecol, ep in enumerate(row):
-            if ep in nextrow:
-                edges.append((ecol, nextrow.index(ep), colors[ep]))
+            if ep in nextcols:
+                edges.append((ecol, nextcols[ep], colors[ep]))
             elif ep == rev:
                 for p in dagparents:
-                    edges.append((ecol, nextrow.index(p), colors[p]))
+                    edges.append((ecol, nextcols[p], colors[p]))
 
         # Yield and move on
-        closing = int(repo[rev].closesbranch)
-        yield ((col, color), edges, closing)
+        yield ((col, color), edges, int(rev in closing))
         row = nextrow
+        rowcols = nextcols
@@ -52,8 +52,9 @@ from webhelpers.paginate import Page as _Page
 from webhelpers.html.tags import _set_input_attrs, _set_id_attr, \
     convert_boolean_attrs, NotGiven, _make_safe_id_component
 
+from kallithea.lib import highlight_cache
 from kallithea.lib.annotate import annotate_highlight
-from kallithea.lib.utils import repo_name_slug, get_custom_lexer
+from kallithea.lib.utils import repo_name_slug, get_lexer_for_filenode
 from kallithea.lib.utils2 import str2bool, safe_unicode, safe_str, \
     get_changeset_safe, datetime_to_time, time_to_datetime, AttributeDict,\
     safe_int
@@ -192,7 +193,7 @@ class _FilesBreadCrumbs(object):
 files_breadcrumbs = _FilesBreadCrumbs()
 
 
-class CodeHtmlFormatter(HtmlFormatter):
+class CodeHtmlFormatter(highlight_cache.CachedFormatterMixin, HtmlFormatter):
     """
     My code Html Formatter for source codes
     """
@@ -287,9 +288,11 @@ def pygmentize(filenode, **kwargs):
 
     :param filenode:
     """
-    lexer = get_custom_lexer(filenode.extension) or filenode.lexer
+    lexer = get_lexer_for_filenode(filenode)
+    formatter = CodeHtmlFormatter(**kwargs)
+    formatter.highlight_key = highlight_cache.get_key(filenode, lexer)
     return literal(markup_whitespace(
-        code_highlight(filenode.content, lexer, CodeHtmlFormatter(**kwargs))))
+        code_highlight(filenode.content, lexer, formatter)))
 
 
 def pygmentize_annotation(repo_name, filenode, **kwargs):
@@ -350,8 +353,13 @@ def pygmentize_annotation(repo_name, filenode, **kwargs):
         return "color: rgb(%s)! important;" % (', '.join(col))
 
     def url_func(repo_name):
+        # cells of the annotate column by changeset, most lines share them
+        cells = {}
 
         def _url_func(changeset):
+            uri = cells.get(changeset.raw_id)
+            if uri is not None:
+                return uri
             author = changeset.author
             date = changeset.date
             message = tooltip(changeset.message)
@@ -372,6 +380,7 @@ def pygmentize_annotation(repo_name, filenode, **kwargs):
                   )
 
             uri += '\n'
+            cells[changeset.raw_id] = uri
             return uri
         return _url_func
 
@@ -423,6 +432,7 @@ flash = Flash()
 #==============================================================================
 from kallithea.lib.vcs.utils import author_name, author_email
 from kallithea.lib.utils2 import credentials_filter, age as _age
+from kallithea.lib.identities import get_identity
 from kallithea.model.db import User, ChangesetStatus
 
 age = lambda  x, y=False: _age(x, y)
@@ -478,24 +488,17 @@ def is_hg(repository):
 
 
 def user_or_none(author):
-    email = author_email(author)
-    if email is not None:
-        user = User.get_by_email(email, case_insensitive=True, cache=True)
-        if user is not None:
-            return user
-
-    user = User.get_by_username(author_name(author), case_insensitive=True, cache=True)
-    if user is not None:
-        return user
-
+    identity = get_identity(author)
+    if identity is not None:
+        return User.get(identity.user_id)
     return None
 
 def email_or_none(author):
     if not author:
         return None
-    user = user_or_none(author)
-    if user is not None:
-        return user.email # always use main email address - not necessarily the one used to find user
+    identity = get_identity(author)
+    if identity is not None:
+        return identity.email # always use main email address - not necessarily the one used to find user
 
     # extract email from the commit string
     email = author_email(author)
@@ -515,9 +518,11 @@ def person(author, show_attr="username"):
     if isinstance(author, User):
         return person_getter(author)
 
-    user = user_or_none(author)
-    if user is not None:
-        return person_getter(user)
+    identity = get_identity(author)
+    if identity is not None:
+        if show_attr in identity:
+            return identity[show_attr]
+        return person_getter(User.get(identity.user_id))
 
     # Still nothing?  Just pass back the author name if any, else the email
     return author_name(author) or email(author)
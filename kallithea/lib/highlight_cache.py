@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+kallithea.lib.highlight_cache
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Memory cache of syntax highlighted files.
+
+Popular files like READMEs and build files are shown over and over again
+without changing, and lexing them is the most expensive part of showing
+them. The HTML of the highlighted lines is stored under the id of the file
+content, the lexer and the formatter options, so the source and annotation
+views of a file share it. The total size of the cache is bounded and least
+recently used files are removed first.
+"""
+
+from kallithea.lib.utils2 import safe_int
+from kallithea.lib.vcs.exceptions import VCSError
+from kallithea.lib.vcs.utils.lrucache import LRUCache
+
+
+def _sizeof(lines):
+    return sum(len(line) for line in lines) + 64 * len(lines)
+
+
+def get_key(filenode, lexer):
+    """
+    Returns key of the highlighted ``filenode`` or None if the content of the
+    node can't be identified.
+    """
+    if filenode.changeset is None:
+        return None
+    try:
+        file_id = filenode.changeset.get_file_id(filenode.path)
+    except (NotImplementedError, VCSError):
+        return None
+    alias = lexer.aliases[0] if lexer.aliases else lexer.name
+    return file_id, alias
+
+
+class CachedFormatterMixin(object):
+    """
+    Mixin for pygments ``HtmlFormatter`` classes which takes highlighted
+    lines from the cache if ``highlight_key`` is set. The tokens aren't even
+    lexed then.
+    """
+
+    highlight_key = None
+
+    def _format_lines(self, tokensource):
+        cache = get_cache() if self.highlight_key is not None else None
+        if cache is None:
+            return super(CachedFormatterMixin, self)._format_lines(tokensource)
+        key = self.highlight_key, repr(sorted(self.options.items()))
+        lines = cache.get(key)
+        if lines is None:
+            lines = tuple(line for _t, line in super(CachedFormatterMixin, self)
+                          ._format_lines(tokensource))
+            cache[key] = lines
+        return ((1, line) for line in lines)
+
+
+_cache = None
+
+
+def get_cache():
+    """
+    Return the process wide cache or None if it is disabled. Its size in
+    megabytes is given by ``highlight_cache_size`` setting.
+    """
+    global _cache
+    if _cache is None:
+        import kallithea
+        size = safe_int(kallithea.CONFIG.get('highlight_cache_size'), 0)
+        if not size:
+            _cache = False
+        else:
+            _cache = LRUCache(size * 1024 * 1024, sizeof=_sizeof)
+    return _cache or None
@@ -419,6 +419,8 @@ def handle_git_receive(repo_path, revs, env, hook_type='post'):
     else:
         #post push shouldn't use the cached instance never
         repo = repo.scm_instance_no_cache()
+        # write the commit graph cache for the pushed refs while we are here
+        repo.update_commit_graph()
 
     if hook_type == 'pre':
         pre_push(baseui, repo)
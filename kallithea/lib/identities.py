@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+kallithea.lib.identities
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Resolution of changeset author strings to users.
+
+Pages like the changelog show the user of the author of each changeset, and
+most changesets on a page share few authors. All distinct authors of a page
+are resolved with one query against users and their additional emails, and
+the results are kept in a process wide cache until any user or email
+changes.
+"""
+
+import logging
+
+from sqlalchemy import and_, or_, func
+
+from kallithea.lib.utils2 import AttributeDict
+from kallithea.lib.vcs.utils import author_email, author_name
+from kallithea.lib.vcs.utils.lrucache import LRUCache
+from kallithea.model.db import User, UserEmailMap, CacheInvalidation, \
+    get_changed_keys
+from kallithea.model.meta import Session
+
+log = logging.getLogger(__name__)
+
+# number of kept author strings
+IDENTITY_CACHE_SIZE = 10000
+# number of author strings resolved by one query
+RESOLVE_CHUNK_SIZE = 500
+
+_identities = LRUCache(IDENTITY_CACHE_SIZE)
+
+
+def _get_generation():
+    """
+    Returns generation of users and emails resolved identities are valid
+    for or None if the current transaction changed them.
+    """
+    key = CacheInvalidation.IDENTITIES_KEY
+    sa = Session()
+    # pending changes would be flushed by the query anyway
+    sa.flush()
+    if key in get_changed_keys(sa):
+        return None
+    return CacheInvalidation.get_generation(key)
+
+
+def _make_identity(row):
+    user_id, username, email, firstname, lastname = row
+    return AttributeDict(user_id=user_id, username=username, email=email,
+                         firstname=firstname, lastname=lastname)
+
+
+def _query_identities(authors):
+    """
+    Returns dict mapping ``authors`` to their identities, resolved like
+    ``User.get_by_email`` and then ``User.get_by_username`` would do.
+    """
+    emails = {}
+    names = {}
+    for author in authors:
+        email = author_email(author)
+        if email:
+            emails[author] = email.lower()
+        name = author_name(author)
+        if name:
+            names[author] = name.lower()
+
+    wanted_emails = set(emails.values())
+    wanted_names = set(names.values())
+    if not wanted_emails and not wanted_names:
+        return dict.fromkeys(authors)
+
+    columns = [User.user_id, User.username, User._email, User.name,
+               User.lastname]
+    conditions = []
+    if wanted_names:
+        conditions.append(func.lower(User.username).in_(wanted_names))
+    if wanted_emails:
+        alt_email = func.lower(UserEmailMap._email)
+        columns.append(alt_email)
+        conditions.append(func.lower(User._email).in_(wanted_emails))
+        conditions.append(alt_email.in_(wanted_emails))
+    q = Session().query(*columns)
+    if wanted_emails:
+        # only join the additional emails that are looked for
+        q = q.outerjoin(UserEmailMap,
+                        and_(UserEmailMap.user_id == User.user_id,
+                             alt_email.in_(wanted_emails)))
+
+    by_email = {}
+    by_alt_email = {}
+    by_username = {}
+    for row in q.filter(or_(*conditions)):
+        identity = _make_identity(row[:5])
+        if identity.email:
+            by_email[identity.email.lower()] = identity
+        if len(row) > 5 and row[5]:
+            by_alt_email[row[5]] = identity
+        by_username[identity.username.lower()] = identity
+
+    result = {}
+    for author in authors:
+        email = emails.get(author)
+        identity = None
+        if email:
+            identity = by_email.get(email) or by_alt_email.get(email)
+        if identity is None and author in names:
+            identity = by_username.get(names[author])
+        result[author] = identity
+    return result
+
+
+def resolve_authors(authors):
+    """
+    Returns dict mapping the given changeset author strings to identities of
+    the users they belong to, None for authors which aren't users. Identities
+    have ``user_id``, ``username``, ``email``, ``firstname`` and ``lastname``
+    attributes.
+
+    Authors which aren't cached yet are resolved with one query, so callers
+    rendering many changesets should resolve all their authors first.
+    """
+    generation = _get_generation()
+    result = {}
+    missing = []
+    for author in set(authors):
+        entry = _identities.get(author)
+        if entry is not None and generation is not None and \
+                entry[0] == generation:
+            result[author] = entry[1]
+        else:
+            missing.append(author)
+
+    for i in xrange(0, len(missing), RESOLVE_CHUNK_SIZE):
+        chunk = missing[i:i + RESOLVE_CHUNK_SIZE]
+        log.debug('Resolving %s authors' % len(chunk))
+        identities = _query_identities(chunk)
+        for author, identity in identities.iteritems():
+            if generation is not None:
+                _identities[author] = (generation, identity)
+            result[author] = identity
+    return result
+
+
+def get_identity(author):
+    """
+    Returns identity of the user ``author`` string belongs to or None.
+    """
+    if not author:
+        return None
+    return resolve_authors([author])[author]
@@ -6,6 +6,7 @@ import traceback
 from webob import Request, Response, exc
 
 import kallithea
+from kallithea.lib import pack_cache
 from kallithea.lib.vcs import subprocessio
 
 log = logging.getLogger(__name__)
@@ -38,6 +39,90 @@ class FileWrapper(object):
         )
 
 
+class PrefixedInput(object):
+    """
+    File-like returning ``prefix`` that has already been read from ``fd``
+    before the rest of ``fd``.
+    """
+
+    def __init__(self, prefix, fd):
+        self.prefix = prefix
+        self.fd = fd
+
+    def read(self, size):
+        if self.prefix:
+            data, self.prefix = self.prefix[:size], self.prefix[size:]
+            return data
+        return self.fd.read(size)
+
+
+def read_prefix(fd, size):
+    """
+    Returns up to ``size`` bytes read from ``fd`` and whether that was all.
+    """
+    chunks = []
+    left = size
+    while left > 0:
+        data = fd.read(min(left, 65536))
+        if not data:
+            return ''.join(chunks), True
+        chunks.append(data)
+        left -= len(data)
+    data = fd.read(1)
+    if not data:
+        return ''.join(chunks), True
+    chunks.append(data)
+    return ''.join(chunks), False
+
+
+def iter_file(f, block_size=65536):
+    try:
+        while True:
+            data = f.read(block_size)
+            if not data:
+                break
+            yield data
+    finally:
+        f.close()
+
+
+class CachingIter(object):
+    """
+    Iterates over the output of upload-pack and stores it with ``writer``
+    if the command completed successfully and the response was sent fully.
+    """
+
+    def __init__(self, out, writer):
+        self.out = out
+        self.writer = writer
+
+    def __iter__(self):
+        for chunk in self.out:
+            if self.writer is not None:
+                try:
+                    self.writer.write(chunk)
+                except EnvironmentError:
+                    log.error(traceback.format_exc())
+                    self.writer.abort()
+                    self.writer = None
+            yield chunk
+        process = self.out.process
+        if (self.writer is not None and process is not None
+            and process.wait() == 0):
+            try:
+                self.writer.commit()
+            except EnvironmentError:
+                # a push might have invalidated the cache meanwhile
+                log.error(traceback.format_exc())
+                self.writer.abort()
+            self.writer = None
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.abort()
+        self.out.close()
+
+
 class GitRepository(object):
     git_folder_signature = set(['config', 'head', 'info', 'objects', 'refs'])
     commands = ['git-upload-pack', 'git-receive-pack']
@@ -118,6 +203,26 @@ class GitRepository(object):
         else:
             inputstream = environ['wsgi.input']
 
+        cache = pack_cache.get_cache()
+        writer = None
+        if cache is not None and git_command == 'git-upload-pack':
+            body, complete = read_prefix(inputstream,
+                                         pack_cache.MAX_REQUEST_SIZE)
+            if complete and pack_cache.is_full_clone(body):
+                from dulwich.repo import Repo
+                key = cache.get_key(Repo(self.content_path).get_refs(), body)
+                resp = self._cached_response(cache, key, git_command)
+                if resp is not None:
+                    log.debug('serving cached pack %s', key)
+                    return resp
+                writer = cache.writer(self.content_path, key)
+                inputstream = body
+            else:
+                inputstream = PrefixedInput(body, inputstream)
+        elif cache is not None and git_command == 'git-receive-pack':
+            # refs are about to change, responses for the old ones are useless
+            cache.invalidate(self.content_path)
+
         try:
             gitenv = os.environ
             # forget all configs
@@ -136,8 +241,13 @@ class GitRepository(object):
             )
         except EnvironmentError, e:
             log.error(traceback.format_exc())
+            if writer is not None:
+                writer.abort()
             raise exc.HTTPExpectationFailed()
 
+        if writer is not None:
+            out = CachingIter(out, writer)
+
         if git_command in [u'git-receive-pack']:
             # updating refs manually after each push.
             # Needed for pre-1.7.0.4 git clients using regular HTTP mode.
@@ -153,6 +263,22 @@ class GitRepository(object):
         resp.app_iter = out
         return resp
 
+    def _cached_response(self, cache, key, git_command):
+        path = cache.get(self.content_path, key)
+        if path is None:
+            return None
+        try:
+            f = open(path, 'rb')
+        except IOError:
+            # just evicted
+            return None
+        resp = Response()
+        resp.content_type = 'application/x-%s-result' % git_command.encode('utf8')
+        resp.charset = None
+        resp.app_iter = iter_file(f)
+        resp.content_length = os.fstat(f.fileno()).st_size
+        return resp
+
     def __call__(self, environ, start_response):
         request = Request(environ)
         _path = self._get_fixedpath(request.path_info)
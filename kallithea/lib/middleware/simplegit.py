@@ -61,11 +61,28 @@ def is_git(environ):
     return isgit_path
 
 
+class LazyGitRepo(object):
+    """
+    Dulwich repository at ``path`` that is only opened when used.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._repo = None
+
+    def __getattr__(self, name):
+        if self._repo is None:
+            from dulwich.repo import Repo
+            self._repo = Repo(self._path)
+        return getattr(self._repo, name)
+
+
 class SimpleGit(BaseVCSController):
 
+    def _is_vcs_request(self, environ):
+        return is_git(environ)
+
     def _handle_request(self, environ, start_response):
-        if not is_git(environ):
-            return self.application(environ, start_response)
         if not self._check_ssl(environ):
             return HTTPNotAcceptable('SSL REQUIRED !')(environ, start_response)
 
@@ -283,16 +300,17 @@ class SimpleGit(BaseVCSController):
         if len(service) < 2:
             return
 
-        from kallithea.model.db import Repository
-        _repo = Repository.get_by_repo_name(repo_name)
-        _repo = _repo.scm_instance
+        # the hooks get everything they need from extras, don't make scm
+        # instance of the repository (listing all revisions) for them
+        _repo = LazyGitRepo(os.path.join(safe_str(self.basepath),
+                                         safe_str(repo_name)))
 
         _hooks = dict(baseui.configitems('hooks')) or {}
         if action == 'pull':
             # stupid git, emulate pre-pull hook !
-            pre_pull(ui=baseui, repo=_repo._repo)
+            pre_pull(ui=baseui, repo=_repo)
         if action == 'pull' and _hooks.get(Ui.HOOK_PULL):
-            log_pull_action(ui=baseui, repo=_repo._repo)
+            log_pull_action(ui=baseui, repo=_repo)
 
     def __inject_extras(self, repo_path, baseui, extras={}):
         """
@@ -68,9 +68,10 @@ def is_mercurial(environ):
 
 class SimpleHg(BaseVCSController):
 
+    def _is_vcs_request(self, environ):
+        return is_mercurial(environ)
+
     def _handle_request(self, environ, start_response):
-        if not is_mercurial(environ):
-            return self.application(environ, start_response)
         if not self._check_ssl(environ):
             return HTTPNotAcceptable('SSL REQUIRED !')(environ, start_response)
 
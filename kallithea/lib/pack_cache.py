@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+kallithea.lib.pack_cache
+~~~~~~~~~~~~~~~~~~~~~~~~
+
+Disk cache of git upload-pack responses of full clones.
+
+Continuous integration systems tend to clone the same repository at the same
+state over and over, and ``git upload-pack`` computes the same pack for each
+of them. Responses are stored under the hash of the negotiation request and
+the refs of the repository, so a push makes the stored responses of the
+repository unreachable, and they are removed right away. The total size of
+the cache is bounded and least recently used responses are removed first.
+"""
+
+from __future__ import with_statement
+
+import os
+import errno
+import shutil
+import hashlib
+import logging
+import tempfile
+
+from kallithea.lib.utils2 import safe_int
+
+log = logging.getLogger(__name__)
+
+# bump when format of stored responses changes
+CACHE_VERSION = 1
+# bigger negotiation requests are not cached
+MAX_REQUEST_SIZE = 1024 * 1024
+# share of max size the cache is shrunk to when full
+EVICT_RATIO = 0.8
+
+
+def parse_pkt_lines(data):
+    """
+    Returns list of git pkt-lines in ``data``, None for flush packets.
+
+    :raise ValueError: If ``data`` isn't a sequence of pkt-lines.
+    """
+    lines = []
+    pos = 0
+    while pos < len(data):
+        size = int(data[pos:pos + 4], 16)
+        if size == 0:
+            lines.append(None)
+            pos += 4
+        elif 4 <= size <= len(data) - pos:
+            lines.append(data[pos + 4:pos + size])
+            pos += size
+        else:
+            raise ValueError('Invalid pkt-line at %s' % pos)
+    return lines
+
+
+def is_full_clone(request_body):
+    """
+    Returns True if ``request_body`` is an upload-pack request which doesn't
+    depend on objects the client has already.
+    """
+    try:
+        lines = parse_pkt_lines(request_body)
+    except ValueError:
+        return False
+    return (any(l and l.startswith('want ') for l in lines)
+            and not any(l and l.startswith('have ') for l in lines)
+            and 'done\n' in lines)
+
+
+class PackCacheWriter(object):
+    """
+    Stores a response in the cache once it is committed.
+    """
+
+    def __init__(self, cache, path):
+        self.cache = cache
+        self.path = path
+        self.size = 0
+        dirname = os.path.dirname(path)
+        if not os.path.isdir(dirname):
+            try:
+                os.makedirs(dirname)
+            except OSError, e:
+                if e.errno != errno.EEXIST:
+                    raise
+        fd, self.tmp_path = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+        self.file = os.fdopen(fd, 'wb')
+
+    def write(self, data):
+        self.size += len(data)
+        self.file.write(data)
+
+    def commit(self):
+        self.file.close()
+        os.rename(self.tmp_path, self.path)
+        self.tmp_path = None
+        self.cache._added(self.size)
+
+    def abort(self):
+        if self.tmp_path is not None:
+            self.file.close()
+            self.cache._remove(self.tmp_path)
+            self.tmp_path = None
+
+
+class PackCache(object):
+    """
+    Directory of upload-pack responses of at most ``max_size`` bytes.
+
+    Usage::
+
+      cache = PackCache(path, 1024 * 1024 * 1024)
+      key = cache.get_key(refs, request_body)
+      path = cache.get(repo_path, key)
+      if path is None:
+          writer = cache.writer(repo_path, key)
+          for chunk in upload_pack(request_body):
+              writer.write(chunk)
+          writer.commit()
+    """
+
+    def __init__(self, path, max_size):
+        self.path = path
+        self.max_size = max_size
+        # estimated size of all entries, recomputed on eviction
+        self._size = None
+
+    @staticmethod
+    def get_key(refs, request_body):
+        h = hashlib.sha1(repr((CACHE_VERSION, sorted(refs.items()))))
+        h.update(request_body)
+        return h.hexdigest()
+
+    def _get_repo_dir(self, repo_path):
+        return os.path.join(self.path,
+                            hashlib.sha1(os.path.abspath(repo_path)).hexdigest())
+
+    def _get_path(self, repo_path, key):
+        return os.path.join(self._get_repo_dir(repo_path), key)
+
+    def get(self, repo_path, key):
+        """
+        Returns path of the cached response of ``key`` or None.
+        """
+        path = self._get_path(repo_path, key)
+        try:
+            # mtime is used for finding least recently used entries
+            os.utime(path, None)
+        except OSError:
+            return None
+        return path
+
+    def writer(self, repo_path, key):
+        """
+        Returns a writer for storing the response of ``key``.
+        """
+        return PackCacheWriter(self, self._get_path(repo_path, key))
+
+    def invalidate(self, repo_path):
+        """
+        Removes all responses of the repository at ``repo_path``.
+        """
+        shutil.rmtree(self._get_repo_dir(repo_path), ignore_errors=True)
+        self._size = None
+
+    def _added(self, size):
+        if self._size is None:
+            self._evict()
+        else:
+            self._size += size
+            if self._size > self.max_size:
+                self._evict()
+
+    def _remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _evict(self):
+        """
+        Compute size of the cache and remove least recently used entries
+        if it is too big.
+        """
+        entries = []
+        for dirpath, _dirnames, filenames in os.walk(self.path):
+            for filename in filenames:
+                if filename.endswith('.tmp'):
+                    continue
+                path = os.path.join(dirpath, filename)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((st.st_mtime, st.st_size, path))
+        size = sum(e[1] for e in entries)
+        if size > self.max_size:
+            entries.sort()
+            limit = self.max_size * EVICT_RATIO
+            removed = 0
+            for _mtime, entry_size, path in entries:
+                if size <= limit:
+                    break
+                self._remove(path)
+                size -= entry_size
+                removed += 1
+            log.debug('Removed %s entries from pack cache %s',
+                      removed, self.path)
+        self._size = size
+
+
+_cache = None
+
+
+def get_cache():
+    """
+    Return the process wide cache or None if it is disabled. Its size in
+    megabytes is given by ``git_pack_cache_size`` setting, entries are stored
+    in ``git_packs`` directory of ``cache_dir``.
+    """
+    global _cache
+    if _cache is None:
+        import kallithea
+        size = safe_int(kallithea.CONFIG.get('git_pack_cache_size'), 0)
+        cache_dir = kallithea.CONFIG.get('cache_dir')
+        if not size or not cache_dir:
+            _cache = False
+        else:
+            _cache = PackCache(os.path.join(cache_dir, 'git_packs'),
+                               size * 1024 * 1024)
+    return _cache or None
@@ -58,15 +58,14 @@ class Command(BasePasterCommand):
     def command(self):
         #get SqlAlchemy session
         self._init_session()
-        _caches = CacheInvalidation.query().order_by(CacheInvalidation.cache_key).all()
+        _caches = CacheInvalidation.query().order_by(CacheInvalidation.cache_args).all()
         if self.options.show:
             for c_obj in _caches:
-                print 'key:%s active:%s' % (c_obj.cache_key, c_obj.cache_active)
+                print 'repo:%s generation:%s' % (c_obj.cache_args, c_obj.generation)
         elif self.options.cleanup:
             for c_obj in _caches:
-                Session().delete(c_obj)
                 print 'removing key:%s' % (c_obj.cache_key)
-                Session().commit()
+            CacheInvalidation.clear_cache()
         else:
             print 'nothing done exiting...'
         sys.exit(0)
@@ -76,12 +75,12 @@ class Command(BasePasterCommand):
             '--show',
             action='store_true',
             dest='show',
-            help=("show existing cache keys with together with status")
+            help=("show existing cache keys together with their generation")
         )
 
         self.parser.add_option(
             '--cleanup',
             action="store_true",
             dest="cleanup",
-            help="cleanup existing cache keys"
+            help="cleanup existing cache keys, only while all instances are stopped"
         )
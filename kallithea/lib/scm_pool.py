@@ -0,0 +1,111 @@
+# -*- coding: utf-8 -*-
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+kallithea.lib.scm_pool
+~~~~~~~~~~~~~~~~~~~~~~
+
+Process wide pool of open scm repository instances.
+
+Repository objects are expensive to create (hg ui and changelog, dulwich
+pack indexes, list of revisions) so they are kept open and shared between
+requests. Entries are keyed by repository path and cache generation, a new
+generation replaces the instance of previous one.
+"""
+
+from __future__ import with_statement
+
+import logging
+import threading
+
+from kallithea.lib.utils2 import safe_int
+from kallithea.lib.vcs.utils.lrucache import LRUCache
+
+log = logging.getLogger(__name__)
+
+# default number of kept repository instances
+DEFAULT_POOL_SIZE = 100
+# number of locks serializing creation of instances
+LOCK_STRIPES = 64
+
+
+class ScmInstancePool(object):
+    """
+    Size bounded LRU pool of repository instances.
+
+    Usage::
+
+      pool = ScmInstancePool(100)
+      repo = pool.get(path, generation, create_function)
+    """
+
+    def __init__(self, max_size=DEFAULT_POOL_SIZE):
+        self._instances = LRUCache(max_size)
+        self._locks = [threading.Lock() for _i in xrange(LOCK_STRIPES)]
+
+    def _get_lock(self, path):
+        return self._locks[hash(path) % LOCK_STRIPES]
+
+    def get(self, path, generation, factory):
+        """
+        Return instance of repository at ``path`` for cache ``generation``.
+        Missing instance is created by calling ``factory`` without arguments,
+        only once even if more threads ask for it at the same time.
+        """
+        key = (path, generation)
+        repo = self._instances.get(key)
+        if repo is not None:
+            return repo
+        with self._get_lock(path):
+            if key in self._instances:
+                return self._instances[key]
+            self.invalidate(path)
+            log.debug('Creating scm instance of %s generation %s'
+                      % (path, generation))
+            repo = factory()
+            self._instances[key] = repo
+            return repo
+
+    def invalidate(self, path):
+        """
+        Drop all instances of repository at ``path``.
+        """
+        for key in self._instances.keys():
+            if key[0] == path:
+                self._instances.pop(key)
+
+    def clear(self):
+        self._instances.clear()
+
+    def get_stats(self):
+        """
+        Returns dict with hits, misses, evictions and number of entries.
+        """
+        return self._instances.get_stats()
+
+
+_pool = None
+
+
+def get_pool():
+    """
+    Return the process wide pool, its size is given by ``vcs_full_cache_size``
+    setting.
+    """
+    global _pool
+    if _pool is None:
+        import kallithea
+        size = safe_int(kallithea.CONFIG.get('vcs_full_cache_size'),
+                        DEFAULT_POOL_SIZE)
+        _pool = ScmInstancePool(size)
+    return _pool
@@ -34,6 +34,7 @@ import paste
 import beaker
 import tarfile
 import shutil
+import fnmatch
 import decorator
 import warnings
 from os.path import abspath
@@ -54,7 +55,8 @@ from kallithea.lib.caching_query import FromCache
 
 from kallithea.model import meta
 from kallithea.model.db import Repository, User, Ui, \
-    UserLog, RepoGroup, Setting, CacheInvalidation, UserGroup
+    UserLog, RepoGroup, Setting, CacheInvalidation, UserGroup, \
+    get_changed_keys
 from kallithea.model.meta import Session
 from kallithea.model.repo_group import RepoGroupModel
 from kallithea.lib.utils2 import safe_str, safe_unicode, get_current_authuser
@@ -341,12 +343,10 @@ def make_ui(read_from='file', path=None, checkpaths=True, clear_session=True):
     :param read_from: read from 'file' or 'db'
     """
 
-    baseui = ui.ui()
+    if read_from == 'db':
+        return _make_db_ui(clear_session)
 
-    # clean the baseui object
-    baseui._ocfg = config.config()
-    baseui._ucfg = config.config()
-    baseui._tcfg = config.config()
+    baseui = _make_clean_ui()
 
     if read_from == 'file':
         if not os.path.isfile(path):
@@ -360,35 +360,70 @@ def make_ui(read_from='file', path=None, checkpaths=True, clear_session=True):
                 log.debug('settings ui from file: [%s] %s=%s' % (section, k, v))
                 baseui.setconfig(safe_str(section), safe_str(k), safe_str(v))
 
-    elif read_from == 'db':
-        sa = meta.Session()
-        ret = sa.query(Ui).all()
-
-        hg_ui = ret
-        for ui_ in hg_ui:
-            if ui_.ui_active:
-                ui_val = safe_str(ui_.ui_value)
-                if ui_.ui_section == 'hooks' and BRAND != 'kallithea' and ui_val.startswith('python:' + BRAND + '.lib.hooks.'):
-                    ui_val = ui_val.replace('python:' + BRAND + '.lib.hooks.', 'python:kallithea.lib.hooks.')
-                log.debug('settings ui from db: [%s] %s=%s', ui_.ui_section,
-                          ui_.ui_key, ui_val)
-                baseui.setconfig(safe_str(ui_.ui_section), safe_str(ui_.ui_key),
-                                 ui_val)
-            if ui_.ui_key == 'push_ssl':
-                # force set push_ssl requirement to False, kallithea
-                # handles that
-                baseui.setconfig(safe_str(ui_.ui_section), safe_str(ui_.ui_key),
-                                 False)
-        if clear_session:
-            meta.Session.remove()
-
-        # prevent interactive questions for ssh password / passphrase
-        ssh = baseui.config('ui', 'ssh', default='ssh')
-        baseui.setconfig('ui', 'ssh', '%s -oBatchMode=yes -oIdentitiesOnly=yes' % ssh)
+    return baseui
+
+
+def _make_clean_ui():
+    baseui = ui.ui()
+
+    # clean the baseui object
+    baseui._ocfg = config.config()
+    baseui._ucfg = config.config()
+    baseui._tcfg = config.config()
+    return baseui
+
+
+# ui made from the database settings and generation of the settings
+_db_ui = (None, None)
 
+
+def _make_db_ui(clear_session):
+    """
+    Returns copy of ui made from the database settings, it is only made
+    again when the settings change.
+    """
+    global _db_ui
+    sa = meta.Session()
+    # pending changes would be flushed by the query anyway
+    sa.flush()
+    generation = CacheInvalidation.get_generation(CacheInvalidation.UI_KEY)
+    cached_generation, cached_ui = _db_ui
+    if cached_ui is not None and cached_generation == generation:
+        baseui = cached_ui.copy()
+    else:
+        baseui = _make_clean_ui()
+        _fill_ui_from_db(baseui, sa)
+        if CacheInvalidation.UI_KEY not in get_changed_keys(sa):
+            _db_ui = (generation, baseui.copy())
+    if clear_session:
+        meta.Session.remove()
     return baseui
 
 
+def _fill_ui_from_db(baseui, sa):
+    ret = sa.query(Ui).all()
+
+    hg_ui = ret
+    for ui_ in hg_ui:
+        if ui_.ui_active:
+            ui_val = safe_str(ui_.ui_value)
+            if ui_.ui_section == 'hooks' and BRAND != 'kallithea' and ui_val.startswith('python:' + BRAND + '.lib.hooks.'):
+                ui_val = ui_val.replace('python:' + BRAND + '.lib.hooks.', 'python:kallithea.lib.hooks.')
+            log.debug('settings ui from db: [%s] %s=%s', ui_.ui_section,
+                      ui_.ui_key, ui_val)
+            baseui.setconfig(safe_str(ui_.ui_section), safe_str(ui_.ui_key),
+                             ui_val)
+        if ui_.ui_key == 'push_ssl':
+            # force set push_ssl requirement to False, kallithea
+            # handles that
+            baseui.setconfig(safe_str(ui_.ui_section), safe_str(ui_.ui_key),
+                             False)
+
+    # prevent interactive questions for ssh password / passphrase
+    ssh = baseui.config('ui', 'ssh', default='ssh')
+    baseui.setconfig('ui', 'ssh', '%s -oBatchMode=yes -oIdentitiesOnly=yes' % ssh)
+
+
 def set_app_settings(config):
     """
     Updates pylons config with new settings from database
@@ -409,7 +444,7 @@ def set_vcs_config(config):
     """
     import kallithea
     from kallithea.lib.vcs import conf
-    from kallithea.lib.utils2 import aslist
+    from kallithea.lib.utils2 import aslist, str2bool, safe_int
     conf.settings.BACKENDS = {
         'hg': 'kallithea.lib.vcs.backends.hg.MercurialRepository',
         'git': 'kallithea.lib.vcs.backends.git.GitRepository',
@@ -417,6 +452,10 @@ def set_vcs_config(config):
 
     conf.settings.GIT_EXECUTABLE_PATH = config.get('git_path', 'git')
     conf.settings.GIT_REV_FILTER = config.get('git_rev_filter', '--all').strip()
+    conf.settings.GIT_COMMIT_GRAPH_CACHE = str2bool(
+        config.get('git_commit_graph_cache', False))
+    conf.settings.HG_MANIFEST_INDEX_CACHE_SIZE = safe_int(
+        config.get('hg_manifest_index_cache_size'), 100000)
     conf.settings.DEFAULT_ENCODINGS = aslist(config.get('default_encoding',
                                                         'utf8'), sep=',')
 
@@ -617,6 +656,64 @@ def get_custom_lexer(extension):
         return lexers.get_lexer_by_name(_lexer_name)
 
 
+# (file name pattern, lexer class) of all pygments lexers, including the
+# patterns of lexers which are only picked by content analysis
+_lexer_patterns = None
+
+
+def _get_lexer_patterns():
+    global _lexer_patterns
+    if _lexer_patterns is None:
+        from pygments import lexers
+        patterns = []
+        for name, _aliases, _filenames, _mimetypes in lexers.get_all_lexers():
+            lexer_class = lexers.find_lexer_class(name)
+            for pattern in lexer_class.filenames + lexer_class.alias_filenames:
+                patterns.append((pattern, lexer_class))
+        _lexer_patterns = patterns
+    return _lexer_patterns
+
+
+def _find_lexer_class(name):
+    """
+    Returns pygments lexer class for a language name of
+    ``LANGUAGES_EXTENSIONS_MAP``, which is either the name of the lexer or
+    its class name without the Lexer suffix, or None.
+    """
+    from pygments import lexers
+    from pygments.util import ClassNotFound
+    lexer_class = (lexers.find_lexer_class(name) or
+                   getattr(lexers, name + 'Lexer', None))
+    if lexer_class is None:
+        try:
+            lexer_class = type(lexers.get_lexer_by_name(name.lower()))
+        except ClassNotFound:
+            pass
+    return lexer_class
+
+
+def get_lexer_for_filenode(filenode):
+    """
+    Returns a lexer for the given ``filenode``. Custom lexers and lexers which
+    are the only ones for the file name are used without looking at the
+    content, otherwise pygments picks one of the candidates by analysing
+    the content.
+    """
+    from kallithea.config.conf import LANGUAGES_EXTENSIONS_MAP
+    lexer = get_custom_lexer(filenode.extension)
+    if lexer is not None:
+        return lexer
+    names = (LANGUAGES_EXTENSIONS_MAP.get(filenode.name.lower()) or
+             LANGUAGES_EXTENSIONS_MAP.get(filenode.extension))
+    if names and len(set(names)) == 1:
+        lexer_class = _find_lexer_class(names[0])
+        if lexer_class is not None and not any(
+                cls is not lexer_class and fnmatch.fnmatch(filenode.name, p)
+                for p, cls in _get_lexer_patterns()):
+            return lexer_class(stripnl=False)
+    return filenode.lexer
+
+
 #==============================================================================
 # TEST FUNCTIONS AND CREATORS
 #==============================================================================
@@ -15,6 +15,8 @@ import itertools
 from kallithea.lib.vcs.utils import author_name, author_email, safe_unicode
 from kallithea.lib.vcs.utils.lazy import LazyProperty
 from kallithea.lib.vcs.utils.helpers import get_dict_for_attrs
+from kallithea.lib.vcs.utils import treestats
+from kallithea.lib.vcs.utils import blame
 from kallithea.lib.vcs.conf import settings
 
 from kallithea.lib.vcs.exceptions import (
@@ -117,19 +119,10 @@ class BaseRepository(object):
         Returns combined size in bytes for all repository files
         """
 
-        size = 0
         try:
-            tip = self.get_changeset()
-            for topnode, dirs, files in tip.walk('/'):
-                for f in files:
-                    size += tip.get_file_size(f.path)
-                for dir in dirs:
-                    for f in files:
-                        size += tip.get_file_size(f.path)
-
-        except RepositoryError, e:
-            pass
-        return size
+            return self.get_changeset().get_tree_stats().size
+        except RepositoryError:
+            return 0
 
     def is_valid(self):
         """
@@ -238,6 +231,17 @@ class BaseRepository(object):
         """
         raise NotImplementedError
 
+    def iter_diff(self, rev1, rev2, path=None, ignore_whitespace=False,
+            context=3):
+        """
+        Like ``get_diff`` but returns iterator of chunks of the *diff*. Backends
+        produce the chunks while the iterator is consumed, so big diffs don't
+        have to be kept in memory.
+        """
+        return iter([self.get_diff(rev1, rev2, path=path,
+                                   ignore_whitespace=ignore_whitespace,
+                                   context=context)])
+
     # ========== #
     # COMMIT API #
     # ========== #
@@ -514,6 +518,14 @@ class BaseChangeset(object):
         """
         raise NotImplementedError
 
+    def get_file_id(self, path):
+        """
+        Returns id of the content of the file at the given ``path``. Files
+        with different ids might have the same content, but files with the
+        same id never differ.
+        """
+        raise NotImplementedError
+
     def get_file_changeset(self, path):
         """
         Returns last commit of the file at the given ``path``.
@@ -527,6 +539,27 @@ class BaseChangeset(object):
         """
         raise NotImplementedError
 
+    def get_file_history_page(self, path, limit=None, cursor=None):
+        """
+        Returns tuple of reversed list of ``ChangesetSummary`` objects for
+        which file at given ``path`` has been modified and a cursor to pass
+        in to get the next page (``None`` if there are no more entries).
+
+        :param limit: maximal number of returned entries, all if not given
+        :param cursor: cursor returned with the previous page
+        """
+        raise NotImplementedError
+
+    def get_file_annotate(self, path):
+        """
+        Returns a generator of four element tuples with
+            lineno, sha, changeset lazy loader and line
+
+        Annotations are cached and derived from cached annotations of the
+        parent changesets where possible.
+        """
+        return blame.iter_annotation(self, path)
+
     def get_nodes(self, path):
         """
         Returns combined ``DirNode`` and ``FileNode`` objects list representing
@@ -546,7 +579,8 @@ class BaseChangeset(object):
         """
         raise NotImplementedError
 
-    def fill_archive(self, stream=None, kind='tgz', prefix=None):
+    def fill_archive(self, stream=None, kind='tgz', prefix=None,
+                     compression_level=None, compression_threads=None):
         """
         Fills up given stream.
 
@@ -557,6 +591,9 @@ class BaseChangeset(object):
             Default is repository name and changeset's raw_id joined with dash.
 
             repo-tip.<kind>
+        :param compression_level: 1 (fastest) to 9 (best) or None for
+            the default of the backend.
+        :param compression_threads: number of threads used for compression.
         """
 
         raise NotImplementedError
@@ -624,12 +661,85 @@ class BaseChangeset(object):
         """
         raise NotImplementedError
 
+    @LazyProperty
+    def file_change_counts(self):
+        """
+        Returns tuple with numbers of added, changed and removed files.
+        Backends should compute it without creating nodes.
+        """
+        return len(self.added), len(self.changed), len(self.removed)
+
     @LazyProperty
     def size(self):
         """
         Returns total number of bytes from contents of all filenodes.
         """
-        return sum((node.size for node in self.get_filenodes_generator()))
+        return self.get_tree_stats().size
+
+    def get_tree_stats(self):
+        """
+        Returns ``TreeStats`` with number and total size of all files of this
+        changeset and number of non binary files by extension.
+        """
+        return treestats.get_tree_stats(self)
+
+    def _tree_entries(self):
+        """
+        Returns iterator of (path, blob id) of all files.
+        """
+        raise NotImplementedError
+
+    def _tree_changes(self, other):
+        """
+        Returns iterator of (old, new) file entries which differ between
+        ``other`` changeset and this one, None for missing entry.
+        """
+        raise NotImplementedError
+
+    def _first_parent_ids(self, limit):
+        """
+        Returns iterator of raw ids of up to ``limit`` first parent
+        ancestors, nearest first.
+        """
+        raise NotImplementedError
+
+    def _blob_info(self, path, blob_id):
+        """
+        Returns tuple of size and binary flag of the given file content.
+        """
+        raise NotImplementedError
+
+    def _annotate(self, path):
+        """
+        Returns iterator of raw ids of the changesets which last changed each
+        line of the file at the given ``path``.
+        """
+        raise NotImplementedError
+
+    def _annotation_id(self, path):
+        """
+        Returns id of the annotation of the file at the given ``path``. It
+        must differ whenever the history of the file differs, so the same
+        content reached through other changesets gets its own annotation.
+        """
+        # raises for missing files
+        self.get_file_id(path)
+        return self.raw_id
+
+    def _annotate_parents(self):
+        """
+        Returns parents in the order in which their annotations take
+        precedence for lines found in several of them.
+        """
+        return self.parents
+
+    def _line_changes(self, other, path):
+        """
+        Returns list of (a1, a2, b1, b2) ranges of lines of the file at the
+        given ``path`` in ``other`` changeset and in this one which differ, or
+        None if the file can't be diffed.
+        """
+        raise NotImplementedError
 
     def walk(self, topurl=''):
         """
@@ -1039,3 +1149,47 @@ class CollectionGenerator(object):
 
     def __repr__(self):
         return '<CollectionGenerator[len:%s]>' % (len(self))
+
+
+class ChangesetSummary(object):
+    """
+    Lightweight record with the basic attributes of a changeset, used where
+    building full changeset objects for every entry would be wasteful, e.g.
+    in file history listings. The full changeset is available as
+    ``changeset``.
+    """
+
+    def __init__(self, repository, raw_id, revision, author, date, message,
+                 branch=None):
+        self.repository = repository
+        self.raw_id = raw_id
+        self.revision = revision
+        self.author = author
+        self.date = date
+        self.message = message
+        self.branch = branch
+
+    @LazyProperty
+    def short_id(self):
+        return self.raw_id[:12]
+
+    @LazyProperty
+    def changeset(self):
+        return self.repository.get_changeset(self.raw_id)
+
+    def __repr__(self):
+        return '<%s at %s:%s>' % (self.__class__.__name__, self.revision,
+            self.short_id)
+
+    def __eq__(self, other):
+        return self.raw_id == getattr(other, 'raw_id', None)
+
+    def __json__(self):
+        return dict(
+            short_id=self.short_id,
+            raw_id=self.raw_id,
+            revision=self.revision,
+            message=self.message,
+            date=self.date,
+            author=self.author,
+        )
@@ -1,7 +1,9 @@
+import os
 import re
 from itertools import chain
-from dulwich import objects
 from subprocess import Popen, PIPE
+from stat import S_IFDIR, S_ISDIR, S_ISLNK
+from dulwich import objects
 
 from kallithea.lib.vcs.conf import settings
 from kallithea.lib.vcs.backends.base import BaseChangeset, EmptyChangeset
@@ -17,6 +19,14 @@ from kallithea.lib.vcs.utils import (
     safe_unicode, safe_str, safe_int, date_fromtimestamp
 )
 from kallithea.lib.vcs.utils.lazy import LazyProperty
+from kallithea.lib.vcs.utils.archivers import write_archive
+from kallithea.lib.vcs.utils.treestats import get_blob_info
+
+from .history import get_file_history
+
+_HUNK_HEADER_RE = re.compile(r'^@@ -(\d+)(?:,(\d+))? \+(\d+)(?:,(\d+))? @@')
+# attributes changing the content of archives, only git archive applies them
+_EXPORT_ATTRIBUTES_RE = re.compile(r'\bexport-(?:ignore|subst)\b')
 
 
 class GitChangeset(BaseChangeset):
@@ -25,7 +35,6 @@ class GitChangeset(BaseChangeset):
     """
 
     def __init__(self, repository, revision):
-        self._stat_modes = {}
         self.repository = repository
         revision = safe_str(revision)
         try:
@@ -44,10 +53,13 @@ class GitChangeset(BaseChangeset):
         self._author_property = 'author'
         self._date_property = 'commit_time'
         self._date_tz_property = 'commit_timezone'
-        self.revision = repository.revisions.index(revision)
+        self.revision = repository._get_revision_position(revision)
 
         self.nodes = {}
-        self._paths = {}
+        # (mode, sha) of paths in the trees indexed so far
+        self._entries = {'': (S_IFDIR, self._tree_id)}
+        # paths of entries of indexed trees
+        self._trees = {}
 
     @LazyProperty
     def message(self):
@@ -103,66 +115,49 @@ class GitChangeset(BaseChangeset):
             path = path.rstrip('/')
         return path
 
-    def _get_id_for_path(self, path):
-        path = safe_str(path)
-        # FIXME: Please, spare a couple of minutes and make those codes cleaner;
-        if not path in self._paths:
-            path = path.strip('/')
-            # set root tree
-            tree = self.repository._repo[self._tree_id]
-            if path == '':
-                self._paths[''] = tree.id
-                return tree.id
-            splitted = path.split('/')
-            dirs, name = splitted[:-1], splitted[-1]
-            curdir = ''
-
-            # initially extract things from root dir
-            for item, stat, id in tree.iteritems():
-                if curdir:
-                    name = '/'.join((curdir, item))
-                else:
-                    name = item
-                self._paths[name] = id
-                self._stat_modes[name] = stat
-
-            for dir in dirs:
-                if curdir:
-                    curdir = '/'.join((curdir, dir))
-                else:
-                    curdir = dir
-                dir_id = None
-                for item, stat, id in tree.iteritems():
-                    if dir == item:
-                        dir_id = id
-                if dir_id:
-                    # Update tree
-                    tree = self.repository._repo[dir_id]
-                    if not isinstance(tree, objects.Tree):
-                        raise ChangesetError('%s is not a directory' % curdir)
-                else:
-                    raise ChangesetError('%s have not been found' % curdir)
-
-                # cache all items from the given traversed tree
-                for item, stat, id in tree.iteritems():
-                    if curdir:
-                        name = '/'.join((curdir, item))
-                    else:
-                        name = item
-                    self._paths[name] = id
-                    self._stat_modes[name] = stat
-            if not path in self._paths:
+    def _get_tree_paths(self, path):
+        """
+        Returns paths of the entries of directory ``path`` and indexes them.
+        Only the tree objects on the way are loaded, never blobs.
+        """
+        paths = self._trees.get(path)
+        if paths is None:
+            try:
+                mode, sha = self._get_entry(path)
+            except NodeDoesNotExistError:
+                raise ChangesetError('%s have not been found' % path)
+            tree = self.repository._repo[sha] if S_ISDIR(mode) else None
+            if not isinstance(tree, objects.Tree):
+                raise ChangesetError('%s is not a directory' % path)
+            prefix = path + '/' if path else ''
+            paths = []
+            for name, mode, sha in tree.iteritems():
+                self._entries[prefix + name] = (mode, sha)
+                paths.append(prefix + name)
+            self._trees[path] = paths
+        return paths
+
+    def _get_entry(self, path):
+        """
+        Returns (mode, sha) tuple of the tree entry at ``path``.
+        """
+        path = safe_str(path).strip('/')
+        entry = self._entries.get(path)
+        if entry is None:
+            self._get_tree_paths(path.rpartition('/')[0])
+            entry = self._entries.get(path)
+            if entry is None:
                 raise NodeDoesNotExistError("There is no file nor directory "
                     "at the given path '%s' at revision %s"
                     % (path, safe_str(self.short_id)))
-        return self._paths[path]
+        return entry
 
     def _get_kind(self, path):
-        obj = self.repository._repo[self._get_id_for_path(path)]
-        if isinstance(obj, objects.Blob):
-            return NodeKind.FILE
-        elif isinstance(obj, objects.Tree):
+        mode = self._get_entry(path)[0]
+        if S_ISDIR(mode):
             return NodeKind.DIR
+        elif not objects.S_ISGITLINK(mode):
+            return NodeKind.FILE
 
     def _get_filectx(self, path):
         path = self._fix_path(path)
@@ -187,17 +182,19 @@ class GitChangeset(BaseChangeset):
         """
         Returns list of children changesets.
         """
-        rev_filter = settings.GIT_REV_FILTER
-        so, se = self.repository.run_git_command(
-            "rev-list %s --children" % (rev_filter)
-        )
-
-        children = []
-        pat = re.compile(r'^%s' % self.raw_id)
-        for l in so.splitlines():
-            if pat.match(l):
-                childs = l.split(' ')[1:]
-                children.extend(childs)
+        children = self.repository._get_children_ids(self.raw_id)
+        if children is None:
+            rev_filter = settings.GIT_REV_FILTER
+            so, se = self.repository.run_git_command(
+                "rev-list %s --children" % (rev_filter)
+            )
+
+            children = []
+            pat = re.compile(r'^%s' % self.raw_id)
+            for l in so.splitlines():
+                if pat.match(l):
+                    childs = l.split(' ')[1:]
+                    children.extend(childs)
         return [self.repository.get_changeset(cs) for cs in children]
 
     def next(self, branch=None):
@@ -247,26 +244,26 @@ class GitChangeset(BaseChangeset):
         """
         Returns stat mode of the file at the given ``path``.
         """
-        # ensure path is traversed
-        path = safe_str(path)
-        self._get_id_for_path(path)
-        return self._stat_modes[path]
+        return self._get_entry(path)[0]
 
     def get_file_content(self, path):
         """
         Returns content of the file at given ``path``.
         """
-        id = self._get_id_for_path(path)
-        blob = self.repository._repo[id]
+        blob = self.repository._repo[self._get_entry(path)[1]]
         return blob.as_pretty_string()
 
     def get_file_size(self, path):
         """
         Returns size of the file at given ``path``.
         """
-        id = self._get_id_for_path(path)
-        blob = self.repository._repo[id]
-        return blob.raw_length()
+        return get_blob_info(self, path, self._get_entry(path)[1])[0]
+
+    def get_file_id(self, path):
+        """
+        Returns id of the blob of the file at given ``path``.
+        """
+        return self._get_entry(path)[1]
 
     def get_file_changeset(self, path):
         """
@@ -278,25 +275,20 @@ class GitChangeset(BaseChangeset):
         """
         Returns history of file as reversed list of ``Changeset`` objects for
         which file at given ``path`` has been modified.
+        """
+        entries, _cursor = self.get_file_history_page(path, limit=limit)
+        return [self.repository.get_changeset(e.raw_id) for e in entries]
 
-        TODO: This function now uses os underlying 'git' and 'grep' commands
-        which is generally not good. Should be replaced with algorithm
-        iterating commits.
+    def get_file_history_page(self, path, limit=None, cursor=None):
+        """
+        Returns tuple of reversed list of ``ChangesetSummary`` objects for
+        which file at given ``path`` has been modified and a cursor for the
+        next page.
         """
         self._get_filectx(path)
-        cs_id = safe_str(self.id)
-        f_path = safe_str(path)
-
-        if limit:
-            cmd = 'log -n %s --pretty="format: %%H" -s %s -- "%s"' % (
-                      safe_int(limit, 0), cs_id, f_path)
-
-        else:
-            cmd = 'log --pretty="format: %%H" -s %s -- "%s"' % (
-                      cs_id, f_path)
-        so, se = self.repository.run_git_command(cmd)
-        ids = re.findall(r'[0-9a-fA-F]{40}', so)
-        return [self.repository.get_changeset(sha) for sha in ids]
+        return get_file_history(self.repository, self.raw_id, path,
+                                limit=safe_int(limit) or None,
+                                cursor=cursor)
 
     def get_file_history_2(self, path):
         """
@@ -312,28 +304,40 @@ class GitChangeset(BaseChangeset):
         return [self.repository.get_changeset(sha)
                 for sha in (x.commit.id for x in walker)]
 
-    def get_file_annotate(self, path):
-        """
-        Returns a generator of four element tuples with
-            lineno, sha, changeset lazy loader and line
-
-        TODO: This function now uses os underlying 'git' command which is
-        generally not good. Should be replaced with algorithm iterating
-        commits.
-        """
-        cmd = 'blame -l --root -r %s -- "%s"' % (self.id, path)
+    def _annotate(self, path):
+        cmd = 'blame -l -s --root -r %s -- "%s"' % (self.id, path)
         # -l     ==> outputs long shas (and we need all 40 characters)
+        # -s     ==> doesn't output author and date we don't need
         # --root ==> doesn't put '^' character for boundaries
         # -r sha ==> blames for the given revision
         so, se = self.repository.run_git_command(cmd)
 
-        for i, blame_line in enumerate(so.split('\n')[:-1]):
-            ln_no = i + 1
-            sha, line = re.split(r' ', blame_line, 1)
-            yield (ln_no, sha, lambda: self.repository.get_changeset(sha), line)
+        for blame_line in so.split('\n')[:-1]:
+            yield blame_line.split(' ', 1)[0]
+
+    def _line_changes(self, other, path):
+        cmd = 'diff -U0 --no-color --no-ext-diff %s %s' % (
+            other.get_file_id(path), self.get_file_id(path))
+        so, se = self.repository.run_git_command(cmd)
+        changes = []
+        for line in so.splitlines():
+            if line.startswith('Binary files '):
+                return None
+            m = _HUNK_HEADER_RE.match(line)
+            if m is None:
+                continue
+            a1, a_len, b1, b_len = m.groups()
+            a_len = 1 if a_len is None else int(a_len)
+            b_len = 1 if b_len is None else int(b_len)
+            # empty ranges start after the given line
+            a1 = int(a1) - 1 if a_len else int(a1)
+            b1 = int(b1) - 1 if b_len else int(b1)
+            changes.append((a1, a1 + a_len, b1, b1 + b_len))
+        return changes
 
     def fill_archive(self, stream=None, kind='tgz', prefix=None,
-                     subrepos=False):
+                     subrepos=False, compression_level=None,
+                     compression_threads=None):
         """
         Fills up given stream.
 
@@ -344,6 +348,13 @@ class GitChangeset(BaseChangeset):
             Default is repository name and changeset's raw_id joined with dash
             (``repo-tip.<KIND>``).
         :param subrepos: include subrepos in this archive.
+        :param compression_level: 1 (fastest) to 9 (best) or None for
+            the default of 9.
+        :param compression_threads: number of threads compressing ``tgz`` and
+            ``zip`` archives, default 1.
+
+        Trees with ``export-ignore`` or ``export-subst`` attributes are
+        archived by ``git archive``, which applies them.
 
         :raise ImproperArchiveTypeError: If given kind is wrong.
         :raise VcsError: If given stream is None
@@ -361,21 +372,46 @@ class GitChangeset(BaseChangeset):
         elif prefix.strip() == '':
             raise VCSError("Prefix cannot be empty")
 
+        if stream is None:
+            raise VCSError('You need to pass in a valid stream for filling'
+                           ' with archival data')
+
+        entries = list(self.repository._repo.object_store
+                       .iter_tree_contents(self._tree_id))
+        if self._has_export_attributes(entries):
+            self._fill_git_archive(stream, kind, prefix, compression_level)
+            return
+        write_archive(stream, kind, prefix, self._commit.commit_time,
+                      self._archive_entries(entries), compression_level,
+                      compression_threads)
+
+    def _has_export_attributes(self, entries):
+        repo = self.repository._repo
+        for entry in entries:
+            if entry.path.rpartition('/')[2] != '.gitattributes':
+                continue
+            if _EXPORT_ATTRIBUTES_RE.search(repo[entry.sha].as_raw_string()):
+                return True
+        path = os.path.join(repo.controldir(), 'info', 'attributes')
+        if os.path.isfile(path):
+            with open(path) as f:
+                return bool(_EXPORT_ATTRIBUTES_RE.search(f.read()))
+        return False
+
+    def _fill_git_archive(self, stream, kind, prefix, compression_level):
+        level = compression_level or 9
+        _git_path = settings.GIT_EXECUTABLE_PATH
         if kind == 'zip':
-            frmt = 'zip'
+            cmd = '%s archive --format=zip -%d --prefix=%s/ %s' % (_git_path,
+                                                level, prefix, self.raw_id)
         else:
-            frmt = 'tar'
-        _git_path = settings.GIT_EXECUTABLE_PATH
-        cmd = '%s archive --format=%s --prefix=%s/ %s' % (_git_path,
-                                                frmt, prefix, self.raw_id)
+            cmd = '%s archive --format=tar --prefix=%s/ %s' % (_git_path,
+                                                prefix, self.raw_id)
         if kind == 'tgz':
-            cmd += ' | gzip -9'
+            cmd += ' | gzip -%d' % level
         elif kind == 'tbz2':
-            cmd += ' | bzip2 -9'
+            cmd += ' | bzip2 -%d' % level
 
-        if stream is None:
-            raise VCSError('You need to pass in a valid stream for filling'
-                           ' with archival data')
         popen = Popen(cmd, stdout=PIPE, stderr=PIPE, shell=True,
                       cwd=self.repository.path)
 
@@ -387,36 +423,35 @@ class GitChangeset(BaseChangeset):
         # Make sure all descriptors would be read
         popen.communicate()
 
+    def _archive_entries(self, entries):
+        repo = self.repository._repo
+        for entry in entries:
+            if objects.S_ISGITLINK(entry.mode):
+                continue
+            # modes like git archive with its default umask of 002
+            mode = 0775 if entry.mode & 0111 else 0664
+            yield (entry.path, mode, S_ISLNK(entry.mode), entry.sha,
+                   lambda sha=entry.sha: repo[sha].as_raw_string())
+
     def get_nodes(self, path):
         if self._get_kind(path) != NodeKind.DIR:
             raise ChangesetError("Directory does not exist for revision %s at "
                 " '%s'" % (self.revision, path))
-        path = self._fix_path(path)
-        id = self._get_id_for_path(path)
-        tree = self.repository._repo[id]
+        path = safe_str(self._fix_path(path))
         dirnodes = []
         filenodes = []
         als = self.repository.alias
-        for name, stat, id in tree.iteritems():
-            if objects.S_ISGITLINK(stat):
+        for obj_path in self._get_tree_paths(path):
+            # entries are classified by their mode, the objects aren't loaded
+            mode, id = self._entries[obj_path]
+            if objects.S_ISGITLINK(mode):
+                name = obj_path.rpartition('/')[2]
                 dirnodes.append(SubModuleNode(name, url=None, changeset=id,
                                               alias=als))
-                continue
-
-            obj = self.repository._repo.get_object(id)
-            if path != '':
-                obj_path = '/'.join((path, name))
-            else:
-                obj_path = name
-            if obj_path not in self._stat_modes:
-                self._stat_modes[obj_path] = stat
-            if isinstance(obj, objects.Tree):
+            elif S_ISDIR(mode):
                 dirnodes.append(DirNode(obj_path, changeset=self))
-            elif isinstance(obj, objects.Blob):
-                filenodes.append(FileNode(obj_path, changeset=self, mode=stat))
             else:
-                raise ChangesetError("Requested object should be Tree "
-                                     "or Blob, is %r" % type(obj))
+                filenodes.append(FileNode(obj_path, changeset=self, mode=mode))
         nodes = dirnodes + filenodes
         for node in nodes:
             if not node.path in self.nodes:
@@ -430,31 +465,21 @@ class GitChangeset(BaseChangeset):
         path = self._fix_path(path)
         if not path in self.nodes:
             try:
-                id_ = self._get_id_for_path(path)
+                mode, id_ = self._get_entry(path)
             except ChangesetError:
                 raise NodeDoesNotExistError("Cannot find one of parents' "
                     "directories for a given path: %s" % path)
 
-            _GL = lambda m: m and objects.S_ISGITLINK(m)
-            if _GL(self._stat_modes.get(path)):
+            if objects.S_ISGITLINK(mode):
                 node = SubModuleNode(path, url=None, changeset=id_,
                                      alias=self.repository.alias)
-            else:
-                obj = self.repository._repo.get_object(id_)
-
-                if isinstance(obj, objects.Tree):
-                    if path == '':
-                        node = RootNode(changeset=self)
-                    else:
-                        node = DirNode(path, changeset=self)
-                    node._tree = obj
-                elif isinstance(obj, objects.Blob):
-                    node = FileNode(path, changeset=self)
-                    node._blob = obj
+            elif S_ISDIR(mode):
+                if path == '':
+                    node = RootNode(changeset=self)
                 else:
-                    raise NodeDoesNotExistError("There is no file nor directory "
-                        "at the given path '%s' at revision %s"
-                        % (path, self.short_id))
+                    node = DirNode(path, changeset=self)
+            else:
+                node = FileNode(path, changeset=self, mode=mode)
             # cache node
             self.nodes[path] = node
         return self.nodes[path]
@@ -515,6 +540,41 @@ class GitChangeset(BaseChangeset):
             'deleted': list(deleted)}[status]
         )
 
+    def _tree_entries(self):
+        store = self.repository._repo.object_store
+        for entry in store.iter_tree_contents(self._tree_id):
+            if not objects.S_ISGITLINK(entry.mode):
+                yield entry.path, entry.sha
+
+    def _tree_changes(self, other):
+        store = self.repository._repo.object_store
+        for (oldpath, newpath), (oldmode, newmode), (oldsha, newsha) in \
+                store.tree_changes(other._tree_id, self._tree_id):
+            old = new = None
+            if oldpath is not None and not objects.S_ISGITLINK(oldmode):
+                old = oldpath, oldsha
+            if newpath is not None and not objects.S_ISGITLINK(newmode):
+                new = newpath, newsha
+            yield old, new
+
+    def _first_parent_ids(self, limit):
+        repo = self.repository._repo
+        commit = self._commit
+        for _i in xrange(limit):
+            if not commit.parents:
+                break
+            commit = repo[commit.parents[0]]
+            yield commit.id
+
+    def _blob_info(self, path, blob_id):
+        content = self.repository._repo[blob_id].as_raw_string()
+        return len(content), '\0' in content
+
+    @LazyProperty
+    def file_change_counts(self):
+        added, modified, deleted = self._changes_cache
+        return len(added), len(modified), len(deleted)
+
     @LazyProperty
     def added(self):
         """
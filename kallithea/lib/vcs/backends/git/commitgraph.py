@@ -0,0 +1,362 @@
+# -*- coding: utf-8 -*-
+"""
+    vcs.backends.git.commitgraph
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Persistent commit graph cache for git repositories.
+
+    The graph is stored in a single file inside the git directory and keeps
+    everything needed to answer revision list and DAG questions without
+    running ``git rev-list`` or loading commit objects:
+
+    * commit ids, in the same order as ``GitRepository.revisions``
+    * positions sorted by commit id, for binary search lookups
+    * commit timestamps
+    * parent and child adjacency, as positions
+
+    The file is memory mapped on load and all lookups read directly from the
+    mapping. It is only written after pushes and fetches, from the output of
+    ``git rev-list``, so its order is always the same as without the cache.
+    Other accesses only read it, and don't use it when the refs changed
+    since it was written.
+"""
+
+import os
+import mmap
+import struct
+import hashlib
+import logging
+import binascii
+import tempfile
+
+from dulwich import objects
+
+from kallithea.lib.vcs.conf import settings
+from kallithea.lib.vcs.exceptions import RepositoryError
+from kallithea.lib.vcs.utils import replace_file
+from kallithea.lib.vcs.utils.lazy import LazyProperty
+
+log = logging.getLogger(__name__)
+
+GRAPH_FILE = 'kallithea_commit_graph'
+GRAPH_MAGIC = 'KCG\x02'
+
+# magic, commits, parent edges, child edges, tips, digest of refs
+_HEADER = struct.Struct('<4sIIII20s')
+_SHA_SIZE = 20
+_UINT = struct.Struct('<I')
+_INT = struct.Struct('<i')
+_TIME = struct.Struct('<q')
+
+# rev filter options and refs they select
+_REV_FILTER_REFS = {
+    '--all': ('refs/', 'HEAD'),
+    '--branches': ('refs/heads/',),
+    '--tags': ('refs/tags/',),
+    '--remotes': ('refs/remotes/',),
+}
+
+
+def get_refs(repo, rev_filter=None):
+    """
+    Returns dict of refs selected by ``rev_filter`` in dulwich ``repo`` and
+    the ids they point to, or None if the filter can't be resolved without
+    git. No objects are loaded.
+    """
+    if rev_filter is None:
+        rev_filter = settings.GIT_REV_FILTER
+    prefixes = []
+    for opt in rev_filter.split():
+        if opt not in _REV_FILTER_REFS:
+            return None
+        prefixes.extend(_REV_FILTER_REFS[opt])
+    return dict((ref, sha) for ref, sha in repo.get_refs().iteritems()
+                if any(ref == p or ref.startswith(p) and p.endswith('/')
+                       for p in prefixes))
+
+
+def get_tips(repo, refs):
+    """
+    Returns sorted list of binary commit ids ``refs`` point to in dulwich
+    ``repo``. Annotated tags are peeled and refs pointing to non commits are
+    skipped.
+    """
+    tips = set()
+    for sha in refs.itervalues():
+        try:
+            obj = repo[sha]
+            while isinstance(obj, objects.Tag):
+                obj = repo[obj.object[1]]
+        except KeyError:
+            continue
+        if isinstance(obj, objects.Commit):
+            tips.add(binascii.unhexlify(obj.id))
+    return sorted(tips)
+
+
+class GitCommitGraph(object):
+    """
+    Read only view of a commit graph file. Commits are addressed by their
+    position, the same as ``revision`` of ``GitChangeset``.
+    """
+
+    def __init__(self, path, data):
+        self.path = path
+        self._data = data
+        (magic, self._count, self._parent_edges, self._child_edges,
+         self._tips_count, self.refs_digest) = _HEADER.unpack_from(data, 0)
+        if magic != GRAPH_MAGIC:
+            raise ValueError('%s is not a commit graph file' % path)
+        n = self._count
+        self._shas_offset = _HEADER.size
+        self._sorted_offset = self._shas_offset + n * _SHA_SIZE
+        self._times_offset = self._sorted_offset + n * _UINT.size
+        self._parent_index_offset = self._times_offset + n * _TIME.size
+        self._parents_offset = self._parent_index_offset + (n + 1) * _UINT.size
+        self._child_index_offset = (self._parents_offset
+                                    + self._parent_edges * _INT.size)
+        self._children_offset = self._child_index_offset + (n + 1) * _UINT.size
+        self._tips_offset = (self._children_offset
+                             + self._child_edges * _UINT.size)
+        if len(data) != self._tips_offset + self._tips_count * _SHA_SIZE:
+            raise ValueError('%s is truncated' % path)
+
+    @classmethod
+    def get_path(cls, repository):
+        return os.path.join(repository._repo.controldir(), GRAPH_FILE)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Maps the graph file at ``path`` into memory. Returns None if there is
+        no usable graph file.
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (IOError, OSError, ValueError):
+            return None
+        try:
+            return cls(path, data)
+        except (ValueError, struct.error), err:
+            log.warning('Ignoring broken commit graph: %s', err)
+            data.close()
+            return None
+
+    @classmethod
+    def get(cls, repository):
+        """
+        Returns ``GitCommitGraph`` of given ``GitRepository`` if its graph
+        file matches the current refs, None otherwise. The file is never
+        written here.
+        """
+        refs = get_refs(repository._repo)
+        if not refs:
+            return None
+        graph = cls.load(cls.get_path(repository))
+        if graph is not None and graph.refs_digest == _refs_digest(refs):
+            return graph
+        return None
+
+    @classmethod
+    def update(cls, repository):
+        """
+        Writes the graph file of given ``GitRepository`` for its current
+        refs and returns the graph. Returns None for empty repositories and
+        rev filters the graph can't follow.
+        """
+        _repo = repository._repo
+        # the refs are read before git, the graph is ignored if they change
+        # while it is built
+        refs = get_refs(_repo)
+        if not refs:
+            return None
+        tips = get_tips(_repo, refs)
+        if not tips:
+            return None
+        path = cls.get_path(repository)
+        shas, times, parents = _build(repository)
+        try:
+            _write(path, shas, times, parents, tips, _refs_digest(refs))
+        except (IOError, OSError), err:
+            log.warning('Could not write commit graph %s: %s', path, err)
+            return None
+        return cls.load(path)
+
+    def __len__(self):
+        return self._count
+
+    def _sha(self, pos):
+        offset = self._shas_offset + pos * _SHA_SIZE
+        return self._data[offset:offset + _SHA_SIZE]
+
+    @LazyProperty
+    def revisions(self):
+        """
+        Returns list of all commit ids, in the graph order.
+        """
+        _h = binascii.hexlify
+        data, offset = self._data, self._shas_offset
+        return [_h(data[offset + i * _SHA_SIZE:offset + (i + 1) * _SHA_SIZE])
+                for i in xrange(self._count)]
+
+    def get_sha(self, pos):
+        """
+        Returns commit id at given position.
+        """
+        if not 0 <= pos < self._count:
+            raise IndexError(pos)
+        return binascii.hexlify(self._sha(pos))
+
+    def index(self, sha):
+        """
+        Returns position of commit with given id, raises ValueError if there
+        is no such commit in the graph.
+        """
+        try:
+            bin_sha = binascii.unhexlify(sha)
+        except TypeError:
+            raise ValueError('%s is not in commit graph' % sha)
+        lo, hi = 0, self._count
+        data, offset = self._data, self._sorted_offset
+        while lo < hi:
+            mid = (lo + hi) // 2
+            pos = _UINT.unpack_from(data, offset + mid * _UINT.size)[0]
+            mid_sha = self._sha(pos)
+            if mid_sha < bin_sha:
+                lo = mid + 1
+            elif mid_sha > bin_sha:
+                hi = mid
+            else:
+                return pos
+        raise ValueError('%s is not in commit graph' % sha)
+
+    def __contains__(self, sha):
+        try:
+            self.index(sha)
+        except ValueError:
+            return False
+        return True
+
+    def get_timestamp(self, pos):
+        return _TIME.unpack_from(self._data,
+                                 self._times_offset + pos * _TIME.size)[0]
+
+    def _adjacent(self, index_offset, values_offset, fmt, pos):
+        if not 0 <= pos < self._count:
+            raise IndexError(pos)
+        data = self._data
+        start, end = struct.unpack_from('<II', data,
+                                        index_offset + pos * _UINT.size)
+        return [fmt.unpack_from(data, values_offset + i * fmt.size)[0]
+                for i in xrange(start, end)]
+
+    def get_parents(self, pos):
+        """
+        Returns positions of parents of the commit at ``pos``.
+        """
+        return self._adjacent(self._parent_index_offset, self._parents_offset,
+                              _INT, pos)
+
+    def get_children(self, pos):
+        """
+        Returns positions of children of the commit at ``pos``.
+        """
+        return self._adjacent(self._child_index_offset, self._children_offset,
+                              _UINT, pos)
+
+
+def _refs_digest(refs):
+    return hashlib.sha1(''.join('%s %s\n' % (ref, refs[ref])
+                                for ref in sorted(refs))).digest()
+
+
+def _build(repository):
+    """
+    Returns (shas, times, parents) for the whole repository, in the same
+    order as ``git rev-list --reverse --date-order``.
+    """
+    cmd = ('rev-list --timestamp --parents --reverse --date-order %s'
+           % settings.GIT_REV_FILTER)
+    so, se = repository.run_git_command(cmd)
+    _u = binascii.unhexlify
+    shas, times, parent_shas = [], [], []
+    for line in so.splitlines():
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        times.append(int(parts[0]))
+        shas.append(_u(parts[1]))
+        parent_shas.append(parts[2:])
+    positions = dict((sha, i) for i, sha in enumerate(shas))
+    parents = [[positions.get(_u(p), -1) for p in ps] for ps in parent_shas]
+    return shas, times, parents
+
+
+def _write(path, shas, times, parents, tips, refs_digest):
+    """
+    Writes graph file atomically, readers keep using their old mapping.
+    """
+    n = len(shas)
+    children = [[] for _i in xrange(n)]
+    for pos, ps in enumerate(parents):
+        for p in ps:
+            if p >= 0:
+                children[p].append(pos)
+    parent_edges = sum(len(ps) for ps in parents)
+    child_edges = sum(len(cs) for cs in children)
+
+    def offsets(lists):
+        result = [0]
+        for l in lists:
+            result.append(result[-1] + len(l))
+        return result
+
+    chunks = [
+        _HEADER.pack(GRAPH_MAGIC, n, parent_edges, child_edges, len(tips),
+                     refs_digest),
+        ''.join(shas),
+        struct.pack('<%dI' % n, *sorted(xrange(n), key=shas.__getitem__)),
+        struct.pack('<%dq' % n, *times),
+        struct.pack('<%dI' % (n + 1), *offsets(parents)),
+        struct.pack('<%di' % parent_edges, *(p for ps in parents for p in ps)),
+        struct.pack('<%dI' % (n + 1), *offsets(children)),
+        struct.pack('<%dI' % child_edges, *(c for cs in children for c in cs)),
+        ''.join(tips),
+    ]
+    fd, tmp_path = tempfile.mkstemp(prefix=GRAPH_FILE,
+                                    dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+        replace_file(tmp_path, path)
+    except (IOError, OSError):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def get_commit_graph(repository):
+    """
+    Returns commit graph of given ``GitRepository`` if the graph cache is
+    enabled and its graph file is up to date, None otherwise.
+    """
+    if not settings.GIT_COMMIT_GRAPH_CACHE:
+        return None
+    return GitCommitGraph.get(repository)
+
+
+def update_commit_graph(repository):
+    """
+    Writes commit graph file of given ``GitRepository`` if the graph cache
+    is enabled and returns the up to date graph.
+    """
+    if not settings.GIT_COMMIT_GRAPH_CACHE:
+        return None
+    try:
+        return GitCommitGraph.update(repository)
+    except RepositoryError, err:
+        log.error('Failed to update commit graph of %s: %s',
+                  repository.path, err)
+        return None
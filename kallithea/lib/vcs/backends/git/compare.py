@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+"""
+    vcs.backends.git.compare
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Comparison of revisions of two (possibly different) git repositories.
+
+    The object stores of both repositories are combined into a read-only
+    view, so the DAGs can be walked without fetching anything from one
+    repository into the other. Results only depend on the compared commit
+    ids and are cached per pair.
+"""
+
+import heapq
+
+from kallithea.lib.vcs.utils.lrucache import LRUCache
+
+# number of kept comparison results
+COMPARE_CACHE_SIZE = 256
+
+_PARENT1 = 1
+_PARENT2 = 2
+_BOTH = _PARENT1 | _PARENT2
+_STALE = 4
+
+_results = LRUCache(COMPARE_CACHE_SIZE)
+
+
+class UnionObjectStore(object):
+    """
+    Read-only view on objects of several object stores, looked up in the
+    given order.
+    """
+
+    def __init__(self, *stores):
+        self.stores = stores
+
+    def __getitem__(self, sha):
+        for store in self.stores:
+            try:
+                return store[sha]
+            except KeyError:
+                pass
+        raise KeyError(sha)
+
+    def __contains__(self, sha):
+        return any(sha in store for store in self.stores)
+
+
+def merge_base(store, rev1, rev2):
+    """
+    Returns id of the best common ancestor of commits ``rev1`` and ``rev2``
+    or None if they are not related.
+
+    Both histories are walked newest first and commits are painted with the
+    side they are reachable from. Commits painted by both sides are merge
+    base candidates and everything below them is painted stale. As commit
+    dates can be skewed, the walk only ends when no queued commit is
+    reachable from just one side, and candidates that are ancestors of
+    other candidates are dropped, like ``git merge-base`` does.
+    """
+    if rev1 == rev2:
+        return rev1
+    commits = {}
+    flags = {}
+    queue = []
+    queued = set()
+    # number of queued commits which are not stale
+    active = [0]
+
+    def paint(sha, sha_flags):
+        old_flags = flags.get(sha, 0)
+        if old_flags & sha_flags == sha_flags:
+            return
+        flags[sha] = old_flags | sha_flags
+        if sha in queued:
+            if sha_flags & _STALE and not old_flags & _STALE:
+                active[0] -= 1
+            return
+        if sha not in commits:
+            commits[sha] = store[sha]
+        heapq.heappush(queue, (-commits[sha].commit_time, sha))
+        queued.add(sha)
+        if not flags[sha] & _STALE:
+            active[0] += 1
+
+    paint(rev1, _PARENT1)
+    paint(rev2, _PARENT2)
+    candidates = []
+    while active[0]:
+        sha = heapq.heappop(queue)[1]
+        queued.remove(sha)
+        sha_flags = flags[sha]
+        if not sha_flags & _STALE:
+            active[0] -= 1
+            if sha_flags & _BOTH == _BOTH:
+                candidates.append(sha)
+                sha_flags = flags[sha] = sha_flags | _STALE
+        for parent in commits[sha].parents:
+            paint(parent, sha_flags)
+    for sha in candidates:
+        if not any(_is_ancestor(store, commits, sha, other)
+                   for other in candidates if other != sha):
+            # newest candidate that is not below another one
+            return sha
+    return None
+
+
+def _is_ancestor(store, commits, ancestor, sha):
+    """
+    Returns True if commit ``ancestor`` is reachable from commit ``sha``
+    """
+    seen = set([sha])
+    todo = [sha]
+    while todo:
+        sha = todo.pop()
+        if sha not in commits:
+            commits[sha] = store[sha]
+        for parent in commits[sha].parents:
+            if parent == ancestor:
+                return True
+            if parent not in seen:
+                seen.add(parent)
+                todo.append(parent)
+    return False
+
+
+def _walk(store, include, exclude):
+    from dulwich.walk import Walker
+    return [entry.commit.id
+            for entry in Walker(store, include=[include], exclude=[exclude])]
+
+
+def compare(repo, rev, other_repo, other_rev):
+    """
+    Returns tuple of ids of commits reachable from ``other_rev`` but not from
+    ``rev``, ids of commits reachable from ``rev`` but not from
+    ``other_rev`` (both oldest first) and id of their merge base.
+
+    :param repo: ``GitRepository`` containing ``rev``
+    :param other_repo: ``GitRepository`` containing ``other_rev``
+    """
+    key = (repo.path, rev, other_repo.path, other_rev)
+    result = _results.get(key)
+    if result is None:
+        if repo.path == other_repo.path:
+            store = repo._repo.object_store
+        else:
+            store = UnionObjectStore(other_repo._repo.object_store,
+                                     repo._repo.object_store)
+        other_revs = _walk(store, other_rev, rev)
+        revs = _walk(store, rev, other_rev)
+        result = (other_revs[::-1], revs[::-1],
+                  merge_base(store, rev, other_rev))
+        _results[key] = result
+    return result
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+    vcs.backends.git.history
+    ~~~~~~~~~~~~~~~~~~~~~~~~
+
+    In-process file history walker for git repositories.
+
+    Works like ``git log <rev> -- <path>``: commits are visited newest first
+    and only those changing the entry at ``path`` are returned, following
+    only a TREESAME parent of merges. Instead of diffing whole trees the
+    walker looks up the tree entries along the path and compares them,
+    stopping at the first subtree that is the same in both commits.
+
+    Walks are kept in a process wide LRU cache keyed by repository, start
+    commit and path. A cached walk remembers where it stopped, so asking for
+    the next page continues the walk instead of starting over. The cache is
+    bounded by the number of commits and tree lookups the walks hold.
+"""
+
+import heapq
+import threading
+
+from dulwich import objects
+
+from kallithea.lib.vcs.backends.base import ChangesetSummary
+from kallithea.lib.vcs.utils import safe_str, safe_unicode, date_fromtimestamp
+from kallithea.lib.vcs.utils.lrucache import LRUCache
+
+# number of history entries, commits and tree lookups of all walks kept in
+# memory
+HISTORY_CACHE_SIZE = 256 * 1024
+
+
+def _sizeof_walk(walk):
+    return (1 + len(walk.entries) + len(walk._lookups) + len(walk._commits)
+            + len(walk._queued))
+
+_walks = LRUCache(HISTORY_CACHE_SIZE, sizeof=_sizeof_walk)
+
+
+class GitFileHistoryWalk(object):
+    """
+    Resumable history walk of single ``path`` starting at commit ``head``.
+    """
+
+    def __init__(self, head, path):
+        self.head = head
+        self.path = path
+        self._parts = path.strip('/').split('/')
+        self._lock = threading.Lock()
+        # (commit id, commit_time, commit_timezone, author, message)
+        self.entries = []
+        self._pending = []
+        self._queued = set()
+        # commits waiting in _pending
+        self._commits = {}
+        self._counter = 0
+        # (depth, tree id) -> (mode, sha) of path entry or None
+        self._lookups = {}
+        self.done = False
+
+    def _path_entry(self, repo, tree_id, depth=0):
+        key = (depth, tree_id)
+        if key not in self._lookups:
+            entry = None
+            tree = repo[tree_id]
+            if isinstance(tree, objects.Tree):
+                try:
+                    mode, sha = tree[self._parts[depth]]
+                except KeyError:
+                    pass
+                else:
+                    if depth == len(self._parts) - 1:
+                        entry = (mode, sha)
+                    elif not objects.S_ISGITLINK(mode):
+                        entry = self._path_entry(repo, sha, depth + 1)
+            self._lookups[key] = entry
+        return self._lookups[key]
+
+    def _push(self, sha, commit):
+        if sha in self._queued:
+            return
+        self._queued.add(sha)
+        self._commits[sha] = commit
+        self._counter += 1
+        heapq.heappush(self._pending,
+                       (-commit.commit_time, self._counter, sha))
+
+    def _step(self, repo):
+        sha = heapq.heappop(self._pending)[2]
+        commit = self._commits.pop(sha)
+        entry = self._path_entry(repo, commit.tree)
+        parents = [(p, self._commits.get(p) or repo[p])
+                   for p in commit.parents]
+        follow = parents
+        changed = entry is not None
+        if parents:
+            changed = True
+            for parent, parent_commit in parents:
+                if self._path_entry(repo, parent_commit.tree) == entry:
+                    # treesame to this parent, history comes from it only
+                    changed = False
+                    follow = [(parent, parent_commit)]
+                    break
+        if changed:
+            self.entries.append((sha, commit.commit_time,
+                                 commit.commit_timezone, commit.author,
+                                 commit.message))
+        for parent, parent_commit in follow:
+            self._push(parent, parent_commit)
+        if not self._pending:
+            self.done = True
+            # only needed while walking
+            self._lookups = {}
+            self._queued = set()
+
+    def get(self, repo, offset=0, limit=None):
+        """
+        Returns entries from ``offset`` (at most ``limit`` of them), walking
+        further when needed, and offset of the next page or None if there
+        are no more entries.
+        """
+        with self._lock:
+            if not self.done and not self._queued:
+                self._push(self.head, repo[self.head])
+            while not self.done and (limit is None
+                                     or len(self.entries) < offset + limit):
+                self._step(repo)
+            if limit is None:
+                return self.entries[offset:], None
+            end = offset + limit
+            more = len(self.entries) > end or not self.done
+            return self.entries[offset:end], end if more else None
+
+
+def get_file_history(repository, head, path, limit=None, cursor=None):
+    """
+    Returns tuple of list of ``ChangesetSummary`` objects for changesets
+    which modified ``path``, newest first, starting from changeset ``head``
+    and a cursor for the next page (None if there are no more entries).
+
+    :param limit: maximal number of returned entries, all if not given
+    :param cursor: cursor returned for the previous page
+    """
+    path = safe_str(path).strip('/')
+    key = (repository.path, head, path)
+    walk = _walks.get(key)
+    if walk is None:
+        walk = GitFileHistoryWalk(head, path)
+        _walks[key] = walk
+    rows, next_cursor = walk.get(repository._repo, cursor or 0, limit)
+    # the walk grew, store it again to account its new size
+    _walks[key] = walk
+
+    heads = repository._heads(reverse=False)
+    entries = []
+    for sha, commit_time, commit_timezone, author, message in rows:
+        try:
+            revision = repository._get_revision_position(sha)
+        except ValueError:
+            revision = None
+        branch = heads.get(sha)
+        entries.append(ChangesetSummary(
+            repository, sha, revision=revision,
+            author=safe_unicode(author),
+            date=date_fromtimestamp(commit_time, commit_timezone),
+            message=safe_unicode(message),
+            branch=safe_unicode(branch) if branch else None))
+    return entries, next_cursor
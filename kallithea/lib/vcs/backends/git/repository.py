@@ -46,6 +46,7 @@ from kallithea.lib.vcs.utils.hgcompat import (
 )
 
 from .changeset import GitChangeset
+from .commitgraph import get_commit_graph, update_commit_graph
 from .inmemory import GitInMemoryChangeset
 from .workdir import GitWorkdir
 
@@ -107,6 +108,85 @@ class GitRepository(BaseRepository):
         """
         return self._get_all_revisions()
 
+    @LazyProperty
+    def _commit_graph(self):
+        """
+        Returns ``GitCommitGraph`` for this repository or None if the commit
+        graph cache is disabled or its file is out of date.
+        """
+        return get_commit_graph(self)
+
+    def update_commit_graph(self):
+        """
+        Writes commit graph cache file for the current refs, used after push
+        and fetch.
+        """
+        self._commit_graph = update_commit_graph(self)
+
+    def _get_graph_for_revisions(self):
+        """
+        Returns commit graph if its positions match ``revisions``.
+        """
+        graph = self._commit_graph
+        if graph is not None and graph.revisions is self.revisions:
+            return graph
+        return None
+
+    def _get_parent_revisions(self, revision):
+        """
+        Returns positions in ``revisions`` of parents of the changeset at
+        position ``revision``, without building changeset objects.
+        """
+        graph = self._get_graph_for_revisions()
+        if graph is not None and revision < len(graph):
+            return graph.get_parents(revision)
+        commit = self._repo[self.revisions[revision]]
+        return [self._get_revision_position(p) for p in commit.parents]
+
+    def _get_children_ids(self, raw_id):
+        """
+        Returns ids of children of given commit from the commit graph, or
+        None if there is no graph to answer from.
+        """
+        graph = self._commit_graph
+        if graph is None:
+            return None
+        try:
+            pos = graph.index(raw_id)
+        except ValueError:
+            return None
+        return [graph.get_sha(c) for c in graph.get_children(pos)]
+
+    @property
+    def _revisions_index(self):
+        """
+        Returns dict mapping revision ids to their position in
+        ``revisions``. It is built lazily and kept in sync if ``revisions``
+        is injected from outside or appended to by in-memory commits.
+        """
+        revisions = self.revisions
+        if self.__dict__.get('_revisions_index_src') is not revisions:
+            self._revisions_index_src = revisions
+            self._revisions_index_map = {}
+            self._revisions_index_len = 0
+        _index = self._revisions_index_map
+        for pos in xrange(self._revisions_index_len, len(revisions)):
+            _index.setdefault(revisions[pos], pos)
+        self._revisions_index_len = len(revisions)
+        return _index
+
+    def _get_revision_position(self, revision):
+        """
+        Returns position of given revision id in ``revisions``. Works like
+        ``revisions.index`` but in constant time.
+
+        :raises ValueError: if revision is not in ``revisions``
+        """
+        try:
+            return self._revisions_index[revision]
+        except KeyError:
+            raise ValueError('%s is not in revisions' % revision)
+
     @classmethod
     def _run_git_command(cls, cmd, **opts):
         """
@@ -114,7 +194,9 @@ class GitRepository(BaseRepository):
         (stdout, stderr).
 
         :param cmd: git command to be executed
-        :param opts: env options to pass into Subprocess command
+        :param opts: env options to pass into Subprocess command, with
+            ``_stream`` stdout is returned as iterator of chunks read while
+            it is consumed
         """
 
         if '_bare' in opts:
@@ -127,6 +209,7 @@ class GitRepository(BaseRepository):
             #no exc on failure
             del opts['_safe']
             safe_call = True
+        stream = opts.pop('_stream', False)
 
         _str_cmd = False
         if isinstance(cmd, basestring):
@@ -160,10 +243,11 @@ class GitRepository(BaseRepository):
             else:
                 raise RepositoryError(tb_err)
 
+        if stream:
+            return p, p.error
         return ''.join(p.output), ''.join(p.error)
 
-    def run_git_command(self, cmd):
-        opts = {}
+    def run_git_command(self, cmd, **opts):
         if os.path.isdir(self.path):
             opts['cwd'] = self.path
         return self._run_git_command(cmd, **opts)
@@ -260,6 +344,9 @@ class GitRepository(BaseRepository):
         except KeyError:
             return []
 
+        if self._commit_graph is not None:
+            return self._commit_graph.revisions
+
         rev_filter = settings.GIT_REV_FILTER
         cmd = 'rev-list %s --reverse --date-order' % (rev_filter)
         try:
@@ -309,7 +396,8 @@ class GitRepository(BaseRepository):
             if revision in _tags_shas:
                 return _tags_shas[_tags_shas.index(revision)]
 
-            elif not SHA_PATTERN.match(revision) or revision not in self.revisions:
+            elif (not SHA_PATTERN.match(revision)
+                  or revision not in self._revisions_index):
                 msg = ("Revision %s does not exist for %s" % (revision, self))
                 raise ChangesetDoesNotExistError(msg)
 
@@ -542,38 +630,44 @@ class GitRepository(BaseRepository):
         if self._empty:
             raise EmptyRepositoryError("There are no changesets yet")
 
-        # %H at format means (full) commit hash, initial hashes are retrieved
-        # in ascending date order
-        cmd_template = 'log --date-order --reverse --pretty=format:"%H"'
-        cmd_params = {}
-        if start_date:
-            cmd_template += ' --since "$since"'
-            cmd_params['since'] = start_date.strftime('%m/%d/%y %H:%M:%S')
-        if end_date:
-            cmd_template += ' --until "$until"'
-            cmd_params['until'] = end_date.strftime('%m/%d/%y %H:%M:%S')
-        if branch_name:
-            cmd_template += ' $branch_name'
-            cmd_params['branch_name'] = branch_name
+        if not (start_date or end_date or branch_name):
+            # unfiltered log is the same list we already have in revisions
+            revs = self.revisions
+            rev_position = self._get_revision_position
         else:
-            rev_filter = settings.GIT_REV_FILTER
-            cmd_template += ' %s' % (rev_filter)
+            # %H at format means (full) commit hash, initial hashes are
+            # retrieved in ascending date order
+            cmd_template = 'log --date-order --reverse --pretty=format:"%H"'
+            cmd_params = {}
+            if start_date:
+                cmd_template += ' --since "$since"'
+                cmd_params['since'] = start_date.strftime('%m/%d/%y %H:%M:%S')
+            if end_date:
+                cmd_template += ' --until "$until"'
+                cmd_params['until'] = end_date.strftime('%m/%d/%y %H:%M:%S')
+            if branch_name:
+                cmd_template += ' $branch_name'
+                cmd_params['branch_name'] = branch_name
+            else:
+                rev_filter = settings.GIT_REV_FILTER
+                cmd_template += ' %s' % (rev_filter)
 
-        cmd = string.Template(cmd_template).safe_substitute(**cmd_params)
-        revs = self.run_git_command(cmd)[0].splitlines()
+            cmd = string.Template(cmd_template).safe_substitute(**cmd_params)
+            revs = self.run_git_command(cmd)[0].splitlines()
+            rev_position = revs.index
         start_pos = 0
         end_pos = len(revs)
         if start:
             _start = self._get_revision(start)
             try:
-                start_pos = revs.index(_start)
+                start_pos = rev_position(_start)
             except ValueError:
                 pass
 
         if end is not None:
             _end = self._get_revision(end)
             try:
-                end_pos = revs.index(_end)
+                end_pos = rev_position(_end)
             except ValueError:
                 pass
 
@@ -603,6 +697,61 @@ class GitRepository(BaseRepository):
         :param context: How many lines before/after changed lines should be
           shown. Defaults to ``3``.
         """
+        cmd, strip_header = self._get_diff_cmd(rev1, rev2, path,
+                                               ignore_whitespace, context)
+        stdout, stderr = self.run_git_command(cmd)
+        # TODO: don't ignore stderr
+        # If we used 'show' command, strip first few lines (until actual diff
+        # starts)
+        if strip_header:
+            parts = stdout.split('\ndiff ', 1)
+            if len(parts) > 1:
+                stdout = 'diff ' + parts[1]
+        return stdout
+
+    def iter_diff(self, rev1, rev2, path=None, ignore_whitespace=False,
+                  context=3):
+        """
+        Returns iterator of chunks of *diff* read from git while it is
+        consumed, see ``get_diff``. Closing the iterator stops git.
+        """
+        cmd, strip_header = self._get_diff_cmd(rev1, rev2, path,
+                                               ignore_whitespace, context)
+        stdout, stderr = self.run_git_command(cmd, _stream=True)
+        return self._iter_closing(stdout, strip_header)
+
+    @classmethod
+    def _iter_closing(cls, stdout, strip_header):
+        try:
+            chunks = stdout
+            if strip_header:
+                chunks = cls._strip_show_header(stdout)
+            for chunk in chunks:
+                yield chunk
+        finally:
+            stdout.close()
+
+    @staticmethod
+    def _strip_show_header(chunks):
+        head = ''
+        for chunk in chunks:
+            head += chunk
+            parts = head.split('\ndiff ', 1)
+            if len(parts) > 1:
+                yield 'diff ' + parts[1]
+                break
+        else:
+            if head:
+                yield head
+            return
+        for chunk in chunks:
+            yield chunk
+
+    def _get_diff_cmd(self, rev1, rev2, path, ignore_whitespace, context):
+        """
+        Returns git command showing diff and flag telling if it is prefixed
+        by changeset header.
+        """
         flags = ['-U%s' % context, '--full-index', '--binary', '-p', '-M', '--abbrev=40']
         if ignore_whitespace:
             flags.append('-w')
@@ -624,15 +773,7 @@ class GitRepository(BaseRepository):
         if path:
             cmd += ' -- "%s"' % path
 
-        stdout, stderr = self.run_git_command(cmd)
-        # TODO: don't ignore stderr
-        # If we used 'show' command, strip first few lines (until actual diff
-        # starts)
-        if rev1 == self.EMPTY_CHANGESET:
-            parts = stdout.split('\ndiff ', 1)
-            if len(parts) > 1:
-                stdout = 'diff ' + parts[1]
-        return stdout
+        return cmd, rev1 == self.EMPTY_CHANGESET
 
     @LazyProperty
     def in_memory_changeset(self):
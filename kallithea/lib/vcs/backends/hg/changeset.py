@@ -1,8 +1,8 @@
-import os
-import posixpath
+import bz2
+import gzip
 
 from kallithea.lib.vcs.conf import settings
-from kallithea.lib.vcs.backends.base import BaseChangeset
+from kallithea.lib.vcs.backends.base import BaseChangeset, ChangesetSummary
 from kallithea.lib.vcs.exceptions import (
     ChangesetDoesNotExistError, ChangesetError, ImproperArchiveTypeError,
     NodeDoesNotExistError, VCSError
@@ -13,8 +13,35 @@ from kallithea.lib.vcs.nodes import (
 )
 from kallithea.lib.vcs.utils import safe_str, safe_unicode, date_fromtimestamp
 from kallithea.lib.vcs.utils.lazy import LazyProperty
-from kallithea.lib.vcs.utils.paths import get_dirs_for_path
-from kallithea.lib.vcs.utils.hgcompat import archival, hex
+from kallithea.lib.vcs.utils.paths import PathIndex
+from kallithea.lib.vcs.utils.lrucache import LRUCache
+from kallithea.lib.vcs.utils.archivers import write_archive
+from kallithea.lib.vcs.utils.hgcompat import archival, bdiff, hex, \
+    fromlocal, getlatesttags, nullrev
+
+# changesets with the same manifest share its index, the cache is bounded
+# by settings.HG_MANIFEST_INDEX_CACHE_SIZE files and directories
+_manifest_indexes = LRUCache(settings.HG_MANIFEST_INDEX_CACHE_SIZE,
+                             sizeof=len)
+
+
+class _BZ2Writer(object):
+    """
+    Writes bzip2 compressed data to the file like object ``fileobj``.
+    """
+
+    def __init__(self, fileobj, compresslevel):
+        self.fileobj = fileobj
+        self._compressor = bz2.BZ2Compressor(compresslevel)
+
+    def write(self, data):
+        self.fileobj.write(self._compressor.compress(data))
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.fileobj.write(self._compressor.flush())
 
 
 class MercurialChangeset(BaseChangeset):
@@ -75,18 +102,14 @@ class MercurialChangeset(BaseChangeset):
                                             self._ctx.node())
 
     @LazyProperty
-    def _file_paths(self):
-        return list(self._ctx)
-
-    @LazyProperty
-    def _dir_paths(self):
-        p = list(set(get_dirs_for_path(*self._file_paths)))
-        p.insert(0, '')
-        return p
-
-    @LazyProperty
-    def _paths(self):
-        return self._dir_paths + self._file_paths
+    def _manifest_index(self):
+        key = self._ctx.manifestnode()
+        index = _manifest_indexes.get(key)
+        if index is None:
+            index = PathIndex((path, None) for path in self._ctx.manifest())
+            _manifest_indexes.max_size = settings.HG_MANIFEST_INDEX_CACHE_SIZE
+            _manifest_indexes[key] = index
+        return index
 
     @LazyProperty
     def id(self):
@@ -168,9 +191,9 @@ class MercurialChangeset(BaseChangeset):
 
     def _get_kind(self, path):
         path = self._fix_path(path)
-        if path in self._file_paths:
+        if path in self._manifest_index.files:
             return NodeKind.FILE
-        elif path in self._dir_paths:
+        elif path in self._manifest_index.dirs:
             return NodeKind.DIR
         else:
             raise ChangesetError("Node does not exist at the given path '%s'"
@@ -214,6 +237,13 @@ class MercurialChangeset(BaseChangeset):
         fctx = self._get_filectx(path)
         return fctx.size()
 
+    def get_file_id(self, path):
+        """
+        Returns id of the file revision at given ``path``.
+        """
+        fctx = self._get_filectx(path)
+        return hex(fctx.filenode())
+
     def get_file_changeset(self, path):
         """
         Returns last commit of the file at the given ``path``.
@@ -236,20 +266,61 @@ class MercurialChangeset(BaseChangeset):
 
         return [self.repository.get_changeset(node) for node in hist]
 
-    def get_file_annotate(self, path):
+    def get_file_history_page(self, path, limit=None, cursor=None):
         """
-        Returns a generator of four element tuples with
-            lineno, sha, changeset lazy loader and line
+        Returns tuple of reversed list of ``ChangesetSummary`` objects for
+        which file at given ``path`` has been modified and a cursor for the
+        next page.
         """
-
         fctx = self._get_filectx(path)
-        for i, annotate_data in enumerate(fctx.annotate()):
-            ln_no = i + 1
-            sha = hex(annotate_data[0].node())
-            yield (ln_no, sha, lambda: self.repository.get_changeset(sha), annotate_data[1],)
+        filelog = fctx.filelog()
+        # cursor is the number of entries already returned
+        start = len(filelog) - 1 - (cursor or 0)
+        stop = -1
+        if limit:
+            stop = max(start - limit, -1)
+        entries = []
+        for filerev in xrange(start, stop, -1):
+            ctx = fctx.filectx(filerev).changectx()
+            entries.append(ChangesetSummary(
+                self.repository, ctx.hex(), revision=ctx.rev(),
+                author=safe_unicode(ctx.user()),
+                date=date_fromtimestamp(*ctx.date()),
+                message=safe_unicode(ctx.description()),
+                branch=safe_unicode(ctx.branch())))
+        next_cursor = None
+        if stop > -1:
+            next_cursor = (cursor or 0) + len(entries)
+        return entries, next_cursor
+
+    def _annotate(self, path):
+        fctx = self._get_filectx(path)
+        for annotate_data in fctx.annotate():
+            yield hex(annotate_data[0].node())
+
+    def _annotation_id(self, path):
+        # file revisions are hashed with their parents, so they identify
+        # the history of the file too
+        return self.get_file_id(path)
+
+    def _annotate_parents(self):
+        # Mercurial lets the last parent win
+        return self.parents[::-1]
+
+    def _line_changes(self, other, path):
+        # the same diff as annotate uses
+        changes = []
+        a = b = 0
+        for a1, a2, b1, b2 in bdiff.blocks(other.get_file_content(path),
+                                           self.get_file_content(path)):
+            if a1 > a or b1 > b:
+                changes.append((a, a1, b, b1))
+            a, b = a2, b2
+        return changes
 
     def fill_archive(self, stream=None, kind='tgz', prefix=None,
-                     subrepos=False):
+                     subrepos=False, compression_level=None,
+                     compression_threads=None):
         """
         Fills up given stream.
 
@@ -260,6 +331,11 @@ class MercurialChangeset(BaseChangeset):
             Default is repository name and changeset's raw_id joined with dash
             (``repo-tip.<KIND>``).
         :param subrepos: include subrepos in this archive.
+        :param compression_level: 1 (fastest) to 9 (best) or None for
+            the default of 9. Zip archives with subrepos always use the
+            default of mercurial.
+        :param compression_threads: number of threads compressing ``tgz`` and
+            ``zip`` archives without subrepos, default 1.
 
         :raise ImproperArchiveTypeError: If given kind is wrong.
         :raise VcsError: If given stream is None
@@ -281,15 +357,58 @@ class MercurialChangeset(BaseChangeset):
         elif prefix.strip() == '':
             raise VCSError("Prefix cannot be empty")
 
-        archival.archive(self.repository._repo, stream, self.raw_id,
-                         kind, prefix=prefix, subrepos=subrepos)
-
-        if stream.closed and hasattr(stream, 'name'):
-            stream = open(stream.name, 'rb')
-        elif hasattr(stream, 'mode') and 'r' not in stream.mode:
-            stream = open(stream.name, 'rb')
+        if not (subrepos and self._ctx.substate):
+            write_archive(stream, kind, prefix, self._ctx.date()[0],
+                          self._archive_entries(), compression_level,
+                          compression_threads)
+        elif compression_level and kind in ('tgz', 'tbz2'):
+            # compress a plain tar archive with the given level
+            if kind == 'tgz':
+                out = gzip.GzipFile(filename='', mode='wb',
+                                    compresslevel=compression_level,
+                                    fileobj=stream, mtime=int(self._ctx.date()[0]))
+            else:
+                out = _BZ2Writer(stream, compression_level)
+            archival.archive(self.repository._repo, out, self.raw_id,
+                             'tar', prefix=prefix, subrepos=subrepos)
+            out.close()
         else:
-            stream.seek(0)
+            archival.archive(self.repository._repo, stream, self.raw_id,
+                             kind, prefix=prefix, subrepos=subrepos)
+
+    def _archive_entries(self):
+        """
+        Returns files like mercurial archives them, with content passed
+        through decode filters and with ``.hg_archival.txt`` metadata.
+        """
+        repo = self.repository._repo
+        if repo.ui.configbool('ui', 'archivemeta', True):
+            yield ('.hg_archival.txt', 0644, False, None,
+                   self._get_archival_metadata)
+        manifest = self._ctx.manifest()
+        for path in sorted(manifest):
+            flags = manifest.flags(path)
+            getdata = lambda path=path: repo.wwritedata(
+                path, self._ctx.filectx(path).data())
+            yield (path, 0755 if 'x' in flags else 0644, 'l' in flags,
+                   hex(manifest[path]), getdata)
+
+    def _get_archival_metadata(self):
+        repo = self.repository._repo
+        ctx = self._ctx
+        metadata = 'repo: %s\nnode: %s\nbranch: %s\n' % (
+            repo[0].hex(), ctx.hex(), fromlocal(ctx.branch()))
+        tags = ''.join('tag: %s\n' % t for t in ctx.tags()
+                       if repo.tagtype(t) == 'global')
+        if not tags:
+            _date, distance, latesttags = getlatesttags(repo, ctx, {})
+            latesttags = latesttags.split(':')
+            changessince = len(repo.revs('::%d - ::%s', ctx.rev(),
+                                         latesttags[0]))
+            tags = ''.join('latesttag: %s\n' % t for t in latesttags)
+            tags += 'latesttagdistance: %s\n' % distance
+            tags += 'changessincelatesttag: %s\n' % changessince
+        return metadata + tags
 
     def get_nodes(self, path):
         """
@@ -303,12 +422,9 @@ class MercurialChangeset(BaseChangeset):
                 " '%s'" % (self.revision, path))
         path = self._fix_path(path)
 
-        filenodes = [FileNode(f, changeset=self) for f in self._file_paths
-            if os.path.dirname(f) == path]
-        dirs = path == '' and '' or [d for d in self._dir_paths
-            if d and posixpath.dirname(d) == path]
-        dirnodes = [DirNode(d, changeset=self) for d in dirs
-            if os.path.dirname(d) == path]
+        dirs, files = self._manifest_index.dirs[path]
+        filenodes = [FileNode(f, changeset=self) for f in files]
+        dirnodes = [DirNode(d, changeset=self) for d in dirs]
 
         als = self.repository.alias
         for k, vals in self._extract_submodules().iteritems():
@@ -334,9 +450,9 @@ class MercurialChangeset(BaseChangeset):
         path = self._fix_path(path)
 
         if not path in self.nodes:
-            if path in self._file_paths:
+            if path in self._manifest_index.files:
                 node = FileNode(path, changeset=self)
-            elif path in self._dir_paths or path in self._dir_paths:
+            elif path in self._manifest_index.dirs:
                 if path == '':
                     node = RootNode(changeset=self)
                 else:
@@ -356,6 +472,47 @@ class MercurialChangeset(BaseChangeset):
         """
         return self._ctx.files()
 
+    def _tree_entries(self):
+        return self._ctx.manifest().iteritems()
+
+    def _tree_changes(self, other):
+        old_manifest = other._ctx.manifest()
+        new_manifest = self._ctx.manifest()
+        if not hasattr(old_manifest, 'diff'):
+            # manifests of Mercurial before 3.4 are plain dicts
+            for path, oldnode in old_manifest.iteritems():
+                newnode = new_manifest.get(path)
+                if newnode != oldnode:
+                    yield (path, oldnode), \
+                          (path, newnode) if newnode else None
+            for path, newnode in new_manifest.iteritems():
+                if path not in old_manifest:
+                    yield None, (path, newnode)
+            return
+        changes = old_manifest.diff(new_manifest)
+        for path, ((oldnode, _oldflag), (newnode, _newflag)) in \
+                changes.iteritems():
+            yield (path, oldnode) if oldnode else None, \
+                  (path, newnode) if newnode else None
+
+    def _first_parent_ids(self, limit):
+        changelog = self.repository._repo.changelog
+        rev = self._ctx.rev()
+        for _i in xrange(limit):
+            rev = changelog.parentrevs(rev)[0]
+            if rev == nullrev:
+                break
+            yield hex(changelog.node(rev))
+
+    def _blob_info(self, path, blob_id):
+        content = self.repository._repo.filectx(path, fileid=blob_id).data()
+        return len(content), '\0' in content
+
+    @LazyProperty
+    def file_change_counts(self):
+        modified, added, removed = self.status[:3]
+        return len(added), len(modified), len(removed)
+
     @property
     def added(self):
         """
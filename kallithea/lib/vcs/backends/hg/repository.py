@@ -246,6 +246,16 @@ class MercurialRepository(BaseRepository):
         :param context: How many lines before/after changed lines should be
           shown. Defaults to ``3``.
         """
+        return ''.join(self.iter_diff(rev1, rev2, path=path,
+                                      ignore_whitespace=ignore_whitespace,
+                                      context=context))
+
+    def iter_diff(self, rev1, rev2, path='', ignore_whitespace=False,
+                  context=3):
+        """
+        Returns generator of chunks of *diff* produced by mercurial, see
+        ``get_diff``.
+        """
         if hasattr(rev1, 'raw_id'):
             rev1 = getattr(rev1, 'raw_id')
 
@@ -262,10 +272,10 @@ class MercurialRepository(BaseRepository):
         else:
             file_filter = None
 
-        return ''.join(patch.diff(self._repo, rev1, rev2, match=file_filter,
+        return patch.diff(self._repo, rev1, rev2, match=file_filter,
                           opts=diffopts(git=True,
                                         ignorews=ignore_whitespace,
-                                        context=context)))
+                                        context=context))
 
     @classmethod
     def _check_url(cls, url, repoui=None):
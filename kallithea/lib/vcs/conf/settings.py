@@ -23,6 +23,10 @@ DEFAULT_ENCODINGS = aslist('utf8')
 GIT_EXECUTABLE_PATH = 'git'
 # can be also --branches --tags
 GIT_REV_FILTER = '--all'
+# keep persistent commit graph file in git repositories
+GIT_COMMIT_GRAPH_CACHE = False
+# number of files and directories of mercurial manifests kept indexed
+HG_MANIFEST_INDEX_CACHE_SIZE = 100000
 
 BACKENDS = {
     'hg': 'kallithea.lib.vcs.backends.hg.MercurialRepository',
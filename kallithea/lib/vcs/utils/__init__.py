@@ -3,6 +3,8 @@ This module provides some useful tools for ``vcs`` like annotate/diff html
 output. It also includes some internal helpers.
 """
 
+import os
+import sys
 import time
 import datetime
 
@@ -188,3 +190,19 @@ def author_name(author):
         return author
     return author.replace(author_email(author), '').replace('<', '')\
         .replace('>', '').strip()
+
+
+def replace_file(src, dst):
+    """
+    Renames file ``src`` to ``dst``, atomically replacing ``dst`` if it
+    exists. ``os.rename`` can't replace existing files on Windows.
+    """
+    if sys.platform != 'win32':
+        os.rename(src, dst)
+        return
+    import ctypes
+    MOVEFILE_REPLACE_EXISTING = 0x1
+    MOVEFILE_WRITE_THROUGH = 0x8
+    if not ctypes.windll.kernel32.MoveFileExW(unicode(src), unicode(dst),
+            MOVEFILE_REPLACE_EXISTING | MOVEFILE_WRITE_THROUGH):
+        raise ctypes.WinError()
@@ -5,63 +5,437 @@
 
     set of archiver functions for creating archives from repository content
 
+    Archives are written directly from the object store of the repository to
+    the given stream. Deflate compression of ``tgz`` and ``zip`` archives is
+    done in independent blocks, optionally in several threads, and the
+    compressed content of files is cached by file id, so files which didn't
+    change are not compressed again for archives of later revisions.
+
     :created_on: Jan 21, 2011
     :copyright: (c) 2010-2011 by Marcin Kuzminski, Lukasz Balcerzak.
 """
 
+import bz2
+import time
+import inspect
+import zlib
+import struct
+import tarfile
+import zipfile
+import collections
+from multiprocessing.pool import ThreadPool
+
+from kallithea.lib.vcs.utils.lrucache import LRUCache
+
+# uncompressed size of blocks compressed together
+BLOCK_SIZE = 256 * 1024
+# content of smaller files is compressed together with its neighbours,
+# bigger files are compressed and cached one by one
+MIN_MEMBER_SIZE = 16 * 1024
+MAX_MEMBER_SIZE = 4 * 1024 * 1024
+# bytes of compressed file content kept in memory
+MEMBER_CACHE_SIZE = 128 * 1024 * 1024
+
+# (crc, uncompressed length, compressed data, file size) by
+# (kind, file id, compression level)
+_members = LRUCache(MEMBER_CACHE_SIZE, sizeof=lambda m: len(m[2]) + 100)
+
+_ZEROS = '\0' * 65536
+
+# ZipInfo.FileHeader only takes the zip64 flag since Python 2.7.4, before
+# it decides by the sizes alone
+_FILE_HEADER_ZIP64 = \
+    'zip64' in inspect.getargspec(zipfile.ZipInfo.FileHeader)[0]
+
+
+def _deflate(data, level, finish=False):
+    """
+    Returns raw deflate data of ``data``. Unless ``finish`` is set the data
+    ends on a byte boundary without a final block, so it can be followed by
+    other compressed data.
+    """
+    c = zlib.compressobj(level, zlib.DEFLATED, -zlib.MAX_WBITS)
+    return c.compress(data) + c.flush(zlib.Z_FINISH if finish
+                                      else zlib.Z_SYNC_FLUSH)
+
+
+def _crc32_zeros(crc, length):
+    while length > 0:
+        n = min(length, len(_ZEROS))
+        crc = zlib.crc32(buffer(_ZEROS, 0, n), crc)
+        length -= n
+    return crc & 0xffffffff
+
+
+def crc32_combine(crc1, crc2, length2):
+    """
+    Returns CRC-32 of concatenated data from CRC-32 ``crc1`` of the first
+    part and ``crc2`` of the second part of ``length2`` bytes.
+    """
+    # crc is linear: continuing crc1 over the second part is the same as
+    # continuing it over zeros and adding crc2, minus the crc of the zeros
+    return (crc2 ^ _crc32_zeros(crc1, length2) ^ _crc32_zeros(0, length2)) \
+        & 0xffffffff
+
+
+class _Result(object):
+    """
+    Already computed result in place of an ``AsyncResult``.
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class _OrderedJobs(object):
+    """
+    Runs jobs in ``threads`` threads and passes their results to the
+    callbacks in order of adding them. Only a few jobs are queued, so there
+    is not much more data in memory than can be processed at once.
+    """
+
+    def __init__(self, threads):
+        self._pool = ThreadPool(threads) if threads > 1 else None
+        self._max_pending = threads * 2
+        self._pending = collections.deque()
+
+    def add(self, callback, func, *args):
+        if self._pool is None:
+            callback(func(*args))
+            return
+        self._pending.append((callback, self._pool.apply_async(func, args)))
+        self._write(self._max_pending)
+
+    def add_result(self, callback, value):
+        if self._pool is None:
+            callback(value)
+            return
+        self._pending.append((callback, _Result(value)))
+        self._write(self._max_pending)
+
+    def _write(self, max_pending):
+        while len(self._pending) > max_pending:
+            callback, result = self._pending.popleft()
+            callback(result.get())
+
+    def close(self):
+        self._write(0)
+        self.terminate()
+
+    def terminate(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool = None
+
 
 class BaseArchiver(object):
+    """
+    Writes archive of the given files to ``stream``.
+    """
 
-    def __init__(self):
-        self.archive_file = self._get_archive_file()
+    def __init__(self, stream, mtime, compression_level=9,
+                 compression_threads=1):
+        self.stream = stream
+        self.mtime = mtime
+        self.compression_level = compression_level
+        self._jobs = _OrderedJobs(compression_threads)
 
-    def addfile(self):
+    def addfile(self, name, mode, islink, file_id, getdata):
         """
-        Adds a file to archive container
+        Adds a file to archive container. ``getdata`` returns content of the
+        file, or target of the link, it might not be called if the content
+        is cached by ``file_id``.
         """
-        pass
+        raise NotImplementedError()
 
     def close(self):
         """
         Closes and finalizes operation of archive container object
         """
-        self.archive_file.close()
+        self._jobs.close()
+
+
+class TarArchiver(BaseArchiver):
+
+    def __init__(self, *args, **kwargs):
+        super(TarArchiver, self).__init__(*args, **kwargs)
+        self._offset = 0
+
+    def _tarinfo(self, name, mode, islink):
+        info = tarfile.TarInfo(name)
+        info.mtime = self.mtime
+        if islink:
+            info.type = tarfile.SYMTYPE
+            info.mode = 0777
+        else:
+            info.mode = mode
+        return info
+
+    def _header(self, info):
+        return info.tobuf(tarfile.GNU_FORMAT)
+
+    def addfile(self, name, mode, islink, file_id, getdata):
+        info = self._tarinfo(name, mode, islink)
+        data = getdata()
+        if islink:
+            info.linkname = data
+            data = ''
+        else:
+            info.size = len(data)
+        self._write(self._header(info) + data + _padding(len(data)))
+
+    def _write(self, data):
+        self._offset += len(data)
+        self.stream.write(data)
 
-    def _get_archive_file(self):
+    def _end(self):
+        # end of archive marker, padded to full records like tarfile does
+        end = '\0' * (tarfile.BLOCKSIZE * 2)
+        rest = (self._offset + len(end)) % tarfile.RECORDSIZE
+        if rest:
+            end += '\0' * (tarfile.RECORDSIZE - rest)
+        return end
+
+    def close(self):
+        self._write(self._end())
+        super(TarArchiver, self).close()
+
+
+def _padding(size):
+    rest = size % tarfile.BLOCKSIZE
+    return '\0' * (tarfile.BLOCKSIZE - rest) if rest else ''
+
+
+class Tbz2Archiver(TarArchiver):
+
+    def __init__(self, *args, **kwargs):
+        super(Tbz2Archiver, self).__init__(*args, **kwargs)
+        self._compressor = bz2.BZ2Compressor(self.compression_level)
+
+    def _write(self, data):
+        self._offset += len(data)
+        self.stream.write(self._compressor.compress(data))
+
+    def close(self):
+        super(Tbz2Archiver, self).close()
+        self.stream.write(self._compressor.flush())
+
+
+class TgzArchiver(TarArchiver):
+    """
+    Writes a gzip file with a single deflate stream made of independently
+    compressed blocks.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(TgzArchiver, self).__init__(*args, **kwargs)
+        self._crc = 0
+        self._size = 0
+        self._block = []
+        self._block_size = 0
+        xfl = {9: 2, 1: 4}.get(self.compression_level, 0)
+        self.stream.write('\037\213\010\000' + struct.pack('<L', self.mtime)
+                          + chr(xfl) + '\377')
+
+    def addfile(self, name, mode, islink, file_id, getdata):
+        if islink:
+            return super(TgzArchiver, self).addfile(name, mode, islink,
+                                                    file_id, getdata)
+        info = self._tarinfo(name, mode, islink)
+        key = ('tgz', file_id, self.compression_level)
+        member = _members.get(key) if file_id is not None else None
+        if member is not None:
+            crc, length, compressed, info.size = member
+            self._write(self._header(info))
+            self._flush()
+            self._add_compressed(crc, length, compressed)
+            return
+
+        data = getdata()
+        info.size = len(data)
+        self._write(self._header(info))
+        data += _padding(len(data))
+        if file_id is None or not MIN_MEMBER_SIZE <= len(data) <= MAX_MEMBER_SIZE:
+            for i in xrange(0, len(data), BLOCK_SIZE):
+                self._write(data[i:i + BLOCK_SIZE])
+            return
+        self._flush()
+        crc = zlib.crc32(data) & 0xffffffff
+        self._add_data(data, crc)
+
+        def compress(data):
+            compressed = _deflate(data, self.compression_level)
+            _members[key] = crc, len(data), compressed, info.size
+            return compressed
+        self._jobs.add(self.stream.write, compress, data)
+
+    def _add_data(self, data, crc):
+        self._crc = crc32_combine(self._crc, crc, len(data))
+        self._offset += len(data)
+        self._size += len(data)
+
+    def _add_compressed(self, crc, length, compressed):
+        self._crc = crc32_combine(self._crc, crc, length)
+        self._offset += length
+        self._size += length
+        self._jobs.add_result(self.stream.write, compressed)
+
+    def _write(self, data):
+        self._offset += len(data)
+        self._block.append(data)
+        self._block_size += len(data)
+        if self._block_size >= BLOCK_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if not self._block:
+            return
+        data = ''.join(self._block)
+        self._block = []
+        self._block_size = 0
+        self._crc = zlib.crc32(data, self._crc) & 0xffffffff
+        self._size += len(data)
+        self._jobs.add(self.stream.write, _deflate, data,
+                       self.compression_level)
+
+    def close(self):
+        self._write(self._end())
+        self._flush()
+        BaseArchiver.close(self)
+        # empty final block
+        self.stream.write(_deflate('', self.compression_level, finish=True))
+        self.stream.write(struct.pack('<LL', self._crc,
+                                      self._size & 0xffffffff))
+
+
+class _Tellable(object):
+    """
+    Stream which counts written bytes for ``zipfile``.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.offset = 0
+
+    def write(self, data):
+        self.offset += len(data)
+        self.stream.write(data)
+
+    def tell(self):
+        return self.offset
+
+    def flush(self):
+        pass
+
+
+class _ZipFile(zipfile.ZipFile):
+
+    def writecompressed(self, zinfo, crc, size, compressed):
         """
-        Returns container for specific archive
+        Like ``writestr`` but with already deflated content.
         """
-        raise NotImplementedError()
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        zinfo.file_size = size
+        zinfo.compress_size = len(compressed)
+        zinfo.CRC = crc
+        zinfo.header_offset = self.fp.tell()
+        self._writecheck(zinfo)
+        self._didModify = True
+        zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or \
+                zinfo.compress_size > zipfile.ZIP64_LIMIT
+        if _FILE_HEADER_ZIP64:
+            self.fp.write(zinfo.FileHeader(zip64))
+        else:
+            self.fp.write(zinfo.FileHeader())
+        self.fp.write(compressed)
+        self.filelist.append(zinfo)
+        self.NameToInfo[zinfo.filename] = zinfo
 
 
-class TarArchiver(BaseArchiver):
-    pass
+class ZipArchiver(BaseArchiver):
 
+    def __init__(self, *args, **kwargs):
+        super(ZipArchiver, self).__init__(*args, **kwargs)
+        self._zip = _ZipFile(_Tellable(self.stream), 'w', zipfile.ZIP_DEFLATED,
+                             allowZip64=True)
+        # zip dates can't be before 1980
+        epoch = 315532800 # calendar.timegm((1980, 1, 1, 0, 0, 0, 1, 1, 0))
+        self._date_time = time.gmtime(max(self.mtime, epoch))[:6]
 
-class Tbz2Archiver(BaseArchiver):
-    pass
+    def addfile(self, name, mode, islink, file_id, getdata):
+        zinfo = zipfile.ZipInfo(name, self._date_time)
+        zinfo.create_system = 3 # unix
+        if islink:
+            zinfo.external_attr = (0777 | 0120000) << 16L
+        else:
+            zinfo.external_attr = (mode | 0100000) << 16L
 
+        def write(member):
+            crc, size, compressed = member
+            self._zip.writecompressed(zinfo, crc, size, compressed)
 
-class TgzArchiver(BaseArchiver):
-    pass
+        key = ('zip', file_id, self.compression_level)
+        member = _members.get(key) if file_id is not None else None
+        if member is not None:
+            self._jobs.add_result(write, member)
+            return
 
+        data = getdata()
+        cache = file_id is not None and len(data) <= MAX_MEMBER_SIZE
 
-class ZipArchiver(BaseArchiver):
-    pass
+        def compress(data):
+            member = (zlib.crc32(data) & 0xffffffff, len(data),
+                      _deflate(data, self.compression_level, finish=True))
+            if cache:
+                _members[key] = member
+            return member
+        self._jobs.add(write, compress, data)
 
+    def close(self):
+        super(ZipArchiver, self).close()
+        self._zip.close()
 
-def get_archiver(self, kind):
+
+ARCHIVERS = {
+    'tar': TarArchiver,
+    'tbz2': Tbz2Archiver,
+    'tgz': TgzArchiver,
+    'zip': ZipArchiver,
+}
+
+
+def get_archiver(kind, stream, mtime, compression_level=None,
+                 compression_threads=None):
     """
     Returns instance of archiver class specific to given kind
 
     :param kind: archive kind
+    :param stream: file like object the archive is written to
+    :param mtime: modification time of the archived files
+    :param compression_level: 1 (fastest) to 9 (best), default 9
+    :param compression_threads: number of threads compressing ``tgz`` and
+        ``zip`` archives, default 1
     """
+    return ARCHIVERS[kind](stream, int(mtime), compression_level or 9,
+                           compression_threads or 1)
 
-    archivers = {
-        'tar': TarArchiver,
-        'tbz2': Tbz2Archiver,
-        'tgz': TgzArchiver,
-        'zip': ZipArchiver,
-    }
 
-    return archivers[kind]()
+def write_archive(stream, kind, prefix, mtime, entries,
+                  compression_level=None, compression_threads=None):
+    """
+    Writes archive of ``entries`` to ``stream``. Entries are tuples of path,
+    mode, is link flag, file id or None and callable returning content of
+    the file.
+    """
+    archiver = get_archiver(kind, stream, mtime, compression_level,
+                            compression_threads)
+    try:
+        for path, mode, islink, file_id, getdata in entries:
+            archiver.addfile('%s/%s' % (prefix, path), mode, islink, file_id,
+                             getdata)
+        archiver.close()
+    finally:
+        archiver._jobs.terminate()
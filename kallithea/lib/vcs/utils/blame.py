@@ -0,0 +1,121 @@
+"""
+Annotation of files, computed incrementally where possible.
+
+Backends provide ``_annotate`` on their changesets, which computes the
+changesets that last changed each line of a file from scratch, and
+``_line_changes``, which diffs a file with its version in another changeset
+like ``_annotate`` does. Annotations are cached by path and annotation id,
+which changes whenever the history of the file does. A file
+which hasn't been annotated yet gets the annotation of the file in its parent
+changesets if these are cached: lines that the diff to a parent doesn't touch
+keep their changeset, all other lines belong to the new changeset.
+"""
+from kallithea.lib.vcs.exceptions import VCSError
+from kallithea.lib.vcs.utils import safe_str
+from kallithea.lib.vcs.utils.lrucache import LRUCache
+
+# number of lines of kept annotations
+ANNOTATION_CACHE_SIZE = 1000000
+
+_annotations = LRUCache(ANNOTATION_CACHE_SIZE, sizeof=lambda a: len(a) + 1)
+
+
+def split_lines(content):
+    """
+    Returns lines of ``content`` including their line breaks, like the
+    backends count them.
+    """
+    lines = content.split('\n')
+    last = lines.pop()
+    lines = [line + '\n' for line in lines]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _get_key(changeset, path):
+    return changeset.repository.path, path, changeset._annotation_id(path)
+
+
+def _annotate_from_parents(changeset, path, lines):
+    """
+    Returns annotation of ``lines`` of the file at ``path`` derived from the
+    cached annotations of the file in the parents of ``changeset``, or None.
+    """
+    result = [None] * len(lines)
+    found = False
+    parents = changeset._annotate_parents()
+    for parent in parents:
+        try:
+            key = _get_key(parent, path)
+        except VCSError:
+            # not in this parent
+            continue
+        annotation = _annotations.get(key)
+        if annotation is None:
+            return None
+        if len(parents) == 1 and \
+                parent.get_file_id(path) == changeset.get_file_id(path):
+            # unchanged, the same annotation is shared
+            return annotation
+        changes = changeset._line_changes(parent, path)
+        if changes is None:
+            return None
+        found = True
+        # unchanged lines are between the changed ones
+        a = b = 0
+        for a1, a2, b1, b2 in changes + [(len(annotation), None,
+                                          len(lines), None)]:
+            if a1 - a != b1 - b:
+                return None
+            for i in xrange(b1 - b):
+                if result[b + i] is None:
+                    result[b + i] = annotation[a + i]
+            a, b = a2, b2
+    if not found and changeset.parents:
+        # the file might have been copied or renamed, which only the backend
+        # knows about
+        return None
+    raw_id = changeset.raw_id
+    return tuple(r or raw_id for r in result)
+
+
+def get_annotation(changeset, path, lines=None):
+    """
+    Returns tuple of raw ids of the changesets which last changed each line
+    of the file at ``path`` in ``changeset``.
+    """
+    path = safe_str(path)
+    key = _get_key(changeset, path)
+    annotation = _annotations.get(key)
+    if annotation is None:
+        if lines is None:
+            lines = split_lines(changeset.get_file_content(path))
+        annotation = _annotate_from_parents(changeset, path, lines)
+        if annotation is None:
+            # one string per changeset, not per line
+            annotation = tuple(map(intern, changeset._annotate(path)))
+        _annotations[key] = annotation
+    return annotation
+
+
+def iter_annotation(changeset, path):
+    """
+    Returns iterator of lineno, raw id, changeset loader and line tuples for
+    the lines of the file at ``path`` in ``changeset``. Each changeset is
+    loaded once.
+    """
+    repository = changeset.repository
+    lines = split_lines(changeset.get_file_content(path))
+    annotation = get_annotation(changeset, path, lines)
+    changesets = {}
+
+    def get_changeset(raw_id):
+        cs = changesets.get(raw_id)
+        if cs is None:
+            cs = changesets[raw_id] = repository.get_changeset(raw_id)
+        return cs
+
+    for i, (raw_id, line) in enumerate(zip(annotation, lines)):
+        yield (i + 1, raw_id, lambda raw_id=raw_id: get_changeset(raw_id),
+               line)
@@ -7,6 +7,7 @@ import mercurial.demandimport
 ## patch demandimport, due to bug in mercurial when it always triggers demandimport.enable()
 mercurial.demandimport.enable = lambda *args, **kwargs: 1
 from mercurial import archival, merge as hg_merge, patch, ui
+from mercurial import bdiff
 from mercurial import discovery
 from mercurial import localrepo
 from mercurial import unionrepo
@@ -21,7 +22,8 @@ from mercurial.localrepo import localrepository
 from mercurial.match import match
 from mercurial.mdiff import diffopts
 from mercurial.node import hex
-from mercurial.encoding import tolocal
+from mercurial.encoding import tolocal, fromlocal
+from mercurial.templatekw import getlatesttags
 from mercurial.discovery import findcommonoutgoing
 from mercurial.hg import peer
 from mercurial.httppeer import httppeer
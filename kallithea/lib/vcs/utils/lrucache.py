@@ -0,0 +1,100 @@
+"""
+Thread safe, size bounded least recently used cache.
+"""
+import threading
+
+from kallithea.lib.vcs.utils.ordered_dict import OrderedDict
+
+_missing = object()
+
+
+class LRUCache(object):
+    """
+    Mapping which keeps at most ``max_size`` worth of the most recently used
+    entries. By default every entry counts as 1, pass ``sizeof`` callable to
+    bound the cache by some other measure (e.g. bytes).
+
+    Usage::
+
+      cache = LRUCache(100)
+      cache['key'] = 'value'
+      cache.get('key')
+    """
+
+    def __init__(self, max_size, sizeof=None):
+        self.max_size = max_size
+        self._sizeof = sizeof or (lambda value: 1)
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.RLock()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._data.pop(key, _missing)
+            if value is _missing:
+                self.misses += 1
+                return default
+            # move to the most recently used end
+            self._data[key] = value
+            self.hits += 1
+            return value
+
+    def __getitem__(self, key):
+        value = self.get(key, _missing)
+        if value is _missing:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            self.pop(key)
+            if size > self.max_size:
+                return
+            self._data[key] = value
+            self._sizes[key] = size
+            self.size += size
+            while self.size > self.max_size:
+                oldest = iter(self._data).next()
+                self.pop(oldest)
+                self.evictions += 1
+
+    def pop(self, key, default=None):
+        with self._lock:
+            value = self._data.pop(key, _missing)
+            if value is _missing:
+                return default
+            self.size -= self._sizes.pop(key)
+            return value
+
+    def keys(self):
+        with self._lock:
+            return self._data.keys()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.size = 0
+
+    def get_stats(self):
+        """
+        Returns dict with hits, misses, evictions and current size
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'entries': len(self._data),
+            'size': self.size,
+        }
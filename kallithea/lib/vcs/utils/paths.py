@@ -18,6 +18,46 @@ def get_dirs_for_path(*paths):
                 break
 
 
+class PathIndex(object):
+    """
+    Index of the files of a tree by directory, so directories can be listed
+    and paths looked up without scanning all files of the tree.
+
+    ``files`` maps paths of files to the value given for them, ``dirs`` maps
+    paths of directories, '' being the root, to a tuple of lists of paths of
+    their subdirectories and files.
+
+    Usage::
+
+      index = PathIndex((path, None) for path in paths)
+      index.dirs['docs']
+      'docs/index.rst' in index.files
+    """
+
+    def __init__(self, entries):
+        self.files = {}
+        self.dirs = {'': ([], [])}
+        for path, value in entries:
+            self.files[path] = value
+            parent = path.rpartition('/')[0]
+            entry = self.dirs.get(parent)
+            if entry is None:
+                entry = self._add_dir(parent)
+            entry[1].append(path)
+
+    def _add_dir(self, path):
+        entry = self.dirs[path] = ([], [])
+        parent = path.rpartition('/')[0]
+        parent_entry = self.dirs.get(parent)
+        if parent_entry is None:
+            parent_entry = self._add_dir(parent)
+        parent_entry[0].append(path)
+        return entry
+
+    def __len__(self):
+        return len(self.files) + len(self.dirs)
+
+
 def get_dir_size(path):
     root_path = path
     size = 0
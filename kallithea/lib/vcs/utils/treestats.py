@@ -0,0 +1,105 @@
+"""
+Statistics of files in a changeset tree computed from raw tree entries.
+
+Backends provide ``_tree_entries``, ``_tree_changes``, ``_first_parent_ids``
+and ``_blob_info`` on their changesets. Information about blobs is cached
+by blob id, so the content of every blob is read only once. Statistics of
+a changeset are derived from cached statistics of a recent first parent
+ancestor and the tree diff between them.
+"""
+from kallithea.lib.vcs.utils import safe_unicode
+from kallithea.lib.vcs.utils.lrucache import LRUCache
+
+# number of (size, is_binary) tuples kept for blobs
+BLOB_CACHE_SIZE = 200000
+# number of kept changeset statistics
+TREE_STATS_CACHE_SIZE = 64
+# how many first parent ancestors are looked at for cached statistics
+MAX_ANCESTOR_DISTANCE = 100
+
+_blobs = LRUCache(BLOB_CACHE_SIZE)
+_tree_stats = LRUCache(TREE_STATS_CACHE_SIZE)
+
+
+class TreeStats(object):
+    """
+    Number and total size of files and number of non binary files by
+    extension.
+    """
+
+    def __init__(self):
+        self.files = 0
+        self.size = 0
+        self.extensions = {}
+
+    def copy(self):
+        stats = TreeStats()
+        stats.files = self.files
+        stats.size = self.size
+        stats.extensions = dict(self.extensions)
+        return stats
+
+    @staticmethod
+    def _extension(path):
+        # same as FileNode.extension
+        return safe_unicode(path.rsplit('/', 1)[-1].split('.')[-1]).lower()
+
+    def add(self, path, size, is_binary):
+        self.files += 1
+        self.size += size
+        if not is_binary:
+            ext = self._extension(path)
+            self.extensions[ext] = self.extensions.get(ext, 0) + 1
+
+    def remove(self, path, size, is_binary):
+        self.files -= 1
+        self.size -= size
+        if not is_binary:
+            ext = self._extension(path)
+            count = self.extensions[ext] - 1
+            if count:
+                self.extensions[ext] = count
+            else:
+                del self.extensions[ext]
+
+
+def get_blob_info(changeset, path, blob_id):
+    """
+    Returns size and whether the blob ``blob_id`` of the file at ``path`` in
+    ``changeset`` is binary.
+    """
+    info = _blobs.get(blob_id)
+    if info is None:
+        info = _blobs[blob_id] = changeset._blob_info(path, blob_id)
+    return info
+
+
+def get_tree_stats(changeset):
+    """
+    Returns ``TreeStats`` of all files in ``changeset``.
+    """
+    path = changeset.repository.path
+    stats = _tree_stats.get((path, changeset.raw_id))
+    if stats is not None:
+        return stats
+
+    base_stats = None
+    # ancestors are looked up by id, only the found one is instantiated
+    for raw_id in changeset._first_parent_ids(MAX_ANCESTOR_DISTANCE):
+        base_stats = _tree_stats.get((path, raw_id))
+        if base_stats is not None:
+            base = changeset.repository.get_changeset(raw_id)
+            break
+    if base_stats is not None:
+        stats = base_stats.copy()
+        for old, new in changeset._tree_changes(base):
+            if old is not None:
+                stats.remove(old[0], *get_blob_info(changeset, *old))
+            if new is not None:
+                stats.add(new[0], *get_blob_info(changeset, *new))
+    else:
+        stats = TreeStats()
+        for entry in changeset._tree_entries():
+            stats.add(entry[0], *get_blob_info(changeset, *entry))
+    _tree_stats[(path, changeset.raw_id)] = stats
+    return stats
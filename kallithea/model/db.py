@@ -33,11 +33,14 @@ import traceback
 import hashlib
 import collections
 import functools
+import itertools
 
 from sqlalchemy import *
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy import event
 from sqlalchemy.orm import relationship, joinedload, class_mapper, validates
-from beaker.cache import cache_region, region_invalidate
+from sqlalchemy.orm.attributes import get_history
 from webob.exc import HTTPNotFound
 
 from pylons.i18n.translation import lazy_ugettext as _
@@ -53,9 +56,10 @@ from kallithea.lib.utils2 import str2bool, safe_str, get_changeset_safe, \
     safe_unicode, remove_prefix, time_to_datetime, aslist, Optional, safe_int, \
     get_clone_url, urlreadable
 from kallithea.lib.compat import json
+from kallithea.lib import scm_pool
 from kallithea.lib.caching_query import FromCache
 
-from kallithea.model.meta import Base, Session
+from kallithea.model.meta import Base, Session, session_factory
 
 URL_SEP = '/'
 log = logging.getLogger(__name__)
@@ -627,9 +631,13 @@ class User(Base, BaseModel):
             raise Exception('Missing default account!')
         return user
 
-    def get_api_data(self, details=False):
+    def get_api_data(self, details=False, emails=None, api_keys=None,
+                     ip_addresses=None):
         """
         Common function for generating user related data for API
+
+        :param emails: additional emails, api keys and ip addresses of the
+            user, if already loaded for many users at once
         """
         user = self
         data = dict(
@@ -638,7 +646,7 @@ class User(Base, BaseModel):
             firstname=user.name,
             lastname=user.lastname,
             email=user.email,
-            emails=user.emails,
+            emails=user.emails if emails is None else [user.email] + emails,
             active=user.active,
             admin=user.admin,
         )
@@ -647,9 +655,11 @@ class User(Base, BaseModel):
                 extern_type=user.extern_type,
                 extern_name=user.extern_name,
                 api_key=user.api_key,
-                api_keys=user.api_keys,
+                api_keys=user.api_keys if api_keys is None
+                    else [user.api_key] + api_keys,
                 last_login=user.last_login,
-                ip_addresses=user.ip_addresses
+                ip_addresses=user.ip_addresses if ip_addresses is None
+                    else ip_addresses
                 ))
         return data
 
@@ -1148,14 +1158,11 @@ class Repository(Base, BaseModel):
         return os.path.join(*map(safe_unicode, p))
 
     @property
-    def cache_keys(self):
+    def cache_generation(self):
         """
-        Returns associated cache keys for that repo
+        Returns current generation of caches of that repo
         """
-        return CacheInvalidation.query()\
-            .filter(CacheInvalidation.cache_args == self.repo_name)\
-            .order_by(CacheInvalidation.cache_key)\
-            .all()
+        return CacheInvalidation.get_generation(self.repo_name)
 
     def get_new_name(self, repo_name):
         """
@@ -1186,10 +1193,14 @@ class Repository(Base, BaseModel):
 
         return is_valid_repo(repo_name, cls.base_path())
 
-    def get_api_data(self):
+    def get_api_data(self, repository_fields=None, lock_users=None):
         """
         Common function for generating repo api data
 
+        :param repository_fields: if extra fields should be included, read
+            from settings if not given
+        :param lock_users: dict of api data of users by user_id which
+            includes the user that locked the repo, loaded if not given
         """
         repo = self
         data = dict(
@@ -1207,13 +1218,18 @@ class Repository(Base, BaseModel):
             enable_locking=repo.enable_locking,
             enable_downloads=repo.enable_downloads,
             last_changeset=repo.changeset_cache,
-            locked_by=User.get(self.locked[0]).get_api_data() \
-                if self.locked[0] else None,
+            locked_by=None,
             locked_date=time_to_datetime(self.locked[1]) \
                 if self.locked[1] else None
         )
-        rc_config = Setting.get_app_settings()
-        repository_fields = str2bool(rc_config.get('repository_fields'))
+        if self.locked[0]:
+            if lock_users is not None:
+                data['locked_by'] = lock_users.get(self.locked[0])
+            else:
+                data['locked_by'] = User.get(self.locked[0]).get_api_data()
+        if repository_fields is None:
+            rc_config = Setting.get_app_settings()
+            repository_fields = str2bool(rc_config.get('repository_fields'))
         if repository_fields:
             for f in self.extra_fields:
                 data[f.field_key_prefixed] = f.field_value
@@ -1418,19 +1434,11 @@ class Repository(Base, BaseModel):
             return self.scm_instance_cached()
         return self.__get_instance()
 
-    def scm_instance_cached(self, valid_cache_keys=None):
-        @cache_region('long_term')
-        def _c(repo_name):
-            return self.__get_instance()
-        rn = self.repo_name
-
-        valid = CacheInvalidation.test_and_set_valid(rn, None, valid_cache_keys=valid_cache_keys)
-        if not valid:
-            log.debug('Cache for %s invalidated, getting new object' % (rn))
-            region_invalidate(_c, None, rn)
-        else:
-            log.debug('Getting scm_instance of %s from cache' % (rn))
-        return _c(rn)
+    def scm_instance_cached(self, generations=None):
+        generation = CacheInvalidation.get_generation(self.repo_name,
+                                                      generations)
+        return scm_pool.get_pool().get(self.repo_full_path, generation,
+                                       self.__get_instance)
 
     def __get_instance(self):
         repo_full_path = self.repo_full_path
@@ -1742,11 +1750,13 @@ class Permission(Base, BaseModel):
         return cls.query().filter(cls.permission_name == key).scalar()
 
     @classmethod
-    def get_default_perms(cls, default_user_id):
+    def get_default_perms(cls, default_user_id, repo_name=None):
         q = Session().query(UserRepoToPerm, Repository, cls)\
          .join((Repository, UserRepoToPerm.repository_id == Repository.repo_id))\
          .join((cls, UserRepoToPerm.permission_id == cls.permission_id))\
          .filter(UserRepoToPerm.user_id == default_user_id)
+        if repo_name is not None:
+            q = q.filter(Repository.repo_name == repo_name)
 
         return q.all()
 
@@ -2016,6 +2026,15 @@ class UserFollowing(Base, BaseModel):
 
 
 class CacheInvalidation(Base, BaseModel):
+    """
+    Generation counters of repository caches.
+
+    Every repository has (at most) one row and its ``cache_generation`` is
+    the current generation of all caches of that repository. Invalidation
+    increments it in place, so it only grows. Caches embed the generation in
+    their keys and never have to write to the database to find out they are
+    still valid.
+    """
     __tablename__ = 'cache_invalidation'
     __table_args__ = (
         UniqueConstraint('cache_key'),
@@ -2025,115 +2044,177 @@ class CacheInvalidation(Base, BaseModel):
     )
     # cache_id, not used
     cache_id = Column(Integer(), nullable=False, unique=True, primary_key=True)
-    # cache_key as created by _get_cache_key
+    # cache_key is a repo_name
     cache_key = Column(String(255, convert_unicode=False))
     # cache_args is a repo_name
     cache_args = Column(String(255, convert_unicode=False))
-    # instance sets cache_active True when it is caching, other instances set
-    # cache_active to False to indicate that this cache is invalid
+    # not used
     cache_active = Column(Boolean(), nullable=True, unique=None, default=False)
+    # generation of caches of the repo
+    cache_generation = Column(Integer(), nullable=False, default=1)
+
+    # process wide snapshot of generations as (time loaded, {repo_name: generation})
+    _generations = (0, {})
 
     def __init__(self, cache_key, repo_name=''):
         self.cache_key = cache_key
         self.cache_args = repo_name
-        self.cache_active = False
+        self.cache_active = True
+        self.cache_generation = 1
 
     def __unicode__(self):
-        return u"<%s('%s:%s[%s]')>" % (
+        return u"<%s('%s:%s')>" % (
             self.__class__.__name__,
-            self.cache_id, self.cache_key, self.cache_active)
-
-    def _cache_key_partition(self):
-        prefix, repo_name, suffix = self.cache_key.partition(self.cache_args)
-        return prefix, repo_name, suffix
-
-    def get_prefix(self):
-        """
-        get prefix that might have been used in _get_cache_key to
-        generate self.cache_key. Only used for informational purposes
-        in repo_edit.html.
-        """
-        # prefix, repo_name, suffix
-        return self._cache_key_partition()[0]
+            self.cache_generation, self.cache_args)
 
-    def get_suffix(self):
-        """
-        get suffix that might have been used in _get_cache_key to
-        generate self.cache_key. Only used for informational purposes
-        in repo_edit.html.
-        """
-        # prefix, repo_name, suffix
-        return self._cache_key_partition()[2]
+    @property
+    def generation(self):
+        return self.cache_generation
 
     @classmethod
     def clear_cache(cls):
         """
-        Delete all cache keys from database.
-        Should only be run when all instances are down and all entries thus stale.
+        Delete all cache keys from database. Generations stay monotonic:
+        keys without a row start from a base generation which is raised
+        above every deleted generation, so caches filled before can't be
+        served again.
+        Should only be run when all instances are down.
         """
+        top = Session().query(func.max(cls.cache_generation)).scalar() or 0
         cls.query().delete()
+        base = CacheInvalidation(cls.BASE_KEY, cls.BASE_KEY)
+        base.cache_generation = top + 1
+        Session().add(base)
         Session().commit()
+        cls._generations = (0, {})
 
     @classmethod
-    def _get_cache_key(cls, key):
+    def _get_refresh_interval(cls):
         """
-        Wrapper for generating a unique cache key for this instance and "key".
-        key must / will start with a repo_name which will be stored in .cache_args .
+        Number of seconds a snapshot of generations is used before it is
+        read from database again.
         """
         import kallithea
-        prefix = kallithea.CONFIG.get('instance_id', '')
-        return "%s%s" % (prefix, key)
+        return safe_int(kallithea.CONFIG.get('cache_generation_interval'),
+                        1000) / 1000.0
 
     @classmethod
-    def set_invalidate(cls, repo_name, delete=False):
+    def get_generations(cls):
         """
-        Mark all caches of a repo as invalid in the database.
+        Return dict with current cache generation of all repositories which
+        ever got invalidated. It is read from database at most once per
+        `cache_generation_interval` milliseconds.
         """
-        inv_objs = Session().query(cls).filter(cls.cache_args == repo_name).all()
-        log.debug('for repo %s got %s invalidation objects'
-                  % (safe_str(repo_name), inv_objs))
-
-        for inv_obj in inv_objs:
-            log.debug('marking %s key for invalidation based on repo_name=%s'
-                      % (inv_obj, safe_str(repo_name)))
-            if delete:
-                Session().delete(inv_obj)
-            else:
-                inv_obj.cache_active = False
-                Session().add(inv_obj)
-        Session().commit()
+        loaded, generations = cls._generations
+        now = time.time()
+        if now - loaded >= cls._get_refresh_interval():
+            generations = dict(Session().query(cls.cache_key,
+                                               cls.cache_generation).all())
+            cls._generations = (now, generations)
+        return generations
 
     @classmethod
-    def test_and_set_valid(cls, repo_name, kind, valid_cache_keys=None):
-        """
-        Mark this cache key as active and currently cached.
-        Return True if the existing cache registration still was valid.
-        Return False to indicate that it had been invalidated and caches should be refreshed.
+    def get_generation(cls, repo_name, generations=None):
         """
+        Return current cache generation of a repo, the base generation (0
+        until cache keys are cleaned up) if the repo never was invalidated.
 
-        key = (repo_name + '_' + kind) if kind else repo_name
-        cache_key = cls._get_cache_key(key)
-
-        if valid_cache_keys and cache_key in valid_cache_keys:
-            return True
-
-        inv_obj = cls.query().filter(cls.cache_key == cache_key).scalar()
-        if not inv_obj:
-            inv_obj = CacheInvalidation(cache_key, repo_name)
-        if inv_obj.cache_active:
-            return True
-        inv_obj.cache_active = True
-        Session().add(inv_obj)
-        Session().commit()
-        return False
+        :param generations: snapshot as returned by get_generations, saves
+            going to database when checking many repositories
+        """
+        if generations is None:
+            generations = cls.get_generations()
+        return generations.get(repo_name, generations.get(cls.BASE_KEY, 0))
 
     @classmethod
-    def get_valid_cache_keys(cls):
+    def set_invalidate(cls, repo_name):
         """
-        Return opaque object with information of which caches still are valid
-        and can be used without checking for invalidation.
+        Mark all caches of a repo as invalid by bumping its generation and
+        commit the current transaction.
         """
-        return set(inv_obj.cache_key for inv_obj in cls.query().filter(cls.cache_active).all())
+        session = Session()
+        generation = cls._bump_in_session(session, repo_name)
+        session.commit()
+        log.debug('caches of %s invalidated, new generation %s'
+                  % (safe_str(repo_name), generation))
+        loaded, generations = cls._generations
+        generations = dict(generations)
+        generations[repo_name] = generation
+        cls._generations = (loaded, generations)
+
+    #==========================================================================
+    # PERMISSION, UI AND AUTHENTICATION VERSIONS
+    #==========================================================================
+    # keys can't clash with repo names which never contain ':'
+    BASE_KEY = ':base'
+    PERMISSIONS_KEY = ':permissions'
+    USER_PERMISSIONS_KEY = ':permissions:%s'
+    UI_KEY = ':ui'
+    AUTH_SETTINGS_KEY = ':auth'
+    USER_AUTH_KEY = ':auth:%s'
+    IDENTITIES_KEY = ':identities'
+
+    @classmethod
+    def get_permissions_version(cls, user_id):
+        """
+        Return version of permissions of user, it changes whenever anything
+        the permissions of the user are computed from changes. Returns None
+        if the current transaction changed permissions, they must not be
+        cached before commit.
+
+        Unlike other generations, these are read from database on every
+        call, so revoked permissions are never used after the revoking
+        transaction committed.
+        """
+        session = Session()
+        # pending changes are checked without flushing them
+        if any(key.startswith(cls.PERMISSIONS_KEY)
+               for key in get_changed_keys(session) | _pending_keys(session)):
+            return None
+        keys = [cls.PERMISSIONS_KEY, cls.USER_PERMISSIONS_KEY % user_id,
+                cls.BASE_KEY]
+        generations = dict(session.query(cls.cache_key, cls.cache_generation)
+                           .filter(cls.cache_key.in_(keys)).all())
+        return tuple(cls.get_generation(key, generations)
+                     for key in keys[:2])
+
+    @classmethod
+    def _bump_in_session(cls, session, key):
+        """
+        Atomically bump generation of ``key`` as a part of the current
+        transaction of ``session`` and return the new generation. The row of
+        a key is created by its first bump. Used while flushing, so it can't
+        query through the ORM.
+        """
+        # the session has no bind of its own, the mapper leads to the engine
+        connection = session.connection(mapper=class_mapper(cls))
+        tbl = cls.__table__
+        bump = tbl.update().where(tbl.c.cache_key == key)\
+            .values(cache_generation=tbl.c.cache_generation + 1)
+        if not connection.execute(bump).rowcount:
+            base = connection.execute(
+                select([tbl.c.cache_generation])
+                .where(tbl.c.cache_key == cls.BASE_KEY)).scalar() or 0
+            create = tbl.insert().values(cache_key=key, cache_args=key,
+                                         cache_active=True,
+                                         cache_generation=base + 1)
+            if connection.dialect.name == 'sqlite':
+                # writers are serialized, and pysqlite would commit the
+                # transaction before a savepoint
+                connection.execute(create)
+            else:
+                savepoint = connection.begin_nested()
+                try:
+                    connection.execute(create)
+                except IntegrityError:
+                    # another transaction created the row meanwhile, the
+                    # bump waits for it
+                    savepoint.rollback()
+                    connection.execute(bump)
+                else:
+                    savepoint.commit()
+        return connection.execute(select([tbl.c.cache_generation])
+                                  .where(tbl.c.cache_key == key)).scalar()
 
 
 class ChangesetComment(Base, BaseModel):
@@ -2521,3 +2602,115 @@ class DbMigrateVersion(Base, BaseModel):
     repository_id = Column(String(250), primary_key=True)
     repository_path = Column(Text)
     version = Column(Integer)
+
+
+#==============================================================================
+# CACHE GENERATIONS TRACKING
+#==============================================================================
+
+# rows granting permissions to a single user
+_USER_PERMISSION_CLASSES = (UserToPerm, UserRepoToPerm, UserRepoGroupToPerm,
+                            UserUserGroupToPerm, UserGroupMember)
+# rows affecting permissions of many users
+_GLOBAL_PERMISSION_CLASSES = (Permission, UserGroupToPerm, UserGroupRepoToPerm,
+                              UserGroupRepoGroupToPerm, UserGroupUserGroupToPerm)
+# attributes permissions are computed from, changes of others don't matter
+_PERMISSION_ATTRIBUTES = {
+    User: ('admin', 'active', 'inherit_default_permissions'),
+    Repository: ('repo_name', 'private', 'user_id', 'user'),
+    RepoGroup: ('group_name',),
+    UserGroup: ('users_group_name', 'users_group_active',
+                'inherit_default_permissions'),
+}
+# attributes verification of credentials of a user depends on
+_AUTH_ATTRIBUTES = ('username', 'password', 'active', 'extern_type',
+                    'extern_name')
+# attributes changeset authors are resolved to users by
+_IDENTITY_ATTRIBUTES = ('username', '_email', 'name', 'lastname')
+
+
+def _has_changes(session, obj, attrs):
+    if obj not in session.dirty:
+        # new or deleted
+        return True
+    return any(get_history(obj, attr).has_changes() for attr in attrs)
+
+
+def _permission_key(user):
+    if user is None or user.username == User.DEFAULT_USER:
+        return CacheInvalidation.PERMISSIONS_KEY
+    if user.user_id is None:
+        # new user, no permissions could have been cached
+        return None
+    return CacheInvalidation.USER_PERMISSIONS_KEY % user.user_id
+
+
+def _pending_keys(session):
+    """
+    Returns set of keys of permissions, ui and authentication settings,
+    credentials and author identities affected by the objects waiting to be
+    flushed in ``session``.
+    """
+    keys = set()
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, User) and obj.user_id is not None and \
+                _has_changes(session, obj, _AUTH_ATTRIBUTES):
+            keys.add(CacheInvalidation.USER_AUTH_KEY % obj.user_id)
+        if isinstance(obj, UserEmailMap) or isinstance(obj, User) and \
+                _has_changes(session, obj, _IDENTITY_ATTRIBUTES):
+            keys.add(CacheInvalidation.IDENTITIES_KEY)
+        if isinstance(obj, _USER_PERMISSION_CLASSES):
+            keys.add(_permission_key(obj.user))
+        elif isinstance(obj, _GLOBAL_PERMISSION_CLASSES):
+            keys.add(CacheInvalidation.PERMISSIONS_KEY)
+        elif isinstance(obj, Ui):
+            keys.add(CacheInvalidation.UI_KEY)
+        elif isinstance(obj, Setting):
+            if (obj.app_settings_name or '').startswith('auth_'):
+                keys.add(CacheInvalidation.AUTH_SETTINGS_KEY)
+        elif type(obj) in _PERMISSION_ATTRIBUTES:
+            if not _has_changes(session, obj, _PERMISSION_ATTRIBUTES[type(obj)]):
+                continue
+            if isinstance(obj, User):
+                keys.add(_permission_key(obj))
+            else:
+                keys.add(CacheInvalidation.PERMISSIONS_KEY)
+    keys.discard(None)
+    return keys
+
+
+def _track_changes(session, flush_context, instances):
+    """
+    Bump generations of keys affected by the objects being flushed, in the
+    same transaction.
+    """
+    keys = _pending_keys(session)
+    for key in keys:
+        log.debug('generation of %s changed' % key)
+        CacheInvalidation._bump_in_session(session, key)
+    if keys:
+        session._changed_keys = get_changed_keys(session) | keys
+
+
+def get_changed_keys(session):
+    """
+    Returns set of keys with generations changed by the current transaction
+    of ``session``, caches must not be filled for them before commit.
+    """
+    return getattr(session, '_changed_keys', frozenset())
+
+
+def _reset_generations(session):
+    if get_changed_keys(session):
+        session._changed_keys = frozenset()
+        # make the new generations visible to this process right away
+        CacheInvalidation._generations = (0, {})
+
+
+def _forget_changes(session):
+    session._changed_keys = frozenset()
+
+
+event.listen(session_factory, 'before_flush', _track_changes)
+event.listen(session_factory, 'after_commit', _reset_generations)
+event.listen(session_factory, 'after_rollback', _forget_changes)
@@ -122,11 +122,12 @@ class RepoModel(BaseModel):
         """
         Gets all repositories that user have at least read access
 
-        :param user:
+        :param user: user, or AuthUser with permissions computed already
         """
         from kallithea.lib.auth import AuthUser
-        user = self._get_user(user)
-        repos = AuthUser(user_id=user.user_id).permissions['repositories']
+        if not isinstance(user, AuthUser):
+            user = AuthUser(user_id=self._get_user(user).user_id)
+        repos = user.permissions['repositories']
         access_check = lambda r: r[1] in ['repository.read',
                                           'repository.write',
                                           'repository.admin']
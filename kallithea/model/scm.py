@@ -29,6 +29,8 @@ from __future__ import with_statement
 import os
 import re
 import time
+import bisect
+import itertools
 import traceback
 import logging
 import cStringIO
@@ -40,7 +42,8 @@ from pylons.i18n.translation import _
 
 import kallithea
 from kallithea.lib.vcs import get_backend
-from kallithea.lib.vcs.exceptions import RepositoryError
+from kallithea.lib.vcs.exceptions import RepositoryError, ChangesetError, \
+    NodeDoesNotExistError
 from kallithea.lib.vcs.utils.lazy import LazyProperty
 from kallithea.lib.vcs.nodes import FileNode
 from kallithea.lib.vcs.backends.base import EmptyChangeset
@@ -100,12 +103,12 @@ class CachedRepoList(object):
         return '<%s (%s)>' % (self.__class__.__name__, self.__len__())
 
     def __iter__(self):
-        # pre-propagated valid_cache_keys to save executing select statements
+        # pre-propagated generations to save executing select statements
         # for each repo
-        valid_cache_keys = CacheInvalidation.get_valid_cache_keys()
+        generations = CacheInvalidation.get_generations()
 
         for dbr in self.db_repo_list:
-            scmr = dbr.scm_instance_cached(valid_cache_keys)
+            scmr = dbr.scm_instance_cached(generations)
             # check permission at this level
             if not HasRepoPermissionAny(
                 *self.perm_set)(dbr.repo_name, 'get repo check'):
@@ -332,13 +335,13 @@ class ScmModel(BaseModel):
                 .filter(RepoGroup.group_parent_id == None).all()
         return [x for x in RepoGroupList(all_groups)]
 
-    def mark_for_invalidation(self, repo_name, delete=False):
+    def mark_for_invalidation(self, repo_name):
         """
         Mark caches of this repo invalid in the database.
 
         :param repo_name: the repo for which caches should be marked invalid
         """
-        CacheInvalidation.set_invalidate(repo_name, delete=delete)
+        CacheInvalidation.set_invalidate(repo_name)
         repo = Repository.get_by_repo_name(repo_name)
         if repo:
             repo.update_changeset_cache()
@@ -515,6 +518,7 @@ class ScmModel(BaseModel):
         try:
             if repo.alias == 'git':
                 repo.fetch(clone_uri)
+                repo.update_commit_graph()
                 # git doesn't really have something like post-fetch action
                 # we fake that now. #TODO: extract fetched revisions somehow
                 # here
@@ -606,6 +610,91 @@ class ScmModel(BaseModel):
 
         return _dirs, _files
 
+    def iter_nodes(self, repo_name, revision, root_path='/', dirs=True,
+                   files=True, path_order=False, after=None):
+        """
+        Like get_nodes with flat=False but returns an iterator over
+        directories followed by files instead of building the lists. The
+        changeset and root path are looked up right away, so lookup errors
+        are raised by this method and not while iterating.
+
+        :param dirs: include directories
+        :param files: include files
+        :param path_order: list both depth first in path order instead of
+            the order of get_nodes, pages of it can be listed with ``after``
+        :param after: path of a node, only the nodes listed after it in path
+            order are returned; nothing is returned if there is no such node
+        """
+        _repo = self.__get_repo(repo_name)
+        changeset = _repo.scm_instance.get_changeset(revision)
+        root_path = root_path.strip('/')
+        root = changeset.get_node(root_path)
+
+        if not path_order and after is None:
+            def walk_levels(want_dirs):
+                for topnode, _dirs, _files in changeset.walk(root_path):
+                    for n in (_dirs if want_dirs else _files):
+                        yield {"name": n.path,
+                               "type": "dir" if want_dirs else "file"}
+
+            iterators = []
+            if dirs:
+                iterators.append(walk_levels(True))
+            if files:
+                iterators.append(walk_levels(False))
+            return itertools.chain(*iterators)
+
+        def walk(node, want_dirs, after):
+            # after is the remaining path components of the node to start
+            # after - sibling names are sorted, so the subtrees before it
+            # are skipped by bisecting instead of being walked
+            if want_dirs:
+                children = node.dirs
+            else:
+                children = sorted(node.nodes, key=lambda n: n.name)
+            start = 0
+            if after:
+                names = [safe_unicode(n.name) for n in children]
+                start = bisect.bisect_left(names, after[0])
+                if start < len(names) and names[start] == after[0]:
+                    if children[start].is_dir():
+                        for n in walk(children[start], want_dirs, after[1:]):
+                            yield n
+                    start += 1
+            for child in children[start:]:
+                if child.is_dir():
+                    if want_dirs:
+                        yield {"name": child.path, "type": "dir"}
+                    for n in walk(child, want_dirs, None):
+                        yield n
+                elif not want_dirs:
+                    yield {"name": child.path, "type": "file"}
+
+        after_dir = after_file = None
+        if after is not None:
+            after = safe_unicode(after).strip('/')
+            prefix = safe_unicode(root_path) + u'/' if root_path else u''
+            if not after.startswith(prefix) or after == prefix.rstrip(u'/'):
+                return iter([])
+            try:
+                after_node = changeset.get_node(safe_str(after))
+            except (ChangesetError, NodeDoesNotExistError):
+                return iter([])
+            after = after[len(prefix):].split(u'/')
+            if after_node.is_dir():
+                # the cursor is in the directory listing - all files follow
+                after_dir = after
+            else:
+                dirs = False
+                after_file = after
+
+        iterators = []
+        if dirs:
+            iterators.append(walk(root, True, after_dir))
+        if files:
+            iterators.append(walk(root, False, after_file))
+        return itertools.chain(*iterators)
+
     def create_nodes(self, user, repo, message, nodes, parent_cs=None,
                      author=None, trigger_push_hook=True):
         """
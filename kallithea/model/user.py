@@ -410,10 +410,12 @@ class UserModel(BaseModel):
         user = self._get_user(user)
         perm = self._get_perm(perm)
 
-        UserToPerm.query().filter(
+        obj = UserToPerm.query().filter(
             UserToPerm.user == user,
             UserToPerm.permission == perm,
-        ).delete()
+        ).scalar()
+        if obj:
+            self.sa.delete(obj)
 
     def add_extra_email(self, user, email):
         """
@@ -228,6 +228,77 @@ class _BaseTestApi(object):
         expected = ret_all
         self._compare_ok(id_, expected, given=response.body)
 
+    def test_api_get_users_by_ids_with_fields(self):
+        fields = ['username', 'emails', 'api_keys', 'ip_addresses']
+        admin = User.get_by_username(TEST_USER_ADMIN_LOGIN)
+        id_, params = _build_data(self.apikey, 'get_users',
+                                  userids=[self.TEST_USER_LOGIN,
+                                           admin.user_id],
+                                  fields=fields)
+        response = api_call(self, params)
+
+        expected = []
+        for usr in [User.get_by_username(self.TEST_USER_LOGIN), admin]:
+            ret = usr.get_api_data(details=True)
+            expected.append(jsonify(dict((k, ret[k]) for k in fields)))
+        self._compare_ok(id_, expected, given=response.body)
+
+    def test_api_get_users_paginated(self):
+        usernames = [u.username for u in User.query()
+                     .filter(User.username != User.DEFAULT_USER)
+                     .order_by(User.username)]
+        id_, params = _build_data(self.apikey, 'get_users',
+                                  cursor=usernames[0], limit=1,
+                                  fields=['username'])
+        response = api_call(self, params)
+        self._compare_ok(id_, [{'username': usernames[1]}],
+                         given=response.body)
+
+    def test_api_get_users_unknown_field(self):
+        id_, params = _build_data(self.apikey, 'get_users',
+                                  fields=['username', 'password'])
+        response = api_call(self, params)
+
+        expected = 'unknown field `password`'
+        self._compare_error(id_, expected, given=response.body)
+
+    def test_api_batch(self):
+        calls = [{'id': 1, 'api_key': self.apikey, 'method': 'get_user',
+                  'args': {'userid': TEST_USER_ADMIN_LOGIN}},
+                 {'id': 2, 'api_key': self.apikey, 'method': 'get_repo',
+                  'args': {}},
+                 {'id': 3, 'api_key': self.apikey_regular, 'method': 'get_ip',
+                  'args': {}},
+                 {'id': 4, 'api_key': self.apikey, 'method': 'get_repo',
+                  'args': {'repoid': 'no-such-repo'}}]
+        response = api_call(self, json.dumps(calls))
+        self.assertEqual(response.status, '200 OK')
+        given = json.loads(response.body)
+
+        id_, params = _build_data(self.apikey, 'get_user',
+                                  userid=TEST_USER_ADMIN_LOGIN)
+        single = json.loads(api_call(self, params).body)
+        self.assertEqual(given[0], dict(single, id=1))
+        self.assertEqual(given[1:], [
+            {'id': 2, 'result': None,
+             'error': 'Missing non optional `repoid` arg in JSON DATA'},
+            {'id': 3, 'result': None,
+             'error': 'All calls of a batch request must use the same API KEY'},
+            {'id': 4, 'result': None,
+             'error': 'repository `no-such-repo` does not exist'},
+        ])
+
+    def test_api_batch_invalid_api_key(self):
+        calls = [{'id': 1, 'api_key': 'trololo', 'method': 'get_user',
+                  'args': {}},
+                 {'id': 2, 'api_key': 'trololo', 'method': 'get_user',
+                  'args': {}}]
+        response = api_call(self, json.dumps(calls))
+        self.assertEqual(json.loads(response.body), [
+            {'id': 1, 'result': None, 'error': 'Invalid API KEY'},
+            {'id': 2, 'result': None, 'error': 'Invalid API KEY'},
+        ])
+
     def test_api_get_user(self):
         id_, params = _build_data(self.apikey, 'get_user',
                                   userid=TEST_USER_ADMIN_LOGIN)
@@ -897,6 +968,78 @@ class _BaseTestApi(object):
         expected = ret
         self._compare_ok(id_, expected, given=response.body)
 
+    def test_api_get_repos_locked(self):
+        repo = RepoModel().get_by_repo_name(self.REPO)
+        user = User.get_by_username(self.TEST_USER_LOGIN)
+        Repository.lock(repo, user.user_id)
+        try:
+            id_, params = _build_data(self.apikey, 'get_repos',
+                                      repoids=[self.REPO],
+                                      fields=['repo_name', 'locked_by'])
+            response = api_call(self, params)
+            expected = [{'repo_name': self.REPO,
+                         'locked_by': user.get_api_data()}]
+            self._compare_ok(id_, expected, given=response.body)
+        finally:
+            Repository.unlock(repo)
+
+    def test_api_batch_get_repos_non_admin(self):
+        calls = [{'id': i, 'api_key': self.apikey_regular,
+                  'method': 'get_repos', 'args': {'fields': ['repo_name']}}
+                 for i in range(3)]
+        with mock.patch.object(AuthUser, 'get_perms',
+                               side_effect=AuthUser.get_perms,
+                               autospec=True) as get_perms:
+            response = api_call(self, json.dumps(calls))
+        # permissions are computed once for the whole batch
+        self.assertEqual(get_perms.call_count, 1)
+        given = json.loads(response.body)
+        self.assertEqual([r['result'] for r in given[1:]],
+                         [given[0]['result']] * 2)
+        self.assertTrue(given[0]['result'])
+
+    def test_api_get_repos_by_ids_with_fields(self):
+        repo = RepoModel().get_by_repo_name(self.REPO)
+        id_, params = _build_data(self.apikey, 'get_repos',
+                                  repoids=[repo.repo_id, self.REPO],
+                                  fields=['repo_name', 'members', 'followers'])
+        response = api_call(self, params)
+
+        id2_, params = _build_data(self.apikey, 'get_repo', repoid=self.REPO)
+        single = json.loads(api_call(self, params).body)['result']
+        expected = [dict((k, single[k])
+                         for k in ['repo_name', 'members', 'followers'])]
+        self._compare_ok(id_, expected, given=response.body)
+
+    def test_api_get_repos_paginated(self):
+        names = sorted(repo.repo_name for repo in RepoModel().get_all())
+        id_, params = _build_data(self.apikey, 'get_repos', limit=2,
+                                  fields=['repo_name'])
+        response = api_call(self, params)
+        self._compare_ok(id_, [{'repo_name': n} for n in names[:2]],
+                         given=response.body)
+
+        id_, params = _build_data(self.apikey, 'get_repos', cursor=names[1],
+                                  fields=['repo_name'])
+        response = api_call(self, params)
+        self._compare_ok(id_, [{'repo_name': n} for n in names[2:]],
+                         given=response.body)
+
+    def test_api_get_repos_bad_limit(self):
+        id_, params = _build_data(self.apikey, 'get_repos', limit=0)
+        response = api_call(self, params)
+
+        expected = 'limit must be a positive number'
+        self._compare_error(id_, expected, given=response.body)
+
+    def test_api_get_repos_by_ids_non_existing(self):
+        id_, params = _build_data(self.apikey_regular, 'get_repos',
+                                  repoids=[self.REPO, 'no-such-repo'])
+        response = api_call(self, params)
+
+        expected = 'repository `%s` does not exist' % 'no-such-repo'
+        self._compare_error(id_, expected, given=response.body)
+
     @parameterized.expand([('all', 'all'),
                            ('dirs', 'dirs'),
                            ('files', 'files'), ])
@@ -914,6 +1057,60 @@ class _BaseTestApi(object):
         expected = response.json['result']
         self._compare_ok(id_, expected, given=response.body)
 
+    def test_api_get_repo_nodes_order(self):
+        id_, params = _build_data(self.apikey, 'get_repo_nodes',
+                                  repoid=self.REPO, revision='tip',
+                                  root_path='/')
+        response = api_call(self, params)
+        # the order of get_nodes unless paginated
+        dirs, files = ScmModel().get_nodes(self.REPO, 'tip', '/', flat=False)
+        self._compare_ok(id_, dirs + files, given=response.body)
+
+        id_, params = _build_data(self.apikey, 'get_repo_nodes',
+                                  repoid=self.REPO, revision='tip',
+                                  root_path='/', limit=len(dirs + files))
+        response = api_call(self, params)
+        split = lambda node: node['name'].split('/')
+        expected = sorted(dirs, key=split) + sorted(files, key=split)
+        self._compare_ok(id_, expected, given=response.body)
+
+    def test_api_get_repo_nodes_paginated(self):
+        id_, params = _build_data(self.apikey, 'get_repo_nodes',
+                                  repoid=self.REPO, revision='tip',
+                                  root_path='/', limit=10000)
+        nodes = json.loads(api_call(self, params).body)['result']
+
+        id_, params = _build_data(self.apikey, 'get_repo_nodes',
+                                  repoid=self.REPO, revision='tip',
+                                  root_path='/', cursor=nodes[9]['name'],
+                                  limit=5)
+        response = api_call(self, params)
+        self._compare_ok(id_, nodes[10:15], given=response.body)
+
+    def test_api_get_repo_nodes_paginated_all_pages(self):
+        id_, params = _build_data(self.apikey, 'get_repo_nodes',
+                                  repoid=self.REPO, revision='tip',
+                                  root_path='/', limit=10000)
+        nodes = json.loads(api_call(self, params).body)['result']
+        self.assertTrue(any(node['type'] == 'dir' for node in nodes))
+
+        # pages starting after directories and files cover the rest
+        for i, node in enumerate(nodes):
+            if node['type'] == 'file' and i % 10:
+                continue
+            id_, params = _build_data(self.apikey, 'get_repo_nodes',
+                                      repoid=self.REPO, revision='tip',
+                                      root_path='/', cursor=node['name'],
+                                      limit=len(nodes))
+            response = api_call(self, params)
+            self._compare_ok(id_, nodes[i + 1:], given=response.body)
+
+        id_, params = _build_data(self.apikey, 'get_repo_nodes',
+                                  repoid=self.REPO, revision='tip',
+                                  root_path='/', cursor='idontexist', limit=5)
+        response = api_call(self, params)
+        self._compare_ok(id_, [], given=response.body)
+
     def test_api_get_repo_nodes_bad_revisions(self):
         rev = 'i-dont-exist'
         path = '/'
@@ -205,7 +205,42 @@ removed extra unicode conversion in diff.</div>
                 ('Content-Disposition', 'attachment; filename=%s' % filename),
                 ('Content-Type', '%s; charset=utf-8' % info[0]),
             ]
-            self.assertEqual(response.response._headers.items(), heads)
+            self.assertEqual(response.response._headers.items()[:4], heads)
+
+            # served from the archive cache now
+            cached_response = self.app.get(url(controller='files',
+                                               action='archivefile',
+                                               repo_name=HG_REPO,
+                                               fname=fname))
+            self.assertEqual(cached_response.body, response.body)
+            self.assertEqual(cached_response.headers['Accept-Ranges'],
+                             'bytes')
+            self.assertEqual(cached_response.content_length,
+                             len(response.body))
+
+    def test_archival_conditional_and_range(self):
+        self.log_user()
+        _set_downloads(HG_REPO, set_to=True)
+        archive_url = url(controller='files', action='archivefile',
+                          repo_name=HG_REPO,
+                          fname='27cd5cce30c96924232dffcd24178a07ffeb5dfc.zip')
+        self.app.get(archive_url)
+        response = self.app.get(archive_url)
+        body = response.body
+        etag = response.headers['ETag']
+
+        response = self.app.get(archive_url,
+                                headers={'If-None-Match': etag}, status=304)
+        self.assertEqual(response.body, '')
+
+        response = self.app.get(archive_url,
+                                headers={'Range': 'bytes=10-99'}, status=206)
+        self.assertEqual(response.body, body[10:100])
+        self.assertEqual(response.headers['Content-Range'],
+                         'bytes 10-99/%s' % len(body))
+
+        self.app.get(archive_url, headers={'Range': 'bytes=%s-' % len(body)},
+                     status=416)
 
     def test_archival_wrong_ext(self):
         self.log_user()
@@ -244,6 +279,26 @@ removed extra unicode conversion in diff.</div>
         self.assertEqual(response.content_disposition, "attachment; filename=nodes.py")
         self.assertEqual(response.content_type, "text/x-python")
 
+    def test_raw_file_conditional_and_range(self):
+        self.log_user()
+        raw_url = url(controller='files', action='rawfile',
+                      repo_name=GIT_REPO,
+                      revision='5f2c6ee195929b0be80749243c18121c9864a3b3',
+                      f_path='vcs/nodes.py')
+        response = self.app.get(raw_url)
+        body = response.body
+        # the etag is the sha of the blob
+        etag = response.headers['ETag']
+        self.assertEqual(len(etag), 42)
+
+        response = self.app.get(raw_url, headers={'If-None-Match': etag},
+                                status=304)
+        self.assertEqual(response.body, '')
+
+        response = self.app.get(raw_url, headers={'Range': 'bytes=-100'},
+                                status=206)
+        self.assertEqual(response.body, body[-100:])
+
     def test_raw_file_wrong_cs(self):
         self.log_user()
         rev = u'ERRORce30c96924232dffcd24178a07ffeb5dfc'
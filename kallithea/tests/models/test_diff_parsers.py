@@ -1,8 +1,18 @@
 from __future__ import with_statement
+import os
+import shutil
+import tempfile
+
+import mock
+
 from kallithea.tests import *
 from kallithea.lib.diffs import DiffProcessor, NEW_FILENODE, DEL_FILENODE, \
-    MOD_FILENODE, RENAMED_FILENODE, CHMOD_FILENODE, BIN_FILENODE, COPIED_FILENODE
+    MOD_FILENODE, RENAMED_FILENODE, CHMOD_FILENODE, BIN_FILENODE, COPIED_FILENODE, \
+    LimitedDiffContainer, get_diff_processor
+from kallithea.model.db import Repository
 from kallithea.tests.fixture import Fixture
+from kallithea.lib import diff_cache
+from kallithea.lib.diff_cache import DiffCache
 
 fixture = Fixture()
 
@@ -275,3 +285,100 @@ class DiffLibTest(BaseTestCase):
         data = [(x['filename'], x['operation'], x['stats']) for x in diff_proc_d]
         expected_data = DIFF_FIXTURES[diff_fixture]
         self.assertListEqual(expected_data, data)
+
+    @parameterized.expand([(x,) for x in DIFF_FIXTURES])
+    def test_diff_stream(self, diff_fixture):
+        diff = fixture.load_resource(diff_fixture, strip=False)
+        expected = DiffProcessor(diff)
+        expected_d = expected.prepare()
+        # stream of small chunks not aligned with lines
+        diff_proc = DiffProcessor(diff[i:i + 10]
+                                  for i in xrange(0, len(diff), 10))
+        diff_proc_d = diff_proc.prepare()
+        self.assertListEqual([(x['filename'], x['operation'], x['stats'],
+                               x['chunks']) for x in expected_d],
+                             [(x['filename'], x['operation'], x['stats'],
+                               x['chunks']) for x in diff_proc_d])
+        self.assertEqual(diff_proc.as_raw(), diff)
+
+    def test_diff_limit(self):
+        diff = fixture.load_resource('git_diff_binary_and_normal.diff',
+                                     strip=False)
+        closed = []
+
+        def chunks():
+            try:
+                for i in xrange(0, len(diff), 10):
+                    yield diff[i:i + 10]
+            finally:
+                closed.append(True)
+
+        diff_proc = DiffProcessor(chunks(), diff_limit=1000)
+        diff_proc_d = diff_proc.prepare()
+        self.assertIsInstance(diff_proc_d, LimitedDiffContainer)
+        self.assertEqual([x['filename'] for x in diff_proc_d],
+                         ['img/baseline-10px.png', 'img/baseline-20px.png',
+                          'index.html'])
+        # the rest of diff is not read and the stream is closed
+        self.assertLess(diff_proc.diff_size, len(diff))
+        self.assertEqual(closed, [True])
+        # chunks are parsed when needed and not kept
+        index = list(diff_proc_d)[2]
+        self.assertEqual(index['chunks'], index['chunks'])
+        self.assertFalse('chunks' in index)
+        html = diff_proc.as_deferred_html(index, enable_comments=True)
+        self.assertEqual(unicode(html),
+                         diff_proc.as_html(enable_comments=True,
+                                           parsed_lines=[index]))
+
+    def test_diff_cache(self):
+        repo = Repository.get_by_repo_name(GIT_REPO).scm_instance
+        rev1, rev2 = repo.revisions[0], repo.revisions[20]
+        expected = DiffProcessor(repo.get_diff(rev1, rev2), vcs='git')
+        expected_d = [(f['filename'], f['operation'], f['stats'], f['chunks'])
+                      for f in expected.prepare()]
+        parsed = [f for f in expected.parsed_diff
+                  if not f['stats']['binary'] and f['operation'] != 'D']
+        cache_dir = tempfile.mkdtemp()
+        try:
+            cache = DiffCache(cache_dir, 10 * 1024 * 1024)
+            with mock.patch.object(diff_cache, 'get_cache', lambda: cache):
+                diff_proc = get_diff_processor(repo, rev1, rev2)
+                self.assertEqual([(f['filename'], f['operation'],
+                                   f['stats'], f['chunks'])
+                                  for f in diff_proc.parsed_diff],
+                                 expected_d)
+                self.assertEqual(diff_proc.stat(), expected.stat())
+                # one entry per parsed file
+                self.assertEqual(sum(len(names) for _d, _ds, names
+                                     in os.walk(cache_dir)), len(parsed))
+                # cached files are not parsed again, whatever type the
+                # revisions are given as
+                with mock.patch.object(DiffProcessor, '_parse_file_lines') \
+                        as parse:
+                    diff_proc = get_diff_processor(repo, unicode(rev1),
+                                                   unicode(rev2))
+                    self.assertEqual([(f['filename'], f['operation'],
+                                       f['stats'], f['chunks'])
+                                      for f in diff_proc.parsed_diff],
+                                     expected_d)
+                    self.assertFalse(parse.called)
+                # entries are filled when files are rendered, limited diffs
+                # share them
+                limited = get_diff_processor(repo, rev1, rev2,
+                                             diff_limit=1000)
+                self.assertIsInstance(limited.parsed_diff,
+                                      LimitedDiffContainer)
+                self.assertTrue(len(list(limited.parsed_diff))
+                                < len(expected_d))
+
+            # least recently used entries are evicted
+            key = cache.get_key('old')
+            cache.set(key, [])
+            os.utime(cache._get_path(key), (0, 0))
+            cache.max_size = cache._size
+            cache.set(cache.get_key('new'), [])
+            self.assertEqual(cache.get(key), None)
+            self.assertEqual(cache.get(cache.get_key('new')), [])
+        finally:
+            shutil.rmtree(cache_dir)
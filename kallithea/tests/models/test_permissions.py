@@ -1,13 +1,18 @@
+import functools
+
+import mock
+
 from kallithea.tests import *
 from kallithea.tests.fixture import Fixture
 from kallithea.model.repo_group import RepoGroupModel
 from kallithea.model.repo import RepoModel
 from kallithea.model.db import RepoGroup, User, UserGroupRepoGroupToPerm,\
-    Permission, UserToPerm
+    Permission, UserToPerm, CacheInvalidation, Ui, get_changed_keys
 from kallithea.model.user import UserModel
 
 from kallithea.model.meta import Session
 from kallithea.model.user_group import UserGroupModel
+from kallithea.lib import auth
 from kallithea.lib.auth import AuthUser
 from kallithea.model.permission import PermissionModel
 
@@ -474,6 +479,101 @@ class TestPermissions(BaseTestCase):
         self.assertEqual(u1_auth.permissions['repositories']['myownrepo'],
                          'repository.admin')
 
+    def test_permission_changes_bump_version(self):
+        computed = []
+        compute = auth._cached_perms_data
+
+        @functools.wraps(compute)
+        def counting_compute(user_id, *args, **kwargs):
+            computed.append(user_id)
+            return compute(user_id, *args, **kwargs)
+
+        with mock.patch.object(AuthUser, '_use_permission_cache',
+                               staticmethod(lambda: True)), \
+                mock.patch.object(auth, '_cached_perms_data',
+                                  counting_compute):
+            u1_version = CacheInvalidation.get_permissions_version(self.u1.user_id)
+            u2_version = CacheInvalidation.get_permissions_version(self.u2.user_id)
+            self.assertEqual(AuthUser(user_id=self.u1.user_id)
+                             .get_repo_permission(HG_REPO), 'repository.read')
+            self.assertEqual(AuthUser(user_id=self.u1.user_id)
+                             .get_repo_permission(HG_REPO), 'repository.read')
+            # unchanged permissions come from cache
+            self.assertEqual(computed, [self.u1.user_id])
+
+            RepoModel().grant_user_permission(repo=HG_REPO, user=self.u1,
+                                              perm='repository.write')
+            Session().commit()
+            new_u1_version = CacheInvalidation.get_permissions_version(self.u1.user_id)
+            self.assertNotEqual(new_u1_version, u1_version)
+            # only user specific part of version changed
+            self.assertEqual(new_u1_version[0], u1_version[0])
+            self.assertEqual(CacheInvalidation.get_permissions_version(self.u2.user_id),
+                             u2_version)
+            u1_auth = AuthUser(user_id=self.u1.user_id)
+            self.assertEqual(u1_auth.get_repo_permission(HG_REPO),
+                             'repository.write')
+            self.assertEqual(u1_auth.permissions['repositories'][HG_REPO],
+                             'repository.write')
+            self.assertEqual(computed, [self.u1.user_id] * 3)
+
+            self.assertEqual(AuthUser(user_id=self.u2.user_id)
+                             .get_repo_permission(HG_REPO), 'repository.read')
+            # default permissions apply to everybody
+            RepoModel().grant_user_permission(repo=HG_REPO, user=self.anon,
+                                              perm='repository.none')
+            Session().commit()
+            self.assertNotEqual(CacheInvalidation.get_permissions_version(self.u2.user_id),
+                                u2_version)
+            self.assertEqual(AuthUser(user_id=self.u2.user_id)
+                             .get_repo_permission(HG_REPO), 'repository.none')
+            self.assertEqual(computed[-2:], [self.u2.user_id] * 2)
+            RepoModel().grant_user_permission(repo=HG_REPO, user=self.anon,
+                                              perm='repository.read')
+            Session().commit()
+
+    def test_bumping_generation_keeps_one_row(self):
+        key = CacheInvalidation.PERMISSIONS_KEY
+        generation = CacheInvalidation._bump_in_session(Session(), key)
+        self.assertEqual(CacheInvalidation._bump_in_session(Session(), key),
+                         generation + 1)
+        Session().commit()
+        self.assertEqual(CacheInvalidation.get_generation(key), generation + 1)
+        self.assertEqual(1, CacheInvalidation.query()
+                         .filter(CacheInvalidation.cache_key == key).count())
+
+    def test_flush_and_set_invalidate_bump_through_session(self):
+        generation = CacheInvalidation.get_generation(
+            CacheInvalidation.UI_KEY)
+        ui = Ui()
+        ui.ui_section = 'hooks'
+        ui.ui_key = 'changegroup.test_bump'
+        ui.ui_value = 'python:test.hook'
+        Session().add(ui)
+        Session().flush()
+        self.assertTrue(CacheInvalidation.UI_KEY in
+                        get_changed_keys(Session()))
+        Session().delete(ui)
+        Session().commit()
+        self.assertEqual(CacheInvalidation.get_generation(
+            CacheInvalidation.UI_KEY), generation + 2)
+
+        generation = CacheInvalidation.get_generation(HG_REPO)
+        CacheInvalidation.set_invalidate(HG_REPO)
+        self.assertEqual(CacheInvalidation.get_generation(HG_REPO),
+                         generation + 1)
+
+    def test_pending_permission_changes_are_not_cached(self):
+        Session().commit()
+        self.assertNotEqual(CacheInvalidation.get_permissions_version(
+            self.u1.user_id), None)
+        perm = Permission.get_by_key('hg.create.repository')
+        Session().add(UserToPerm(user=self.u1, permission=perm))
+        # seen without flushing the pending change
+        self.assertEqual(CacheInvalidation.get_permissions_version(
+            self.u1.user_id), None)
+        Session().rollback()
+
     def _test_def_perm_equal(self, user, change_factor=0):
         perms = UserToPerm.query()\
                 .filter(UserToPerm.user == user)\
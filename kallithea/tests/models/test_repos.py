@@ -3,7 +3,8 @@ from kallithea.tests import *
 from kallithea.model.meta import Session
 from kallithea.tests.fixture import Fixture
 from kallithea.model.repo import RepoModel
-from kallithea.model.db import Repository
+from kallithea.model.db import Repository, CacheInvalidation
+from kallithea.model.scm import ScmModel
 from kallithea.lib.exceptions import AttachedForksError
 
 fixture = Fixture()
@@ -75,3 +76,35 @@ class TestRepos(BaseTestCase):
             RepoModel().delete(repo='test-repo-fork-fork-1')
             RepoModel().delete(repo='test-repo-fork-1')
             Session().commit()
+
+    def test_mark_for_invalidation_bumps_generation(self):
+        repo = Repository.get_by_repo_name(HG_REPO)
+        generation = CacheInvalidation.get_generation(HG_REPO)
+        scm_repo = repo.scm_instance_cached()
+        self.assertTrue(scm_repo is repo.scm_instance_cached())
+
+        ScmModel().mark_for_invalidation(HG_REPO)
+        new_generation = CacheInvalidation.get_generation(HG_REPO)
+        self.assertTrue(new_generation > generation)
+        self.assertEqual(1, CacheInvalidation.query()
+                         .filter(CacheInvalidation.cache_args == HG_REPO).count())
+        self.assertTrue(scm_repo is not repo.scm_instance_cached())
+
+        ScmModel().mark_for_invalidation(HG_REPO)
+        self.assertTrue(CacheInvalidation.get_generation(HG_REPO) > new_generation)
+        # repos never invalidated are at the base generation
+        self.assertEqual(CacheInvalidation.get_generation(
+                             CacheInvalidation.BASE_KEY),
+                         CacheInvalidation.get_generation('not-a-repo'))
+
+    def test_clear_cache_keeps_generations_monotonic(self):
+        ScmModel().mark_for_invalidation(HG_REPO)
+        generation = CacheInvalidation.get_generation(HG_REPO)
+        CacheInvalidation.clear_cache()
+        self.assertEqual(1, CacheInvalidation.query().count())
+        self.assertTrue(CacheInvalidation.get_generation(HG_REPO) > generation)
+        self.assertTrue(CacheInvalidation.get_generation('not-a-repo')
+                        > generation)
+        base = CacheInvalidation.get_generation(HG_REPO)
+        ScmModel().mark_for_invalidation(HG_REPO)
+        self.assertEqual(CacheInvalidation.get_generation(HG_REPO), base + 1)
@@ -256,14 +256,7 @@ class TestVCSOperations(BaseTestCase):
         _check_proper_git_push(stdout, stderr)
 
     def test_push_invalidates_cache_hg(self):
-        key = CacheInvalidation.query().filter(CacheInvalidation.cache_key
-                                               ==HG_REPO).scalar()
-        if not key:
-            key = CacheInvalidation(HG_REPO, HG_REPO)
-
-        key.cache_active = True
-        Session().add(key)
-        Session().commit()
+        generation = CacheInvalidation.get_generation(HG_REPO)
 
         DEST = _get_tmp_dir()
         clone_url = _construct_url(HG_REPO, dest=DEST)
@@ -271,19 +264,12 @@ class TestVCSOperations(BaseTestCase):
 
         stdout, stderr = _add_files_and_push('hg', DEST, files_no=1)
 
-        key = CacheInvalidation.query().filter(CacheInvalidation.cache_key
+        key = CacheInvalidation.query().filter(CacheInvalidation.cache_args
                                                ==HG_REPO).one()
-        self.assertEqual(key.cache_active, False)
+        self.assertTrue(key.generation > generation)
 
     def test_push_invalidates_cache_git(self):
-        key = CacheInvalidation.query().filter(CacheInvalidation.cache_key
-                                               ==GIT_REPO).scalar()
-        if not key:
-            key = CacheInvalidation(GIT_REPO, GIT_REPO)
-
-        key.cache_active = True
-        Session().add(key)
-        Session().commit()
+        generation = CacheInvalidation.get_generation(GIT_REPO)
 
         DEST = _get_tmp_dir()
         clone_url = _construct_url(GIT_REPO, dest=DEST)
@@ -293,10 +279,9 @@ class TestVCSOperations(BaseTestCase):
         stdout, stderr = _add_files_and_push('git', DEST, files_no=1)
         _check_proper_git_push(stdout, stderr)
 
-        key = CacheInvalidation.query().filter(CacheInvalidation.cache_key
+        key = CacheInvalidation.query().filter(CacheInvalidation.cache_args
                                                ==GIT_REPO).one()
-        print CacheInvalidation.get_all()
-        self.assertEqual(key.cache_active, False)
+        self.assertTrue(key.generation > generation)
 
     def test_push_wrong_credentials_hg(self):
         DEST = _get_tmp_dir()
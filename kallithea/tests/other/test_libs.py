@@ -26,6 +26,7 @@ Original author and date, and relevant copyright and licensing information is be
 """
 
 from __future__ import with_statement
+import os
 import datetime
 import hashlib
 import mock
@@ -373,3 +374,321 @@ class TestLibs(BaseTestCase):
         _test = _extract_id_from_repo_name(test)
         self.assertEqual(_test, expected, msg='url:%s, got:`%s` expected: `%s`'
                                               % (test, _test, expected))
+
+    def test_graph_layout(self):
+        from kallithea.lib.graphmod import _dagwalker, _colored
+        parents = {3: [2, 1], 2: [0], 1: [0], 0: [-1]}
+        dag = list(_dagwalker(parents.__getitem__, [3, 2, 1, 0]))
+        self.assertEqual(dag, [(3, [1, 2]), (2, [0]), (1, [0]), (0, [])])
+        # rev 1 is on its own branch which it closes
+        branches = {3: 1, 2: 1, 1: 2, 0: 1}
+        self.assertEqual(list(_colored(dag, branches, set([1]))), [
+            ((0, 1), [(0, 1, 2), (0, 0, 1)], 0),
+            ((0, 1), [(0, 0, 1), (1, 1, 2)], 0),
+            ((1, 2), [(0, 0, 1), (1, 0, 1)], 1),
+            ((0, 1), [], 0),
+        ])
+
+    def test_scm_instance_pool(self):
+        from kallithea.lib.scm_pool import ScmInstancePool
+        pool = ScmInstancePool(2)
+        created = []
+        def factory():
+            created.append(object())
+            return created[-1]
+        repo = pool.get('a', 0, factory)
+        self.assertTrue(pool.get('a', 0, factory) is repo)
+        # new generation replaces the old instance
+        new_repo = pool.get('a', 1, factory)
+        self.assertTrue(new_repo is not repo)
+        pool.get('b', 0, factory)
+        pool.get('c', 0, factory)
+        self.assertEqual(len(created), 4)
+        self.assertEqual(pool.get_stats(), {'hits': 1, 'misses': 4,
+                                            'evictions': 1, 'entries': 2,
+                                            'size': 2})
+
+    def test_commit_stats(self):
+        from kallithea.lib.celerylib.commit_stats import CommitStats, \
+            parse_range, parse_range_parallel
+        repo = Repository.get_by_repo_name(HG_REPO).scm_instance
+        stats, last_cs = parse_range(repo, 0, 20)
+        self.assertEqual(last_cs.revision, 19)
+        self.assertEqual(sum(stats.days.values()), 20)
+        # aggregates of split ranges merge to the same result
+        merged, _cs = parse_range(repo, 0, 7)
+        merged.merge(parse_range(repo, 7, 20)[0])
+        self.assertEqual(merged.to_json_data(), stats.to_json_data())
+        # and survive round trip through the stored format
+        restored = CommitStats.from_json_data(*stats.to_json_data())
+        self.assertEqual(restored.to_json_data(), stats.to_json_data())
+
+        parallel, last_cs = parse_range_parallel(repo, 0, 20, 3)
+        self.assertEqual(last_cs.revision, 19)
+        self.assertEqual(parallel.to_json_data(), stats.to_json_data())
+
+        # workers keep raw authors, they are resolved in the parent
+        from kallithea.lib.celerylib.commit_stats import _parse_range_worker
+        with mock.patch('kallithea.lib.celerylib.commit_stats.person') as p:
+            raw = _parse_range_worker((repo.alias, repo.path, 0, 20))
+        self.assertFalse(p.called)
+        self.assertEqual(sorted(raw.authors),
+                         sorted(set(cs.author for cs in repo[0:20])))
+        self.assertEqual(raw.labelled().to_json_data(), stats.to_json_data())
+
+    def test_make_ui_from_db_is_cached_until_settings_change(self):
+        from kallithea.lib.utils import make_ui
+        from kallithea.model.db import Ui
+        from kallithea.model.meta import Session
+        baseui = make_ui('db')
+        with mock.patch('kallithea.lib.utils._fill_ui_from_db') as fill:
+            other = make_ui('db')
+            self.assertFalse(fill.called)
+        # every caller gets its own copy
+        self.assertFalse(other is baseui)
+        self.assertEqual(other.configitems('hooks'), baseui.configitems('hooks'))
+
+        sett = Ui.get_by_key(Ui.HOOK_PULL)
+        sett.ui_active = not sett.ui_active
+        Session().commit()
+        try:
+            self.assertEqual(make_ui('db').config('hooks', Ui.HOOK_PULL) is None,
+                             not sett.ui_active)
+        finally:
+            sett = Ui.get_by_key(Ui.HOOK_PULL)
+            sett.ui_active = not sett.ui_active
+            Session().commit()
+
+    def test_vcs_credentials_verification_is_cached_until_user_changes(self):
+        from kallithea.lib import auth_modules
+        from kallithea.lib.auth import KallitheaCrypto
+        from kallithea.lib.auth_modules.auth_internal import KallitheaAuthPlugin
+        from kallithea.model.db import User
+        from kallithea.model.meta import Session
+        login, password = TEST_USER_REGULAR_LOGIN, TEST_USER_REGULAR_PASS
+        auth_modules._credentials.clear()
+        self.assertTrue(auth_modules.authenticate(login, password, cache=True))
+        with mock.patch.object(KallitheaAuthPlugin, 'auth') as auth:
+            self.assertTrue(auth_modules.authenticate(login, password,
+                                                      cache=True))
+            # wrong password and uncached callers are verified again
+            auth.return_value = None
+            self.assertEqual(auth_modules.authenticate(login, 'wrong',
+                                                       cache=True), None)
+            self.assertEqual(auth_modules.authenticate(login, password), None)
+            self.assertEqual(auth.call_count, 2)
+
+        user = User.get_by_username(login)
+        old_hash = user.password
+        user.password = KallitheaCrypto.hash_string('new password')
+        Session().commit()
+        try:
+            self.assertEqual(auth_modules.authenticate(login, password,
+                                                       cache=True), None)
+        finally:
+            user = User.get_by_username(login)
+            user.password = old_hash
+            Session().commit()
+
+        self.assertTrue(auth_modules.authenticate(login, password, cache=True))
+        user = User.get_by_username(login)
+        user.active = False
+        Session().commit()
+        try:
+            self.assertEqual(auth_modules.authenticate(login, password,
+                                                       cache=True), None)
+        finally:
+            user = User.get_by_username(login)
+            user.active = True
+            Session().commit()
+
+    def test_archive_cache_generates_archive_once(self):
+        import shutil
+        import tempfile
+        import threading
+        from kallithea.lib.archive_cache import ArchiveCache
+        cache_dir = tempfile.mkdtemp()
+        try:
+            cache = ArchiveCache(cache_dir, 5 * 1024 * 1024)
+            started = threading.Event()
+            release = threading.Event()
+            calls = []
+
+            def fill(stream):
+                calls.append(stream)
+                stream.write('x' * 1024 * 1024)
+                stream.flush()
+                started.set()
+                release.wait(10)
+                stream.write('y' * 1024 * 1024)
+
+            self.assertEqual(cache.get('a.tar.gz'), None)
+            first = cache.generate('a.tar.gz', fill)
+            started.wait(10)
+            # concurrent requests stream the archive as it grows
+            second = cache.generate('a.tar.gz', fill)
+            release.set()
+            content = 'x' * 1024 * 1024 + 'y' * 1024 * 1024
+            self.assertEqual(''.join(first), content)
+            self.assertEqual(''.join(second), content)
+            self.assertEqual(len(calls), 1)
+            self.assertEqual(os.listdir(cache_dir), ['a.tar.gz'])
+
+            self.assertEqual(''.join(cache.generate('b.tar.gz', fill)),
+                             content)
+            path = cache.get('b.tar.gz')
+            self.assertEqual(open(path).read(), content)
+            os.utime(path, (1, os.stat(path).st_mtime))
+            self.assertTrue(cache.get('a.tar.gz'))
+            # least recently used archives are removed when cache is full
+            self.assertEqual(''.join(cache.generate('c.tar.gz', fill)),
+                             content)
+            self.assertEqual(sorted(os.listdir(cache_dir)),
+                             ['a.tar.gz', 'c.tar.gz'])
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_pack_cache_serves_full_clones(self):
+        import shutil
+        import tempfile
+        from webob import Request
+        from dulwich.repo import Repo
+        from kallithea.lib import pack_cache
+        from kallithea.lib.middleware import pygrack
+
+        def pkt_line(data):
+            return '%04x%s' % (len(data) + 4, data)
+
+        head = Repo(TEST_GIT_REPO).head()
+        clone = (pkt_line('want %s side-band-64k ofs-delta\n' % head) +
+                 '0000' + pkt_line('done\n'))
+        fetch = (pkt_line('want %s side-band-64k ofs-delta\n' % head) +
+                 '0000' + pkt_line('have %s\n' % head) + pkt_line('done\n'))
+        self.assertTrue(pack_cache.is_full_clone(clone))
+        self.assertFalse(pack_cache.is_full_clone(fetch))
+        self.assertFalse(pack_cache.is_full_clone('garbage'))
+
+        def upload_pack(body):
+            app = pygrack.make_wsgi_app(GIT_REPO, TESTS_TMP_PATH, {})
+            req = Request.blank('/%s/git-upload-pack' % GIT_REPO,
+                                method='POST', body=body,
+                                headers={'Accept': 'application/x-git-upload-pack-result'})
+            resp = req.get_response(app)
+            self.assertEqual(resp.status_int, 200)
+            return resp.body
+
+        cache_dir = tempfile.mkdtemp()
+        try:
+            cache = pack_cache.PackCache(cache_dir, 1024 * 1024 * 1024)
+            with mock.patch.object(pack_cache, 'get_cache', lambda: cache):
+                pack = upload_pack(clone)
+                self.assertTrue(pack.endswith('0000'))
+                key = cache.get_key(Repo(TEST_GIT_REPO).get_refs(), clone)
+                self.assertEqual(open(cache.get(TEST_GIT_REPO, key)).read(), pack)
+                # identical clones are served from the cache
+                with mock.patch.object(pygrack.subprocessio,
+                                       'SubprocessIOChunker') as chunker:
+                    self.assertEqual(upload_pack(clone), pack)
+                    self.assertFalse(chunker.called)
+                # fetches are not cached
+                upload_pack(fetch)
+                self.assertEqual(sum(len(names) for _d, _ds, names
+                                     in os.walk(cache_dir)), 1)
+
+            # pushes invalidate responses of the repository
+            cache.invalidate(TEST_GIT_REPO)
+            self.assertEqual(cache.get(TEST_GIT_REPO, key), None)
+
+            # least recently used responses are evicted
+            for name in ['old', 'new']:
+                writer = cache.writer(TEST_GIT_REPO, name)
+                writer.write('x' * 100)
+                writer.commit()
+                os.utime(cache.get(TEST_GIT_REPO, name), (0, 0))
+                cache.max_size = 150
+            self.assertEqual(cache.get(TEST_GIT_REPO, 'old'), None)
+            self.assertTrue(cache.get(TEST_GIT_REPO, 'new'))
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_highlight_cache_skips_lexing(self):
+        from kallithea.lib import helpers, highlight_cache
+        from kallithea.lib.utils import get_lexer_for_filenode
+        from kallithea.lib.vcs.utils.lrucache import LRUCache
+        repo = Repository.get_by_repo_name(HG_REPO).scm_instance
+        node = repo.get_changeset().get_node('setup.py')
+
+        # file names with a single known lexer don't need content analysis
+        with mock.patch('pygments.lexers.guess_lexer_for_filename') as guess:
+            self.assertEqual(get_lexer_for_filenode(node).name, 'Python')
+            self.assertFalse(guess.called)
+
+        cache = LRUCache(1024 * 1024, sizeof=highlight_cache._sizeof)
+        with mock.patch.object(highlight_cache, 'get_cache', lambda: cache):
+            html = helpers.pygmentize(node, linenos=True)
+            self.assertEqual(len(cache), 1)
+            lexer = get_lexer_for_filenode(node)
+            with mock.patch.object(lexer, 'get_tokens_unprocessed') as lex:
+                with mock.patch('kallithea.lib.helpers.get_lexer_for_filenode',
+                                lambda filenode: lexer):
+                    self.assertEqual(helpers.pygmentize(node, linenos=True),
+                                     html)
+                self.assertFalse(lex.called)
+            # other formatter options are cached separately
+            self.assertNotEqual(helpers.pygmentize(node), html)
+            self.assertEqual(len(cache), 2)
+
+    def test_lexer_for_filenode_mapped_names_and_ambiguous_names(self):
+        from pygments import lexers
+        from kallithea.lib import utils
+        from kallithea.lib.vcs.nodes import FileNode
+        self.assertEqual(utils._find_lexer_class('HTML'), lexers.HtmlLexer)
+        self.assertEqual(utils._find_lexer_class('C++'), lexers.CppLexer)
+        self.assertEqual(utils._find_lexer_class('Cpp'), lexers.CppLexer)
+
+        # .h files are C or Objective-C, depending on the content
+        node = FileNode('test.h', content='@interface Foo : NSObject\n@end\n')
+        with mock.patch('pygments.lexers.guess_lexer_for_filename',
+                        wraps=lexers.guess_lexer_for_filename) as guess:
+            self.assertEqual(utils.get_lexer_for_filenode(node).name,
+                             'Objective-C')
+            self.assertTrue(guess.called)
+
+    def test_authors_are_resolved_in_one_query_until_users_change(self):
+        from kallithea.lib import identities
+        from kallithea.model.db import User
+        from kallithea.model.meta import Session
+        from kallithea.model.user import UserModel
+        identities._identities.clear()
+        admin_email = User.get_by_username(TEST_USER_ADMIN_LOGIN).email
+        admin = 'Admin <%s>' % admin_email.upper()
+        regular = TEST_USER_REGULAR_LOGIN
+        other = 'Someone <someone@example.com>'
+        with mock.patch.object(identities, '_query_identities',
+                               wraps=identities._query_identities) as query:
+            resolved = identities.resolve_authors([admin, regular, other,
+                                                   admin])
+            self.assertEqual(query.call_count, 1)
+            self.assertEqual(resolved[admin].username, TEST_USER_ADMIN_LOGIN)
+            self.assertEqual(resolved[regular].email, TEST_USER_REGULAR_EMAIL)
+            self.assertEqual(resolved[other], None)
+            # authors and non-users are cached
+            self.assertEqual(identities.resolve_authors([admin, other]),
+                             {admin: resolved[admin], other: None})
+            self.assertEqual(query.call_count, 1)
+
+        user = User.get_by_username(TEST_USER_REGULAR_LOGIN)
+        email = UserModel().add_extra_email(user, 'someone@example.com')
+        Session().commit()
+        try:
+            self.assertEqual(identities.get_identity(other).username,
+                             TEST_USER_REGULAR_LOGIN)
+            from kallithea.lib import helpers
+            self.assertEqual(helpers.email_or_none(other),
+                             TEST_USER_REGULAR_EMAIL)
+            self.assertEqual(helpers.person(other, 'username_and_name'),
+                             user.username_and_name)
+        finally:
+            UserModel().delete_extra_email(user, email.email_id)
+            Session().commit()
+        self.assertEqual(identities.get_identity(other), None)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+kallithea.tests.scripts.bench_graphmod
+~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+Benchmark for changelog graph layout on a synthetic DAG with heavy
+branching. Run it as a regular script::
+
+    python kallithea/tests/scripts/bench_graphmod.py [revisions] [branches]
+"""
+
+import sys
+import time
+import random
+
+from kallithea.lib.graphmod import nullrev, _dagwalker, _colored
+
+
+def make_dag(count, width, seed=0):
+    """
+    Returns parents and branch ids of ``count`` synthetic revisions spread
+    over ``width`` concurrently active branches that fork and merge often.
+    """
+    rnd = random.Random(seed)
+    parents = {}
+    branches = {}
+    tips = {}
+    for rev in xrange(count):
+        lane = rnd.randrange(width)
+        tip = tips.get(lane)
+        ps = [tip if tip is not None else nullrev]
+        if tips and rnd.random() < 0.2:
+            # merge from another branch
+            other = tips[rnd.choice(tips.keys())]
+            if other not in ps:
+                ps.append(other)
+        elif rev and rnd.random() < 0.05:
+            # fork from somewhere in the recent history
+            ps = [rnd.randrange(max(0, rev - 500), rev)]
+        parents[rev] = ps
+        branches[rev] = lane
+        tips[lane] = rev
+    return parents, branches
+
+
+def main(argv):
+    count = int(argv[1]) if len(argv) > 1 else 10000
+    width = int(argv[2]) if len(argv) > 2 else 200
+    parents, branches = make_dag(count, width)
+    revs = range(count - 1, -1, -1)
+
+    s = time.time()
+    dag = list(_dagwalker(parents.__getitem__, revs))
+    walked = time.time()
+    rows = list(_colored(dag, branches, set()))
+    done = time.time()
+
+    print 'revisions %s, branches %s, max columns %s' % (
+        count, width, max(len(edges) for _node, edges, _closing in rows))
+    print 'dag walk %.3fs, layout %.3fs' % (walked - s, done - walked)
+
+
+if __name__ == '__main__':
+    main(sys.argv)
@@ -1,6 +1,8 @@
 from __future__ import with_statement
 
 import os
+import zlib
+import mock
 import tarfile
 import zipfile
 import datetime
@@ -10,6 +12,7 @@ from kallithea.tests.vcs.base import _BackendTestMixin
 from kallithea.tests.vcs.conf import SCM_TESTS
 from kallithea.lib.vcs.exceptions import VCSError
 from kallithea.lib.vcs.nodes import FileNode
+from kallithea.lib.vcs.utils import archivers
 from kallithea.lib.vcs.utils.compat import unittest
 
 
@@ -73,6 +76,58 @@ class ArchivesTestCaseMixin(_BackendTestMixin):
                 open(os.path.join(outdir, 'repo/' + node_path)).read(),
                 self.tip.get_node(node_path).content)
 
+    def test_archive_compression_level(self):
+        for kind, mode in [('tgz', 'r|gz'), ('tbz2', 'r|bz2'), ('zip', None)]:
+            path = tempfile.mkstemp()[1]
+            with open(path, 'wb') as f:
+                self.tip.fill_archive(stream=f, kind=kind, prefix='repo',
+                                      compression_level=1)
+            if mode is None:
+                names = zipfile.ZipFile(path).namelist()
+            else:
+                names = tarfile.open(path, mode).getnames()
+            self.assertTrue('repo/4/file_4.txt' in names)
+
+    def test_archive_threads_and_member_cache(self):
+        def get_files(kind, threads):
+            stream = StringIO.StringIO()
+            self.tip.fill_archive(stream=stream, kind=kind, prefix='repo',
+                                  compression_threads=threads)
+            stream.seek(0)
+            if kind == 'zip':
+                out = zipfile.ZipFile(stream)
+                self.assertEqual(out.testzip(), None)
+                return dict((name, out.read(name)) for name in out.namelist())
+            out = tarfile.open(fileobj=stream, mode='r|gz')
+            return dict((info.name, out.extractfile(info).read())
+                        for info in out)
+
+        archivers._members.clear()
+        with mock.patch.object(archivers, 'MIN_MEMBER_SIZE', 0):
+            for kind in ['tgz', 'zip']:
+                files = get_files(kind, 1)
+                self.assertEqual(files['repo/4/file_4.txt'], 'Foobar 4')
+                # compressed files are reused
+                hits = archivers._members.hits
+                self.assertEqual(get_files(kind, 3), files)
+                self.assertTrue(archivers._members.hits - hits >= 5)
+
+    def test_archive_zip_file_header_without_zip64(self):
+        stream = StringIO.StringIO()
+        with mock.patch.object(archivers, '_FILE_HEADER_ZIP64', False):
+            self.tip.fill_archive(stream=stream, kind='zip', prefix='repo')
+        stream.seek(0)
+        out = zipfile.ZipFile(stream)
+        self.assertEqual(out.testzip(), None)
+        self.assertEqual(out.read('repo/4/file_4.txt'), 'Foobar 4')
+
+    def test_crc32_combine(self):
+        first, second = 'a' * 1000, 'b' * 100000
+        self.assertEqual(archivers.crc32_combine(
+                             zlib.crc32(first) & 0xffffffff,
+                             zlib.crc32(second) & 0xffffffff, len(second)),
+                         zlib.crc32(first + second) & 0xffffffff)
+
     def test_archive_default_stream(self):
         tmppath = tempfile.mkstemp()[1]
         with open(tmppath, 'w') as stream:
@@ -95,6 +150,35 @@ class ArchivesTestCaseMixin(_BackendTestMixin):
         with self.assertRaises(VCSError):
             self.tip.fill_archive(prefix='/any')
 
+class GitExportAttributesArchiveTest(_BackendTestMixin, unittest.TestCase):
+    backend_alias = 'git'
+
+    @classmethod
+    def _get_commits(cls):
+        return [{
+            'message': 'Commit with export attributes',
+            'author': 'Joe Doe <joe.doe@example.com>',
+            'date': datetime.datetime(2010, 1, 1, 20),
+            'added': [
+                FileNode('.gitattributes', content='ignored.txt export-ignore\n'),
+                FileNode('ignored.txt', content='Ignored'),
+                FileNode('kept.txt', content='Kept'),
+            ],
+        }]
+
+    def test_archive_applies_export_ignore(self):
+        for kind, mode in [('tgz', 'r|gz'), ('zip', None)]:
+            stream = StringIO.StringIO()
+            self.tip.fill_archive(stream=stream, kind=kind, prefix='repo')
+            stream.seek(0)
+            if mode is None:
+                names = zipfile.ZipFile(stream).namelist()
+            else:
+                names = tarfile.open(fileobj=stream, mode=mode).getnames()
+            self.assertTrue('repo/kept.txt' in names)
+            self.assertFalse('repo/ignored.txt' in names)
+
+
 # For each backend create test case class
 for alias in SCM_TESTS:
     attrs = {
@@ -3,11 +3,13 @@ from __future__ import with_statement
 
 import time
 import datetime
+import mock
 from kallithea.lib import vcs
 from kallithea.tests.vcs.base import _BackendTestMixin
 from kallithea.tests.vcs.conf import SCM_TESTS
 
 from kallithea.lib.vcs.backends.base import BaseChangeset
+from kallithea.lib.vcs.utils import blame
 from kallithea.lib.vcs.nodes import (
     FileNode, AddedFileNodesGenerator,
     ChangedFileNodesGenerator, RemovedFileNodesGenerator
@@ -357,6 +359,30 @@ class _ChangesetsChangesTestCaseMixin(_BackendTestMixin):
         self.assertEqual(len(changeset.removed), 1)
         self.assertEqual(list(changeset.removed)[0].path, 'qwe')
 
+    def test_file_change_counts(self):
+        self.assertEqual(self.repo.get_changeset(0).file_change_counts,
+                         (4, 0, 0))
+        self.assertEqual(self.repo.get_changeset().file_change_counts,
+                         (1, 2, 1))
+
+    def test_tree_stats(self):
+        stats = self.repo.get_changeset(0).get_tree_stats()
+        self.assertEqual((stats.files, stats.size), (4, 12))
+        self.assertEqual(stats.extensions,
+                         {u'bar': 1, u'ba\u0142': 1, u'foobar': 1, u'qwe': 1})
+        # computed from the cached stats of the parent
+        stats = self.repo.get_changeset().get_tree_stats()
+        self.assertEqual((stats.files, stats.size), (4, 26))
+        self.assertEqual(stats.extensions,
+                         {u'bar': 1, u'ba\u0142': 1, u'foobar': 1, u'fallout': 1})
+        self.assertEqual(self.repo.size, 26)
+
+    def test_first_parent_ids(self):
+        changeset = self.repo.get_changeset()
+        self.assertEqual(list(changeset._first_parent_ids(10)),
+                         [self.repo.get_changeset(0).raw_id])
+        self.assertEqual(list(changeset._first_parent_ids(0)), [])
+
     def test_get_filemode(self):
         changeset = self.repo.get_changeset()
         self.assertEqual(33188, changeset.get_file_mode('foo/bar'))
@@ -366,6 +392,73 @@ class _ChangesetsChangesTestCaseMixin(_BackendTestMixin):
         self.assertEqual(33188, changeset.get_file_mode('foo/bał'))
         self.assertEqual(33188, changeset.get_file_mode(u'foo/bał'))
 
+    def test_get_file_id(self):
+        initial = self.repo.get_changeset(0)
+        changeset = self.repo.get_changeset()
+        self.assertEqual(initial.get_file_id('foo/bał'),
+                         changeset.get_file_id('foo/bał'))
+        self.assertNotEqual(initial.get_file_id('foo/bar'),
+                            changeset.get_file_id('foo/bar'))
+        self.assertEqual(40, len(changeset.get_file_id('fallout')))
+
+
+class _AnnotateTestCaseMixin(_BackendTestMixin):
+    recreate_repo_per_test = False
+
+    @classmethod
+    def _get_commits(cls):
+        # the last commit reverts to the content of the first one
+        contents = ['1\n2\n3\n4\n', '1\nx\n3\n4\n5\n', '0\n1\nx\n3\n5',
+                    '1\n2\n3\n4\n']
+        return [
+            {
+                'message': u'Commit %s' % i,
+                'author': u'Joe Doe <joe.doe@example.com>',
+                'date': datetime.datetime(2010, 1, 1, 20 + i),
+                'added' if i == 0 else 'changed':
+                    [FileNode('foo', content=content)],
+            }
+            for i, content in enumerate(contents)
+        ]
+
+    def test_annotate_incrementally(self):
+        ids = [self.repo.get_changeset(i).raw_id for i in range(3)]
+        changesets = [self.repo.get_changeset(i) for i in range(3)]
+        self.assertEqual(blame.get_annotation(changesets[0], 'foo'),
+                         (ids[0],) * 4)
+        expected = [
+            (ids[0], ids[1], ids[0], ids[0], ids[1]),
+            # the last line lost its line break
+            (ids[2], ids[0], ids[1], ids[0], ids[2]),
+        ]
+        for changeset, annotation in zip(changesets[1:], expected):
+            # same as from the backend
+            self.assertEqual(tuple(changeset._annotate('foo')), annotation)
+            # but derived from the cached annotation of the parent
+            with mock.patch.object(type(changeset), '_annotate') as annotate:
+                self.assertEqual(blame.get_annotation(changeset, 'foo'),
+                                 annotation)
+                self.assertFalse(annotate.called)
+
+        lines = list(changesets[2].get_file_annotate('foo'))
+        self.assertEqual([l[0] for l in lines], [1, 2, 3, 4, 5])
+        self.assertEqual([l[1] for l in lines], list(expected[1]))
+        self.assertEqual([l[3] for l in lines], ['0\n', '1\n', 'x\n', '3\n', '5'])
+        # changesets are loaded once
+        self.assertTrue(lines[1][2]() is lines[3][2]())
+        self.assertEqual(lines[1][2]().raw_id, ids[0])
+
+    def test_annotate_same_content_with_other_history(self):
+        first = self.repo.get_changeset(0)
+        revert = self.repo.get_changeset(3)
+        self.assertEqual(first.get_file_content('foo'),
+                         revert.get_file_content('foo'))
+        blame.get_annotation(first, 'foo')
+        annotation = blame.get_annotation(revert, 'foo')
+        self.assertEqual(annotation, tuple(revert._annotate('foo')))
+        self.assertTrue(revert.raw_id in annotation)
+
+
 # For each backend create test case class
 for alias in SCM_TESTS:
     attrs = {
@@ -381,6 +474,10 @@ for alias in SCM_TESTS:
     bases = (_ChangesetsTestCaseMixin, unittest.TestCase)
     globals()[cls_name] = type(cls_name, bases, attrs)
 
+    cls_name = ''.join(('%s annotate test' % alias).title().split())
+    bases = (_AnnotateTestCaseMixin, unittest.TestCase)
+    globals()[cls_name] = type(cls_name, bases, attrs)
+
     # tests changes
     cls_name = ''.join(('%s changesets changes test' % alias).title().split())
     bases = (_ChangesetsChangesTestCaseMixin, unittest.TestCase)
@@ -5,6 +5,7 @@ import mock
 import datetime
 import urllib2
 from kallithea.lib.vcs.backends.git import GitRepository, GitChangeset
+from kallithea.lib.vcs.conf import settings
 from kallithea.lib.vcs.exceptions import RepositoryError, VCSError, NodeDoesNotExistError
 from kallithea.lib.vcs.nodes import NodeKind, FileNode, DirNode, NodeState
 from kallithea.lib.vcs.utils.compat import unittest
@@ -141,6 +142,19 @@ class GitRepositoryTest(unittest.TestCase):
             'e686b958768ee96af8029fe19c6050b1a8dd3b2b'])
         self.assertTrue(subset.issubset(set(self.repo.revisions)))
 
+    def test_revision_position(self):
+        for pos, raw_id in enumerate(self.repo.revisions):
+            self.assertEqual(self.repo._get_revision_position(raw_id), pos)
+        self.assertRaises(ValueError, self.repo._get_revision_position,
+                          'f' * 40)
+
+    def test_revision_position_injected_revisions(self):
+        revisions = self.repo.revisions[:3]
+        self.repo.revisions = revisions
+        self.assertEqual(self.repo._get_revision_position(revisions[2]), 2)
+        self.repo.revisions.append(self.repo.revisions[0][::-1])
+        self.assertEqual(
+            self.repo._get_revision_position(revisions[0][::-1]), 3)
 
 
     def test_slicing(self):
@@ -226,6 +240,59 @@ TODO: To be written...
         self.assertEqual(node.kind, NodeKind.FILE)
         self.assertEqual(node.content, README)
 
+    @mock.patch.object(settings, 'GIT_COMMIT_GRAPH_CACHE', True)
+    def test_commit_graph(self):
+        repo_path = get_new_dir('commit-graph-repo')
+        repo = GitRepository(repo_path, src_url=TEST_GIT_REPO, create=True,
+                             bare=True)
+        # reading doesn't write the graph file
+        self.assertEqual(repo._commit_graph, None)
+        repo.update_commit_graph()
+        graph = repo._commit_graph
+        self.assertTrue(os.path.isfile(graph.path))
+        self.assertTrue(GitRepository(repo_path)._commit_graph is not None)
+        with mock.patch.object(settings, 'GIT_COMMIT_GRAPH_CACHE', False):
+            plain_repo = GitRepository(repo_path)
+            self.assertEqual(repo.revisions, plain_repo.revisions)
+        for raw_id in plain_repo.revisions[::10]:
+            pos = graph.index(raw_id)
+            self.assertEqual(graph.get_sha(pos), raw_id)
+            cs = plain_repo.get_changeset(raw_id)
+            self.assertEqual(repo._get_parent_revisions(pos),
+                             [p.revision for p in cs.parents])
+            self.assertEqual(sorted(repo._get_children_ids(raw_id)),
+                             sorted(c.raw_id for c in cs.children))
+        self.assertRaises(ValueError, graph.index, 'f' * 40)
+
+    @mock.patch.object(settings, 'GIT_COMMIT_GRAPH_CACHE', True)
+    def test_commit_graph_update(self):
+        repo_path = get_new_dir('commit-graph-update-repo')
+        repo = GitRepository(repo_path, src_url=TEST_GIT_REPO, create=True,
+                             update_after_clone=True)
+        repo.update_commit_graph()
+        revisions_count = len(repo._commit_graph)
+        imc = repo.in_memory_changeset
+        imc.add(FileNode('graph_test', content='graph'))
+        tip = imc.commit(message=u'graph test', author=u'joe <joe@example.com>',
+                         branch='master')
+
+        # the graph of the old refs isn't used
+        repo = GitRepository(repo_path)
+        self.assertEqual(repo._commit_graph, None)
+        self.assertEqual(repo.revisions[-1], tip.raw_id)
+        revisions = repo.revisions
+
+        repo.update_commit_graph()
+        graph = repo._commit_graph
+        self.assertEqual(len(graph), revisions_count + 1)
+        # the same order as without the graph
+        self.assertEqual(graph.revisions, revisions)
+        pos = graph.index(tip.raw_id)
+        self.assertEqual([graph.get_sha(p) for p in graph.get_parents(pos)],
+                         [p.raw_id for p in tip.parents])
+        self.assertIn(tip.raw_id,
+                      repo._get_children_ids(tip.parents[0].raw_id))
+
 
 class GitChangesetTest(unittest.TestCase):
 
@@ -352,6 +419,34 @@ class GitChangesetTest(unittest.TestCase):
         for revision, path, size in to_check:
             self._test_file_size(revision, path, size)
 
+    def test_nodes_are_classified_by_tree_modes(self):
+        from dulwich.objects import Tree
+        cs = self.repo.get_changeset('f50f42baeed5af6518ef4b0cb2f1423f3851a941')
+        repo_type = type(self.repo._repo)
+        get_object = repo_type.__getitem__
+        loaded = []
+
+        def getitem(repo, sha):
+            loaded.append(get_object(repo, sha))
+            return loaded[-1]
+
+        with mock.patch.object(repo_type, '__getitem__', getitem):
+            nodes = cs.get_nodes('vcs/backends')
+            self.assertEqual([n.path for n in nodes if n.is_file()],
+                             ['vcs/backends/__init__.py',
+                              'vcs/backends/base.py',
+                              'vcs/backends/hg.py'])
+            self.assertEqual(cs.get_node('vcs/backends/hg.py').mode, 0100644)
+            self.assertEqual(cs.get_file_mode('vcs/backends/base.py'), 0100644)
+            self.assertTrue(cs.get_node('vcs').is_dir())
+        # only the trees on the way have been loaded, each of them once
+        self.assertEqual(len(loaded), 3)
+        self.assertTrue(all(isinstance(o, Tree) for o in loaded))
+        self.assertRaises(NodeDoesNotExistError, cs.get_node,
+                          'vcs/backends/nonexisting')
+        self.assertRaises(NodeDoesNotExistError, cs.get_node,
+                          'vcs/backends/hg.py/foo')
+
     def test_file_history(self):
         # we can only check if those revisions are present in the history
         # as we cannot update this test every time file is changed
@@ -419,6 +514,102 @@ class GitChangesetTest(unittest.TestCase):
                 "has been changed, and history of that node returned: %s"
                 % (revs, path, node_revs))
 
+    def test_file_history_matches_git_log(self):
+        tip = self.repo.get_changeset()
+        for path in ['setup.py', 'vcs/nodes.py', 'README.rst']:
+            so, se = self.repo.run_git_command(
+                'log --pretty="format: %%H" -s %s -- "%s"' % (tip.raw_id, path))
+            expected = [x.strip() for x in so.splitlines()]
+            entries, cursor = tip.get_file_history_page(path)
+            self.assertEqual([e.raw_id for e in entries], expected)
+            self.assertEqual(cursor, None)
+
+    def test_file_history_page(self):
+        tip = self.repo.get_changeset()
+        all_ids = [e.raw_id for e in
+                   tip.get_file_history_page('vcs/nodes.py')[0]]
+        ids = []
+        cursor = None
+        while True:
+            entries, cursor = tip.get_file_history_page('vcs/nodes.py',
+                                                        limit=7, cursor=cursor)
+            self.assertTrue(len(entries) <= 7)
+            ids.extend(e.raw_id for e in entries)
+            if cursor is None:
+                break
+        self.assertEqual(ids, all_ids)
+        entry = tip.get_file_history_page('vcs/nodes.py', limit=1)[0][0]
+        cs = entry.changeset
+        self.assertEqual(entry.author, cs.author)
+        self.assertEqual(entry.date, cs.date)
+        self.assertEqual(entry.revision, cs.revision)
+
+    def test_file_history_cache_size(self):
+        from kallithea.lib.vcs.backends.git import history
+        tip = self.repo.get_changeset()
+        key = (self.repo.path, tip.raw_id, 'vcs/nodes.py')
+        history._walks.pop(key)
+        tip.get_file_history_page('vcs/nodes.py', limit=1)
+        walk = history._walks.get(key)
+        # size of partial walk covers what it holds to continue
+        self.assertTrue(walk._lookups)
+        self.assertEqual(history._walks._sizes[key],
+                         history._sizeof_walk(walk))
+        tip.get_file_history_page('vcs/nodes.py')
+        # finished walk only keeps its entries
+        self.assertTrue(walk.done)
+        self.assertEqual(history._walks._sizes[key], 1 + len(walk.entries))
+
+    def test_compare_revisions(self):
+        from kallithea.lib.vcs.backends.git.compare import compare
+        revs = self.repo.revisions
+        for rev1, rev2 in [(revs[10], revs[40]), (revs[-1], revs[-30]),
+                           (revs[5], revs[5])]:
+            other_revs, org_revs, ancestor = compare(self.repo, rev1,
+                                                     self.repo, rev2)
+            so, se = self.repo.run_git_command('merge-base %s %s'
+                                               % (rev1, rev2))
+            self.assertEqual(ancestor, so.strip())
+            so, se = self.repo.run_git_command('rev-list %s..%s'
+                                               % (rev1, rev2))
+            self.assertEqual(sorted(other_revs), sorted(so.split()))
+            so, se = self.repo.run_git_command('rev-list %s..%s'
+                                               % (rev2, rev1))
+            self.assertEqual(sorted(org_revs), sorted(so.split()))
+        # results are cached per pair of revisions
+        self.assertTrue(compare(self.repo, revs[10], self.repo, revs[40])
+                        is compare(self.repo, revs[10], self.repo, revs[40]))
+
+    def test_merge_base_with_skewed_commit_date(self):
+        from dulwich.object_store import MemoryObjectStore
+        from dulwich.objects import Commit, Tree
+        from kallithea.lib.vcs.backends.git.compare import merge_base
+        store = MemoryObjectStore()
+        tree = Tree()
+        store.add_object(tree)
+
+        def commit(commit_time, *parents):
+            c = Commit()
+            c.tree = tree.id
+            c.parents = [p.id for p in parents]
+            c.author = c.committer = 'Joe Doe <joe.doe@example.com>'
+            c.author_time = c.commit_time = commit_time
+            c.author_timezone = c.commit_timezone = 0
+            c.message = 'commit at %s' % commit_time
+            store.add_object(c)
+            return c
+
+        old = commit(90)
+        base = commit(100, old)
+        left = commit(200, base)
+        # committed with a clock far behind - older than its parent
+        skewed = commit(10, base)
+        right = commit(300, skewed, old)
+        # old is reached from both sides first but base is the best one
+        self.assertEqual(merge_base(store, left.id, right.id), base.id)
+        self.assertEqual(merge_base(store, right.id, left.id), base.id)
+        self.assertEqual(merge_base(store, left.id, commit(50).id), None)
+
     def test_file_annotate(self):
         files = {
             'vcs/backends/__init__.py': {
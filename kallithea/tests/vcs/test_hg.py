@@ -1,7 +1,10 @@
 from __future__ import with_statement
 
 import os
+import mock
 from kallithea.lib.vcs.backends.hg import MercurialRepository, MercurialChangeset
+from kallithea.lib.vcs.backends.hg import changeset as hg_changeset
+from kallithea.lib.vcs.conf import settings
 from kallithea.lib.vcs.exceptions import RepositoryError, VCSError, NodeDoesNotExistError
 from kallithea.lib.vcs.nodes import NodeKind, NodeState
 from kallithea.tests.vcs.conf import TEST_HG_REPO, TEST_HG_REPO_CLONE, \
@@ -180,14 +183,14 @@ class MercurialRepositoryTest(unittest.TestCase):
         self.assertEqual(init_chset.message, 'initial import')
         self.assertEqual(init_chset.author,
             'Marcin Kuzminski <marcin@python-blog.com>')
-        self.assertEqual(sorted(init_chset._file_paths),
+        self.assertEqual(sorted(init_chset._manifest_index.files),
             sorted([
                 'vcs/__init__.py',
                 'vcs/backends/BaseRepository.py',
                 'vcs/backends/__init__.py',
             ])
         )
-        self.assertEqual(sorted(init_chset._dir_paths),
+        self.assertEqual(sorted(init_chset._manifest_index.dirs),
             sorted(['', 'vcs', 'vcs/backends']))
 
         self.assertRaises(NodeDoesNotExistError, init_chset.get_node, path='foobar')
@@ -204,6 +207,14 @@ class MercurialRepositoryTest(unittest.TestCase):
         self.assertTrue(hasattr(node, 'kind'))
         self.assertEqual(node.kind, NodeKind.FILE)
 
+    @mock.patch.object(settings, 'HG_MANIFEST_INDEX_CACHE_SIZE', 2)
+    def test_manifest_index_cache_size(self):
+        hg_changeset._manifest_indexes.clear()
+        index = self.repo.get_changeset(0)._manifest_index
+        # indexes bigger than the configured size are not kept
+        self.assertTrue(len(index) > 2)
+        self.assertEqual(len(hg_changeset._manifest_indexes), 0)
+
     def test_not_existing_changeset(self):
         #rawid
         self.assertRaises(RepositoryError, self.repo.get_changeset,
@@ -266,6 +277,20 @@ class MercurialChangesetTest(unittest.TestCase):
         tip = self.repo.get_changeset('tip')
         self.assertTrue(tip.root is tip.get_node(''))
 
+    def test_manifest_index(self):
+        chset = self.repo.get_changeset(45)
+        other = MercurialRepository(TEST_HG_REPO).get_changeset(45)
+        # changesets with the same manifest share its index
+        self.assertTrue(chset._manifest_index is other._manifest_index)
+        walked = [f.path for _top, _dirs, files in chset.walk()
+                  for f in files]
+        self.assertEqual(sorted(walked), sorted(chset._ctx.manifest()))
+        self.assertEqual([n.path for n in chset.get_nodes('docs')],
+                         ['docs/api', 'docs/theme', 'docs/Makefile',
+                          'docs/conf.py', 'docs/index.rst',
+                          'docs/installation.rst', 'docs/make.bat',
+                          'docs/quickstart.rst'])
+
     def test_lazy_fetch(self):
         """
         Test if changeset's nodes expands and are cached as we walk through
@@ -361,6 +386,26 @@ class MercurialChangesetTest(unittest.TestCase):
                 "has been changed, and history of that node returned: %s"
                 % (revs, path, node_revs))
 
+    def test_file_history_page(self):
+        tip = self.repo.get_changeset()
+        history = tip.get_file_history('vcs/nodes.py')
+        entries, cursor = tip.get_file_history_page('vcs/nodes.py')
+        self.assertEqual(cursor, None)
+        self.assertEqual([e.raw_id for e in entries],
+                         [cs.raw_id for cs in history])
+        self.assertEqual([e.author for e in entries],
+                         [cs.author for cs in history])
+
+        ids = []
+        cursor = None
+        while True:
+            entries, cursor = tip.get_file_history_page('vcs/nodes.py',
+                                                        limit=5, cursor=cursor)
+            ids.extend(e.raw_id for e in entries)
+            if cursor is None:
+                break
+        self.assertEqual(ids, [cs.raw_id for cs in history])
+
     def test_file_annotate(self):
         files = {
                  'vcs/backends/__init__.py':
@@ -87,6 +87,22 @@ class RepositoryGetDiffTest(_BackendTestMixin):
         with self.assertRaises(ChangesetDoesNotExistError):
             self.repo.get_diff('a' * 40, 'b' * 40)
 
+    def test_iter_diff(self):
+        revs = [self.repo.EMPTY_CHANGESET] + self.repo.revisions
+        for rev1, rev2 in zip(revs, revs[1:]):
+            self.assertEqual(''.join(self.repo.iter_diff(rev1, rev2)),
+                             self.repo.get_diff(rev1, rev2))
+        with self.assertRaises(ChangesetDoesNotExistError):
+            self.repo.iter_diff('a' * 40, 'b' * 40)
+
+    def test_iter_diff_close(self):
+        revs = self.repo.revisions
+        chunks = self.repo.iter_diff(self.repo.EMPTY_CHANGESET, revs[-1])
+        first = next(chunks)
+        self.assertTrue(first)
+        chunks.close()
+        self.assertEqual(list(chunks), [])
+
 
 class GitRepositoryGetDiffTest(RepositoryGetDiffTest, unittest.TestCase):
     backend_alias = 'git'
@@ -7,7 +7,7 @@ import shutil
 import tempfile
 import datetime
 from kallithea.lib.vcs.utils.compat import unittest
-from kallithea.lib.vcs.utils.paths import get_dirs_for_path
+from kallithea.lib.vcs.utils.paths import get_dirs_for_path, PathIndex
 from kallithea.lib.vcs.utils.helpers import get_dict_for_attrs
 from kallithea.lib.vcs.utils.helpers import get_scm
 from kallithea.lib.vcs.utils.helpers import get_scms_for_path
@@ -43,6 +43,19 @@ class PathsTest(unittest.TestCase):
         for path, expected in paths_and_results:
             self._test_get_dirs_for_path(path, expected)
 
+    def test_path_index(self):
+        index = PathIndex([('README', 1), ('foo/bar/baz/file', 2),
+                           ('foo/setup.py', 3), ('foo/bar/other', 4)])
+        self.assertEqual(index.files['foo/setup.py'], 3)
+        self.assertEqual(sorted(index.dirs),
+                         ['', 'foo', 'foo/bar', 'foo/bar/baz'])
+        self.assertEqual(index.dirs[''], (['foo'], ['README']))
+        self.assertEqual(index.dirs['foo'], (['foo/bar'], ['foo/setup.py']))
+        self.assertEqual(index.dirs['foo/bar'],
+                         (['foo/bar/baz'], ['foo/bar/other']))
+        self.assertEqual(index.dirs['foo/bar/baz'],
+                         ([], ['foo/bar/baz/file']))
+        self.assertFalse('foo/bar' in index.files)
 
     def test_get_scm(self):
         self.assertEqual(('hg', TEST_HG_REPO), get_scm(TEST_HG_REPO))